@@ -0,0 +1,280 @@
+"""Bounded SQLite history of media-service activity aggregates.
+
+``ActivityService`` answers "what is happening now"; this store remembers how
+much of it happened. Each collection is folded into an in-memory minute bucket
+per service, and only the closed bucket is written, so an 8-second refresh
+costs one SQLite write a minute rather than eight. Rows live in the same
+database as the system metric history so transcode load can be read against
+CPU and temperature over the same fixed ranges.
+"""
+
+from __future__ import annotations
+
+import math
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from metric_history import (
+    BUSY_TIMEOUT_MS,
+    RANGES,
+    RETENTION_SECONDS,
+    InvalidMetricRange,
+    _iso_timestamp,
+)
+
+
+BUCKET_SECONDS = 60
+ACTIVITY_COLUMNS = (
+    "streams",
+    "transcodes",
+    "download_speed",
+    "queue_problems",
+)
+MAX_SOURCES = 24
+
+
+def _finite_number(value) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return 0.0
+    numeric = float(value)
+    return numeric if math.isfinite(numeric) else 0.0
+
+
+@dataclass
+class _Accumulator:
+    observations: int = 0
+    streams: float = 0.0
+    transcodes: float = 0.0
+    download_speed: float = 0.0
+    queue_problems: float = 0.0
+
+    def add(self, aggregate: Mapping) -> None:
+        self.observations += 1
+        self.streams += _finite_number(aggregate.get("streams"))
+        self.transcodes += _finite_number(aggregate.get("transcodes"))
+        self.download_speed += _finite_number(aggregate.get("download_speed"))
+        # A stuck import is a state, not a rate: keep the worst reading.
+        self.queue_problems = max(
+            self.queue_problems, _finite_number(aggregate.get("queue_problems"))
+        )
+
+    def row(self) -> tuple[float, float, float, float]:
+        count = max(1, self.observations)
+        return (
+            round(self.streams / count, 3),
+            round(self.transcodes / count, 3),
+            round(self.download_speed / count, 2),
+            self.queue_problems,
+        )
+
+
+def _rows(pending: Mapping[str, _Accumulator]) -> dict[str, tuple]:
+    return {source: accumulator.row() for source, accumulator in pending.items()}
+
+
+class ActivityHistoryStore:
+    """Fold activity aggregates into minute buckets and query fixed ranges."""
+
+    def __init__(
+        self,
+        database_path: str | Path,
+        *,
+        clock: Callable[[], float] = time.time,
+        bucket_seconds: int = BUCKET_SECONDS,
+    ) -> None:
+        self.database_path = Path(database_path)
+        self._clock = clock
+        self._bucket_seconds = max(1, int(bucket_seconds))
+        self._lock = threading.Lock()
+        self._bucket_at: int | None = None
+        self._pending: dict[str, _Accumulator] = {}
+
+    def observe(self, aggregates: Mapping[str, Mapping], *, observed_at: float | None = None) -> None:
+        """Fold one collection's per-service aggregates into the current bucket.
+
+        ``aggregates`` maps a service (container) name to its ``streams``,
+        ``transcodes``, ``download_speed`` (bytes per second) and
+        ``queue_problems``. Crossing into a new bucket writes the previous one.
+        """
+        at = int(self._clock() if observed_at is None else observed_at)
+        bucket_at = at - at % self._bucket_seconds
+        closed = None
+        with self._lock:
+            if self._bucket_at is not None and bucket_at != self._bucket_at:
+                closed = (self._bucket_at, self._pending)
+                self._pending = {}
+            self._bucket_at = bucket_at
+            for source, aggregate in list(aggregates.items())[:MAX_SOURCES]:
+                if not isinstance(aggregate, Mapping):
+                    continue
+                self._pending.setdefault(str(source)[:200], _Accumulator()).add(aggregate)
+        if closed is not None and closed[1]:
+            self._write(closed[0], _rows(closed[1]))
+
+    def flush(self) -> None:
+        """Write the open bucket now, e.g. when readers go idle or on shutdown.
+
+        The bucket stays open: later observations in it rewrite the same rows.
+        """
+        with self._lock:
+            bucket_at, rows = self._bucket_at, _rows(self._pending)
+        if bucket_at is not None and rows:
+            self._write(bucket_at, rows)
+
+    def _write(self, bucket_at: int, rows: Mapping[str, tuple]) -> None:
+        self.database_path.parent.mkdir(parents=True, exist_ok=True, mode=0o750)
+        connection = sqlite3.connect(self.database_path, timeout=BUSY_TIMEOUT_MS / 1000)
+        try:
+            connection.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+            with connection:
+                connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS activity_samples (
+                        bucket_at INTEGER NOT NULL,
+                        source TEXT NOT NULL,
+                        streams REAL,
+                        transcodes REAL,
+                        download_speed REAL,
+                        queue_problems REAL,
+                        PRIMARY KEY (bucket_at, source)
+                    )
+                    """
+                )
+                connection.executemany(
+                    """
+                    INSERT INTO activity_samples (
+                        bucket_at,
+                        source,
+                        streams,
+                        transcodes,
+                        download_speed,
+                        queue_problems
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(bucket_at, source) DO UPDATE SET
+                        streams = excluded.streams,
+                        transcodes = excluded.transcodes,
+                        download_speed = excluded.download_speed,
+                        queue_problems = excluded.queue_problems
+                    """,
+                    [(bucket_at, source, *row) for source, row in rows.items()],
+                )
+                connection.execute(
+                    "DELETE FROM activity_samples WHERE bucket_at < ?",
+                    (bucket_at - RETENTION_SECONDS,),
+                )
+        finally:
+            connection.close()
+
+    def query(self, selected_range: str) -> dict:
+        """Return ordered fixed buckets of totals plus a series per service."""
+        config = RANGES.get(selected_range)
+        if config is None:
+            raise InvalidMetricRange("range must be one of: 24h, 7d, 30d")
+
+        end = int(self._clock())
+        start = end - config["duration"]
+        response = {
+            "range": selected_range,
+            "from": _iso_timestamp(start),
+            "to": _iso_timestamp(end),
+            "bucket_seconds": config["bucket"],
+            "points": [],
+            "services": [],
+        }
+        if not self.database_path.is_file():
+            return response
+
+        rows = self._aggregate(
+            start,
+            end,
+            config["bucket"],
+            config["duration"] // config["bucket"],
+        )
+        if not rows:
+            return response
+
+        by_source: dict[str, dict[int, tuple]] = {}
+        for bucket_at, source, *values in rows:
+            by_source.setdefault(source, {})[int(bucket_at)] = tuple(values)
+        buckets = sorted({bucket for series in by_source.values() for bucket in series})
+        timeline = range(buckets[0], buckets[-1] + config["bucket"], config["bucket"])
+
+        points = []
+        for bucket_at in timeline:
+            present = [series[bucket_at] for series in by_source.values() if bucket_at in series]
+            points.append(
+                {
+                    "at": _iso_timestamp(bucket_at),
+                    **{
+                        column: round(sum(values[index] or 0 for values in present), 3)
+                        if present
+                        else None
+                        for index, column in enumerate(ACTIVITY_COLUMNS)
+                    },
+                }
+            )
+        response["points"] = points
+        response["services"] = [
+            {
+                "source": source,
+                "points": [
+                    {
+                        "at": _iso_timestamp(bucket_at),
+                        **dict(zip(ACTIVITY_COLUMNS, values, strict=True)),
+                    }
+                    for bucket_at, values in sorted(series.items())
+                ],
+            }
+            for source, series in sorted(by_source.items())
+        ]
+        return response
+
+    def _aggregate(
+        self,
+        start: int,
+        end: int,
+        bucket_seconds: int,
+        max_buckets: int,
+    ) -> list[tuple]:
+        uri = f"file:{self.database_path}?mode=ro"
+        connection = sqlite3.connect(uri, uri=True, timeout=BUSY_TIMEOUT_MS / 1000)
+        try:
+            connection.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+            connection.execute("PRAGMA query_only = ON")
+            try:
+                return connection.execute(
+                    """
+                    SELECT
+                        ? + MIN(CAST((bucket_at - ?) / ? AS INTEGER), ?) * ? AS display_at,
+                        source,
+                        AVG(streams),
+                        AVG(transcodes),
+                        AVG(download_speed),
+                        MAX(queue_problems)
+                    FROM activity_samples
+                    WHERE bucket_at >= ? AND bucket_at <= ?
+                    GROUP BY display_at, source
+                    ORDER BY display_at ASC
+                    LIMIT ?
+                    """,
+                    (
+                        start,
+                        start,
+                        bucket_seconds,
+                        max_buckets - 1,
+                        bucket_seconds,
+                        start,
+                        end,
+                        max_buckets * MAX_SOURCES,
+                    ),
+                ).fetchall()
+            except sqlite3.OperationalError as error:
+                if "no such table" in str(error).lower():
+                    return []
+                raise
+        finally:
+            connection.close()
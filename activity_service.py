@@ -6,6 +6,11 @@ who is streaming from Jellyfin, what SABnzbd and Transmission are pulling down,
 and which Servarr queues are stuck. Services are discovered from the container
 inventory and their API keys are read from the config directories Docker already
 mounts, so nothing needs configuring by hand.
+
+Polling a slow *arr must never stall the dashboard, so reads are served from the
+last snapshot while a background thread refreshes it, and that thread goes
+quiet once nobody is reading. Config roots and API keys are remembered per
+container until it restarts, so steady-state refreshes only touch HTTP.
 """
 
 from __future__ import annotations
@@ -14,8 +19,6 @@ import json
 import math
 import threading
 import time
-import urllib.error
-import urllib.request
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -26,10 +29,17 @@ from activity_credentials import (
     read_jellyfin_api_key,
     read_sabnzbd_api_key,
 )
+from http_pool import HttpResponse, pooled_transport
 
 
 DEFAULT_TTL_SECONDS = 8.0
 DEFAULT_TIMEOUT_SECONDS = 4.0
+# Same reasoning as the container stats sampler: a dashboard nobody has open is
+# the normal case, so stop refreshing after this long without a reader.
+DEFAULT_IDLE_AFTER_SECONDS = 60.0
+# History must not depend on someone watching, so with a recorder attached the
+# refresher keeps sampling at this slower cadence while nobody reads.
+DEFAULT_HISTORY_INTERVAL_SECONDS = 60.0
 MAX_WORKERS = 6
 MAX_STREAMS = 12
 MAX_DOWNLOADS = 12
@@ -62,28 +72,42 @@ PROVIDERS: dict[str, _Provider] = {
 }
 
 
-@dataclass(frozen=True)
-class HttpResponse:
-    status: int
-    headers: Mapping[str, str]
-    body: bytes
-
-
-def urllib_transport(
-    method: str,
+def transmission_rpc(
+    transport: Callable[..., HttpResponse],
     url: str,
-    headers: Mapping[str, str] | None = None,
-    body: bytes | None = None,
+    method: str,
+    arguments: Mapping | None = None,
+    *,
     timeout: float = DEFAULT_TIMEOUT_SECONDS,
-) -> HttpResponse:
-    """Perform one loopback HTTP call, returning error responses rather than raising."""
-    request = urllib.request.Request(url, data=body, headers=dict(headers or {}), method=method)
-    try:
-        with urllib.request.urlopen(request, timeout=timeout) as response:  # noqa: S310 - loopback admin API
-            return HttpResponse(response.status, dict(response.headers), response.read())
-    except urllib.error.HTTPError as error:
-        # Transmission answers the first call with 409 plus a session id header.
-        return HttpResponse(error.code, dict(error.headers or {}), error.read())
+) -> Mapping:
+    """Call one Transmission RPC method, completing its session-id handshake."""
+    body = json.dumps(
+        {"method": method, "arguments": dict(arguments or {})}, separators=(",", ":")
+    ).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+
+    response = transport("POST", url, headers, body, timeout)
+    if response.status == 409:
+        # Transmission's CSRF guard: retry once with the session id it just issued.
+        session_id = response.headers.get("X-Transmission-Session-Id")
+        if not session_id:
+            raise RuntimeError("Transmission withheld a session id")
+        response = transport(
+            "POST", url, {**headers, "X-Transmission-Session-Id": session_id}, body, timeout
+        )
+    if response.status >= 400:
+        raise RuntimeError(f"HTTP {response.status}")
+    return _mapping(json.loads(response.body.decode("utf-8", errors="replace")))
+
+
+@dataclass(frozen=True)
+class DownloadClient:
+    """Where to reach a download client's API; never serialise ``api_key``."""
+
+    name: str
+    family: str
+    base_url: str
+    api_key: str | None
 
 
 @dataclass(frozen=True)
@@ -94,6 +118,9 @@ class _Target:
     family: str
     port: int | None
     config_root: str | None
+    # Docker's StartedAt; changes on every restart, which is what expires the
+    # cached config root and credential for this container.
+    started_at: str | None = None
 
 
 def _finite(value) -> float | None:
@@ -161,7 +188,7 @@ class ActivityService:
         *,
         container_provider: Callable[[], list[dict]],
         inspect_reader: Callable[[str], Mapping],
-        transport: Callable[..., HttpResponse] = urllib_transport,
+        transport: Callable[..., HttpResponse] = pooled_transport,
         credential_readers: Mapping[str, Callable[[str], str]] | None = None,
         host: str = "127.0.0.1",
         ttl_seconds: float = DEFAULT_TTL_SECONDS,
@@ -169,6 +196,10 @@ class ActivityService:
         clock: Callable[[], float] = time.monotonic,
         wall_clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
         max_workers: int = MAX_WORKERS,
+        idle_after_seconds: float = DEFAULT_IDLE_AFTER_SECONDS,
+        history_recorder: Callable[[Mapping[str, Mapping]], None] | None = None,
+        history_flusher: Callable[[], None] | None = None,
+        history_interval_seconds: float = DEFAULT_HISTORY_INTERVAL_SECONDS,
     ) -> None:
         self._container_provider = container_provider
         self._inspect_reader = inspect_reader
@@ -187,24 +218,157 @@ class ActivityService:
         self._clock = clock
         self._wall_clock = wall_clock
         self._max_workers = max(1, int(max_workers))
+        self._idle_after = max(0.0, float(idle_after_seconds))
+        self._history_recorder = history_recorder
+        self._history_flusher = history_flusher
+        self._history_interval = max(1.0, float(history_interval_seconds))
         self._lock = threading.Lock()
+        # Serialises collection so a background pass and an inline read never
+        # poll the same services twice at once.
+        self._refresh_lock = threading.Lock()
         self._cached: dict | None = None
         self._cached_at: float | None = None
+        self._last_read_at: float | None = None
+        # container id -> (started_at, value); dropped when the container restarts.
+        self._config_roots: dict[str, tuple[str | None, str | None]] = {}
+        self._credentials: dict[str, tuple[str | None, str]] = {}
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._wake = threading.Event()
+
+    # --- lifecycle ---------------------------------------------------------
+
+    def start(self) -> None:
+        """Begin background refreshing; safe to call more than once."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="activity-refresher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stopping.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self._thread = None
+        self._flush_history()
+
+    def _run(self) -> None:
+        reading = False
+        while not self._stopping.is_set():
+            try:
+                has_reader = self._has_a_reader()
+                if has_reader and self._is_stale():
+                    self.refresh()
+                elif not has_reader and self._history_due():
+                    self.refresh()
+                if reading and not has_reader:
+                    self._flush_history()
+                reading = has_reader
+            except Exception:
+                # Activity is best-effort telemetry; never kill the thread.
+                pass
+            self._wake.wait(max(self._ttl, 1.0))
+            self._wake.clear()
+
+    def _history_due(self) -> bool:
+        """Whether an idle refresher should still sample for the history."""
+        if self._history_recorder is None:
+            return False
+        with self._lock:
+            cached_at = self._cached_at
+        return cached_at is None or (self._clock() - cached_at) >= self._history_interval
+
+    def _flush_history(self) -> None:
+        if self._history_flusher is None:
+            return
+        try:
+            self._history_flusher()
+        except Exception:
+            pass
+
+    def _has_a_reader(self) -> bool:
+        """Whether anything has asked for activity recently enough to matter."""
+        if self._idle_after <= 0:
+            return True
+        with self._lock:
+            last_read = self._last_read_at
+        if last_read is None:
+            return False
+        return (self._clock() - last_read) <= self._idle_after
+
+    def _is_stale(self) -> bool:
+        with self._lock:
+            cached_at = self._cached_at
+        return cached_at is None or (self._clock() - cached_at) > self._ttl
+
+    def _refresher_running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive() and not self._stopping.is_set()
 
     # --- public ------------------------------------------------------------
 
     def snapshot(self) -> dict:
-        """Return the current activity view, refreshing at most once per TTL."""
-        with self._lock:
-            cached, cached_at = self._cached, self._cached_at
-        if cached is not None and cached_at is not None and (self._clock() - cached_at) <= self._ttl:
-            return cached
+        """Return the current activity view without waiting on a warm cache.
 
-        result = self._collect()
+        The first read collects inline because there is nothing to serve yet.
+        After that a stale snapshot is returned as-is and the background
+        refresher is woken to replace it; without a running refresher the read
+        falls back to collecting inline, at most once per TTL.
+        """
         with self._lock:
-            self._cached = result
-            self._cached_at = self._clock()
-        return result
+            # Reading is what keeps the background refresher awake.
+            self._last_read_at = self._clock()
+            cached = self._cached
+        if cached is None:
+            return self.refresh()
+        if not self._is_stale():
+            return cached
+        if self._refresher_running():
+            self._wake.set()
+            return cached
+        return self.refresh()
+
+    def refresh(self) -> dict:
+        """Collect and replace the cached snapshot unless it is still fresh."""
+        with self._refresh_lock:
+            # Another caller may have refreshed while this one waited.
+            with self._lock:
+                cached = self._cached
+            if cached is not None and not self._is_stale():
+                return cached
+            result = self._collect()
+            with self._lock:
+                self._cached = result
+                self._cached_at = self._clock()
+            return result
+
+    def download_clients(self) -> list[DownloadClient]:
+        """Running SABnzbd and Transmission instances that can take speed limits."""
+        clients = []
+        for target in self._discover():
+            if target.family not in {"sabnzbd", "transmission"} or target.port is None:
+                continue
+            api_key = None
+            if target.family == "sabnzbd":
+                try:
+                    api_key = self._credential(target)
+                except CredentialUnavailable:
+                    continue
+            clients.append(
+                DownloadClient(
+                    name=target.name,
+                    family=target.family,
+                    base_url=self._base_url(target),
+                    api_key=api_key,
+                )
+            )
+        return clients
 
     # --- collection --------------------------------------------------------
 
@@ -227,6 +391,8 @@ class ActivityService:
             queues.extend(report.get("queues", []))
             services.append(report["service"])
 
+        self._record_history(services, streams, downloads, queues)
+
         streams.sort(key=lambda item: (item.get("is_paused", False), item.get("title", "")))
         downloads.sort(key=lambda item: -(item.get("speed_bytes") or 0))
         queues.sort(key=lambda item: item.get("source", ""))
@@ -250,6 +416,45 @@ class ActivityService:
             },
         }
 
+    def _record_history(
+        self,
+        services: list[dict],
+        streams: list[dict],
+        downloads: list[dict],
+        queues: list[dict],
+    ) -> None:
+        """Hand per-service aggregates, counted before display truncation, to history."""
+        if self._history_recorder is None:
+            return
+        aggregates = {
+            service["name"]: {
+                "streams": 0,
+                "transcodes": 0,
+                "download_speed": 0.0,
+                "queue_problems": 0,
+            }
+            for service in services
+            if service.get("reachable")
+        }
+        for item in streams:
+            aggregate = aggregates.get(item.get("source"))
+            if aggregate is not None:
+                aggregate["streams"] += 1
+                aggregate["transcodes"] += 1 if item.get("is_transcoding") else 0
+        for item in downloads:
+            aggregate = aggregates.get(item.get("source"))
+            if aggregate is not None and item.get("state") == "downloading":
+                aggregate["download_speed"] += item.get("speed_bytes") or 0
+        for item in queues:
+            aggregate = aggregates.get(item.get("source"))
+            if aggregate is not None:
+                aggregate["queue_problems"] += item.get("problems") or 0
+        try:
+            self._history_recorder(aggregates)
+        except Exception:
+            # History is a side channel; it must never cost the live view.
+            pass
+
     def _discover(self) -> list[_Target]:
         try:
             containers = self._container_provider()
@@ -257,6 +462,7 @@ class ActivityService:
             return []
 
         targets = []
+        seen: set[str] = set()
         for container in _listing(containers):
             item = _mapping(container)
             if _text(item.get("status")) != "running":
@@ -267,6 +473,8 @@ class ActivityService:
                 continue
             _token, provider = matched
             container_id = _text(item.get("id"))
+            started_at = _text(item.get("started_at")) or None
+            seen.add(container_id)
             targets.append(
                 _Target(
                     container_id=container_id,
@@ -274,18 +482,32 @@ class ActivityService:
                     label=provider.label,
                     family=provider.family,
                     port=_resolve_port(item.get("ports"), provider.default_port),
-                    config_root=self._read_config_root(container_id),
+                    config_root=self._read_config_root(container_id, started_at),
+                    started_at=started_at,
                 )
             )
+        with self._lock:
+            # Removed containers take their cached roots and keys with them.
+            for cache in (self._config_roots, self._credentials):
+                for container_id in [key for key in cache if key not in seen]:
+                    del cache[container_id]
         return targets
 
-    def _read_config_root(self, container_id: str) -> str | None:
+    def _read_config_root(self, container_id: str, started_at: str | None = None) -> str | None:
         if not container_id:
             return None
+        with self._lock:
+            cached = self._config_roots.get(container_id)
+        if cached is not None and cached[0] == started_at:
+            return cached[1]
         try:
-            return _config_root(_mapping(self._inspect_reader(container_id)).get("mounts"))
+            root = _config_root(_mapping(self._inspect_reader(container_id)).get("mounts"))
         except Exception:
+            # Not cached: Docker may simply have been busy.
             return None
+        with self._lock:
+            self._config_roots[container_id] = (started_at, root)
+        return root
 
     def _poll(self, target: _Target) -> dict:
         service = {
@@ -312,6 +534,8 @@ class ActivityService:
             service["detail"] = str(error)
             return {"service": service}
         except Exception as error:
+            # A rotated API key looks like any other failure; re-read it next time.
+            self._forget_credential(target)
             service["detail"] = f"{target.label} did not respond: {error}"
             return {"service": service}
 
@@ -343,10 +567,22 @@ class ActivityService:
             raise CredentialUnavailable(
                 f"{target.label} has no /config mount, so its API key cannot be read"
             )
+        with self._lock:
+            cached = self._credentials.get(target.container_id)
+        if cached is not None and cached[0] == target.started_at:
+            return cached[1]
         reader = self._credential_readers.get(target.family)
         if reader is None:
             raise CredentialUnavailable(f"No credential reader for {target.family}")
-        return reader(target.config_root)
+        value = reader(target.config_root)
+        if target.container_id:
+            with self._lock:
+                self._credentials[target.container_id] = (target.started_at, value)
+        return value
+
+    def _forget_credential(self, target: _Target) -> None:
+        with self._lock:
+            self._credentials.pop(target.container_id, None)
 
     # --- per-service polling ----------------------------------------------
 
@@ -436,26 +672,14 @@ class ActivityService:
         return {"downloads": downloads}
 
     def _poll_transmission(self, target: _Target) -> dict:
-        url = f"{self._base_url(target)}/transmission/rpc"
         fields = ["name", "status", "rateDownload", "rateUpload", "percentDone", "eta", "totalSize"]
-        body = json.dumps(
-            {"method": "torrent-get", "arguments": {"fields": fields}}, separators=(",", ":")
-        ).encode("utf-8")
-        headers = {"Content-Type": "application/json"}
-
-        response = self._transport("POST", url, headers, body, self._timeout)
-        if response.status == 409:
-            # Transmission's CSRF guard: retry once with the session id it just issued.
-            session_id = response.headers.get("X-Transmission-Session-Id")
-            if not session_id:
-                raise RuntimeError("Transmission withheld a session id")
-            response = self._transport(
-                "POST", url, {**headers, "X-Transmission-Session-Id": session_id}, body, self._timeout
-            )
-        if response.status >= 400:
-            raise RuntimeError(f"HTTP {response.status}")
-
-        payload = json.loads(response.body.decode("utf-8", errors="replace"))
+        payload = transmission_rpc(
+            self._transport,
+            f"{self._base_url(target)}/transmission/rpc",
+            "torrent-get",
+            {"fields": fields},
+            timeout=self._timeout,
+        )
         torrents = _listing(_mapping(_mapping(payload).get("arguments")).get("torrents"))
         downloads = []
         for entry in torrents:
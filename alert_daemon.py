@@ -1,14 +1,25 @@
-"""Alert daemon (brick B2, part 2): poll signals, evaluate, deliver to Mattermost.
+"""Alert daemon (brick B2, part 2): watch signals, evaluate, deliver to Mattermost.
 
 Runs as its own process — deliberately outside the Flask API — so an API crash still pages.
 The pure orchestration (`collect_signals`, `run_once`) and extraction helpers are unit-tested;
 `main()` wires the live services and loops, and is validated on the target hardware.
 
+Evaluation is event-driven: Docker `die`/`oom`/`health_status` events and changes to
+/proc/self/mountinfo wake the loop immediately, and a follow-up evaluation a few seconds later
+confirms the fault so `fail_threshold` does not cost a whole poll interval. The periodic poll
+remains as a safety net for missed events. SMART and SnapRAID are expensive to read and change
+slowly, so they are re-read on their own, slower cadence and served from the last reading in
+between.
+
 Config (environment):
   LIMEOS_ALERT_MATTERMOST_WEBHOOK   incoming-webhook URL (unset => dry run, log only)
-  LIMEOS_ALERT_POLL_SECONDS         evaluation interval (default 60)
+  LIMEOS_ALERT_POLL_SECONDS         fallback evaluation interval (default 60)
+  LIMEOS_ALERT_SLOW_POLL_SECONDS    SMART / SnapRAID re-read interval (default 900)
+  LIMEOS_ALERT_CONFIRM_SECONDS      delay before re-checking after an event (default 15)
   LIMEOS_ALERT_FAIL_THRESHOLD       consecutive failures before paging (default 2)
+  LIMEOS_ALERT_BURST_SIZE           notifications per tick sent individually before a digest (default 3)
   LIMEOS_ALERT_REQUIRED_MOUNTS      comma-separated mountpoints that must be present
+  LIMEOS_METRICS_DB                 metric history database for sustained / trend alerts
 """
 
 from __future__ import annotations
@@ -16,6 +27,8 @@ from __future__ import annotations
 import logging
 import json
 import os
+import select
+import threading
 import time
 from collections.abc import Callable, Iterable
 from dataclasses import asdict, dataclass
@@ -37,6 +50,14 @@ logger = logging.getLogger("limeos.alertd")
 
 SignalSource = Callable[[], list[Signal]]
 
+# Container events that can change a container signal. Docker reports health changes as
+# "health_status: unhealthy", so actions are compared up to the first colon.
+DOCKER_ALERT_EVENTS = ("die", "oom", "health_status")
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+# A `docker compose down` emits a burst of events; fold them into one evaluation.
+EVENT_SETTLE_SECONDS = 0.5
+WATCHER_RETRY_SECONDS = 5.0
+
 
 @dataclass
 class DaemonConfig:
@@ -48,6 +69,11 @@ class DaemonConfig:
     policy_path: Path | None = None
     status_path: Path | None = None
     history_path: Path | None = None
+    slow_poll_seconds: int = 900
+    confirm_seconds: int = 15
+    metrics_path: Path | None = None
+    outbox_path: Path | None = None
+    burst_size: int = 3
 
 
 def config_from_env(environ: dict | None = None) -> DaemonConfig:
@@ -69,6 +95,7 @@ def config_from_env(environ: dict | None = None) -> DaemonConfig:
     policy_value = (environ.get("LIMEOS_ALERT_POLICY_PATH") or "").strip()
     status_value = (environ.get("LIMEOS_ALERT_STATUS_PATH") or "").strip()
     history_value = (environ.get("LIMEOS_ALERT_HISTORY_PATH") or "").strip()
+    metrics_value = (environ.get("LIMEOS_METRICS_DB") or "").strip()
     return DaemonConfig(
         webhook_url=(environ.get("LIMEOS_ALERT_MATTERMOST_WEBHOOK") or "").strip() or None,
         poll_seconds=_int("LIMEOS_ALERT_POLL_SECONDS", 60),
@@ -78,6 +105,11 @@ def config_from_env(environ: dict | None = None) -> DaemonConfig:
         policy_path=Path(policy_value) if policy_value else None,
         status_path=Path(status_value) if status_value else state_dir / "alert-status.json",
         history_path=Path(history_value) if history_value else state_dir / "alert-events.jsonl",
+        slow_poll_seconds=_int("LIMEOS_ALERT_SLOW_POLL_SECONDS", 900),
+        confirm_seconds=_int("LIMEOS_ALERT_CONFIRM_SECONDS", 15),
+        metrics_path=Path(metrics_value) if metrics_value else state_dir / "metrics.sqlite3",
+        outbox_path=state_dir / "alert-outbox.json",
+        burst_size=_int("LIMEOS_ALERT_BURST_SIZE", 3),
     )
 
 
@@ -119,6 +151,19 @@ def run_once(
         should_notify=should_notify,
         on_transition=record_transition if on_event is not None else None,
     )
+    send_batch = getattr(notifier, "send_batch", None)
+    if send_batch is not None and notifications:
+        # A queueing notifier accepts the whole tick at once and reports delivery itself;
+        # only a failure to accept the batch is handled here.
+        try:
+            send_batch(notifications)
+        except Exception as exc:  # noqa: BLE001 - unqueued incidents are retried next tick
+            logger.exception("failed to queue %d notifications", len(notifications))
+            for notification in notifications:
+                evaluator.mark_delivery_failed(notification)
+                if on_delivery is not None:
+                    on_delivery(notification, exc)
+        return notifications
     for notification in notifications:
         try:
             notifier.send(notification)
@@ -132,6 +177,160 @@ def run_once(
     return notifications
 
 
+def cadenced(
+    source: SignalSource,
+    interval_seconds: float,
+    *,
+    clock: Callable[[], float] = time.monotonic,
+) -> SignalSource:
+    """Re-read `source` at most every `interval_seconds`, repeating its last signals between.
+
+    Repeating the reading (rather than omitting it) keeps an open incident's streak and
+    summary current; a failed read is retried on the next tick instead of waiting a full
+    interval.
+    """
+    last: dict = {"at": None, "signals": []}
+
+    def _source() -> list[Signal]:
+        now = clock()
+        if last["at"] is not None and now - last["at"] < interval_seconds:
+            return list(last["signals"])
+        signals = source()
+        last.update({"at": now, "signals": list(signals)})
+        return signals
+
+    return _source
+
+
+# -- event watchers -----------------------------------------------------------
+class Wakeup:
+    """Coalescing wake-up the watchers raise and the evaluation loop waits on."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._reasons: set[str] = set()
+
+    def signal(self, reason: str) -> None:
+        with self._condition:
+            self._reasons.add(reason)
+            self._condition.notify_all()
+
+    def wait(self, timeout: float, *, settle: float = 0.0) -> set[str]:
+        """Block until a signal or `timeout`; return (and clear) the reasons raised.
+
+        After the first signal, wait `settle` seconds more so a burst of events
+        produces one evaluation rather than one per event.
+        """
+        with self._condition:
+            if not self._reasons:
+                self._condition.wait(max(0.0, timeout))
+            if self._reasons and settle > 0:
+                # Each signal notifies, so keep waiting until the settle window closes.
+                deadline = time.monotonic() + settle
+                while (left := deadline - time.monotonic()) > 0:
+                    self._condition.wait(left)
+            reasons, self._reasons = self._reasons, set()
+        return reasons
+
+
+def docker_event_action(event: dict) -> str:
+    action = str(event.get("Action") or event.get("status") or "")
+    return action.split(":", 1)[0].strip()
+
+
+def watch_docker_events(
+    events: Callable[[], Iterable[dict]],
+    wakeup: Wakeup,
+    *,
+    stop: threading.Event,
+    retry_seconds: float = WATCHER_RETRY_SECONDS,
+) -> None:
+    """Raise `wakeup` for each container event that can change a container signal.
+
+    `events` opens a decoded event stream. When the stream breaks (Docker restarted)
+    it is reopened after `retry_seconds`, and the loop is woken because events may have
+    been missed in between.
+    """
+    while not stop.is_set():
+        try:
+            for event in events():
+                if stop.is_set():
+                    return
+                if event.get("Type", "container") != "container":
+                    continue
+                if docker_event_action(event) in DOCKER_ALERT_EVENTS:
+                    wakeup.signal("container")
+        except Exception:  # noqa: BLE001 - the poll fallback covers a dead watcher
+            logger.warning("docker event stream failed; retrying in %ss", retry_seconds, exc_info=True)
+        if stop.is_set():
+            return
+        wakeup.signal("container")
+        stop.wait(retry_seconds)
+
+
+def watch_mountinfo(
+    wakeup: Wakeup,
+    *,
+    stop: threading.Event,
+    path: str = MOUNTINFO_PATH,
+    poller_factory: Callable[[], object] = select.poll,
+    interval_ms: int = 1000,
+) -> None:
+    """Raise `wakeup` when the mount table changes.
+
+    The kernel flags /proc/self/mountinfo with POLLPRI|POLLERR on every mount or unmount;
+    the file has to be re-read from the start to re-arm the notification.
+    """
+    try:
+        handle = open(path, "rb")
+    except OSError:
+        logger.warning("cannot watch %s; mount changes wait for the next poll", path)
+        return
+    with handle:
+        handle.read()
+        poller = poller_factory()
+        poller.register(handle.fileno(), select.POLLPRI | select.POLLERR)
+        while not stop.is_set():
+            if not poller.poll(interval_ms):
+                continue
+            handle.seek(0)
+            handle.read()
+            wakeup.signal("mount")
+
+
+def start_watchers(
+    wakeup: Wakeup,
+    stop: threading.Event,
+    *,
+    docker_events: Callable[[], Iterable[dict]] | None = None,
+    mountinfo_path: str | None = MOUNTINFO_PATH,
+) -> list[threading.Thread]:
+    threads = []
+    if docker_events is not None:
+        threads.append(
+            threading.Thread(
+                target=watch_docker_events,
+                args=(docker_events, wakeup),
+                kwargs={"stop": stop},
+                name="alertd-docker-events",
+                daemon=True,
+            )
+        )
+    if mountinfo_path:
+        threads.append(
+            threading.Thread(
+                target=watch_mountinfo,
+                args=(wakeup,),
+                kwargs={"stop": stop, "path": mountinfo_path},
+                name="alertd-mountinfo",
+                daemon=True,
+            )
+        )
+    for thread in threads:
+        thread.start()
+    return threads
+
+
 # -- extraction helpers (pure) ----------------------------------------------
 def smart_passed(data: dict) -> bool | None:
     """Best-effort SMART overall-health from a parsed SMART dict. None = unknown."""
@@ -189,8 +388,15 @@ def build_live_provider(
     snapraid_status: Callable[[], dict],
     read_proc_mounts: Callable[[], str],
     required_mounts: Iterable[str] | Callable[[], Iterable[str]],
+    slow_interval_seconds: float | None = None,
+    clock: Callable[[], float] = time.monotonic,
+    metric_signals: SignalSource | None = None,
 ) -> SignalSource:
-    """Assemble one signal provider from injected live readers (best-effort per subsystem)."""
+    """Assemble one signal provider from injected live readers (best-effort per subsystem).
+
+    With `slow_interval_seconds`, SMART and SnapRAID are only re-read on that cadence.
+    `metric_signals` adds sustained-threshold and trend signals from metric history.
+    """
 
     def _containers() -> list[Signal]:
         return container_signals(container_records(list_containers()))
@@ -215,7 +421,12 @@ def build_live_provider(
     def _snapraid() -> list[Signal]:
         return snapraid_signals(snapraid_status())
 
-    sources: list[SignalSource] = [_containers, _smart, _mounts, _snapraid]
+    slow: list[SignalSource] = [_smart, _snapraid]
+    if slow_interval_seconds is not None:
+        slow = [cadenced(source, slow_interval_seconds, clock=clock) for source in slow]
+    sources: list[SignalSource] = [_containers, slow[0], _mounts, slow[1]]
+    if metric_signals is not None:
+        sources.append(metric_signals)
 
     def _provider() -> list[Signal]:
         return collect_signals(sources)
@@ -228,9 +439,33 @@ def main() -> int:  # pragma: no cover - integration entrypoint, validated on th
     config = config_from_env()
 
     from alert_notifier import MattermostWebhookNotifier, RecordingNotifier
+    from alert_outbox import NotificationQueue
+
+    delivery_status: dict = {}
+
+    def record_delivery(notification: Notification, error: Exception | None) -> None:
+        delivery_status.clear()
+        delivery_status.update(
+            {
+                "at": notification.at,
+                "ok": error is None,
+                "error": str(error) if error else None,
+            }
+        )
 
     if config.webhook_url:
-        notifier: Notifier = MattermostWebhookNotifier(config.webhook_url)
+        webhook = MattermostWebhookNotifier(config.webhook_url)
+        if config.outbox_path is not None:
+            queue = NotificationQueue(
+                config.outbox_path,
+                deliver=webhook.deliver,
+                burst_size=config.burst_size,
+                on_result=lambda notes, error: record_delivery(notes[-1], error),
+            )
+            queue.start()
+            notifier: Notifier = queue
+        else:
+            notifier = webhook
     else:
         logger.warning("LIMEOS_ALERT_MATTERMOST_WEBHOOK unset — running in dry mode (log only)")
         notifier = RecordingNotifier()
@@ -244,32 +479,48 @@ def main() -> int:  # pragma: no cover - integration entrypoint, validated on th
     history = AlertEventLedger(config.history_path) if config.history_path is not None else None
 
     policy_holder = [_load_policy(config)]
+    docker_client = _docker_client()
     provider = _build_live_provider_from_environment(
         config,
         required_mounts_provider=lambda: policy_holder[0].required_mounts,
+        docker_client=docker_client,
+    )
+    wakeup = Wakeup()
+    stop = threading.Event()
+    start_watchers(
+        wakeup,
+        stop,
+        docker_events=(
+            (
+                lambda: docker_client.events(
+                    decode=True,
+                    filters={"type": "container", "event": list(DOCKER_ALERT_EVENTS)},
+                )
+            )
+            if docker_client is not None
+            else None
+        ),
     )
     latest_signals: list[Signal] = []
-    delivery_status: dict = {}
 
     def record_signals(signals: list[Signal]) -> None:
         latest_signals[:] = signals
 
-    def record_delivery(notification: Notification, error: Exception | None) -> None:
-        delivery_status.clear()
-        delivery_status.update(
-            {
-                "at": notification.at,
-                "ok": error is None,
-                "error": str(error) if error else None,
-            }
-        )
-
     def record_event(notification: Notification) -> None:
         if history is not None:
             history.record(notification)
 
-    logger.info("limeos alertd started (interval=%ss, mounts=%s)", config.poll_seconds, config.required_mounts)
+    logger.info(
+        "limeos alertd started (interval=%ss, slow=%ss, mounts=%s)",
+        config.poll_seconds,
+        config.slow_poll_seconds,
+        config.required_mounts,
+    )
+    timeout = 0.0
     while True:
+        reasons = wakeup.wait(timeout, settle=EVENT_SETTLE_SECONDS)
+        if reasons:
+            logger.info("evaluating on %s change", ", ".join(sorted(reasons)))
         try:
             policy_holder[0] = _load_policy(config)
             for note in run_once(
@@ -287,55 +538,64 @@ def main() -> int:  # pragma: no cover - integration entrypoint, validated on th
             _write_status(config, evaluator, latest_signals, delivery_status)
         except Exception:
             logger.exception("evaluation tick failed")
-        time.sleep(config.poll_seconds)
+        # A fault seen on an event needs `fail_threshold` readings to page; take the next
+        # one soon rather than a full poll interval later.
+        timeout = min(config.confirm_seconds, config.poll_seconds) if reasons else config.poll_seconds
+
+
+def _docker_client():  # pragma: no cover
+    try:
+        import docker as docker_sdk
+
+        return docker_sdk.from_env()
+    except Exception:
+        return None
 
 
 def _build_live_provider_from_environment(
     config: DaemonConfig,
     *,
     required_mounts_provider: Callable[[], Iterable[str]] | None = None,
+    docker_client=None,
 ) -> SignalSource:  # pragma: no cover
     """Wire the live services lazily so the module imports cleanly for tests.
 
     Container signals use the read-only Docker socket. Host SMART, mount, and
-    SnapRAID inputs use the helper's read-only health snapshot command.
+    SnapRAID inputs use the helper's read-only health snapshot command, one
+    section at a time so a mount check does not also pay for SMART.
     """
-    try:
-        import docker as docker_sdk
-
-        client = docker_sdk.from_env()
-    except Exception:
-        client = None
+    client = docker_client
 
     def list_containers():
         return client.containers.list(all=True) if client is not None else []
 
-    snapshot_cache: dict = {"read_at": 0.0, "value": {}}
+    snapshot_cache: dict = {}
 
-    def health_snapshot():
+    def health_snapshot(section: str):
         now = time.monotonic()
-        if now - snapshot_cache["read_at"] < 1:
-            return snapshot_cache["value"]
+        cached = snapshot_cache.get(section)
+        if cached is not None and now - cached[0] < 1:
+            return cached[1]
         try:
             from helper_client import helper_call
 
-            result = helper_call("alert_health_snapshot", {})
+            result = helper_call("alert_health_snapshot", {"sections": [section]})
             value = result if result.get("success") else {}
         except Exception:
             value = {}
-        snapshot_cache.update({"read_at": now, "value": value})
+        snapshot_cache[section] = (now, value)
         return value
 
     def smart_devices():
-        snapshot = health_snapshot()
+        snapshot = health_snapshot("smart")
         smart = snapshot.get("smart") or {}
         return {"disks": smart.get("devices", [])}
 
     def snapraid_status():
-        return (health_snapshot().get("snapraid") or {})
+        return (health_snapshot("snapraid").get("snapraid") or {})
 
     def read_proc_mounts():
-        snapshot = health_snapshot()
+        snapshot = health_snapshot("mounts")
         mounts = (snapshot.get("mounts") or {}).get("data")
         if isinstance(mounts, list):
             return "\n".join(
@@ -354,9 +614,20 @@ def _build_live_provider_from_environment(
         snapraid_status=snapraid_status,
         read_proc_mounts=read_proc_mounts,
         required_mounts=required_mounts_provider or config.required_mounts,
+        slow_interval_seconds=config.slow_poll_seconds,
+        metric_signals=_metric_signals(config),
     )
 
 
+def _metric_signals(config: DaemonConfig) -> SignalSource | None:  # pragma: no cover
+    if config.metrics_path is None:
+        return None
+    from metric_alerts import MetricAlertMonitor
+    from metric_history import MetricHistoryStore
+
+    return MetricAlertMonitor(MetricHistoryStore(config.metrics_path)).signals
+
+
 def _load_policy(config: DaemonConfig) -> AlertPolicy:
     raw = None
     if config.policy_path is not None:
@@ -1,10 +1,20 @@
-"""Bounded incident and recovery history for the Overview dashboard."""
+"""Bounded incident and recovery history for the Overview dashboard.
+
+The ledger is an append-only JSONL file: each transition is one appended line,
+and the file is compacted back to the newest ``max_records`` once it grows to
+twice that. Each process (the alert daemon writes, the dashboard reads) keeps
+the retained tail and every key's last event in memory and only reads the
+bytes appended since its last look, so ``recent()`` normally costs one
+``stat``.
+"""
 
 from __future__ import annotations
 
 import json
 import os
 import tempfile
+import threading
+from collections import deque
 from collections.abc import Mapping
 from pathlib import Path
 
@@ -13,6 +23,8 @@ from alert_evaluator import Notification
 
 MAX_ALERT_EVENTS = 200
 MAX_LEDGER_BYTES = 1024 * 1024
+# Compact once the file holds this many times the retained record count.
+COMPACT_FACTOR = 2
 _FIELDS = ("at", "event", "key", "kind", "severity", "summary")
 
 
@@ -52,13 +64,19 @@ def _normalize(record: Mapping) -> dict | None:
 
 
 class AlertEventLedger:
-    """Read and atomically rewrite a small transition ledger."""
+    """Append transitions to a compacting ledger and serve the tail from memory."""
 
     def __init__(self, path: Path | str, *, max_records: int = MAX_ALERT_EVENTS) -> None:
         if not isinstance(max_records, int) or isinstance(max_records, bool) or max_records < 1:
             raise ValueError("max_records must be a positive integer")
         self._path = Path(path)
         self._max_records = max_records
+        self._lock = threading.Lock()
+        self._tail: deque[dict] = deque(maxlen=max_records)
+        self._last_event: dict[str, str] = {}
+        self._identity: tuple[int, int] | None = None
+        self._offset = 0
+        self._lines = 0
 
     def record(self, notification: Notification) -> bool:
         record = _normalize(
@@ -73,48 +91,102 @@ class AlertEventLedger:
         )
         if record is None:
             raise ValueError("alert event is invalid")
-        records = self.records()
-        latest_for_key = next(
-            (item for item in reversed(records) if item["key"] == record["key"]),
-            None,
-        )
-        if latest_for_key is not None and latest_for_key["event"] == record["event"]:
-            return False
-        records.append(record)
-        self._write(records[-self._max_records :])
+        with self._lock:
+            self._refresh()
+            if self._last_event.get(record["key"]) == record["event"]:
+                return False
+            self._append(record)
+            self._refresh()
+            if (
+                self._lines >= self._max_records * COMPACT_FACTOR
+                or self._offset > MAX_LEDGER_BYTES // 2
+            ):
+                self._write(list(self._tail))
+                self._refresh()
         return True
 
     def records(self) -> list[dict]:
-        try:
-            if self._path.stat().st_size > MAX_LEDGER_BYTES:
-                return []
-            lines = self._path.read_text().splitlines()
-        except FileNotFoundError:
-            return []
-        except OSError:
-            return []
-        records = []
-        for line in lines[-self._max_records :]:
-            try:
-                raw = json.loads(line)
-            except (TypeError, ValueError):
-                continue
-            if not isinstance(raw, Mapping) or set(raw) != set(_FIELDS):
-                continue
-            record = _normalize(raw)
-            if record is not None:
-                records.append(record)
-        return records
+        with self._lock:
+            self._refresh()
+            return [dict(record) for record in self._tail]
 
     def recent(self, *, event: str | None = None, limit: int = 5) -> list[dict]:
         if event not in {None, "incident", "recovery"}:
             raise ValueError("event filter is invalid")
         if not isinstance(limit, int) or isinstance(limit, bool) or not 1 <= limit <= 50:
             raise ValueError("limit must be between 1 and 50")
-        records = self.records()
-        if event is not None:
-            records = [record for record in records if record["event"] == event]
-        return list(reversed(records[-limit:]))
+        selected = []
+        with self._lock:
+            self._refresh()
+            for record in reversed(self._tail):
+                if event is None or record["event"] == event:
+                    selected.append(dict(record))
+                    if len(selected) == limit:
+                        break
+        return selected
+
+    # -- file handling -------------------------------------------------------
+    def _reset(self) -> None:
+        self._tail.clear()
+        self._last_event.clear()
+        self._identity = None
+        self._offset = 0
+        self._lines = 0
+
+    def _refresh(self) -> None:
+        """Fold lines appended since the last look; reload after compaction."""
+        try:
+            stat = self._path.stat()
+        except OSError:
+            self._reset()
+            return
+        if stat.st_size > MAX_LEDGER_BYTES:
+            self._reset()
+            return
+        identity = (stat.st_dev, stat.st_ino)
+        if identity != self._identity or stat.st_size < self._offset:
+            # Replaced by a compaction (here or in the other process): start over.
+            self._reset()
+            self._identity = identity
+        if stat.st_size == self._offset:
+            return
+        try:
+            with self._path.open("rb") as handle:
+                handle.seek(self._offset)
+                chunk = handle.read(stat.st_size - self._offset)
+        except OSError:
+            return
+        # A writer may be mid-line; leave the partial line for the next look.
+        complete = chunk.rfind(b"\n") + 1
+        for line in chunk[:complete].splitlines():
+            self._lines += 1
+            self._fold(line)
+        self._offset += complete
+
+    def _fold(self, line: bytes) -> None:
+        try:
+            raw = json.loads(line)
+        except (TypeError, ValueError):
+            return
+        if not isinstance(raw, Mapping) or set(raw) != set(_FIELDS):
+            return
+        record = _normalize(raw)
+        if record is None:
+            return
+        self._tail.append(record)
+        self._last_event[record["key"]] = record["event"]
+
+    def _append(self, record: dict) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True, mode=0o750)
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            # See _write for why the ledger is world-readable.
+            os.fchmod(fd, 0o644)
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
     def _write(self, records: list[dict]) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True, mode=0o750)
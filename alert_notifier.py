@@ -14,6 +14,8 @@ from alert_evaluator import Notification
 
 _INCIDENT_COLOR = {"critical": "#d24b4b", "warning": "#e0a13b"}
 _RECOVERY_COLOR = "#3aa657"
+# Mattermost truncates very long attachments; list this many and count the rest.
+MAX_DIGEST_LINES = 25
 
 
 class Notifier(Protocol):
@@ -58,6 +60,40 @@ def render_mattermost_payload(notification: Notification) -> dict:
     }
 
 
+def render_mattermost_digest(notifications: list[Notification]) -> dict:
+    """One post summarising a burst of notifications raised in the same tick."""
+    incidents = [note for note in notifications if note.event == "incident"]
+    recoveries = [note for note in notifications if note.event == "recovery"]
+    if any(note.severity == "critical" for note in incidents):
+        color = _INCIDENT_COLOR["critical"]
+    elif incidents:
+        color = _INCIDENT_COLOR["warning"]
+    else:
+        color = _RECOVERY_COLOR
+    parts = []
+    if incidents:
+        parts.append(f"{len(incidents)} incident{'s' if len(incidents) != 1 else ''}")
+    if recoveries:
+        parts.append(f"{len(recoveries)} recover{'ies' if len(recoveries) != 1 else 'y'}")
+    lines = [
+        f"- {_title(note)} — {note.summary}" for note in notifications[:MAX_DIGEST_LINES]
+    ]
+    if len(notifications) > MAX_DIGEST_LINES:
+        lines.append(f"- …and {len(notifications) - MAX_DIGEST_LINES} more")
+    return {
+        "attachments": [
+            {
+                "color": color,
+                "title": f"Alert digest: {', '.join(parts)}",
+                "text": "\n".join(lines),
+                "fields": [
+                    {"short": True, "title": "At", "value": notifications[-1].at},
+                ],
+            }
+        ]
+    }
+
+
 class MattermostWebhookNotifier:
     """Posts incidents/recoveries to a Mattermost incoming webhook.
 
@@ -73,6 +109,13 @@ class MattermostWebhookNotifier:
     def send(self, notification: Notification) -> None:
         self._poster(self._webhook_url, render_mattermost_payload(notification))
 
+    def deliver(self, notifications: list[Notification]) -> None:
+        """Post one notification as itself, or several as a single digest."""
+        if len(notifications) == 1:
+            self.send(notifications[0])
+        elif notifications:
+            self._poster(self._webhook_url, render_mattermost_digest(notifications))
+
 
 def _default_poster(url: str, payload: dict) -> None:  # pragma: no cover - thin network wrapper
     import requests
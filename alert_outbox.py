@@ -0,0 +1,236 @@
+"""Durable outbound queue between the alert evaluator and its webhook (brick B2).
+
+`run_once` hands each tick's notifications to the queue and moves on; a worker thread
+delivers them. The queue is a small JSON file replaced atomically, so a crash or restart
+does not drop an accepted incident (at worst, one in flight is posted again). A failed post is retried with
+exponential backoff, in order, so a recovery never overtakes its incident. A tick that
+raises more than `burst_size` notifications (a whole stack going down) is coalesced
+into a single digest instead of one post per container.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable
+from dataclasses import asdict
+from pathlib import Path
+
+from alert_evaluator import Notification
+
+logger = logging.getLogger("limeos.alertd")
+
+DEFAULT_BURST_SIZE = 3
+DEFAULT_BASE_BACKOFF_SECONDS = 5.0
+DEFAULT_MAX_BACKOFF_SECONDS = 300.0
+# An incident nobody could be told about for a day is stale news; the dashboard
+# still shows it, so stop retrying rather than paging about yesterday.
+DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
+MAX_PENDING_ENTRIES = 500
+
+Deliver = Callable[[list[Notification]], None]
+
+
+class NotificationQueue:
+    """Persist notification batches and deliver them from a background worker.
+
+    `deliver(notifications)` posts one message: a single notification, or a digest
+    when it receives several. It raises on failure.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        deliver: Deliver,
+        burst_size: int = DEFAULT_BURST_SIZE,
+        base_backoff_seconds: float = DEFAULT_BASE_BACKOFF_SECONDS,
+        max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.time,
+        on_result: Callable[[list[Notification], Exception | None], None] | None = None,
+    ) -> None:
+        self._path = Path(path)
+        self._deliver = deliver
+        self._burst_size = max(1, int(burst_size))
+        self._base_backoff = max(0.0, float(base_backoff_seconds))
+        self._max_backoff = max(self._base_backoff, float(max_backoff_seconds))
+        self._max_age = float(max_age_seconds)
+        self._clock = clock
+        self._on_result = on_result
+        self._condition = threading.Condition()
+        self._delivering = threading.Lock()
+        self._entries: list[dict] = self._load()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    # -- producer side -------------------------------------------------------
+    def send(self, notification: Notification) -> None:
+        self.send_batch([notification])
+
+    def send_batch(self, notifications: Iterable[Notification]) -> None:
+        """Accept one tick's notifications; returns once they are on disk."""
+        notifications = list(notifications)
+        if not notifications:
+            return
+        if len(notifications) > self._burst_size:
+            batches = [notifications]
+        else:
+            batches = [[notification] for notification in notifications]
+        now = self._clock()
+        with self._condition:
+            for batch in batches:
+                self._entries.append(
+                    {
+                        "id": uuid.uuid4().hex,
+                        "created_at": now,
+                        "attempts": 0,
+                        "next_attempt_at": now,
+                        "notifications": [asdict(notification) for notification in batch],
+                    }
+                )
+            overflow = len(self._entries) - MAX_PENDING_ENTRIES
+            if overflow > 0:
+                logger.warning("alert outbox full; dropping %d oldest entries", overflow)
+                del self._entries[:overflow]
+            self._persist()
+            self._condition.notify_all()
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._entries)
+
+    # -- delivery ------------------------------------------------------------
+    def deliver_due(self) -> int:
+        """Deliver every due entry in order; stop at the first failure. Returns posts sent."""
+        sent = 0
+        with self._delivering:
+            while True:
+                with self._condition:
+                    self._expire()
+                    if not self._entries:
+                        return sent
+                    entry = self._entries[0]
+                    if entry["next_attempt_at"] > self._clock():
+                        return sent
+                notifications = [Notification(**item) for item in entry["notifications"]]
+                try:
+                    self._deliver(notifications)
+                except Exception as exc:  # noqa: BLE001 - any failure is retried later
+                    with self._condition:
+                        entry["attempts"] += 1
+                        delay = min(
+                            self._max_backoff,
+                            self._base_backoff * (2 ** (entry["attempts"] - 1)),
+                        )
+                        entry["next_attempt_at"] = self._clock() + delay
+                        self._persist()
+                    logger.warning(
+                        "alert delivery failed (attempt %d, retrying in %.0fs): %s",
+                        entry["attempts"],
+                        delay,
+                        exc,
+                    )
+                    self._report(notifications, exc)
+                    return sent
+                with self._condition:
+                    self._entries = [item for item in self._entries if item["id"] != entry["id"]]
+                    self._persist()
+                sent += 1
+                self._report(notifications, None)
+
+    def start(self) -> None:
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="alertd-outbox", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            self.deliver_due()
+            with self._condition:
+                if self._stopping:
+                    return
+                if self._entries:
+                    delay = max(0.0, self._entries[0]["next_attempt_at"] - self._clock())
+                else:
+                    delay = None
+                if delay is None or delay > 0:
+                    self._condition.wait(delay)
+                if self._stopping:
+                    return
+
+    def _report(self, notifications: list[Notification], error: Exception | None) -> None:
+        if self._on_result is None:
+            return
+        try:
+            self._on_result(notifications, error)
+        except Exception:  # noqa: BLE001 - status reporting must not stop delivery
+            logger.exception("alert delivery status callback failed")
+
+    # -- persistence ---------------------------------------------------------
+    def _expire(self) -> None:
+        cutoff = self._clock() - self._max_age
+        fresh = [entry for entry in self._entries if entry["created_at"] >= cutoff]
+        if len(fresh) != len(self._entries):
+            logger.warning(
+                "dropping %d undelivered alert notifications older than %ds",
+                len(self._entries) - len(fresh),
+                self._max_age,
+            )
+            self._entries = fresh
+            self._persist()
+
+    def _load(self) -> list[dict]:
+        try:
+            raw = json.loads(self._path.read_text())
+        except (FileNotFoundError, ValueError, OSError):
+            return []
+        if not isinstance(raw, dict):
+            return []
+        entries = []
+        for entry in raw.get("entries") or []:
+            try:
+                notifications = [Notification(**item) for item in entry["notifications"]]
+                entries.append(
+                    {
+                        "id": str(entry["id"]),
+                        "created_at": float(entry["created_at"]),
+                        "attempts": int(entry.get("attempts", 0)),
+                        "next_attempt_at": float(entry.get("next_attempt_at", 0)),
+                        "notifications": [asdict(item) for item in notifications],
+                    }
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        return entries
+
+    def _persist(self) -> None:
+        directory = self._path.parent
+        directory.mkdir(parents=True, exist_ok=True)
+        # Atomic replace so a crash mid-write can't lose or duplicate queued alerts.
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{self._path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as handle:
+                json.dump({"entries": self._entries}, handle)
+            os.replace(tmp, self._path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
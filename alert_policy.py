@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from typing import Any, Mapping
 
 
-ALERT_KINDS = ("container", "smart", "mount", "snapraid")
+ALERT_KINDS = ("container", "smart", "mount", "snapraid", "metric")
 
 
 def default_alert_policy() -> dict[str, Any]:
@@ -11,6 +11,7 @@ from flask import (
     send_from_directory,
     session,
 )
+import atexit
 import os
 import time
 import psutil  # noqa: F401  (referenced as app.psutil in tests)
@@ -79,7 +80,7 @@ from media_seed_service import MediaSeedService
 from tools_manager import tools_manager, default_tools_service
 from tools_service import ToolsService
 from storage_plugins import default_storage_read_service, storage_bp
-from storage_plugins.registry import init_plugins
+from storage_plugins.registry import get_registry, init_plugins
 from storage_capability_adapters import LegacyStorageCapabilityAdapter
 from integration_capability_adapters import IntegrationCapabilityAdapter
 from pi_monitor import get_pi_metrics
@@ -90,6 +91,8 @@ from backup_service import BackupService
 from disk_manager import (
     default_disk_inventory_service,
     default_disk_mount_service,
+    default_disk_benchmark_service,
+    default_disk_io_history,
     default_disk_summary_service,
     default_disk_suggestion_service,
     default_media_paths_service,
@@ -99,6 +102,10 @@ from disk_manager import (
 )
 from disk_inventory_service import DiskInventoryService
 from disk_summary_service import DiskSummaryService
+from disk_benchmark_service import DiskBenchmarkService
+from disk_io_history import DiskIoHistoryStore
+from disk_usage_index import DiskUsageError, DiskUsageIndex
+from duplicate_finder import DuplicateFinder, ScanRoot, media_category
 from disk_mount_service import DiskMountService
 from media_layout import DOWNLOAD_CATEGORIES, LIBRARY_KINDS
 from media_paths_service import MediaPathsService
@@ -116,8 +123,13 @@ from smart_service import SmartService
 from storage_read_service import StorageReadService
 from setup_manager import setup_manager
 from helper_client import helper_call
-from operation_manager import OperationRegistry, OperationCapacityError
+from operation_manager import (
+    OperationCapacityError,
+    OperationConflictError,
+    OperationRegistry,
+)
 from operation_sse import stream_operation_response
+from operation_store import OperationStore
 from overview_service import OverviewService
 from metric_history import InvalidMetricRange, MetricHistoryStore
 from pihealth_update_service import stream_update as stream_pihealth_update
@@ -147,7 +159,10 @@ from container_inventory_service import (
 from container_operations_service import ContainerOperationsService
 from container_stats_service import ContainerStatsService
 from process_stats import ProcessSampler
+from activity_history import ActivityHistoryStore
 from activity_service import ActivityService
+from download_governor import DownloadGovernor, GovernorConfigError
+from scrub_planner import ScrubPlanner, ScrubPlannerConfigError
 from host_prerequisites import HostPrerequisiteService
 from pending_actions import PendingActionStore, REBOOT_REQUIRED
 from network_diagnostics_service import (  # noqa: F401  (several names re-exported for tests)
@@ -179,6 +194,7 @@ from runtime_paths import (
     CONFIG_DIR as RUNTIME_CONFIG_DIR,
     INTEGRATIONS_CONFIG_DIR as RUNTIME_INTEGRATIONS_CONFIG_DIR,
     INTEGRATIONS_STATE_DIR as RUNTIME_INTEGRATIONS_STATE_DIR,
+    OPERATIONS_STATE_DIR as RUNTIME_OPERATIONS_STATE_DIR,
     STATE_DIR as RUNTIME_STATE_DIR,
     STORAGE_PLUGIN_CONFIG_DIR as RUNTIME_STORAGE_PLUGIN_CONFIG_DIR,
 )
@@ -203,6 +219,8 @@ STORAGE_PLUGIN_CONFIG_DIR = str(RUNTIME_STORAGE_PLUGIN_CONFIG_DIR)
 PIHEALTH_UPDATE_CONFIG = str(RUNTIME_CONFIG_DIR / "pihealth_update.json")
 MEDIA_LAYOUT_CONFIG = str(RUNTIME_CONFIG_DIR / "media_layout.json")
 MEDIA_PROFILE_CONFIG = str(RUNTIME_CONFIG_DIR / "media_profile.json")
+DOWNLOAD_GOVERNOR_CONFIG = str(RUNTIME_STATE_DIR / "download_governor.json")
+SCRUB_PLANNER_CONFIG = str(RUNTIME_STATE_DIR / "scrub_planner.json")
 DEFAULT_PIHEALTH_UPDATE_CONFIG = {
     "repo_path": f"/home/{os.getenv('USER', 'pi')}/pi-health",
     "service_name": "pi-health"
@@ -241,6 +259,9 @@ class AppDependencies:
     container_stats_service: ContainerStatsService | None = None
     process_sampler: ProcessSampler | None = None
     activity_service: ActivityService | None = None
+    activity_history_service: ActivityHistoryStore | None = None
+    download_governor: DownloadGovernor | None = None
+    scrub_planner: ScrubPlanner | None = None
     host_prerequisite_service: HostPrerequisiteService | None = None
     pending_action_store: PendingActionStore | None = None
     container_inventory_service: ContainerInventoryService | None = None
@@ -252,6 +273,10 @@ class AppDependencies:
     stack_operations_service: StackOperationsService | None = None
     disk_inventory_service: DiskInventoryService | None = None
     disk_summary_service: DiskSummaryService | None = None
+    disk_benchmark_service: DiskBenchmarkService | None = None
+    disk_io_history: DiskIoHistoryStore | None = None
+    disk_usage_index: DiskUsageIndex | None = None
+    duplicate_finder: DuplicateFinder | None = None
     disk_mount_service: DiskMountService | None = None
     media_paths_service: MediaPathsService | None = None
     media_layout_service: MediaLayoutService | None = None
@@ -330,13 +355,69 @@ def _default_container_stats_service(docker_port):
     return ContainerStatsService(docker=docker_port)
 
 
-def _default_activity_service(container_inventory_service):
+def _default_activity_service(container_inventory_service, activity_history=None):
     return ActivityService(
         container_provider=lambda: container_inventory_service.list_containers(
             include_stats=False
         ),
         inspect_reader=container_inventory_service.inspect,
+        history_recorder=activity_history.observe if activity_history is not None else None,
+        history_flusher=activity_history.flush if activity_history is not None else None,
+    )
+
+
+def _default_download_governor(repository, activity_service, system_service):
+    return DownloadGovernor(
+        repository=repository,
+        config_path_provider=lambda: DOWNLOAD_GOVERNOR_CONFIG,
+        activity_reader=activity_service.refresh,
+        client_reader=activity_service.download_clients,
+        host_reader=system_service.stats,
+    )
+
+
+def _snapraid_plugin():
+    plugin = get_registry().get("snapraid")
+    if plugin is None:
+        raise RuntimeError("SnapRAID plugin is not available")
+    return plugin
+
+
+def _run_snapraid_scrub(percent, older_than_days):
+    results = _snapraid_plugin().run_command(
+        "scrub", {"percent": percent, "age_days": older_than_days}
     )
+    while True:
+        try:
+            next(results)
+        except StopIteration as stop:
+            result = stop.value
+            break
+    if result is None or not result.success:
+        raise RuntimeError(getattr(result, "error", None) or "SnapRAID scrub failed")
+
+
+def _default_scrub_planner(repository, activity_service):
+    return ScrubPlanner(
+        repository=repository,
+        config_path_provider=lambda: SCRUB_PLANNER_CONFIG,
+        status_reader=lambda: _snapraid_plugin().get_status_model(),
+        scrub_runner=_run_snapraid_scrub,
+        activity_reader=activity_service.refresh,
+    )
+
+
+def _default_activity_history_service():
+    # Shares the metric database so activity and host load chart on one timeline.
+    return ActivityHistoryStore(RUNTIME_STATE_DIR / "metrics.sqlite3")
+
+
+def _default_disk_usage_index():
+    return DiskUsageIndex(RUNTIME_STATE_DIR / "disk_usage.sqlite3")
+
+
+def _default_duplicate_finder():
+    return DuplicateFinder(RUNTIME_STATE_DIR / "duplicates.sqlite3")
 
 
 def _default_media_layout_service(helper, repository, storage_contract_loader=None):
@@ -683,7 +764,11 @@ def _default_dependencies():
         users=users,
         login_rate_limiter=LoginRateLimiter(clock=clock),
         docker_client=client,
-        operation_registry=OperationRegistry(clock=clock),
+        operation_registry=OperationRegistry(
+            clock=clock,
+            spill_dir=RUNTIME_OPERATIONS_STATE_DIR,
+            store=OperationStore(RUNTIME_STATE_DIR / "operations.sqlite3"),
+        ),
         clock=clock,
         helper=HelperClientAdapter(),
         docker=DockerClientAdapter(client),
@@ -1112,6 +1197,272 @@ def api_system_history():
     return jsonify(history)
 
 
+@core_api.route('/api/activity/history', methods=['GET'])
+@login_required
+def api_activity_history():
+    """Return bounded stream, transcode and download history for one fixed range."""
+    try:
+        history = current_app.extensions["activity_history_service"].query(
+            request.args.get("range", "24h")
+        )
+    except InvalidMetricRange as error:
+        return jsonify({"error": str(error)}), 400
+    return jsonify(history)
+
+
+@core_api.route('/api/activity/governor', methods=['GET'])
+@login_required
+def api_download_governor_status():
+    """Return the download governor's settings, state and recent changes."""
+    return jsonify(current_app.extensions["download_governor"].status())
+
+
+@core_api.route('/api/activity/governor', methods=['POST'])
+@login_required
+@csrf_protect
+def api_download_governor_update():
+    """Update download governor settings; disabling restores any throttled limits."""
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Expected a JSON object"}), 400
+    try:
+        status = current_app.extensions["download_governor"].update_config(payload)
+    except GovernorConfigError as error:
+        return jsonify({"error": str(error)}), 400
+    return jsonify(status)
+
+
+@core_api.route('/api/storage/snapraid/scrub-planner', methods=['GET'])
+@login_required
+def api_scrub_planner_status():
+    """Return the adaptive scrub planner's settings, idle state and recent slices."""
+    return jsonify(current_app.extensions["scrub_planner"].status())
+
+
+@core_api.route('/api/storage/snapraid/scrub-planner', methods=['POST'])
+@login_required
+@csrf_protect
+def api_scrub_planner_update():
+    """Update adaptive scrub planner settings."""
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Expected a JSON object"}), 400
+    try:
+        status = current_app.extensions["scrub_planner"].update_config(payload)
+    except ScrubPlannerConfigError as error:
+        return jsonify({"error": str(error)}), 400
+    return jsonify(status)
+
+
+def _disk_usage_suggestions():
+    """Scan targets worth offering: media roots and MergerFS pools."""
+    layout = _media_layout_service().layout()
+    suggestions = [
+        {"path": layout.storage_root, "label": "Media library"},
+        {"path": layout.downloads_root, "label": "Downloads"},
+        {"path": layout.backup_root, "label": "Backups"},
+    ]
+    try:
+        plugin = get_registry().get("mergerfs")
+        pools = plugin.get_config().get("pools", []) if plugin is not None else []
+    except Exception:
+        pools = []
+    for pool in pools:
+        if pool.get("mount_point") and pool.get("branches"):
+            suggestions.append(
+                {
+                    "path": pool["mount_point"],
+                    "label": f"MergerFS pool {pool.get('name', '')}".strip(),
+                    "branches": list(pool["branches"]),
+                }
+            )
+    return suggestions
+
+
+def _disk_usage_target(path):
+    """Resolve a requested scan root to ``(root, sources)`` or raise DiskUsageError."""
+    if not isinstance(path, str) or not path.startswith("/"):
+        raise DiskUsageError("Path must be absolute")
+    root = os.path.normpath(path)
+    suggestions = _disk_usage_suggestions()
+    for suggestion in suggestions:
+        mount, branches = suggestion["path"], suggestion.get("branches")
+        if not branches:
+            continue
+        if root == mount:
+            return root, branches
+        if root.startswith(mount.rstrip("/") + "/"):
+            # Read the same directory on each branch rather than through FUSE.
+            relative = os.path.relpath(root, mount)
+            sources = [os.path.join(branch, relative) for branch in branches]
+            if not any(os.path.isdir(source) for source in sources):
+                raise DiskUsageError(f"{root} is not a directory")
+            return root, sources
+    if not (root.startswith("/mnt/") or any(item["path"] == root for item in suggestions)):
+        raise DiskUsageError("Only mounts under /mnt and media paths can be scanned")
+    if not os.path.isdir(root):
+        raise DiskUsageError(f"{root} is not a directory")
+    return root, None
+
+
+def _duplicate_scan_roots():
+    """Pool branches under their mount point, plus media roots outside any pool."""
+    roots = []
+    pool_mounts = []
+    for suggestion in _disk_usage_suggestions():
+        branches = suggestion.get("branches")
+        if branches:
+            pool_mounts.append(suggestion["path"])
+            roots.extend(ScanRoot(branch, suggestion["path"]) for branch in branches)
+    layout = _media_layout_service().layout()
+    for path in (layout.storage_root, layout.downloads_root):
+        inside_pool = any(path == mount or path.startswith(mount + "/") for mount in pool_mounts)
+        if not inside_pool and os.path.isdir(path):
+            roots.append(ScanRoot(path, path))
+    return roots
+
+
+@core_api.route('/api/storage/duplicates', methods=['GET'])
+@login_required
+def api_duplicate_groups():
+    """Return duplicate-file groups from the last scan, largest waste first."""
+    try:
+        limit = int(request.args.get("limit", 100))
+    except ValueError:
+        return jsonify({"error": "limit must be a number"}), 400
+    layout = _media_layout_service().layout()
+    return jsonify(
+        current_app.extensions["duplicate_finder"].groups(
+            limit=limit,
+            categorize=lambda path: media_category(path, layout),
+        )
+    )
+
+
+@core_api.route('/api/storage/duplicates/scan', methods=['POST'])
+@login_required
+@csrf_protect
+def api_duplicate_scan():
+    """Start a streamed duplicate-file scan of the pools and media roots."""
+    roots = _duplicate_scan_roots()
+    if not roots:
+        return jsonify({"error": "No MergerFS pools or media folders to scan"}), 400
+    finder = current_app.extensions["duplicate_finder"]
+
+    def produce_events():
+        yield from finder.scan(roots)
+
+    try:
+        operation = current_app.extensions["operation_registry"].create(
+            owner=session['csrf_token'],
+            username=session.get('username', 'unknown'),
+            kind='duplicate_scan',
+            target=",".join(root.path for root in roots),
+            producer=produce_events,
+            conflict_key="duplicate-scan",
+        )
+    except OperationConflictError:
+        return jsonify({'error': 'A duplicate scan is already running'}), 409
+    except OperationCapacityError as exc:
+        return jsonify({'error': str(exc)}), 429
+    except RuntimeError as exc:
+        return jsonify({'error': f'Unable to start scan: {exc}'}), 500
+
+    return jsonify({
+        'operation_id': operation.operation_id,
+        'stream_url': f'/api/storage/duplicates/operations/{operation.operation_id}/stream',
+    }), 202
+
+
+@core_api.route('/api/storage/duplicates/operations/<operation_id>/stream', methods=['GET'])
+@login_required
+def api_stream_duplicate_scan(operation_id):
+    """Replay and follow one duplicate-file scan."""
+    return stream_operation_response(
+        current_app.extensions["operation_registry"],
+        operation_id,
+        expected_kind='duplicate_scan',
+    )
+
+
+@core_api.route('/api/storage/usage', methods=['GET'])
+@login_required
+def api_disk_usage_roots():
+    """List indexed roots and suggested scan targets."""
+    return jsonify({
+        "roots": current_app.extensions["disk_usage_index"].roots(),
+        "suggestions": _disk_usage_suggestions(),
+    })
+
+
+@core_api.route('/api/storage/usage/tree', methods=['GET'])
+@login_required
+def api_disk_usage_tree():
+    """Return one indexed directory and its largest subdirectories."""
+    try:
+        limit = int(request.args.get("limit", 100))
+    except ValueError:
+        return jsonify({"error": "limit must be a number"}), 400
+    try:
+        tree = current_app.extensions["disk_usage_index"].children(
+            request.args.get("root", ""),
+            request.args.get("path", ""),
+            limit=limit,
+        )
+    except DiskUsageError as exc:
+        return jsonify({"error": str(exc)}), 404
+    return jsonify(tree)
+
+
+@core_api.route('/api/storage/usage/scan', methods=['POST'])
+@login_required
+@csrf_protect
+def api_disk_usage_scan():
+    """Start a streamed, incremental directory-size scan."""
+    data = request.get_json(silent=True) or {}
+    try:
+        root, sources = _disk_usage_target(data.get("path"))
+    except DiskUsageError as exc:
+        return jsonify({"error": str(exc)}), 400
+    index = current_app.extensions["disk_usage_index"]
+    full = bool(data.get("full"))
+
+    def produce_events():
+        yield from index.scan(root, sources, full=full)
+
+    try:
+        operation = current_app.extensions["operation_registry"].create(
+            owner=session['csrf_token'],
+            username=session.get('username', 'unknown'),
+            kind='disk_usage_scan',
+            target=root,
+            producer=produce_events,
+            conflict_key=f"disk-usage:{root}",
+        )
+    except OperationConflictError:
+        return jsonify({'error': f'A scan of {root} is already running'}), 409
+    except OperationCapacityError as exc:
+        return jsonify({'error': str(exc)}), 429
+    except RuntimeError as exc:
+        return jsonify({'error': f'Unable to start scan: {exc}'}), 500
+
+    return jsonify({
+        'operation_id': operation.operation_id,
+        'stream_url': f'/api/storage/usage/operations/{operation.operation_id}/stream',
+    }), 202
+
+
+@core_api.route('/api/storage/usage/operations/<operation_id>/stream', methods=['GET'])
+@login_required
+def api_stream_disk_usage_scan(operation_id):
+    """Replay and follow one directory-size scan."""
+    return stream_operation_response(
+        current_app.extensions["operation_registry"],
+        operation_id,
+        expected_kind='disk_usage_scan',
+    )
+
+
 @core_api.route('/api/containers', methods=['GET'])
 @login_required
 def api_list_containers():
@@ -1664,9 +2015,30 @@ def create_app(config=None, dependencies=None):
             application.extensions["container_stats_service"],
         )
     )
+    application.extensions["activity_history_service"] = (
+        resolved.activity_history_service or _default_activity_history_service()
+    )
     application.extensions["activity_service"] = (
         resolved.activity_service
-        or _default_activity_service(application.extensions["container_inventory_service"])
+        or _default_activity_service(
+            application.extensions["container_inventory_service"],
+            application.extensions["activity_history_service"],
+        )
+    )
+    application.extensions["download_governor"] = (
+        resolved.download_governor
+        or _default_download_governor(
+            application.extensions["config_repo"],
+            application.extensions["activity_service"],
+            application.extensions["system_service"],
+        )
+    )
+    application.extensions["scrub_planner"] = (
+        resolved.scrub_planner
+        or _default_scrub_planner(
+            application.extensions["config_repo"],
+            application.extensions["activity_service"],
+        )
     )
     application.extensions["container_operations_service"] = (
         resolved.container_operations_service
@@ -1739,13 +2111,31 @@ def create_app(config=None, dependencies=None):
     application.extensions["smart_service"] = (
         resolved.smart_service or default_smart_service(application.extensions["helper"])
     )
+    application.extensions["disk_benchmark_service"] = (
+        resolved.disk_benchmark_service
+        or default_disk_benchmark_service(
+            application.extensions["helper"],
+            application.extensions["config_repo"],
+        )
+    )
+    application.extensions["disk_io_history"] = (
+        resolved.disk_io_history or default_disk_io_history()
+    )
     application.extensions["disk_summary_service"] = (
         resolved.disk_summary_service
         or default_disk_summary_service(
             application.extensions["disk_inventory_service"],
             application.extensions["smart_service"],
+            benchmark_service=application.extensions["disk_benchmark_service"],
+            io_history=application.extensions["disk_io_history"],
         )
     )
+    application.extensions["disk_usage_index"] = (
+        resolved.disk_usage_index or _default_disk_usage_index()
+    )
+    application.extensions["duplicate_finder"] = (
+        resolved.duplicate_finder or _default_duplicate_finder()
+    )
     application.extensions["storage_read_service"] = (
         resolved.storage_read_service or default_storage_read_service()
     )
@@ -1880,6 +2270,14 @@ def create_app(config=None, dependencies=None):
         # Keeps container CPU and byte rates warm so dashboard reads never block
         # on Docker, and so the first read already has a delta baseline.
         application.extensions["container_stats_service"].start()
+        # Serves the activity panel its last snapshot while a slow *arr is polled,
+        # and keeps sampling slowly for the activity history while nobody reads.
+        application.extensions["activity_service"].start()
+        # Writes the open activity-history bucket on a clean shutdown.
+        atexit.register(application.extensions["activity_service"].stop)
+        # Opt-in; the thread only reads its config until someone enables it.
+        application.extensions["download_governor"].start()
+        application.extensions["scrub_planner"].start()
         _converge_host_prerequisites(application)
 
     print(f"Loaded {len(resolved.users)} user(s) for authentication")
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import json
-import urllib.error
-import urllib.request
 import xml.etree.ElementTree as ET
 from collections.abc import Callable, Mapping
 from typing import Any
 
+from http_pool import pooled_transport
+
 
 class ArrClientError(RuntimeError):
     """Raised when a Servarr API call fails."""
@@ -17,16 +17,19 @@ class ArrClientError(RuntimeError):
 HttpTransport = Callable[[str, str, Mapping[str, str], bytes | None], Any]
 
 
-def urllib_transport(method: str, url: str, headers: Mapping[str, str], body: bytes | None):
-    request = urllib.request.Request(url, data=body, headers=dict(headers), method=method)
+SEED_TIMEOUT_SECONDS = 20.0
+
+
+def http_transport(method: str, url: str, headers: Mapping[str, str], body: bytes | None):
+    """JSON call over the shared keep-alive pool, raising ``ArrClientError`` on failure."""
     try:
-        with urllib.request.urlopen(request, timeout=20) as response:  # noqa: S310 - local admin API
-            payload = response.read()
-    except urllib.error.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="replace")
-        raise ArrClientError(f"{method} {url} failed: {exc.code} {detail}") from exc
+        response = pooled_transport(method, url, headers, body, SEED_TIMEOUT_SECONDS)
     except OSError as exc:
         raise ArrClientError(f"{method} {url} failed: {exc}") from exc
+    if response.status >= 400:
+        detail = response.body.decode("utf-8", errors="replace")
+        raise ArrClientError(f"{method} {url} failed: {response.status} {detail}")
+    payload = response.body
     if not payload:
         return None
     try:
@@ -60,7 +63,7 @@ class ArrClient:
         port: int,
         api_key: str,
         host: str = "127.0.0.1",
-        transport: HttpTransport = urllib_transport,
+        transport: HttpTransport = http_transport,
     ) -> None:
         self._base_url = f"http://{host}:{port}/api/v3"
         self._headers = {
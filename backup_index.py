@@ -0,0 +1,460 @@
+"""Seekable backup archives: independently compressed frames plus sidecars.
+
+A ``.tar.zst`` or ``.tar.gz`` archive is written as a run of frames, each the
+compressed form of the next FRAME_SIZE bytes of the tar stream. zstd and gzip
+both decode concatenated frames as one stream, so the archive still extracts
+whole with plain ``tar``. A JSON sidecar beside it records where every frame
+starts in the file and in the tar stream, and where each member's headers and
+data sit, so restoring one file only decompresses the frames that hold it.
+A second, small sidecar describes the run itself (sources, sizes, duration,
+checksum) so listings never need to open the archive.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import os
+import subprocess
+import tarfile
+import tempfile
+from collections.abc import Callable, Iterable
+
+from chunk_store import selected
+
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".index.json"
+METADATA_SUFFIX = ".meta.json"
+SIDECAR_SUFFIXES = (INDEX_SUFFIX, METADATA_SUFFIX)
+FRAME_SIZE = 32 * 1024 * 1024
+# Members up to this size are verified in memory before tar sees them; larger
+# ones spill to a temporary file.
+STAGE_IN_MEMORY_BYTES = 8 * 1024 * 1024
+STAGE_READ_BYTES = 1024 * 1024
+BLOCK = 512
+END_OF_ARCHIVE = b"\0" * (2 * BLOCK)
+_EXTENSION_TYPES = {
+    tarfile.GNUTYPE_LONGNAME,
+    tarfile.GNUTYPE_LONGLINK,
+    tarfile.XHDTYPE,
+    tarfile.XGLTYPE,
+    tarfile.SOLARIS_XHDTYPE,
+}
+_TYPES = {
+    tarfile.REGTYPE: "file",
+    tarfile.AREGTYPE: "file",
+    tarfile.CONTTYPE: "file",
+    tarfile.DIRTYPE: "dir",
+    tarfile.SYMTYPE: "symlink",
+    tarfile.LNKTYPE: "hardlink",
+}
+
+
+class BackupIndexError(Exception):
+    """Raised when an index is missing, unreadable or disagrees with its archive."""
+
+
+def index_path(archive_path: str) -> str:
+    return f"{archive_path}{INDEX_SUFFIX}"
+
+
+def metadata_path(archive_path: str) -> str:
+    return f"{archive_path}{METADATA_SUFFIX}"
+
+
+def _padded(size: int) -> int:
+    return -(-size // BLOCK) * BLOCK
+
+
+def _digest():
+    return hashlib.blake2b(digest_size=32)
+
+
+def _pax_records(data: bytes) -> dict[str, str]:
+    records = {}
+    position = 0
+    while position < len(data):
+        space = data.find(b" ", position)
+        if space < 0:
+            break
+        try:
+            length = int(data[position:space])
+        except ValueError:
+            break
+        if length <= 0:
+            break
+        key, _, value = data[space + 1:position + length - 1].partition(b"=")
+        records[key.decode("utf-8", "surrogateescape")] = value.decode(
+            "utf-8", "surrogateescape"
+        )
+        position += length
+    return records
+
+
+class TarIndexer:
+    """Record each member's offsets and digest while a tar stream passes by.
+
+    ``feed`` takes the stream in blocks of any size. If a header does not
+    parse, indexing stops and ``failed`` is set; the archive itself is fine.
+    """
+
+    def __init__(self) -> None:
+        self.entries: list[dict] = []
+        self.failed = False
+        self._offset = 0
+        self._header = bytearray()
+        self._data_left = 0
+        self._pad_left = 0
+        self._extension: bytearray | None = None
+        self._extension_type = b""
+        self._hasher = None
+        self._entry: dict | None = None
+        self._member_start: int | None = None
+        self._long_name: str | None = None
+        self._long_link: str | None = None
+        self._pax: dict[str, str] = {}
+
+    def feed(self, data: bytes) -> None:
+        if self.failed:
+            return
+        view = memoryview(data)
+        position = 0
+        while position < len(view):
+            available = len(view) - position
+            if self._data_left:
+                take = min(self._data_left, available)
+                piece = view[position:position + take]
+                if self._extension is not None:
+                    self._extension += piece
+                elif self._hasher is not None:
+                    self._hasher.update(piece)
+                self._data_left -= take
+                if not self._data_left:
+                    self._finish_data()
+            elif self._pad_left:
+                take = min(self._pad_left, available)
+                self._pad_left -= take
+            else:
+                take = min(BLOCK - len(self._header), available)
+                self._header += view[position:position + take]
+                if len(self._header) == BLOCK:
+                    header = bytes(self._header)
+                    self._header.clear()
+                    self._parse_header(header, self._offset + take - BLOCK)
+                    if self.failed:
+                        return
+            position += take
+            self._offset += take
+
+    def _parse_header(self, block: bytes, offset: int) -> None:
+        if block == b"\0" * BLOCK:
+            return
+        try:
+            info = tarfile.TarInfo.frombuf(block, "utf-8", "surrogateescape")
+        except tarfile.HeaderError:
+            self.failed = True
+            return
+        if self._member_start is None:
+            self._member_start = offset
+        size = info.size
+        if info.type in _EXTENSION_TYPES:
+            self._extension = bytearray()
+            self._extension_type = info.type
+        else:
+            if "size" in self._pax:
+                size = int(self._pax["size"])
+            path = self._pax.get("path") or self._long_name or info.name
+            kind = _TYPES.get(info.type, "other")
+            self._entry = {
+                "path": "/" + path.strip("/"),
+                "type": kind,
+                "mode": info.mode,
+                "size": size,
+                "mtime": int(float(self._pax.get("mtime", info.mtime))),
+                "offset": self._member_start,
+                "data_offset": offset + BLOCK,
+            }
+            if kind == "hardlink":
+                link = self._pax.get("linkpath") or self._long_link or info.linkname
+                self._entry["link"] = "/" + link.strip("/")
+            self._hasher = _digest() if kind == "file" else None
+            self._member_start = None
+            self._long_name = None
+            self._long_link = None
+            self._pax = {}
+        self._data_left = size
+        self._pad_left = _padded(size) - size
+        if not size:
+            self._finish_data()
+
+    def _finish_data(self) -> None:
+        if self._extension is not None:
+            data = bytes(self._extension)
+            if self._extension_type == tarfile.GNUTYPE_LONGNAME:
+                self._long_name = data.rstrip(b"\0").decode("utf-8", "surrogateescape")
+            elif self._extension_type == tarfile.GNUTYPE_LONGLINK:
+                self._long_link = data.rstrip(b"\0").decode("utf-8", "surrogateescape")
+            elif self._extension_type in (tarfile.XHDTYPE, tarfile.SOLARIS_XHDTYPE):
+                self._pax.update(_pax_records(data))
+            self._extension = None
+            return
+        entry, self._entry = self._entry, None
+        if entry is None:
+            return
+        if self._hasher is not None:
+            entry["hash"] = self._hasher.hexdigest()
+            self._hasher = None
+        self.entries.append(entry)
+
+
+class FrameWriter:
+    """Feed a stream to one compressor process per frame, all into one file.
+
+    Each compressor is started by ``start`` with its output going to the
+    archive; ``position`` reports the archive's current size. The writer
+    stands in for a single pipeline stage: it has ``returncode``, ``args``,
+    ``kill`` and ``wait`` like the process it replaces.
+    """
+
+    def __init__(
+        self,
+        start: Callable[[], subprocess.Popen],
+        position: Callable[[], int],
+        *,
+        frame_size: int = FRAME_SIZE,
+        tap: Callable[[bytes], None] | None = None,
+    ) -> None:
+        self.frames: list[list[int]] = []
+        self.returncode = 0
+        self.args: list[str] = []
+        self._start = start
+        self._position = position
+        self._frame_size = frame_size
+        self._tap = tap
+        self._process: subprocess.Popen | None = None
+        self._written = 0
+        self._frame_start = (0, 0)
+
+    def write(self, data: bytes) -> None:
+        if self.returncode:
+            raise BrokenPipeError("compressor failed")
+        if self._tap is not None:
+            self._tap(data)
+        view = memoryview(data)
+        while view:
+            if self._process is None:
+                self._frame_start = (self._written, self._position())
+                self._process = self._start()
+                self.args = self._process.args
+            used = self._written - self._frame_start[0]
+            take = min(self._frame_size - used, len(view))
+            self._process.stdin.write(view[:take])
+            self._written += take
+            view = view[take:]
+            if used + take == self._frame_size:
+                self._finish_frame()
+                if self.returncode:
+                    raise BrokenPipeError("compressor failed")
+
+    def close(self) -> None:
+        if self._process is not None:
+            self._finish_frame()
+
+    def kill(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+
+    def wait(self) -> int:
+        return self.returncode
+
+    def _finish_frame(self) -> None:
+        process, self._process = self._process, None
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        if process.wait():
+            self.returncode = process.returncode
+            return
+        stream_start, file_start = self._frame_start
+        self.frames.append(
+            [stream_start, self._written - stream_start, file_start, self._position() - file_start]
+        )
+
+
+def build_index(
+    archive_name: str, compression: str, frames: list[list[int]], indexer: TarIndexer
+) -> dict:
+    return {
+        "version": INDEX_VERSION,
+        "archive": archive_name,
+        "compression": compression,
+        # [stream offset, stream length, file offset, file length] per frame
+        "frames": frames,
+        "entries": indexer.entries,
+    }
+
+
+def _write_json(path: str, data: dict) -> None:
+    temp = f"{path}.tmp"
+    with open(temp, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, separators=(",", ":"))
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.chmod(temp, 0o644)
+    os.replace(temp, path)
+
+
+def write_index(archive_path: str, index: dict) -> None:
+    _write_json(index_path(archive_path), index)
+
+
+def write_metadata(archive_path: str, metadata: dict) -> None:
+    _write_json(metadata_path(archive_path), metadata)
+
+
+def load_metadata(archive_path: str) -> dict | None:
+    """The run summary written beside an archive, or None for older archives."""
+    try:
+        with open(metadata_path(archive_path), encoding="utf-8") as handle:
+            metadata = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    return metadata if isinstance(metadata, dict) else None
+
+
+def file_digest(path: str, block_size: int = 1024 * 1024) -> str:
+    hasher = _digest()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def load_index(archive_path: str) -> dict:
+    try:
+        with open(index_path(archive_path), encoding="utf-8") as handle:
+            index = json.load(handle)
+    except FileNotFoundError:
+        raise BackupIndexError("Archive has no index") from None
+    except (OSError, ValueError) as exc:
+        raise BackupIndexError(f"Unreadable archive index: {exc}") from None
+    if (
+        not isinstance(index, dict)
+        or index.get("version") != INDEX_VERSION
+        or not isinstance(index.get("frames"), list)
+        or not isinstance(index.get("entries"), list)
+    ):
+        raise BackupIndexError("Unsupported archive index")
+    return index
+
+
+def select_entries(entries: Iterable[dict], paths: Iterable[str]) -> list[dict]:
+    """Entries at or beneath any of ``paths``, in archive order.
+
+    A hard link only extracts next to the file it points at, so each selected
+    link brings its target along. Raises BackupIndexError when the index does
+    not say where a selected link points.
+    """
+    entries = list(entries)
+    paths = list(paths)
+    chosen = {
+        entry["offset"]: entry for entry in entries if selected(entry.get("path", ""), paths)
+    }
+    for link in [entry for entry in chosen.values() if entry.get("type") == "hardlink"]:
+        target = next(
+            (
+                entry
+                for entry in entries
+                if entry.get("path") == link.get("link") and entry["offset"] < link["offset"]
+            ),
+            None,
+        )
+        if target is None:
+            raise BackupIndexError(
+                f"Hard link {link['path']} cannot be restored without its target"
+            )
+        chosen[target["offset"]] = target
+    return sorted(chosen.values(), key=lambda entry: entry["offset"])
+
+
+class MemberStream:
+    """Readable tar stream holding only the selected members of an archive.
+
+    ``decompress`` turns one frame's bytes into its part of the tar stream.
+    Each member is staged and checked against its recorded digest before any
+    of it is returned, so a reader writing in place never receives bytes that
+    fail verification; a mismatch raises BackupIndexError instead.
+    """
+
+    def __init__(
+        self,
+        archive_path: str,
+        index: dict,
+        entries: list[dict],
+        decompress: Callable[[bytes], bytes],
+    ) -> None:
+        self.total = sum(
+            entry["data_offset"] + _padded(entry["size"]) - entry["offset"]
+            for entry in entries
+        ) + len(END_OF_ARCHIVE)
+        self._frames = index["frames"]
+        self._starts = [frame[0] for frame in self._frames]
+        self._decompress = decompress
+        self._handle = open(archive_path, "rb")
+        self._cached: tuple[int, bytes] | None = None
+        self._pieces = self._generate(entries)
+
+    def read(self, _size: int = -1) -> bytes:
+        return next(self._pieces, b"")
+
+    def close(self) -> None:
+        self._pieces.close()
+        self._handle.close()
+
+    def _frame(self, number: int) -> bytes:
+        if self._cached is None or self._cached[0] != number:
+            _stream_start, length, file_start, file_length = self._frames[number]
+            self._handle.seek(file_start)
+            data = self._decompress(self._handle.read(file_length))
+            if len(data) != length:
+                raise BackupIndexError("Archive frame does not match its index")
+            self._cached = (number, data)
+        return self._cached[1]
+
+    def _range(self, start: int, end: int):
+        number = bisect.bisect_right(self._starts, start) - 1
+        while start < end:
+            if number < 0 or number >= len(self._frames):
+                raise BackupIndexError("Archive index points past the archive")
+            frame_start = self._frames[number][0]
+            data = self._frame(number)
+            stop = min(end, frame_start + len(data))
+            yield start, data[start - frame_start:stop - frame_start]
+            start = stop
+            number += 1
+
+    def _generate(self, entries: list[dict]):
+        for entry in entries:
+            data_start = entry["data_offset"]
+            data_end = data_start + entry["size"]
+            pieces = self._range(entry["offset"], data_start + _padded(entry["size"]))
+            if not entry.get("hash"):
+                for _offset, piece in pieces:
+                    yield piece
+                continue
+            hasher = _digest()
+            with tempfile.SpooledTemporaryFile(max_size=STAGE_IN_MEMORY_BYTES) as staged:
+                for offset, piece in pieces:
+                    low = max(offset, data_start) - offset
+                    high = min(offset + len(piece), data_end) - offset
+                    if high > low:
+                        hasher.update(piece[low:high])
+                    staged.write(piece)
+                if hasher.hexdigest() != entry["hash"]:
+                    raise BackupIndexError(f"{entry['path']} differs from the backup")
+                staged.seek(0)
+                yield from iter(lambda: staged.read(STAGE_READ_BYTES), b"")
+        yield END_OF_ARCHIVE
@@ -6,14 +6,16 @@ blueprint, supplies environment-specific providers, and preserves the historical
 module-level functions used by internal callers and tests.
 """
 
-from flask import Blueprint, current_app, has_app_context, jsonify, request
+from flask import Blueprint, current_app, has_app_context, jsonify, request, session
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from auth_utils import login_required
+from auth_utils import csrf_protect, login_required
 from disk_manager import load_media_paths
 from helper_client import HelperError, helper_available, helper_call
+from operation_manager import OperationCapacityError, OperationConflictError
+from operation_sse import stream_operation_response
 from ports import ApschedulerAdapter, JsonFileRepository
 from runtime_paths import (
     CONFIG_DIR as RUNTIME_CONFIG_DIR,
@@ -208,12 +210,61 @@ def api_backup_run():
     return jsonify({'status': 'ok', 'result': result})
 
 
+@backup_scheduler.route('/api/backups/operations', methods=['POST'])
+@login_required
+@csrf_protect
+def api_backup_operation():
+    """Start a backup in the background and return its progress stream."""
+    service = _backup_service()
+
+    def produce_events():
+        yield from service.stream_backup()
+
+    try:
+        operation = current_app.extensions["operation_registry"].create(
+            owner=session['csrf_token'],
+            username=session.get('username', 'unknown'),
+            kind='backup',
+            target='backup',
+            producer=produce_events,
+            conflict_key='backup',
+        )
+    except OperationConflictError:
+        return jsonify({'error': 'Backup already in progress'}), 409
+    except OperationCapacityError as exc:
+        return jsonify({'error': str(exc)}), 429
+    except RuntimeError as exc:
+        return jsonify({'error': f'Unable to start backup: {exc}'}), 500
+
+    return jsonify({
+        'operation_id': operation.operation_id,
+        'stream_url': f'/api/backups/operations/{operation.operation_id}/stream',
+    }), 202
+
+
+@backup_scheduler.route('/api/backups/operations/<operation_id>/stream', methods=['GET'])
+@login_required
+def api_stream_backup_operation(operation_id):
+    """Replay and follow one background backup."""
+    return stream_operation_response(
+        current_app.extensions["operation_registry"],
+        operation_id,
+        expected_kind='backup',
+    )
+
+
 @backup_scheduler.route('/api/backups/list', methods=['GET'])
 @login_required
 def api_backup_list():
     return jsonify({'backups': _backup_service().list_backups()})
 
 
+@backup_scheduler.route('/api/backups/trend', methods=['GET'])
+@login_required
+def api_backup_trend():
+    return jsonify({'backups': _backup_service().size_trend()})
+
+
 @backup_scheduler.route('/api/backups/restore', methods=['POST'])
 @login_required
 def api_backup_restore():
@@ -238,6 +289,45 @@ def api_backup_restore():
     return jsonify({'status': 'ok', 'result': result})
 
 
+@backup_scheduler.route('/api/backups/<archive_name>/contents', methods=['GET'])
+@login_required
+def api_backup_contents(archive_name):
+    """Browse one directory of an indexed archive or a snapshot."""
+    try:
+        result = _backup_service().browse(archive_name, request.args.get('path', '/'))
+    except BackupConfigError as exc:
+        return jsonify({'error': str(exc)}), 400
+    except BackupNotFound as exc:
+        return jsonify({'error': str(exc)}), 404
+    return jsonify(result)
+
+
+@backup_scheduler.route('/api/backups/<archive_name>/restore-paths', methods=['POST'])
+@login_required
+@csrf_protect
+def api_backup_restore_paths(archive_name):
+    """Restore selected paths in place or into the staging directory."""
+    data = request.get_json() or {}
+    try:
+        result = _backup_service().restore_paths(
+            archive_name,
+            data.get('paths'),
+            staging=bool(data.get('staging', False)),
+        )
+    except BackupConfigError as exc:
+        return jsonify({'error': str(exc)}), 400
+    except BackupNotFound as exc:
+        return jsonify({'error': str(exc)}), 404
+    except BackupHelperUnavailable as exc:
+        return jsonify({'error': str(exc)}), 503
+    except BackupOperationError as exc:
+        return jsonify({'error': str(exc)}), 500
+    except HelperError as exc:
+        return jsonify({'error': str(exc)}), 503
+
+    return jsonify({'status': 'ok', 'result': result})
+
+
 @backup_scheduler.route('/api/backups/restore-plugins', methods=['POST'])
 @login_required
 def api_backup_restore_plugins():
@@ -8,12 +8,21 @@ service and supplies the environment-specific providers.
 
 from __future__ import annotations
 
+import json
 import os
 import threading
-from collections.abc import Callable, Mapping, Sequence
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from datetime import datetime, timezone
 from typing import Any
 
+from backup_index import (
+    INDEX_SUFFIX,
+    METADATA_SUFFIX,
+    BackupIndexError,
+    load_index,
+    load_metadata,
+)
 from helper_client import HelperError
 from ports import ConfigRepository, HelperPort, SchedulerPort
 
@@ -30,6 +39,10 @@ DEFAULT_CONFIG = {
     "stacks_path": "/opt/stacks",
     "include_env": True,
     "compression": "zst",
+    "compression_level": 3,
+    "compression_threads": 0,
+    "low_priority": True,
+    "backup_mode": "archive",
     "last_run": None,
     "last_run_result": None,
     "plugin_backup_enabled": True,
@@ -77,6 +90,42 @@ SCHEDULE_PRESETS = {
 BACKUP_PREFIXES = ("pi-health-backup-", "storage-plugins-")
 BACKUP_SUFFIXES = (".tar.zst", ".tar.gz")
 
+# "archive" writes a full tarball per run; "snapshot" stores deduplicated
+# chunks in CHUNK_STORE_DIR under dest_dir and keeps one manifest per run.
+BACKUP_MODES = ("archive", "snapshot")
+CHUNK_STORE_DIR = "pi-health-chunks"
+SNAPSHOT_MANIFEST_SUFFIX = ".json"
+JOB_POLL_SECONDS = 1.0
+# Run details copied from an archive's metadata sidecar into its listing.
+METADATA_FIELDS = (
+    "created_at",
+    "duration_seconds",
+    "sources",
+    "compression",
+    "bytes",
+    "ratio",
+    "checksum",
+)
+TREND_FIELDS = (
+    "name",
+    "series",
+    "type",
+    "mtime",
+    "source_bytes",
+    "stored_bytes",
+    "duration_seconds",
+    "ratio",
+)
+# A directory changed this recently may change again within its filesystem's
+# mtime granularity (a full second on some SSHFS and FAT targets).
+CATALOG_SETTLE_SECONDS = 2.0
+# Partial restores can land here, under dest_dir, instead of over the live files.
+RESTORE_STAGING_DIR = "restore-staging"
+RESTORE_PATHS_MAX = 256
+# Level ranges of zstd (without --ultra) and gzip; 0 threads means one per core.
+COMPRESSION_LEVELS = {"zst": (1, 19), "gz": (1, 9)}
+MAX_COMPRESSION_THREADS = 16
+
 
 class BackupConfigError(Exception):
     """Raised when a backup configuration or request is invalid (maps to 400)."""
@@ -94,13 +143,105 @@ class BackupOperationError(Exception):
     """Raised when a backup or restore operation fails (maps to 500)."""
 
 
+def _snapshot_path(dest_dir: str, name: str) -> str:
+    return os.path.join(
+        dest_dir, CHUNK_STORE_DIR, "snapshots", f"{name}{SNAPSHOT_MANIFEST_SUFFIX}"
+    )
+
+
+def _list_snapshots(dest_dir: str) -> list[dict]:
+    directory = os.path.join(dest_dir, CHUNK_STORE_DIR, "snapshots")
+    try:
+        names = sorted(os.listdir(directory))
+    except OSError:
+        return []
+    entries = []
+    for filename in names:
+        name = filename[: -len(SNAPSHOT_MANIFEST_SUFFIX)]
+        if not filename.endswith(SNAPSHOT_MANIFEST_SUFFIX):
+            continue
+        if not any(name.startswith(prefix) for prefix in BACKUP_PREFIXES):
+            continue
+        path = os.path.join(directory, filename)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                manifest = json.load(handle)
+            mtime = os.stat(path).st_mtime
+        except (OSError, ValueError):
+            continue
+        if not isinstance(manifest, dict):
+            continue
+        entries.append(
+            {
+                "name": name,
+                "size": manifest.get("bytes", 0),
+                "mtime": mtime,
+                "type": "snapshot",
+                "stored_bytes": manifest.get("stored_bytes", 0),
+                "files": manifest.get("files", 0),
+                "created_at": manifest.get("created_at"),
+                "duration_seconds": manifest.get("duration_seconds"),
+                "bytes": manifest.get("bytes", 0),
+                "ratio": (
+                    round(manifest.get("stored_bytes", 0) / manifest["bytes"], 4)
+                    if manifest.get("bytes")
+                    else None
+                ),
+            }
+        )
+    return entries
+
+
+def backup_contents(dest_dir: str, name: str) -> list[dict]:
+    """Every entry recorded for an archive (from its index) or a snapshot."""
+    if name.endswith(BACKUP_SUFFIXES):
+        try:
+            return load_index(os.path.join(dest_dir, name))["entries"]
+        except BackupIndexError as exc:
+            raise BackupConfigError(str(exc)) from None
+    try:
+        with open(_snapshot_path(dest_dir, name), encoding="utf-8") as handle:
+            entries = json.load(handle).get("entries")
+    except (OSError, ValueError, AttributeError):
+        raise BackupConfigError("Unreadable snapshot manifest") from None
+    return entries if isinstance(entries, list) else []
+
+
+def _children(entries: list[dict], directory: str) -> list[dict]:
+    """One level of ``entries`` below ``directory``; directories sum their files."""
+    base = directory.rstrip("/")
+    children: dict[str, dict] = {}
+    for entry in entries:
+        path = entry.get("path")
+        if not isinstance(path, str) or not path.startswith(f"{base}/"):
+            continue
+        head, _, rest = path[len(base) + 1:].partition("/")
+        if not head:
+            continue
+        child = children.setdefault(
+            head,
+            {"name": head, "path": f"{base}/{head}", "type": "dir", "size": 0, "files": 0},
+        )
+        is_file = entry.get("type") == "file"
+        if rest:
+            child["size"] += entry.get("size", 0) if is_file else 0
+            child["files"] += 1 if is_file else 0
+            continue
+        child.update(type=entry.get("type"), mode=entry.get("mode"), mtime=entry.get("mtime"))
+        if is_file:
+            child.update(size=entry.get("size", 0), files=1)
+    return sorted(children.values(), key=lambda item: (item["type"] != "dir", item["name"]))
+
+
 def list_backups(dest_dir: str | None) -> list[dict]:
-    """List primary and plugin archives in ``dest_dir``, newest first."""
+    """List primary and plugin archives and snapshots in ``dest_dir``, newest first."""
     entries: list[dict] = []
     if not dest_dir or not os.path.isdir(dest_dir):
         return entries
 
-    for name in sorted(os.listdir(dest_dir)):
+    names = sorted(os.listdir(dest_dir))
+    present = set(names)
+    for name in names:
         if not any(name.startswith(prefix) for prefix in BACKUP_PREFIXES):
             continue
         if not name.endswith(BACKUP_SUFFIXES):
@@ -110,12 +251,75 @@ def list_backups(dest_dir: str | None) -> list[dict]:
             stat = os.stat(path)
         except OSError:
             continue
-        entries.append({"name": name, "size": stat.st_size, "mtime": stat.st_mtime})
+        entry = {
+            "name": name,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "type": "archive",
+            "indexed": f"{name}{INDEX_SUFFIX}" in present,
+        }
+        if f"{name}{METADATA_SUFFIX}" in present:
+            metadata = load_metadata(path)
+            if metadata:
+                entry.update({key: metadata.get(key) for key in METADATA_FIELDS})
+        entries.append(entry)
 
+    entries.extend(_list_snapshots(dest_dir))
     entries.sort(key=lambda item: item["mtime"], reverse=True)
     return entries
 
 
+class BackupCatalog:
+    """Cache :func:`list_backups` until the destination directory changes.
+
+    Adding, removing or renaming an archive, sidecar or snapshot manifest
+    updates the mtime of ``dest_dir`` or of the manifest directory, so while
+    both are unchanged a listing costs two ``stat`` calls instead of a scan
+    that reads every sidecar and manifest on a possibly remote target.
+    """
+
+    def __init__(
+        self,
+        *,
+        lister: Callable[[str | None], list[dict]] = list_backups,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._lister = lister
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cached: dict[str, tuple[tuple, list[dict]]] = {}
+
+    def list(self, dest_dir: str | None) -> list[dict]:
+        key = self._key(dest_dir) if dest_dir else None
+        if key is not None:
+            with self._lock:
+                cached = self._cached.get(dest_dir)
+            if cached is not None and cached[0] == key:
+                return [dict(entry) for entry in cached[1]]
+        entries = self._lister(dest_dir)
+        newest = max((mtime for mtime in key or () if mtime is not None), default=None)
+        if newest is not None and self._clock() - newest / 1e9 >= CATALOG_SETTLE_SECONDS:
+            with self._lock:
+                self._cached[dest_dir] = (key, [dict(entry) for entry in entries])
+        return entries
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._cached.clear()
+
+    @staticmethod
+    def _key(dest_dir: str) -> tuple | None:
+        try:
+            directory = os.stat(dest_dir).st_mtime_ns
+        except OSError:
+            return None
+        try:
+            snapshots = os.stat(os.path.join(dest_dir, CHUNK_STORE_DIR, "snapshots")).st_mtime_ns
+        except OSError:
+            snapshots = None
+        return (directory, snapshots)
+
+
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -139,6 +343,8 @@ class BackupService:
         excludes: Sequence[str] = tuple(DEFAULT_EXCLUDES),
         archive_exists: Callable[[str], bool] = os.path.exists,
         clock: Callable[[], datetime] = _utcnow,
+        sleep: Callable[[float], None] = time.sleep,
+        catalog: BackupCatalog | None = None,
     ) -> None:
         self._repository = repository
         self._scheduler = scheduler
@@ -153,6 +359,8 @@ class BackupService:
         self._excludes = list(excludes)
         self._archive_exists = archive_exists
         self._clock = clock
+        self._sleep = sleep
+        self._catalog = catalog or BackupCatalog()
         self._lock = threading.Lock()
         self._running = False
 
@@ -185,6 +393,10 @@ class BackupService:
             "config_dir",
             "stacks_path",
             "include_env",
+            "compression_level",
+            "compression_threads",
+            "low_priority",
+            "backup_mode",
             "plugin_backup_enabled",
             "plugin_retention_count",
         ):
@@ -212,6 +424,23 @@ class BackupService:
         if stacks_path and (not stacks_path.startswith("/") or ".." in stacks_path):
             raise BackupConfigError("stacks_path invalid")
 
+        if config.get("backup_mode", "archive") not in BACKUP_MODES:
+            raise BackupConfigError("Invalid backup_mode")
+
+        lowest, highest = COMPRESSION_LEVELS.get(
+            config.get("compression", "zst"), COMPRESSION_LEVELS["gz"]
+        )
+        config["compression_level"] = self._validate_range(
+            config.get("compression_level", 3), "compression_level", lowest, highest
+        )
+        config["compression_threads"] = self._validate_range(
+            config.get("compression_threads", 0),
+            "compression_threads",
+            0,
+            MAX_COMPRESSION_THREADS,
+        )
+        config["low_priority"] = bool(config.get("low_priority", True))
+
         schedule = config.get("schedule_preset", "disabled")
         if schedule not in SCHEDULE_PRESETS:
             raise BackupConfigError("Invalid schedule_preset")
@@ -234,6 +463,18 @@ class BackupService:
             raise BackupConfigError(f"{field} must be >= 1")
         return retention
 
+    @staticmethod
+    def _validate_range(value: Any, field: str, lowest: int, highest: int) -> int:
+        if isinstance(value, bool):
+            raise BackupConfigError(f"Invalid {field}")
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise BackupConfigError(f"Invalid {field}") from None
+        if not lowest <= number <= highest:
+            raise BackupConfigError(f"{field} must be between {lowest} and {highest}")
+        return number
+
     # -- Scheduler -----------------------------------------------------------
 
     def init_scheduler(self) -> None:
@@ -290,49 +531,82 @@ class BackupService:
 
     def list_backups(self) -> list[dict]:
         """List archives in the configured destination directory."""
-        return list_backups(self.load_config().get("dest_dir"))
+        return self._catalog.list(self.load_config().get("dest_dir"))
+
+    def size_trend(self) -> list[dict]:
+        """Each backup's source and stored size and duration, oldest first.
+
+        Built from the catalog alone, so charting history never opens an archive.
+        """
+        trend = []
+        for entry in sorted(self.list_backups(), key=lambda item: item["mtime"]):
+            is_snapshot = entry["type"] == "snapshot"
+            point = {
+                **entry,
+                "series": next(
+                    (prefix.rstrip("-") for prefix in BACKUP_PREFIXES if entry["name"].startswith(prefix)),
+                    None,
+                ),
+                "source_bytes": entry.get("bytes"),
+                "stored_bytes": entry.get("stored_bytes") if is_snapshot else entry.get("size"),
+            }
+            trend.append({key: point.get(key) for key in TREND_FIELDS})
+        return trend
 
     # -- Execution -----------------------------------------------------------
 
     def run_backup(self) -> dict:
         """Run primary and plugin backups, guarded against concurrent runs."""
+        for event in self.stream_backup():
+            if event.get("done"):
+                return event["result"]
+            if "error" in event:
+                return {"error": event["error"]}
+        return {}
+
+    def stream_backup(self) -> Iterator[dict]:
+        """Run a backup, yielding snapshot progress and then the final result."""
         if not self._lock.acquire(blocking=False):
-            return {"error": "Backup already in progress"}
+            yield {"error": "Backup already in progress"}
+            return
         try:
             self._running = True
-            return self._run_locked()
+            result = yield from self._run_locked()
         finally:
             self._running = False
             self._lock.release()
+            self._catalog.invalidate()
+        yield {"type": "complete", "done": True, "result": result}
 
-    def _run_locked(self) -> dict:
+    def _run_locked(self) -> Iterator[dict]:
         config = self.load_config()
+        mode = config.get("backup_mode", "archive")
 
         if not self._helper.available():
             result = {"success": False, "error": "Helper service unavailable"}
             plugin_result = {"success": False, "error": "Helper service unavailable"}
         else:
             try:
-                result = self._helper.call(
-                    "backup_create",
+                result = yield from self._create(
+                    mode,
                     {
                         "sources": self._sources_provider(config),
                         "dest_dir": config.get("dest_dir"),
                         "retention_count": config.get("retention_count", 7),
-                        "compression": config.get("compression", "zst"),
                         "archive_prefix": "pi-health-backup",
                         "excludes": self._excludes,
+                        **self._tuning(config),
                     },
                 )
                 if config.get("plugin_backup_enabled", True):
-                    plugin_result = self._helper.call(
-                        "backup_create",
+                    plugin_result = yield from self._create(
+                        mode,
                         {
                             "sources": self._plugin_sources_provider(),
                             "dest_dir": config.get("dest_dir"),
                             "retention_count": config.get("plugin_retention_count", 10),
-                            "compression": config.get("compression", "zst"),
                             "archive_prefix": "storage-plugins",
+                            **self._tuning(config),
                         },
                     )
                 else:
@@ -349,6 +623,44 @@ class BackupService:
         self.save_config(config)
         return {"primary": result, "plugins": plugin_result}
 
+    @staticmethod
+    def _tuning(config: Mapping[str, Any]) -> dict:
+        """Compression and scheduling settings passed to every helper run."""
+        return {
+            "compression": config.get("compression", "zst"),
+            "compression_level": config.get("compression_level", 3),
+            "compression_threads": config.get("compression_threads", 0),
+            "low_priority": config.get("low_priority", True) is not False,
+        }
+
+    def _create(self, mode: str, params: dict) -> Iterator[dict]:
+        # Both modes run as helper jobs so progress can be relayed; a helper
+        # that answers synchronously is handled by _follow_job as well.
+        command = "backup_snapshot_create" if mode == "snapshot" else "backup_create"
+        started = self._helper.call(command, {**params, "background": True})
+        return (yield from self._follow_job(started, params["archive_prefix"]))
+
+    def _follow_job(self, started: Mapping, target: str) -> Iterator[dict]:
+        """Relay a helper job's progress events until it reports a result."""
+        if not started.get("success") or not started.get("job_id"):
+            return dict(started)
+        cursor = 0
+        while True:
+            status = self._helper.call(
+                "backup_job_status", {"job_id": started["job_id"], "cursor": cursor}
+            )
+            if not status.get("success"):
+                return {"success": False, "error": status.get("error", "Backup job was lost")}
+            events = status.get("events") or []
+            for event in events:
+                if isinstance(event, dict):
+                    yield {**event, "target": target}
+            cursor = status.get("cursor", cursor)
+            if status.get("done"):
+                return status.get("result") or {"success": False, "error": "Backup job failed"}
+            if not events:
+                self._sleep(JOB_POLL_SECONDS)
+
     # -- Restore -------------------------------------------------------------
 
     def restore(
@@ -366,14 +678,14 @@ class BackupService:
             if error:
                 raise BackupOperationError(error)
             for stack in stacks:
-                name = stack.get("name")
-                if not name:
+                stack_name = stack.get("name")
+                if not stack_name:
                     continue
-                result = self._compose_runner(name, "stop")
+                result = self._compose_runner(stack_name, "stop")
                 if result and result.get("success"):
-                    stacks_stopped.append(name)
+                    stacks_stopped.append(stack_name)
 
-        restore_result = self._helper.call("backup_restore", {"archive_path": archive_path})
+        restore_result = self._restore_archive(name, archive_path)
         if not restore_result.get("success"):
             raise BackupOperationError(restore_result.get("error", "Restore failed"))
 
@@ -400,7 +712,7 @@ class BackupService:
             raise BackupConfigError("Invalid plugin archive")
         archive_path = self._locate_archive(name)
 
-        restore_result = self._helper.call("backup_restore", {"archive_path": archive_path})
+        restore_result = self._restore_archive(name, archive_path)
         if not restore_result.get("success"):
             raise BackupOperationError(restore_result.get("error", "Restore failed"))
 
@@ -410,6 +722,55 @@ class BackupService:
         self.save_config(config)
         return restore_result
 
+    def browse(self, archive_name: str, path: str = "/") -> dict:
+        """List one directory of a backup's contents, for picking what to restore."""
+        name = self._validate_archive_name(archive_name)
+        directory = self._validate_restore_path(path)
+        self._locate_archive(name, require_helper=False)
+        entries = backup_contents(self.load_config().get("dest_dir", ""), name)
+        return {"name": name, "path": directory, "entries": _children(entries, directory)}
+
+    def restore_paths(
+        self, archive_name: str, paths: Sequence[str], *, staging: bool = False
+    ) -> dict:
+        """Restore selected files and directories, in place or into a staging directory.
+
+        Archives read only the frames holding the selection through their
+        index. Stacks are left running; restart the affected one afterwards.
+        """
+        name = self._validate_archive_name(archive_name)
+        if not isinstance(paths, (list, tuple)) or not paths:
+            raise BackupConfigError("paths required")
+        if len(paths) > RESTORE_PATHS_MAX:
+            raise BackupConfigError(f"At most {RESTORE_PATHS_MAX} paths can be restored at once")
+        selection = [self._validate_restore_path(path) for path in paths]
+        archive_path = self._locate_archive(name)
+
+        target = "/"
+        if staging:
+            stem = name
+            for suffix in BACKUP_SUFFIXES:
+                if name.endswith(suffix):
+                    stem = name[: -len(suffix)]
+            target = os.path.join(
+                self.load_config().get("dest_dir", ""), RESTORE_STAGING_DIR, stem
+            )
+        result = self._restore_archive(name, archive_path, paths=selection, target=target)
+        if not result.get("success"):
+            raise BackupOperationError(result.get("error", "Restore failed"))
+
+        config = self.load_config()
+        config["last_restore"] = self._clock().isoformat()
+        config["last_restore_result"] = {"restore": result, "paths": selection}
+        self.save_config(config)
+        return result
+
+    @staticmethod
+    def _validate_restore_path(path: Any) -> str:
+        if not isinstance(path, str) or not path.startswith("/") or ".." in path.split("/"):
+            raise BackupConfigError("Invalid path")
+        return path.rstrip("/") or "/"
+
     @staticmethod
     def _validate_archive_name(archive_name: str) -> str:
         name = (archive_name or "").strip()
@@ -417,11 +778,49 @@ class BackupService:
             raise BackupConfigError("Invalid archive name")
         return name
 
-    def _locate_archive(self, name: str) -> str:
+    def _restore_archive(self, name: str, archive_path: str, **selection: Any) -> dict:
+        config = self.load_config()
+        low_priority = config.get("low_priority", True) is not False
+        if name.endswith(BACKUP_SUFFIXES):
+            started = self._helper.call(
+                "backup_restore",
+                {
+                    "archive_path": archive_path,
+                    "low_priority": low_priority,
+                    "background": True,
+                    **selection,
+                },
+            )
+        else:
+            started = self._helper.call(
+                "backup_snapshot_restore",
+                {
+                    "dest_dir": config.get("dest_dir", ""),
+                    "snapshot": name,
+                    "low_priority": low_priority,
+                    **selection,
+                },
+            )
+        # Restores run from a request thread; progress is not relayed.
+        return self._drain(self._follow_job(started, name))
+
+    @staticmethod
+    def _drain(events: Iterator[dict]) -> dict:
+        while True:
+            try:
+                next(events)
+            except StopIteration as finished:
+                return finished.value
+
+    def _locate_archive(self, name: str, *, require_helper: bool = True) -> str:
         dest_dir = self.load_config().get("dest_dir", "")
-        archive_path = os.path.join(dest_dir, name)
+        archive_path = (
+            os.path.join(dest_dir, name)
+            if name.endswith(BACKUP_SUFFIXES)
+            else _snapshot_path(dest_dir, name)
+        )
         if not self._archive_exists(archive_path):
             raise BackupNotFound("Backup not found")
-        if not self._helper.available():
+        if require_helper and not self._helper.available():
             raise BackupHelperUnavailable("Helper service unavailable")
         return archive_path
@@ -113,6 +113,7 @@ class ContainerInventoryService:
             "exit_code": (container.attrs.get("State") or {}).get("ExitCode")
             if container.status in ("exited", "dead")
             else None,
+            "started_at": (container.attrs.get("State") or {}).get("StartedAt") or None,
             "network": network_topology.get(container.id, _DEFAULT_NETWORK.copy()),
             "cpu_percent": None,
             "memory_percent": None,
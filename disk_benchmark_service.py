@@ -0,0 +1,159 @@
+"""Per-drive throughput benchmarks run through the privileged helper.
+
+A USB disk that has dropped from UAS to ``usb-storage``, sits behind an
+underpowered hub or negotiated a USB 2.0 link still works, just several times
+slower, and nothing else in Pi-Health notices. Results are kept per device
+with the driver and transport the helper read from sysfs, and the latest run
+of each disk is compared with its peers of the same kind (spinning or solid
+state) so an outlier is flagged.
+"""
+
+from __future__ import annotations
+
+import re
+import statistics
+from collections.abc import Callable, Mapping
+from datetime import datetime, timezone
+from typing import Any
+
+from ports import ConfigRepository, HelperPort
+
+
+DEVICE_PATTERN = re.compile(r"^/dev/[a-zA-Z0-9_-]+$")
+WRITE_PATH_PATTERN = re.compile(r"^/mnt(/[a-zA-Z0-9._-]+)+$")
+HISTORY_LIMIT = 20
+# A disk reading at under half its peers' median is worth a look.
+SLOW_PEER_RATIO = 0.5
+USB2_SPEED_MBPS = 480
+RESULT_FIELDS = (
+    "sequential_read_mbps",
+    "random_read_iops",
+    "random_read_latency_ms",
+    "write_mbps",
+    "write_direct",
+    "duration_seconds",
+    "size_bytes",
+    "model",
+    "rotational",
+    "transport",
+    "driver",
+    "usb_speed_mbps",
+)
+
+
+class DiskBenchmarkError(Exception):
+    """Raised when a benchmark request is invalid or the helper rejects it."""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _timestamp(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _rate(entry: Mapping) -> float | None:
+    value = entry.get("sequential_read_mbps")
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        return None
+    return float(value)
+
+
+class DiskBenchmarkService:
+    """Run helper benchmarks, keep their history and flag slow drives."""
+
+    def __init__(
+        self,
+        *,
+        helper: HelperPort,
+        repository: ConfigRepository,
+        history_path_provider: Callable[[], str],
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        self._helper = helper
+        self._repository = repository
+        self._history_path_provider = history_path_provider
+        self._clock = clock
+
+    def _load(self) -> dict[str, list[dict]]:
+        try:
+            stored = self._repository.read_json(self._history_path_provider(), default={})
+        except Exception:
+            stored = {}
+        devices = stored.get("devices") if isinstance(stored, dict) else None
+        if not isinstance(devices, dict):
+            return {}
+        return {
+            device: [entry for entry in entries if isinstance(entry, dict)]
+            for device, entries in devices.items()
+            if isinstance(entries, list)
+        }
+
+    def run(self, device: str, *, write_path: str | None = None) -> dict:
+        """Benchmark one whole disk and record the result."""
+        if not isinstance(device, str) or not DEVICE_PATTERN.match(device):
+            raise DiskBenchmarkError("Invalid device path")
+        params: dict[str, Any] = {"device": device}
+        if write_path:
+            if not isinstance(write_path, str) or not WRITE_PATH_PATTERN.match(write_path):
+                raise DiskBenchmarkError("Write tests need a mount point under /mnt")
+            params["write_path"] = write_path
+        result = self._helper.call("disk_benchmark", params)
+        if not isinstance(result, Mapping) or not result.get("success"):
+            error = result.get("error") if isinstance(result, Mapping) else None
+            raise DiskBenchmarkError(error or "Benchmark failed")
+
+        entry = {key: result.get(key) for key in RESULT_FIELDS}
+        entry["at"] = _timestamp(self._clock())
+        history = self._load()
+        history[device] = (history.get(device, []) + [entry])[-HISTORY_LIMIT:]
+        self._repository.write_json(
+            self._history_path_provider(), {"version": 1, "devices": history}
+        )
+        return {"device": device, "result": entry, "latest": self.latest().get(device)}
+
+    def history(self, device: str) -> list[dict]:
+        """Recorded runs for one device, newest first."""
+        return list(reversed(self._load().get(device, [])))
+
+    def latest(self) -> dict[str, dict]:
+        """Each device's newest run with any warning flags."""
+        latest = {device: dict(entries[-1]) for device, entries in self._load().items() if entries}
+        for device, entry in latest.items():
+            entry["flags"] = self._flags(device, entry, latest)
+        return latest
+
+    @staticmethod
+    def _flags(device: str, entry: Mapping, latest: Mapping[str, Mapping]) -> list[dict]:
+        flags = []
+        if entry.get("transport") == "usb" and entry.get("driver") == "usb-storage":
+            flags.append(
+                {
+                    "code": "usb_storage_fallback",
+                    "message": "Using the usb-storage driver instead of UAS",
+                }
+            )
+        speed = entry.get("usb_speed_mbps")
+        if isinstance(speed, int) and 0 < speed <= USB2_SPEED_MBPS:
+            flags.append(
+                {"code": "usb2_link", "message": f"USB link negotiated at {speed} Mbit/s"}
+            )
+        rate = _rate(entry)
+        peers = [
+            peer_rate
+            for peer, other in latest.items()
+            if peer != device
+            and other.get("rotational") == entry.get("rotational")
+            and (peer_rate := _rate(other)) is not None
+        ]
+        if rate is not None and peers:
+            median = statistics.median(peers)
+            if rate < median * SLOW_PEER_RATIO:
+                flags.append(
+                    {
+                        "code": "slow_vs_peers",
+                        "message": f"Reads at {rate:.0f} MB/s against a peer median of {median:.0f} MB/s",
+                    }
+                )
+        return flags
@@ -0,0 +1,221 @@
+"""Per-disk I/O rate history kept beside the system metric samples.
+
+The metric collector is a short-lived process, so the previous
+``/proc/diskstats`` reading is stored with the samples and each run records the
+average rates since the last one.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+from diskstats import DiskCounters, disk_rates
+from metric_history import (
+    BUSY_TIMEOUT_MS,
+    RANGES,
+    RETENTION_SECONDS,
+    InvalidMetricRange,
+    _iso_timestamp,
+)
+
+
+IO_COLUMNS = (
+    "read_iops",
+    "write_iops",
+    "read_bps",
+    "write_bps",
+    "await_ms",
+    "busy_percent",
+)
+COUNTER_FIELDS = (
+    "read_bytes",
+    "write_bytes",
+    "busy_ms",
+    "reads",
+    "writes",
+    "read_ms",
+    "write_ms",
+)
+# Rates averaged over a longer gap than this say little about any moment in it.
+MAX_INTERVAL_SECONDS = 60 * 60
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS disk_io_counters (
+        device TEXT PRIMARY KEY,
+        sampled_at REAL NOT NULL,
+        read_bytes INTEGER NOT NULL,
+        write_bytes INTEGER NOT NULL,
+        busy_ms INTEGER NOT NULL,
+        reads INTEGER NOT NULL,
+        writes INTEGER NOT NULL,
+        read_ms INTEGER NOT NULL,
+        write_ms INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS disk_io_samples (
+        sampled_at INTEGER NOT NULL,
+        device TEXT NOT NULL,
+        read_iops REAL,
+        write_iops REAL,
+        read_bps REAL,
+        write_bps REAL,
+        await_ms REAL,
+        busy_percent REAL,
+        PRIMARY KEY (device, sampled_at)
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def _reset(before: DiskCounters, after: DiskCounters) -> bool:
+    return any(
+        getattr(after, field) < getattr(before, field) for field in COUNTER_FIELDS
+    )
+
+
+class DiskIoHistoryStore:
+    """Record per-disk rates between collector runs and query them by range."""
+
+    def __init__(
+        self,
+        database_path: str | Path,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.database_path = Path(database_path)
+        self._clock = clock
+
+    def record(
+        self,
+        counters: Mapping[str, DiskCounters],
+        *,
+        sampled_at: float | None = None,
+    ) -> dict[str, dict]:
+        """Store rates since the previous reading and keep this one as the baseline.
+
+        Devices seen for the first time, after a reboot or after a long gap
+        only update the baseline. Returns the rates that were recorded.
+        """
+        now = float(self._clock() if sampled_at is None else sampled_at)
+        self.database_path.parent.mkdir(parents=True, exist_ok=True, mode=0o750)
+        connection = sqlite3.connect(self.database_path, timeout=BUSY_TIMEOUT_MS / 1000)
+        recorded = {}
+        try:
+            connection.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+            with connection:
+                for statement in SCHEMA:
+                    connection.execute(statement)
+                previous = {
+                    row[0]: (row[1], DiskCounters(*row[2:]))
+                    for row in connection.execute(
+                        f"SELECT device, sampled_at, {', '.join(COUNTER_FIELDS)} "
+                        "FROM disk_io_counters"
+                    )
+                }
+                for device, current in counters.items():
+                    before = previous.get(device)
+                    if before is not None:
+                        elapsed = now - before[0]
+                        if 0 < elapsed <= MAX_INTERVAL_SECONDS and not _reset(
+                            before[1], current
+                        ):
+                            recorded[device] = disk_rates(before[1], current, elapsed)
+                    connection.execute(
+                        f"""
+                        INSERT OR REPLACE INTO disk_io_counters (
+                            device, sampled_at, {', '.join(COUNTER_FIELDS)}
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (device, now, *(getattr(current, field) for field in COUNTER_FIELDS)),
+                    )
+                connection.executemany(
+                    f"""
+                    INSERT OR REPLACE INTO disk_io_samples (
+                        sampled_at, device, {', '.join(IO_COLUMNS)}
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (int(now), device, *(rates[column] for column in IO_COLUMNS))
+                        for device, rates in recorded.items()
+                    ],
+                )
+                connection.execute(
+                    "DELETE FROM disk_io_samples WHERE sampled_at < ?",
+                    (int(now) - RETENTION_SECONDS,),
+                )
+        finally:
+            connection.close()
+        return recorded
+
+    def latest(self) -> dict[str, dict]:
+        """Newest recorded rates per device with their sample time."""
+        rows = self._read(
+            f"""
+            SELECT device, MAX(sampled_at), {', '.join(IO_COLUMNS)}
+            FROM disk_io_samples
+            GROUP BY device
+            """,
+            (),
+        )
+        return {
+            row[0]: {
+                "sampled_at": _iso_timestamp(int(row[1])),
+                **dict(zip(IO_COLUMNS, row[2:], strict=True)),
+            }
+            for row in rows
+        }
+
+    def query(self, device: str, selected_range: str) -> dict:
+        """Return one device's bucketed averages for an allowed fixed range."""
+        config = RANGES.get(selected_range)
+        if config is None:
+            raise InvalidMetricRange("range must be one of: 24h, 7d, 30d")
+        end = int(self._clock())
+        start = end - config["duration"]
+        bucket = config["bucket"]
+        averages = ", ".join(f"AVG({column})" for column in IO_COLUMNS)
+        rows = self._read(
+            f"""
+            SELECT ? + CAST((sampled_at - ?) / ? AS INTEGER) * ? AS bucket_at, {averages}
+            FROM disk_io_samples
+            WHERE device = ? AND sampled_at >= ? AND sampled_at <= ?
+            GROUP BY bucket_at
+            ORDER BY bucket_at ASC
+            """,
+            (start, start, bucket, bucket, device, start, end),
+        )
+        return {
+            "device": device,
+            "range": selected_range,
+            "from": _iso_timestamp(start),
+            "to": _iso_timestamp(end),
+            "bucket_seconds": bucket,
+            "points": [
+                {
+                    "at": _iso_timestamp(int(row[0])),
+                    **dict(zip(IO_COLUMNS, row[1:], strict=True)),
+                }
+                for row in rows
+            ],
+        }
+
+    def _read(self, sql: str, params: tuple) -> list[tuple]:
+        if not self.database_path.is_file():
+            return []
+        uri = f"file:{self.database_path}?mode=ro"
+        connection = sqlite3.connect(uri, uri=True, timeout=BUSY_TIMEOUT_MS / 1000)
+        try:
+            connection.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+            connection.execute("PRAGMA query_only = ON")
+            try:
+                return connection.execute(sql, params).fetchall()
+            except sqlite3.OperationalError as error:
+                if "no such table" in str(error).lower():
+                    return []
+                raise
+        finally:
+            connection.close()
@@ -14,6 +14,10 @@ from helper_client import helper_available, HelperError, HELPER_SOCKET
 from disk_inventory_service import DiskInventoryService
 from disk_provider_assignments import StorageProviderAssignmentReader
 from disk_summary_service import DiskSummaryService
+from disk_benchmark_service import DiskBenchmarkError, DiskBenchmarkService
+from disk_io_history import DiskIoHistoryStore
+from diskstats import DiskThroughputSampler
+from metric_history import InvalidMetricRange
 from ports import HelperClientAdapter, JsonFileRepository
 from helper_templates import render_startup_files
 from fstab_presets import FSTAB_PRESETS
@@ -41,7 +45,7 @@ from seedbox_service import (
 from disk_suggestion_service import DiskSuggestionService, parse_size_to_gb
 from smart_service import SmartOperationError, SmartService, SmartValidationError
 from smart_monitor import parse_smartctl_json
-from runtime_paths import CONFIG_DIR as RUNTIME_CONFIG_DIR, STORAGE_PLUGIN_CONFIG_DIR as RUNTIME_STORAGE_PLUGIN_CONFIG_DIR
+from runtime_paths import CONFIG_DIR as RUNTIME_CONFIG_DIR, STATE_DIR as RUNTIME_STATE_DIR, STORAGE_PLUGIN_CONFIG_DIR as RUNTIME_STORAGE_PLUGIN_CONFIG_DIR
 
 disk_manager = Blueprint('disk_manager', __name__)
 
@@ -50,6 +54,11 @@ MEDIA_PATHS_CONFIG = str(RUNTIME_CONFIG_DIR / 'media_paths.json')
 
 SEEDBOX_CONFIG = str(RUNTIME_CONFIG_DIR / 'seedbox_mount.json')
 
+DISK_BENCHMARK_HISTORY = str(RUNTIME_STATE_DIR / 'disk_benchmarks.json')
+
+# Per-disk I/O rates are recorded by the metric collector beside its samples.
+DISK_IO_HISTORY_DB = str(RUNTIME_STATE_DIR / 'metrics.sqlite3')
+
 STORAGE_PLUGIN_CONFIG_DIR = str(RUNTIME_STORAGE_PLUGIN_CONFIG_DIR)
 
 # Default media paths
@@ -158,10 +167,31 @@ def default_smart_service(helper=None):
     )
 
 
+def default_disk_benchmark_service(helper=None, repository=None):
+    return DiskBenchmarkService(
+        helper=helper if helper is not None else HelperClientAdapter(),
+        repository=repository if repository is not None else JsonFileRepository(),
+        history_path_provider=lambda: DISK_BENCHMARK_HISTORY,
+    )
+
+
+def default_disk_io_history():
+    return DiskIoHistoryStore(DISK_IO_HISTORY_DB)
+
+
+def disk_io_rates_provider(sampler=None, io_history=None):
+    """Rates since the previous summary, else the collector's latest sample."""
+    sampler = sampler or DiskThroughputSampler()
+    io_history = io_history or default_disk_io_history()
+    return lambda: sampler.sample() or io_history.latest()
+
+
 def default_disk_summary_service(
     inventory_service=None,
     smart_service=None,
     assignment_reader=None,
+    benchmark_service=None,
+    io_history=None,
 ):
     inventory_service = inventory_service or default_disk_inventory_service()
     smart_service = smart_service or default_smart_service()
@@ -172,6 +202,8 @@ def default_disk_summary_service(
         inventory_provider=inventory_service.inventory,
         smart_provider=smart_service.all_devices,
         assignment_provider=assignment_reader.read,
+        benchmark_provider=benchmark_service.latest if benchmark_service else None,
+        io_provider=disk_io_rates_provider(io_history=io_history),
     )
 
 
@@ -223,6 +255,22 @@ def _disk_suggestions():
     return default_disk_suggestion_service(_disk_inventory())
 
 
+def _disk_benchmarks():
+    if has_app_context():
+        service = current_app.extensions.get("disk_benchmark_service")
+        if service is not None:
+            return service
+    return default_disk_benchmark_service()
+
+
+def _disk_io_history():
+    if has_app_context():
+        service = current_app.extensions.get("disk_io_history")
+        if service is not None:
+            return service
+    return default_disk_io_history()
+
+
 def _smart():
     if has_app_context():
         service = current_app.extensions.get("smart_service")
@@ -548,3 +596,63 @@ def api_smart_test(device):
         return jsonify({'error': str(exc)}), 503
     except HelperError as e:
         return jsonify({'error': str(e), 'helper_available': False}), 503
+
+
+# =============================================================================
+# Throughput Benchmark API Endpoints
+# =============================================================================
+
+@disk_manager.route('/api/disks/benchmarks', methods=['GET'])
+@login_required
+def api_disk_benchmarks():
+    """Latest throughput result per disk, with slow-drive flags."""
+    return jsonify({'devices': _disk_benchmarks().latest()})
+
+
+@disk_manager.route('/api/disks/<path:device>/benchmark', methods=['GET'])
+@login_required
+def api_disk_benchmark_history(device):
+    """Recorded throughput runs for one disk, newest first."""
+    return jsonify({'device': f'/dev/{device}', 'history': _disk_benchmarks().history(f'/dev/{device}')})
+
+
+@disk_manager.route('/api/disks/<path:device>/benchmark', methods=['POST'])
+@login_required
+def api_disk_benchmark(device):
+    """
+    Run a bounded, non-destructive throughput test on a whole disk.
+
+    Args:
+        device: Device name (e.g., sda). Will be prefixed with /dev/.
+
+    Request body:
+        {
+            "write_path": "/mnt/disk1"   (optional; a mounted filesystem on the disk)
+        }
+    """
+    data = request.get_json(silent=True) or {}
+    try:
+        return jsonify(_disk_benchmarks().run(f'/dev/{device}', write_path=data.get('write_path')))
+    except DiskBenchmarkError as exc:
+        return jsonify({'error': str(exc)}), 400
+    except HelperError as e:
+        return jsonify({'error': str(e), 'helper_available': False}), 503
+
+
+# =============================================================================
+# Disk I/O History API Endpoints
+# =============================================================================
+
+@disk_manager.route('/api/disks/<path:device>/io', methods=['GET'])
+@login_required
+def api_disk_io_history(device):
+    """
+    Recorded I/O rates for one disk.
+
+    Query params:
+        range: 24h (default), 7d or 30d
+    """
+    try:
+        return jsonify(_disk_io_history().query(device, request.args.get('range', '24h')))
+    except InvalidMetricRange as exc:
+        return jsonify({'error': str(exc)}), 400
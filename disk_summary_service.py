@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import math
 import os
+import statistics
 from collections.abc import Callable, Mapping
 from datetime import datetime, timezone
 
@@ -12,6 +13,11 @@ MAX_DEVICES = 128
 MAX_ASSIGNMENTS = 256
 MAX_WARNINGS = 20
 HEALTH_STATES = frozenset({"healthy", "warning", "failing"})
+IO_FIELDS = ("read_iops", "write_iops", "read_bps", "write_bps", "await_ms", "busy_percent")
+# A pool member whose requests wait this many times longer than its peers'
+# median, and long enough to notice, is what holds a mergerfs pool back.
+POOL_AWAIT_RATIO = 3.0
+POOL_AWAIT_MIN_MS = 20.0
 
 
 def _utcnow() -> datetime:
@@ -104,6 +110,83 @@ def _device_capacity(device: Mapping) -> dict:
     }
 
 
+def _benchmark(path: str, benchmarks: Mapping[str, Mapping]) -> dict | None:
+    entry = benchmarks.get(path)
+    if not isinstance(entry, Mapping):
+        return None
+    flags = entry.get("flags")
+    return {
+        "at": entry.get("at"),
+        "sequential_read_mbps": entry.get("sequential_read_mbps"),
+        "random_read_iops": entry.get("random_read_iops"),
+        "write_mbps": entry.get("write_mbps"),
+        "transport": entry.get("transport"),
+        "driver": entry.get("driver"),
+        "usb_speed_mbps": entry.get("usb_speed_mbps"),
+        "flags": list(flags)[:MAX_WARNINGS] if isinstance(flags, list) else [],
+    }
+
+
+def _io(name: str, rates: Mapping[str, Mapping]) -> dict | None:
+    entry = rates.get(name)
+    if not isinstance(entry, Mapping):
+        return None
+    record = {}
+    for key in IO_FIELDS:
+        value = entry.get(key)
+        numeric = (
+            None
+            if isinstance(value, bool)
+            or not isinstance(value, (int, float))
+            or not math.isfinite(value)
+            else max(0.0, float(value))
+        )
+        record[key] = round(numeric, 1) if numeric is not None else None
+    record["sampled_at"] = (
+        entry["sampled_at"] if isinstance(entry.get("sampled_at"), str) else None
+    )
+    record["flags"] = []
+    return record
+
+
+def _flag_slow_pool_members(devices: list[dict]) -> None:
+    """Flag devices whose await stands out among the disks of a shared pool."""
+    pools: dict[tuple, tuple[str, list[dict]]] = {}
+    for device in devices:
+        for item in device["assignments"]:
+            resource = item.get("resource_id") or item.get("resource_name")
+            if not resource:
+                continue
+            label, members = pools.setdefault(
+                (item.get("provider_id"), resource),
+                (str(item.get("resource_name") or resource), []),
+            )
+            if device not in members:
+                members.append(device)
+    for label, members in pools.values():
+        timed = [
+            device
+            for device in members
+            if device["io"] is not None and device["io"]["await_ms"] is not None
+        ]
+        for device in timed:
+            peers = [other["io"]["await_ms"] for other in timed if other is not device]
+            if not peers:
+                continue
+            median = statistics.median(peers)
+            waited = device["io"]["await_ms"]
+            if waited >= POOL_AWAIT_MIN_MS and waited > median * POOL_AWAIT_RATIO:
+                device["io"]["flags"].append(
+                    {
+                        "code": "slow_in_pool",
+                        "message": (
+                            f"Requests wait {waited:.0f} ms against {median:.0f} ms "
+                            f"on other {label} disks"
+                        ),
+                    }
+                )
+
+
 class DiskSummaryService:
     """Compose a bounded disk snapshot from existing read providers."""
 
@@ -113,11 +196,15 @@ class DiskSummaryService:
         inventory_provider: Callable[[], Mapping],
         smart_provider: Callable[[], Mapping],
         assignment_provider: Callable[[], Mapping],
+        benchmark_provider: Callable[[], Mapping] | None = None,
+        io_provider: Callable[[], Mapping | None] | None = None,
         clock: Callable[[], datetime] = _utcnow,
     ) -> None:
         self._inventory_provider = inventory_provider
         self._smart_provider = smart_provider
         self._assignment_provider = assignment_provider
+        self._benchmark_provider = benchmark_provider
+        self._io_provider = io_provider
         self._clock = clock
 
     def snapshot(
@@ -138,9 +225,13 @@ class DiskSummaryService:
         ]
         smart, smart_source = self._smart(warnings) if include_smart else ({}, "not_checked")
         assignments, assignment_source = self._assignments(warnings)
+        benchmarks = self._benchmarks()
+        io_rates = self._io_rates()
         device_records = [
-            self._device_record(device, smart, assignments) for device in devices
+            self._device_record(device, smart, assignments, benchmarks, io_rates)
+            for device in devices
         ]
+        _flag_slow_pool_members(device_records)
 
         health_counts = {state: 0 for state in ("healthy", "warning", "failing", "unknown")}
         for device in device_records:
@@ -255,8 +346,34 @@ class DiskSummaryService:
             warnings.append(_warning("assignments", "Provider assignments are unavailable"))
             return [], "unavailable"
 
+    def _benchmarks(self) -> Mapping[str, Mapping]:
+        """Latest throughput result per device; absent results are not a warning."""
+        if self._benchmark_provider is None:
+            return {}
+        try:
+            result = self._benchmark_provider()
+        except Exception:
+            return {}
+        return result if isinstance(result, Mapping) else {}
+
+    def _io_rates(self) -> Mapping[str, Mapping]:
+        """Current I/O rates per device name; absent rates are not a warning."""
+        if self._io_provider is None:
+            return {}
+        try:
+            result = self._io_provider()
+        except Exception:
+            return {}
+        return result if isinstance(result, Mapping) else {}
+
     @staticmethod
-    def _device_record(device: Mapping, smart: dict[str, Mapping], assignments: list[dict]) -> dict:
+    def _device_record(
+        device: Mapping,
+        smart: dict[str, Mapping],
+        assignments: list[dict],
+        benchmarks: Mapping[str, Mapping] | None = None,
+        io_rates: Mapping[str, Mapping] | None = None,
+    ) -> dict:
         path = device.get("path") if isinstance(device.get("path"), str) else ""
         records = _flatten(device)
         matched = []
@@ -303,6 +420,8 @@ class DiskSummaryService:
             "mounted": any(_is_mounted(record) for record in flattened),
             "mounted_capacity": capacity,
             "assignments": matched[:MAX_ASSIGNMENTS],
+            "benchmark": _benchmark(path, benchmarks or {}),
+            "io": _io(str(device.get("name", "")), io_rates or {}),
         }
 
     @staticmethod
@@ -0,0 +1,370 @@
+"""Directory-size index for mounts, MergerFS pools and media paths.
+
+A plain ``du`` over a large media pool stats every file on every run. This
+walks the tree with a bounded pool of ``os.scandir`` workers, stores one row
+per directory (own size, subtree size) in SQLite, and on the next scan reuses
+a directory's row without listing it when its mtime has not changed: adding,
+removing or renaming an entry always bumps the parent directory's mtime, so an
+unchanged directory still has the same files and subdirectories. Files that
+grow in place (a download being written) do not touch the directory, which is
+what ``full=True`` is for.
+
+A MergerFS pool is scanned through its branches rather than the FUSE mount.
+The pool reports one branch's directory mtime, so a change on another branch
+would go unnoticed; each branch's own mtime is recorded instead, and reading
+the branches directly avoids a FUSE round trip per entry.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+
+BUSY_TIMEOUT_MS = 3_000
+SCAN_WORKERS = 4
+INSERT_BATCH = 5_000
+PROGRESS_INTERVAL_SECONDS = 1.0
+MAX_CHILDREN = 500
+SKIPPED_DIRS = frozenset({"lost+found"})
+
+
+class DiskUsageError(ValueError):
+    """Raised when a scan or drill-down request names an unusable path."""
+
+
+def _signature(sources: tuple[str, ...], relative: str) -> str | None:
+    """Per-source directory mtimes; None when no source has the directory."""
+    parts = []
+    for index, source in enumerate(sources):
+        try:
+            stat = os.stat(os.path.join(source, relative) if relative else source)
+        except OSError:
+            continue
+        parts.append(f"{index}:{stat.st_mtime_ns}")
+    return ",".join(parts) or None
+
+
+def _list_directory(sources: tuple[str, ...], relative: str):
+    """Return ``(own_bytes, own_files, subdirectories)`` across every source."""
+    own_bytes = own_files = 0
+    subdirs = set()
+    listed = False
+    error = None
+    for source in sources:
+        path = os.path.join(source, relative) if relative else source
+        try:
+            entries = os.scandir(path)
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            error = exc
+            continue
+        listed = True
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIPPED_DIRS:
+                            subdirs.add(f"{relative}/{entry.name}" if relative else entry.name)
+                        continue
+                    if entry.is_symlink():
+                        continue
+                    own_bytes += entry.stat(follow_symlinks=False).st_size
+                    own_files += 1
+                except OSError:
+                    continue
+    if not listed and error is not None:
+        raise error
+    return own_bytes, own_files, sorted(subdirs)
+
+
+def _parent(relative: str) -> str | None:
+    if not relative:
+        return None
+    return relative.rpartition("/")[0]
+
+
+class DiskUsageIndex:
+    """Scan directory trees incrementally and answer drill-down queries."""
+
+    def __init__(
+        self,
+        database_path: str | Path,
+        *,
+        max_workers: int = SCAN_WORKERS,
+        clock: Callable[[], float] = time.time,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.database_path = str(database_path)
+        self._max_workers = max(1, int(max_workers))
+        self._clock = clock
+        self._monotonic = monotonic
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.database_path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.database_path, timeout=BUSY_TIMEOUT_MS / 1000)
+        connection.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        with connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS scans (
+                    root TEXT PRIMARY KEY,
+                    sources TEXT NOT NULL,
+                    scanned_at INTEGER NOT NULL,
+                    duration_seconds REAL NOT NULL,
+                    directories INTEGER NOT NULL,
+                    reused INTEGER NOT NULL,
+                    errors INTEGER NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS dirs (
+                    root TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    parent TEXT,
+                    signature TEXT,
+                    own_bytes INTEGER NOT NULL,
+                    own_files INTEGER NOT NULL,
+                    total_bytes INTEGER NOT NULL,
+                    total_files INTEGER NOT NULL,
+                    PRIMARY KEY (root, path)
+                ) WITHOUT ROWID
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS dirs_parent ON dirs (root, parent, total_bytes)"
+            )
+        return connection
+
+    def _previous(self, root: str, sources: tuple[str, ...]) -> dict[str, tuple]:
+        """Last scan's rows keyed by path, or nothing when the sources changed."""
+        connection = self._connect()
+        try:
+            row = connection.execute("SELECT sources FROM scans WHERE root = ?", (root,)).fetchone()
+            if row is None or row[0] != "\n".join(sources):
+                return {}
+            return {
+                path: (signature, own_bytes, own_files, parent)
+                for path, parent, signature, own_bytes, own_files in connection.execute(
+                    "SELECT path, parent, signature, own_bytes, own_files FROM dirs WHERE root = ?",
+                    (root,),
+                )
+            }
+        finally:
+            connection.close()
+
+    def scan(
+        self,
+        root: str,
+        sources: Iterable[str] | None = None,
+        *,
+        full: bool = False,
+    ) -> Iterator[dict]:
+        """Yield progress events while scanning ``root``; the last event is the summary.
+
+        ``sources`` are the directories actually read (a pool's branches);
+        they default to ``root`` itself.
+        """
+        sources = tuple(sources or (root,))
+        if not any(os.path.isdir(source) for source in sources):
+            raise DiskUsageError(f"{root} is not a directory")
+        previous = {} if full else self._previous(root, sources)
+        children: dict[str, list[str]] = {}
+        for path, (_signature_, _bytes, _files, parent) in previous.items():
+            if parent is not None:
+                children.setdefault(parent, []).append(path)
+
+        def visit(relative: str):
+            signature = _signature(sources, relative)
+            known = previous.get(relative)
+            if known is not None and signature is not None and known[0] == signature:
+                return signature, known[1], known[2], children.get(relative, []), True
+            own_bytes, own_files, subdirs = _list_directory(sources, relative)
+            return signature, own_bytes, own_files, subdirs, False
+
+        started = self._monotonic()
+        reported_at = started
+        rows: dict[str, list] = {}
+        scanned_bytes = scanned_files = reused = errors = 0
+        yield {"type": "progress", "event": "start", "root": root, "sources": list(sources), "full": full}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            pending = {pool.submit(visit, ""): ""}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    relative = pending.pop(future)
+                    try:
+                        signature, own_bytes, own_files, subdirs, was_reused = future.result()
+                    except OSError as exc:
+                        errors += 1
+                        # No signature: the next scan lists this directory again.
+                        rows[relative] = [None, 0, 0]
+                        yield {
+                            "type": "progress",
+                            "event": "error",
+                            "path": relative or ".",
+                            "error": exc.strerror or str(exc),
+                        }
+                        continue
+                    rows[relative] = [signature, own_bytes, own_files]
+                    reused += was_reused
+                    scanned_bytes += own_bytes
+                    scanned_files += own_files
+                    for subdir in subdirs:
+                        pending[pool.submit(visit, subdir)] = subdir
+                now = self._monotonic()
+                if now - reported_at >= PROGRESS_INTERVAL_SECONDS:
+                    reported_at = now
+                    yield {
+                        "type": "progress",
+                        "event": "scanning",
+                        "directories": len(rows),
+                        "reused": reused,
+                        "queued": len(pending),
+                        "bytes": scanned_bytes,
+                        "files": scanned_files,
+                    }
+
+        totals = {path: [row[1], row[2]] for path, row in rows.items()}
+        # Deepest first, so every subtree is complete before its parent adds it.
+        for path in sorted(rows, key=lambda item: item.count("/") if item else -1, reverse=True):
+            parent = _parent(path)
+            if parent is not None and parent in totals:
+                totals[parent][0] += totals[path][0]
+                totals[parent][1] += totals[path][1]
+
+        duration = round(self._monotonic() - started, 2)
+        self._store(root, sources, rows, totals, duration, reused, errors)
+        yield {
+            "type": "progress",
+            "event": "complete",
+            "done": True,
+            "root": root,
+            "directories": len(rows),
+            "reused": reused,
+            "errors": errors,
+            "total_bytes": totals.get("", [0, 0])[0],
+            "total_files": totals.get("", [0, 0])[1],
+            "duration_seconds": duration,
+        }
+
+    def _store(self, root, sources, rows, totals, duration, reused, errors) -> None:
+        records = (
+            (root, path, _parent(path), row[0], row[1], row[2], totals[path][0], totals[path][1])
+            for path, row in rows.items()
+        )
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute("DELETE FROM dirs WHERE root = ?", (root,))
+                while True:
+                    batch = [record for _, record in zip(range(INSERT_BATCH), records)]
+                    if not batch:
+                        break
+                    connection.executemany(
+                        "INSERT INTO dirs VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch
+                    )
+                connection.execute(
+                    "INSERT OR REPLACE INTO scans VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        root,
+                        "\n".join(sources),
+                        int(self._clock()),
+                        duration,
+                        len(rows),
+                        reused,
+                        errors,
+                    ),
+                )
+        finally:
+            connection.close()
+
+    def roots(self) -> list[dict]:
+        """Every scanned root with its last scan's totals."""
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                """
+                SELECT scans.root, scans.scanned_at, scans.duration_seconds, scans.directories,
+                       scans.reused, scans.errors, dirs.total_bytes, dirs.total_files
+                FROM scans LEFT JOIN dirs ON dirs.root = scans.root AND dirs.path = ''
+                ORDER BY scans.root
+                """
+            ).fetchall()
+        finally:
+            connection.close()
+        return [
+            {
+                "root": root,
+                "scanned_at": scanned_at,
+                "duration_seconds": duration,
+                "directories": directories,
+                "reused": reused_count,
+                "errors": error_count,
+                "total_bytes": total_bytes or 0,
+                "total_files": total_files or 0,
+            }
+            for root, scanned_at, duration, directories, reused_count, error_count, total_bytes, total_files in rows
+        ]
+
+    def children(self, root: str, path: str = "", *, limit: int = 100) -> dict:
+        """Return one directory's totals and its largest subdirectories."""
+        path = path.strip("/")
+        if path and any(part in ("", ".", "..") for part in path.split("/")):
+            raise DiskUsageError("Invalid path")
+        limit = max(1, min(int(limit), MAX_CHILDREN))
+        connection = self._connect()
+        try:
+            scan = connection.execute(
+                "SELECT scanned_at FROM scans WHERE root = ?", (root,)
+            ).fetchone()
+            if scan is None:
+                raise DiskUsageError(f"{root} has not been scanned")
+            row = connection.execute(
+                "SELECT own_bytes, own_files, total_bytes, total_files FROM dirs WHERE root = ? AND path = ?",
+                (root, path),
+            ).fetchone()
+            if row is None:
+                raise DiskUsageError(f"{path or root} is not in the index")
+            count = connection.execute(
+                "SELECT COUNT(*) FROM dirs WHERE root = ? AND parent = ?", (root, path)
+            ).fetchone()[0]
+            entries = connection.execute(
+                """
+                SELECT path, total_bytes, total_files FROM dirs
+                WHERE root = ? AND parent = ?
+                ORDER BY total_bytes DESC, path
+                LIMIT ?
+                """,
+                (root, path, limit),
+            ).fetchall()
+        finally:
+            connection.close()
+        own_bytes, own_files, total_bytes, total_files = row
+        return {
+            "root": root,
+            "path": path,
+            "scanned_at": scan[0],
+            "total_bytes": total_bytes,
+            "total_files": total_files,
+            "files_bytes": own_bytes,
+            "files": own_files,
+            "children_count": count,
+            "children": [
+                {
+                    "name": child.rpartition("/")[2],
+                    "path": child,
+                    "total_bytes": child_bytes,
+                    "total_files": child_files,
+                    "percent": round(child_bytes / total_bytes * 100, 1) if total_bytes else 0.0,
+                }
+                for child, child_bytes, child_files in entries
+            ],
+        }
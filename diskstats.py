@@ -0,0 +1,129 @@
+"""Block-device throughput and latency from ``/proc/diskstats``.
+
+The kernel exposes cumulative request, sector and time counters per device;
+rates come from the delta between two reads. The sampler keeps the previous
+reading, so each call is one small file read and never sleeps.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+
+DISKSTATS_PATH = "/proc/diskstats"
+SYS_BLOCK_PATH = "/sys/block"
+SECTOR_BYTES = 512
+# Virtual devices whose traffic is already counted on the disks beneath them.
+IGNORED_PREFIXES = ("loop", "ram", "zram", "dm-", "md", "sr", "fd")
+
+
+@dataclass(frozen=True)
+class DiskCounters:
+    read_bytes: int
+    write_bytes: int
+    busy_ms: int
+    reads: int = 0
+    writes: int = 0
+    read_ms: int = 0
+    write_ms: int = 0
+
+
+def read_diskstats(path: str = DISKSTATS_PATH) -> dict[str, DiskCounters]:
+    """Return cumulative counters per device name; empty when unreadable."""
+    counters = {}
+    try:
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                fields = line.split()
+                if len(fields) < 13:
+                    continue
+                try:
+                    counters[fields[2]] = DiskCounters(
+                        read_bytes=int(fields[5]) * SECTOR_BYTES,
+                        write_bytes=int(fields[9]) * SECTOR_BYTES,
+                        busy_ms=int(fields[12]),
+                        reads=int(fields[3]),
+                        writes=int(fields[7]),
+                        read_ms=int(fields[6]),
+                        write_ms=int(fields[10]),
+                    )
+                except ValueError:
+                    continue
+    except OSError:
+        return {}
+    return counters
+
+
+def is_whole_disk(name: str, sys_block: str = SYS_BLOCK_PATH) -> bool:
+    """True for physical disks; partitions have no ``/sys/block`` entry."""
+    if name.startswith(IGNORED_PREFIXES):
+        return False
+    return os.path.isdir(os.path.join(sys_block, name))
+
+
+def disk_rates(before: DiskCounters, after: DiskCounters, elapsed: float) -> dict:
+    """Rates between two readings ``elapsed`` seconds apart.
+
+    ``await_ms`` is the mean time a completed request spent queued and in
+    service, the same figure ``iostat -x`` reports; it is None when no request
+    completed. Counters that went backwards (a reboot or device reset) count as
+    no activity.
+    """
+    reads = max(0, after.reads - before.reads)
+    writes = max(0, after.writes - before.writes)
+    waited = max(0, after.read_ms - before.read_ms) + max(0, after.write_ms - before.write_ms)
+    return {
+        "read_bps": max(0, after.read_bytes - before.read_bytes) / elapsed,
+        "write_bps": max(0, after.write_bytes - before.write_bytes) / elapsed,
+        "read_iops": reads / elapsed,
+        "write_iops": writes / elapsed,
+        "await_ms": waited / (reads + writes) if reads + writes else None,
+        "busy_percent": min(100.0, max(0, after.busy_ms - before.busy_ms) / (elapsed * 10)),
+    }
+
+
+class DiskThroughputSampler:
+    """Per-disk rates, latency and busy share since the previous sample."""
+
+    def __init__(
+        self,
+        *,
+        reader: Callable[[], Mapping[str, DiskCounters]] = read_diskstats,
+        device_filter: Callable[[str], bool] = is_whole_disk,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._reader = reader
+        self._device_filter = device_filter
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._previous: dict[str, DiskCounters] = {}
+        self._previous_at: float | None = None
+
+    def sample(self) -> dict[str, dict] | None:
+        """Return ``{device: rates}`` as produced by :func:`disk_rates`.
+
+        The first call only primes the baseline and returns None.
+        """
+        at = self._clock()
+        current = {
+            name: counters
+            for name, counters in self._reader().items()
+            if self._device_filter(name)
+        }
+        with self._lock:
+            previous, previous_at = self._previous, self._previous_at
+            self._previous, self._previous_at = current, at
+        if previous_at is None or at <= previous_at:
+            return None
+        elapsed = at - previous_at
+        rates = {}
+        for name, counters in current.items():
+            before = previous.get(name)
+            if before is None:
+                continue
+            rates[name] = disk_rates(before, counters, elapsed)
+        return rates
@@ -0,0 +1,505 @@
+"""Opt-in download throttling while the host is busy serving media.
+
+A large SABnzbd unpack or a fast torrent on the same USB array is what makes
+Jellyfin playback stutter on a Pi. ``ActivityService`` already knows when
+someone is watching, and the system stats know when the SoC is hot or
+throttling; this governor joins the two. While there is contention it lowers
+the SABnzbd and Transmission download limits through their own APIs, and once
+the host has been calm for a while it puts back exactly what it found.
+
+Changes are deliberately sluggish: separate engage and release thresholds stop
+a temperature hovering at the line from flapping the limit, a release needs a
+sustained quiet spell, and no two changes land within the cooldown. The limits
+the governor replaced are persisted with the config, so a restart mid-throttle
+still restores them.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import urllib.parse
+from collections import deque
+from collections.abc import Callable, Mapping
+from datetime import datetime, timezone
+from typing import Any
+
+from activity_service import DownloadClient, HttpResponse, transmission_rpc
+from http_pool import pooled_transport
+from ports import ConfigRepository
+
+
+DEFAULT_CONFIG = {
+    "version": 1,
+    "enabled": False,
+    # Applied to every download client while contended, in KiB/s.
+    "throttled_limit_kbps": 2048,
+    "throttle_on_streams": True,
+    "temperature_celsius": 75.0,
+    "temperature_release_celsius": 70.0,
+    "cpu_percent": 90.0,
+    "cpu_release_percent": 70.0,
+    # Share of time some task stalled on I/O over 10 s, from /proc/pressure/io.
+    "io_pressure_percent": 40.0,
+    "io_pressure_release_percent": 20.0,
+    "release_after_seconds": 120,
+    "cooldown_seconds": 60,
+    "interval_seconds": 30,
+    "throttle_state": None,
+}
+NUMERIC_FIELDS = {
+    "throttled_limit_kbps": (64, 1_000_000),
+    "temperature_celsius": (40.0, 100.0),
+    "temperature_release_celsius": (30.0, 100.0),
+    "cpu_percent": (10.0, 100.0),
+    "cpu_release_percent": (0.0, 100.0),
+    "io_pressure_percent": (1.0, 100.0),
+    "io_pressure_release_percent": (0.0, 100.0),
+    "release_after_seconds": (0, 3600),
+    "cooldown_seconds": (0, 3600),
+    "interval_seconds": (5, 3600),
+}
+MAX_RECENT_CHANGES = 20
+IO_PRESSURE_PATH = "/proc/pressure/io"
+
+
+class GovernorConfigError(Exception):
+    """Raised when a governor configuration change is invalid."""
+
+
+def read_io_pressure(path: str = IO_PRESSURE_PATH) -> float | None:
+    """Return PSI ``some avg10`` for block I/O, or None on kernels without PSI."""
+    try:
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                if not line.startswith("some "):
+                    continue
+                for field in line.split()[1:]:
+                    key, _, value = field.partition("=")
+                    if key == "avg10":
+                        return float(value)
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _mapping(value) -> Mapping:
+    return value if isinstance(value, Mapping) else {}
+
+
+def _number(value) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+# --- per-client speed control -------------------------------------------------
+
+
+def _sabnzbd_url(client: DownloadClient, **params: str) -> str:
+    query = urllib.parse.urlencode({**params, "output": "json", "apikey": client.api_key or ""})
+    return f"{client.base_url}/api?{query}"
+
+
+def _sabnzbd_call(transport, client: DownloadClient, timeout: float, **params: str) -> Mapping:
+    response = transport("GET", _sabnzbd_url(client, **params), None, None, timeout)
+    if response.status >= 400:
+        raise RuntimeError(f"HTTP {response.status}")
+    if not response.body:
+        return {}
+    return _mapping(json.loads(response.body.decode("utf-8", errors="replace")))
+
+
+def read_limit(transport, client: DownloadClient, timeout: float) -> dict:
+    """Capture a client's current download limit in a form ``apply_limit`` restores."""
+    if client.family == "sabnzbd":
+        payload = _sabnzbd_call(transport, client, timeout, mode="queue", limit="0")
+        queue = _mapping(payload.get("queue"))
+        # SABnzbd reports the limit as a percentage of its configured line speed,
+        # plus the absolute rate that works out to; the absolute form restores
+        # correctly even when no line speed is configured.
+        percent = str(queue.get("speedlimit") or "").strip()
+        absolute = _number(_float_text(queue.get("speedlimit_abs")))
+        if percent in {"", "0", "100"}:
+            return {"speedlimit": "100"}
+        if absolute:
+            return {"speedlimit": f"{max(1, round(absolute / 1024))}K"}
+        return {"speedlimit": percent}
+    arguments = _mapping(
+        transmission_rpc(
+            transport,
+            f"{client.base_url}/transmission/rpc",
+            "session-get",
+            {"fields": ["speed-limit-down", "speed-limit-down-enabled"]},
+            timeout=timeout,
+        ).get("arguments")
+    )
+    return {
+        "speed-limit-down": int(_number(arguments.get("speed-limit-down")) or 0),
+        "speed-limit-down-enabled": bool(arguments.get("speed-limit-down-enabled")),
+    }
+
+
+def _float_text(value):
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            return None
+    return value
+
+
+def throttle_limit(kbps: int, client: DownloadClient) -> dict:
+    if client.family == "sabnzbd":
+        return {"speedlimit": f"{int(kbps)}K"}
+    return {"speed-limit-down": int(kbps), "speed-limit-down-enabled": True}
+
+
+def apply_limit(transport, client: DownloadClient, limit: Mapping, timeout: float) -> None:
+    if client.family == "sabnzbd":
+        _sabnzbd_call(
+            transport,
+            client,
+            timeout,
+            mode="config",
+            name="speedlimit",
+            value=str(limit.get("speedlimit") or "100"),
+        )
+        return
+    transmission_rpc(
+        transport,
+        f"{client.base_url}/transmission/rpc",
+        "session-set",
+        dict(limit),
+        timeout=timeout,
+    )
+
+
+# --- governor -----------------------------------------------------------------
+
+
+class DownloadGovernor:
+    """Throttle download clients under playback or thermal contention."""
+
+    def __init__(
+        self,
+        *,
+        repository: ConfigRepository,
+        config_path_provider: Callable[[], str],
+        activity_reader: Callable[[], Mapping],
+        client_reader: Callable[[], list[DownloadClient]],
+        host_reader: Callable[[], Mapping] | None = None,
+        io_pressure_reader: Callable[[], float | None] = read_io_pressure,
+        transport: Callable[..., HttpResponse] = pooled_transport,
+        timeout_seconds: float = 4.0,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], datetime] = _utcnow,
+        logger: Callable[[str], None] = print,
+    ) -> None:
+        self._repository = repository
+        self._config_path_provider = config_path_provider
+        self._activity_reader = activity_reader
+        self._client_reader = client_reader
+        self._host_reader = host_reader
+        self._io_pressure_reader = io_pressure_reader
+        self._transport = transport
+        self._timeout = max(0.5, float(timeout_seconds))
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._log = logger
+        self._lock = threading.Lock()
+        # Serialises every load-modify-save of the config together with the
+        # engage/release it drives, so a settings change can never save a copy
+        # read before the throttle state (and the limits to restore) existed.
+        self._evaluation_lock = threading.Lock()
+        self._calm_since: float | None = None
+        self._last_change_at: float | None = None
+        self._last_reasons: list[str] = []
+        self._recent: deque[dict] = deque(maxlen=MAX_RECENT_CHANGES)
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    # -- Config --------------------------------------------------------------
+
+    def load_config(self) -> dict:
+        """Read persisted state merged over defaults."""
+        try:
+            stored = self._repository.read_json(self._config_path_provider(), default={})
+        except Exception:
+            stored = {}
+        if not isinstance(stored, dict):
+            stored = {}
+        merged = dict(DEFAULT_CONFIG)
+        merged.update(stored)
+        return merged
+
+    def save_config(self, config: Mapping[str, Any]) -> None:
+        self._repository.write_json(self._config_path_provider(), dict(config))
+
+    def update_config(self, changes: Mapping[str, Any]) -> dict:
+        """Validate and persist selected fields; disabling restores any throttle."""
+        with self._evaluation_lock:
+            self._update_config_locked(changes)
+        return self.status()
+
+    def _update_config_locked(self, changes: Mapping[str, Any]) -> None:
+        config = self.load_config()
+        if "enabled" in changes:
+            config["enabled"] = bool(changes["enabled"])
+        if "throttle_on_streams" in changes:
+            config["throttle_on_streams"] = bool(changes["throttle_on_streams"])
+        for field, (low, high) in NUMERIC_FIELDS.items():
+            if field not in changes:
+                continue
+            value = _number(changes[field])
+            if value is None or not low <= value <= high:
+                raise GovernorConfigError(f"{field} must be between {low} and {high}")
+            config[field] = int(value) if isinstance(low, int) else value
+        for engage, release in (
+            ("temperature_celsius", "temperature_release_celsius"),
+            ("cpu_percent", "cpu_release_percent"),
+            ("io_pressure_percent", "io_pressure_release_percent"),
+        ):
+            if config[release] > config[engage]:
+                raise GovernorConfigError(f"{release} must not exceed {engage}")
+        self.save_config(config)
+        if not config["enabled"] and config.get("throttle_state"):
+            self._release(config, ["governor disabled"])
+
+    # -- Lifecycle -----------------------------------------------------------
+
+    def start(self) -> None:
+        """Begin evaluating in the background; safe to call more than once."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="download-governor", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stopping.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            interval = DEFAULT_CONFIG["interval_seconds"]
+            try:
+                interval = self.tick()
+            except Exception as error:
+                # A governor that dies silently leaves downloads throttled forever.
+                self._log(f"Download governor: evaluation failed: {error}")
+            self._stopping.wait(interval)
+
+    # -- Evaluation ----------------------------------------------------------
+
+    def tick(self) -> float:
+        """Evaluate contention once and engage or release; returns the next interval."""
+        with self._evaluation_lock:
+            return self._tick_locked()
+
+    def _tick_locked(self) -> float:
+        config = self.load_config()
+        interval = float(config["interval_seconds"])
+        engaged = bool(config.get("throttle_state"))
+        if not config["enabled"]:
+            if engaged:
+                self._release(config, ["governor disabled"])
+            return interval
+
+        reasons = self.contention(config, engaged=engaged)
+        with self._lock:
+            self._last_reasons = reasons
+        now = self._clock()
+        if reasons:
+            self._calm_since = None
+            if not engaged and self._cooled_down(config, now):
+                self._engage(config, reasons)
+            return interval
+
+        if not engaged:
+            return interval
+        if self._calm_since is None:
+            self._calm_since = now
+        calm_for = now - self._calm_since
+        if calm_for >= float(config["release_after_seconds"]) and self._cooled_down(config, now):
+            self._release(config, [f"calm for {int(calm_for)}s"])
+        return interval
+
+    def contention(self, config: Mapping, *, engaged: bool) -> list[str]:
+        """Reasons the host is contended; release thresholds apply while engaged."""
+        reasons = []
+        if config["throttle_on_streams"]:
+            try:
+                streams = _mapping(self._activity_reader()).get("streams") or []
+            except Exception:
+                streams = []
+            playing = [
+                item for item in streams if isinstance(item, Mapping) and not item.get("is_paused")
+            ]
+            if playing:
+                transcodes = sum(1 for item in playing if item.get("is_transcoding"))
+                detail = f"{len(playing)} active stream(s)"
+                if transcodes:
+                    detail += f", {transcodes} transcoding"
+                reasons.append(detail)
+
+        stats: Mapping = {}
+        if self._host_reader is not None:
+            try:
+                stats = _mapping(self._host_reader())
+            except Exception:
+                stats = {}
+        if _mapping(stats.get("throttling")).get("throttled_now"):
+            reasons.append("SoC is thermally throttled")
+        readings = (
+            (
+                "temperature",
+                _number(stats.get("temperature_celsius")),
+                "temperature_celsius",
+                "temperature_release_celsius",
+                "°C",
+            ),
+            (
+                "CPU",
+                _number(stats.get("cpu_usage_percent")),
+                "cpu_percent",
+                "cpu_release_percent",
+                "%",
+            ),
+            (
+                "I/O pressure",
+                self._io_pressure(),
+                "io_pressure_percent",
+                "io_pressure_release_percent",
+                "%",
+            ),
+        )
+        for label, value, engage_key, release_key, unit in readings:
+            if value is None:
+                continue
+            threshold = float(config[release_key] if engaged else config[engage_key])
+            if value >= threshold:
+                reasons.append(f"{label} {value:.0f}{unit} ≥ {threshold:.0f}{unit}")
+        return reasons
+
+    def _io_pressure(self) -> float | None:
+        try:
+            return self._io_pressure_reader()
+        except Exception:
+            return None
+
+    def _cooled_down(self, config: Mapping, now: float) -> bool:
+        if self._last_change_at is None:
+            return True
+        return now - self._last_change_at >= float(config["cooldown_seconds"])
+
+    def _engage(self, config: dict, reasons: list[str]) -> None:
+        try:
+            clients = self._client_reader()
+        except Exception as error:
+            self._log(f"Download governor: could not list download clients: {error}")
+            return
+        if not clients:
+            return
+        kbps = int(config["throttled_limit_kbps"])
+        saved: dict[str, dict] = {}
+        for client in clients:
+            try:
+                previous = read_limit(self._transport, client, self._timeout)
+                apply_limit(self._transport, client, throttle_limit(kbps, client), self._timeout)
+            except Exception as error:
+                self._log(f"Download governor: could not throttle {client.name}: {error}")
+                continue
+            saved[client.name] = previous
+            self._note("throttled", client.name, f"{kbps} KiB/s", reasons)
+        if not saved:
+            return
+        config["throttle_state"] = {
+            "engaged_at": self._wall_clock().isoformat().replace("+00:00", "Z"),
+            "reasons": reasons,
+            "saved": saved,
+        }
+        self.save_config(config)
+        self._last_change_at = self._clock()
+
+    def _release(self, config: dict, reasons: list[str]) -> None:
+        state = _mapping(config.get("throttle_state"))
+        saved = dict(_mapping(state.get("saved")))
+        try:
+            clients = {client.name: client for client in self._client_reader()}
+        except Exception as error:
+            self._log(f"Download governor: could not list download clients: {error}")
+            clients = {}
+        remaining = {}
+        for name, previous in saved.items():
+            client = clients.get(name)
+            if client is None:
+                # Gone or stopped: its own config file restores the limit on restart.
+                self._note("forgot", name, "client no longer running", reasons)
+                continue
+            try:
+                apply_limit(self._transport, client, previous, self._timeout)
+            except Exception as error:
+                self._log(f"Download governor: could not restore {name}: {error}")
+                remaining[name] = previous
+                continue
+            self._note("restored", name, _describe(previous), reasons)
+        # Anything that failed to restore stays recorded and is retried next tick.
+        config["throttle_state"] = {**state, "saved": remaining} if remaining else None
+        self.save_config(config)
+        self._calm_since = None
+        self._last_change_at = self._clock()
+
+    def _note(self, action: str, name: str, detail: str, reasons: list[str]) -> None:
+        because = "; ".join(reasons) or "no reason recorded"
+        self._log(f"Download governor: {action} {name} ({detail}) because {because}")
+        with self._lock:
+            self._recent.append(
+                {
+                    "at": self._wall_clock().isoformat().replace("+00:00", "Z"),
+                    "action": action,
+                    "client": name,
+                    "detail": detail,
+                    "reasons": list(reasons),
+                }
+            )
+
+    # -- Read models ---------------------------------------------------------
+
+    def status(self) -> dict:
+        config = self.load_config()
+        state = _mapping(config.get("throttle_state"))
+        with self._lock:
+            recent = list(self._recent)
+            reasons = list(self._last_reasons)
+        return {
+            "config": {key: value for key, value in config.items() if key != "throttle_state"},
+            "engaged": bool(state),
+            "engaged_at": state.get("engaged_at"),
+            "engaged_reasons": list(state.get("reasons") or []),
+            "throttled_clients": sorted(_mapping(state.get("saved"))),
+            "contention": reasons,
+            "recent_changes": recent[::-1],
+        }
+
+
+def _describe(limit: Mapping) -> str:
+    if "speedlimit" in limit:
+        value = str(limit.get("speedlimit") or "100")
+        if value in {"0", "100"}:
+            return "no limit"
+        return f"limit {value}" if value.endswith("K") else f"limit {value}%"
+    if not limit.get("speed-limit-down-enabled"):
+        return "no limit"
+    return f"{limit.get('speed-limit-down')} KiB/s"
@@ -0,0 +1,417 @@
+"""Staged duplicate-file detection across MergerFS branches and media folders.
+
+Files are narrowed down in three passes so most of a media pool is never read:
+only files sharing a size are sampled (a hash of the size plus the first and
+last blocks), and only files sharing a sample are hashed in full. Hashing runs
+one worker per physical device, so each disk reads sequentially while separate
+disks work in parallel, and each worker can be rate limited. Hashes are kept
+in SQLite keyed by path, inode, size and mtime, so a re-run only reads files
+that are new or changed.
+
+Hard links (a torrent seed next to its library import) share an inode and are
+one copy on disk; they are never reported as duplicates of each other.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import queue
+import sqlite3
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from stat import S_ISREG
+
+from media_layout import DOWNLOAD_CATEGORIES, LIBRARY_KINDS, MediaLayout
+from pool_files import SKIPPED_DIRS, SKIPPED_PREFIXES, TEMP_SUFFIX, RateLimiter
+
+
+BUSY_TIMEOUT_MS = 3_000
+SAMPLE_BYTES = 64 * 1024
+CHUNK_BYTES = 4 * 1024 * 1024
+DEFAULT_MIN_FILE_BYTES = 1024 * 1024
+PROGRESS_INTERVAL_SECONDS = 1.0
+INSERT_BATCH = 5_000
+MAX_GROUPS = 500
+
+
+@dataclass(frozen=True)
+class ScanRoot:
+    """A directory to read and the path it appears under to users (a pool mount)."""
+
+    path: str
+    logical: str
+
+
+@dataclass
+class FileEntry:
+    path: str
+    logical: str
+    dev: int
+    ino: int
+    size: int
+    mtime_ns: int
+    sample: str | None = None
+    digest: str | None = None
+
+
+def media_category(logical_path: str, layout: MediaLayout) -> str | None:
+    """Name the library kind or download category a pool path belongs to."""
+    for kind in LIBRARY_KINDS:
+        if _within(logical_path, layout.library_path(kind)):
+            return f"library:{kind}"
+    for category in DOWNLOAD_CATEGORIES:
+        if _within(logical_path, layout.download_complete_path(category)):
+            return f"download:{category}"
+    if _within(logical_path, layout.download_incomplete_path()):
+        return "download:incomplete"
+    return None
+
+
+def _within(path: str, directory: str) -> bool:
+    return path == directory or path.startswith(directory.rstrip("/") + "/")
+
+
+def _walk(root: ScanRoot, min_bytes: int) -> list[FileEntry]:
+    entries = []
+    stack = [""]
+    while stack:
+        relative = stack.pop()
+        directory = os.path.join(root.path, relative) if relative else root.path
+        try:
+            listing = os.scandir(directory)
+        except OSError:
+            continue
+        with listing:
+            for item in listing:
+                relpath = f"{relative}/{item.name}" if relative else item.name
+                try:
+                    if item.is_dir(follow_symlinks=False):
+                        if item.name not in SKIPPED_DIRS:
+                            stack.append(relpath)
+                        continue
+                    if item.name.startswith(SKIPPED_PREFIXES) or item.name.endswith(TEMP_SUFFIX):
+                        continue
+                    stat = item.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if not S_ISREG(stat.st_mode) or stat.st_size < min_bytes:
+                    continue
+                entries.append(
+                    FileEntry(
+                        path=item.path,
+                        logical=os.path.join(root.logical, relpath),
+                        dev=stat.st_dev,
+                        ino=stat.st_ino,
+                        size=stat.st_size,
+                        mtime_ns=stat.st_mtime_ns,
+                    )
+                )
+    return entries
+
+
+def _ambiguous(groups: Iterable[list[FileEntry]]) -> list[FileEntry]:
+    """Entries in groups that still hold more than one distinct inode."""
+    pending = []
+    for group in groups:
+        if len({(entry.dev, entry.ino) for entry in group}) > 1:
+            pending.extend(group)
+    return pending
+
+
+class DuplicateFinder:
+    """Find duplicate files and keep their hashes for the next run."""
+
+    def __init__(
+        self,
+        database_path: str | Path,
+        *,
+        min_file_bytes: int = DEFAULT_MIN_FILE_BYTES,
+        sample_bytes: int = SAMPLE_BYTES,
+        rate_limit_bytes: float = 0,
+        clock: Callable[[], float] = time.time,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.database_path = str(database_path)
+        self._min_bytes = max(1, int(min_file_bytes))
+        self._sample_bytes = max(1, int(sample_bytes))
+        self._rate_limit = rate_limit_bytes
+        self._clock = clock
+        self._monotonic = monotonic
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.database_path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.database_path, timeout=BUSY_TIMEOUT_MS / 1000)
+        connection.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        with connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    logical TEXT NOT NULL,
+                    dev INTEGER NOT NULL,
+                    ino INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sample TEXT,
+                    digest TEXT
+                ) WITHOUT ROWID
+                """
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS files_digest ON files (digest)")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS scans (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    finished_at INTEGER NOT NULL,
+                    roots TEXT NOT NULL,
+                    files INTEGER NOT NULL,
+                    hashed_bytes INTEGER NOT NULL
+                )
+                """
+            )
+        return connection
+
+    # -- hashing ---------------------------------------------------------------
+
+    def _sample_hash(self, entry: FileEntry, limiter: RateLimiter) -> str:
+        digest = hashlib.blake2b(str(entry.size).encode(), digest_size=20)
+        with open(entry.path, "rb") as handle:
+            if entry.size <= 2 * self._sample_bytes:
+                chunk = handle.read()
+                limiter.consume(len(chunk))
+                digest.update(chunk)
+            else:
+                head = handle.read(self._sample_bytes)
+                handle.seek(entry.size - self._sample_bytes)
+                tail = handle.read(self._sample_bytes)
+                limiter.consume(len(head) + len(tail))
+                digest.update(head)
+                digest.update(tail)
+        return digest.hexdigest()
+
+    def _full_hash(self, entry: FileEntry, limiter: RateLimiter) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        with open(entry.path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(CHUNK_BYTES), b""):
+                limiter.consume(len(chunk))
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _per_device(self, entries: list[FileEntry], hasher) -> Iterator[tuple[FileEntry, object]]:
+        """Hash entries with one sequential worker per device, yielding as each finishes."""
+        by_device: dict[int, list[FileEntry]] = defaultdict(list)
+        for entry in entries:
+            by_device[entry.dev].append(entry)
+        results: queue.Queue = queue.Queue()
+
+        def work(batch):
+            limiter = RateLimiter(self._rate_limit, clock=self._monotonic)
+            for entry in batch:
+                try:
+                    results.put((entry, hasher(entry, limiter)))
+                except Exception as exc:
+                    results.put((entry, exc))
+
+        with ThreadPoolExecutor(max_workers=max(1, len(by_device))) as pool:
+            for batch in by_device.values():
+                pool.submit(work, batch)
+            for _ in range(len(entries)):
+                yield results.get()
+
+    # -- scan ------------------------------------------------------------------
+
+    def scan(self, roots: Iterable[ScanRoot]) -> Iterator[dict]:
+        """Yield progress events; the last one summarises the duplicates found."""
+        roots = list(roots)
+        yield {"type": "progress", "stage": "walk", "roots": [root.path for root in roots]}
+        with ThreadPoolExecutor(max_workers=max(1, len(roots))) as pool:
+            walked = list(pool.map(lambda root: _walk(root, self._min_bytes), roots))
+        entries = [entry for batch in walked for entry in batch]
+
+        cached = self._cached()
+        for entry in entries:
+            known = cached.get(entry.path)
+            if known is not None and known[:3] == (entry.ino, entry.size, entry.mtime_ns):
+                entry.sample, entry.digest = known[3], known[4]
+
+        by_size: dict[int, list[FileEntry]] = defaultdict(list)
+        for entry in entries:
+            by_size[entry.size].append(entry)
+        candidates = _ambiguous(by_size.values())
+        yield {
+            "type": "progress",
+            "stage": "size",
+            "files": len(entries),
+            "candidates": len(candidates),
+        }
+
+        tally = {"bytes": 0, "errors": 0}
+        need_sample = [entry for entry in candidates if entry.sample is None]
+        yield from self._hash_stage("sample", need_sample, self._sample_hash, tally)
+
+        by_sample: dict[tuple, list[FileEntry]] = defaultdict(list)
+        for entry in candidates:
+            if entry.sample is None:
+                continue
+            if entry.size <= 2 * self._sample_bytes:
+                # The sample already covered the whole file.
+                entry.digest = entry.sample
+            by_sample[(entry.size, entry.sample)].append(entry)
+        need_digest = [entry for entry in _ambiguous(by_sample.values()) if entry.digest is None]
+        yield from self._hash_stage("hash", need_digest, self._full_hash, tally)
+
+        self._store(roots, entries, tally["bytes"])
+        groups = self.groups()
+        yield {
+            "type": "progress",
+            "stage": "complete",
+            "done": True,
+            "files": len(entries),
+            "sampled": len(need_sample),
+            "hashed": len(need_digest),
+            "hashed_bytes": tally["bytes"],
+            "errors": tally["errors"],
+            "groups": groups["count"],
+            "wasted_bytes": groups["wasted_bytes"],
+        }
+
+    def _hash_stage(self, stage: str, pending: list[FileEntry], hasher, tally: dict) -> Iterator[dict]:
+        """Run one hashing pass, counting bytes read and failures into ``tally``."""
+        attribute = "sample" if stage == "sample" else "digest"
+        total_bytes = sum(entry.size for entry in pending) if stage == "hash" else 0
+        done = done_bytes = 0
+        reported_at = self._monotonic()
+        yield {"type": "progress", "stage": stage, "done_files": 0, "files": len(pending), "bytes": total_bytes}
+        for entry, result in self._per_device(pending, hasher):
+            done += 1
+            if isinstance(result, Exception):
+                tally["errors"] += 1
+                yield {"type": "progress", "stage": stage, "path": entry.logical, "error": str(result)}
+                continue
+            setattr(entry, attribute, result)
+            read = entry.size if stage == "hash" else min(entry.size, 2 * self._sample_bytes)
+            done_bytes += read
+            tally["bytes"] += read
+            now = self._monotonic()
+            if now - reported_at >= PROGRESS_INTERVAL_SECONDS:
+                reported_at = now
+                yield {
+                    "type": "progress",
+                    "stage": stage,
+                    "done_files": done,
+                    "files": len(pending),
+                    "done_bytes": done_bytes,
+                    "bytes": total_bytes,
+                }
+
+    def _cached(self) -> dict[str, tuple]:
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT path, ino, size, mtime_ns, sample, digest FROM files"
+            ).fetchall()
+        finally:
+            connection.close()
+        return {path: tuple(values) for path, *values in rows}
+
+    def _store(self, roots: list[ScanRoot], entries: list[FileEntry], hashed_bytes: int) -> None:
+        records = iter(
+            [
+                (
+                    entry.path,
+                    entry.logical,
+                    entry.dev,
+                    entry.ino,
+                    entry.size,
+                    entry.mtime_ns,
+                    entry.sample,
+                    entry.digest,
+                )
+                for entry in entries
+            ]
+        )
+        connection = self._connect()
+        try:
+            with connection:
+                # Rows from earlier scans of other roots stay cached; these roots are rewritten.
+                for root in roots:
+                    prefix = root.path.rstrip("/") + "/"
+                    connection.execute(
+                        "DELETE FROM files WHERE substr(path, 1, ?) = ?",
+                        (len(prefix), prefix),
+                    )
+                while True:
+                    batch = [record for _, record in zip(range(INSERT_BATCH), records)]
+                    if not batch:
+                        break
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch
+                    )
+                connection.execute(
+                    "INSERT OR REPLACE INTO scans VALUES (1, ?, ?, ?, ?)",
+                    (
+                        int(self._clock()),
+                        "\n".join(root.path for root in roots),
+                        len(entries),
+                        hashed_bytes,
+                    ),
+                )
+        finally:
+            connection.close()
+
+    # -- results ---------------------------------------------------------------
+
+    def groups(
+        self,
+        *,
+        limit: int = MAX_GROUPS,
+        categorize: Callable[[str], str | None] | None = None,
+    ) -> dict:
+        """Duplicate groups from the last scan, largest waste first."""
+        connection = self._connect()
+        try:
+            scan = connection.execute(
+                "SELECT finished_at, files, hashed_bytes FROM scans WHERE id = 1"
+            ).fetchone()
+            rows = connection.execute(
+                """
+                SELECT digest, size, path, logical, dev, ino FROM files
+                WHERE digest IN (
+                    SELECT digest FROM files WHERE digest IS NOT NULL
+                    GROUP BY digest HAVING COUNT(DISTINCT dev || ':' || ino) > 1
+                )
+                ORDER BY digest, logical
+                """
+            ).fetchall()
+        finally:
+            connection.close()
+        grouped: dict[str, dict] = {}
+        for digest, size, path, logical, dev, ino in rows:
+            group = grouped.setdefault(digest, {"digest": digest, "size": size, "files": [], "_inodes": set()})
+            group["_inodes"].add((dev, ino))
+            group["files"].append(
+                {
+                    "path": logical,
+                    "source": path,
+                    "category": categorize(logical) if categorize else None,
+                }
+            )
+        result = []
+        for group in grouped.values():
+            copies = len(group.pop("_inodes"))
+            group["copies"] = copies
+            group["wasted_bytes"] = group["size"] * (copies - 1)
+            result.append(group)
+        result.sort(key=lambda group: (-group["wasted_bytes"], group["digest"]))
+        return {
+            "scanned_at": scan[0] if scan else None,
+            "files": scan[1] if scan else 0,
+            "count": len(result),
+            "wasted_bytes": sum(group["wasted_bytes"] for group in result),
+            "groups": result[: max(1, min(int(limit), MAX_GROUPS))],
+        }
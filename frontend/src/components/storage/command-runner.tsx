@@ -100,6 +100,8 @@ export function CommandRunner({
         if (parsed !== null) {
           params[param.name] = parsed;
         }
+      } else if (param.type === "boolean") {
+        params[param.name] = raw === "true";
       } else if (raw !== "") {
         params[param.name] = raw;
       }
@@ -242,6 +244,14 @@ export function CommandRunner({
                     <option value="">No pools configured</option>
                   )}
                 </select>
+              ) : param.type === "boolean" ? (
+                <input
+                  checked={paramValue(openCommand, param) === "true"}
+                  className="block h-4 w-4"
+                  data-command-param={param.name}
+                  onChange={(e) => setValue(openCommand.id, param.name, String(e.target.checked))}
+                  type="checkbox"
+                />
               ) : (
                 <input
                   className="h-9 w-full rounded-md border border-input bg-background px-2 text-sm"
@@ -9,6 +9,28 @@ export interface DiskProviderAssignment {
   href: string;
   device_path: string;
 }
+export interface DiskBenchmarkSummary {
+  at: string;
+  sequential_read_mbps: number | null;
+  random_read_iops: number | null;
+  write_mbps: number | null;
+  transport: string;
+  driver: string;
+  usb_speed_mbps: number | null;
+  flags: Array<{ code: string; message: string }>;
+}
+
+export interface DiskIoSummary {
+  read_iops: number | null;
+  write_iops: number | null;
+  read_bps: number | null;
+  write_bps: number | null;
+  await_ms: number | null;
+  busy_percent: number | null;
+  sampled_at: string;
+  flags: Array<{ code: string; message: string }>;
+}
+
 export interface DiskSummaryDevice {
   name: string;
   path: string;
@@ -21,6 +43,8 @@ export interface DiskSummaryDevice {
     mounted_available_bytes: number;
   };
   assignments: DiskProviderAssignment[];
+  benchmark: DiskBenchmarkSummary | null;
+  io: DiskIoSummary | null;
 }
 
 export interface DiskSummary {
@@ -71,6 +95,44 @@ function nullableNumber(value: unknown): number | null {
   return typeof value === "number" && Number.isFinite(value) && value >= 0 ? value : null;
 }
 
+function normalizeFlags(value: unknown): Array<{ code: string; message: string }> {
+  const flags = Array.isArray(value) ? value.slice(0, 20) : [];
+  return flags.map((item) => {
+    const flag = record(item);
+    return { code: text(flag.code), message: text(flag.message) };
+  });
+}
+
+function normalizeBenchmark(value: unknown): DiskBenchmarkSummary | null {
+  if (!value || typeof value !== "object" || Array.isArray(value)) return null;
+  const benchmark = record(value);
+  return {
+    at: text(benchmark.at),
+    sequential_read_mbps: nullableNumber(benchmark.sequential_read_mbps),
+    random_read_iops: nullableNumber(benchmark.random_read_iops),
+    write_mbps: nullableNumber(benchmark.write_mbps),
+    transport: text(benchmark.transport),
+    driver: text(benchmark.driver),
+    usb_speed_mbps: nullableNumber(benchmark.usb_speed_mbps),
+    flags: normalizeFlags(benchmark.flags),
+  };
+}
+
+function normalizeIo(value: unknown): DiskIoSummary | null {
+  if (!value || typeof value !== "object" || Array.isArray(value)) return null;
+  const io = record(value);
+  return {
+    read_iops: nullableNumber(io.read_iops),
+    write_iops: nullableNumber(io.write_iops),
+    read_bps: nullableNumber(io.read_bps),
+    write_bps: nullableNumber(io.write_bps),
+    await_ms: nullableNumber(io.await_ms),
+    busy_percent: nullableNumber(io.busy_percent),
+    sampled_at: text(io.sampled_at),
+    flags: normalizeFlags(io.flags),
+  };
+}
+
 function sourceState(value: unknown): DiskSummarySourceState {
   return value === "available" || value === "degraded" || value === "not_checked"
     ? value
@@ -142,6 +204,8 @@ export function normalizeDiskSummary(value: unknown): DiskSummary {
             device_path: text(assignment.device_path),
           };
         }),
+        benchmark: normalizeBenchmark(device.benchmark),
+        io: normalizeIo(device.io),
       };
     }),
     warnings: warnings.map((item) => {
@@ -2,6 +2,8 @@ import { requestApi, toNullableNumber, toNullableString } from "@/lib/api";
 import { normalizeDiskSummary, type DiskSummary } from "@/lib/disk-summary";
 
 export type {
+  DiskBenchmarkSummary,
+  DiskIoSummary,
   DiskProviderAssignment,
   DiskSummary,
   DiskSummaryDevice,
@@ -300,3 +302,24 @@ export async function runSmartTest(
   }
   return payload.message || `${testType} self-test started`;
 }
+
+export async function runDiskBenchmark(deviceName: string, signal?: AbortSignal): Promise<string> {
+  const payload = await requestApi<{
+    result?: { sequential_read_mbps?: unknown; random_read_iops?: unknown };
+    latest?: { flags?: Array<{ message?: unknown }> };
+    error?: string;
+  }>(`/api/disks/${encodeURIComponent(deviceName)}/benchmark`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({}),
+    signal,
+  });
+  if (payload.error) {
+    throw new Error(payload.error);
+  }
+  const read = toNullableNumber(payload.result?.sequential_read_mbps);
+  const iops = toNullableNumber(payload.result?.random_read_iops);
+  const flag = payload.latest?.flags?.[0]?.message;
+  const measured = `/dev/${deviceName}: ${read ?? "?"} MB/s sequential, ${iops ?? "?"} random reads/s`;
+  return typeof flag === "string" && flag ? `${measured} — ${flag}` : measured;
+}
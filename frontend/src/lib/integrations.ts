@@ -6,7 +6,7 @@ import {
   type IntegrationLifecycleStatus,
 } from "@/lib/integration-lifecycle-contract";
 
-export type AlertKind = "container" | "smart" | "mount" | "snapraid";
+export type AlertKind = "container" | "smart" | "mount" | "snapraid" | "metric";
 
 export interface AlertSilence {
   kind: AlertKind;
@@ -17,6 +17,9 @@ export interface OperationEvent {
   requires_auth?: boolean;
   requires_setup?: boolean;
   expired?: boolean;
+  // Set on operations recovered after a restart that had not finished.
+  interrupted?: boolean;
+  last_progress?: OperationEvent | null;
   warnings?: Array<{ code?: string; message?: string }>;
 }
 
@@ -55,53 +58,72 @@ export async function createOperation(
   };
 }
 
+// A lagging stream is closed by the server; reconnect and replay from the last id.
+const STREAM_RECONNECT_ATTEMPTS = 3;
+
 export async function streamOperation(
   streamUrl: string,
   onEvent: (event: OperationEvent) => void,
   signal?: AbortSignal,
 ): Promise<void> {
-  const response = await fetch(streamUrl, {
-    method: "GET",
-    credentials: "same-origin",
-    headers: { Accept: "text/event-stream" },
-    signal,
-  });
-  if (!response.ok || !response.body) {
-    throw new Error(`Operation stream failed (${response.status})`);
-  }
-
-  const reader = response.body.getReader();
-  const decoder = new TextDecoder();
-  let buffer = "";
-  let terminalEvent = false;
-  for (;;) {
-    const { value, done } = await reader.read();
-    if (done) {
-      break;
+  let lastEventId: string | null = null;
+  let attempts = 0;
+  while (attempts < STREAM_RECONNECT_ATTEMPTS) {
+    const headers: Record<string, string> = { Accept: "text/event-stream" };
+    if (lastEventId !== null) {
+      headers["Last-Event-ID"] = lastEventId;
     }
-    buffer += decoder.decode(value, { stream: true });
-    let separator = buffer.indexOf("\n\n");
-    while (separator !== -1) {
-      const frame = buffer.slice(0, separator);
-      buffer = buffer.slice(separator + 2);
-      const dataLine = frame.split("\n").find((line) => line.startsWith("data:"));
-      if (dataLine) {
-        try {
-          const event = JSON.parse(dataLine.slice(5).trim()) as OperationEvent;
-          terminalEvent = terminalEvent || Boolean(event.done || event.error);
-          onEvent(event);
-        } catch (error) {
-          if (error instanceof SyntaxError) {
-            // Ignore malformed frames; a terminal event still controls completion.
-          } else {
-            throw error;
+    const response = await fetch(streamUrl, {
+      method: "GET",
+      credentials: "same-origin",
+      headers,
+      signal,
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Operation stream failed (${response.status})`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    const previousEventId = lastEventId;
+    let buffer = "";
+    let terminalEvent = false;
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) {
+        break;
+      }
+      buffer += decoder.decode(value, { stream: true });
+      let separator = buffer.indexOf("\n\n");
+      while (separator !== -1) {
+        const frame = buffer.slice(0, separator);
+        buffer = buffer.slice(separator + 2);
+        const lines = frame.split("\n");
+        const idLine = lines.find((line) => line.startsWith("id:"));
+        if (idLine) {
+          lastEventId = idLine.slice(3).trim();
+        }
+        const dataLine = lines.find((line) => line.startsWith("data:"));
+        if (dataLine) {
+          try {
+            const event = JSON.parse(dataLine.slice(5).trim()) as OperationEvent;
+            terminalEvent = terminalEvent || Boolean(event.done || event.error);
+            onEvent(event);
+          } catch (error) {
+            if (error instanceof SyntaxError) {
+              // Ignore malformed frames; a terminal event still controls completion.
+            } else {
+              throw error;
+            }
           }
         }
+        separator = buffer.indexOf("\n\n");
       }
-      separator = buffer.indexOf("\n\n");
     }
+    if (terminalEvent) {
+      return;
+    }
+    attempts = lastEventId === previousEventId ? attempts + 1 : 1;
   }
-  if (!terminalEvent) {
-    throw new Error("Operation stream ended before completion");
-  }
+  throw new Error("Operation stream ended before completion");
 }
@@ -106,6 +106,8 @@ export interface BackupConfig {
   schedule_preset: string;
   retention_count: number | null;
   dest_dir: string;
+  backup_mode: "archive" | "snapshot";
+  low_priority: boolean;
 }
 
 export interface BackupStatus {
@@ -123,6 +125,8 @@ export async function fetchBackupConfig(signal?: AbortSignal): Promise<BackupCon
     schedule_preset: String(payload.schedule_preset ?? "daily"),
     retention_count: payload.retention_count === undefined ? null : Number(payload.retention_count),
     dest_dir: String(payload.dest_dir ?? ""),
+    backup_mode: payload.backup_mode === "snapshot" ? "snapshot" : "archive",
+    low_priority: payload.low_priority !== false,
   };
 }
 
@@ -173,6 +177,66 @@ export async function restoreBackup(archiveName: string, signal?: AbortSignal):
   }
 }
 
+export interface BackupTrendPoint {
+  name: string;
+  series: string | null;
+  type: "archive" | "snapshot";
+  mtime: number;
+  source_bytes: number | null;
+  stored_bytes: number | null;
+  duration_seconds: number | null;
+  ratio: number | null;
+}
+
+export async function fetchBackupTrend(signal?: AbortSignal): Promise<BackupTrendPoint[]> {
+  const payload = await requestApi<{ backups?: BackupTrendPoint[] }>("/api/backups/trend", { method: "GET", signal });
+  return Array.isArray(payload.backups) ? payload.backups : [];
+}
+
+export interface BackupContentEntry {
+  name: string;
+  path: string;
+  type: string;
+  size: number;
+  files: number;
+}
+
+export async function browseBackup(
+  archiveName: string,
+  path: string,
+  signal?: AbortSignal,
+): Promise<BackupContentEntry[]> {
+  const query = new URLSearchParams({ path });
+  const payload = await requestApi<{ entries?: BackupContentEntry[]; error?: string }>(
+    `/api/backups/${encodeURIComponent(archiveName)}/contents?${query.toString()}`,
+    { method: "GET", signal },
+  );
+  if (payload.error) {
+    throw new Error(payload.error);
+  }
+  return Array.isArray(payload.entries) ? payload.entries : [];
+}
+
+export async function restoreBackupPaths(
+  archiveName: string,
+  paths: string[],
+  staging: boolean,
+  signal?: AbortSignal,
+): Promise<void> {
+  const payload = await requestApi<{ status?: string; error?: string }>(
+    `/api/backups/${encodeURIComponent(archiveName)}/restore-paths`,
+    {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ paths, staging }),
+      signal,
+    },
+  );
+  if (payload.error) {
+    throw new Error(payload.error);
+  }
+}
+
 // --- Auto-update -------------------------------------------------------------
 
 export interface AutoUpdateConfig {
@@ -19,7 +19,7 @@ export interface StoragePlugin {
 export interface PluginCommandParam {
   name: string;
   label?: string;
-  type: string; // "select" | "number" | "text"
+  type: string; // "select" | "number" | "boolean" | "text"
   required?: boolean;
   source?: string; // e.g. "status.details.pools[].name"
   default?: unknown;
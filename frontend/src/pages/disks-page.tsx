@@ -4,6 +4,7 @@ import {
   Activity,
   ExternalLink,
   FolderInput,
+  Gauge,
   HardDrive,
   Loader2,
   RefreshCw,
@@ -35,11 +36,12 @@ import {
   fetchSmartSummary,
   fetchSuggestedMounts,
   mountDisk,
+  runDiskBenchmark,
   runSmartTest,
   unmountDisk,
 } from "@/lib/disks";
 import { mergeDiskSummaryHealth } from "@/lib/disk-summary";
-import { formatBytes, formatClockTime } from "@/lib/format";
+import { formatBytes, formatClockTime, formatRate } from "@/lib/format";
 import { cn } from "@/lib/utils";
 
 type AsyncStatus = "idle" | "loading" | "ready" | "error";
@@ -275,6 +277,7 @@ function DiskCard({
   setConfirmKey,
   onSmart,
   onUnmount,
+  onBenchmark,
 }: {
   disk: DiskInfo;
   summary?: DiskSummaryDevice;
@@ -285,6 +288,7 @@ function DiskCard({
   setConfirmKey: (key: string | null) => void;
   onSmart: (disk: DiskInfo) => void;
   onUnmount: (mountpoint: string) => void;
+  onBenchmark: (disk: DiskInfo) => void;
 }) {
   const usage = getDiskUsage(disk);
   const usagePercent = usage?.percent ?? null;
@@ -295,6 +299,9 @@ function DiskCard({
     ...disk.partitions.flatMap((partition) => (partition.mountpoint ? [partition.mountpoint] : [])),
   ];
   const confirmedUnmount = unmountTargets.find((mountpoint) => confirmKey === `unmount:${mountpoint}`);
+  const benchmark = summary?.benchmark ?? null;
+  const io = summary?.io ?? null;
+  const diskFlags = [...(benchmark?.flags ?? []), ...(io?.flags ?? [])];
   return (
     <Card className="transition-colors duration-200 hover:border-primary/25">
       <CardContent className="space-y-4 p-4">
@@ -325,19 +332,31 @@ function DiskCard({
             >
               <ShieldCheck aria-hidden="true" className="h-4 w-4" />
             </Button>
-            {unmountTargets.length && helperAvailable !== false ? (
+            {helperAvailable !== false ? (
               <ActionMenu
                 disabled={Boolean(pendingKey)}
-                items={unmountTargets.map((mountpoint) => ({
-                  id: `unmount:${mountpoint}`,
-                  label: `Unmount ${mountpoint}`,
-                  Icon: Unplug,
-                  onSelect: () => setConfirmKey(`unmount:${mountpoint}`),
-                  tone: "danger" as const,
-                  data: { "data-unmount": mountpoint },
-                }))}
+                items={[
+                  {
+                    id: `benchmark:${disk.name}`,
+                    label: "Run throughput test",
+                    Icon: Gauge,
+                    onSelect: () => onBenchmark(disk),
+                    data: { "data-benchmark": disk.name },
+                  },
+                  ...unmountTargets.map((mountpoint) => ({
+                    id: `unmount:${mountpoint}`,
+                    label: `Unmount ${mountpoint}`,
+                    Icon: Unplug,
+                    onSelect: () => setConfirmKey(`unmount:${mountpoint}`),
+                    tone: "danger" as const,
+                    data: { "data-unmount": mountpoint },
+                  })),
+                ]}
                 label={`More actions for ${disk.path}`}
-                pending={Boolean(pendingKey?.startsWith("unmount:"))}
+                pending={
+                  pendingKey === `benchmark:${disk.name}` ||
+                  Boolean(pendingKey?.startsWith("unmount:"))
+                }
                 triggerData={{ "data-disk-menu": disk.name }}
               />
             ) : null}
@@ -353,8 +372,37 @@ function DiskCard({
               {temperature} °C
             </span>
           ) : null}
+          {benchmark?.sequential_read_mbps !== null && benchmark?.sequential_read_mbps !== undefined ? (
+            <span className="inline-flex items-center gap-1" data-disk-benchmark={disk.name}>
+              <Gauge aria-hidden="true" className="h-3.5 w-3.5 text-dim" />
+              {Math.round(benchmark.sequential_read_mbps)} MB/s
+              {benchmark.random_read_iops !== null ? ` · ${Math.round(benchmark.random_read_iops)} IOPS` : ""}
+            </span>
+          ) : null}
+          {io?.busy_percent !== null && io?.busy_percent !== undefined ? (
+            <span
+              className="inline-flex items-center gap-1"
+              data-disk-io={disk.name}
+              title={`Read ${formatRate(io.read_bps)} · write ${formatRate(io.write_bps)}`}
+            >
+              <Activity aria-hidden="true" className="h-3.5 w-3.5 text-dim" />
+              {Math.round(io.busy_percent)}% busy
+              {io.await_ms !== null ? ` · ${io.await_ms.toFixed(1)} ms await` : ""}
+            </span>
+          ) : null}
         </div>
 
+        {diskFlags.length ? (
+          <div className="space-y-1 text-xs text-warning" data-disk-flags={disk.name}>
+            {diskFlags.map((flag) => (
+              <p className="flex items-center gap-1.5" key={flag.code}>
+                <TriangleAlert aria-hidden="true" className="h-3.5 w-3.5 shrink-0" />
+                {flag.message}
+              </p>
+            ))}
+          </div>
+        ) : null}
+
         {usage && usagePercent !== null ? (
           <div data-disk-usage={disk.name}>
             <div className="flex items-baseline justify-between gap-3">
@@ -600,6 +648,12 @@ export function DisksPage() {
     [runDiskAction],
   );
 
+  const onBenchmark = useCallback(
+    (disk: DiskInfo) =>
+      runDiskAction(`benchmark:${disk.name}`, () => runDiskBenchmark(disk.name)),
+    [runDiskAction],
+  );
+
   const onSmartTest = useCallback(
     async (deviceName: string, testType: SmartTestType) => {
       if (pendingKey) return;
@@ -831,6 +885,7 @@ export function DisksPage() {
               disk={disk}
               helperAvailable={helperAvailable}
               key={disk.path}
+              onBenchmark={onBenchmark}
               onSmart={onSmart}
               onUnmount={onUnmount}
               pendingKey={pendingKey}
@@ -74,6 +74,7 @@ const KIND_LABELS: Record<AlertKind, { label: string; description: string }> = {
   smart: { label: "SMART", description: "Disk health assessments that report a failure" },
   mount: { label: "Mounts", description: "Required mountpoints that disappear" },
   snapraid: { label: "SnapRAID", description: "Parity errors, degradation, or a required sync" },
+  metric: { label: "System metrics", description: "Sustained CPU, memory, or heat, and storage filling up" },
 };
 
 type Tab = "overview" | "policy";
@@ -157,6 +158,7 @@ export function IntegrationsPage() {
       smart: [],
       mount: [],
       snapraid: [],
+      metric: [],
     };
     status?.resources.forEach((resource) => grouped[resource.kind]?.push(resource));
     return grouped;
@@ -185,6 +185,8 @@ export function SettingsPage() {
     schedule_preset: "daily",
     retention_count: null,
     dest_dir: "",
+    backup_mode: "archive",
+    low_priority: true,
   });
   const [backupStatus, setBackupStatus] = useState<BackupStatus | null>(null);
   const [backups, setBackups] = useState<string[]>([]);
@@ -505,6 +507,20 @@ export function SettingsPage() {
                 testId="backup-dest"
                 value={backup.dest_dir}
               />
+              <ToggleField
+                checked={backup.backup_mode === "snapshot"}
+                label="Deduplicated snapshots"
+                onChange={(checked) =>
+                  setBackup((c) => ({ ...c, backup_mode: checked ? "snapshot" : "archive" }))
+                }
+                testId="backup-snapshots"
+              />
+              <ToggleField
+                checked={backup.low_priority}
+                label="Run backups at low CPU and disk priority"
+                onChange={(checked) => setBackup((c) => ({ ...c, low_priority: checked }))}
+                testId="backup-low-priority"
+              />
               <div className="flex flex-wrap items-center gap-2">
                 <Button
                   disabled={busy}
@@ -517,6 +533,8 @@ export function SettingsPage() {
                           enabled: backup.enabled,
                           schedule_preset: backup.schedule_preset,
                           dest_dir: backup.dest_dir,
+                          backup_mode: backup.backup_mode,
+                          low_priority: backup.low_priority,
                         }),
                       "Backup config saved",
                     )
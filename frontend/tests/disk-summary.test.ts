@@ -80,3 +80,51 @@ test("merges independently loaded SMART health into an embedded summary", () =>
   assert.equal(merged.counts.unknown, 0);
   assert.equal(merged.devices[0]?.temperature_c, 38);
 });
+
+test("normalizes the latest throughput benchmark and its flags", () => {
+  const result = normalizeDiskSummary({
+    devices: [
+      {
+        name: "sda",
+        path: "/dev/sda",
+        benchmark: {
+          sequential_read_mbps: 38.5,
+          random_read_iops: "fast",
+          transport: "usb",
+          driver: "usb-storage",
+          flags: [{code: "usb_storage_fallback", message: "Using the usb-storage driver instead of UAS"}],
+        },
+      },
+      {name: "sdb", path: "/dev/sdb", benchmark: "none"},
+    ],
+  });
+
+  assert.equal(result.devices[0]?.benchmark?.sequential_read_mbps, 38.5);
+  assert.equal(result.devices[0]?.benchmark?.random_read_iops, null);
+  assert.equal(result.devices[0]?.benchmark?.flags[0]?.code, "usb_storage_fallback");
+  assert.equal(result.devices[1]?.benchmark, null);
+});
+
+test("normalizes current I/O rates and pool flags", () => {
+  const result = normalizeDiskSummary({
+    devices: [
+      {
+        name: "sdc",
+        path: "/dev/sdc",
+        io: {
+          read_iops: 40.5,
+          busy_percent: 97,
+          await_ms: 180,
+          write_bps: -1,
+          flags: [{code: "slow_in_pool", message: "Requests wait 180 ms against 9 ms on other storage disks"}],
+        },
+      },
+      {name: "sdd", path: "/dev/sdd"},
+    ],
+  });
+
+  assert.equal(result.devices[0]?.io?.busy_percent, 97);
+  assert.equal(result.devices[0]?.io?.write_bps, null);
+  assert.equal(result.devices[0]?.io?.flags[0]?.code, "slow_in_pool");
+  assert.equal(result.devices[1]?.io, null);
+});
@@ -0,0 +1,271 @@
+"""Keep-alive HTTP connections for polling the media stack's local APIs.
+
+Activity collection calls Jellyfin, SABnzbd, Transmission and every *arr several
+times per refresh, and ``urllib`` opens (and tears down) a fresh TCP connection
+for each one. This module keeps a small per-host pool of ``http.client``
+connections instead: a connection is checked out for one request, returned if
+the server kept it open, and closed once it has sat idle for too long. Requests
+return error responses rather than raising, so callers decide what a 4xx means.
+"""
+
+from __future__ import annotations
+
+import http.client
+import select
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+
+DEFAULT_TIMEOUT_SECONDS = 4.0
+# Services close idle keep-alive sockets on their own schedule (Kestrel after
+# two minutes, CherryPy sooner); dropping ours first avoids writing into a
+# socket the far end has already abandoned.
+DEFAULT_IDLE_SECONDS = 30.0
+# Activity polls each service from one worker at a time, seeding is sequential,
+# so a couple of spare connections per host covers the overlap.
+DEFAULT_MAX_PER_HOST = 4
+DEFAULT_MAX_HOSTS = 32
+
+# A reused connection that fails with one of these was probably closed by the
+# server while it sat idle. (``http.client.RemoteDisconnected`` is a
+# ``ConnectionResetError``.) The same errors arrive when the service dropped the
+# socket after acting on the request, so only a request that was never written,
+# or one that is safe to repeat, is resent.
+_STALE_CONNECTION_ERRORS = (
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class _UnsentRequestError(ConnectionResetError):
+    """A stale connection failed while the request was still being written."""
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+
+
+_HostKey = tuple[str, str, int]
+
+
+def _connection_factory(scheme: str, host: str, port: int, timeout: float):
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, port, timeout=timeout)
+    return http.client.HTTPConnection(host, port, timeout=timeout)
+
+
+class HttpConnectionPool:
+    """Bounded, thread-safe pool of persistent connections keyed by host."""
+
+    def __init__(
+        self,
+        *,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        max_hosts: int = DEFAULT_MAX_HOSTS,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        connection_factory: Callable[..., http.client.HTTPConnection] = _connection_factory,
+    ) -> None:
+        self._max_per_host = max(1, int(max_per_host))
+        self._max_hosts = max(1, int(max_hosts))
+        self._idle_seconds = max(0.0, float(idle_seconds))
+        self._timeout = max(0.1, float(timeout_seconds))
+        self._clock = clock
+        self._connection_factory = connection_factory
+        self._lock = threading.Lock()
+        # host -> idle connections, most recently returned last. The outer dict
+        # is ordered by host recency so the least-used host is evicted first.
+        self._idle: OrderedDict[_HostKey, list[tuple[http.client.HTTPConnection, float]]] = (
+            OrderedDict()
+        )
+
+    def __call__(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        body: bytes | None = None,
+        timeout: float | None = None,
+    ) -> HttpResponse:
+        return self.request(method, url, headers, body, timeout)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        body: bytes | None = None,
+        timeout: float | None = None,
+    ) -> HttpResponse:
+        """Perform one HTTP call over a pooled connection.
+
+        Raises ``OSError`` for connection failures and timeouts; HTTP error
+        statuses come back as ordinary responses.
+        """
+        parts = urllib.parse.urlsplit(url)
+        scheme = (parts.scheme or "http").lower()
+        if scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        key: _HostKey = (scheme, parts.hostname, parts.port or (443 if scheme == "https" else 80))
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        seconds = self._timeout if timeout is None else max(0.1, float(timeout))
+
+        connection, reused = self._checkout(key, seconds)
+        try:
+            response = self._send(connection, method, target, headers, body, seconds)
+        except _STALE_CONNECTION_ERRORS as error:
+            connection.close()
+            if not reused or not (
+                isinstance(error, _UnsentRequestError) or method.upper() in IDEMPOTENT_METHODS
+            ):
+                raise
+            connection, reused = self._new_connection(key, seconds), False
+            response = self._send_or_close(connection, method, target, headers, body, seconds)
+        except BaseException:
+            connection.close()
+            raise
+
+        status, response_headers, payload, keep = response
+        if keep:
+            self._checkin(key, connection)
+        else:
+            connection.close()
+        return HttpResponse(status, response_headers, payload)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            pools = list(self._idle.values())
+            self._idle.clear()
+        for pool in pools:
+            for connection, _returned_at in pool:
+                connection.close()
+
+    def idle_count(self, host: str | None = None) -> int:
+        with self._lock:
+            return sum(
+                len(pool) for key, pool in self._idle.items() if host is None or key[1] == host
+            )
+
+    # --- internals ---------------------------------------------------------
+
+    def _send_or_close(self, connection, method, target, headers, body, seconds):
+        try:
+            return self._send(connection, method, target, headers, body, seconds)
+        except BaseException:
+            connection.close()
+            raise
+
+    @staticmethod
+    def _send(connection, method, target, headers, body, seconds):
+        connection.timeout = seconds
+        if connection.sock is not None:
+            connection.sock.settimeout(seconds)
+        try:
+            try:
+                connection.request(method, target, body=body, headers=dict(headers or {}))
+            except _STALE_CONNECTION_ERRORS as error:
+                raise _UnsentRequestError(*error.args) from error
+            response = connection.getresponse()
+            payload = response.read()
+        except http.client.HTTPException as error:
+            if isinstance(error, _STALE_CONNECTION_ERRORS):
+                raise
+            # Surface protocol garbage like any other connection failure.
+            raise ConnectionError(str(error) or error.__class__.__name__) from error
+        return response.status, dict(response.headers), payload, not response.will_close
+
+    def _new_connection(self, key: _HostKey, seconds: float):
+        scheme, host, port = key
+        return self._connection_factory(scheme, host, port, seconds)
+
+    def _checkout(self, key: _HostKey, seconds: float):
+        now = self._clock()
+        expired = []
+        connection = None
+        with self._lock:
+            pool = self._idle.get(key) or []
+            while pool:
+                candidate, returned_at = pool.pop()
+                if now - returned_at > self._idle_seconds or _dropped(candidate):
+                    expired.append(candidate)
+                    continue
+                connection = candidate
+                break
+            if not pool:
+                self._idle.pop(key, None)
+            expired.extend(self._prune_locked(now))
+        for stale in expired:
+            stale.close()
+        if connection is not None:
+            return connection, True
+        return self._new_connection(key, seconds), False
+
+    def _checkin(self, key: _HostKey, connection) -> None:
+        now = self._clock()
+        surplus = []
+        with self._lock:
+            pool = self._idle.setdefault(key, [])
+            self._idle.move_to_end(key)
+            pool.append((connection, now))
+            while len(pool) > self._max_per_host:
+                surplus.append(pool.pop(0)[0])
+            while len(self._idle) > self._max_hosts:
+                _host, evicted = self._idle.popitem(last=False)
+                surplus.extend(item[0] for item in evicted)
+            surplus.extend(self._prune_locked(now))
+        for extra in surplus:
+            extra.close()
+
+    def _prune_locked(self, now: float) -> list:
+        """Detach connections that have idled past the limit; caller closes them."""
+        expired = []
+        for key in list(self._idle):
+            pool = self._idle[key]
+            keep = [item for item in pool if now - item[1] <= self._idle_seconds]
+            expired.extend(item[0] for item in pool if now - item[1] > self._idle_seconds)
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+        return expired
+
+
+def _dropped(connection) -> bool:
+    """True when an idle socket is readable: the peer hung up or sent stray bytes."""
+    sock = connection.sock
+    if sock is None:
+        return False
+    try:
+        readable, _writable, _errors = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+# Shared by everything that polls the local media stack, so a refresh that talks
+# to Sonarr and a seed run that configures it reuse the same sockets.
+DEFAULT_POOL = HttpConnectionPool()
+
+
+def pooled_transport(
+    method: str,
+    url: str,
+    headers: Mapping[str, str] | None = None,
+    body: bytes | None = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> HttpResponse:
+    """Perform one HTTP call through the shared pool."""
+    return DEFAULT_POOL.request(method, url, headers, body, timeout)
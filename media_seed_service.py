@@ -541,7 +541,7 @@ class JellyfinClient:
         }
         if api_key:
             self._headers["X-Emby-Token"] = api_key
-        self._transport = transport or _jellyfin_urllib_transport
+        self._transport = transport or _jellyfin_http_transport
 
     def list_libraries(self) -> list[dict[str, Any]]:
         libraries = self._request("GET", "/Library/VirtualFolders")
@@ -598,12 +598,12 @@ class JellyfinClient:
         return self._transport(method, f"{self._base_url}{normalized}", self._headers, body)
 
 
-def _jellyfin_urllib_transport(
+def _jellyfin_http_transport(
     method: str,
     url: str,
     headers: Mapping[str, str],
     body: bytes | None,
 ) -> Any:
-    from arr_client import urllib_transport
+    from arr_client import http_transport
 
-    return urllib_transport(method, url, headers, body)
+    return http_transport(method, url, headers, body)
@@ -0,0 +1,246 @@
+"""Metric threshold and trend signals for the alert daemon.
+
+The metric collector writes a sample every few minutes to ``MetricHistoryStore``.
+This monitor reads only the rollup buckets that closed since its last tick and
+folds each into constant-size state: a "above since" timestamp per sustained
+rule and running least-squares sums for the storage trend. Nothing is
+re-queried once the monitor has warmed up, so a tick costs one small SQLite
+read however long the windows are.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from alert_evaluator import Signal
+from metric_history import METRIC_COLUMNS, RANGES, MetricHistoryStore
+from overview_service import METRIC_RULES
+
+
+# The 24h chart bucket; it matches the collector's five-minute timer.
+BUCKET_SECONDS = RANGES["24h"]["bucket"]
+# A reading older than this is a stopped collector, not a healthy host.
+STALE_AFTER_BUCKETS = 3
+
+
+@dataclass(frozen=True)
+class SustainedRule:
+    name: str
+    column: str
+    threshold: float
+    sustain_seconds: int
+    severity: str
+    label: str
+    suffix: str
+
+
+@dataclass(frozen=True)
+class TrendRule:
+    name: str
+    column: str
+    limit: float
+    horizon_seconds: int
+    window_seconds: int
+    min_span_seconds: int
+    severity: str
+    label: str
+
+
+def _sustained(name: str, column: str, minutes: int, severity: str) -> SustainedRule:
+    # Page at the dashboard's critical line, but only once it has held.
+    _warning, critical, label, suffix = METRIC_RULES[name]
+    return SustainedRule(name, column, critical, minutes * 60, severity, label, suffix)
+
+
+DEFAULT_SUSTAINED_RULES = (
+    _sustained("cpu", "cpu_percent", 15, "warning"),
+    _sustained("memory", "memory_percent", 15, "warning"),
+    _sustained("temperature", "temperature_celsius", 10, "critical"),
+    _sustained("disk", "disk_percent", 10, "critical"),
+)
+DEFAULT_TREND_RULES = (
+    TrendRule(
+        name="disk_trend",
+        column="disk_percent",
+        limit=100.0,
+        horizon_seconds=24 * 60 * 60,
+        window_seconds=6 * 60 * 60,
+        min_span_seconds=60 * 60,
+        severity="warning",
+        label="Storage",
+    ),
+)
+
+
+class _SustainedState:
+    __slots__ = ("above_since", "last_at", "value")
+
+    def __init__(self) -> None:
+        self.above_since: int | None = None
+        self.last_at: int | None = None
+        self.value: float | None = None
+
+
+class _LinearFit:
+    """Least-squares line over a sliding window with O(1) add and evict.
+
+    Times are kept in hours from a moving origin so the sums stay small; the
+    origin is re-based (an O(window) pass) only once per window length.
+    """
+
+    def __init__(self, window_seconds: int) -> None:
+        self._window = window_seconds
+        self._points: deque[tuple[int, float]] = deque()
+        self._origin: int | None = None
+        self._n = 0
+        self._st = self._sv = self._stt = self._stv = 0.0
+
+    def add(self, at: int, value: float) -> None:
+        if self._origin is None or at - self._origin > 2 * self._window:
+            self._rebase(at)
+        self._points.append((at, value))
+        self._accumulate(at, value, 1)
+        while self._points and at - self._points[0][0] > self._window:
+            old_at, old_value = self._points.popleft()
+            self._accumulate(old_at, old_value, -1)
+
+    @property
+    def span_seconds(self) -> int:
+        return self._points[-1][0] - self._points[0][0] if self._points else 0
+
+    def slope_per_second(self) -> float | None:
+        denominator = self._n * self._stt - self._st * self._st
+        if self._n < 2 or denominator <= 1e-12:
+            return None
+        slope_per_hour = (self._n * self._stv - self._st * self._sv) / denominator
+        return slope_per_hour / 3600
+
+    def _accumulate(self, at: int, value: float, sign: int) -> None:
+        hours = (at - self._origin) / 3600
+        self._n += sign
+        self._st += sign * hours
+        self._sv += sign * value
+        self._stt += sign * hours * hours
+        self._stv += sign * hours * value
+
+    def _rebase(self, at: int) -> None:
+        self._origin = self._points[0][0] if self._points else at
+        self._n = 0
+        self._st = self._sv = self._stt = self._stv = 0.0
+        for point_at, value in self._points:
+            self._accumulate(point_at, value, 1)
+
+
+class MetricAlertMonitor:
+    """Turn closed metric rollups into sustained-threshold and trend signals."""
+
+    def __init__(
+        self,
+        store: MetricHistoryStore,
+        *,
+        sustained_rules: tuple[SustainedRule, ...] = DEFAULT_SUSTAINED_RULES,
+        trend_rules: tuple[TrendRule, ...] = DEFAULT_TREND_RULES,
+        bucket_seconds: int = BUCKET_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._store = store
+        self._sustained_rules = sustained_rules
+        self._trend_rules = trend_rules
+        self._bucket = max(1, int(bucket_seconds))
+        self._clock = clock
+        self._cursor: int | None = None
+        self._sustained = {rule.name: _SustainedState() for rule in sustained_rules}
+        self._fits = {rule.name: _LinearFit(rule.window_seconds) for rule in trend_rules}
+        self._latest: dict[str, tuple[int, float]] = {}
+        warmup = [rule.sustain_seconds for rule in sustained_rules]
+        warmup += [rule.window_seconds for rule in trend_rules]
+        self._warmup = max(warmup, default=0) + self._bucket
+
+    def signals(self) -> list[Signal]:
+        now = int(self._clock())
+        closed_until = now - now % self._bucket
+        if self._cursor is None:
+            # First tick: backfill the longest window once, then read increments.
+            self._cursor = closed_until - self._warmup
+        if closed_until > self._cursor:
+            for row in self._store.rollup(self._cursor, closed_until, self._bucket):
+                self._fold(int(row[0]), dict(zip(METRIC_COLUMNS, row[1:], strict=True)))
+            self._cursor = closed_until
+
+        fresh_after = closed_until - STALE_AFTER_BUCKETS * self._bucket
+        signals = []
+        for rule in self._sustained_rules:
+            signal = self._sustained_signal(rule, fresh_after)
+            if signal is not None:
+                signals.append(signal)
+        for rule in self._trend_rules:
+            signal = self._trend_signal(rule, fresh_after)
+            if signal is not None:
+                signals.append(signal)
+        return signals
+
+    # -- folding -------------------------------------------------------------
+    def _fold(self, bucket_at: int, values: dict) -> None:
+        for rule in self._sustained_rules:
+            value = values.get(rule.column)
+            if value is None:
+                continue
+            state = self._sustained[rule.name]
+            if state.last_at is not None and bucket_at - state.last_at > 2 * self._bucket:
+                state.above_since = None  # a gap in collection breaks the streak
+            if value >= rule.threshold:
+                if state.above_since is None:
+                    state.above_since = bucket_at
+            else:
+                state.above_since = None
+            state.last_at = bucket_at
+            state.value = value
+        for rule in self._trend_rules:
+            value = values.get(rule.column)
+            if value is None:
+                continue
+            self._fits[rule.name].add(bucket_at, value)
+            self._latest[rule.name] = (bucket_at, value)
+
+    # -- signals -------------------------------------------------------------
+    def _sustained_signal(self, rule: SustainedRule, fresh_after: int) -> Signal | None:
+        state = self._sustained[rule.name]
+        if state.last_at is None or state.last_at < fresh_after:
+            return None
+        key = f"metric:{rule.name}"
+        reading = f"{state.value:.1f}{rule.suffix}"
+        held = (
+            state.last_at + self._bucket - state.above_since
+            if state.above_since is not None
+            else 0
+        )
+        if held >= rule.sustain_seconds:
+            minutes = held // 60
+            summary = (
+                f"{rule.label} has been at or above {rule.threshold:g}{rule.suffix} "
+                f"for {minutes} min (now {reading})"
+            )
+            return Signal(key, False, summary, "metric", rule.severity)
+        return Signal(key, True, f"{rule.label} is {reading}", "metric", rule.severity)
+
+    def _trend_signal(self, rule: TrendRule, fresh_after: int) -> Signal | None:
+        latest = self._latest.get(rule.name)
+        fit = self._fits[rule.name]
+        if latest is None or latest[0] < fresh_after or fit.span_seconds < rule.min_span_seconds:
+            return None
+        key = f"metric:{rule.name}"
+        _at, value = latest
+        slope = fit.slope_per_second()
+        if slope is not None and slope > 0 and value < rule.limit:
+            seconds_left = (rule.limit - value) / slope
+            if seconds_left < rule.horizon_seconds:
+                hours = max(1, round(seconds_left / 3600))
+                summary = (
+                    f"{rule.label} is {value:.1f}% full and on course to fill "
+                    f"in about {hours}h"
+                )
+                return Signal(key, False, summary, "metric", rule.severity)
+        return Signal(key, True, f"{rule.label} is not filling quickly", "metric", rule.severity)
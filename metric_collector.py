@@ -6,6 +6,8 @@ import os
 import sys
 from pathlib import Path
 
+from disk_io_history import DiskIoHistoryStore
+from diskstats import is_whole_disk, read_diskstats
 from metric_history import MetricHistoryStore
 from pi_monitor import get_pi_metrics
 from runtime_paths import STATE_DIR
@@ -21,6 +23,9 @@ def collect_once(database_path: str | Path | None = None) -> None:
     )
     path = database_path or os.getenv("LIMEOS_METRICS_DB", str(STATE_DIR / "metrics.sqlite3"))
     MetricHistoryStore(path).record(service.stats())
+    DiskIoHistoryStore(path).record(
+        {name: counters for name, counters in read_diskstats().items() if is_whole_disk(name)}
+    )
 
 
 def main() -> int:
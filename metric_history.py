@@ -154,6 +154,17 @@ class MetricHistoryStore:
         response["summary"] = self._summaries(points)
         return response
 
+    def rollup(self, start: int, end: int, bucket_seconds: int) -> list[tuple]:
+        """Return ``(bucket_at, *METRIC_COLUMNS)`` averages for ``start <= t < end``.
+
+        Buckets are aligned to ``start``; empty buckets are omitted.
+        """
+        if end <= start or not self.database_path.is_file():
+            return []
+        bucket_seconds = max(1, int(bucket_seconds))
+        max_buckets = -(-(end - start) // bucket_seconds)
+        return self._aggregate(start, end - 1, bucket_seconds, max_buckets)
+
     def _aggregate(
         self,
         start: int,
@@ -1,19 +1,46 @@
-"""Process-scoped background operations with bounded replayable output."""
+"""Background operations with bounded replayable output.
+
+Each operation keeps its newest events in a ring bounded by count and bytes.
+With a spill directory, older events are appended to a per-operation gzip file
+in batches so replay from an early cursor still sees the whole log. With an
+``OperationStore`` as well, every event is flushed to that log within a few
+seconds and operations can be re-attached after the web process restarts.
+"""
 
 from __future__ import annotations
 
+import bisect
+import gzip
 import hmac
+import itertools
 import json
+import logging
+import os
 import threading
 import time
 import uuid
+import sqlite3
+import zlib
+from collections import deque
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Callable, Iterable
 
+from operation_store import STATUS_INTERRUPTED, owner_digest
+
 
 OPERATION_TTL_SECONDS = 15 * 60
 OPERATION_LIMIT = 100
 OPERATION_EVENT_LIMIT = 5000
+OPERATION_EVENT_BYTES_LIMIT = 512 * 1024
+SPILL_SUFFIX = ".events.gz"
+# Spilling trims a tenth of the ring at once so the file grows in whole batches.
+SPILL_BATCH_DIVISOR = 10
+# Durable operations lose at most this much output when the process dies.
+FLUSH_INTERVAL_SECONDS = 5
+INTERRUPTED_ERROR = "Operation interrupted by a restart"
+
+logger = logging.getLogger(__name__)
 
 OperationProducer = Callable[[], Iterable[dict]]
 OperationProducerFactory = Callable[[str], Iterable[dict]]
@@ -30,8 +57,15 @@ class OperationConflictError(RuntimeError):
 
 @dataclass(frozen=True)
 class OperationEvent:
+    """One event with its SSE wire frame, rendered once and shared by every subscriber."""
+
     event_id: int
     payload: dict
+    frame: str = ""
+
+    def __post_init__(self):
+        if not self.frame:
+            object.__setattr__(self, "frame", _sse_frame(self.event_id, self.payload))
 
 
 @dataclass(frozen=True)
@@ -53,37 +87,239 @@ class BackgroundOperation:
         target,
         created_at,
         conflict_key=None,
+        spill_path=None,
+        on_flush=None,
     ):
         self.operation_id = operation_id
         self.owner = owner
+        # Operations recovered after a restart only know a digest of their owner.
+        self.owner_digest = None
         self.username = username
         self.kind = kind
         self.target = target
         self.created_at = created_at
         self.conflict_key = conflict_key
-        self.events = []
+        self.events = deque()
+        self.event_bytes = 0
         self.first_event_id = 0
+        self.spill_path = spill_path
+        # (first event id, event count, file offset, member length) per gzip member.
+        self.spilled = []
+        # Events before ``written_event_id`` are in the spill file; those before
+        # ``persisted_event_id`` are also recorded in the journal.
+        self.written_event_id = 0
+        self.persisted_event_id = 0
+        self.on_flush = on_flush
+        self._unjournaled = []
+        self._journal_lock = threading.Lock()
+        self._flushed_at = time.monotonic()
         self.complete = False
+        self.discarded = False
         self.condition = threading.Condition()
 
-    def append(self, payload, event_limit):
+    def append(self, payload, event_limit, byte_limit=None):
+        flushed = False
         with self.condition:
-            self.events.append(payload)
-            if len(self.events) > event_limit:
-                self.events.pop(0)
-                self.first_event_id += 1
+            event = OperationEvent(
+                event_id=self.first_event_id + len(self.events), payload=payload
+            )
+            self.events.append(event)
+            self.event_bytes += len(event.frame)
+            if _over_limit(self, event_limit, byte_limit):
+                if self.spill_path is not None:
+                    event_limit -= max(1, event_limit // SPILL_BATCH_DIVISOR)
+                    if byte_limit is not None:
+                        byte_limit -= byte_limit // SPILL_BATCH_DIVISOR
+                self._evict_locked(event_limit, byte_limit)
+                flushed = True
             if payload.get("done") or payload.get("error"):
                 self.complete = True
+            if self.on_flush is not None and (
+                self.complete or time.monotonic() - self._flushed_at >= FLUSH_INTERVAL_SECONDS
+            ):
+                self._flush_locked()
+                flushed = True
             self.condition.notify_all()
+        if flushed:
+            self._journal()
 
     def finish(self):
         with self.condition:
-            self.events = [
-                {"expired": True} if payload.get("_ephemeral") else payload
-                for payload in self.events
-            ]
+            if self.on_flush is not None:
+                self._flush_locked()
+            self.events = deque(
+                _expired(event) if event.payload.get("_ephemeral") else event
+                for event in self.events
+            )
+            self.event_bytes = sum(len(event.frame) for event in self.events)
             self.complete = True
             self.condition.notify_all()
+        self._journal()
+
+    def read(self, cursor, wait_timeout=0):
+        """Return events from ``cursor`` on, spilled ones one gzip member at a time.
+
+        Spilled batches never report ``complete`` so callers keep reading forward.
+        """
+        waited = False
+        while True:
+            with self.condition:
+                member = self.spilled_member(cursor) if cursor < self.first_event_id else None
+                if member is None:
+                    cursor = max(cursor, self.first_event_id)
+                    end_cursor = self.first_event_id + len(self.events)
+                    if cursor >= end_cursor and not self.complete and wait_timeout and not waited:
+                        self.condition.wait(timeout=wait_timeout)
+                        waited = True
+                        continue
+                    events = tuple(
+                        itertools.islice(self.events, cursor - self.first_event_id, None)
+                    )
+                    return OperationEventBatch(
+                        events=events,
+                        next_cursor=cursor + len(events),
+                        complete=self.complete,
+                    )
+            first_event_id, count, offset, length = member
+            events = _read_spill(self.spill_path, first_event_id, offset, length)
+            if events is not None and len(events) == count:
+                return OperationEventBatch(
+                    events=tuple(events[max(0, cursor - first_event_id):]),
+                    next_cursor=first_event_id + count,
+                    complete=False,
+                )
+            cursor = first_event_id + count
+
+    def spilled_member(self, cursor):
+        """Return the spilled member holding ``cursor``, or the first one after it."""
+        index = bisect.bisect_right(
+            self.spilled, cursor, key=lambda member: member[0] + member[1]
+        )
+        return self.spilled[index] if index < len(self.spilled) else None
+
+    def discard(self):
+        with self.condition:
+            self.discarded = True
+            self.spilled = []
+            if self.spill_path is not None:
+                try:
+                    self.spill_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+            self.condition.notify_all()
+
+    def _evict_locked(self, event_limit, byte_limit):
+        if self.on_flush is not None:
+            self._flush_locked()
+        evicted = []
+        while _over_limit(self, event_limit, byte_limit):
+            event = self.events.popleft()
+            self.event_bytes -= len(event.frame)
+            evicted.append(event)
+        unwritten = [event for event in evicted if event.event_id >= self.written_event_id]
+        if unwritten and self.spill_path is not None:
+            self._spill_locked(unwritten)
+        self.first_event_id += len(evicted)
+
+    def _flush_locked(self):
+        self._flushed_at = time.monotonic()
+        pending = list(
+            itertools.islice(
+                self.events, max(0, self.written_event_id - self.first_event_id), None
+            )
+        )
+        if pending:
+            self._spill_locked(pending)
+
+    def _spill_locked(self, events):
+        # Secrets marked ephemeral never reach the disk.
+        frames = "".join(
+            (_expired(event) if event.payload.get("_ephemeral") else event).frame
+            for event in events
+        )
+        compressed = gzip.compress(frames.encode(), compresslevel=6)
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            descriptor = os.open(
+                self.spill_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600
+            )
+            with os.fdopen(descriptor, "wb") as spill:
+                offset = spill.seek(0, os.SEEK_END)
+                spill.write(compressed)
+        except OSError as exc:
+            logger.warning(
+                "Dropping %d events of operation %s: %s",
+                len(events),
+                self.operation_id,
+                exc,
+            )
+            return
+        member = (events[0].event_id, len(events), offset, len(compressed))
+        self.spilled.append(member)
+        self.written_event_id = events[-1].event_id + 1
+        if self.on_flush is None:
+            self.persisted_event_id = self.written_event_id
+            return
+        progress = next(
+            (
+                event.payload
+                for event in reversed(events)
+                if not event.payload.get("_ephemeral")
+            ),
+            None,
+        )
+        self._unjournaled.append((member, progress))
+
+    def _journal(self):
+        """Record written members through ``on_flush`` without holding the condition.
+
+        Members whose record fails stay queued and are retried on the next flush.
+        """
+        if self.on_flush is None:
+            return
+        with self._journal_lock:
+            with self.condition:
+                pending, self._unjournaled = self._unjournaled, []
+            for index, (member, progress) in enumerate(pending):
+                if not self.on_flush(self, member, progress):
+                    with self.condition:
+                        self._unjournaled[:0] = pending[index:]
+                    return
+                with self.condition:
+                    self.persisted_event_id = member[0] + member[1]
+
+
+class OperationSubscription:
+    """One reader's cursor into an operation's shared event buffer.
+
+    Ownership is checked once at subscribe time; afterwards the reader only
+    waits on the operation's condition. A reader that falls behind the
+    in-memory ring after catching up is dropped so it can reconnect with
+    ``Last-Event-ID`` and replay from the spill file instead.
+    """
+
+    def __init__(self, operation, cursor):
+        self._operation = operation
+        self.cursor = cursor
+        self._caught_up = False
+        self.dropped = False
+
+    def next_batch(self, wait_timeout=0):
+        """Return the next batch, or ``None`` once the operation is gone or the reader lags."""
+        operation = self._operation
+        with operation.condition:
+            if operation.discarded:
+                return None
+            if self._caught_up and self.cursor < operation.first_event_id:
+                self.dropped = True
+                return None
+        batch = operation.read(self.cursor, wait_timeout)
+        if operation.discarded:
+            return None
+        self.cursor = batch.next_cursor
+        with operation.condition:
+            self._caught_up = self._caught_up or self.cursor >= operation.first_event_id
+        return batch
 
 
 class OperationRegistry:
@@ -91,7 +327,8 @@ class OperationRegistry:
 
     Injection makes lifecycle ownership explicit; it does not make this registry safe to share
     across worker processes. Deploy one application worker until operation state has a shared-store
-    design.
+    design. A ``store`` only journals operations so the next process can recover them: running
+    ones come back as interrupted with their last recorded progress.
     """
 
     def __init__(
@@ -102,14 +339,23 @@ class OperationRegistry:
         ttl_seconds=OPERATION_TTL_SECONDS,
         operation_limit=OPERATION_LIMIT,
         event_limit=OPERATION_EVENT_LIMIT,
+        byte_limit=OPERATION_EVENT_BYTES_LIMIT,
+        spill_dir=None,
+        store=None,
     ):
+        if store is not None and spill_dir is None:
+            raise ValueError("A durable operation store needs a spill directory")
         self._clock = clock
         self._thread_factory = thread_factory
         self._ttl_seconds = ttl_seconds
         self._operation_limit = operation_limit
         self._event_limit = event_limit
+        self._byte_limit = byte_limit
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._store = store
         self._operations = {}
         self._lock = threading.Lock()
+        self._clear_stale_spills(self._recover())
 
     def create(
         self,
@@ -135,6 +381,12 @@ class OperationRegistry:
             target=target,
             created_at=self._clock(),
             conflict_key=conflict_key,
+            spill_path=(
+                self._spill_dir / f"{operation_id}{SPILL_SUFFIX}"
+                if self._spill_dir is not None
+                else None
+            ),
+            on_flush=self._record_flush if self._store is not None else None,
         )
         with self._lock:
             self._prune_locked()
@@ -151,10 +403,11 @@ class OperationRegistry:
                 )
                 if oldest_complete is None:
                     raise OperationCapacityError("Too many background operations")
-                self._operations.pop(oldest_complete.operation_id, None)
+                self._discard_locked(oldest_complete.operation_id)
             self._operations[operation_id] = operation
 
         try:
+            self._persist("start", operation)
             resolved_producer = (
                 producer
                 if producer_factory is None
@@ -171,20 +424,12 @@ class OperationRegistry:
             thread.start()
         except Exception:
             with self._lock:
-                self._operations.pop(operation_id, None)
+                self._discard_locked(operation_id)
             raise
         return operation
 
     def is_owner(self, operation_id, *, expected_kind, owner):
-        with self._lock:
-            self._prune_locked()
-            operation = self._operations.get(operation_id)
-        return bool(
-            operation
-            and _kind_matches(operation.kind, expected_kind)
-            and isinstance(owner, str)
-            and hmac.compare_digest(operation.owner, owner)
-        )
+        return self._owned(operation_id, expected_kind, owner) is not None
 
     def events_since(
         self,
@@ -195,37 +440,22 @@ class OperationRegistry:
         cursor=0,
         wait_timeout=0,
     ):
-        """Return retained events at or after the next-event cursor for an owner."""
-        with self._lock:
-            self._prune_locked()
-            operation = self._operations.get(operation_id)
-        if not (
-            operation
-            and _kind_matches(operation.kind, expected_kind)
-            and isinstance(owner, str)
-            and hmac.compare_digest(operation.owner, owner)
-        ):
+        """Return retained events at or after the next-event cursor for an owner.
+
+        A cursor behind the in-memory ring is served one spilled batch at a time;
+        those batches never report ``complete`` so callers keep reading forward.
+        """
+        operation = self._owned(operation_id, expected_kind, owner)
+        if operation is None:
             return None
+        return operation.read(cursor, wait_timeout)
 
-        with operation.condition:
-            cursor = max(cursor, operation.first_event_id)
-            end_cursor = operation.first_event_id + len(operation.events)
-            if cursor >= end_cursor and not operation.complete and wait_timeout:
-                operation.condition.wait(timeout=wait_timeout)
-                cursor = max(cursor, operation.first_event_id)
-                end_cursor = operation.first_event_id + len(operation.events)
-
-            offset = cursor - operation.first_event_id
-            payloads = tuple(operation.events[offset:])
-            events = tuple(
-                OperationEvent(event_id=cursor + index, payload=payload)
-                for index, payload in enumerate(payloads)
-            )
-            return OperationEventBatch(
-                events=events,
-                next_cursor=cursor + len(events),
-                complete=operation.complete,
-            )
+    def subscribe(self, operation_id, *, expected_kind, owner, cursor=0):
+        """Return a subscription for an owner starting at the next-event cursor."""
+        operation = self._owned(operation_id, expected_kind, owner)
+        if operation is None:
+            return None
+        return OperationSubscription(operation, cursor)
 
     def _run(self, operation, producer):
         terminal_event = False
@@ -233,7 +463,7 @@ class OperationRegistry:
             for payload in producer():
                 if not isinstance(payload, dict):
                     continue
-                operation.append(payload, self._event_limit)
+                operation.append(payload, self._event_limit, self._byte_limit)
                 terminal_event = terminal_event or bool(
                     payload.get("done") or payload.get("error")
                 )
@@ -244,15 +474,21 @@ class OperationRegistry:
                 error = "Integration lifecycle operation failed"
             else:
                 error = str(exc)
-            operation.append({"error": error}, self._event_limit)
+            operation.append({"error": error}, self._event_limit, self._byte_limit)
             terminal_event = True
         finally:
             if not terminal_event:
                 operation.append(
                     {"error": "Operation ended without a result"},
                     self._event_limit,
+                    self._byte_limit,
                 )
             operation.finish()
+            self._persist(
+                "finish",
+                operation.operation_id,
+                operation.first_event_id + len(operation.events),
+            )
 
     def _prune_locked(self):
         cutoff = self._clock() - self._ttl_seconds
@@ -262,7 +498,7 @@ class OperationRegistry:
             if operation.complete and operation.created_at < cutoff
         ]
         for operation_id in expired:
-            self._operations.pop(operation_id, None)
+            self._discard_locked(operation_id)
         if len(self._operations) > self._operation_limit:
             oldest = sorted(
                 (operation for operation in self._operations.values() if operation.complete),
@@ -270,7 +506,96 @@ class OperationRegistry:
             )
             excess = len(self._operations) - self._operation_limit
             for operation in oldest[:excess]:
-                self._operations.pop(operation.operation_id, None)
+                self._discard_locked(operation.operation_id)
+
+    def _owned(self, operation_id, expected_kind, owner):
+        with self._lock:
+            self._prune_locked()
+            operation = self._operations.get(operation_id)
+        if not (operation and _kind_matches(operation.kind, expected_kind)):
+            return None
+        if not isinstance(owner, str):
+            return None
+        if operation.owner is None:
+            matched = hmac.compare_digest(operation.owner_digest, owner_digest(owner))
+        else:
+            matched = hmac.compare_digest(operation.owner, owner)
+        return operation if matched else None
+
+    def _discard_locked(self, operation_id):
+        operation = self._operations.pop(operation_id, None)
+        if operation is not None:
+            operation.discard()
+            self._persist("delete", operation_id)
+
+    def _record_flush(self, operation, member, progress):
+        return self._persist("record_flush", operation.operation_id, member, progress)
+
+    def _persist(self, method, *args):
+        """Call ``method`` on the store; return whether it was journaled."""
+        if self._store is None:
+            return False
+        try:
+            getattr(self._store, method)(*args)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Could not journal background operation: %s", exc)
+            return False
+        return True
+
+    def _recover(self):
+        if self._store is None:
+            return set()
+        try:
+            rows = self._store.recover(
+                max_age=self._ttl_seconds, limit=self._operation_limit
+            )
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Could not recover background operations: %s", exc)
+            return set()
+        for row in rows:
+            operation = BackgroundOperation(
+                operation_id=row["operation_id"],
+                owner=None,
+                username=row["username"],
+                kind=row["kind"],
+                target=row["target"],
+                created_at=self._clock(),
+                spill_path=self._spill_dir / f"{row['operation_id']}{SPILL_SUFFIX}",
+            )
+            operation.owner_digest = row["owner_digest"]
+            operation.spilled = row["members"]
+            operation.first_event_id = row["event_count"]
+            operation.written_event_id = operation.persisted_event_id = row["event_count"]
+            operation.complete = True
+            if row["status"] == STATUS_INTERRUPTED:
+                operation.events.append(
+                    OperationEvent(
+                        event_id=row["event_count"],
+                        payload={
+                            "error": INTERRUPTED_ERROR,
+                            "interrupted": True,
+                            "last_progress": row["progress"],
+                        },
+                    )
+                )
+            self._operations[operation.operation_id] = operation
+        return set(self._operations)
+
+    def _clear_stale_spills(self, keep):
+        # Logs of operations that were not recovered belong to no one.
+        if self._spill_dir is None:
+            return
+        try:
+            stale = list(self._spill_dir.glob(f"*{SPILL_SUFFIX}"))
+        except OSError:
+            return
+        for path in stale:
+            if path.name.removesuffix(SPILL_SUFFIX) in keep:
+                continue
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
 
 
 def parse_sse_payload(frame):
@@ -286,6 +611,47 @@ def parse_sse_payload(frame):
     return None
 
 
+def _sse_frame(event_id, payload):
+    data = {key: value for key, value in payload.items() if key != "_ephemeral"}
+    return f"id: {event_id}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _expired(event):
+    return OperationEvent(event_id=event.event_id, payload={"expired": True})
+
+
+def _over_limit(operation, event_limit, byte_limit):
+    if len(operation.events) > event_limit:
+        return True
+    return (
+        byte_limit is not None
+        and operation.event_bytes > byte_limit
+        and len(operation.events) > 1
+    )
+
+
+def _read_spill(path, first_event_id, offset, length):
+    try:
+        with open(path, "rb") as spill:
+            spill.seek(offset)
+            frames = gzip.decompress(spill.read(length)).decode()
+    except (OSError, EOFError, ValueError, zlib.error):
+        return None
+    events = []
+    for index, frame in enumerate(frames.split("\n\n")[:-1]):
+        payload = parse_sse_payload(frame)
+        if payload is None:
+            return None
+        events.append(
+            OperationEvent(
+                event_id=first_event_id + index,
+                payload=payload,
+                frame=frame + "\n\n",
+            )
+        )
+    return events
+
+
 def _kind_matches(actual, expected):
     if isinstance(expected, (tuple, list, frozenset)):
         return actual in expected
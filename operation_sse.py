@@ -1,47 +1,38 @@
 """Flask transport adapter for replayable background-operation events."""
 
-import json
-
 from flask import Response, jsonify, request, session
 
 
 def stream_operation_response(registry, operation_id, expected_kind):
-    """Stream one session-owned operation as SSE with replay support."""
-    owner = session.get("csrf_token")
-    if not registry.is_owner(
-        operation_id,
-        expected_kind=expected_kind,
-        owner=owner,
-    ):
-        return jsonify({"error": "Operation not found"}), 404
+    """Stream one session-owned operation as SSE with replay support.
 
+    Frames are rendered once when the event is recorded, so each watcher only
+    advances a cursor and writes shared strings.
+    """
     try:
         cursor = int(request.headers.get("Last-Event-ID", "-1")) + 1
     except ValueError:
         cursor = 0
     cursor = max(0, cursor)
 
+    subscription = registry.subscribe(
+        operation_id,
+        expected_kind=expected_kind,
+        owner=session.get("csrf_token"),
+        cursor=cursor,
+    )
+    if subscription is None:
+        return jsonify({"error": "Operation not found"}), 404
+
     def generate():
-        nonlocal cursor
         while True:
-            batch = registry.events_since(
-                operation_id,
-                expected_kind=expected_kind,
-                owner=owner,
-                cursor=cursor,
-                wait_timeout=15,
-            )
+            batch = subscription.next_batch(wait_timeout=15)
             if batch is None:
                 break
             if not batch.events and not batch.complete:
                 yield ": keep-alive\n\n"
                 continue
-            for event in batch.events:
-                payload = {
-                    key: value for key, value in event.payload.items() if key != "_ephemeral"
-                }
-                yield f"id: {event.event_id}\ndata: {json.dumps(payload)}\n\n"
-            cursor = batch.next_cursor
+            yield "".join(event.frame for event in batch.events)
             if batch.complete:
                 break
 
@@ -0,0 +1,232 @@
+"""SQLite journal that lets background operations outlive the web process.
+
+Event frames stay in each operation's append-only gzip log; this journal keeps
+the operation metadata, where each log member starts, and the last progress
+payload so a restarted process can re-attach clients or report an interruption.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+
+BUSY_TIMEOUT_MS = 5000
+STATUS_RUNNING = "running"
+STATUS_COMPLETE = "complete"
+STATUS_INTERRUPTED = "interrupted"
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS operations (
+        operation_id TEXT PRIMARY KEY,
+        owner_digest TEXT NOT NULL,
+        username TEXT,
+        kind TEXT NOT NULL,
+        target TEXT,
+        created_at REAL NOT NULL,
+        updated_at REAL NOT NULL,
+        status TEXT NOT NULL,
+        event_count INTEGER NOT NULL DEFAULT 0,
+        progress TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS operation_log (
+        operation_id TEXT NOT NULL,
+        first_event_id INTEGER NOT NULL,
+        event_count INTEGER NOT NULL,
+        file_offset INTEGER NOT NULL,
+        length INTEGER NOT NULL,
+        PRIMARY KEY (operation_id, first_event_id)
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def owner_digest(owner: str) -> str:
+    """Hash a session owner token so the raw token never reaches the disk."""
+    return hashlib.sha256(owner.encode()).hexdigest()
+
+
+class OperationStore:
+    """Persist operation metadata and log offsets with bounded retention."""
+
+    def __init__(
+        self,
+        database_path: str | Path,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.database_path = Path(database_path)
+        self._clock = clock
+        # Tables are created by the first write or recovery, not on every flush.
+        self._schema_ready = False
+
+    def start(self, operation) -> None:
+        """Record a newly started operation as running."""
+        now = self._clock()
+        self._write(
+            """
+            INSERT OR REPLACE INTO operations (
+                operation_id, owner_digest, username, kind, target,
+                created_at, updated_at, status, event_count
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
+            """,
+            (
+                operation.operation_id,
+                owner_digest(operation.owner),
+                operation.username,
+                operation.kind,
+                str(operation.target),
+                now,
+                now,
+                STATUS_RUNNING,
+            ),
+        )
+
+    def record_flush(self, operation_id: str, member: tuple, progress: dict | None) -> None:
+        """Record one appended log member and the newest progress payload."""
+        first_event_id, count, offset, length = member
+        self._write(
+            """
+            INSERT OR REPLACE INTO operation_log (
+                operation_id, first_event_id, event_count, file_offset, length
+            ) VALUES (?, ?, ?, ?, ?)
+            """,
+            (operation_id, first_event_id, count, offset, length),
+            """
+            UPDATE operations
+            SET updated_at = ?, event_count = ?, progress = COALESCE(?, progress)
+            WHERE operation_id = ?
+            """,
+            (
+                self._clock(),
+                first_event_id + count,
+                json.dumps(progress, default=str) if progress is not None else None,
+                operation_id,
+            ),
+        )
+
+    def finish(self, operation_id: str, event_count: int) -> None:
+        self._write(
+            """
+            UPDATE operations SET updated_at = ?, status = ?, event_count = ?
+            WHERE operation_id = ?
+            """,
+            (self._clock(), STATUS_COMPLETE, event_count, operation_id),
+        )
+
+    def delete(self, operation_id: str) -> None:
+        self._write(
+            "DELETE FROM operation_log WHERE operation_id = ?",
+            (operation_id,),
+            "DELETE FROM operations WHERE operation_id = ?",
+            (operation_id,),
+        )
+
+    def recover(self, *, max_age: float, limit: int) -> list[dict]:
+        """Mark operations left running as interrupted and return the retained ones.
+
+        Operations last updated more than ``max_age`` seconds ago, or beyond the
+        newest ``limit``, are deleted. Each returned row carries its log members.
+        """
+        if not self.database_path.is_file():
+            return []
+        now = self._clock()
+        connection = self._connect()
+        try:
+            self._create_schema(connection)
+            with connection:
+                connection.execute(
+                    "UPDATE operations SET status = ?, updated_at = ? WHERE status = ?",
+                    (STATUS_INTERRUPTED, now, STATUS_RUNNING),
+                )
+                connection.execute(
+                    """
+                    DELETE FROM operations
+                    WHERE updated_at < ? OR operation_id NOT IN (
+                        SELECT operation_id FROM operations
+                        ORDER BY created_at DESC LIMIT ?
+                    )
+                    """,
+                    (now - max_age, limit),
+                )
+                connection.execute(
+                    """
+                    DELETE FROM operation_log WHERE operation_id NOT IN (
+                        SELECT operation_id FROM operations
+                    )
+                    """
+                )
+            rows = connection.execute(
+                """
+                SELECT operation_id, owner_digest, username, kind, target,
+                       status, event_count, progress
+                FROM operations
+                ORDER BY created_at ASC
+                """
+            ).fetchall()
+            members = {}
+            for operation_id, *member in connection.execute(
+                """
+                SELECT operation_id, first_event_id, event_count, file_offset, length
+                FROM operation_log
+                ORDER BY operation_id, first_event_id
+                """
+            ):
+                members.setdefault(operation_id, []).append(tuple(member))
+        finally:
+            connection.close()
+        return [
+            {
+                "operation_id": row[0],
+                "owner_digest": row[1],
+                "username": row[2],
+                "kind": row[3],
+                "target": row[4],
+                "status": row[5],
+                "event_count": row[6],
+                "progress": _load_progress(row[7]),
+                "members": members.get(row[0], []),
+            }
+            for row in rows
+        ]
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.database_path, timeout=BUSY_TIMEOUT_MS / 1000)
+        connection.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        return connection
+
+    def _create_schema(self, connection: sqlite3.Connection) -> None:
+        if self._schema_ready:
+            return
+        with connection:
+            for statement in SCHEMA:
+                connection.execute(statement)
+        self._schema_ready = True
+
+    def _write(self, *statements) -> None:
+        if not self._schema_ready:
+            self.database_path.parent.mkdir(parents=True, exist_ok=True, mode=0o750)
+        connection = self._connect()
+        try:
+            self._create_schema(connection)
+            with connection:
+                for sql, params in zip(statements[::2], statements[1::2], strict=True):
+                    connection.execute(sql, params)
+        finally:
+            connection.close()
+
+
+def _load_progress(value):
+    if value is None:
+        return None
+    try:
+        progress = json.loads(value)
+    except ValueError:
+        return None
+    return progress if isinstance(progress, dict) else None
@@ -22,17 +22,21 @@ import socket
 import subprocess
 import re
 import logging
+import mmap
+import random
 import signal
 import shutil
 import stat
 import struct
 import threading
 import tempfile
+import time
 from datetime import datetime, timezone
 from typing import Optional
 import urllib.request
 import urllib.error
 import shlex
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
 from helper_templates import (
     cron_to_oncalendar,
     render_package_reconcile_service,
@@ -41,6 +45,21 @@ from helper_templates import (
     render_startup_files,
 )
 from fstab_presets import get_fstab_preset, normalize_fstype
+from backup_index import (
+    BackupIndexError,
+    FrameWriter,
+    MemberStream,
+    TarIndexer,
+    build_index,
+    file_digest,
+    index_path,
+    load_index,
+    metadata_path,
+    select_entries,
+    write_index,
+    write_metadata,
+)
+from chunk_store import ChunkStore, ChunkStoreError, excluded
 from agent_provider.provisioning import (
     ACTION_AUDIT_PATH,
     ACTION_BROKER_POLICY_PATH,
@@ -131,6 +150,22 @@ BACKUP_SOURCE_ALLOWED = (
     '/var/lib/limeos/',
     '/var/log/limeos/',
 )
+# Deduplicated snapshots live in one chunk store beside the tar archives.
+CHUNK_STORE_DIR = 'pi-health-chunks'
+SNAPSHOT_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9._-]{0,127}$')
+BACKUP_JOB_EVENT_LIMIT = 200
+BACKUP_JOB_POLL_LIMIT = 50
+BACKUP_JOB_PROGRESS_INTERVAL = 1.0
+BACKUP_JOBS_KEPT = 8
+BACKUP_TIMEOUT_SECONDS = 3600
+BACKUP_PIPE_CHUNK = 1024 * 1024
+# Backups yield CPU and disk time to streaming: nice 10 and the lowest
+# best-effort I/O class (idle can starve outright on a busy media disk).
+BACKUP_NICE = 10
+BACKUP_IONICE_ARGS = ('-c', '2', '-n', '7')
+BACKUP_COMPRESSION_LEVELS = {'zst': (1, 19), 'gz': (1, 9)}
+BACKUP_MAX_THREADS = 16
+BACKUP_RESTORE_PATHS_MAX = 256
 SEEDBOX_MOUNT_POINT = '/mnt/seedbox'
 SEEDBOX_PASSFILE = '/etc/sshfs/seedbox.pass'
 SEEDBOX_MOUNT_UNIT = 'mnt-seedbox.mount'
@@ -827,39 +862,171 @@ def cmd_umount(params):
     return {'success': False, 'error': result.get('stderr', result.get('error', 'Unmount failed'))}
 
 
-def cmd_smart_info(params):
-    """Get full SMART info for a device (with USB drive support)."""
-    device = params.get('device', '')
-    use_sat = params.get('use_sat', False)
+# SMART health moves on a scale of days; re-reading a drive more often than this
+# only costs time and, on a sleeping disk, a spin-up.
+SMART_REFRESH_SECONDS = 600
+# Drives are read a few at a time so one USB hub is not saturated.
+SMART_MAX_WORKERS = 3
+SMART_MAX_WORKERS_LIMIT = 8
+SMART_DEVICE_TIMEOUT = 20
+# Answer before helper_call's default 30 s socket deadline gives up on us;
+# whatever has not finished by then is reported as timed out.
+SMART_BATCH_DEADLINE_SECONDS = 25
+SMART_STANDBY_PATTERN = re.compile(r'device is in (standby|sleep)', re.IGNORECASE)
 
-    if not device or not DEVICE_PATTERN.match(device):
-        return {'success': False, 'error': 'Invalid device path'}
 
-    # Check if smartctl is available
-    result = run_command(['which', 'smartctl'])
-    if result.get('returncode') != 0:
-        return {'success': False, 'error': 'smartctl not installed'}
+class SmartCollector:
+    """Per-device SMART cache that never wakes a spun-down drive.
 
-    # Build command - use -a for full attributes, -j for JSON
-    cmd = ['smartctl', '-a', '-j']
-    if use_sat:
-        cmd.extend(['-d', 'sat'])
-    cmd.append(device)
+    Routine reads run ``smartctl -n standby`` so a sleeping disk answers from
+    its last full report plus its power state instead of spinning up. Each
+    device is re-checked at most once per refresh interval, and whether it
+    needs ``-d sat`` (USB bridges) is remembered after the first success.
+    """
 
-    result = run_command(cmd)
-    # smartctl returns various codes, but if we have stdout try to parse it
-    if result.get('stdout'):
+    def __init__(self, *, runner=None, which=shutil.which, clock=None):
+        self._runner = runner or (lambda cmd, timeout: run_command(cmd, timeout=timeout))
+        self._which = which
+        self._clock = clock or (lambda: datetime.now(timezone.utc).timestamp())
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._device_locks = {}
+        self._smartctl = None
+
+    def smartctl(self):
+        """Resolve smartctl once; a missing binary is re-checked on the next call."""
+        if self._smartctl is None:
+            self._smartctl = self._which('smartctl')
+        return self._smartctl
+
+    def read(
+        self,
+        device,
+        *,
+        use_sat=None,
+        wake=False,
+        max_age_seconds=SMART_REFRESH_SECONDS,
+        timeout=SMART_DEVICE_TIMEOUT,
+    ):
+        """Return one device's report as ``{'success', 'data', 'power_state', ...}``."""
+        binary = self.smartctl()
+        if not binary:
+            return {'success': False, 'error': 'smartctl not installed'}
+
+        # One smartctl per device at a time: a second caller waits for the
+        # first read instead of queueing another command on the same drive.
+        with self._lock:
+            device_lock = self._device_locks.setdefault(device, threading.Lock())
+        if not device_lock.acquire(timeout=timeout):
+            return {'success': False, 'error': 'SMART read already in progress'}
         try:
-            data = json.loads(result['stdout'])
-            return {'success': True, 'data': data}
-        except json.JSONDecodeError:
-            pass
+            return self._read_locked(device, binary, use_sat, wake, max_age_seconds, timeout)
+        finally:
+            device_lock.release()
+
+    def _read_locked(self, device, binary, use_sat, wake, max_age_seconds, timeout):
+        now = self._clock()
+        with self._lock:
+            entry = dict(self._entries.get(device) or {})
+        checked_at = entry.get('checked_at')
+        if (
+            not wake
+            and use_sat is None
+            and checked_at is not None
+            and now - checked_at < max(0, max_age_seconds)
+        ):
+            return self._result(device, entry, cached=True)
+
+        transports = [use_sat] if use_sat is not None else (
+            [entry['use_sat']] if 'use_sat' in entry else [False, True]
+        )
+        error = 'smartctl failed'
+        for sat in transports:
+            cmd = [binary, '-a', '-j']
+            if not wake:
+                cmd.extend(['-n', 'standby'])
+            if sat:
+                cmd.extend(['-d', 'sat'])
+            cmd.append(device)
+            result = self._runner(cmd, timeout)
+            stdout = result.get('stdout') or ''
+
+            if not wake and SMART_STANDBY_PATTERN.search(stdout + (result.get('stderr') or '')):
+                entry.update({'checked_at': now, 'power_state': 'standby'})
+                self._store(device, entry)
+                return self._result(device, entry, cached=True)
+
+            data = None
+            if stdout:
+                try:
+                    data = json.loads(stdout)
+                except json.JSONDecodeError:
+                    data = None
+            # smartctl sets bit 2 (4) for "some SMART command failed" yet still
+            # reports; anything else without JSON means this transport is wrong.
+            if isinstance(data, dict) and (data.get('device') or result.get('returncode') in (0, 4)):
+                entry.update({
+                    'checked_at': now,
+                    'read_at': now,
+                    'data': data,
+                    'use_sat': bool(sat),
+                    'power_state': 'active',
+                })
+                self._store(device, entry)
+                return self._result(device, entry, cached=False)
+            error = result.get('stderr') or result.get('error') or error
+        return {'success': False, 'error': error}
+
+    def forget(self, device=None):
+        with self._lock:
+            if device is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(device, None)
+
+    def _store(self, device, entry):
+        with self._lock:
+            self._entries[device] = entry
+
+    def _result(self, device, entry, *, cached):
+        read_at = entry.get('read_at')
+        result = {
+            'success': True,
+            'data': entry.get('data'),
+            'power_state': entry.get('power_state', 'unknown'),
+            'cached': cached,
+            'read_at': (
+                datetime.fromtimestamp(read_at, tz=timezone.utc).isoformat().replace('+00:00', 'Z')
+                if read_at is not None
+                else None
+            ),
+        }
+        if entry.get('data') is None:
+            result['error'] = (
+                f'{device} is in standby; SMART data will be read once it spins up'
+            )
+        return result
+
+
+SMART_COLLECTOR = SmartCollector()
+
+
+def cmd_smart_info(params):
+    """Get full SMART info for a device (with USB drive support).
+
+    An explicit read is allowed to wake the drive: someone asked for it.
+    """
+    device = params.get('device', '')
+    use_sat = params.get('use_sat', False)
 
-    # If no SAT and failed, retry with SAT for USB drives
-    if not use_sat and result.get('returncode') not in [0, 4]:
-        return cmd_smart_info({'device': device, 'use_sat': True})
+    if not device or not DEVICE_PATTERN.match(device):
+        return {'success': False, 'error': 'Invalid device path'}
 
-    return {'success': False, 'error': result.get('stderr', 'smartctl failed')}
+    # use_sat=False means "let the collector pick", which retries with SAT.
+    result = SMART_COLLECTOR.read(device, use_sat=True if use_sat else None, wake=True)
+    if not result.get('success'):
+        return result
+    return {'success': True, 'data': result['data']}
 
 
 def cmd_smart_test(params):
@@ -875,8 +1042,7 @@ def cmd_smart_test(params):
         return {'success': False, 'error': 'Invalid test type. Use: short, long, or conveyance'}
 
     # Check if smartctl is available
-    result = run_command(['which', 'smartctl'])
-    if result.get('returncode') != 0:
+    if not SMART_COLLECTOR.smartctl():
         return {'success': False, 'error': 'smartctl not installed'}
 
     # Build command
@@ -896,8 +1062,46 @@ def cmd_smart_test(params):
     return {'success': False, 'error': result.get('stderr', 'Failed to start test')}
 
 
+def _smart_all_devices_entry(device, smart_result):
+    entry = {'device': device}
+    if smart_result.get('success'):
+        entry.update({
+            'data': smart_result.get('data'),
+            'power_state': smart_result.get('power_state'),
+            'cached': smart_result.get('cached'),
+            'read_at': smart_result.get('read_at'),
+        })
+        if smart_result.get('error'):
+            entry['error'] = smart_result['error']
+    else:
+        entry['error'] = smart_result.get('error')
+    return entry
+
+
 def cmd_smart_all_devices(params):
-    """Get SMART info for all disk devices."""
+    """Get SMART info for all disk devices without waking sleeping ones.
+
+    Devices are read concurrently, ``max_workers`` at a time, each with its own
+    ``timeout_seconds``. A device still running when the batch deadline
+    passes is reported as timed out so the others are not held back.
+    """
+    max_age = params.get('max_age_seconds', SMART_REFRESH_SECONDS)
+    if isinstance(max_age, bool) or not isinstance(max_age, (int, float)) or max_age < 0:
+        return {'success': False, 'error': 'max_age_seconds must be a non-negative number'}
+    max_workers = params.get('max_workers', SMART_MAX_WORKERS)
+    if (
+        isinstance(max_workers, bool)
+        or not isinstance(max_workers, int)
+        or not 1 <= max_workers <= SMART_MAX_WORKERS_LIMIT
+    ):
+        return {
+            'success': False,
+            'error': f'max_workers must be between 1 and {SMART_MAX_WORKERS_LIMIT}',
+        }
+    timeout = params.get('timeout_seconds', SMART_DEVICE_TIMEOUT)
+    if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or not 0 < timeout <= 120:
+        return {'success': False, 'error': 'timeout_seconds must be between 0 and 120'}
+
     # Get list of block devices
     result = run_command(['lsblk', '-d', '-n', '-o', 'NAME,TYPE'])
     if result.get('returncode') != 0:
@@ -910,29 +1114,39 @@ def cmd_smart_all_devices(params):
         parts = line.split()
         if len(parts) >= 2 and parts[1] == 'disk':
             devices.append(f"/dev/{parts[0]}")
+    if not devices:
+        return {'success': True, 'devices': []}
+
+    workers = min(max_workers, len(devices))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='smart')
+    try:
+        futures = [
+            pool.submit(SMART_COLLECTOR.read, device, max_age_seconds=max_age, timeout=timeout)
+            for device in devices
+        ]
+        futures_wait(futures, timeout=SMART_BATCH_DEADLINE_SECONDS)
+    finally:
+        # A smartctl stuck in the kernel cannot be joined; leave it behind.
+        pool.shutdown(wait=False, cancel_futures=True)
 
-    # Get SMART info for each device
     results = []
-    for device in devices:
-        smart_result = cmd_smart_info({'device': device})
-        if smart_result.get('success'):
-            results.append({
-                'device': device,
-                'data': smart_result.get('data')
-            })
-        else:
-            results.append({
-                'device': device,
-                'error': smart_result.get('error')
-            })
+    for device, future in zip(devices, futures):
+        if not future.done() or future.cancelled():
+            logger.warning("SMART read of %s timed out", device)
+            results.append({'device': device, 'error': 'Timed out reading SMART data'})
+            continue
+        try:
+            results.append(_smart_all_devices_entry(device, future.result()))
+        except Exception as e:
+            results.append({'device': device, 'error': str(e)})
 
     return {'success': True, 'devices': results}
 
 
-def cmd_alert_health_snapshot(params):
-    """Return read-only host health inputs used by the alert daemon."""
-    smart = cmd_smart_all_devices({})
-    mounts = cmd_mounts_read({})
+ALERT_SNAPSHOT_SECTIONS = ('smart', 'mounts', 'snapraid')
+
+
+def _snapraid_alert_status():
     try:
         from storage_plugins.snapraid_plugin import SnapRAIDPlugin
 
@@ -940,15 +1154,37 @@ def cmd_alert_health_snapshot(params):
             os.getenv('LIMEOS_CONFIG_DIR', '/etc/limeos'),
             'storage_plugins',
         )
-        snapraid = SnapRAIDPlugin(config_dir).get_status()
+        return SnapRAIDPlugin(config_dir).get_status()
     except Exception as exc:
-        snapraid = {'status': 'unavailable', 'message': str(exc), 'details': {}}
-    return {
-        'success': True,
-        'smart': smart,
-        'mounts': mounts,
-        'snapraid': snapraid,
+        return {'status': 'unavailable', 'message': str(exc), 'details': {}}
+
+
+def cmd_alert_health_snapshot(params):
+    """Return read-only host health inputs used by the alert daemon.
+
+    ``sections`` limits the snapshot to some of smart, mounts and snapraid, so
+    the daemon can check mounts often without also reading every drive.
+    """
+    sections = params.get('sections', ALERT_SNAPSHOT_SECTIONS)
+    if (
+        not isinstance(sections, (list, tuple))
+        or not sections
+        or any(section not in ALERT_SNAPSHOT_SECTIONS for section in sections)
+    ):
+        return {
+            'success': False,
+            'error': f"sections must list some of: {', '.join(ALERT_SNAPSHOT_SECTIONS)}",
+        }
+    readers = {
+        'smart': lambda: cmd_smart_all_devices({}),
+        'mounts': lambda: cmd_mounts_read({}),
+        'snapraid': _snapraid_alert_status,
     }
+    snapshot = {'success': True}
+    for section in ALERT_SNAPSHOT_SECTIONS:
+        if section in sections:
+            snapshot[section] = readers[section]()
+    return snapshot
 
 
 def cmd_df(params):
@@ -970,6 +1206,208 @@ def cmd_df(params):
     return {'success': False, 'error': result.get('stderr', 'df failed')}
 
 
+SYS_BLOCK_PATH = '/sys/block'
+SYS_DEV_BLOCK_PATH = '/sys/dev/block'
+BENCHMARK_SEQ_BLOCK = 1024 * 1024
+BENCHMARK_RANDOM_BLOCK = 4096
+# (minimum, maximum, default); the whole run must fit the helper client's 30s timeout.
+BENCHMARK_LIMITS = {
+    'seq_mb': (16, 1024, 256),
+    'random_reads': (16, 4096, 512),
+    'write_mb': (16, 512, 128),
+    'max_seconds': (5, 25, 20),
+}
+# Concurrent runs would measure each other, not the drives.
+_benchmark_lock = threading.Lock()
+
+
+def _benchmark_limit(params, key):
+    low, high, default = BENCHMARK_LIMITS[key]
+    value = params.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, int) or not low <= value <= high:
+        raise ValueError(f'{key} must be between {low} and {high}')
+    return value
+
+
+def _read_sysfs(path):
+    try:
+        with open(path) as handle:
+            return handle.read().strip()
+    except OSError:
+        return None
+
+
+def _block_device_info(name, sys_block=SYS_BLOCK_PATH):
+    """Transport, bound driver and USB link speed for a whole disk, from sysfs.
+
+    A USB disk's interface is bound to ``uas`` or, after a fallback, the much
+    slower ``usb-storage``; the USB device one level up reports its link speed.
+    """
+    base = os.path.join(sys_block, name)
+    rotational = _read_sysfs(os.path.join(base, 'queue', 'rotational'))
+    info = {
+        'model': _read_sysfs(os.path.join(base, 'device', 'model')),
+        'rotational': rotational == '1' if rotational in ('0', '1') else None,
+        'transport': 'unknown',
+        'driver': None,
+        'usb_speed_mbps': None,
+    }
+    device_path = os.path.realpath(os.path.join(base, 'device'))
+    if name.startswith('nvme'):
+        info['transport'] = 'nvme'
+    elif name.startswith('mmcblk'):
+        info['transport'] = 'mmc'
+    elif '/usb' in device_path:
+        info['transport'] = 'usb'
+    elif '/ata' in device_path:
+        info['transport'] = 'sata'
+
+    current = device_path
+    for _ in range(12):
+        driver_link = os.path.join(current, 'driver')
+        if info['driver'] is None and os.path.islink(driver_link):
+            driver = os.path.basename(os.readlink(driver_link))
+            if driver != 'sd':
+                info['driver'] = driver
+        speed = _read_sysfs(os.path.join(current, 'speed'))
+        if info['transport'] == 'usb' and speed:
+            try:
+                info['usb_speed_mbps'] = int(float(speed))
+            except ValueError:
+                pass
+            break
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
+    return info
+
+
+def _mount_on_disk(path, name, sys_dev_block=SYS_DEV_BLOCK_PATH):
+    """True when the filesystem holding ``path`` lives on disk ``name``."""
+    st_dev = os.stat(path).st_dev
+    node = os.path.realpath(
+        os.path.join(sys_dev_block, f'{os.major(st_dev)}:{os.minor(st_dev)}')
+    )
+    return f'/block/{name}/' in node + '/'
+
+
+def _direct_read_test(device, seq_bytes, random_reads, deadline, clock=time.monotonic):
+    """Sequential 1 MiB and random 4 KiB O_DIRECT reads, bypassing the page cache."""
+    fd = os.open(device, os.O_RDONLY | os.O_DIRECT)
+    try:
+        size = os.lseek(fd, 0, os.SEEK_END)
+        # Anonymous mmap buffers are page aligned, as O_DIRECT requires.
+        buffer = mmap.mmap(-1, BENCHMARK_SEQ_BLOCK)
+        started = clock()
+        seq_deadline = started + (deadline - started) / 2
+        seq_read = 0
+        while seq_read < min(seq_bytes, size) and clock() < seq_deadline:
+            count = os.preadv(fd, [buffer], seq_read)
+            if count <= 0:
+                break
+            seq_read += count
+        seq_seconds = max(clock() - started, 1e-6)
+
+        small = mmap.mmap(-1, BENCHMARK_RANDOM_BLOCK)
+        blocks = max(1, size // BENCHMARK_RANDOM_BLOCK)
+        offsets = random.Random(size)
+        started = clock()
+        done = 0
+        while done < random_reads and clock() < deadline:
+            os.preadv(fd, [small], offsets.randrange(blocks) * BENCHMARK_RANDOM_BLOCK)
+            done += 1
+        random_seconds = max(clock() - started, 1e-6)
+    finally:
+        os.close(fd)
+    return {
+        'size_bytes': size,
+        'sequential_read_bytes': seq_read,
+        'sequential_read_mbps': round(seq_read / seq_seconds / 1e6, 1),
+        'random_reads': done,
+        'random_read_iops': round(done / random_seconds, 1),
+        'random_read_latency_ms': round(random_seconds / done * 1000, 2) if done else None,
+    }
+
+
+def _write_test(directory, write_bytes, deadline, clock=time.monotonic):
+    """Sequential writes to a temporary file that is always removed afterwards."""
+    fd, path = tempfile.mkstemp(prefix='.pihealth-benchmark-', dir=directory)
+    os.close(fd)
+    direct = True
+    try:
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_DIRECT)
+        except OSError:
+            # FUSE and some other filesystems refuse O_DIRECT; fsync still bounds the cache.
+            direct = False
+            fd = os.open(path, os.O_WRONLY)
+        try:
+            buffer = mmap.mmap(-1, BENCHMARK_SEQ_BLOCK)
+            buffer.write(os.urandom(BENCHMARK_SEQ_BLOCK))
+            started = clock()
+            written = 0
+            while written < write_bytes and clock() < deadline:
+                written += os.write(fd, buffer)
+            os.fsync(fd)
+            seconds = max(clock() - started, 1e-6)
+        finally:
+            os.close(fd)
+    finally:
+        os.unlink(path)
+    return {
+        'write_bytes': written,
+        'write_mbps': round(written / seconds / 1e6, 1),
+        'write_direct': direct,
+    }
+
+
+def cmd_disk_benchmark(params):
+    """Measure a whole disk's read (and optionally write) throughput.
+
+    Reads are non-destructive O_DIRECT reads of the raw device. The optional
+    write test needs ``write_path``, a mounted filesystem on the same disk.
+    """
+    device = params.get('device', '')
+    if not device or not DEVICE_PATTERN.match(device):
+        return {'success': False, 'error': 'Invalid device path'}
+    name = os.path.basename(device)
+    if not os.path.isdir(os.path.join(SYS_BLOCK_PATH, name)):
+        return {'success': False, 'error': f'{device} is not a whole disk'}
+    try:
+        seq_mb = _benchmark_limit(params, 'seq_mb')
+        random_reads = _benchmark_limit(params, 'random_reads')
+        write_mb = _benchmark_limit(params, 'write_mb')
+        max_seconds = _benchmark_limit(params, 'max_seconds')
+    except ValueError as exc:
+        return {'success': False, 'error': str(exc)}
+
+    write_path = params.get('write_path')
+    if write_path:
+        if not MOUNT_POINT_PATTERN.match(write_path) or '..' in write_path:
+            return {'success': False, 'error': 'Invalid write path'}
+        if not os.path.ismount(write_path) or not _mount_on_disk(write_path, name):
+            return {'success': False, 'error': f'{write_path} is not a filesystem on {device}'}
+
+    if not _benchmark_lock.acquire(blocking=False):
+        return {'success': False, 'error': 'Another disk benchmark is running'}
+    try:
+        started = time.monotonic()
+        # Reads get the whole budget when there is no write test, otherwise two thirds.
+        read_deadline = started + (max_seconds * 2 / 3 if write_path else max_seconds)
+        result = _direct_read_test(device, seq_mb * 1024 * 1024, random_reads, read_deadline)
+        if write_path:
+            result.update(
+                _write_test(write_path, write_mb * 1024 * 1024, started + max_seconds)
+            )
+        result['duration_seconds'] = round(time.monotonic() - started, 2)
+    except OSError as exc:
+        return {'success': False, 'error': f'Benchmark failed: {exc.strerror or exc}'}
+    finally:
+        _benchmark_lock.release()
+    return {'success': True, 'device': device, **_block_device_info(name), **result}
+
+
 SNAPRAID_ALLOWED_CONF = frozenset({'/etc/snapraid.conf', '/etc/snapraid-diff.conf'})
 
 
@@ -1578,26 +2016,19 @@ def cmd_write_vpn_env(params):
         return {'success': False, 'error': str(e)}
 
 
-def cmd_backup_create(params):
-    """Create a compressed backup archive."""
-    sources = params.get('sources', [])
-    dest_dir = params.get('dest_dir', '')
-    retention_count = params.get('retention_count', 7)
-    compression = params.get('compression', 'zst')
-    archive_prefix = params.get('archive_prefix', 'pi-health-backup')
-    excludes = params.get('excludes', [])
-
+def _backup_request(sources, dest_dir, retention_count):
+    """Validate shared backup params; return (sources, retention, error)."""
     if not isinstance(sources, list) or not sources:
-        return {'success': False, 'error': 'sources required'}
+        return None, None, 'sources required'
     if not dest_dir or not BACKUP_DEST_PATTERN.match(dest_dir) or '..' in dest_dir:
-        return {'success': False, 'error': 'Invalid dest_dir'}
+        return None, None, 'Invalid dest_dir'
 
     try:
         retention_count = int(retention_count)
     except (TypeError, ValueError):
-        return {'success': False, 'error': 'Invalid retention_count'}
+        return None, None, 'Invalid retention_count'
     if retention_count < 1:
-        return {'success': False, 'error': 'retention_count must be >= 1'}
+        return None, None, 'retention_count must be >= 1'
 
     valid_sources = []
     for source in sources:
@@ -1614,34 +2045,261 @@ def cmd_backup_create(params):
             valid_sources.append(source)
 
     if not valid_sources:
-        return {'success': False, 'error': 'No valid sources found'}
+        return None, None, 'No valid sources found'
+    return valid_sources, retention_count, None
 
-    # Validate and build exclude arguments
-    exclude_args = []
-    if isinstance(excludes, list):
-        for pattern in excludes:
-            if isinstance(pattern, str) and pattern and '..' not in pattern:
-                exclude_args.extend(['--exclude', pattern])
 
-    os.makedirs(dest_dir, exist_ok=True)
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    safe_prefix = re.sub(r'[^a-zA-Z0-9._-]', '', archive_prefix) or 'pi-health-backup'
-    archive_name = f"{safe_prefix}-{timestamp}.tar.zst" if compression == 'zst' else f"{safe_prefix}-{timestamp}.tar.gz"
-    archive_path = os.path.join(dest_dir, archive_name)
+def _backup_excludes(excludes):
+    if not isinstance(excludes, list):
+        return []
+    return [
+        pattern for pattern in excludes
+        if isinstance(pattern, str) and pattern and '..' not in pattern
+    ]
+
+
+def _backup_prefix(archive_prefix):
+    return re.sub(r'[^a-zA-Z0-9._-]', '', str(archive_prefix or '')) or 'pi-health-backup'
+
+
+def _backup_tuning(params, compression):
+    """Return (level, threads, low_priority, error) for an archive run."""
+    lowest, highest = BACKUP_COMPRESSION_LEVELS[compression]
+    try:
+        level = int(params.get('compression_level', 3))
+        threads = int(params.get('compression_threads', 0))
+    except (TypeError, ValueError):
+        return None, None, None, 'Invalid compression settings'
+    if not lowest <= level <= highest:
+        return None, None, None, f'compression_level must be {lowest}-{highest}'
+    if not 0 <= threads <= BACKUP_MAX_THREADS:
+        return None, None, None, f'compression_threads must be 0-{BACKUP_MAX_THREADS}'
+    return level, threads, params.get('low_priority', True) is not False, None
+
 
+def _backup_priority(low_priority):
+    """Command prefix that runs a backup process at the backup priority."""
+    if not low_priority:
+        return []
+    prefix = []
+    if shutil.which('nice'):
+        prefix += ['nice', '-n', str(BACKUP_NICE)]
+    if shutil.which('ionice'):
+        prefix += ['ionice', *BACKUP_IONICE_ARGS]
+    return prefix
+
+
+def _lower_thread_priority():
+    """Drop the calling thread to the backup CPU and I/O priority."""
+    thread_id = threading.get_native_id()
+    try:
+        os.setpriority(os.PRIO_PROCESS, thread_id, BACKUP_NICE)
+    except OSError:
+        pass
+    if shutil.which('ionice'):
+        run_command(['ionice', *BACKUP_IONICE_ARGS, '-p', str(thread_id)])
+
+
+def _backup_compressor(compression, level, threads):
+    """Compressor argv; thread count 0 uses every core."""
     if compression == 'zst':
-        cmd = ['tar', '-I', 'zstd', '-cf', archive_path] + exclude_args + valid_sources
-    else:
-        cmd = ['tar', '-czf', archive_path] + exclude_args + valid_sources
+        return ['zstd', '-q', f'-{level}', f'-T{threads}']
+    if shutil.which('pigz'):
+        return ['pigz', f'-{level}'] + (['-p', str(threads)] if threads else [])
+    return ['gzip', f'-{level}']
+
+
+def _backup_decompressor(compression):
+    if compression == 'zst':
+        return ['zstd', '-d', '-q', '-c']
+    return ['pigz' if shutil.which('pigz') else 'gzip', '-d', '-c']
+
+
+def _estimate_backup_bytes(sources, excludes):
+    """Approximate the tar stream size: a header per entry plus padded data."""
+    total = 0
+
+    def add(path):
+        nonlocal total
+        try:
+            info = os.lstat(path)
+        except OSError:
+            return
+        total += 512
+        if stat.S_ISREG(info.st_mode):
+            total += -(-info.st_size // 512) * 512
+
+    for source in sources:
+        if excluded(source, excludes):
+            continue
+        add(source)
+        for directory, dirnames, filenames in os.walk(source, onerror=lambda _e: None):
+            dirnames[:] = [
+                name for name in dirnames
+                if not excluded(os.path.join(directory, name), excludes)
+            ]
+            for name in dirnames + filenames:
+                path = os.path.join(directory, name)
+                if name in dirnames or not excluded(path, excludes):
+                    add(path)
+    return total
+
+
+def _pipe_backup_data(source, sink, processes, total, emit, stage):
+    """Copy ``source`` into ``sink`` in blocks, reporting the bytes moved.
+
+    Every process in the pipeline is killed if the copy outlives
+    BACKUP_TIMEOUT_SECONDS. Returns an error message or None.
+    """
+    timed_out = threading.Event()
+
+    def expire():
+        timed_out.set()
+        for process in processes:
+            process.kill()
+
+    watchdog = threading.Timer(BACKUP_TIMEOUT_SECONDS, expire)
+    watchdog.daemon = True
+    watchdog.start()
+    moved = 0
+    try:
+        try:
+            while True:
+                block = source.read(BACKUP_PIPE_CHUNK)
+                if not block:
+                    break
+                sink.write(block)
+                moved += len(block)
+                emit({'type': 'progress', 'stage': stage, 'bytes': moved, 'bytes_total': total})
+        except BrokenPipeError:
+            pass
+        finally:
+            # The sink first, so the next stage sees end of input.
+            for stream in (sink, source):
+                try:
+                    stream.close()
+                except BrokenPipeError:
+                    pass
+        for process in processes:
+            process.wait()
+    finally:
+        watchdog.cancel()
+    return 'Command timed out' if timed_out.is_set() else None
+
+
+def _pipeline_error(stages):
+    """First failure's stderr, skipping stages only killed by a closed pipe."""
+    failed = [(process, errors) for process, errors in stages if process.returncode]
+    causes = [stage for stage in failed if stage[0].returncode != -signal.SIGPIPE]
+    for process, errors in causes or failed:
+        errors.seek(0)
+        message = errors.read().decode('utf-8', 'replace').strip()
+        return message[-2000:] or f'{shlex.join(process.args)} exited with {process.returncode}'
+    return None
+
+
+def _start_pipeline(commands, stdin, stdout, error_files):
+    """Start ``commands`` piped into each other; stop them all on failure."""
+    processes = []
+    try:
+        for index, command in enumerate(commands):
+            processes.append(subprocess.Popen(
+                command,
+                stdin=processes[-1].stdout if processes else stdin,
+                stdout=stdout if index == len(commands) - 1 else subprocess.PIPE,
+                stderr=error_files[index],
+            ))
+            if index:
+                # Only the next stage reads this pipe now.
+                processes[-2].stdout.close()
+    except OSError:
+        for process in processes:
+            process.kill()
+            process.wait()
+        raise
+    return processes
+
+
+def _write_backup_archive(tar_cmd, compressor, archive_path, compression, total, emit):
+    """Stream tar through framed compression into ``archive_path`` and index it.
+
+    Returns (error, bytes of tar stream written).
+    """
+    partial = f'{archive_path}.partial'
+    written = 0
+    try:
+        with open(partial, 'wb') as output, \
+                tempfile.TemporaryFile() as tar_errors, \
+                tempfile.TemporaryFile() as compress_errors:
+            tar, = _start_pipeline([tar_cmd], None, subprocess.PIPE, [tar_errors])
+            indexer = TarIndexer()
+            frames = FrameWriter(
+                lambda: _start_pipeline(
+                    [compressor], subprocess.PIPE, output, [compress_errors]
+                )[0],
+                lambda: os.lseek(output.fileno(), 0, os.SEEK_CUR),
+                tap=indexer.feed,
+            )
+            try:
+                error = _pipe_backup_data(
+                    tar.stdout, frames, (tar, frames), total, emit, 'backup'
+                ) or _pipeline_error(((frames, compress_errors), (tar, tar_errors)))
+            except OSError:
+                tar.kill()
+                tar.wait()
+                raise
+            written = sum(frame[1] for frame in frames.frames)
+            # An archive whose stream could not be indexed still restores whole.
+            if not error and not indexer.failed:
+                write_index(archive_path, build_index(
+                    os.path.basename(archive_path), compression, frames.frames, indexer
+                ))
+        if not error:
+            os.replace(partial, archive_path)
+    except OSError as exc:
+        error = str(exc)
+    if error:
+        try:
+            os.unlink(partial)
+        except OSError:
+            pass
+    return error, written
+
+
+def _write_backup_metadata(archive_path, metadata):
+    """Record the run beside the archive; listings read this, not the archive."""
+    try:
+        size = os.path.getsize(archive_path)
+        write_metadata(archive_path, {
+            **metadata,
+            'archive': os.path.basename(archive_path),
+            'archive_bytes': size,
+            'ratio': round(size / metadata['bytes'], 4) if metadata['bytes'] else None,
+            'checksum': f'blake2b:{file_digest(archive_path)}',
+        })
+    except OSError:
+        logger.warning('Could not write backup metadata for %s', archive_path, exc_info=True)
+
+
+def _extract_backup_archive(archive_path, decompressor, tar_cmd, emit):
+    """Feed ``archive_path`` through the decompressor into ``tar -x``."""
+    try:
+        total = os.path.getsize(archive_path)
+        with open(archive_path, 'rb') as source, \
+                tempfile.TemporaryFile() as decompress_errors, \
+                tempfile.TemporaryFile() as tar_errors:
+            decompress, tar = _start_pipeline(
+                [decompressor, tar_cmd], subprocess.PIPE, subprocess.DEVNULL,
+                [decompress_errors, tar_errors],
+            )
+            return _pipe_backup_data(
+                source, decompress.stdin, (decompress, tar), total, emit, 'restore'
+            ) or _pipeline_error(((tar, tar_errors), (decompress, decompress_errors)))
+    except OSError as exc:
+        return str(exc)
 
-    result = run_command(cmd, timeout=3600)
-    if result.get('returncode') != 0:
-        return {
-            'success': False,
-            'error': result.get('stderr', 'Backup failed')
-        }
 
-    # Retention cleanup
+def _prune_backup_archives(dest_dir, safe_prefix, retention_count):
     try:
         backups = []
         for name in os.listdir(dest_dir):
@@ -1651,24 +2309,157 @@ def cmd_backup_create(params):
                 continue
             path = os.path.join(dest_dir, name)
             try:
-                stat = os.stat(path)
-                backups.append((stat.st_mtime, path))
+                backups.append((os.stat(path).st_mtime, path))
             except OSError:
                 continue
         backups.sort(reverse=True)
         for _, path in backups[retention_count:]:
-            try:
-                os.remove(path)
-            except OSError:
-                continue
+            for stale in (path, index_path(path), metadata_path(path)):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    continue
     except Exception:
         pass
 
-    return {'success': True, 'archive': archive_path}
+
+def cmd_backup_create(params):
+    """Create a compressed backup archive.
+
+    With ``background`` set the archive is written by a helper job whose
+    progress events report bytes streamed against the estimated total.
+    """
+    sources = params.get('sources', [])
+    dest_dir = params.get('dest_dir', '')
+    retention_count = params.get('retention_count', 7)
+    compression = 'zst' if params.get('compression', 'zst') == 'zst' else 'gz'
+    archive_prefix = params.get('archive_prefix', 'pi-health-backup')
+    excludes = _backup_excludes(params.get('excludes', []))
+
+    valid_sources, retention_count, error = _backup_request(
+        sources, dest_dir, retention_count
+    )
+    if error:
+        return {'success': False, 'error': error}
+    level, threads, low_priority, error = _backup_tuning(params, compression)
+    if error:
+        return {'success': False, 'error': error}
+
+    # Validate and build exclude arguments
+    exclude_args = []
+    for pattern in excludes:
+        exclude_args.extend(['--exclude', pattern])
+
+    os.makedirs(dest_dir, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    safe_prefix = _backup_prefix(archive_prefix)
+    archive_path = os.path.join(dest_dir, f"{safe_prefix}-{timestamp}.tar.{compression}")
+
+    # tar and the compressor run as separate processes so the helper can
+    # count the bytes passing between them.
+    priority = _backup_priority(low_priority)
+    tar_cmd = priority + ['tar', '-cf', '-'] + exclude_args + valid_sources
+    compressor = priority + _backup_compressor(compression, level, threads)
+
+    def work(emit):
+        started = time.monotonic()
+        error, written = _write_backup_archive(
+            tar_cmd, compressor, archive_path, compression,
+            _estimate_backup_bytes(valid_sources, excludes), emit,
+        )
+        if error:
+            return {'success': False, 'error': error}
+        _write_backup_metadata(archive_path, {
+            'version': 1,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'duration_seconds': round(time.monotonic() - started, 3),
+            'sources': valid_sources,
+            'compression': compression,
+            'compression_level': level,
+            'bytes': written,
+        })
+        _prune_backup_archives(dest_dir, safe_prefix, retention_count)
+        return {'success': True, 'archive': archive_path}
+
+    if params.get('background'):
+        return _start_backup_job(work, low_priority=low_priority)
+    return work(lambda _event: None)
+
+
+def _extract_backup_paths(archive_path, paths, decompressor, tar_cmd, emit):
+    """Restore only the members under ``paths``, reading just their frames.
+
+    Members are verified before tar receives them; a mismatch stops the
+    restore without touching the damaged file.
+
+    Returns (error, restored member count).
+    """
+    try:
+        index = load_index(archive_path)
+        entries = select_entries(index['entries'], paths)
+    except BackupIndexError as exc:
+        return str(exc), 0
+    if not entries:
+        return 'No matching paths in archive', 0
+
+    def decompress(data):
+        result = subprocess.run(
+            decompressor, input=data, capture_output=True, timeout=BACKUP_TIMEOUT_SECONDS
+        )
+        if result.returncode:
+            message = result.stderr.decode('utf-8', 'replace').strip()
+            raise BackupIndexError(message or 'Could not decompress archive frame')
+        return result.stdout
+
+    try:
+        stream = MemberStream(archive_path, index, entries, decompress)
+        try:
+            with tempfile.TemporaryFile() as tar_errors:
+                tar, = _start_pipeline(
+                    [tar_cmd], subprocess.PIPE, subprocess.DEVNULL, [tar_errors]
+                )
+                try:
+                    error = _pipe_backup_data(
+                        stream, tar.stdin, (tar,), stream.total, emit, 'restore'
+                    ) or _pipeline_error(((tar, tar_errors),))
+                except (BackupIndexError, subprocess.TimeoutExpired) as exc:
+                    tar.kill()
+                    tar.wait()
+                    error = str(exc)
+        finally:
+            stream.close()
+    except OSError as exc:
+        return str(exc), 0
+    return error, len(entries)
+
+
+def _restore_selection(params):
+    """Return (paths or None for everything, target, error) for a restore."""
+    paths = params.get('paths')
+    if paths is not None:
+        if not isinstance(paths, list) or not paths or len(paths) > BACKUP_RESTORE_PATHS_MAX:
+            return None, None, 'Invalid paths'
+        for path in paths:
+            if (
+                not isinstance(path, str)
+                or not path.startswith('/')
+                or '..' in path.split('/')
+            ):
+                return None, None, 'Invalid paths'
+    target = params.get('target') or '/'
+    if target != '/' and (
+        not isinstance(target, str) or not BACKUP_DEST_PATTERN.match(target) or '..' in target
+    ):
+        return None, None, 'Invalid restore target'
+    return paths, target, None
 
 
 def cmd_backup_restore(params):
-    """Restore from a compressed backup archive."""
+    """Restore from a compressed backup archive, in a job with ``background``.
+
+    ``paths`` limits the restore to those files and directories, read through
+    the archive's index; ``target`` restores beneath a staging directory.
+    """
     archive_path = params.get('archive_path', '').strip()
 
     if not archive_path or '..' in archive_path:
@@ -1679,17 +2470,162 @@ def cmd_backup_restore(params):
         return {'success': False, 'error': 'Archive path not allowed'}
     if not os.path.exists(archive_path):
         return {'success': False, 'error': 'Archive not found'}
+    paths, target, error = _restore_selection(params)
+    if error:
+        return {'success': False, 'error': error}
 
-    if archive_path.endswith('.tar.zst'):
-        cmd = ['tar', '-I', 'zstd', '-x', '--overwrite', '-f', archive_path, '-C', '/']
-    else:
-        cmd = ['tar', '-x', '--overwrite', '-zf', archive_path, '-C', '/']
+    low_priority = params.get('low_priority', True) is not False
+    priority = _backup_priority(low_priority)
+    decompressor = priority + _backup_decompressor(
+        'zst' if archive_path.endswith('.tar.zst') else 'gz'
+    )
+    tar_cmd = priority + ['tar', '-x', '--overwrite', '-f', '-', '-C', target]
 
-    result = run_command(cmd, timeout=3600)
-    if result.get('returncode') != 0:
-        return {'success': False, 'error': result.get('stderr', 'Restore failed')}
+    def work(emit):
+        os.makedirs(target, exist_ok=True)
+        if paths is None:
+            error = _extract_backup_archive(archive_path, decompressor, tar_cmd, emit)
+            restored = None
+        else:
+            error, restored = _extract_backup_paths(
+                archive_path, paths, decompressor, tar_cmd, emit
+            )
+        if error:
+            return {'success': False, 'error': error}
+        result = {'success': True, 'archive': archive_path, 'target': target}
+        if restored is not None:
+            result['entries'] = restored
+        return result
+
+    if params.get('background'):
+        return _start_backup_job(work, low_priority=low_priority)
+    return work(lambda _event: None)
+
+
+_backup_jobs = {}
+_backup_jobs_lock = threading.Lock()
+
+
+def _start_backup_job(work, low_priority=False):
+    """Run ``work(emit)`` in a thread; progress is read with backup_job_status.
 
-    return {'success': True, 'archive': archive_path}
+    Helper replies are single bounded frames, so long backup runs report
+    through a polled event list instead of holding the socket open.
+    """
+    job_id = os.urandom(8).hex()
+    job = {'events': [], 'first': 0, 'done': False, 'result': None, 'emitted_at': 0.0}
+
+    def emit(event):
+        now = time.monotonic()
+        with _backup_jobs_lock:
+            if now - job['emitted_at'] < BACKUP_JOB_PROGRESS_INTERVAL:
+                return
+            job['emitted_at'] = now
+            job['events'].append(event)
+            overflow = len(job['events']) - BACKUP_JOB_EVENT_LIMIT
+            if overflow > 0:
+                del job['events'][:overflow]
+                job['first'] += overflow
+
+    def run():
+        if low_priority:
+            _lower_thread_priority()
+        try:
+            result = work(emit)
+        except ChunkStoreError as exc:
+            result = {'success': False, 'error': str(exc)}
+        except Exception:
+            logger.exception('Backup job %s failed', job_id)
+            result = {'success': False, 'error': 'Backup job failed'}
+        with _backup_jobs_lock:
+            job['result'] = result
+            job['done'] = True
+
+    with _backup_jobs_lock:
+        finished = [key for key, item in _backup_jobs.items() if item['done']]
+        for key in finished[:max(0, len(finished) - BACKUP_JOBS_KEPT + 1)]:
+            del _backup_jobs[key]
+        _backup_jobs[job_id] = job
+    threading.Thread(target=run, name=f'backup-job-{job_id}', daemon=True).start()
+    return {'success': True, 'job_id': job_id}
+
+
+def _chunk_store(dest_dir):
+    if not dest_dir or not BACKUP_DEST_PATTERN.match(dest_dir) or '..' in dest_dir:
+        return None
+    return ChunkStore(os.path.join(dest_dir, CHUNK_STORE_DIR))
+
+
+def cmd_backup_snapshot_create(params):
+    """Start a deduplicated snapshot into the destination's chunk store."""
+    dest_dir = params.get('dest_dir', '')
+    sources, retention_count, error = _backup_request(
+        params.get('sources', []), dest_dir, params.get('retention_count', 7)
+    )
+    if error:
+        return {'success': False, 'error': error}
+    prefix = _backup_prefix(params.get('archive_prefix', 'pi-health-backup'))
+    excludes = _backup_excludes(params.get('excludes', []))
+    store = _chunk_store(dest_dir)
+
+    def work(emit):
+        summary = store.create(prefix, sources, excludes=excludes, progress=emit)
+        pruned = store.prune(prefix, retention_count)
+        return {
+            'success': True,
+            'snapshot': summary['snapshot'],
+            'summary': summary,
+            'pruned': pruned,
+        }
+
+    return _start_backup_job(work, low_priority=params.get('low_priority', True) is not False)
+
+
+def cmd_backup_snapshot_restore(params):
+    """Start rebuilding one snapshot, or the entries under ``paths``, in place."""
+    name = params.get('snapshot', '')
+    if not isinstance(name, str) or not SNAPSHOT_NAME_PATTERN.match(name):
+        return {'success': False, 'error': 'Invalid snapshot name'}
+    store = _chunk_store(params.get('dest_dir', ''))
+    if store is None:
+        return {'success': False, 'error': 'Invalid dest_dir'}
+    if name not in store.snapshot_names():
+        return {'success': False, 'error': 'Snapshot not found'}
+    paths, target, error = _restore_selection(params)
+    if error:
+        return {'success': False, 'error': error}
+
+    def work(emit):
+        os.makedirs(target, exist_ok=True)
+        restored = store.restore(name, target=target, paths=paths, progress=emit)
+        return {'success': True, 'target': target, **restored}
+
+    return _start_backup_job(work, low_priority=params.get('low_priority', True) is not False)
+
+
+def cmd_backup_job_status(params):
+    """Return progress events after ``cursor`` and the result once finished."""
+    job_id = params.get('job_id')
+    try:
+        cursor = max(0, int(params.get('cursor', 0)))
+    except (TypeError, ValueError):
+        return {'success': False, 'error': 'Invalid cursor'}
+    with _backup_jobs_lock:
+        job = _backup_jobs.get(job_id) if isinstance(job_id, str) else None
+        if job is None:
+            return {'success': False, 'error': 'Unknown backup job'}
+        start = max(cursor, job['first']) - job['first']
+        events = job['events'][start:start + BACKUP_JOB_POLL_LIMIT]
+        next_cursor = job['first'] + start + len(events)
+        caught_up = next_cursor >= job['first'] + len(job['events'])
+        done = job['done'] and caught_up
+        return {
+            'success': True,
+            'events': events,
+            'cursor': next_cursor,
+            'done': done,
+            'result': job['result'] if done else None,
+        }
 
 
 def cmd_seedbox_configure(params):
@@ -5714,6 +6650,7 @@ COMMANDS = {
     'smart_all_devices': cmd_smart_all_devices,
     'alert_health_snapshot': cmd_alert_health_snapshot,
     'df': cmd_df,
+    'disk_benchmark': cmd_disk_benchmark,
     'snapraid': cmd_snapraid,
     'mergerfs_mount': cmd_mergerfs_mount,
     'mergerfs_umount': cmd_mergerfs_umount,
@@ -5732,6 +6669,9 @@ COMMANDS = {
     'write_vpn_env': cmd_write_vpn_env,
     'backup_create': cmd_backup_create,
     'backup_restore': cmd_backup_restore,
+    'backup_snapshot_create': cmd_backup_snapshot_create,
+    'backup_snapshot_restore': cmd_backup_snapshot_restore,
+    'backup_job_status': cmd_backup_job_status,
     'seedbox_configure': cmd_seedbox_configure,
     'seedbox_disable': cmd_seedbox_disable,
     'sshfs_list': cmd_sshfs_list,
@@ -0,0 +1,37 @@
+"""Conventions shared by the tools that walk MergerFS branches file by file.
+
+The branch balancer and the duplicate finder both skip the same bookkeeping
+files, recognise the balancer's in-flight copies, and throttle their reads so
+a background pass does not starve playback on the same disks.
+"""
+
+from __future__ import annotations
+
+import time
+
+
+TEMP_SUFFIX = ".pihealth-balance"
+# Never relocate parity/content files or filesystem bookkeeping.
+SKIPPED_DIRS = frozenset({"lost+found", ".Trash-0", ".Trash-1000"})
+SKIPPED_PREFIXES = ("snapraid.", ".snapraid")
+
+
+class RateLimiter:
+    """Token bucket that sleeps to keep a byte stream under ``bytes_per_second``."""
+
+    def __init__(self, bytes_per_second: float, *, clock=time.monotonic, sleep=time.sleep):
+        self._rate = float(bytes_per_second)
+        self._clock = clock
+        self._sleep = sleep
+        self._allowance = self._rate
+        self._checked_at = clock()
+
+    def consume(self, amount: int) -> None:
+        if self._rate <= 0:
+            return
+        now = self._clock()
+        self._allowance = min(self._rate, self._allowance + (now - self._checked_at) * self._rate)
+        self._checked_at = now
+        self._allowance -= amount
+        if self._allowance < 0:
+            self._sleep(-self._allowance / self._rate)
@@ -36,6 +36,7 @@ MATTERMOST_LIFECYCLE_PATH = INTEGRATIONS_STATE_DIR / "mattermost-lifecycle.json"
 AGENT_LIFECYCLE_PATH = INTEGRATIONS_STATE_DIR / "agents-lifecycle.json"
 STORAGE_CONTRACT_PATH = CONFIG_DIR / "storage-contract.json"
 MATTERMOST_RECOVERY_DIR = STATE_DIR / "integration-recovery"
+OPERATIONS_STATE_DIR = STATE_DIR / "operations"
 MATTERMOST_RECOVERY_CREDENTIAL_PATH = MATTERMOST_RECOVERY_DIR / "mattermost.env"
 SNAPRAID_LOG_DIR = LOG_DIR / "snapraid"
 RETIRED_ENV_KEYS = frozenset({"PIHEALTH_UI_MODE", "PIHEALTH_UI_V2_PAGES", "THEME"})
@@ -0,0 +1,345 @@
+"""Opt-in adaptive SnapRAID scrubbing in small slices while the array is idle.
+
+A fixed ``snapraid scrub -p 12`` timer reads a large share of every disk at the
+same hour whatever else is happening, and on a Pi serving Jellyfin that hour is
+often someone's film. This planner instead scrubs a few percent at a time and
+only after the host has been quiet for a while: no active stream, little disk
+traffic in ``/proc/diskstats`` and outside the configured busy hours.
+
+How much to scrub comes from the scrub-age picture in ``snapraid status``: a
+steady rate that revisits the whole array within ``target_age_days`` plus a
+catch-up share for blocks that are already older than that (or were never
+scrubbed), spread over ``catch_up_days``. The day's progress is persisted with
+the config, so a restart does not re-spend the daily budget.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from typing import Any
+
+from diskstats import DiskThroughputSampler
+from ports import ConfigRepository
+
+
+DEFAULT_CONFIG = {
+    "version": 1,
+    "enabled": False,
+    "target_age_days": 30,
+    "catch_up_days": 7,
+    "max_percent_per_run": 2,
+    # Passed to `snapraid scrub -o`: leave recently verified blocks alone.
+    "min_block_age_days": 10,
+    "idle_for_seconds": 900,
+    "min_interval_seconds": 1800,
+    "busy_disk_percent": 25.0,
+    "busy_mbps": 30.0,
+    # Local hours when playback is likely; a slice never starts inside them.
+    "avoid_hours": [18, 19, 20, 21, 22, 23],
+    "interval_seconds": 60,
+    "budget": None,
+}
+NUMERIC_FIELDS = {
+    "target_age_days": (1, 365),
+    "catch_up_days": (1, 90),
+    "max_percent_per_run": (1, 100),
+    "min_block_age_days": (0, 365),
+    "idle_for_seconds": (0, 86400),
+    "min_interval_seconds": (0, 86400),
+    "busy_disk_percent": (1.0, 100.0),
+    "busy_mbps": (1.0, 10_000.0),
+    "interval_seconds": (10, 3600),
+}
+MAX_RECENT_RUNS = 20
+
+
+class ScrubPlannerConfigError(Exception):
+    """Raised when a scrub planner configuration change is invalid."""
+
+
+def _mapping(value) -> Mapping:
+    return value if isinstance(value, Mapping) else {}
+
+
+def _number(value) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def due_percent(scrub: Mapping, target_age_days: int) -> float:
+    """Share of the array that is unscrubbed or last scrubbed ``target_age_days`` ago or more."""
+    due = _number(scrub.get("not_scrubbed_percent")) or 0.0
+    histogram = [item for item in scrub.get("histogram") or [] if isinstance(item, Mapping)]
+    if histogram:
+        total = sum(_number(item.get("percent")) or 0.0 for item in histogram)
+        old = sum(
+            _number(item.get("percent")) or 0.0
+            for item in histogram
+            if (_number(item.get("days_ago")) or 0.0) >= target_age_days
+        )
+        if total > 0:
+            # The chart is drawn to scale, not to 100%; normalise over the scrubbed share.
+            due += (100.0 - due) * old / total
+    else:
+        oldest = _number(scrub.get("oldest_days"))
+        median = _number(scrub.get("median_days"))
+        if median is not None and median >= target_age_days:
+            due = max(due, 50.0)
+        elif oldest is not None and oldest >= target_age_days:
+            due = max(due, 100.0 / target_age_days)
+    return min(100.0, due)
+
+
+class ScrubPlanner:
+    """Run SnapRAID scrub slices in idle windows to keep scrub age bounded."""
+
+    def __init__(
+        self,
+        *,
+        repository: ConfigRepository,
+        config_path_provider: Callable[[], str],
+        status_reader: Callable[[], Mapping | None],
+        scrub_runner: Callable[[int, int], None],
+        activity_reader: Callable[[], Mapping],
+        throughput_sampler: DiskThroughputSampler | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], datetime] = datetime.now,
+        logger: Callable[[str], None] = print,
+    ) -> None:
+        self._repository = repository
+        self._config_path_provider = config_path_provider
+        self._status_reader = status_reader
+        self._scrub_runner = scrub_runner
+        self._activity_reader = activity_reader
+        self._throughput = throughput_sampler or DiskThroughputSampler()
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._log = logger
+        self._lock = threading.Lock()
+        self._calm_since: float | None = None
+        self._last_run_at: float | None = None
+        self._last_reasons: list[str] = []
+        self._last_plan: dict | None = None
+        self._recent: deque[dict] = deque(maxlen=MAX_RECENT_RUNS)
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    # -- Config --------------------------------------------------------------
+
+    def load_config(self) -> dict:
+        """Read persisted settings and budget merged over defaults."""
+        try:
+            stored = self._repository.read_json(self._config_path_provider(), default={})
+        except Exception:
+            stored = {}
+        if not isinstance(stored, dict):
+            stored = {}
+        merged = dict(DEFAULT_CONFIG)
+        merged.update(stored)
+        return merged
+
+    def save_config(self, config: Mapping[str, Any]) -> None:
+        self._repository.write_json(self._config_path_provider(), dict(config))
+
+    def update_config(self, changes: Mapping[str, Any]) -> dict:
+        """Validate and persist selected fields."""
+        config = self.load_config()
+        if "enabled" in changes:
+            config["enabled"] = bool(changes["enabled"])
+        for field, (low, high) in NUMERIC_FIELDS.items():
+            if field not in changes:
+                continue
+            value = _number(changes[field])
+            if value is None or not low <= value <= high:
+                raise ScrubPlannerConfigError(f"{field} must be between {low} and {high}")
+            config[field] = int(value) if isinstance(low, int) else value
+        if "avoid_hours" in changes:
+            hours = changes["avoid_hours"]
+            if not isinstance(hours, list) or not all(
+                isinstance(hour, int) and not isinstance(hour, bool) and 0 <= hour <= 23
+                for hour in hours
+            ):
+                raise ScrubPlannerConfigError("avoid_hours must be a list of hours 0-23")
+            config["avoid_hours"] = sorted(set(hours))
+        self.save_config(config)
+        return self.status()
+
+    # -- Lifecycle -----------------------------------------------------------
+
+    def start(self) -> None:
+        """Begin evaluating in the background; safe to call more than once."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="scrub-planner", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stopping.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            interval = DEFAULT_CONFIG["interval_seconds"]
+            try:
+                interval = self.tick()
+            except Exception as error:
+                self._log(f"Scrub planner: evaluation failed: {error}")
+            self._stopping.wait(interval)
+
+    # -- Evaluation ----------------------------------------------------------
+
+    def tick(self) -> float:
+        """Evaluate once and run a scrub slice when idle and due; returns the next interval."""
+        config = self.load_config()
+        interval = float(config["interval_seconds"])
+        if not config["enabled"]:
+            # Prime the disk-throughput baseline only; polling media services
+            # for streams is left to enabled ticks.
+            try:
+                self._throughput.sample()
+            except Exception:
+                pass
+            with self._lock:
+                self._last_reasons = []
+            return interval
+        reasons = self.busy_reasons(config)
+        with self._lock:
+            self._last_reasons = reasons
+
+        now = self._clock()
+        if reasons:
+            self._calm_since = None
+            return interval
+        if self._calm_since is None:
+            self._calm_since = now
+        if now - self._calm_since < float(config["idle_for_seconds"]):
+            return interval
+        if (
+            self._last_run_at is not None
+            and now - self._last_run_at < float(config["min_interval_seconds"])
+        ):
+            return interval
+
+        plan = self.plan(config)
+        with self._lock:
+            self._last_plan = plan
+        if plan["percent"] <= 0:
+            return interval
+        self._scrub(config, plan)
+        return interval
+
+    def busy_reasons(self, config: Mapping) -> list[str]:
+        """Why now is not an idle window; empty when a slice may start."""
+        reasons = []
+        hour = self._wall_clock().hour
+        if hour in (config.get("avoid_hours") or []):
+            reasons.append(f"{hour:02d}:00 is a busy hour")
+        try:
+            streams = _mapping(self._activity_reader()).get("streams") or []
+        except Exception:
+            streams = []
+        playing = [item for item in streams if isinstance(item, Mapping) and not item.get("is_paused")]
+        if playing:
+            reasons.append(f"{len(playing)} active stream(s)")
+        try:
+            rates = self._throughput.sample()
+        except Exception:
+            rates = None
+        if rates:
+            busiest = max(rates.items(), key=lambda item: item[1]["busy_percent"])
+            if busiest[1]["busy_percent"] >= float(config["busy_disk_percent"]):
+                reasons.append(f"{busiest[0]} {busiest[1]['busy_percent']:.0f}% busy")
+            total_mbps = sum(rate["read_bps"] + rate["write_bps"] for rate in rates.values()) / 1e6
+            if total_mbps >= float(config["busy_mbps"]):
+                reasons.append(f"disk traffic {total_mbps:.0f} MB/s")
+        return reasons
+
+    def plan(self, config: Mapping) -> dict:
+        """Size the next slice from scrub ages and what today's budget has left."""
+        target = int(config["target_age_days"])
+        try:
+            model = self._status_reader()
+        except Exception as error:
+            return {"percent": 0, "reason": f"SnapRAID status unavailable: {error}"}
+        if not model:
+            return {"percent": 0, "reason": "SnapRAID status unavailable"}
+        if model.get("sync_in_progress"):
+            return {"percent": 0, "reason": "a sync is in progress"}
+        scrub = _mapping(model.get("scrub"))
+        due = due_percent(scrub, target)
+        daily = 100.0 / target + due / int(config["catch_up_days"])
+        spent = self._spent_today(config)
+        remaining = daily - spent
+        base = {"due_percent": round(due, 1), "daily_percent": round(daily, 1), "spent_percent": spent}
+        if remaining < 0.5:
+            return {**base, "percent": 0, "reason": "today's scrub budget is spent"}
+        percent = max(1, min(int(config["max_percent_per_run"]), math.ceil(remaining)))
+        older_than = int(config["min_block_age_days"])
+        return {
+            **base,
+            "percent": percent,
+            "older_than_days": older_than,
+            "reason": f"{due:.0f}% of the array is older than {target} days",
+        }
+
+    def _spent_today(self, config: Mapping) -> float:
+        budget = _mapping(config.get("budget"))
+        if budget.get("day") != self._wall_clock().date().isoformat():
+            return 0.0
+        return _number(budget.get("percent")) or 0.0
+
+    def _scrub(self, config: dict, plan: dict) -> None:
+        percent, older_than = plan["percent"], plan["older_than_days"]
+        started = self._clock()
+        self._last_run_at = started
+        try:
+            self._scrub_runner(percent, older_than)
+        except Exception as error:
+            self._note(percent, older_than, started, f"failed: {error}")
+            self._log(f"Scrub planner: scrub of {percent}% failed: {error}")
+            return
+        # The slice kept the disks busy; wait for a fresh quiet spell.
+        self._calm_since = None
+        day = self._wall_clock().date().isoformat()
+        config = self.load_config()
+        config["budget"] = {"day": day, "percent": self._spent_today(config) + percent}
+        self.save_config(config)
+        self._note(percent, older_than, started, "complete")
+        self._log(f"Scrub planner: scrubbed {percent}% (blocks older than {older_than} days)")
+
+    def _note(self, percent: int, older_than: int, started: float, result: str) -> None:
+        with self._lock:
+            self._recent.append(
+                {
+                    "at": self._wall_clock().isoformat(),
+                    "percent": percent,
+                    "older_than_days": older_than,
+                    "duration_seconds": round(self._clock() - started, 1),
+                    "result": result,
+                }
+            )
+
+    def status(self) -> dict:
+        config = self.load_config()
+        with self._lock:
+            recent = list(self._recent)
+            reasons = list(self._last_reasons)
+            plan = dict(self._last_plan) if self._last_plan else None
+        return {
+            "config": {key: value for key, value in config.items() if key != "budget"},
+            "spent_today_percent": self._spent_today(config),
+            "busy": reasons,
+            "last_plan": plan,
+            "recent_runs": recent[::-1],
+        }
@@ -4,11 +4,21 @@ Parses smartctl output and provides health status for drives.
 """
 
 import json
+import math
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional
 from dataclasses import dataclass, field, asdict
 
 
+# smartctl over a USB bridge can take seconds per drive; a few at a time keeps
+# one hub from being saturated while still overlapping the waits.
+DEFAULT_MAX_WORKERS = 3
+DEFAULT_DEVICE_TIMEOUT = 30
+# Slack on top of the smartctl timeouts before a device is given up on.
+BATCH_GRACE_SECONDS = 5
+
+
 @dataclass
 class SmartHealth:
     """SMART health data for a drive."""
@@ -220,13 +230,18 @@ def _calculate_health_status(health: SmartHealth):
         health.health_status = 'healthy'
 
 
-def get_smart_data(device: str, use_sat: bool = False) -> SmartHealth:
+def get_smart_data(
+    device: str,
+    use_sat: bool = False,
+    timeout: float = DEFAULT_DEVICE_TIMEOUT,
+) -> SmartHealth:
     """
     Get SMART data for a device by running smartctl.
 
     Args:
         device: Device path (e.g., /dev/sda)
         use_sat: Use SAT passthrough for USB drives (-d sat)
+        timeout: Seconds to allow each smartctl run
 
     Returns:
         SmartHealth object
@@ -243,7 +258,7 @@ def get_smart_data(device: str, use_sat: bool = False) -> SmartHealth:
             cmd,
             capture_output=True,
             text=True,
-            timeout=30
+            timeout=timeout
         )
 
         # smartctl returns non-zero for various reasons, try to parse anyway
@@ -257,7 +272,7 @@ def get_smart_data(device: str, use_sat: bool = False) -> SmartHealth:
 
         # If no output and not using SAT, try with SAT for USB drives
         if not use_sat and 'No such device' not in result.stderr:
-            return get_smart_data(device, use_sat=True)
+            return get_smart_data(device, use_sat=True, timeout=timeout)
 
         health.error_message = result.stderr or "No SMART data available"
 
@@ -271,14 +286,21 @@ def get_smart_data(device: str, use_sat: bool = False) -> SmartHealth:
     return health
 
 
-def get_all_smart_data() -> list:
+def get_all_smart_data(
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float = DEFAULT_DEVICE_TIMEOUT,
+) -> list:
     """
     Get SMART data for all block devices.
 
+    Devices are read concurrently, at most ``max_workers`` at a time. A device
+    that has not answered by the time the batch should have finished is
+    reported with an error instead of holding back the others.
+
     Returns:
-        List of SmartHealth objects
+        List of SmartHealth objects, in lsblk order
     """
-    results = []
+    devices = []
 
     try:
         # Get list of block devices
@@ -294,14 +316,35 @@ def get_all_smart_data() -> list:
                 continue
             parts = line.split()
             if len(parts) >= 2 and parts[1] == 'disk':
-                device = f"/dev/{parts[0]}"
-                health = get_smart_data(device)
-                results.append(health)
+                devices.append(f"/dev/{parts[0]}")
 
     except Exception:
         # Return empty list on error
-        pass
+        return []
 
+    if not devices:
+        return []
+
+    workers = max(1, min(int(max_workers), len(devices)))
+    # Each device may need a second, SAT, attempt; queued devices wait their turn.
+    budget = (timeout * 2 + BATCH_GRACE_SECONDS) * math.ceil(len(devices) / workers)
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="smart")
+    try:
+        futures = [pool.submit(get_smart_data, device, timeout=timeout) for device in devices]
+        wait(futures, timeout=budget)
+    finally:
+        # Never join a smartctl stuck in the kernel; its thread is abandoned.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    results = []
+    for device, future in zip(devices, futures):
+        if not future.done() or future.cancelled():
+            results.append(SmartHealth(device=device, error_message="Timeout reading SMART data"))
+            continue
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(SmartHealth(device=device, error_message=str(e)))
     return results
 
 
@@ -56,6 +56,10 @@ class SmartService:
                     "device": device,
                     "error_message": item.get("error", "No SMART data"),
                 }
+            # Sleeping drives are answered from the helper's last full read.
+            for key in ("power_state", "cached", "read_at"):
+                if key in item:
+                    data[key] = item[key]
             disks.append({"device": device, "data": data})
         return {"disks": disks}
 
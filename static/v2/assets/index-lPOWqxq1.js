@@ -494,13 +494,13 @@ Error generating stack: `+i.message+`
  *
  * This source code is licensed under the ISC license.
  * See the LICENSE file in the root directory of this source tree.
- */const n0=[["path",{d:"M18 6 6 18",key:"1bl5f8"}],["path",{d:"m6 6 12 12",key:"d8bk6v"}]],We=Z("x",n0);function Wx(e){var t,r,s="";if(typeof e=="string"||typeof e=="number")s+=e;else if(typeof e=="object")if(Array.isArray(e)){var a=e.length;for(t=0;t<a;t++)e[t]&&(r=Wx(e[t]))&&(s&&(s+=" "),s+=r)}else for(r in e)e[r]&&(s&&(s+=" "),s+=r);return s}function Gx(){for(var e,t,r=0,s="",a=arguments.length;r<a;r++)(e=arguments[r])&&(t=Wx(e))&&(s&&(s+=" "),s+=t);return s}const Km=e=>typeof e=="boolean"?`${e}`:e===0?"0":e,Qm=Gx,Kx=(e,t)=>r=>{var s;if(t?.variants==null)return Qm(e,r?.class,r?.className);const{variants:a,defaultVariants:i}=t,l=Object.keys(a).map(u=>{const h=r?.[u],m=i?.[u];if(h===null)return null;const f=Km(h)||Km(m);return a[u][f]}),o=r&&Object.entries(r).reduce((u,h)=>{let[m,f]=h;return f===void 0||(u[m]=f),u},{}),c=t==null||(s=t.compoundVariants)===null||s===void 0?void 0:s.reduce((u,h)=>{let{class:m,className:f,...w}=h;return Object.entries(w).every(j=>{let[y,b]=j;return Array.isArray(b)?b.includes({...i,...o}[y]):{...i,...o}[y]===b})?[...u,m,f]:u},[]);return Qm(e,l,c,r?.class,r?.className)},r0=(e,t)=>{const r=new Array(e.length+t.length);for(let s=0;s<e.length;s++)r[s]=e[s];for(let s=0;s<t.length;s++)r[e.length+s]=t[s];return r},s0=(e,t)=>({classGroupId:e,validator:t}),Qx=(e=new Map,t=null,r)=>({nextPart:e,validators:t,classGroupId:r}),ml="-",Jm=[],a0="arbitrary..",i0=e=>{const t=o0(e),{conflictingClassGroups:r,conflictingClassGroupModifiers:s}=e;return{getClassGroupId:l=>{if(l.startsWith("[")&&l.endsWith("]"))return l0(l);const o=l.split(ml),c=o[0]===""&&o.length>1?1:0;return Jx(o,c,t)},getConflictingClassGroupIds:(l,o)=>{if(o){const c=s[l],u=r[l];return c?u?r0(u,c):c:u||Jm}return r[l]||Jm}}},Jx=(e,t,r)=>{if(e.length-t===0)return r.classGroupId;const a=e[t],i=r.nextPart.get(a);if(i){const u=Jx(e,t+1,i);if(u)return u}const l=r.validators;if(l===null)return;const o=t===0?e.join(ml):e.slice(t).join(ml),c=l.length;for(let u=0;u<c;u++){const h=l[u];if(h.validator(o))return h.classGroupId}},l0=e=>e.slice(1,-1).indexOf(":")===-1?void 0:(()=>{const t=e.slice(1,-1),r=t.indexOf(":"),s=t.slice(0,r);return s?a0+s:void 0})(),o0=e=>{const{theme:t,classGroups:r}=e;return c0(r,t)},c0=(e,t)=>{const r=Qx();for(const s in e){const a=e[s];cu(a,r,s,t)}return r},cu=(e,t,r,s)=>{const a=e.length;for(let i=0;i<a;i++){const l=e[i];d0(l,t,r,s)}},d0=(e,t,r,s)=>{if(typeof e=="string"){u0(e,t,r);return}if(typeof e=="function"){m0(e,t,r,s);return}p0(e,t,r,s)},u0=(e,t,r)=>{const s=e===""?t:Yx(t,e);s.classGroupId=r},m0=(e,t,r,s)=>{if(f0(e)){cu(e(s),t,r,s);return}t.validators===null&&(t.validators=[]),t.validators.push(s0(r,e))},p0=(e,t,r,s)=>{const a=Object.entries(e),i=a.length;for(let l=0;l<i;l++){const[o,c]=a[l];cu(c,Yx(t,o),r,s)}},Yx=(e,t)=>{let r=e;const s=t.split(ml),a=s.length;for(let i=0;i<a;i++){const l=s[i];let o=r.nextPart.get(l);o||(o=Qx(),r.nextPart.set(l,o)),r=o}return r},f0=e=>"isThemeGetter"in e&&e.isThemeGetter===!0,h0=e=>{if(e<1)return{get:()=>{},set:()=>{}};let t=0,r=Object.create(null),s=Object.create(null);const a=(i,l)=>{r[i]=l,t++,t>e&&(t=0,s=r,r=Object.create(null))};return{get(i){let l=r[i];if(l!==void 0)return l;if((l=s[i])!==void 0)return a(i,l),l},set(i,l){i in r?r[i]=l:a(i,l)}}},Jc="!",Ym=":",x0=[],Xm=(e,t,r,s,a)=>({modifiers:e,hasImportantModifier:t,baseClassName:r,maybePostfixModifierPosition:s,isExternal:a}),g0=e=>{const{prefix:t,experimentalParseClassName:r}=e;let s=a=>{const i=[];let l=0,o=0,c=0,u;const h=a.length;for(let y=0;y<h;y++){const b=a[y];if(l===0&&o===0){if(b===Ym){i.push(a.slice(c,y)),c=y+1;continue}if(b==="/"){u=y;continue}}b==="["?l++:b==="]"?l--:b==="("?o++:b===")"&&o--}const m=i.length===0?a:a.slice(c);let f=m,w=!1;m.endsWith(Jc)?(f=m.slice(0,-1),w=!0):m.startsWith(Jc)&&(f=m.slice(1),w=!0);const j=u&&u>c?u-c:void 0;return Xm(i,w,f,j)};if(t){const a=t+Ym,i=s;s=l=>l.startsWith(a)?i(l.slice(a.length)):Xm(x0,!1,l,void 0,!0)}if(r){const a=s;s=i=>r({className:i,parseClassName:a})}return s},v0=e=>{const t=new Map;return e.orderSensitiveModifiers.forEach((r,s)=>{t.set(r,1e6+s)}),r=>{const s=[];let a=[];for(let i=0;i<r.length;i++){const l=r[i],o=l[0]==="[",c=t.has(l);o||c?(a.length>0&&(a.sort(),s.push(...a),a=[]),s.push(l)):a.push(l)}return a.length>0&&(a.sort(),s.push(...a)),s}},y0=e=>({cache:h0(e.cacheSize),parseClassName:g0(e),sortModifiers:v0(e),...i0(e)}),b0=/\s+/,j0=(e,t)=>{const{parseClassName:r,getClassGroupId:s,getConflictingClassGroupIds:a,sortModifiers:i}=t,l=[],o=e.trim().split(b0);let c="";for(let u=o.length-1;u>=0;u-=1){const h=o[u],{isExternal:m,modifiers:f,hasImportantModifier:w,baseClassName:j,maybePostfixModifierPosition:y}=r(h);if(m){c=h+(c.length>0?" "+c:c);continue}let b=!!y,v=s(b?j.substring(0,y):j);if(!v){if(!b){c=h+(c.length>0?" "+c:c);continue}if(v=s(j),!v){c=h+(c.length>0?" "+c:c);continue}b=!1}const p=f.length===0?"":f.length===1?f[0]:i(f).join(":"),x=w?p+Jc:p,g=x+v;if(l.indexOf(g)>-1)continue;l.push(g);const N=a(v,b);for(let E=0;E<N.length;++E){const C=N[E];l.push(x+C)}c=h+(c.length>0?" "+c:c)}return c},w0=(...e)=>{let t=0,r,s,a="";for(;t<e.length;)(r=e[t++])&&(s=Xx(r))&&(a&&(a+=" "),a+=s);return a},Xx=e=>{if(typeof e=="string")return e;let t,r="";for(let s=0;s<e.length;s++)e[s]&&(t=Xx(e[s]))&&(r&&(r+=" "),r+=t);return r},N0=(e,...t)=>{let r,s,a,i;const l=c=>{const u=t.reduce((h,m)=>m(h),e());return r=y0(u),s=r.cache.get,a=r.cache.set,i=o,o(c)},o=c=>{const u=s(c);if(u)return u;const h=j0(c,r);return a(c,h),h};return i=l,(...c)=>i(w0(...c))},k0=[],et=e=>{const t=r=>r[e]||k0;return t.isThemeGetter=!0,t},Zx=/^\[(?:(\w[\w-]*):)?(.+)\]$/i,eg=/^\((?:(\w[\w-]*):)?(.+)\)$/i,S0=/^\d+(?:\.\d+)?\/\d+(?:\.\d+)?$/,_0=/^(\d+(\.\d+)?)?(xs|sm|md|lg|xl)$/,C0=/\d+(%|px|r?em|[sdl]?v([hwib]|min|max)|pt|pc|in|cm|mm|cap|ch|ex|r?lh|cq(w|h|i|b|min|max))|\b(calc|min|max|clamp)\(.+\)|^0$/,E0=/^(rgba?|hsla?|hwb|(ok)?(lab|lch)|color-mix)\(.+\)$/,A0=/^(inset_)?-?((\d+)?\.?(\d+)[a-z]+|0)_-?((\d+)?\.?(\d+)[a-z]+|0)/,P0=/^(url|image|image-set|cross-fade|element|(repeating-)?(linear|radial|conic)-gradient)\(.+\)$/,On=e=>S0.test(e),be=e=>!!e&&!Number.isNaN(Number(e)),Dn=e=>!!e&&Number.isInteger(Number(e)),Ro=e=>e.endsWith("%")&&be(e.slice(0,-1)),jn=e=>_0.test(e),tg=()=>!0,R0=e=>C0.test(e)&&!E0.test(e),du=()=>!1,M0=e=>A0.test(e),T0=e=>P0.test(e),$0=e=>!le(e)&&!oe(e),I0=e=>dr(e,sg,du),le=e=>Zx.test(e),fr=e=>dr(e,ag,R0),Zm=e=>dr(e,V0,be),L0=e=>dr(e,lg,tg),z0=e=>dr(e,ig,du),ep=e=>dr(e,ng,du),O0=e=>dr(e,rg,T0),mi=e=>dr(e,og,M0),oe=e=>eg.test(e),zs=e=>Ir(e,ag),D0=e=>Ir(e,ig),tp=e=>Ir(e,ng),U0=e=>Ir(e,sg),B0=e=>Ir(e,rg),pi=e=>Ir(e,og,!0),F0=e=>Ir(e,lg,!0),dr=(e,t,r)=>{const s=Zx.exec(e);return s?s[1]?t(s[1]):r(s[2]):!1},Ir=(e,t,r=!1)=>{const s=eg.exec(e);return s?s[1]?t(s[1]):r:!1},ng=e=>e==="position"||e==="percentage",rg=e=>e==="image"||e==="url",sg=e=>e==="length"||e==="size"||e==="bg-size",ag=e=>e==="length",V0=e=>e==="number",ig=e=>e==="family-name",lg=e=>e==="number"||e==="weight",og=e=>e==="shadow",q0=()=>{const e=et("color"),t=et("font"),r=et("text"),s=et("font-weight"),a=et("tracking"),i=et("leading"),l=et("breakpoint"),o=et("container"),c=et("spacing"),u=et("radius"),h=et("shadow"),m=et("inset-shadow"),f=et("text-shadow"),w=et("drop-shadow"),j=et("blur"),y=et("perspective"),b=et("aspect"),v=et("ease"),p=et("animate"),x=()=>["auto","avoid","all","avoid-page","page","left","right","column"],g=()=>["center","top","bottom","left","right","top-left","left-top","top-right","right-top","bottom-right","right-bottom","bottom-left","left-bottom"],N=()=>[...g(),oe,le],E=()=>["auto","hidden","clip","visible","scroll"],C=()=>["auto","contain","none"],k=()=>[oe,le,c],O=()=>[On,"full","auto",...k()],S=()=>[Dn,"none","subgrid",oe,le],$=()=>["auto",{span:["full",Dn,oe,le]},Dn,oe,le],R=()=>[Dn,"auto",oe,le],H=()=>["auto","min","max","fr",oe,le],I=()=>["start","end","center","between","around","evenly","stretch","baseline","center-safe","end-safe"],U=()=>["start","end","center","stretch","center-safe","end-safe"],L=()=>["auto",...k()],B=()=>[On,"auto","full","dvw","dvh","lvw","lvh","svw","svh","min","max","fit",...k()],P=()=>[On,"screen","full","dvw","lvw","svw","min","max","fit",...k()],M=()=>[On,"screen","full","lh","dvh","lvh","svh","min","max","fit",...k()],A=()=>[e,oe,le],F=()=>[...g(),tp,ep,{position:[oe,le]}],D=()=>["no-repeat",{repeat:["","x","y","space","round"]}],G=()=>["auto","cover","contain",U0,I0,{size:[oe,le]}],se=()=>[Ro,zs,fr],de=()=>["","none","full",u,oe,le],ue=()=>["",be,zs,fr],Ce=()=>["solid","dashed","dotted","double"],Re=()=>["normal","multiply","screen","overlay","darken","lighten","color-dodge","color-burn","hard-light","soft-light","difference","exclusion","hue","saturation","color","luminosity"],pe=()=>[be,Ro,tp,ep],Ft=()=>["","none",j,oe,le],kt=()=>["none",be,oe,le],rt=()=>["none",be,oe,le],vt=()=>[be,oe,le],Xe=()=>[On,"full",...k()];return{cacheSize:500,theme:{animate:["spin","ping","pulse","bounce"],aspect:["video"],blur:[jn],breakpoint:[jn],color:[tg],container:[jn],"drop-shadow":[jn],ease:["in","out","in-out"],font:[$0],"font-weight":["thin","extralight","light","normal","medium","semibold","bold","extrabold","black"],"inset-shadow":[jn],leading:["none","tight","snug","normal","relaxed","loose"],perspective:["dramatic","near","normal","midrange","distant","none"],radius:[jn],shadow:[jn],spacing:["px",be],text:[jn],"text-shadow":[jn],tracking:["tighter","tight","normal","wide","wider","widest"]},classGroups:{aspect:[{aspect:["auto","square",On,le,oe,b]}],container:["container"],columns:[{columns:[be,le,oe,o]}],"break-after":[{"break-after":x()}],"break-before":[{"break-before":x()}],"break-inside":[{"break-inside":["auto","avoid","avoid-page","avoid-column"]}],"box-decoration":[{"box-decoration":["slice","clone"]}],box:[{box:["border","content"]}],display:["block","inline-block","inline","flex","inline-flex","table","inline-table","table-caption","table-cell","table-column","table-column-group","table-footer-group","table-header-group","table-row-group","table-row","flow-root","grid","inline-grid","contents","list-item","hidden"],sr:["sr-only","not-sr-only"],float:[{float:["right","left","none","start","end"]}],clear:[{clear:["left","right","both","none","start","end"]}],isolation:["isolate","isolation-auto"],"object-fit":[{object:["contain","cover","fill","none","scale-down"]}],"object-position":[{object:N()}],overflow:[{overflow:E()}],"overflow-x":[{"overflow-x":E()}],"overflow-y":[{"overflow-y":E()}],overscroll:[{overscroll:C()}],"overscroll-x":[{"overscroll-x":C()}],"overscroll-y":[{"overscroll-y":C()}],position:["static","fixed","absolute","relative","sticky"],inset:[{inset:O()}],"inset-x":[{"inset-x":O()}],"inset-y":[{"inset-y":O()}],start:[{"inset-s":O(),start:O()}],end:[{"inset-e":O(),end:O()}],"inset-bs":[{"inset-bs":O()}],"inset-be":[{"inset-be":O()}],top:[{top:O()}],right:[{right:O()}],bottom:[{bottom:O()}],left:[{left:O()}],visibility:["visible","invisible","collapse"],z:[{z:[Dn,"auto",oe,le]}],basis:[{basis:[On,"full","auto",o,...k()]}],"flex-direction":[{flex:["row","row-reverse","col","col-reverse"]}],"flex-wrap":[{flex:["nowrap","wrap","wrap-reverse"]}],flex:[{flex:[be,On,"auto","initial","none",le]}],grow:[{grow:["",be,oe,le]}],shrink:[{shrink:["",be,oe,le]}],order:[{order:[Dn,"first","last","none",oe,le]}],"grid-cols":[{"grid-cols":S()}],"col-start-end":[{col:$()}],"col-start":[{"col-start":R()}],"col-end":[{"col-end":R()}],"grid-rows":[{"grid-rows":S()}],"row-start-end":[{row:$()}],"row-start":[{"row-start":R()}],"row-end":[{"row-end":R()}],"grid-flow":[{"grid-flow":["row","col","dense","row-dense","col-dense"]}],"auto-cols":[{"auto-cols":H()}],"auto-rows":[{"auto-rows":H()}],gap:[{gap:k()}],"gap-x":[{"gap-x":k()}],"gap-y":[{"gap-y":k()}],"justify-content":[{justify:[...I(),"normal"]}],"justify-items":[{"justify-items":[...U(),"normal"]}],"justify-self":[{"justify-self":["auto",...U()]}],"align-content":[{content:["normal",...I()]}],"align-items":[{items:[...U(),{baseline:["","last"]}]}],"align-self":[{self:["auto",...U(),{baseline:["","last"]}]}],"place-content":[{"place-content":I()}],"place-items":[{"place-items":[...U(),"baseline"]}],"place-self":[{"place-self":["auto",...U()]}],p:[{p:k()}],px:[{px:k()}],py:[{py:k()}],ps:[{ps:k()}],pe:[{pe:k()}],pbs:[{pbs:k()}],pbe:[{pbe:k()}],pt:[{pt:k()}],pr:[{pr:k()}],pb:[{pb:k()}],pl:[{pl:k()}],m:[{m:L()}],mx:[{mx:L()}],my:[{my:L()}],ms:[{ms:L()}],me:[{me:L()}],mbs:[{mbs:L()}],mbe:[{mbe:L()}],mt:[{mt:L()}],mr:[{mr:L()}],mb:[{mb:L()}],ml:[{ml:L()}],"space-x":[{"space-x":k()}],"space-x-reverse":["space-x-reverse"],"space-y":[{"space-y":k()}],"space-y-reverse":["space-y-reverse"],size:[{size:B()}],"inline-size":[{inline:["auto",...P()]}],"min-inline-size":[{"min-inline":["auto",...P()]}],"max-inline-size":[{"max-inline":["none",...P()]}],"block-size":[{block:["auto",...M()]}],"min-block-size":[{"min-block":["auto",...M()]}],"max-block-size":[{"max-block":["none",...M()]}],w:[{w:[o,"screen",...B()]}],"min-w":[{"min-w":[o,"screen","none",...B()]}],"max-w":[{"max-w":[o,"screen","none","prose",{screen:[l]},...B()]}],h:[{h:["screen","lh",...B()]}],"min-h":[{"min-h":["screen","lh","none",...B()]}],"max-h":[{"max-h":["screen","lh",...B()]}],"font-size":[{text:["base",r,zs,fr]}],"font-smoothing":["antialiased","subpixel-antialiased"],"font-style":["italic","not-italic"],"font-weight":[{font:[s,F0,L0]}],"font-stretch":[{"font-stretch":["ultra-condensed","extra-condensed","condensed","semi-condensed","normal","semi-expanded","expanded","extra-expanded","ultra-expanded",Ro,le]}],"font-family":[{font:[D0,z0,t]}],"font-features":[{"font-features":[le]}],"fvn-normal":["normal-nums"],"fvn-ordinal":["ordinal"],"fvn-slashed-zero":["slashed-zero"],"fvn-figure":["lining-nums","oldstyle-nums"],"fvn-spacing":["proportional-nums","tabular-nums"],"fvn-fraction":["diagonal-fractions","stacked-fractions"],tracking:[{tracking:[a,oe,le]}],"line-clamp":[{"line-clamp":[be,"none",oe,Zm]}],leading:[{leading:[i,...k()]}],"list-image":[{"list-image":["none",oe,le]}],"list-style-position":[{list:["inside","outside"]}],"list-style-type":[{list:["disc","decimal","none",oe,le]}],"text-alignment":[{text:["left","center","right","justify","start","end"]}],"placeholder-color":[{placeholder:A()}],"text-color":[{text:A()}],"text-decoration":["underline","overline","line-through","no-underline"],"text-decoration-style":[{decoration:[...Ce(),"wavy"]}],"text-decoration-thickness":[{decoration:[be,"from-font","auto",oe,fr]}],"text-decoration-color":[{decoration:A()}],"underline-offset":[{"underline-offset":[be,"auto",oe,le]}],"text-transform":["uppercase","lowercase","capitalize","normal-case"],"text-overflow":["truncate","text-ellipsis","text-clip"],"text-wrap":[{text:["wrap","nowrap","balance","pretty"]}],indent:[{indent:k()}],"vertical-align":[{align:["baseline","top","middle","bottom","text-top","text-bottom","sub","super",oe,le]}],whitespace:[{whitespace:["normal","nowrap","pre","pre-line","pre-wrap","break-spaces"]}],break:[{break:["normal","words","all","keep"]}],wrap:[{wrap:["break-word","anywhere","normal"]}],hyphens:[{hyphens:["none","manual","auto"]}],content:[{content:["none",oe,le]}],"bg-attachment":[{bg:["fixed","local","scroll"]}],"bg-clip":[{"bg-clip":["border","padding","content","text"]}],"bg-origin":[{"bg-origin":["border","padding","content"]}],"bg-position":[{bg:F()}],"bg-repeat":[{bg:D()}],"bg-size":[{bg:G()}],"bg-image":[{bg:["none",{linear:[{to:["t","tr","r","br","b","bl","l","tl"]},Dn,oe,le],radial:["",oe,le],conic:[Dn,oe,le]},B0,O0]}],"bg-color":[{bg:A()}],"gradient-from-pos":[{from:se()}],"gradient-via-pos":[{via:se()}],"gradient-to-pos":[{to:se()}],"gradient-from":[{from:A()}],"gradient-via":[{via:A()}],"gradient-to":[{to:A()}],rounded:[{rounded:de()}],"rounded-s":[{"rounded-s":de()}],"rounded-e":[{"rounded-e":de()}],"rounded-t":[{"rounded-t":de()}],"rounded-r":[{"rounded-r":de()}],"rounded-b":[{"rounded-b":de()}],"rounded-l":[{"rounded-l":de()}],"rounded-ss":[{"rounded-ss":de()}],"rounded-se":[{"rounded-se":de()}],"rounded-ee":[{"rounded-ee":de()}],"rounded-es":[{"rounded-es":de()}],"rounded-tl":[{"rounded-tl":de()}],"rounded-tr":[{"rounded-tr":de()}],"rounded-br":[{"rounded-br":de()}],"rounded-bl":[{"rounded-bl":de()}],"border-w":[{border:ue()}],"border-w-x":[{"border-x":ue()}],"border-w-y":[{"border-y":ue()}],"border-w-s":[{"border-s":ue()}],"border-w-e":[{"border-e":ue()}],"border-w-bs":[{"border-bs":ue()}],"border-w-be":[{"border-be":ue()}],"border-w-t":[{"border-t":ue()}],"border-w-r":[{"border-r":ue()}],"border-w-b":[{"border-b":ue()}],"border-w-l":[{"border-l":ue()}],"divide-x":[{"divide-x":ue()}],"divide-x-reverse":["divide-x-reverse"],"divide-y":[{"divide-y":ue()}],"divide-y-reverse":["divide-y-reverse"],"border-style":[{border:[...Ce(),"hidden","none"]}],"divide-style":[{divide:[...Ce(),"hidden","none"]}],"border-color":[{border:A()}],"border-color-x":[{"border-x":A()}],"border-color-y":[{"border-y":A()}],"border-color-s":[{"border-s":A()}],"border-color-e":[{"border-e":A()}],"border-color-bs":[{"border-bs":A()}],"border-color-be":[{"border-be":A()}],"border-color-t":[{"border-t":A()}],"border-color-r":[{"border-r":A()}],"border-color-b":[{"border-b":A()}],"border-color-l":[{"border-l":A()}],"divide-color":[{divide:A()}],"outline-style":[{outline:[...Ce(),"none","hidden"]}],"outline-offset":[{"outline-offset":[be,oe,le]}],"outline-w":[{outline:["",be,zs,fr]}],"outline-color":[{outline:A()}],shadow:[{shadow:["","none",h,pi,mi]}],"shadow-color":[{shadow:A()}],"inset-shadow":[{"inset-shadow":["none",m,pi,mi]}],"inset-shadow-color":[{"inset-shadow":A()}],"ring-w":[{ring:ue()}],"ring-w-inset":["ring-inset"],"ring-color":[{ring:A()}],"ring-offset-w":[{"ring-offset":[be,fr]}],"ring-offset-color":[{"ring-offset":A()}],"inset-ring-w":[{"inset-ring":ue()}],"inset-ring-color":[{"inset-ring":A()}],"text-shadow":[{"text-shadow":["none",f,pi,mi]}],"text-shadow-color":[{"text-shadow":A()}],opacity:[{opacity:[be,oe,le]}],"mix-blend":[{"mix-blend":[...Re(),"plus-darker","plus-lighter"]}],"bg-blend":[{"bg-blend":Re()}],"mask-clip":[{"mask-clip":["border","padding","content","fill","stroke","view"]},"mask-no-clip"],"mask-composite":[{mask:["add","subtract","intersect","exclude"]}],"mask-image-linear-pos":[{"mask-linear":[be]}],"mask-image-linear-from-pos":[{"mask-linear-from":pe()}],"mask-image-linear-to-pos":[{"mask-linear-to":pe()}],"mask-image-linear-from-color":[{"mask-linear-from":A()}],"mask-image-linear-to-color":[{"mask-linear-to":A()}],"mask-image-t-from-pos":[{"mask-t-from":pe()}],"mask-image-t-to-pos":[{"mask-t-to":pe()}],"mask-image-t-from-color":[{"mask-t-from":A()}],"mask-image-t-to-color":[{"mask-t-to":A()}],"mask-image-r-from-pos":[{"mask-r-from":pe()}],"mask-image-r-to-pos":[{"mask-r-to":pe()}],"mask-image-r-from-color":[{"mask-r-from":A()}],"mask-image-r-to-color":[{"mask-r-to":A()}],"mask-image-b-from-pos":[{"mask-b-from":pe()}],"mask-image-b-to-pos":[{"mask-b-to":pe()}],"mask-image-b-from-color":[{"mask-b-from":A()}],"mask-image-b-to-color":[{"mask-b-to":A()}],"mask-image-l-from-pos":[{"mask-l-from":pe()}],"mask-image-l-to-pos":[{"mask-l-to":pe()}],"mask-image-l-from-color":[{"mask-l-from":A()}],"mask-image-l-to-color":[{"mask-l-to":A()}],"mask-image-x-from-pos":[{"mask-x-from":pe()}],"mask-image-x-to-pos":[{"mask-x-to":pe()}],"mask-image-x-from-color":[{"mask-x-from":A()}],"mask-image-x-to-color":[{"mask-x-to":A()}],"mask-image-y-from-pos":[{"mask-y-from":pe()}],"mask-image-y-to-pos":[{"mask-y-to":pe()}],"mask-image-y-from-color":[{"mask-y-from":A()}],"mask-image-y-to-color":[{"mask-y-to":A()}],"mask-image-radial":[{"mask-radial":[oe,le]}],"mask-image-radial-from-pos":[{"mask-radial-from":pe()}],"mask-image-radial-to-pos":[{"mask-radial-to":pe()}],"mask-image-radial-from-color":[{"mask-radial-from":A()}],"mask-image-radial-to-color":[{"mask-radial-to":A()}],"mask-image-radial-shape":[{"mask-radial":["circle","ellipse"]}],"mask-image-radial-size":[{"mask-radial":[{closest:["side","corner"],farthest:["side","corner"]}]}],"mask-image-radial-pos":[{"mask-radial-at":g()}],"mask-image-conic-pos":[{"mask-conic":[be]}],"mask-image-conic-from-pos":[{"mask-conic-from":pe()}],"mask-image-conic-to-pos":[{"mask-conic-to":pe()}],"mask-image-conic-from-color":[{"mask-conic-from":A()}],"mask-image-conic-to-color":[{"mask-conic-to":A()}],"mask-mode":[{mask:["alpha","luminance","match"]}],"mask-origin":[{"mask-origin":["border","padding","content","fill","stroke","view"]}],"mask-position":[{mask:F()}],"mask-repeat":[{mask:D()}],"mask-size":[{mask:G()}],"mask-type":[{"mask-type":["alpha","luminance"]}],"mask-image":[{mask:["none",oe,le]}],filter:[{filter:["","none",oe,le]}],blur:[{blur:Ft()}],brightness:[{brightness:[be,oe,le]}],contrast:[{contrast:[be,oe,le]}],"drop-shadow":[{"drop-shadow":["","none",w,pi,mi]}],"drop-shadow-color":[{"drop-shadow":A()}],grayscale:[{grayscale:["",be,oe,le]}],"hue-rotate":[{"hue-rotate":[be,oe,le]}],invert:[{invert:["",be,oe,le]}],saturate:[{saturate:[be,oe,le]}],sepia:[{sepia:["",be,oe,le]}],"backdrop-filter":[{"backdrop-filter":["","none",oe,le]}],"backdrop-blur":[{"backdrop-blur":Ft()}],"backdrop-brightness":[{"backdrop-brightness":[be,oe,le]}],"backdrop-contrast":[{"backdrop-contrast":[be,oe,le]}],"backdrop-grayscale":[{"backdrop-grayscale":["",be,oe,le]}],"backdrop-hue-rotate":[{"backdrop-hue-rotate":[be,oe,le]}],"backdrop-invert":[{"backdrop-invert":["",be,oe,le]}],"backdrop-opacity":[{"backdrop-opacity":[be,oe,le]}],"backdrop-saturate":[{"backdrop-saturate":[be,oe,le]}],"backdrop-sepia":[{"backdrop-sepia":["",be,oe,le]}],"border-collapse":[{border:["collapse","separate"]}],"border-spacing":[{"border-spacing":k()}],"border-spacing-x":[{"border-spacing-x":k()}],"border-spacing-y":[{"border-spacing-y":k()}],"table-layout":[{table:["auto","fixed"]}],caption:[{caption:["top","bottom"]}],transition:[{transition:["","all","colors","opacity","shadow","transform","none",oe,le]}],"transition-behavior":[{transition:["normal","discrete"]}],duration:[{duration:[be,"initial",oe,le]}],ease:[{ease:["linear","initial",v,oe,le]}],delay:[{delay:[be,oe,le]}],animate:[{animate:["none",p,oe,le]}],backface:[{backface:["hidden","visible"]}],perspective:[{perspective:[y,oe,le]}],"perspective-origin":[{"perspective-origin":N()}],rotate:[{rotate:kt()}],"rotate-x":[{"rotate-x":kt()}],"rotate-y":[{"rotate-y":kt()}],"rotate-z":[{"rotate-z":kt()}],scale:[{scale:rt()}],"scale-x":[{"scale-x":rt()}],"scale-y":[{"scale-y":rt()}],"scale-z":[{"scale-z":rt()}],"scale-3d":["scale-3d"],skew:[{skew:vt()}],"skew-x":[{"skew-x":vt()}],"skew-y":[{"skew-y":vt()}],transform:[{transform:[oe,le,"","none","gpu","cpu"]}],"transform-origin":[{origin:N()}],"transform-style":[{transform:["3d","flat"]}],translate:[{translate:Xe()}],"translate-x":[{"translate-x":Xe()}],"translate-y":[{"translate-y":Xe()}],"translate-z":[{"translate-z":Xe()}],"translate-none":["translate-none"],accent:[{accent:A()}],appearance:[{appearance:["none","auto"]}],"caret-color":[{caret:A()}],"color-scheme":[{scheme:["normal","dark","light","light-dark","only-dark","only-light"]}],cursor:[{cursor:["auto","default","pointer","wait","text","move","help","not-allowed","none","context-menu","progress","cell","crosshair","vertical-text","alias","copy","no-drop","grab","grabbing","all-scroll","col-resize","row-resize","n-resize","e-resize","s-resize","w-resize","ne-resize","nw-resize","se-resize","sw-resize","ew-resize","ns-resize","nesw-resize","nwse-resize","zoom-in","zoom-out",oe,le]}],"field-sizing":[{"field-sizing":["fixed","content"]}],"pointer-events":[{"pointer-events":["auto","none"]}],resize:[{resize:["none","","y","x"]}],"scroll-behavior":[{scroll:["auto","smooth"]}],"scroll-m":[{"scroll-m":k()}],"scroll-mx":[{"scroll-mx":k()}],"scroll-my":[{"scroll-my":k()}],"scroll-ms":[{"scroll-ms":k()}],"scroll-me":[{"scroll-me":k()}],"scroll-mbs":[{"scroll-mbs":k()}],"scroll-mbe":[{"scroll-mbe":k()}],"scroll-mt":[{"scroll-mt":k()}],"scroll-mr":[{"scroll-mr":k()}],"scroll-mb":[{"scroll-mb":k()}],"scroll-ml":[{"scroll-ml":k()}],"scroll-p":[{"scroll-p":k()}],"scroll-px":[{"scroll-px":k()}],"scroll-py":[{"scroll-py":k()}],"scroll-ps":[{"scroll-ps":k()}],"scroll-pe":[{"scroll-pe":k()}],"scroll-pbs":[{"scroll-pbs":k()}],"scroll-pbe":[{"scroll-pbe":k()}],"scroll-pt":[{"scroll-pt":k()}],"scroll-pr":[{"scroll-pr":k()}],"scroll-pb":[{"scroll-pb":k()}],"scroll-pl":[{"scroll-pl":k()}],"snap-align":[{snap:["start","end","center","align-none"]}],"snap-stop":[{snap:["normal","always"]}],"snap-type":[{snap:["none","x","y","both"]}],"snap-strictness":[{snap:["mandatory","proximity"]}],touch:[{touch:["auto","none","manipulation"]}],"touch-x":[{"touch-pan":["x","left","right"]}],"touch-y":[{"touch-pan":["y","up","down"]}],"touch-pz":["touch-pinch-zoom"],select:[{select:["none","text","all","auto"]}],"will-change":[{"will-change":["auto","scroll","contents","transform",oe,le]}],fill:[{fill:["none",...A()]}],"stroke-w":[{stroke:[be,zs,fr,Zm]}],stroke:[{stroke:["none",...A()]}],"forced-color-adjust":[{"forced-color-adjust":["auto","none"]}]},conflictingClassGroups:{overflow:["overflow-x","overflow-y"],overscroll:["overscroll-x","overscroll-y"],inset:["inset-x","inset-y","inset-bs","inset-be","start","end","top","right","bottom","left"],"inset-x":["right","left"],"inset-y":["top","bottom"],flex:["basis","grow","shrink"],gap:["gap-x","gap-y"],p:["px","py","ps","pe","pbs","pbe","pt","pr","pb","pl"],px:["pr","pl"],py:["pt","pb"],m:["mx","my","ms","me","mbs","mbe","mt","mr","mb","ml"],mx:["mr","ml"],my:["mt","mb"],size:["w","h"],"font-size":["leading"],"fvn-normal":["fvn-ordinal","fvn-slashed-zero","fvn-figure","fvn-spacing","fvn-fraction"],"fvn-ordinal":["fvn-normal"],"fvn-slashed-zero":["fvn-normal"],"fvn-figure":["fvn-normal"],"fvn-spacing":["fvn-normal"],"fvn-fraction":["fvn-normal"],"line-clamp":["display","overflow"],rounded:["rounded-s","rounded-e","rounded-t","rounded-r","rounded-b","rounded-l","rounded-ss","rounded-se","rounded-ee","rounded-es","rounded-tl","rounded-tr","rounded-br","rounded-bl"],"rounded-s":["rounded-ss","rounded-es"],"rounded-e":["rounded-se","rounded-ee"],"rounded-t":["rounded-tl","rounded-tr"],"rounded-r":["rounded-tr","rounded-br"],"rounded-b":["rounded-br","rounded-bl"],"rounded-l":["rounded-tl","rounded-bl"],"border-spacing":["border-spacing-x","border-spacing-y"],"border-w":["border-w-x","border-w-y","border-w-s","border-w-e","border-w-bs","border-w-be","border-w-t","border-w-r","border-w-b","border-w-l"],"border-w-x":["border-w-r","border-w-l"],"border-w-y":["border-w-t","border-w-b"],"border-color":["border-color-x","border-color-y","border-color-s","border-color-e","border-color-bs","border-color-be","border-color-t","border-color-r","border-color-b","border-color-l"],"border-color-x":["border-color-r","border-color-l"],"border-color-y":["border-color-t","border-color-b"],translate:["translate-x","translate-y","translate-none"],"translate-none":["translate","translate-x","translate-y","translate-z"],"scroll-m":["scroll-mx","scroll-my","scroll-ms","scroll-me","scroll-mbs","scroll-mbe","scroll-mt","scroll-mr","scroll-mb","scroll-ml"],"scroll-mx":["scroll-mr","scroll-ml"],"scroll-my":["scroll-mt","scroll-mb"],"scroll-p":["scroll-px","scroll-py","scroll-ps","scroll-pe","scroll-pbs","scroll-pbe","scroll-pt","scroll-pr","scroll-pb","scroll-pl"],"scroll-px":["scroll-pr","scroll-pl"],"scroll-py":["scroll-pt","scroll-pb"],touch:["touch-x","touch-y","touch-pz"],"touch-x":["touch"],"touch-y":["touch"],"touch-pz":["touch"]},conflictingClassGroupModifiers:{"font-size":["leading"]},orderSensitiveModifiers:["*","**","after","backdrop","before","details-content","file","first-letter","first-line","marker","placeholder","selection"]}},H0=N0(q0);function q(...e){return H0(Gx(e))}const W0=Kx("inline-flex min-h-6 items-center gap-1.5 rounded px-2 py-1 font-mono text-[11px] font-medium leading-none",{variants:{tone:{neutral:"bg-muted text-muted-foreground",primary:"bg-primary/10 text-primary",success:"bg-success/10 text-success",warning:"bg-warning/10 text-warning",danger:"bg-danger/10 text-danger",info:"bg-info/10 text-info"}},defaultVariants:{tone:"neutral"}});function ee({className:e,tone:t,...r}){return n.jsx("span",{className:q(W0({tone:t}),e),...r})}function fe({label:e,tone:t="neutral",className:r}){return n.jsxs(ee,{className:r,tone:t,children:[n.jsx("span",{"aria-hidden":"true",className:"h-1.5 w-1.5 rounded-full bg-current"}),e]})}const Ye=Kx("inline-flex min-h-11 cursor-pointer items-center justify-center rounded-md font-mono text-sm font-medium transition-colors duration-200 focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2 focus-visible:ring-offset-background disabled:pointer-events-none disabled:opacity-50",{variants:{variant:{default:"bg-primary text-primary-foreground hover:bg-primary/90",secondary:"border border-border bg-card text-foreground hover:border-[#2a3340] hover:bg-muted",outline:"border border-border bg-transparent text-foreground hover:border-[#2a3340] hover:bg-muted/70",ghost:"text-muted-foreground hover:bg-muted hover:text-foreground",success:"border border-success/30 bg-success/10 text-success hover:bg-success/15",warning:"border border-warning/30 bg-warning/10 text-warning hover:bg-warning/15",danger:"border border-danger/30 bg-danger/10 text-danger hover:bg-danger/15",info:"border border-info/30 bg-info/10 text-info hover:bg-info/15"},size:{default:"px-4 py-2",sm:"min-h-9 px-3 py-1.5 text-xs",icon:"h-9 min-h-9 w-9 p-0",lg:"px-5 py-2.5"}},defaultVariants:{variant:"default",size:"default"}}),_=d.forwardRef(({className:e,variant:t,size:r,type:s="button",...a},i)=>n.jsx("button",{className:q(Ye({variant:t,size:r,className:e})),ref:i,type:s,...a}));_.displayName="Button";function Q({className:e,...t}){return n.jsx("div",{className:q("rounded-lg border border-border bg-card text-card-foreground",e),...t})}function xe({className:e,...t}){return n.jsx("div",{className:q("space-y-1 p-4 sm:p-6",e),...t})}function ge({className:e,...t}){return n.jsx("h2",{className:q("font-mono text-base font-semibold",e),...t})}function we({className:e,...t}){return n.jsx("p",{className:q("text-sm text-muted-foreground",e),...t})}function K({className:e,...t}){return n.jsx("div",{className:q("px-4 pb-4 sm:px-6 sm:pb-6",e),...t})}const np='a[href], button:not([disabled]), textarea, input, select, [tabindex]:not([tabindex="-1"])';function ze({onClose:e,restoreFocus:t,children:r}){const s=d.useRef(null),a=d.useRef(e),i=d.useRef(t);return a.current=e,i.current=t,d.useEffect(()=>{const l=s.current,o=document.activeElement,c=l&&o&&!l.contains(o)?o:null;((l?Array.from(l.querySelectorAll(np)):[])[0]??l)?.focus();const h=document.body.style.overflow;document.body.style.overflow="hidden";const m=f=>{if(f.key==="Escape"){f.preventDefault(),a.current();return}if(f.key!=="Tab"||!l)return;const w=Array.from(l.querySelectorAll(np));if(!w.length)return;const j=w[0],y=w[w.length-1],b=document.activeElement;f.shiftKey&&b===j?(f.preventDefault(),y.focus()):!f.shiftKey&&b===y&&(f.preventDefault(),j.focus())};return document.addEventListener("keydown",m,!0),()=>{document.removeEventListener("keydown",m,!0),document.body.style.overflow=h,c?.isConnected?c.focus():i.current?.()}},[]),n.jsx("div",{className:"fixed inset-0 z-[70] flex items-center justify-center bg-black/75 p-3 sm:p-4",onMouseDown:l=>{l.target===l.currentTarget&&a.current()},ref:s,tabIndex:-1,children:r})}function pt({title:e,description:t,status:r,actions:s}){return n.jsxs("header",{className:"flex flex-col gap-4 sm:flex-row sm:items-start sm:justify-between",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-3",children:[n.jsx("h1",{className:"break-words font-mono text-xl font-semibold text-foreground sm:text-[22px]",children:e}),r]}),t?n.jsx("div",{className:"mt-1.5 font-mono text-xs text-dim sm:text-[13px]",children:t}):null]}),s?n.jsx("div",{className:"flex shrink-0 flex-wrap items-center gap-2",children:s}):null]})}const rp=64*1024,uu=2e3;class Wl extends Error{constructor({status:r,code:s,path:a,message:i,details:l,bodyTruncated:o}){super(i);zr(this,"status");zr(this,"code");zr(this,"path");zr(this,"details");zr(this,"bodyTruncated");this.name="ApiError",this.status=r,this.code=s,this.path=a,this.details=l,this.bodyTruncated=o}}async function G0(e){if(!e.body)return{text:"",truncated:!1};const t=e.body.getReader(),r=new TextDecoder;let s="",a=0,i=!1;for(;;){const{value:l,done:o}=await t.read();if(o)break;const c=rp-a;if(c<=0){i=!0,await t.cancel().catch(()=>{});break}const u=l.byteLength>c?l.subarray(0,c):l;if(a+=u.byteLength,s+=r.decode(u,{stream:!0}),u.byteLength<l.byteLength||a===rp){i=!0,await t.cancel().catch(()=>{});break}}return s+=r.decode(),{text:s,truncated:i}}function yr(e,t=uu){if(typeof e!="string")return null;const r=e.replace(/\s+/g," ").trim();return r?r.slice(0,t):null}function K0(e){if(Array.isArray(e)){const t=e.map(r=>yr(r,500)).filter(r=>r!==null);return t.length?t.join("; ").slice(0,uu):null}return yr(e)}async function Q0(e,t){let r={text:"",truncated:!1};try{r=await G0(e)}catch{}const{text:s,truncated:a}=r,i=e.headers.get("Content-Type")?.toLowerCase()??"",l=i.includes("json"),o=i.includes("text/html");let c=null;try{const y=JSON.parse(s);y&&typeof y=="object"&&!Array.isArray(y)&&(c=y)}catch{c=null}const u=yr(c?.code??c?.error_code,128),h=yr(c?.error)??yr(c?.message),m=h?yr(c?.message):null,f=K0(c?.details),w=[h];m&&m!==h&&w.push(m);let j=w.filter(y=>y!==null).join(": ");return f&&(j=j?`${j} (${f})`:f),!j&&!c&&!l&&!o&&(j=yr(s)??""),j||(j=`Request failed (${e.status}) for ${t}`),new Wl({status:e.status,code:u??`http_${e.status}`,path:t,message:j.slice(0,uu),details:c?.details,bodyTruncated:a})}const cg=new Set(["POST","PUT","PATCH","DELETE"]);let ts=null;function sp(e){ts=e}async function J0(){if(ts)return ts;try{const e=await fetch("/api/auth/check",{credentials:"same-origin",headers:{Accept:"application/json"}});e.ok&&(ts=(await e.json()).csrf_token??null)}catch{}return ts}async function Pr(e){if(!cg.has((e??"GET").toUpperCase()))return{};const t=await J0();return t?{"X-CSRF-Token":t}:{}}async function W(e,t){const r=(t?.method??"GET").toUpperCase(),s={Accept:"application/json",...t?.headers??{},...await Pr(r)};let a=await fetch(e,{...t,credentials:"same-origin",headers:s});if(a.status===403&&cg.has(r)){ts=null;const i={...s,...await Pr(r)};a=await fetch(e,{...t,credentials:"same-origin",headers:i})}if(!a.ok)throw await Q0(a,e);return await a.json()}function ne(e){if(e==null||e==="")return null;const t=Number(e);return Number.isFinite(t)?t:null}function ce(e){return typeof e=="string"&&e.trim().length>0?e:null}async function $n(e,t,r){const s=await W("/api/auth/check",{method:"GET",signal:r});if(!s.csrf_token)throw new Error("CSRF token unavailable");const a=await W(e,{method:"POST",headers:{"Content-Type":"application/json","X-CSRF-Token":s.csrf_token},body:JSON.stringify(t),signal:r});if(a.error||!a.operation_id||!a.stream_url)throw new Error(a.error||"Operation was not created");return{operation_id:a.operation_id,stream_url:a.stream_url}}async function In(e,t,r){const s=await fetch(e,{method:"GET",credentials:"same-origin",headers:{Accept:"text/event-stream"},signal:r});if(!s.ok||!s.body)throw new Error(`Operation stream failed (${s.status})`);const a=s.body.getReader(),i=new TextDecoder;let l="",o=!1;for(;;){const{value:c,done:u}=await a.read();if(u)break;l+=i.decode(c,{stream:!0});let h=l.indexOf(`
+ */const n0=[["path",{d:"M18 6 6 18",key:"1bl5f8"}],["path",{d:"m6 6 12 12",key:"d8bk6v"}]],We=Z("x",n0);function Wx(e){var t,r,s="";if(typeof e=="string"||typeof e=="number")s+=e;else if(typeof e=="object")if(Array.isArray(e)){var a=e.length;for(t=0;t<a;t++)e[t]&&(r=Wx(e[t]))&&(s&&(s+=" "),s+=r)}else for(r in e)e[r]&&(s&&(s+=" "),s+=r);return s}function Gx(){for(var e,t,r=0,s="",a=arguments.length;r<a;r++)(e=arguments[r])&&(t=Wx(e))&&(s&&(s+=" "),s+=t);return s}const Km=e=>typeof e=="boolean"?`${e}`:e===0?"0":e,Qm=Gx,Kx=(e,t)=>r=>{var s;if(t?.variants==null)return Qm(e,r?.class,r?.className);const{variants:a,defaultVariants:i}=t,l=Object.keys(a).map(u=>{const h=r?.[u],m=i?.[u];if(h===null)return null;const f=Km(h)||Km(m);return a[u][f]}),o=r&&Object.entries(r).reduce((u,h)=>{let[m,f]=h;return f===void 0||(u[m]=f),u},{}),c=t==null||(s=t.compoundVariants)===null||s===void 0?void 0:s.reduce((u,h)=>{let{class:m,className:f,...w}=h;return Object.entries(w).every(j=>{let[y,b]=j;return Array.isArray(b)?b.includes({...i,...o}[y]):{...i,...o}[y]===b})?[...u,m,f]:u},[]);return Qm(e,l,c,r?.class,r?.className)},r0=(e,t)=>{const r=new Array(e.length+t.length);for(let s=0;s<e.length;s++)r[s]=e[s];for(let s=0;s<t.length;s++)r[e.length+s]=t[s];return r},s0=(e,t)=>({classGroupId:e,validator:t}),Qx=(e=new Map,t=null,r)=>({nextPart:e,validators:t,classGroupId:r}),ml="-",Jm=[],a0="arbitrary..",i0=e=>{const t=o0(e),{conflictingClassGroups:r,conflictingClassGroupModifiers:s}=e;return{getClassGroupId:l=>{if(l.startsWith("[")&&l.endsWith("]"))return l0(l);const o=l.split(ml),c=o[0]===""&&o.length>1?1:0;return Jx(o,c,t)},getConflictingClassGroupIds:(l,o)=>{if(o){const c=s[l],u=r[l];return c?u?r0(u,c):c:u||Jm}return r[l]||Jm}}},Jx=(e,t,r)=>{if(e.length-t===0)return r.classGroupId;const a=e[t],i=r.nextPart.get(a);if(i){const u=Jx(e,t+1,i);if(u)return u}const l=r.validators;if(l===null)return;const o=t===0?e.join(ml):e.slice(t).join(ml),c=l.length;for(let u=0;u<c;u++){const h=l[u];if(h.validator(o))return h.classGroupId}},l0=e=>e.slice(1,-1).indexOf(":")===-1?void 0:(()=>{const t=e.slice(1,-1),r=t.indexOf(":"),s=t.slice(0,r);return s?a0+s:void 0})(),o0=e=>{const{theme:t,classGroups:r}=e;return c0(r,t)},c0=(e,t)=>{const r=Qx();for(const s in e){const a=e[s];cu(a,r,s,t)}return r},cu=(e,t,r,s)=>{const a=e.length;for(let i=0;i<a;i++){const l=e[i];d0(l,t,r,s)}},d0=(e,t,r,s)=>{if(typeof e=="string"){u0(e,t,r);return}if(typeof e=="function"){m0(e,t,r,s);return}p0(e,t,r,s)},u0=(e,t,r)=>{const s=e===""?t:Yx(t,e);s.classGroupId=r},m0=(e,t,r,s)=>{if(f0(e)){cu(e(s),t,r,s);return}t.validators===null&&(t.validators=[]),t.validators.push(s0(r,e))},p0=(e,t,r,s)=>{const a=Object.entries(e),i=a.length;for(let l=0;l<i;l++){const[o,c]=a[l];cu(c,Yx(t,o),r,s)}},Yx=(e,t)=>{let r=e;const s=t.split(ml),a=s.length;for(let i=0;i<a;i++){const l=s[i];let o=r.nextPart.get(l);o||(o=Qx(),r.nextPart.set(l,o)),r=o}return r},f0=e=>"isThemeGetter"in e&&e.isThemeGetter===!0,h0=e=>{if(e<1)return{get:()=>{},set:()=>{}};let t=0,r=Object.create(null),s=Object.create(null);const a=(i,l)=>{r[i]=l,t++,t>e&&(t=0,s=r,r=Object.create(null))};return{get(i){let l=r[i];if(l!==void 0)return l;if((l=s[i])!==void 0)return a(i,l),l},set(i,l){i in r?r[i]=l:a(i,l)}}},Jc="!",Ym=":",x0=[],Xm=(e,t,r,s,a)=>({modifiers:e,hasImportantModifier:t,baseClassName:r,maybePostfixModifierPosition:s,isExternal:a}),g0=e=>{const{prefix:t,experimentalParseClassName:r}=e;let s=a=>{const i=[];let l=0,o=0,c=0,u;const h=a.length;for(let y=0;y<h;y++){const b=a[y];if(l===0&&o===0){if(b===Ym){i.push(a.slice(c,y)),c=y+1;continue}if(b==="/"){u=y;continue}}b==="["?l++:b==="]"?l--:b==="("?o++:b===")"&&o--}const m=i.length===0?a:a.slice(c);let f=m,w=!1;m.endsWith(Jc)?(f=m.slice(0,-1),w=!0):m.startsWith(Jc)&&(f=m.slice(1),w=!0);const j=u&&u>c?u-c:void 0;return Xm(i,w,f,j)};if(t){const a=t+Ym,i=s;s=l=>l.startsWith(a)?i(l.slice(a.length)):Xm(x0,!1,l,void 0,!0)}if(r){const a=s;s=i=>r({className:i,parseClassName:a})}return s},v0=e=>{const t=new Map;return e.orderSensitiveModifiers.forEach((r,s)=>{t.set(r,1e6+s)}),r=>{const s=[];let a=[];for(let i=0;i<r.length;i++){const l=r[i],o=l[0]==="[",c=t.has(l);o||c?(a.length>0&&(a.sort(),s.push(...a),a=[]),s.push(l)):a.push(l)}return a.length>0&&(a.sort(),s.push(...a)),s}},y0=e=>({cache:h0(e.cacheSize),parseClassName:g0(e),sortModifiers:v0(e),...i0(e)}),b0=/\s+/,j0=(e,t)=>{const{parseClassName:r,getClassGroupId:s,getConflictingClassGroupIds:a,sortModifiers:i}=t,l=[],o=e.trim().split(b0);let c="";for(let u=o.length-1;u>=0;u-=1){const h=o[u],{isExternal:m,modifiers:f,hasImportantModifier:w,baseClassName:j,maybePostfixModifierPosition:y}=r(h);if(m){c=h+(c.length>0?" "+c:c);continue}let b=!!y,v=s(b?j.substring(0,y):j);if(!v){if(!b){c=h+(c.length>0?" "+c:c);continue}if(v=s(j),!v){c=h+(c.length>0?" "+c:c);continue}b=!1}const p=f.length===0?"":f.length===1?f[0]:i(f).join(":"),x=w?p+Jc:p,g=x+v;if(l.indexOf(g)>-1)continue;l.push(g);const N=a(v,b);for(let E=0;E<N.length;++E){const C=N[E];l.push(x+C)}c=h+(c.length>0?" "+c:c)}return c},w0=(...e)=>{let t=0,r,s,a="";for(;t<e.length;)(r=e[t++])&&(s=Xx(r))&&(a&&(a+=" "),a+=s);return a},Xx=e=>{if(typeof e=="string")return e;let t,r="";for(let s=0;s<e.length;s++)e[s]&&(t=Xx(e[s]))&&(r&&(r+=" "),r+=t);return r},N0=(e,...t)=>{let r,s,a,i;const l=c=>{const u=t.reduce((h,m)=>m(h),e());return r=y0(u),s=r.cache.get,a=r.cache.set,i=o,o(c)},o=c=>{const u=s(c);if(u)return u;const h=j0(c,r);return a(c,h),h};return i=l,(...c)=>i(w0(...c))},k0=[],et=e=>{const t=r=>r[e]||k0;return t.isThemeGetter=!0,t},Zx=/^\[(?:(\w[\w-]*):)?(.+)\]$/i,eg=/^\((?:(\w[\w-]*):)?(.+)\)$/i,S0=/^\d+(?:\.\d+)?\/\d+(?:\.\d+)?$/,_0=/^(\d+(\.\d+)?)?(xs|sm|md|lg|xl)$/,C0=/\d+(%|px|r?em|[sdl]?v([hwib]|min|max)|pt|pc|in|cm|mm|cap|ch|ex|r?lh|cq(w|h|i|b|min|max))|\b(calc|min|max|clamp)\(.+\)|^0$/,E0=/^(rgba?|hsla?|hwb|(ok)?(lab|lch)|color-mix)\(.+\)$/,A0=/^(inset_)?-?((\d+)?\.?(\d+)[a-z]+|0)_-?((\d+)?\.?(\d+)[a-z]+|0)/,P0=/^(url|image|image-set|cross-fade|element|(repeating-)?(linear|radial|conic)-gradient)\(.+\)$/,On=e=>S0.test(e),be=e=>!!e&&!Number.isNaN(Number(e)),Dn=e=>!!e&&Number.isInteger(Number(e)),Ro=e=>e.endsWith("%")&&be(e.slice(0,-1)),jn=e=>_0.test(e),tg=()=>!0,R0=e=>C0.test(e)&&!E0.test(e),du=()=>!1,M0=e=>A0.test(e),T0=e=>P0.test(e),$0=e=>!le(e)&&!oe(e),I0=e=>dr(e,sg,du),le=e=>Zx.test(e),fr=e=>dr(e,ag,R0),Zm=e=>dr(e,V0,be),L0=e=>dr(e,lg,tg),z0=e=>dr(e,ig,du),ep=e=>dr(e,ng,du),O0=e=>dr(e,rg,T0),mi=e=>dr(e,og,M0),oe=e=>eg.test(e),zs=e=>Ir(e,ag),D0=e=>Ir(e,ig),tp=e=>Ir(e,ng),U0=e=>Ir(e,sg),B0=e=>Ir(e,rg),pi=e=>Ir(e,og,!0),F0=e=>Ir(e,lg,!0),dr=(e,t,r)=>{const s=Zx.exec(e);return s?s[1]?t(s[1]):r(s[2]):!1},Ir=(e,t,r=!1)=>{const s=eg.exec(e);return s?s[1]?t(s[1]):r:!1},ng=e=>e==="position"||e==="percentage",rg=e=>e==="image"||e==="url",sg=e=>e==="length"||e==="size"||e==="bg-size",ag=e=>e==="length",V0=e=>e==="number",ig=e=>e==="family-name",lg=e=>e==="number"||e==="weight",og=e=>e==="shadow",q0=()=>{const e=et("color"),t=et("font"),r=et("text"),s=et("font-weight"),a=et("tracking"),i=et("leading"),l=et("breakpoint"),o=et("container"),c=et("spacing"),u=et("radius"),h=et("shadow"),m=et("inset-shadow"),f=et("text-shadow"),w=et("drop-shadow"),j=et("blur"),y=et("perspective"),b=et("aspect"),v=et("ease"),p=et("animate"),x=()=>["auto","avoid","all","avoid-page","page","left","right","column"],g=()=>["center","top","bottom","left","right","top-left","left-top","top-right","right-top","bottom-right","right-bottom","bottom-left","left-bottom"],N=()=>[...g(),oe,le],E=()=>["auto","hidden","clip","visible","scroll"],C=()=>["auto","contain","none"],k=()=>[oe,le,c],O=()=>[On,"full","auto",...k()],S=()=>[Dn,"none","subgrid",oe,le],$=()=>["auto",{span:["full",Dn,oe,le]},Dn,oe,le],R=()=>[Dn,"auto",oe,le],H=()=>["auto","min","max","fr",oe,le],I=()=>["start","end","center","between","around","evenly","stretch","baseline","center-safe","end-safe"],U=()=>["start","end","center","stretch","center-safe","end-safe"],L=()=>["auto",...k()],B=()=>[On,"auto","full","dvw","dvh","lvw","lvh","svw","svh","min","max","fit",...k()],P=()=>[On,"screen","full","dvw","lvw","svw","min","max","fit",...k()],M=()=>[On,"screen","full","lh","dvh","lvh","svh","min","max","fit",...k()],A=()=>[e,oe,le],F=()=>[...g(),tp,ep,{position:[oe,le]}],D=()=>["no-repeat",{repeat:["","x","y","space","round"]}],G=()=>["auto","cover","contain",U0,I0,{size:[oe,le]}],se=()=>[Ro,zs,fr],de=()=>["","none","full",u,oe,le],ue=()=>["",be,zs,fr],Ce=()=>["solid","dashed","dotted","double"],Re=()=>["normal","multiply","screen","overlay","darken","lighten","color-dodge","color-burn","hard-light","soft-light","difference","exclusion","hue","saturation","color","luminosity"],pe=()=>[be,Ro,tp,ep],Ft=()=>["","none",j,oe,le],kt=()=>["none",be,oe,le],rt=()=>["none",be,oe,le],vt=()=>[be,oe,le],Xe=()=>[On,"full",...k()];return{cacheSize:500,theme:{animate:["spin","ping","pulse","bounce"],aspect:["video"],blur:[jn],breakpoint:[jn],color:[tg],container:[jn],"drop-shadow":[jn],ease:["in","out","in-out"],font:[$0],"font-weight":["thin","extralight","light","normal","medium","semibold","bold","extrabold","black"],"inset-shadow":[jn],leading:["none","tight","snug","normal","relaxed","loose"],perspective:["dramatic","near","normal","midrange","distant","none"],radius:[jn],shadow:[jn],spacing:["px",be],text:[jn],"text-shadow":[jn],tracking:["tighter","tight","normal","wide","wider","widest"]},classGroups:{aspect:[{aspect:["auto","square",On,le,oe,b]}],container:["container"],columns:[{columns:[be,le,oe,o]}],"break-after":[{"break-after":x()}],"break-before":[{"break-before":x()}],"break-inside":[{"break-inside":["auto","avoid","avoid-page","avoid-column"]}],"box-decoration":[{"box-decoration":["slice","clone"]}],box:[{box:["border","content"]}],display:["block","inline-block","inline","flex","inline-flex","table","inline-table","table-caption","table-cell","table-column","table-column-group","table-footer-group","table-header-group","table-row-group","table-row","flow-root","grid","inline-grid","contents","list-item","hidden"],sr:["sr-only","not-sr-only"],float:[{float:["right","left","none","start","end"]}],clear:[{clear:["left","right","both","none","start","end"]}],isolation:["isolate","isolation-auto"],"object-fit":[{object:["contain","cover","fill","none","scale-down"]}],"object-position":[{object:N()}],overflow:[{overflow:E()}],"overflow-x":[{"overflow-x":E()}],"overflow-y":[{"overflow-y":E()}],overscroll:[{overscroll:C()}],"overscroll-x":[{"overscroll-x":C()}],"overscroll-y":[{"overscroll-y":C()}],position:["static","fixed","absolute","relative","sticky"],inset:[{inset:O()}],"inset-x":[{"inset-x":O()}],"inset-y":[{"inset-y":O()}],start:[{"inset-s":O(),start:O()}],end:[{"inset-e":O(),end:O()}],"inset-bs":[{"inset-bs":O()}],"inset-be":[{"inset-be":O()}],top:[{top:O()}],right:[{right:O()}],bottom:[{bottom:O()}],left:[{left:O()}],visibility:["visible","invisible","collapse"],z:[{z:[Dn,"auto",oe,le]}],basis:[{basis:[On,"full","auto",o,...k()]}],"flex-direction":[{flex:["row","row-reverse","col","col-reverse"]}],"flex-wrap":[{flex:["nowrap","wrap","wrap-reverse"]}],flex:[{flex:[be,On,"auto","initial","none",le]}],grow:[{grow:["",be,oe,le]}],shrink:[{shrink:["",be,oe,le]}],order:[{order:[Dn,"first","last","none",oe,le]}],"grid-cols":[{"grid-cols":S()}],"col-start-end":[{col:$()}],"col-start":[{"col-start":R()}],"col-end":[{"col-end":R()}],"grid-rows":[{"grid-rows":S()}],"row-start-end":[{row:$()}],"row-start":[{"row-start":R()}],"row-end":[{"row-end":R()}],"grid-flow":[{"grid-flow":["row","col","dense","row-dense","col-dense"]}],"auto-cols":[{"auto-cols":H()}],"auto-rows":[{"auto-rows":H()}],gap:[{gap:k()}],"gap-x":[{"gap-x":k()}],"gap-y":[{"gap-y":k()}],"justify-content":[{justify:[...I(),"normal"]}],"justify-items":[{"justify-items":[...U(),"normal"]}],"justify-self":[{"justify-self":["auto",...U()]}],"align-content":[{content:["normal",...I()]}],"align-items":[{items:[...U(),{baseline:["","last"]}]}],"align-self":[{self:["auto",...U(),{baseline:["","last"]}]}],"place-content":[{"place-content":I()}],"place-items":[{"place-items":[...U(),"baseline"]}],"place-self":[{"place-self":["auto",...U()]}],p:[{p:k()}],px:[{px:k()}],py:[{py:k()}],ps:[{ps:k()}],pe:[{pe:k()}],pbs:[{pbs:k()}],pbe:[{pbe:k()}],pt:[{pt:k()}],pr:[{pr:k()}],pb:[{pb:k()}],pl:[{pl:k()}],m:[{m:L()}],mx:[{mx:L()}],my:[{my:L()}],ms:[{ms:L()}],me:[{me:L()}],mbs:[{mbs:L()}],mbe:[{mbe:L()}],mt:[{mt:L()}],mr:[{mr:L()}],mb:[{mb:L()}],ml:[{ml:L()}],"space-x":[{"space-x":k()}],"space-x-reverse":["space-x-reverse"],"space-y":[{"space-y":k()}],"space-y-reverse":["space-y-reverse"],size:[{size:B()}],"inline-size":[{inline:["auto",...P()]}],"min-inline-size":[{"min-inline":["auto",...P()]}],"max-inline-size":[{"max-inline":["none",...P()]}],"block-size":[{block:["auto",...M()]}],"min-block-size":[{"min-block":["auto",...M()]}],"max-block-size":[{"max-block":["none",...M()]}],w:[{w:[o,"screen",...B()]}],"min-w":[{"min-w":[o,"screen","none",...B()]}],"max-w":[{"max-w":[o,"screen","none","prose",{screen:[l]},...B()]}],h:[{h:["screen","lh",...B()]}],"min-h":[{"min-h":["screen","lh","none",...B()]}],"max-h":[{"max-h":["screen","lh",...B()]}],"font-size":[{text:["base",r,zs,fr]}],"font-smoothing":["antialiased","subpixel-antialiased"],"font-style":["italic","not-italic"],"font-weight":[{font:[s,F0,L0]}],"font-stretch":[{"font-stretch":["ultra-condensed","extra-condensed","condensed","semi-condensed","normal","semi-expanded","expanded","extra-expanded","ultra-expanded",Ro,le]}],"font-family":[{font:[D0,z0,t]}],"font-features":[{"font-features":[le]}],"fvn-normal":["normal-nums"],"fvn-ordinal":["ordinal"],"fvn-slashed-zero":["slashed-zero"],"fvn-figure":["lining-nums","oldstyle-nums"],"fvn-spacing":["proportional-nums","tabular-nums"],"fvn-fraction":["diagonal-fractions","stacked-fractions"],tracking:[{tracking:[a,oe,le]}],"line-clamp":[{"line-clamp":[be,"none",oe,Zm]}],leading:[{leading:[i,...k()]}],"list-image":[{"list-image":["none",oe,le]}],"list-style-position":[{list:["inside","outside"]}],"list-style-type":[{list:["disc","decimal","none",oe,le]}],"text-alignment":[{text:["left","center","right","justify","start","end"]}],"placeholder-color":[{placeholder:A()}],"text-color":[{text:A()}],"text-decoration":["underline","overline","line-through","no-underline"],"text-decoration-style":[{decoration:[...Ce(),"wavy"]}],"text-decoration-thickness":[{decoration:[be,"from-font","auto",oe,fr]}],"text-decoration-color":[{decoration:A()}],"underline-offset":[{"underline-offset":[be,"auto",oe,le]}],"text-transform":["uppercase","lowercase","capitalize","normal-case"],"text-overflow":["truncate","text-ellipsis","text-clip"],"text-wrap":[{text:["wrap","nowrap","balance","pretty"]}],indent:[{indent:k()}],"vertical-align":[{align:["baseline","top","middle","bottom","text-top","text-bottom","sub","super",oe,le]}],whitespace:[{whitespace:["normal","nowrap","pre","pre-line","pre-wrap","break-spaces"]}],break:[{break:["normal","words","all","keep"]}],wrap:[{wrap:["break-word","anywhere","normal"]}],hyphens:[{hyphens:["none","manual","auto"]}],content:[{content:["none",oe,le]}],"bg-attachment":[{bg:["fixed","local","scroll"]}],"bg-clip":[{"bg-clip":["border","padding","content","text"]}],"bg-origin":[{"bg-origin":["border","padding","content"]}],"bg-position":[{bg:F()}],"bg-repeat":[{bg:D()}],"bg-size":[{bg:G()}],"bg-image":[{bg:["none",{linear:[{to:["t","tr","r","br","b","bl","l","tl"]},Dn,oe,le],radial:["",oe,le],conic:[Dn,oe,le]},B0,O0]}],"bg-color":[{bg:A()}],"gradient-from-pos":[{from:se()}],"gradient-via-pos":[{via:se()}],"gradient-to-pos":[{to:se()}],"gradient-from":[{from:A()}],"gradient-via":[{via:A()}],"gradient-to":[{to:A()}],rounded:[{rounded:de()}],"rounded-s":[{"rounded-s":de()}],"rounded-e":[{"rounded-e":de()}],"rounded-t":[{"rounded-t":de()}],"rounded-r":[{"rounded-r":de()}],"rounded-b":[{"rounded-b":de()}],"rounded-l":[{"rounded-l":de()}],"rounded-ss":[{"rounded-ss":de()}],"rounded-se":[{"rounded-se":de()}],"rounded-ee":[{"rounded-ee":de()}],"rounded-es":[{"rounded-es":de()}],"rounded-tl":[{"rounded-tl":de()}],"rounded-tr":[{"rounded-tr":de()}],"rounded-br":[{"rounded-br":de()}],"rounded-bl":[{"rounded-bl":de()}],"border-w":[{border:ue()}],"border-w-x":[{"border-x":ue()}],"border-w-y":[{"border-y":ue()}],"border-w-s":[{"border-s":ue()}],"border-w-e":[{"border-e":ue()}],"border-w-bs":[{"border-bs":ue()}],"border-w-be":[{"border-be":ue()}],"border-w-t":[{"border-t":ue()}],"border-w-r":[{"border-r":ue()}],"border-w-b":[{"border-b":ue()}],"border-w-l":[{"border-l":ue()}],"divide-x":[{"divide-x":ue()}],"divide-x-reverse":["divide-x-reverse"],"divide-y":[{"divide-y":ue()}],"divide-y-reverse":["divide-y-reverse"],"border-style":[{border:[...Ce(),"hidden","none"]}],"divide-style":[{divide:[...Ce(),"hidden","none"]}],"border-color":[{border:A()}],"border-color-x":[{"border-x":A()}],"border-color-y":[{"border-y":A()}],"border-color-s":[{"border-s":A()}],"border-color-e":[{"border-e":A()}],"border-color-bs":[{"border-bs":A()}],"border-color-be":[{"border-be":A()}],"border-color-t":[{"border-t":A()}],"border-color-r":[{"border-r":A()}],"border-color-b":[{"border-b":A()}],"border-color-l":[{"border-l":A()}],"divide-color":[{divide:A()}],"outline-style":[{outline:[...Ce(),"none","hidden"]}],"outline-offset":[{"outline-offset":[be,oe,le]}],"outline-w":[{outline:["",be,zs,fr]}],"outline-color":[{outline:A()}],shadow:[{shadow:["","none",h,pi,mi]}],"shadow-color":[{shadow:A()}],"inset-shadow":[{"inset-shadow":["none",m,pi,mi]}],"inset-shadow-color":[{"inset-shadow":A()}],"ring-w":[{ring:ue()}],"ring-w-inset":["ring-inset"],"ring-color":[{ring:A()}],"ring-offset-w":[{"ring-offset":[be,fr]}],"ring-offset-color":[{"ring-offset":A()}],"inset-ring-w":[{"inset-ring":ue()}],"inset-ring-color":[{"inset-ring":A()}],"text-shadow":[{"text-shadow":["none",f,pi,mi]}],"text-shadow-color":[{"text-shadow":A()}],opacity:[{opacity:[be,oe,le]}],"mix-blend":[{"mix-blend":[...Re(),"plus-darker","plus-lighter"]}],"bg-blend":[{"bg-blend":Re()}],"mask-clip":[{"mask-clip":["border","padding","content","fill","stroke","view"]},"mask-no-clip"],"mask-composite":[{mask:["add","subtract","intersect","exclude"]}],"mask-image-linear-pos":[{"mask-linear":[be]}],"mask-image-linear-from-pos":[{"mask-linear-from":pe()}],"mask-image-linear-to-pos":[{"mask-linear-to":pe()}],"mask-image-linear-from-color":[{"mask-linear-from":A()}],"mask-image-linear-to-color":[{"mask-linear-to":A()}],"mask-image-t-from-pos":[{"mask-t-from":pe()}],"mask-image-t-to-pos":[{"mask-t-to":pe()}],"mask-image-t-from-color":[{"mask-t-from":A()}],"mask-image-t-to-color":[{"mask-t-to":A()}],"mask-image-r-from-pos":[{"mask-r-from":pe()}],"mask-image-r-to-pos":[{"mask-r-to":pe()}],"mask-image-r-from-color":[{"mask-r-from":A()}],"mask-image-r-to-color":[{"mask-r-to":A()}],"mask-image-b-from-pos":[{"mask-b-from":pe()}],"mask-image-b-to-pos":[{"mask-b-to":pe()}],"mask-image-b-from-color":[{"mask-b-from":A()}],"mask-image-b-to-color":[{"mask-b-to":A()}],"mask-image-l-from-pos":[{"mask-l-from":pe()}],"mask-image-l-to-pos":[{"mask-l-to":pe()}],"mask-image-l-from-color":[{"mask-l-from":A()}],"mask-image-l-to-color":[{"mask-l-to":A()}],"mask-image-x-from-pos":[{"mask-x-from":pe()}],"mask-image-x-to-pos":[{"mask-x-to":pe()}],"mask-image-x-from-color":[{"mask-x-from":A()}],"mask-image-x-to-color":[{"mask-x-to":A()}],"mask-image-y-from-pos":[{"mask-y-from":pe()}],"mask-image-y-to-pos":[{"mask-y-to":pe()}],"mask-image-y-from-color":[{"mask-y-from":A()}],"mask-image-y-to-color":[{"mask-y-to":A()}],"mask-image-radial":[{"mask-radial":[oe,le]}],"mask-image-radial-from-pos":[{"mask-radial-from":pe()}],"mask-image-radial-to-pos":[{"mask-radial-to":pe()}],"mask-image-radial-from-color":[{"mask-radial-from":A()}],"mask-image-radial-to-color":[{"mask-radial-to":A()}],"mask-image-radial-shape":[{"mask-radial":["circle","ellipse"]}],"mask-image-radial-size":[{"mask-radial":[{closest:["side","corner"],farthest:["side","corner"]}]}],"mask-image-radial-pos":[{"mask-radial-at":g()}],"mask-image-conic-pos":[{"mask-conic":[be]}],"mask-image-conic-from-pos":[{"mask-conic-from":pe()}],"mask-image-conic-to-pos":[{"mask-conic-to":pe()}],"mask-image-conic-from-color":[{"mask-conic-from":A()}],"mask-image-conic-to-color":[{"mask-conic-to":A()}],"mask-mode":[{mask:["alpha","luminance","match"]}],"mask-origin":[{"mask-origin":["border","padding","content","fill","stroke","view"]}],"mask-position":[{mask:F()}],"mask-repeat":[{mask:D()}],"mask-size":[{mask:G()}],"mask-type":[{"mask-type":["alpha","luminance"]}],"mask-image":[{mask:["none",oe,le]}],filter:[{filter:["","none",oe,le]}],blur:[{blur:Ft()}],brightness:[{brightness:[be,oe,le]}],contrast:[{contrast:[be,oe,le]}],"drop-shadow":[{"drop-shadow":["","none",w,pi,mi]}],"drop-shadow-color":[{"drop-shadow":A()}],grayscale:[{grayscale:["",be,oe,le]}],"hue-rotate":[{"hue-rotate":[be,oe,le]}],invert:[{invert:["",be,oe,le]}],saturate:[{saturate:[be,oe,le]}],sepia:[{sepia:["",be,oe,le]}],"backdrop-filter":[{"backdrop-filter":["","none",oe,le]}],"backdrop-blur":[{"backdrop-blur":Ft()}],"backdrop-brightness":[{"backdrop-brightness":[be,oe,le]}],"backdrop-contrast":[{"backdrop-contrast":[be,oe,le]}],"backdrop-grayscale":[{"backdrop-grayscale":["",be,oe,le]}],"backdrop-hue-rotate":[{"backdrop-hue-rotate":[be,oe,le]}],"backdrop-invert":[{"backdrop-invert":["",be,oe,le]}],"backdrop-opacity":[{"backdrop-opacity":[be,oe,le]}],"backdrop-saturate":[{"backdrop-saturate":[be,oe,le]}],"backdrop-sepia":[{"backdrop-sepia":["",be,oe,le]}],"border-collapse":[{border:["collapse","separate"]}],"border-spacing":[{"border-spacing":k()}],"border-spacing-x":[{"border-spacing-x":k()}],"border-spacing-y":[{"border-spacing-y":k()}],"table-layout":[{table:["auto","fixed"]}],caption:[{caption:["top","bottom"]}],transition:[{transition:["","all","colors","opacity","shadow","transform","none",oe,le]}],"transition-behavior":[{transition:["normal","discrete"]}],duration:[{duration:[be,"initial",oe,le]}],ease:[{ease:["linear","initial",v,oe,le]}],delay:[{delay:[be,oe,le]}],animate:[{animate:["none",p,oe,le]}],backface:[{backface:["hidden","visible"]}],perspective:[{perspective:[y,oe,le]}],"perspective-origin":[{"perspective-origin":N()}],rotate:[{rotate:kt()}],"rotate-x":[{"rotate-x":kt()}],"rotate-y":[{"rotate-y":kt()}],"rotate-z":[{"rotate-z":kt()}],scale:[{scale:rt()}],"scale-x":[{"scale-x":rt()}],"scale-y":[{"scale-y":rt()}],"scale-z":[{"scale-z":rt()}],"scale-3d":["scale-3d"],skew:[{skew:vt()}],"skew-x":[{"skew-x":vt()}],"skew-y":[{"skew-y":vt()}],transform:[{transform:[oe,le,"","none","gpu","cpu"]}],"transform-origin":[{origin:N()}],"transform-style":[{transform:["3d","flat"]}],translate:[{translate:Xe()}],"translate-x":[{"translate-x":Xe()}],"translate-y":[{"translate-y":Xe()}],"translate-z":[{"translate-z":Xe()}],"translate-none":["translate-none"],accent:[{accent:A()}],appearance:[{appearance:["none","auto"]}],"caret-color":[{caret:A()}],"color-scheme":[{scheme:["normal","dark","light","light-dark","only-dark","only-light"]}],cursor:[{cursor:["auto","default","pointer","wait","text","move","help","not-allowed","none","context-menu","progress","cell","crosshair","vertical-text","alias","copy","no-drop","grab","grabbing","all-scroll","col-resize","row-resize","n-resize","e-resize","s-resize","w-resize","ne-resize","nw-resize","se-resize","sw-resize","ew-resize","ns-resize","nesw-resize","nwse-resize","zoom-in","zoom-out",oe,le]}],"field-sizing":[{"field-sizing":["fixed","content"]}],"pointer-events":[{"pointer-events":["auto","none"]}],resize:[{resize:["none","","y","x"]}],"scroll-behavior":[{scroll:["auto","smooth"]}],"scroll-m":[{"scroll-m":k()}],"scroll-mx":[{"scroll-mx":k()}],"scroll-my":[{"scroll-my":k()}],"scroll-ms":[{"scroll-ms":k()}],"scroll-me":[{"scroll-me":k()}],"scroll-mbs":[{"scroll-mbs":k()}],"scroll-mbe":[{"scroll-mbe":k()}],"scroll-mt":[{"scroll-mt":k()}],"scroll-mr":[{"scroll-mr":k()}],"scroll-mb":[{"scroll-mb":k()}],"scroll-ml":[{"scroll-ml":k()}],"scroll-p":[{"scroll-p":k()}],"scroll-px":[{"scroll-px":k()}],"scroll-py":[{"scroll-py":k()}],"scroll-ps":[{"scroll-ps":k()}],"scroll-pe":[{"scroll-pe":k()}],"scroll-pbs":[{"scroll-pbs":k()}],"scroll-pbe":[{"scroll-pbe":k()}],"scroll-pt":[{"scroll-pt":k()}],"scroll-pr":[{"scroll-pr":k()}],"scroll-pb":[{"scroll-pb":k()}],"scroll-pl":[{"scroll-pl":k()}],"snap-align":[{snap:["start","end","center","align-none"]}],"snap-stop":[{snap:["normal","always"]}],"snap-type":[{snap:["none","x","y","both"]}],"snap-strictness":[{snap:["mandatory","proximity"]}],touch:[{touch:["auto","none","manipulation"]}],"touch-x":[{"touch-pan":["x","left","right"]}],"touch-y":[{"touch-pan":["y","up","down"]}],"touch-pz":["touch-pinch-zoom"],select:[{select:["none","text","all","auto"]}],"will-change":[{"will-change":["auto","scroll","contents","transform",oe,le]}],fill:[{fill:["none",...A()]}],"stroke-w":[{stroke:[be,zs,fr,Zm]}],stroke:[{stroke:["none",...A()]}],"forced-color-adjust":[{"forced-color-adjust":["auto","none"]}]},conflictingClassGroups:{overflow:["overflow-x","overflow-y"],overscroll:["overscroll-x","overscroll-y"],inset:["inset-x","inset-y","inset-bs","inset-be","start","end","top","right","bottom","left"],"inset-x":["right","left"],"inset-y":["top","bottom"],flex:["basis","grow","shrink"],gap:["gap-x","gap-y"],p:["px","py","ps","pe","pbs","pbe","pt","pr","pb","pl"],px:["pr","pl"],py:["pt","pb"],m:["mx","my","ms","me","mbs","mbe","mt","mr","mb","ml"],mx:["mr","ml"],my:["mt","mb"],size:["w","h"],"font-size":["leading"],"fvn-normal":["fvn-ordinal","fvn-slashed-zero","fvn-figure","fvn-spacing","fvn-fraction"],"fvn-ordinal":["fvn-normal"],"fvn-slashed-zero":["fvn-normal"],"fvn-figure":["fvn-normal"],"fvn-spacing":["fvn-normal"],"fvn-fraction":["fvn-normal"],"line-clamp":["display","overflow"],rounded:["rounded-s","rounded-e","rounded-t","rounded-r","rounded-b","rounded-l","rounded-ss","rounded-se","rounded-ee","rounded-es","rounded-tl","rounded-tr","rounded-br","rounded-bl"],"rounded-s":["rounded-ss","rounded-es"],"rounded-e":["rounded-se","rounded-ee"],"rounded-t":["rounded-tl","rounded-tr"],"rounded-r":["rounded-tr","rounded-br"],"rounded-b":["rounded-br","rounded-bl"],"rounded-l":["rounded-tl","rounded-bl"],"border-spacing":["border-spacing-x","border-spacing-y"],"border-w":["border-w-x","border-w-y","border-w-s","border-w-e","border-w-bs","border-w-be","border-w-t","border-w-r","border-w-b","border-w-l"],"border-w-x":["border-w-r","border-w-l"],"border-w-y":["border-w-t","border-w-b"],"border-color":["border-color-x","border-color-y","border-color-s","border-color-e","border-color-bs","border-color-be","border-color-t","border-color-r","border-color-b","border-color-l"],"border-color-x":["border-color-r","border-color-l"],"border-color-y":["border-color-t","border-color-b"],translate:["translate-x","translate-y","translate-none"],"translate-none":["translate","translate-x","translate-y","translate-z"],"scroll-m":["scroll-mx","scroll-my","scroll-ms","scroll-me","scroll-mbs","scroll-mbe","scroll-mt","scroll-mr","scroll-mb","scroll-ml"],"scroll-mx":["scroll-mr","scroll-ml"],"scroll-my":["scroll-mt","scroll-mb"],"scroll-p":["scroll-px","scroll-py","scroll-ps","scroll-pe","scroll-pbs","scroll-pbe","scroll-pt","scroll-pr","scroll-pb","scroll-pl"],"scroll-px":["scroll-pr","scroll-pl"],"scroll-py":["scroll-pt","scroll-pb"],touch:["touch-x","touch-y","touch-pz"],"touch-x":["touch"],"touch-y":["touch"],"touch-pz":["touch"]},conflictingClassGroupModifiers:{"font-size":["leading"]},orderSensitiveModifiers:["*","**","after","backdrop","before","details-content","file","first-letter","first-line","marker","placeholder","selection"]}},H0=N0(q0);function q(...e){return H0(Gx(e))}const W0=Kx("inline-flex min-h-6 items-center gap-1.5 rounded px-2 py-1 font-mono text-[11px] font-medium leading-none",{variants:{tone:{neutral:"bg-muted text-muted-foreground",primary:"bg-primary/10 text-primary",success:"bg-success/10 text-success",warning:"bg-warning/10 text-warning",danger:"bg-danger/10 text-danger",info:"bg-info/10 text-info"}},defaultVariants:{tone:"neutral"}});function ee({className:e,tone:t,...r}){return n.jsx("span",{className:q(W0({tone:t}),e),...r})}function fe({label:e,tone:t="neutral",className:r}){return n.jsxs(ee,{className:r,tone:t,children:[n.jsx("span",{"aria-hidden":"true",className:"h-1.5 w-1.5 rounded-full bg-current"}),e]})}const Ye=Kx("inline-flex min-h-11 cursor-pointer items-center justify-center rounded-md font-mono text-sm font-medium transition-colors duration-200 focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2 focus-visible:ring-offset-background disabled:pointer-events-none disabled:opacity-50",{variants:{variant:{default:"bg-primary text-primary-foreground hover:bg-primary/90",secondary:"border border-border bg-card text-foreground hover:border-[#2a3340] hover:bg-muted",outline:"border border-border bg-transparent text-foreground hover:border-[#2a3340] hover:bg-muted/70",ghost:"text-muted-foreground hover:bg-muted hover:text-foreground",success:"border border-success/30 bg-success/10 text-success hover:bg-success/15",warning:"border border-warning/30 bg-warning/10 text-warning hover:bg-warning/15",danger:"border border-danger/30 bg-danger/10 text-danger hover:bg-danger/15",info:"border border-info/30 bg-info/10 text-info hover:bg-info/15"},size:{default:"px-4 py-2",sm:"min-h-9 px-3 py-1.5 text-xs",icon:"h-9 min-h-9 w-9 p-0",lg:"px-5 py-2.5"}},defaultVariants:{variant:"default",size:"default"}}),_=d.forwardRef(({className:e,variant:t,size:r,type:s="button",...a},i)=>n.jsx("button",{className:q(Ye({variant:t,size:r,className:e})),ref:i,type:s,...a}));_.displayName="Button";function Q({className:e,...t}){return n.jsx("div",{className:q("rounded-lg border border-border bg-card text-card-foreground",e),...t})}function xe({className:e,...t}){return n.jsx("div",{className:q("space-y-1 p-4 sm:p-6",e),...t})}function ge({className:e,...t}){return n.jsx("h2",{className:q("font-mono text-base font-semibold",e),...t})}function we({className:e,...t}){return n.jsx("p",{className:q("text-sm text-muted-foreground",e),...t})}function K({className:e,...t}){return n.jsx("div",{className:q("px-4 pb-4 sm:px-6 sm:pb-6",e),...t})}const np='a[href], button:not([disabled]), textarea, input, select, [tabindex]:not([tabindex="-1"])';function ze({onClose:e,restoreFocus:t,children:r}){const s=d.useRef(null),a=d.useRef(e),i=d.useRef(t);return a.current=e,i.current=t,d.useEffect(()=>{const l=s.current,o=document.activeElement,c=l&&o&&!l.contains(o)?o:null;((l?Array.from(l.querySelectorAll(np)):[])[0]??l)?.focus();const h=document.body.style.overflow;document.body.style.overflow="hidden";const m=f=>{if(f.key==="Escape"){f.preventDefault(),a.current();return}if(f.key!=="Tab"||!l)return;const w=Array.from(l.querySelectorAll(np));if(!w.length)return;const j=w[0],y=w[w.length-1],b=document.activeElement;f.shiftKey&&b===j?(f.preventDefault(),y.focus()):!f.shiftKey&&b===y&&(f.preventDefault(),j.focus())};return document.addEventListener("keydown",m,!0),()=>{document.removeEventListener("keydown",m,!0),document.body.style.overflow=h,c?.isConnected?c.focus():i.current?.()}},[]),n.jsx("div",{className:"fixed inset-0 z-[70] flex items-center justify-center bg-black/75 p-3 sm:p-4",onMouseDown:l=>{l.target===l.currentTarget&&a.current()},ref:s,tabIndex:-1,children:r})}function pt({title:e,description:t,status:r,actions:s}){return n.jsxs("header",{className:"flex flex-col gap-4 sm:flex-row sm:items-start sm:justify-between",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-3",children:[n.jsx("h1",{className:"break-words font-mono text-xl font-semibold text-foreground sm:text-[22px]",children:e}),r]}),t?n.jsx("div",{className:"mt-1.5 font-mono text-xs text-dim sm:text-[13px]",children:t}):null]}),s?n.jsx("div",{className:"flex shrink-0 flex-wrap items-center gap-2",children:s}):null]})}const rp=64*1024,uu=2e3;class Wl extends Error{constructor({status:r,code:s,path:a,message:i,details:l,bodyTruncated:o}){super(i);zr(this,"status");zr(this,"code");zr(this,"path");zr(this,"details");zr(this,"bodyTruncated");this.name="ApiError",this.status=r,this.code=s,this.path=a,this.details=l,this.bodyTruncated=o}}async function G0(e){if(!e.body)return{text:"",truncated:!1};const t=e.body.getReader(),r=new TextDecoder;let s="",a=0,i=!1;for(;;){const{value:l,done:o}=await t.read();if(o)break;const c=rp-a;if(c<=0){i=!0,await t.cancel().catch(()=>{});break}const u=l.byteLength>c?l.subarray(0,c):l;if(a+=u.byteLength,s+=r.decode(u,{stream:!0}),u.byteLength<l.byteLength||a===rp){i=!0,await t.cancel().catch(()=>{});break}}return s+=r.decode(),{text:s,truncated:i}}function yr(e,t=uu){if(typeof e!="string")return null;const r=e.replace(/\s+/g," ").trim();return r?r.slice(0,t):null}function K0(e){if(Array.isArray(e)){const t=e.map(r=>yr(r,500)).filter(r=>r!==null);return t.length?t.join("; ").slice(0,uu):null}return yr(e)}async function Q0(e,t){let r={text:"",truncated:!1};try{r=await G0(e)}catch{}const{text:s,truncated:a}=r,i=e.headers.get("Content-Type")?.toLowerCase()??"",l=i.includes("json"),o=i.includes("text/html");let c=null;try{const y=JSON.parse(s);y&&typeof y=="object"&&!Array.isArray(y)&&(c=y)}catch{c=null}const u=yr(c?.code??c?.error_code,128),h=yr(c?.error)??yr(c?.message),m=h?yr(c?.message):null,f=K0(c?.details),w=[h];m&&m!==h&&w.push(m);let j=w.filter(y=>y!==null).join(": ");return f&&(j=j?`${j} (${f})`:f),!j&&!c&&!l&&!o&&(j=yr(s)??""),j||(j=`Request failed (${e.status}) for ${t}`),new Wl({status:e.status,code:u??`http_${e.status}`,path:t,message:j.slice(0,uu),details:c?.details,bodyTruncated:a})}const cg=new Set(["POST","PUT","PATCH","DELETE"]);let ts=null;function sp(e){ts=e}async function J0(){if(ts)return ts;try{const e=await fetch("/api/auth/check",{credentials:"same-origin",headers:{Accept:"application/json"}});e.ok&&(ts=(await e.json()).csrf_token??null)}catch{}return ts}async function Pr(e){if(!cg.has((e??"GET").toUpperCase()))return{};const t=await J0();return t?{"X-CSRF-Token":t}:{}}async function W(e,t){const r=(t?.method??"GET").toUpperCase(),s={Accept:"application/json",...t?.headers??{},...await Pr(r)};let a=await fetch(e,{...t,credentials:"same-origin",headers:s});if(a.status===403&&cg.has(r)){ts=null;const i={...s,...await Pr(r)};a=await fetch(e,{...t,credentials:"same-origin",headers:i})}if(!a.ok)throw await Q0(a,e);return await a.json()}function ne(e){if(e==null||e==="")return null;const t=Number(e);return Number.isFinite(t)?t:null}function ce(e){return typeof e=="string"&&e.trim().length>0?e:null}async function $n(e,t,r){const s=await W("/api/auth/check",{method:"GET",signal:r});if(!s.csrf_token)throw new Error("CSRF token unavailable");const a=await W(e,{method:"POST",headers:{"Content-Type":"application/json","X-CSRF-Token":s.csrf_token},body:JSON.stringify(t),signal:r});if(a.error||!a.operation_id||!a.stream_url)throw new Error(a.error||"Operation was not created");return{operation_id:a.operation_id,stream_url:a.stream_url}}async function In(e,t,r){let s=null,a=0;for(;a<3;){const i={Accept:"text/event-stream"};s!==null&&(i["Last-Event-ID"]=s);const l=await fetch(e,{method:"GET",credentials:"same-origin",headers:i,signal:r});if(!l.ok||!l.body)throw new Error(`Operation stream failed (${l.status})`);const o=l.body.getReader(),c=new TextDecoder,u=s;let h="",m=!1;for(;;){const{value:f,done:w}=await o.read();if(w)break;h+=c.decode(f,{stream:!0});let j=h.indexOf(`
 
-`);for(;h!==-1;){const m=l.slice(0,h);l=l.slice(h+2);const f=m.split(`
-`).find(w=>w.startsWith("data:"));if(f)try{const w=JSON.parse(f.slice(5).trim());o=o||!!(w.done||w.error),t(w)}catch(w){if(!(w instanceof SyntaxError))throw w}h=l.indexOf(`
+`);for(;j!==-1;){const y=h.slice(0,j);h=h.slice(j+2);const b=y.split(`
+`),v=b.find(g=>g.startsWith("id:"));v&&(s=v.slice(3).trim());const x=b.find(g=>g.startsWith("data:"));if(x)try{const g=JSON.parse(x.slice(5).trim());m=m||!!(g.done||g.error),t(g)}catch(g){if(!(g instanceof SyntaxError))throw g}j=h.indexOf(`
 
-`)}}if(!o)throw new Error("Operation stream ended before completion")}function dg(e){return{name:String(e?.name??"unknown"),status:String(e?.status??"unknown"),running_count:ne(e?.running_count),container_count:ne(e?.container_count),path:ce(e?.path),compose_file:ce(e?.compose_file)}}async function ug(e={}){const t=e.includeStatus??!0,r=await W(`/api/stacks?status=${t?"true":"false"}`,{method:"GET",signal:e.signal});if(r.error)throw new Error(r.error);return Array.isArray(r.stacks)?r.stacks.map(s=>dg(s)):[]}async function Y0(e,t,r){return $n(`/api/stacks/${encodeURIComponent(e)}/operations`,{action:t},r)}async function X0(e,t=200,r){const s=await W(`/api/stacks/${encodeURIComponent(e)}/logs?tail=${t}`,{method:"GET",signal:r});if(s.error)throw new Error(s.error);return{logs:s.logs??"",returncode:ne(s.returncode)}}async function Z0(e,t,r){return In(e,t,r)}async function e1(e,t){return W(`/api/stacks/${encodeURIComponent(e.name)}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({compose_content:e.composeContent,env_content:e.envContent}),signal:t})}async function t1(e,t,r){return W(`/api/stacks/${encodeURIComponent(e)}`,{method:"DELETE",headers:{"Content-Type":"application/json"},body:JSON.stringify({force:t.force===!0,confirm_name:t.confirmName}),signal:r})}async function n1(e){const t=await W("/api/stacks/scan",{method:"POST",signal:e});if(t.error)throw new Error(t.error);const r=Array.isArray(t.stacks)?t.stacks.map(s=>dg(s)):[];return{stacks:r,count:ne(t.count)??r.length}}async function ap(e,t){const r=await W(`/api/stacks/${encodeURIComponent(e)}`,{method:"GET",signal:t});if(r.error)throw new Error(r.error);return{name:String(r.name??e),path:ce(r.path),compose_file:ce(r.compose_file),compose_content:String(r.compose_content??""),has_env:!!r.has_env,env_content:String(r.env_content??""),status:r.status&&typeof r.status=="object"?r.status:null}}async function r1(e,t,r){return W(`/api/stacks/${encodeURIComponent(e)}/compose?validate_only=true`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({content:t}),signal:r})}async function s1(e,t,r){const s=await W(`/api/stacks/${encodeURIComponent(e)}/compose`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({content:t}),signal:r});if(s.error)throw new Error(s.error)}async function a1(e,t,r){const s=await W(`/api/stacks/${encodeURIComponent(e)}/env`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({content:t}),signal:r});if(s.error)throw new Error(s.error)}async function i1(e,t){const r=await W(`/api/stacks/${encodeURIComponent(e)}/backups`,{method:"GET",signal:t});if(r.error)throw new Error(r.error);return Array.isArray(r.backups)?r.backups.map(s=>String(s)).filter(s=>s.length>0):[]}async function l1(e,t,r){const s=await W(`/api/stacks/${encodeURIComponent(e)}/backups/${encodeURIComponent(t)}`,{method:"GET",signal:r});if(s.error)throw new Error(s.error);return{content:s.content??"",filename:ce(s.filename)}}async function o1(e,t,r){const s=await W(`/api/stacks/${encodeURIComponent(e)}/restore`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({backup:t}),signal:r});if(s.error)throw new Error(s.error)}function c1(e){return e.container_count===null||e.container_count<=0||e.running_count===null?null:Math.round(e.running_count/e.container_count*100)}function d1(e){return Array.isArray(e)?[...new Set(e.map(t=>String(t).trim()).filter(Boolean))].sort():[]}function u1(e,t){const r=String(e?.id??"");return{id:r,name:String(e?.name??r),description:String(e?.description??""),requires:Array.isArray(e?.requires)?e.requires.map(s=>String(s)):[],installedStacks:d1(t[r]),managedBy:e?.managed_by?String(e.managed_by):null}}async function m1(e){const[t,r,s]=await Promise.all([W("/api/catalog",{method:"GET",signal:e}),W("/api/catalog/status",{method:"GET",signal:e}),ug({includeStatus:!1,signal:e})]),a=r.service_stacks??{};return{items:Array.isArray(t.items)?t.items.map(i=>u1(i,a)):[],availableStacks:[...new Set(s.map(i=>i.name).filter(Boolean))].sort()}}async function p1(e,t){const r=await W(`/api/catalog/${encodeURIComponent(e)}?apply_media_paths=true`,{method:"GET",signal:t});if(r.error)throw new Error(r.error);const s=r.item?.fields;return Array.isArray(s)?s.map(a=>({key:String(a.key??""),label:String(a.label??a.key??""),default:a.default===void 0||a.default===null?"":String(a.default),required:a.required===void 0?!0:!!a.required})):[]}async function f1(e,t,r,s,a){const i=await $n("/api/catalog/install",{id:e,values:t,start_service:!0,target_stack:r,stack_name:s},a);await In(i.stream_url,l=>{if(l.error)throw new Error(l.error);if(l.done&&l.returncode!==0)throw new Error(`App startup failed (${l.returncode??"unknown status"})`)},a)}async function h1(e,t,r){const s=await W("/api/catalog/remove",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({id:e,stop_service:!0,target_stack:t}),signal:r});if(s.error)throw new Error(s.error)}const ip=["B","KB","MB","GB","TB"],Gl="—";function Kl(e){return typeof e=="number"&&Number.isFinite(e)?e:null}function Pe(e,t=1){const r=Kl(e);if(r===null||r<0)return Gl;if(r===0)return"0 B";const s=Math.min(Math.floor(Math.log(r)/Math.log(1024)),ip.length-1);return`${(r/1024**s).toFixed(t)} ${ip[s]}`}function pl(e){const t=Kl(e);return t===null?Gl:`${Pe(t)}/s`}function Bt(e){const t=String(e.getHours()).padStart(2,"0"),r=String(e.getMinutes()).padStart(2,"0"),s=String(e.getSeconds()).padStart(2,"0");return`${t}:${r}:${s}`}function _t(e,t=1){const r=Kl(e);return r===null?Gl:`${r.toFixed(t)}%`}function fl(e){const t=Kl(e);if(t===null||t<0)return Gl;const r=Math.floor(t/86400),s=Math.floor(t%86400/3600),a=Math.floor(t%3600/60);return r?`${r}d ${s}h`:s?`${s}h ${a}m`:a?`${a}m`:`${Math.floor(t)}s`}async function x1({stack:e,values:t={},signal:r,onEvent:s}){const a=await $n("/api/media/quickstart",{stack:e,values:t},r);await In(a.stream_url,s,r)}const g1=3e4,Os={open:!1,itemId:"",itemName:"",status:"idle",fields:[],values:{},targetStack:"new",newStackName:"",error:null,saving:!1},Mo={open:!1,status:"idle",stackName:"media",lines:[],error:null};function Dr(e){return e instanceof Error&&e.message?e.message:"Unable to complete the request"}function lp(e,t){return`${e}:${t}`}function v1(e,t,r){if(!e.requires.length)return"new";const s=e.requires.map(a=>t.find(i=>i.id===a)?.installedStacks??[]);return r.find(a=>s.every(i=>i.includes(a)))??"new"}function y1(){const[e,t]=d.useState([]),[r,s]=d.useState([]),[a,i]=d.useState(!0),[l,o]=d.useState(!1),[c,u]=d.useState(null),[h,m]=d.useState("Never"),[f,w]=d.useState(null),[j,y]=d.useState(null),[b,v]=d.useState(null),[p,x]=d.useState(Os),[g,N]=d.useState(Mo),E=d.useRef(!0),C=d.useCallback(async I=>{I==="initial"&&i(!0),I==="manual"&&o(!0);try{const U=await m1();if(!E.current)return;t(U.items),s(U.availableStacks),u(null),m(Bt(new Date))}catch(U){E.current&&u(Dr(U))}finally{E.current&&(I==="initial"&&i(!1),I==="manual"&&o(!1))}},[]),k=d.useCallback(async(I,U)=>{const L=lp(I.id,U);v(null),y(L);try{await h1(I.id,U),E.current&&(w({tone:"success",message:`Removed ${I.name} from ${U}`}),await C("manual"))}catch(B){E.current&&w({tone:"error",message:Dr(B)})}finally{E.current&&y(null)}},[C]),O=d.useCallback(async I=>{x({...Os,open:!0,itemId:I.id,itemName:I.name,status:"loading",targetStack:v1(I,e,r),newStackName:I.id});try{const U=await p1(I.id);if(!E.current)return;const L={};for(const B of U)L[B.key]=B.default;x(B=>B.itemId===I.id&&B.open?{...B,status:"ready",fields:U,values:L}:B)}catch(U){E.current&&x(L=>L.itemId===I.id&&L.open?{...L,status:"error",error:Dr(U)}:L)}},[r,e]),S=d.useCallback(async()=>{const I=p.targetStack==="new"?p.newStackName.trim():"";if(p.targetStack==="new"&&!I){x(U=>({...U,error:"New stack name is required"}));return}x(U=>({...U,saving:!0,error:null}));try{if(await f1(p.itemId,p.values,p.targetStack,I),!E.current)return;const U=p.itemName;x(Os),w({tone:"success",message:`Installed ${U}`}),await C("manual")}catch(U){E.current&&x(L=>({...L,saving:!1,error:Dr(U)}))}},[p,C]),$=d.useCallback(async()=>{const I=g.stackName.trim();if(!I){N(U=>({...U,error:"Stack name is required"}));return}N(U=>({...U,status:"running",stackName:I,lines:["Preparing media quickstart..."],error:null}));try{if(await x1({stack:I,values:{USE_VPN:"true"},onEvent:U=>{if(!E.current)return;const L=U.error||U.line;L&&N(B=>({...B,lines:[...B.lines,L],error:U.error??B.error})),U.error?N(B=>({...B,status:"error",error:U.error??B.error})):U.done&&N(B=>({...B,status:"success"}))}}),!E.current)return;w({tone:"success",message:`Media quickstart completed for ${I}`}),await C("manual")}catch(U){E.current&&N(L=>({...L,status:"error",error:Dr(U),lines:[...L.lines,Dr(U)]}))}},[C,g.stackName]);d.useEffect(()=>{E.current=!0,C("initial");const I=window.setInterval(()=>void C("poll"),g1);return()=>{E.current=!1,window.clearInterval(I)}},[C]);const R=e.reduce((I,U)=>I+U.installedStacks.length,0),H=e.find(I=>I.id===p.itemId);return n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",disabled:l,onClick:()=>void C("manual"),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",l?"animate-spin":"")}),l?"refreshing":"refresh"]}),description:`${R} installations · ${e.length} catalog apps`,title:"app_catalog"}),f?n.jsx(Q,{"aria-live":f.tone==="error"?"assertive":"polite",className:f.tone==="error"?"border-danger/30 text-danger":"border-success/30 text-success",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm",children:[f.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),f.message]})}):null,c&&!e.length?n.jsx(Q,{className:"border-danger/30",children:n.jsxs(K,{className:"flex flex-col items-start gap-3 p-4 sm:p-6",children:[n.jsx("p",{className:"text-sm font-medium text-danger",children:"Unable to load catalog"}),n.jsx("p",{className:"text-sm text-muted-foreground",children:c}),n.jsx(_,{onClick:()=>void C("manual"),variant:"outline",children:"Retry"})]})}):null,n.jsx(Q,{className:"overflow-hidden border-info/30 bg-gradient-to-br from-info/10 via-card to-card shadow-[0_0_0_1px_rgba(56,189,248,0.06)]",children:n.jsxs(K,{className:"grid gap-4 p-4 sm:grid-cols-[1fr_auto] sm:items-center sm:p-5",children:[n.jsxs("div",{className:"space-y-3",children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(ee,{tone:"info",children:"guided setup"}),n.jsx(ee,{tone:"success",children:"vpn-first"}),n.jsx(ee,{tone:"neutral",children:"Jellyfin + downloads"})]}),n.jsxs("div",{children:[n.jsx("h2",{className:"font-mono text-lg font-semibold text-foreground",children:"Media server quickstart"}),n.jsx("p",{className:"mt-1 max-w-3xl text-sm text-muted-foreground",children:"Create the media stack in one run: provision folders, install the bundle, start Compose, then seed app folders and first-run config."})]}),n.jsxs("div",{className:"grid gap-2 text-xs text-muted-foreground sm:grid-cols-3",children:[n.jsxs("span",{className:"inline-flex items-center gap-2 rounded-md border border-border/70 bg-background/50 px-2 py-1.5",children:[n.jsx(su,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-info"}),"Media folders"]}),n.jsxs("span",{className:"inline-flex items-center gap-2 rounded-md border border-border/70 bg-background/50 px-2 py-1.5",children:[n.jsx(jt,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-success"}),"VPN networking"]}),n.jsxs("span",{className:"inline-flex items-center gap-2 rounded-md border border-border/70 bg-background/50 px-2 py-1.5",children:[n.jsx(lt,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-primary"}),"Seeded apps"]})]})]}),n.jsxs(_,{className:"gap-2 sm:min-w-40","data-media-quickstart-open":!0,disabled:g.status==="running",onClick:()=>N(I=>({...I,open:!0,status:"idle",error:null})),size:"lg",variant:"info",children:[n.jsx(Wm,{"aria-hidden":"true",className:"h-4 w-4"}),"Quickstart"]})]})}),a?n.jsx(Q,{"aria-live":"polite",role:"status",children:n.jsx(K,{className:"flex min-h-[14rem] items-center justify-center p-6 text-sm text-muted-foreground",children:"Loading catalog..."})}):null,!a&&e.length?n.jsx("div",{className:"grid gap-3 sm:grid-cols-2 xl:grid-cols-3",children:e.map(I=>n.jsx(Q,{className:"flex flex-col transition-colors duration-200 hover:border-primary/25",children:n.jsxs(K,{className:"flex flex-1 flex-col gap-3 p-4",children:[n.jsxs("div",{className:"flex items-start justify-between gap-3",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"truncate text-sm font-semibold",children:I.name}),n.jsx("p",{className:"line-clamp-2 text-xs text-muted-foreground",children:I.description})]}),I.installedStacks.length?n.jsx(fe,{label:"installed",tone:"success"}):null]}),I.requires.length?n.jsx("div",{className:"flex flex-wrap gap-1.5",children:I.requires.map(U=>n.jsxs(ee,{tone:"warning",children:["requires: ",U]},U))}):null,I.installedStacks.length?n.jsx("div",{className:"space-y-1.5",role:"list","aria-label":`${I.name} installations`,children:I.installedStacks.map(U=>{const L=lp(I.id,U),B=b===L,P=j===L;return n.jsxs("div",{className:"flex min-h-11 items-center justify-between gap-2 rounded-md border border-border/70 bg-muted/30 px-2",role:"listitem",children:[n.jsx(ee,{className:"max-w-32 truncate",title:U,tone:"success",children:U}),B?n.jsxs("span",{className:"flex items-center gap-1.5",children:[n.jsx(_,{className:"border-danger/30 bg-danger/10 px-3 text-xs text-danger hover:bg-danger/15","data-confirm-remove":I.id,"data-stack":U,disabled:P,onClick:()=>void k(I,U),variant:"outline",children:P?"Removing...":"Confirm"}),n.jsx(_,{"aria-label":`Cancel removing ${I.name} from ${U}`,className:"px-3 text-xs",onClick:()=>v(null),variant:"ghost",children:"Cancel"})]}):n.jsx(_,{"aria-label":`Remove ${I.name} from ${U}`,className:"w-11 px-0","data-catalog-action":"remove","data-item":I.id,"data-stack":U,disabled:!!j,onClick:()=>v(L),title:`Remove from ${U}`,variant:"ghost",children:n.jsx(Kt,{"aria-hidden":"true",className:"h-4 w-4"})})]},U)})}):null,n.jsx("div",{className:"mt-auto flex flex-wrap gap-2",children:I.managedBy==="integrations"?n.jsx(Ee,{className:Ye({size:"sm",variant:"info"}),to:"/integrations",children:"Manage in Integrations"}):n.jsx(_,{className:"px-3 text-xs sm:text-sm","data-catalog-action":"install","data-item":I.id,disabled:!!j,onClick:()=>void O(I),children:"Install"})})]})},I.id))}):null,!a&&!e.length&&!c?n.jsx(Q,{children:n.jsx(K,{className:"flex min-h-[10rem] items-center justify-center p-6 text-sm text-muted-foreground",children:"No catalog items found."})}):null,p.open?n.jsx(ze,{onClose:()=>x(Os),children:n.jsxs(Q,{"aria-labelledby":"v2-catalog-install-title","aria-modal":"true",className:"flex max-h-[90vh] w-full max-w-xl flex-col overflow-hidden",id:"v2-catalog-install-modal",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsxs(ge,{className:"text-base sm:text-lg",id:"v2-catalog-install-title",children:["Install ",p.itemName]}),n.jsx(we,{children:"Confirm configuration before deploying."})]}),n.jsx(_,{id:"v2-catalog-install-close",onClick:()=>x(Os),variant:"outline",children:"Close"})]}),n.jsx(K,{className:"space-y-3 overflow-auto p-4",children:p.status==="loading"?n.jsx("p",{className:"text-sm text-muted-foreground",children:"Loading options..."}):p.status==="error"?n.jsx("p",{className:"text-sm text-danger",children:p.error}):n.jsxs(n.Fragment,{children:[n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Target stack"}),n.jsxs("select",{className:"min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 text-sm focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring","data-install-target":!0,onChange:I=>x(U=>({...U,targetStack:I.target.value})),value:p.targetStack,children:[n.jsx("option",{value:"new",children:"Create new stack"}),r.map(I=>{const U=H?.installedStacks.includes(I)??!1;return n.jsxs("option",{disabled:U,value:I,children:[I,U?" (installed)":""]},I)})]})]}),p.targetStack==="new"?n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"New stack name"}),n.jsx("input",{className:"min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 font-mono text-xs focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring sm:text-sm","data-install-stack-name":!0,onChange:I=>x(U=>({...U,newStackName:I.target.value})),spellCheck:!1,value:p.newStackName})]}):null,p.fields.length?p.fields.map(I=>n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:I.label}),n.jsx("input",{className:"w-full rounded-md border border-border bg-background px-3 py-2 font-mono text-xs focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring sm:text-sm","data-install-field":I.key,onChange:U=>x(L=>({...L,values:{...L.values,[I.key]:U.target.value}})),spellCheck:!1,value:p.values[I.key]??""})]},I.key)):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No configuration required."}),p.error?n.jsx("p",{className:"text-sm text-danger",id:"v2-catalog-install-error",children:p.error}):null,n.jsxs(_,{disabled:p.saving||p.targetStack==="new"&&!p.newStackName.trim(),id:"v2-catalog-install-submit",onClick:()=>void S(),children:[p.saving?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):null,p.saving?"Installing...":"Install"]})]})})]})}):null,g.open?n.jsx(ze,{onClose:g.status==="running"?()=>{}:()=>N(Mo),children:n.jsxs(Q,{"aria-labelledby":"v2-media-quickstart-title","aria-modal":"true",className:"flex max-h-[90vh] w-full max-w-2xl flex-col overflow-hidden",id:"v2-media-quickstart-modal",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsx(ge,{className:"text-base sm:text-lg",id:"v2-media-quickstart-title",children:"Media server quickstart"}),n.jsx(we,{children:"Build the media stack with VPN-first defaults."})]}),n.jsx(_,{disabled:g.status==="running",id:"v2-media-quickstart-close",onClick:()=>N(Mo),variant:"outline",children:"Close"})]}),n.jsx(K,{className:"space-y-4 overflow-auto p-4",children:g.status==="running"||g.status==="success"||g.status==="error"?n.jsxs(n.Fragment,{children:[n.jsx("div",{"aria-live":g.status==="error"?"assertive":"polite",className:q("rounded-md border p-3 text-sm",g.status==="error"?"border-danger/30 text-danger":g.status==="success"?"border-success/30 text-success":"border-info/30 text-info"),role:"status",children:g.status==="running"?"Quickstart is running...":g.status==="success"?`Media quickstart completed for ${g.stackName}`:g.error}),n.jsx("pre",{className:"max-h-72 overflow-auto rounded-md border border-border bg-black/30 p-3 font-mono text-xs leading-5 text-muted-foreground","data-media-quickstart-log":!0,children:g.lines.join(`
-`)})]}):n.jsxs(n.Fragment,{children:[n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Stack name"}),n.jsx("input",{className:"min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 font-mono text-sm focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring","data-media-quickstart-stack":!0,onChange:I=>N(U=>({...U,stackName:I.target.value,error:null})),spellCheck:!1,value:g.stackName})]}),n.jsx("p",{className:"text-sm text-muted-foreground",children:"This uses the media bundle with VPN enabled. Non-VPN mode is not exposed yet because the current catalog definitions depend on VPN networking."}),g.error?n.jsx("p",{className:"text-sm text-danger",id:"v2-media-quickstart-error",children:g.error}):null,n.jsxs(_,{className:"gap-2","data-media-quickstart-start":!0,onClick:()=>void $(),children:[n.jsx(Wm,{"aria-hidden":"true",className:"h-4 w-4"}),"Start quickstart"]})]})})]})}):null]})}function b1(e){const t=e.filter(r=>r.status==="running");return t.length>0&&t.every(r=>r.memory_used===null)}function j1(e){return e?{container_port:ne(e.container_port),protocol:ce(e.protocol),host_port:ne(e.host_port),host_ip:ce(e.host_ip),via_service:ce(e.via_service)}:{container_port:null,protocol:null,host_port:null,host_ip:null,via_service:null}}function w1(e){const t=String(e?.id??""),r=e?.web_scheme;return{id:t||"unknown-container",name:String(e?.name??"Unnamed"),status:String(e?.status??"unknown"),image:String(e?.image??"unknown"),stack:ce(e?.stack),health:ce(e?.health),update_available:!!e?.update_available,ports:Array.isArray(e?.ports)?e.ports.map(s=>j1(s)):[],cpu_percent:ne(e?.cpu_percent),memory_percent:ne(e?.memory_percent),memory_used:ne(e?.memory_used),memory_limit:ne(e?.memory_limit),net_rx:ne(e?.net_rx),net_tx:ne(e?.net_tx),net_rx_rate:ne(e?.net_rx_rate),net_tx_rate:ne(e?.net_tx_rate),block_read_rate:ne(e?.block_read_rate),block_write_rate:ne(e?.block_write_rate),web_url:ce(e?.web_url),web_scheme:r==="http"||r==="https"?r:null}}async function mg(e={}){const t=e.includeStats??!0;return(await W(`/api/containers?stats=${t?"true":"false"}`,{method:"GET",signal:e.signal})).map(s=>w1(s))}async function op(e,t=!1,r){return W(`/api/containers/${encodeURIComponent(e)}${t?"?env=full":""}`,{method:"GET",signal:r})}async function N1(e,t){const r=await W(`/api/containers/${encodeURIComponent(e)}/health`,{method:"GET",signal:t});return{status:String(r.status??"none"),failing_streak:ne(r.failing_streak)??0,last_output:String(r.last_output??""),last_exit_code:ne(r.last_exit_code),last_started_at:ce(r.last_started_at),last_finished_at:ce(r.last_finished_at)}}async function To(e,t,r){const s=await W(`/api/containers/${encodeURIComponent(e)}/${t}`,{method:"POST",signal:r});if(s.error)throw new Error(s.error);return s}async function k1(e,t=200,r){const s=await W(`/api/containers/${encodeURIComponent(e)}/logs?tail=${t}`,{method:"GET",signal:r});if(s.error)throw new Error(s.error);return{logs:s.logs??"",container:ce(s.container)}}async function S1(e,t){const r=await W(`/api/containers/${encodeURIComponent(e)}/network-test`,{method:"POST",signal:t});if(r.error)throw new Error(r.error);return{ping_success:!!r.ping_success,ping_output:r.ping_output??"",local_ip:ce(r.local_ip),public_ip:ce(r.public_ip),probe_method:ce(r.probe_method),container_id:ce(r.container_id),container_name:ce(r.container_name)}}async function pg(e){const t=await W("/api/network-test",{method:"POST",signal:e});if(t.error)throw new Error(t.error);return{ping_success:!!t.ping_success,ping_output:t.ping_output??"",local_ip:ce(t.local_ip),public_ip:ce(t.public_ip),probe_method:ce(t.probe_method)}}async function _1(e,t){if(!e.length)return{};const r=e.map(a=>a.trim()).filter(Boolean).join(",");if(!r)return{};const s=await W(`/api/containers/stats?ids=${encodeURIComponent(r)}`,{method:"GET",signal:t});return Object.entries(s).reduce((a,[i,l])=>(a[i]={cpu_percent:ne(l.cpu_percent),memory_percent:ne(l.memory_percent),memory_used:ne(l.memory_used),memory_limit:ne(l.memory_limit),net_rx:ne(l.net_rx),net_tx:ne(l.net_tx),net_rx_rate:ne(l.net_rx_rate),net_tx_rate:ne(l.net_tx_rate),block_read_rate:ne(l.block_read_rate),block_write_rate:ne(l.block_write_rate)},a),{})}const C1=new Set(["stopped","exited"]);function E1(e,t){return t==="all"?e:t==="stopped"?e.filter(r=>C1.has(r.status)):t==="updates"?e.filter(r=>r.update_available):e.filter(r=>r.status===t)}function Ds(e){return typeof e=="number"&&Number.isInteger(e)&&e>0&&e<=65535}function A1(e){if(!e.ports.length)return null;const t=e.ports.filter(s=>s.protocol!=="udp"),r=[t.find(s=>Ds(s.host_port))?.host_port,e.ports.find(s=>Ds(s.host_port))?.host_port,t.find(s=>Ds(s.container_port))?.container_port,e.ports.find(s=>Ds(s.container_port))?.container_port];for(const s of r)if(Ds(s))return s;return null}function P1(e,t=typeof window>"u"?null:window.location.hostname){if(e.web_url)try{const i=new URL(e.web_url);if((i.protocol==="http:"||i.protocol==="https:")&&!i.username&&!i.password)return i.href}catch{}const r=A1(e);if(!r||!t)return null;const s=e.web_scheme??"http",a=t.includes(":")&&!t.startsWith("[")?`[${t}]`:t;return`${s}://${a}:${r}`}function R1(e){if(e===null)return"Not running";const t=Math.floor(e/86400),r=Math.floor(e%86400/3600),s=Math.floor(e%3600/60);return[t?`${t}d`:"",r?`${r}h`:"",`${s}m`].filter(Boolean).join(" ")}function M1({container:e,onClose:t}){const[r,s]=d.useState(null),[a,i]=d.useState(null),[l,o]=d.useState(null),[c,u]=d.useState(null),[h,m]=d.useState(new Set),[f,w]=d.useState(null);d.useEffect(()=>{const b=new AbortController;return Promise.all([op(e.id,!1,b.signal),N1(e.id,b.signal)]).then(([v,p])=>{s(v),i(p)}).catch(v=>{b.signal.aborted||o(v instanceof Error?v.message:"Unable to inspect container")}),()=>b.abort()},[e.id]);const j=d.useMemo(()=>{const b=r?.restart_policy.Name;return typeof b=="string"&&b?b:"none"},[r]),y=async b=>{w(b);try{let v=c;if(!v){const p=await op(e.id,!0);v=new Map(p.environment.map(x=>[x.key,x.value??""])),u(v)}m(p=>new Set(p).add(b))}catch(v){o(v instanceof Error?v.message:"Unable to reveal variable")}finally{w(null)}};return n.jsx(ze,{onClose:t,children:n.jsxs(Q,{"aria-labelledby":"v2-container-detail-title","aria-modal":"true",className:"flex max-h-[92vh] w-full max-w-4xl flex-col overflow-hidden",id:"v2-container-detail",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsxs("div",{children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(ge,{id:"v2-container-detail-title",children:e.name}),n.jsx(fe,{label:e.status,tone:e.status==="running"?"success":"neutral"})]}),n.jsx("p",{className:"mt-1 font-mono text-xs text-muted-foreground",children:e.id})]}),n.jsx(_,{"aria-label":"Close container details",onClick:t,variant:"outline",children:n.jsx(We,{"aria-hidden":"true",className:"h-4 w-4"})})]}),n.jsxs(K,{className:"space-y-5 overflow-auto p-4 sm:p-5",children:[l?n.jsx("p",{className:"text-sm text-danger",role:"alert",children:l}):null,r?n.jsxs(n.Fragment,{children:[n.jsx("dl",{className:"grid gap-3 rounded-lg border border-border bg-muted/20 p-4 text-sm sm:grid-cols-2 lg:grid-cols-3",children:[["Image",r.image],["Stack",r.stack??"Standalone"],["Uptime",R1(r.uptime_seconds)],["Restart",j],["Created",r.created??"Unknown"],["Started",r.started_at??"Not running"]].map(([b,v])=>n.jsxs("div",{className:"min-w-0",children:[n.jsx("dt",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:b}),n.jsx("dd",{className:"break-words font-mono text-xs",children:v})]},b))}),n.jsxs("section",{className:"space-y-2",children:[n.jsx("h3",{className:"text-sm font-semibold",children:"Healthcheck"}),n.jsxs("div",{className:"rounded-lg border border-border bg-[#080b0f] p-3",children:[n.jsxs("div",{className:"mb-2 flex items-center gap-2 text-sm",children:[n.jsx("span",{className:`h-2.5 w-2.5 rounded-full ${a?.status==="healthy"?"bg-success":a?.status==="unhealthy"?"bg-danger":"bg-muted-foreground"}`}),a?.status||"none"," · failing streak ",a?.failing_streak??0]}),n.jsx("pre",{className:"max-h-40 overflow-auto whitespace-pre-wrap break-words text-xs text-muted-foreground",children:a?.last_output||"No healthcheck output."})]})]}),n.jsxs("section",{className:"space-y-2",children:[n.jsx("h3",{className:"text-sm font-semibold",children:"Mounts"}),n.jsx("div",{className:"space-y-2",children:r.mounts.length?r.mounts.map((b,v)=>n.jsxs("div",{className:"break-all rounded-md border border-border p-2 font-mono text-xs",children:[b.source||b.type," → ",b.destination," (",b.rw?"rw":"ro",")"]},`${b.destination}-${v}`)):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No mounts."})})]}),n.jsxs("section",{className:"space-y-2",children:[n.jsx("h3",{className:"text-sm font-semibold",children:"Networks"}),n.jsx("div",{className:"grid gap-2 sm:grid-cols-2",children:r.networks.map(b=>n.jsxs("div",{className:"rounded-md border border-border p-3 text-xs",children:[n.jsx("p",{className:"font-semibold",children:b.name}),n.jsx("p",{className:"font-mono text-muted-foreground",children:b.ip_address||"No IP"})]},b.name))})]}),n.jsxs("section",{className:"space-y-2",children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(Ua,{"aria-hidden":"true",className:"h-4 w-4 text-warning"}),n.jsx("h3",{className:"text-sm font-semibold",children:"Environment keys"})]}),n.jsx("div",{className:"space-y-2",children:r.environment.map(({key:b})=>n.jsxs("div",{className:"flex min-h-11 flex-wrap items-center justify-between gap-2 rounded-md border border-border px-3",children:[n.jsxs("code",{className:"break-all text-xs",children:[b,h.has(b)?`=${c?.get(b)??""}`:""]}),h.has(b)?null:n.jsxs(_,{className:"gap-1",disabled:f===b,onClick:()=>void y(b),size:"sm",variant:"outline",children:[n.jsx(ru,{"aria-hidden":"true",className:"h-3.5 w-3.5"})," Reveal"]})]},b))})]})]}):n.jsxs("p",{className:"flex items-center gap-2 text-sm text-muted-foreground",children:[n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"})," Loading details..."]})]})]})})}const T1=[100,200,500,1e3];function fg({title:e,description:t,filename:r,idPrefix:s,closeId:a,onClose:i,load:l}){const[o,c]=d.useState(200),[u,h]=d.useState(""),[m,f]=d.useState(!0),[w,j]=d.useState(null),[y,b]=d.useState(!1),v=d.useCallback(async()=>{f(!0),j(null);try{h(await l(o)||"No logs available.")}catch(x){j(x instanceof Error?x.message:"Failed to load logs")}finally{f(!1)}},[l,o]);d.useEffect(()=>{v()},[v]),d.useEffect(()=>{if(!y)return;const x=window.setInterval(()=>void v(),5e3);return()=>window.clearInterval(x)},[y,v]);const p=()=>{const x=URL.createObjectURL(new Blob([u],{type:"text/plain;charset=utf-8"})),g=document.createElement("a");g.href=x,g.download=r,g.click(),URL.revokeObjectURL(x)};return n.jsx(ze,{onClose:i,children:n.jsxs(Q,{"aria-labelledby":`${s}-title`,"aria-modal":"true",className:"flex max-h-[92vh] w-full max-w-5xl flex-col overflow-hidden",id:`${s}-modal`,role:"dialog",children:[n.jsxs(xe,{className:"space-y-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsxs("div",{className:"flex flex-wrap items-start justify-between gap-3",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsx(ge,{id:`${s}-title`,children:e}),n.jsx(we,{children:t})]}),n.jsx(_,{id:a??`${s}-close`,onClick:i,variant:"outline",children:"Close"})]}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsxs("label",{className:"flex min-h-11 items-center gap-2 text-xs text-muted-foreground",children:["Tail",n.jsx("select",{className:"min-h-11 rounded-md border border-border bg-background px-3 text-foreground",id:`${s}-tail`,onChange:x=>c(Number(x.target.value)),value:o,children:T1.map(x=>n.jsx("option",{value:x,children:x},x))})]}),n.jsxs(_,{className:"gap-2",disabled:m,onClick:()=>void v(),variant:"outline",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",m&&"animate-spin")}),"Refresh"]}),n.jsxs(_,{"aria-pressed":y,onClick:()=>b(x=>!x),variant:y?"success":"outline",children:["Auto-refresh ",y?"on":"off"]}),n.jsxs(_,{className:"gap-2",disabled:!u,onClick:p,variant:"outline",children:[n.jsx(Oa,{"aria-hidden":"true",className:"h-4 w-4"}),"Download"]})]})]}),n.jsx(K,{className:"overflow-auto p-4",children:n.jsx("pre",{"aria-live":"polite",className:"min-h-48 whitespace-pre-wrap break-words rounded-lg border border-border/70 bg-[#080b0f] p-3 font-mono text-xs text-foreground sm:text-sm",id:`${s}-content`,children:m&&!u?"Loading logs...":w||u||"No logs available."})})]})})}function Ba({label:e,items:t,disabled:r=!1,pending:s=!1,triggerData:a,menuData:i}){const[l,o]=d.useState(!1),[c,u]=d.useState({left:0,top:0}),h=d.useRef(null),m=d.useRef(null),f=d.useRef(null),w=d.useCallback(()=>{const j=f.current;if(!j)return;const y=j.getBoundingClientRect(),b=192,v=m.current?.offsetHeight??142,p=y.bottom+8;u({left:Math.min(window.innerWidth-b-8,Math.max(8,y.right-b)),top:p+v<=window.innerHeight-8?p:Math.max(8,y.top-v-8)})},[]);return d.useLayoutEffect(()=>{l&&(w(),m.current?.querySelector("[role='menuitem']")?.focus())},[l,w]),d.useEffect(()=>{if(!l)return;const j=b=>{const v=b.target;!h.current?.contains(v)&&!m.current?.contains(v)&&o(!1)},y=b=>{b.key==="Escape"&&(o(!1),f.current?.focus())};return document.addEventListener("pointerdown",j),document.addEventListener("keydown",y),window.addEventListener("resize",w),window.addEventListener("scroll",w,!0),()=>{document.removeEventListener("pointerdown",j),document.removeEventListener("keydown",y),window.removeEventListener("resize",w),window.removeEventListener("scroll",w,!0)}},[l,w]),n.jsxs("div",{className:"relative",ref:h,children:[n.jsx(_,{...a,"aria-expanded":l,"aria-haspopup":"menu","aria-label":e,className:"h-9 min-h-9 w-9 px-0",disabled:r,onClick:()=>o(j=>!j),onKeyDown:j=>{j.key==="ArrowDown"&&(j.preventDefault(),o(!0))},ref:f,size:"sm",title:e,variant:"outline",children:s?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(Bw,{"aria-hidden":"true",className:"h-4 w-4"})}),l?wx.createPortal(n.jsx("div",{...i,"aria-label":e,className:"fixed z-50 w-48 overflow-hidden rounded-md border border-border bg-card p-1 shadow-xl shadow-black/30",onBlur:j=>{const y=j.relatedTarget;y&&(m.current?.contains(y)||f.current?.contains(y))||o(!1)},onKeyDown:j=>{if(j.key!=="ArrowDown"&&j.key!=="ArrowUp")return;j.preventDefault();const y=Array.from(m.current?.querySelectorAll("[role='menuitem']:not(:disabled)")??[]),b=y.indexOf(document.activeElement),v=j.key==="ArrowDown"?1:-1;y[(b+v+y.length)%y.length]?.focus()},ref:m,role:"menu",style:{left:c.left,top:c.top},children:t.map(j=>n.jsxs("div",{children:[j.separatorBefore?n.jsx("div",{className:"my-1 border-t border-divider",role:"separator"}):null,n.jsxs("button",{...j.data,className:q("flex min-h-10 w-full items-center gap-2 rounded-sm px-3 text-left text-sm hover:bg-muted focus-visible:bg-muted focus-visible:outline-none disabled:cursor-not-allowed disabled:opacity-50",j.tone==="info"?"text-info":j.tone==="danger"?"text-danger":"text-foreground"),disabled:j.disabled,onClick:()=>{o(!1),f.current?.focus(),j.onSelect()},role:"menuitem",type:"button",children:[n.jsx(j.Icon,{"aria-hidden":"true",className:q("h-4 w-4",j.tone?"":"text-muted-foreground")}),j.label]})]},j.id))}),document.body):null]})}const hg={start:{label:"Start",pendingLabel:"Starting...",className:"border-success/30 bg-success/10 text-success hover:bg-success/15"},stop:{label:"Stop",pendingLabel:"Stopping...",className:"border-danger/30 bg-danger/10 text-danger hover:bg-danger/15"},restart:{label:"Restart",pendingLabel:"Restarting...",className:"border-warning/30 bg-warning/10 text-warning hover:bg-warning/15"},check_update:{label:"Check Update",pendingLabel:"Checking...",className:"border-border text-muted-foreground hover:bg-muted"},update:{label:"Update",pendingLabel:"Updating...",className:"border-info/30 bg-info/10 text-info hover:bg-info/15"}};function cp(e){return e==="running"?"success":e==="stopped"||e==="exited"?"danger":e==="unavailable"?"warning":"neutral"}function $1(e){return e===null?"text-muted-foreground":e<50?"text-success":e<80?"text-warning":"text-danger"}function I1(e){return e===null?"bg-dim":e<50?"bg-success":e<80?"bg-warning":"bg-danger"}function L1(e){return e==="unavailable"||e==="error"}function dp(e){if(!(e.memory_used===null&&e.memory_limit===null))return`${Pe(e.memory_used)} / ${Pe(e.memory_limit)}`}function fi({percent:e,detail:t}){const r=e===null?0:Math.max(0,Math.min(e,100));return n.jsxs("div",{className:"min-w-0 space-y-1",children:[n.jsx("p",{className:q("text-sm font-medium",$1(e)),children:_t(e)}),t?n.jsx("p",{className:"text-xs text-muted-foreground",children:t}):null,n.jsx("div",{className:"h-1.5 rounded-full bg-muted",children:n.jsx("div",{className:q("h-1.5 rounded-full transition-[width] duration-300",I1(e)),style:{width:`${r}%`}})})]})}function up({rate:e,rx:t,tx:r}){const s=!!(e&&(e.rxRate!==null||e.txRate!==null)),a=s?pl(e?.rxRate):Pe(t),i=s?pl(e?.txRate):Pe(r);return n.jsxs("div",{className:"space-y-1 text-xs",children:[n.jsxs("p",{className:"text-sky-300",children:[n.jsx("span",{"aria-hidden":"true",children:"↓ "}),n.jsx("span",{className:"sr-only",children:s?"Download rate ":"Received "}),a]}),n.jsxs("p",{className:"text-emerald-300",children:[n.jsx("span",{"aria-hidden":"true",children:"↑ "}),n.jsx("span",{className:"sr-only",children:s?"Upload rate ":"Sent "}),i]})]})}function mp({role:e}){return e.kind==="provider"?n.jsx("span",{className:"shrink-0 rounded-full bg-sky-500/15 px-2 py-0.5 text-[0.65rem] font-medium text-sky-300","data-vpn-role":"provider",title:"VPN network provider for one or more containers",children:"VPN provider"}):e.kind==="orphaned"?n.jsx("a",{className:"inline-flex shrink-0 items-center gap-0.5 rounded-full bg-danger/15 px-2 py-0.5 text-[0.65rem] font-medium text-danger hover:underline","data-vpn-role":"orphaned",href:"/v2/network",title:`Orphaned from ${e.provider} — recreate the network group`,children:"⚠ orphaned"}):n.jsxs("span",{className:"shrink-0 rounded-full bg-muted px-2 py-0.5 text-[0.65rem] text-muted-foreground","data-vpn-role":"member",title:`Routed via ${e.provider}`,children:["via ",e.provider]})}const z1={start:Hl,stop:qx,restart:lu};function O1(e){return e.status==="running"?["stop","restart"]:["start"]}function pp({container:e,pendingAction:t,align:r,onAction:s,onOpenLogs:a,onOpenNetworkTest:i}){const o=!!t||L1(e.status);return n.jsxs("div",{className:q("flex items-center gap-1.5",r==="end"?"justify-end":"justify-start"),children:[O1(e).map(c=>{const u=hg[c],h=z1[c];return n.jsx(_,{"aria-label":`${u.label} ${e.name}`,className:q("h-9 min-h-9 w-9 px-0",u.className),"data-action":c,"data-container-id":e.id,disabled:o,onClick:()=>s(e,c),size:"sm",title:`${u.label} ${e.name}`,variant:"outline",children:t===c?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(h,{"aria-hidden":"true",className:"h-4 w-4"})},c)}),n.jsx(_,{"aria-label":`Logs ${e.name}`,className:"h-9 min-h-9 w-9 px-0","data-container-id":e.id,"data-diagnostic-action":"logs",disabled:o,onClick:()=>a(e),size:"sm",title:`Logs ${e.name}`,variant:"outline",children:n.jsx(Bl,{"aria-hidden":"true",className:"h-4 w-4"})}),n.jsx(D1,{container:e,disabled:o,onAction:s,onOpenNetworkTest:i,pendingAction:t})]})}function D1({container:e,disabled:t,pendingAction:r,onAction:s,onOpenNetworkTest:a}){return n.jsx(Ba,{disabled:t,items:[{id:"check-update",label:"Check update",Icon:je,onSelect:()=>s(e,"check_update"),data:{"data-action":"check_update","data-container-id":e.id}},{id:"update",label:"Update image",Icon:kw,onSelect:()=>s(e,"update"),tone:"info",data:{"data-action":"update","data-container-id":e.id}},{id:"network-test",label:"Network test",Icon:ou,onSelect:()=>a(e),separatorBefore:!0,data:{"data-container-id":e.id,"data-diagnostic-action":"network-test"}}],label:`More actions for ${e.name}`,menuData:{"data-container-actions-menu":e.id},pending:r==="check_update"||r==="update",triggerData:{"data-container-menu":e.id}})}function fp({container:e}){const t=P1(e);return t?n.jsx("a",{"aria-label":`Open ${e.name} web UI in a new tab`,className:"inline-flex h-8 w-8 shrink-0 items-center justify-center rounded-md text-muted-foreground hover:bg-muted hover:text-primary focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring",href:t,rel:"noopener noreferrer",target:"_blank",title:`Open ${e.name} web UI`,children:n.jsx(ys,{"aria-hidden":"true",className:"h-4 w-4"})}):null}function hp(e){const{containers:t,networkRates:r,pendingActions:s,vpnRoles:a,onAction:i,onOpenLogs:l,onOpenDetails:o,onOpenNetworkTest:c}=e;return n.jsxs(n.Fragment,{children:[n.jsx("div",{className:"hidden xl:block",children:n.jsx("div",{className:"overflow-x-auto rounded-lg border border-border bg-card",children:n.jsxs("table",{className:"min-w-full divide-y divide-divider text-sm",children:[n.jsx("thead",{className:"bg-[#0e131a]",children:n.jsx("tr",{children:["Container","Image","Status","CPU","Memory","Network","Actions"].map(u=>n.jsx("th",{className:q("px-4 py-3 font-mono text-[10px] font-medium uppercase tracking-[0.12em] text-dim",u==="Actions"?"text-right":"text-left"),children:u},u))})}),n.jsx("tbody",{className:"divide-y divide-divider",children:t.map(u=>{const h=s[u.id];return n.jsxs("tr",{children:[n.jsx("td",{className:"px-4 py-3",children:n.jsxs("div",{className:"flex min-w-0 items-center gap-2",children:[n.jsx("button",{className:"truncate font-medium text-primary hover:underline",onClick:()=>o(u),children:u.name}),n.jsx(fp,{container:u}),u.health?n.jsx("span",{"aria-label":`Health ${u.health}`,className:q("h-2.5 w-2.5 shrink-0 rounded-full",u.health==="healthy"?"bg-success":u.health==="unhealthy"?"bg-danger":"bg-warning"),title:`Health: ${u.health}`}):null,u.update_available?n.jsx("span",{"aria-label":"Update available",className:"inline-flex text-amber-300",role:"img",title:"Update available",children:n.jsx(je,{"aria-hidden":"true",className:"h-3.5 w-3.5"})}):null,a?.[u.name]?n.jsx(mp,{role:a[u.name]}):null]})}),n.jsx("td",{className:"max-w-[20rem] px-4 py-3 text-muted-foreground",children:n.jsx("span",{className:"line-clamp-2 break-all",children:u.image})}),n.jsx("td",{className:"px-4 py-3",children:n.jsx(fe,{label:u.status,tone:cp(u.status)})}),n.jsx("td",{className:"px-4 py-3",children:n.jsx(fi,{percent:u.cpu_percent})}),n.jsx("td",{className:"px-4 py-3",children:n.jsx(fi,{detail:dp(u),percent:u.memory_percent})}),n.jsx("td",{className:"px-4 py-3",children:n.jsx(up,{rate:r[u.id],rx:u.net_rx,tx:u.net_tx})}),n.jsx("td",{className:"w-[11rem] px-4 py-3 text-right",children:n.jsx(pp,{align:"end",container:u,onAction:i,onOpenLogs:l,onOpenNetworkTest:c,pendingAction:h})})]},u.id)})})]})})}),n.jsx("div",{className:"grid gap-3 xl:hidden",children:t.map(u=>{const h=s[u.id];return n.jsx(Q,{className:"overflow-hidden",children:n.jsxs(K,{className:"space-y-3 p-4",children:[n.jsxs("div",{className:"flex items-start justify-between gap-3",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsxs("div",{className:"flex min-w-0 items-center gap-1",children:[n.jsx("button",{className:"truncate text-left text-sm font-semibold text-primary hover:underline",onClick:()=>o(u),children:u.name}),n.jsx(fp,{container:u})]}),n.jsx("p",{className:"line-clamp-2 break-all text-xs text-muted-foreground",children:u.image}),a?.[u.name]?n.jsx("div",{className:"pt-1",children:n.jsx(mp,{role:a[u.name]})}):null]}),n.jsx(fe,{className:"shrink-0",label:u.status,tone:cp(u.status)})]}),n.jsxs("div",{className:"grid gap-2 text-xs sm:grid-cols-2",children:[n.jsxs("div",{className:"space-y-1 rounded-md border border-border bg-muted/20 p-2",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"CPU"}),n.jsx(fi,{percent:u.cpu_percent})]}),n.jsxs("div",{className:"space-y-1 rounded-md border border-border bg-muted/20 p-2",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Memory"}),n.jsx(fi,{detail:dp(u),percent:u.memory_percent})]})]}),n.jsxs("div",{className:"grid gap-1 rounded-md border border-border bg-muted/20 p-2 text-xs",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Network"}),n.jsx(up,{rate:r[u.id],rx:u.net_rx,tx:u.net_tx})]}),n.jsx(pp,{align:"start",container:u,onAction:i,onOpenLogs:l,onOpenNetworkTest:c,pendingAction:h})]})},u.id)})})]})}async function xg(e){const t=await W("/api/network-groups",{method:"GET",signal:e}),r=Array.isArray(t.groups)?t.groups.map(s=>({provider:String(s.provider??""),provider_status:String(s.provider_status??"unknown"),provider_health:ce(s.provider_health),members:Array.isArray(s.members)?s.members.map(a=>String(a)):[],member_count:Number(s.member_count??0),orphaned_members:Array.isArray(s.orphaned_members)?s.orphaned_members.map(a=>String(a)):[],status:String(s.status??"ok")})):[];return{docker_available:!!t.docker_available,groups:r}}async function gg(e,t){const r=await W(`/api/network-groups/${encodeURIComponent(e)}/recreate`,{method:"POST",signal:t});if(r.error)throw new Error(r.error)}async function U1(e){const t=await fetch("/api/tailscale/status",{method:"GET",credentials:"same-origin",headers:{Accept:"application/json"},signal:e});if(!t.ok)return{available:!1,data:null};const r=await t.json().catch(()=>null);return!r||r.error?{available:!1,data:r}:{available:!0,data:r}}async function B1(e){const t=await W("/api/tailscale/logout",{method:"POST",signal:e});if(t.error)throw new Error(t.error)}const F1=1e4,xp="pihealth.containers.groupByStack",V1=[{key:"all",label:"All"},{key:"running",label:"Running"},{key:"stopped",label:"Stopped"}];function Us(e){return e instanceof Error&&e.message?e.message:"Unable to load containers"}function q1(e){return e==="success"?"border-success/30 text-success":e==="error"?"border-danger/30 text-danger":"border-info/30 text-info"}function H1(e,t,r){if(t==="check_update")return typeof r.update_available=="boolean"?r.update_available?`${e}: update available`:`${e}: up to date`:r.status||`${e}: update check complete`;if(t==="update")return r.status||`${e}: update triggered`;const s=t==="start"?"started":t==="stop"?"stopped":"restarted";return r.status||`${e} ${s} successfully`}function Ur(e){return e&&e.trim().length>0?e:"Unavailable"}function gp(e,t){return e==="loading"?{label:"Running test...",className:"text-sky-300"}:e==="error"?{label:"Error",className:"text-rose-300"}:t===null?{label:"Idle",className:"text-muted-foreground"}:t?{label:"Success",className:"text-emerald-300"}:{label:"Failed",className:"text-amber-300"}}function W1(){const[e,t]=d.useState([]),[r,s]=d.useState({}),[a,i]=d.useState("all"),[l,o]=d.useState(!0),[c,u]=d.useState(!1),[h,m]=d.useState(null),[f,w]=d.useState("Never"),[j,y]=d.useState(null),[b,v]=d.useState({}),[p,x]=d.useState(null),[g,N]=d.useState(null),[E,C]=d.useState([]),[k,O]=d.useState(()=>typeof localStorage>"u"?!1:localStorage.getItem(xp)==="true"),[S,$]=d.useState({open:!1,status:"idle",containerId:null,containerName:"",result:null,error:null}),[R,H]=d.useState({visible:!1,status:"idle",result:null,error:null}),I=d.useRef(!0),U=d.useRef({}),L=d.useRef([]),B=d.useRef({}),[P,M]=d.useState(null),[A,F]=d.useState(null),D=d.useRef(!1),G=d.useCallback(T=>{L.current=T,t(T)},[]),se=d.useCallback((T,Y)=>{v(re=>{const he={...re};return Y?he[T]=Y:delete he[T],U.current=he,he})},[]),de=d.useCallback(async T=>{T==="initial"&&o(!0),T==="manual"&&u(!0);try{const Y=await mg({includeStats:!1});if(!I.current)return null;const re=new Map(L.current.map(_e=>[_e.id,_e])),he=Y.map(_e=>{const ye=re.get(_e.id);return!ye||_e.status!=="running"?_e:{..._e,cpu_percent:ye.cpu_percent,memory_percent:ye.memory_percent,memory_used:ye.memory_used,memory_limit:ye.memory_limit,net_rx:ye.net_rx,net_tx:ye.net_tx,net_rx_rate:ye.net_rx_rate,net_tx_rate:ye.net_tx_rate,block_read_rate:ye.block_read_rate,block_write_rate:ye.block_write_rate}});return G(he),m(null),w(Bt(new Date)),he}catch(Y){return I.current&&m(Us(Y)),null}finally{I.current&&(T==="initial"&&o(!1),T==="manual"&&u(!1))}},[G]),ue=d.useCallback(async T=>{const Y=T.filter(re=>re.status==="running").map(re=>re.id);if(!(!Y.length||D.current)){D.current=!0;try{const re=await _1(Y);if(!I.current)return;const he={};for(const[ye,Ze]of Object.entries(re))(Ze.net_rx_rate!==null||Ze.net_tx_rate!==null)&&(he[ye]={rxRate:Ze.net_rx_rate,txRate:Ze.net_tx_rate});s(he);const _e=L.current.map(ye=>{const Ze=re[ye.id];return Ze?{...ye,...Ze}:ye});G(_e)}catch{}finally{D.current=!1}}},[G]),Ce=d.useCallback(async(T,Y)=>{if(U.current[T.id])return;if(Y==="update"&&B.current[T.name]?.kind==="provider"){M(T);return}const re=hg[Y];se(T.id,Y),y({tone:"info",message:`${re.pendingLabel.replace("...","")} ${T.name}...`});try{const he=await To(T.id,Y);I.current&&y({tone:"success",message:H1(T.name,Y,he)})}catch(he){I.current&&y({tone:"error",message:`${re.label} failed for ${T.name}: ${Us(he)}`})}finally{const he=await de("action");he&&await ue(he),I.current&&se(T.id,null)}},[de,ue,se]),Re=d.useCallback(async(T,Y)=>{M(null),se(T.id,"update"),y({tone:"info",message:`Updating ${T.name}...`});try{await To(T.id,"update"),Y&&await gg(T.name),I.current&&y({tone:"success",message:Y?`Updated ${T.name} and recreated its network group`:`Updated ${T.name} (members may need a manual group recreate)`})}catch(re){I.current&&y({tone:"error",message:`Provider update failed for ${T.name}: ${Us(re)}`})}finally{const re=await de("action");re&&await ue(re),I.current&&se(T.id,null)}},[de,ue,se]),pe=d.useCallback(async()=>{const T=L.current.filter(ye=>ye.status==="running");if(!T.length){y({tone:"info",message:"No running containers to check."});return}F({done:0,total:T.length});const Y=[];let re=0,he=0;const _e=async()=>{for(;re<T.length;){const ye=T[re++];try{(await To(ye.id,"check_update")).update_available&&Y.push(ye.name)}catch{}he+=1,I.current&&F({done:he,total:T.length})}};if(await Promise.all([_e(),_e(),_e()]),I.current){F(null),y({tone:Y.length?"info":"success",message:Y.length?`Updates available (${Y.length}): ${Y.join(", ")}`:"All running containers are up to date."});const ye=await de("action");ye&&await ue(ye)}},[de,ue]),Ft=d.useCallback(()=>{x(null)},[]),kt=d.useCallback(()=>{$(T=>({...T,open:!1}))},[]),rt=d.useCallback(T=>{x(T)},[]),vt=d.useCallback(async T=>{$({open:!0,status:"loading",containerId:T.id,containerName:T.name,result:null,error:null});try{const Y=await S1(T.id);if(!I.current)return;$({open:!0,status:"ready",containerId:T.id,containerName:Y.container_name||T.name,result:Y,error:null})}catch(Y){if(!I.current)return;$({open:!0,status:"error",containerId:T.id,containerName:T.name,result:null,error:Us(Y)})}},[]),Xe=d.useCallback(async()=>{H(T=>({...T,visible:!0,status:"loading",result:null,error:null}));try{const T=await pg();if(!I.current)return;H({visible:!0,status:"ready",result:T,error:null})}catch(T){if(!I.current)return;H({visible:!0,status:"error",result:null,error:Us(T)})}},[]),qe=d.useCallback(async T=>{const Y=await de(T);Y&&await ue(Y)},[de,ue]);d.useEffect(()=>{I.current=!0,qe("initial");const T=window.setInterval(()=>{qe("poll")},F1);return()=>{I.current=!1,window.clearInterval(T)}},[qe]),d.useEffect(()=>{if(!j||j.tone==="error")return;const T=window.setTimeout(()=>{y(null)},4500);return()=>{window.clearTimeout(T)}},[j]);const Ge=d.useMemo(()=>E1(e,a),[e,a]),Xt=d.useMemo(()=>b1(e),[e]);d.useEffect(()=>{const T=new AbortController;return xg(T.signal).then(Y=>C(Y.groups)).catch(()=>{}),()=>T.abort()},[]),d.useEffect(()=>{typeof localStorage<"u"&&localStorage.setItem(xp,k?"true":"false")},[k]);const Fe=d.useMemo(()=>{const T={};for(const Y of E){Y.provider&&(T[Y.provider]={kind:"provider",provider:Y.provider});for(const re of Y.members)T[re]={kind:"member",provider:Y.provider};for(const re of Y.orphaned_members)T[re]={kind:"orphaned",provider:Y.provider}}return T},[E]);d.useEffect(()=>{B.current=Fe},[Fe]);const V=d.useMemo(()=>{if(!k)return null;const T=new Map;for(const Y of Ge){const re=Y.stack??"Standalone",he=T.get(re)??[];he.push(Y),T.set(re,he)}return[...T.entries()].sort(([Y],[re])=>Y==="Standalone"?1:re==="Standalone"?-1:Y.localeCompare(re))},[k,Ge]),te=gp(R.status,R.result?R.result.ping_success:null),z=gp(S.status,S.result?S.result.ping_success:null);return n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(n.Fragment,{children:[n.jsxs(_,{className:"gap-2","data-check-all-updates":!0,disabled:A!==null||Object.keys(b).length>0,onClick:()=>void pe(),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",A!==null?"animate-spin":"")}),A!==null?`checking ${A.done}/${A.total}`:"check all"]}),n.jsxs(_,{className:"gap-2",id:"v2-host-network-test-button",onClick:()=>void Xe(),variant:"secondary",children:[R.status==="loading"?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(ou,{"aria-hidden":"true",className:"h-4 w-4"}),"network test"]}),n.jsxs(_,{className:"gap-2",disabled:c,onClick:()=>void qe("manual"),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",c?"animate-spin":"")}),c?"refreshing":"refresh"]})]}),description:`docker · ${e.length} containers · synced ${f}`,status:n.jsx(fe,{label:`${e.filter(T=>T.status==="running").length} running`,tone:"success"}),title:"docker_containers"}),n.jsxs("div",{"aria-label":"Container filters",className:"flex flex-wrap items-center gap-2",role:"group",children:[V1.map(T=>n.jsx(_,{"aria-pressed":a===T.key,onClick:()=>i(T.key),size:"sm",variant:a===T.key?"default":"outline",children:T.label},T.key)),e.some(T=>T.update_available)?n.jsxs(_,{"aria-pressed":a==="updates","data-filter":"updates",onClick:()=>i("updates"),size:"sm",variant:a==="updates"?"default":"outline",children:["Updates (",e.filter(T=>T.update_available).length,")"]}):null,n.jsx(_,{"aria-pressed":k,className:"ml-auto","data-group-by-stack":!0,onClick:()=>O(T=>!T),size:"sm",variant:k?"default":"outline",children:"Group by stack"})]}),R.visible?n.jsxs(Q,{className:"border-sky-500/30",id:"v2-host-network-panel",children:[n.jsx(xe,{className:"space-y-3",children:n.jsxs("div",{className:"flex flex-wrap items-start justify-between gap-2",children:[n.jsxs("div",{children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"Host Network Diagnostics"}),n.jsx(we,{children:"Runs a direct host probe against public network endpoints."})]}),n.jsx(_,{id:"v2-host-network-hide",onClick:()=>H(T=>({...T,visible:!1})),variant:"outline",children:"Hide"})]})}),n.jsxs(K,{className:"space-y-3",children:[n.jsxs("div",{className:"grid gap-2 rounded-lg border border-border/70 bg-muted/30 p-3 text-sm sm:grid-cols-3",children:[n.jsxs("div",{children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Status"}),n.jsx("p",{className:q("font-medium",te.className),id:"v2-host-network-status",children:te.label})]}),n.jsxs("div",{children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Local IP"}),n.jsx("p",{className:"break-words font-mono text-xs sm:text-sm",children:Ur(R.result?.local_ip??null)})]}),n.jsxs("div",{children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Public IP"}),n.jsx("p",{className:"break-words font-mono text-xs sm:text-sm",children:Ur(R.result?.public_ip??null)})]})]}),n.jsxs("div",{className:"grid gap-2 rounded-lg border border-border/70 bg-muted/30 p-3 text-sm",children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Probe Method"}),n.jsx("p",{className:"font-mono text-xs sm:text-sm",children:Ur(R.result?.probe_method??null)})]}),n.jsxs("div",{className:"rounded-lg border border-border/70 bg-muted/20 p-3",children:[n.jsx("p",{className:"mb-2 text-xs uppercase tracking-wide text-muted-foreground",children:"Output"}),n.jsx("pre",{className:"max-h-[16rem] overflow-auto whitespace-pre-wrap break-words text-xs sm:text-sm",id:"v2-host-network-output",children:R.status==="loading"?"Running test...":R.status==="error"?R.error||"Host diagnostics failed":R.result?.ping_output||"No output provided."})]})]})]}):null,j?n.jsx(Q,{"aria-live":j.tone==="error"?"assertive":"polite",className:q1(j.tone),role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm",children:[j.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):j.tone==="info"?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),j.message]})}):null,h&&!e.length?n.jsx(Q,{className:"border-rose-500/40",children:n.jsxs(K,{className:"flex flex-col items-start gap-3 p-4 sm:p-6",children:[n.jsxs("div",{className:"flex items-center gap-2 text-rose-300",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),n.jsx("p",{className:"text-sm font-medium",children:"Unable to load containers"})]}),n.jsx("p",{className:"text-sm text-muted-foreground",children:h}),n.jsx(_,{onClick:()=>void qe("manual"),variant:"outline",children:"Retry"})]})}):null,h&&e.length?n.jsx(Q,{className:"border-amber-500/40",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm text-amber-300",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Refresh failed: ",h]})}):null,Xt?n.jsxs("div",{className:"flex items-start gap-3 border-l-2 border-warning/60 bg-warning/[0.04] px-4 py-3 text-sm",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-warning"}),n.jsxs("p",{className:"text-muted-foreground",children:[n.jsx("span",{className:"font-medium text-warning",children:"Container memory is not accounted for on this host."})," ","The kernel was booted without the memory cgroup, so Docker reports no usage for any container. Add"," ",n.jsx("code",{className:"rounded bg-muted px-1 py-0.5 font-mono text-xs text-foreground",children:"cgroup_enable=memory cgroup_memory=1"})," ","to ",n.jsx("code",{className:"font-mono text-xs",children:"/boot/firmware/cmdline.txt"})," ","and reboot. CPU and network figures are unaffected."]})]}):null,l?n.jsx(Q,{"aria-live":"polite",role:"status",children:n.jsxs(K,{className:"flex min-h-[14rem] items-center justify-center gap-2 p-6 text-sm text-muted-foreground",children:[n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4 animate-pulse text-primary"}),"Loading containers..."]})}):null,!l&&!Ge.length?n.jsx(Q,{children:n.jsxs(K,{className:"flex min-h-[10rem] items-center justify-center p-6 text-sm text-muted-foreground",children:["No ",a," containers found."]})}):null,!l&&Ge.length?V?n.jsx("div",{className:"space-y-6",children:V.map(([T,Y])=>n.jsxs("section",{className:"space-y-2","data-stack-group":T,children:[n.jsxs("div",{className:"flex items-center gap-2",children:[T==="Standalone"?n.jsx("h3",{className:"text-sm font-semibold text-muted-foreground",children:"Standalone"}):n.jsx("a",{className:"text-sm font-semibold text-primary hover:underline",href:"/v2/stacks",children:T}),n.jsx("span",{className:"text-xs text-muted-foreground",children:Y.length})]}),n.jsx(hp,{containers:Y,networkRates:r,onAction:Ce,onOpenDetails:N,onOpenLogs:rt,onOpenNetworkTest:vt,pendingActions:b,vpnRoles:Fe})]},T))}):n.jsx(hp,{containers:Ge,networkRates:r,onAction:Ce,onOpenDetails:N,onOpenLogs:rt,onOpenNetworkTest:vt,pendingActions:b,vpnRoles:Fe}):null,p?n.jsx(fg,{closeId:"v2-logs-modal-close",description:"Container log snapshot with optional five-second refresh.",filename:`${p.name}.log`,idPrefix:"v2-logs",load:async T=>(await k1(p.id,T)).logs,onClose:Ft,title:`Container Logs: ${p.name}`}):null,g?n.jsx(M1,{container:g,onClose:()=>N(null)}):null,P?n.jsx(ze,{onClose:()=>M(null),children:n.jsxs(Q,{className:"w-full max-w-md","data-provider-update-modal":!0,children:[n.jsxs(xe,{children:[n.jsxs(ge,{className:"text-base",children:["Update ",P.name,"?"]}),n.jsxs(we,{children:[P.name," is a VPN network provider. Updating it recreates its container and orphans every member routed through it (",n.jsx("span",{className:"font-mono",children:"network_mode: service:"}),") until the group is recreated."]})]}),n.jsxs(K,{className:"flex flex-wrap gap-2",children:[n.jsx(_,{"data-provider-update-recreate":!0,onClick:()=>void Re(P,!0),children:"Update & recreate group"}),n.jsx(_,{onClick:()=>void Re(P,!1),variant:"outline",children:"Update only"}),n.jsx(_,{onClick:()=>M(null),variant:"ghost",children:"Cancel"})]})]})}):null,S.open?n.jsx(ze,{onClose:kt,children:n.jsxs(Q,{"aria-labelledby":"v2-container-network-modal-title","aria-modal":"true",className:"flex max-h-[90vh] w-full max-w-4xl flex-col overflow-hidden",id:"v2-container-network-modal",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsxs(ge,{id:"v2-container-network-modal-title",className:"text-base sm:text-lg",children:["Container Network Test: ",S.containerName]}),n.jsx(we,{children:"Probe result from `/api/containers/<id>/network-test`."})]}),n.jsx(_,{id:"v2-container-network-modal-close",onClick:kt,variant:"outline",children:"Close"})]}),n.jsxs(K,{className:"space-y-3 overflow-auto p-4",children:[n.jsxs("div",{className:"grid gap-2 rounded-lg border border-border/70 bg-muted/30 p-3 text-sm sm:grid-cols-3",children:[n.jsxs("div",{children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Status"}),n.jsx("p",{className:q("font-medium",z.className),id:"v2-container-network-status",children:z.label})]}),n.jsxs("div",{children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Local IP"}),n.jsx("p",{className:"break-words font-mono text-xs sm:text-sm",children:Ur(S.result?.local_ip??null)})]}),n.jsxs("div",{children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Public IP"}),n.jsx("p",{className:"break-words font-mono text-xs sm:text-sm",children:Ur(S.result?.public_ip??null)})]})]}),n.jsxs("div",{className:"grid gap-2 rounded-lg border border-border/70 bg-muted/30 p-3 text-sm",children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Probe Method"}),n.jsx("p",{className:"font-mono text-xs sm:text-sm",children:Ur(S.result?.probe_method??null)})]}),n.jsxs("div",{className:"rounded-lg border border-border/70 bg-muted/20 p-3",children:[n.jsx("p",{className:"mb-2 text-xs uppercase tracking-wide text-muted-foreground",children:"Output"}),n.jsx("pre",{className:"max-h-[16rem] overflow-auto whitespace-pre-wrap break-words text-xs sm:text-sm",id:"v2-container-network-output",children:S.status==="loading"?"Collecting diagnostics...":S.status==="error"?S.error||"Failed to run container network test":S.result?.ping_output||"No output provided."})]})]})]})}):null]})}function vg({percent:e,tone:t}){return n.jsx("div",{"aria-hidden":"true",className:"mt-2 h-1 overflow-hidden rounded-full bg-border",children:n.jsx("div",{className:q("h-full rounded-full transition-[width] duration-500",t),style:{width:`${Math.max(0,Math.min(e??0,100))}%`}})})}function G1({stream:e}){const t=e.is_paused?xN:Kc,r=[e.user,e.client||e.device].filter(Boolean).join(" · ");return n.jsx("li",{className:"min-w-0 border-t border-divider py-3 first:border-t-0 first:pt-0 last:pb-0",children:n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx(t,{"aria-hidden":"true",className:q("mt-0.5 h-4 w-4 shrink-0",e.is_paused?"text-muted-foreground":"text-success")}),n.jsxs("div",{className:"min-w-0 flex-1",children:[n.jsxs("div",{className:"flex min-w-0 items-baseline justify-between gap-2",children:[n.jsx("p",{className:"min-w-0 truncate text-sm text-foreground",title:e.title,children:e.title}),n.jsx("span",{className:"shrink-0 font-mono text-[10px] text-dim",children:_t(e.progress_percent,0)})]}),e.subtitle?n.jsx("p",{className:"truncate text-xs text-muted-foreground",children:e.subtitle}):null,n.jsxs("div",{className:"mt-1 flex flex-wrap items-center gap-1.5",children:[r?n.jsx("span",{className:"font-mono text-[10px] text-dim",children:r}):null,e.is_transcoding?n.jsx(ee,{tone:"warning",title:e.transcode_reason??"Transcoding uses far more CPU than direct play",children:"transcoding"}):e.play_method?n.jsx(ee,{tone:"success",children:e.play_method.toLowerCase()}):null,e.is_paused?n.jsx(ee,{tone:"neutral",children:"paused"}):null]}),n.jsx(vg,{percent:e.progress_percent,tone:e.is_paused?"bg-dim":"bg-success"}),e.duration_seconds?n.jsxs("p",{className:"mt-1 font-mono text-[10px] text-dim",children:[fl(e.position_seconds)," of"," ",fl(e.duration_seconds)]}):null]})]})})}function K1({download:e}){const t=(e.speed_bytes??0)>0;return n.jsxs("li",{className:"min-w-0 border-t border-divider py-3 first:border-t-0 first:pt-0 last:pb-0",children:[n.jsxs("div",{className:"flex min-w-0 items-baseline justify-between gap-2",children:[n.jsx("p",{className:"min-w-0 truncate text-sm text-foreground",title:e.name,children:e.name}),n.jsx("span",{className:"shrink-0 font-mono text-[10px] text-dim",children:_t(e.progress_percent,0)})]}),n.jsxs("div",{className:"mt-1 flex flex-wrap items-center gap-1.5",children:[n.jsx(ee,{tone:"neutral",children:e.label||e.source}),n.jsx(ee,{tone:t?"info":"neutral",children:e.state}),t?n.jsx("span",{className:"font-mono text-[10px] text-info",children:pl(e.speed_bytes)}):null,e.eta?n.jsxs("span",{className:"font-mono text-[10px] text-dim",children:[e.eta," left"]}):null,e.remaining_bytes!==null?n.jsxs("span",{className:"font-mono text-[10px] text-dim",children:[Pe(e.remaining_bytes)," of ",Pe(e.size_bytes)]}):null]}),n.jsx(vg,{percent:e.progress_percent,tone:t?"bg-info":"bg-dim"})]})}function Q1({queue:e}){return n.jsxs("li",{className:"flex min-w-0 items-center justify-between gap-3 border-t border-divider py-2.5 first:border-t-0 first:pt-0 last:pb-0",children:[n.jsxs("div",{className:"flex min-w-0 items-center gap-2",children:[n.jsx("span",{className:"truncate text-sm text-foreground",children:e.label||e.source}),e.problems>0?n.jsxs(ee,{tone:"warning",title:"Items in this queue need attention",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-3 w-3"}),e.problems]}):null]}),n.jsxs("span",{className:"shrink-0 font-mono text-xs text-muted-foreground",children:[e.total," queued"]})]})}function $o({title:e,icon:t,children:r}){return n.jsxs("div",{className:"min-w-0",children:[n.jsxs("div",{className:"mb-2 flex items-center gap-1.5",children:[n.jsx(t,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-dim"}),n.jsx("span",{className:"font-mono text-[11px] uppercase text-dim",children:e})]}),r]})}function J1({snapshot:e,error:t}){const r=e?.totals,s=(e?.services??[]).filter(i=>!i.reachable),a=e!==null&&r!==void 0&&r.streams===0&&r.downloads===0&&r.queued===0;return n.jsx(Q,{children:n.jsxs(K,{className:"p-4 sm:p-5",children:[n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-3",children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(Kc,{"aria-hidden":"true",className:"h-4 w-4 text-primary"}),n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"activity"})]}),n.jsx("div",{className:"flex flex-wrap items-center gap-1.5",children:r?n.jsxs(n.Fragment,{children:[n.jsxs(ee,{tone:r.streams>0?"success":"neutral",children:[r.streams," streaming"]}),r.transcodes>0?n.jsxs(ee,{tone:"warning",children:[r.transcodes," transcoding"]}):null,n.jsxs(ee,{tone:r.downloads>0?"info":"neutral",children:[r.downloads," downloading"]}),r.download_speed>0?n.jsx(ee,{tone:"info",children:pl(r.download_speed)}):null]}):null})]}),t?n.jsxs("p",{className:"mt-4 text-sm text-muted-foreground",children:[n.jsx("span",{className:"text-warning",children:"Activity unavailable:"})," ",t]}):null,!e&&!t?n.jsx("p",{className:"mt-4 text-sm text-muted-foreground",children:"Checking media services..."}):null,a?n.jsxs("div",{className:"mt-4 flex items-center gap-2 text-sm text-muted-foreground",children:[n.jsx(lt,{"aria-hidden":"true",className:"h-4 w-4 text-success"}),"Nothing streaming or downloading right now."]}):null,e&&!a?n.jsxs("div",{className:"mt-4 space-y-5",children:[e.streams.length?n.jsx($o,{icon:Kc,title:"now playing",children:n.jsx("ul",{children:e.streams.map(i=>n.jsx(G1,{stream:i},`${i.source}:${i.title}:${i.user}`))})}):null,e.downloads.length?n.jsx($o,{icon:Oa,title:"downloading",children:n.jsx("ul",{children:e.downloads.map(i=>n.jsx(K1,{download:i},`${i.source}:${i.name}`))})}):null,e.queues.some(i=>i.total>0)?n.jsx($o,{icon:aN,title:"queues",children:n.jsx("ul",{children:e.queues.filter(i=>i.total>0).map(i=>n.jsx(Q1,{queue:i},i.source))})}):null]}):null,s.length?n.jsxs("details",{className:"mt-4 border-t border-divider pt-3",children:[n.jsxs("summary",{className:"cursor-pointer font-mono text-[10px] uppercase text-dim hover:text-muted-foreground",children:[s.length," service",s.length===1?"":"s"," not reporting"]}),n.jsx("ul",{className:"mt-2 space-y-1",children:s.map(i=>n.jsxs("li",{className:"text-xs text-muted-foreground",children:[n.jsx("span",{className:"text-foreground",children:i.label||i.name}),i.detail?` — ${i.detail}`:null]},i.id||i.name))})]}):null]})})}const Y1=[{key:"cpu",label:"cpu"},{key:"memory",label:"memory"}];function X1(e){return e===null?"neutral":e>=3?"danger":e>=1.5?"warning":"success"}function Z1(e,t){return e===null||t<=0?0:Math.max(2,Math.min(100,e/t*100))}function ek({consumer:e,basis:t,peak:r}){const s=t==="cpu"?e.cpu_percent:e.memory_bytes,a=t==="cpu"?_t(e.cpu_percent):Pe(e.memory_bytes);return n.jsxs("li",{className:"min-w-0 py-2 first:pt-0 last:pb-0",children:[n.jsxs("div",{className:"flex min-w-0 items-baseline justify-between gap-3",children:[n.jsx("span",{className:"min-w-0 truncate text-sm text-foreground",title:e.name,children:e.name}),n.jsx("span",{className:"shrink-0 font-mono text-xs text-muted-foreground",children:a})]}),n.jsx("div",{className:"mt-1.5 h-1 overflow-hidden rounded-full bg-border",children:n.jsx("div",{className:q("h-full rounded-full transition-[width] duration-300",t==="cpu"?"bg-primary":"bg-info"),style:{width:`${Z1(s,r)}%`}})})]})}function vp({consumers:e,basis:t,emptyLabel:r}){if(!e.length)return n.jsx("p",{className:"py-3 text-sm text-muted-foreground",children:r});const s=e.reduce((a,i)=>{const l=t==="cpu"?i.cpu_percent:i.memory_bytes;return l!==null&&l>a?l:a},0);return n.jsx("ul",{className:"divide-y divide-divider",children:e.map(a=>n.jsx(ek,{basis:t,consumer:a,peak:s},a.id))})}function tk({pressure:e}){const[t,r]=d.useState("cpu"),s=t==="cpu"?e.containers.by_cpu:e.containers.by_memory,a=t==="cpu"?e.processes.by_cpu:e.processes.by_memory,i=e.load_average,l=e.containers.capabilities.memory!==!1;return n.jsx(Q,{children:n.jsxs(K,{className:"p-4 sm:p-5",children:[n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-3",children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(Fl,{"aria-hidden":"true",className:"h-4 w-4 text-primary"}),n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"top consumers"})]}),n.jsx("div",{className:"flex items-center gap-1 rounded-md border border-border p-0.5",children:Y1.map(o=>n.jsx("button",{"aria-pressed":t===o.key,className:q("min-h-7 rounded px-2.5 font-mono text-[11px] transition-colors",t===o.key?"bg-primary/15 text-primary":"text-muted-foreground hover:text-foreground"),onClick:()=>r(o.key),type:"button",children:o.label},o.key))})]}),n.jsxs("div",{className:"mt-3 flex flex-wrap items-center gap-2",children:[i?n.jsxs(ee,{tone:X1(i.per_core),children:["load ",i.one?.toFixed(2)??"—",i.cpu_count?` / ${i.cpu_count} cores`:""]}):null,e.uptime_seconds!==null?n.jsxs(ee,{tone:"neutral",children:[n.jsx(QN,{"aria-hidden":"true",className:"h-3 w-3"}),"up ",fl(e.uptime_seconds)]}):null,e.processes.total!==null?n.jsxs(ee,{tone:"neutral",children:[e.processes.total," processes"]}):null]}),n.jsxs("div",{className:"mt-4 grid gap-4 divide-divider sm:grid-cols-2 sm:gap-5 sm:divide-x",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsxs("div",{className:"mb-2 flex items-center justify-between gap-2",children:[n.jsxs("span",{className:"flex items-center gap-1.5 font-mono text-[11px] uppercase text-dim",children:[n.jsx(Ul,{"aria-hidden":"true",className:"h-3.5 w-3.5"})," containers"]}),n.jsx(Ee,{className:"font-mono text-[10px] text-muted-foreground hover:text-primary",to:"/containers",children:"all"})]}),n.jsx(vp,{basis:t,consumers:s,emptyLabel:t==="memory"&&!l?"Container memory is not accounted for on this host.":"No container is using measurable resources."})]}),n.jsxs("div",{className:"min-w-0 sm:pl-5",children:[n.jsxs("div",{className:"mb-2 flex items-center justify-between gap-2",children:[n.jsxs("span",{className:"flex items-center gap-1.5 font-mono text-[11px] uppercase text-dim",children:[n.jsx(zw,{"aria-hidden":"true",className:"h-3.5 w-3.5"})," host processes"]}),n.jsx(Ee,{className:"font-mono text-[10px] text-muted-foreground hover:text-primary",to:"/system",children:"system"})]}),n.jsx(vp,{basis:t,consumers:a,emptyLabel:"No process is using measurable resources."})]})]}),t==="cpu"?n.jsxs("p",{className:"mt-3 font-mono text-[10px] text-dim",children:["cpu % is per core, as reported by docker stats and top",i?.cpu_count?` — ${i.cpu_count*100}% uses the whole machine`:""]}):null]})})}const nk={primary:"bg-primary",success:"bg-success",warning:"bg-warning",danger:"bg-danger",info:"bg-info"};function Yt({value:e,tone:t="primary",className:r,label:s}){const a=e!=null&&Number.isFinite(Number(e)),i=a?Math.min(100,Math.max(0,Number(e))):0;return n.jsx("div",{"aria-label":s,"aria-valuemax":100,"aria-valuemin":0,"aria-valuenow":a?Math.round(i):void 0,className:q("h-1 overflow-hidden rounded-full bg-border",r),role:"progressbar",children:n.jsx("div",{className:q("h-full rounded-full transition-[width] duration-300",nk[t]),style:{width:`${i}%`}})})}const mu="limeos.liveRefresh.v1",Yc="limeos:live-refresh-change",oa={enabled:!1,intervalSeconds:30};function yg(e){if(!e)return oa;try{const t=JSON.parse(e);return typeof t.enabled!="boolean"||t.interval_seconds!==30&&t.interval_seconds!==60?oa:{enabled:t.enabled,intervalSeconds:t.interval_seconds}}catch{return oa}}function rk(){if(typeof window>"u")return oa;try{return yg(window.localStorage.getItem(mu))}catch{return oa}}function sk(e){try{window.localStorage.setItem(mu,JSON.stringify({enabled:e.enabled,interval_seconds:e.intervalSeconds}))}catch{}window.dispatchEvent(new CustomEvent(Yc,{detail:e}))}function ak(e){const[t,r]=d.useState(rk),s=d.useRef(e);d.useEffect(()=>{s.current=e},[e]),d.useEffect(()=>{const o=u=>{u.key===mu&&r(yg(u.newValue))},c=u=>{const h=u.detail;h&&r(h)};return window.addEventListener("storage",o),window.addEventListener(Yc,c),()=>{window.removeEventListener("storage",o),window.removeEventListener(Yc,c)}},[]),d.useEffect(()=>{if(!t.enabled)return;let o=null;const c=()=>{o!==null&&(window.clearInterval(o),o=null)},u=()=>{c(),document.visibilityState==="visible"&&(o=window.setInterval(()=>s.current(),t.intervalSeconds*1e3))},h=()=>{document.visibilityState==="visible"?(s.current(),u()):c()};return u(),document.addEventListener("visibilitychange",h),()=>{c(),document.removeEventListener("visibilitychange",h)}},[t.enabled,t.intervalSeconds]);const a=d.useCallback(o=>{r(o),sk(o)},[]),i=d.useCallback(o=>a({...t,enabled:o}),[t,a]),l=d.useCallback(o=>a({...t,intervalSeconds:o}),[t,a]);return{preference:t,setEnabled:i,setIntervalSeconds:l}}function bg({isRefreshing:e,onRefresh:t}){const{preference:r,setEnabled:s,setIntervalSeconds:a}=ak(t);return n.jsxs("div",{className:"flex flex-wrap items-center justify-end gap-2",children:[n.jsxs("div",{className:"flex min-h-9 items-center gap-2 rounded-md border border-border bg-card px-2",children:[n.jsx("span",{className:"font-mono text-[11px] text-muted-foreground",children:"auto"}),n.jsx("button",{"aria-checked":r.enabled,"aria-label":"Auto refresh",className:q("relative h-5 w-9 cursor-pointer rounded-full border transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring",r.enabled?"border-primary/50 bg-primary/25":"border-[#303a47] bg-muted"),onClick:()=>s(!r.enabled),role:"switch",type:"button",children:n.jsx("span",{"aria-hidden":"true",className:q("absolute top-0.5 h-3.5 w-3.5 rounded-full transition-transform",r.enabled?"translate-x-[17px] bg-primary":"translate-x-0.5 bg-muted-foreground")})})]}),n.jsx("div",{"aria-label":"Auto refresh interval",className:"flex rounded-md border border-border bg-card p-0.5",role:"group",children:[30,60].map(i=>n.jsxs("button",{"aria-pressed":r.intervalSeconds===i,className:q("min-h-8 min-w-11 cursor-pointer rounded px-2 font-mono text-[11px] transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring disabled:cursor-not-allowed disabled:opacity-40",r.intervalSeconds===i?"bg-muted text-foreground":"text-muted-foreground hover:text-foreground"),disabled:!r.enabled,onClick:()=>a(i),type:"button",children:[i,"s"]},i))}),n.jsx(_,{"aria-label":"Refresh now",className:"min-h-9 w-10 px-0",disabled:e,onClick:t,size:"sm",title:"Refresh now",variant:"secondary",children:n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",e&&"animate-spin")})})]})}function jg(e){return e&&typeof e=="object"?e:{}}function Ks(e){return Array.isArray(e)?e.map(t=>jg(t)):[]}function ik(e){return{source:String(e.source??""),label:String(e.label??""),title:String(e.title??"Unknown title"),subtitle:String(e.subtitle??""),user:String(e.user??""),client:String(e.client??""),device:String(e.device??""),play_method:ce(e.play_method),is_paused:!!e.is_paused,is_transcoding:!!e.is_transcoding,transcode_reason:ce(e.transcode_reason),bitrate:ne(e.bitrate),progress_percent:ne(e.progress_percent),position_seconds:ne(e.position_seconds),duration_seconds:ne(e.duration_seconds)}}function lk(e){return{source:String(e.source??""),label:String(e.label??""),name:String(e.name??"Unknown item"),state:String(e.state??"queued"),progress_percent:ne(e.progress_percent),size_bytes:ne(e.size_bytes),remaining_bytes:ne(e.remaining_bytes),speed_bytes:ne(e.speed_bytes),eta:ce(e.eta)}}function ok(e){return{source:String(e.source??""),label:String(e.label??""),total:ne(e.total)??0,problems:ne(e.problems)??0,items:Ks(e.items).map(t=>({title:String(t.title??"Unknown item"),state:String(t.state??"queued"),status:String(t.status??"unknown")}))}}function ck(e){return{id:String(e.id??""),name:String(e.name??"unknown"),label:String(e.label??""),family:String(e.family??""),reachable:!!e.reachable,detail:ce(e.detail)}}async function dk(e){const t=await W("/api/activity",{method:"GET",signal:e}),r=jg(t.totals);return{collected_at:String(t.collected_at??""),streams:Ks(t.streams).map(ik),downloads:Ks(t.downloads).map(lk),queues:Ks(t.queues).map(ok),services:Ks(t.services).map(ck),totals:{streams:ne(r.streams)??0,transcodes:ne(r.transcodes)??0,downloads:ne(r.downloads)??0,download_speed:ne(r.download_speed)??0,queued:ne(r.queued)??0,queue_problems:ne(r.queue_problems)??0}}}const uk={load_average:null,uptime_seconds:null,containers:{by_cpu:[],by_memory:[],capabilities:{},sampled_at:null},processes:{by_cpu:[],by_memory:[],total:null}};async function mk(e){const t=await W("/api/overview",{method:"GET",signal:e});return{...t,pressure:{...uk,...t.pressure??{}}}}function pk(e,t=typeof window>"u"?null:window.location.hostname){if(e.web_url)try{const a=new URL(e.web_url);if((a.protocol==="http:"||a.protocol==="https:")&&!a.username&&!a.password)return a.href}catch{}if(!e.port||!t)return null;const r=e.web_scheme??"http",s=t.includes(":")&&!t.startsWith("[")?`[${t}]`:t;return`${r}://${s}:${e.port}`}const Io=12,fk=1e4,hk={transmission:"Transmission",jackett:"Jackett",sonarr:"Sonarr",radarr:"Radarr",nzbget:"NZBGet",jellyfin:"Jellyfin",get_iplayer:"Get iPlayer",rtdclient:"RTD Client",rdtclient:"RDT Client",lidarr:"Lidarr",audiobookshelf:"Audiobookshelf","airsonic-advanced":"Airsonic"},xk={healthy:{label:"All systems operational",detail:"Metrics, workloads, and monitored resources are healthy.",tone:"success"},attention:{label:"Attention required",detail:"One or more resources need review.",tone:"warning"},critical:{label:"Critical issues",detail:"Immediate action is recommended.",tone:"danger"},unknown:{label:"Status unavailable",detail:"Some health sources could not be checked.",tone:"neutral"}};function gk(e){return hk[e.toLowerCase()]??e.replace(/[-_]+/g," ").replace(/\b\w/g,t=>t.toUpperCase())}function Qs(e,t,r){return e===null?"info":e>=r?"danger":e>=t?"warning":"success"}function vk(e){return{primary:"text-primary",success:"text-success",warning:"text-warning",danger:"text-danger",info:"text-info"}[e]}function yk(e){return!e||e.swap_total===null?{value:"—",percent:null,tone:"info"}:e.swap_total===0?{value:"none",detail:"not configured",percent:0,tone:"success"}:{value:_t(e.swap_percent),detail:`${Pe(e.swap_used)} / ${Pe(e.swap_total)}`,percent:e.swap_percent,tone:Qs(e.swap_percent,25,60)}}function yp(e){return e instanceof Error&&e.message?e.message:"Unable to load Overview"}function bk(e){const t=new Date(e);if(Number.isNaN(t.getTime()))return"time unavailable";const r=new Date;return t.toDateString()===r.toDateString()?Bt(t):new Intl.DateTimeFormat(void 0,{day:"numeric",month:"short"}).format(t)}function Bs({label:e,value:t,percent:r,tone:s,detail:a}){return n.jsx(Ee,{className:"group block focus-visible:outline-none",to:"/system",children:n.jsx(Q,{className:"h-full transition-colors group-hover:border-[#303b48] group-focus-visible:ring-2 group-focus-visible:ring-ring",children:n.jsxs(K,{className:"p-4",children:[n.jsxs("div",{className:"flex items-center justify-between gap-2",children:[n.jsx("p",{className:"font-mono text-[11px] uppercase text-muted-foreground",children:e}),n.jsx(Fl,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-dim transition-colors group-hover:text-primary"})]}),n.jsxs("div",{className:"mt-1 flex min-h-8 items-baseline justify-between gap-3",children:[n.jsx("p",{className:q("font-mono text-xl font-medium",vk(s)),children:t}),a?n.jsx("p",{className:"truncate font-mono text-[10px] text-dim",children:a}):null]}),n.jsx(Yt,{className:"mt-2",label:`${e} ${t}`,tone:s,value:r})]})})})}function jk({state:e,issues:t}){const r=xk[e],a=e==="healthy"?lt:e==="critical"?za:ie,i={success:"border-success/60 bg-success/[0.06] text-success",warning:"border-warning/60 bg-warning/[0.06] text-warning",danger:"border-danger/60 bg-danger/[0.06] text-danger",neutral:"border-muted-foreground/40 bg-muted/40 text-muted-foreground"}[r.tone];return n.jsxs("section",{"aria-labelledby":"overview-health-title",className:q("border-l-2",i),children:[n.jsxs("div",{className:"flex flex-col gap-4 px-4 py-4 sm:flex-row sm:items-center sm:justify-between sm:px-5",children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx(a,{"aria-hidden":"true",className:"mt-0.5 h-5 w-5 shrink-0"}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("h2",{className:"font-mono text-base font-semibold text-foreground",id:"overview-health-title",children:r.label}),n.jsx("p",{className:"mt-0.5 text-sm text-muted-foreground",children:r.detail})]})]}),n.jsxs(ee,{tone:r.tone,children:[t.length," ",t.length===1?"issue":"issues"]})]}),t.length?n.jsx("div",{className:"grid border-t border-current/15 sm:grid-cols-2 xl:grid-cols-3",children:t.slice(0,3).map(l=>n.jsxs(Ee,{className:"flex min-w-0 items-center justify-between gap-3 border-b border-current/10 px-4 py-2.5 text-sm transition-colors hover:bg-white/[0.025] sm:border-r sm:px-5 xl:border-b-0",to:l.path,children:[n.jsx("span",{className:"min-w-0 truncate text-foreground",children:l.label}),n.jsx("span",{className:"shrink-0 font-mono text-[10px] uppercase text-current",children:"review"})]},l.code))}):null]})}function bp({record:e,recovered:t=!1}){return n.jsxs("div",{className:"flex min-w-0 items-start gap-3 border-t border-divider py-3 first:border-t-0 first:pt-0 last:pb-0",children:[n.jsx("span",{"aria-hidden":"true",className:q("mt-1.5 h-2 w-2 shrink-0 rounded-full",t?"bg-success":e.severity==="critical"?"bg-danger":"bg-warning")}),n.jsxs("div",{className:"min-w-0 flex-1",children:[n.jsx("p",{className:"truncate text-sm text-foreground",children:e.summary}),n.jsxs("p",{className:"mt-0.5 font-mono text-[10px] text-dim",children:[t?"resolved":e.kind," · ",bk(e.at)]})]})]})}function wk({application:e}){const t=gk(e.name),r=e.status==="running",s=pk(e),a=n.jsxs(n.Fragment,{children:[n.jsx("span",{className:"flex h-8 w-8 shrink-0 items-center justify-center rounded border border-[#2a3440] bg-muted font-mono text-xs font-semibold text-primary",children:t.charAt(0).toUpperCase()}),n.jsxs("span",{className:"min-w-0 flex-1",children:[n.jsx("span",{className:"block truncate text-sm font-medium text-foreground",children:t}),n.jsxs("span",{className:"mt-0.5 flex items-center gap-1.5 font-mono text-[10px] text-dim",children:[n.jsx("span",{className:q("h-1.5 w-1.5 rounded-full",r?"bg-success":"bg-danger")}),e.status]})]}),s&&r?n.jsx(ys,{"aria-hidden":"true",className:"h-3.5 w-3.5 shrink-0 text-dim"}):null]}),i="flex min-h-14 min-w-0 items-center gap-3 rounded-md border border-border bg-card px-3 py-2 transition-colors hover:border-[#303b48] hover:bg-muted/40 focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring";return s&&r?n.jsx("a",{className:i,href:s,rel:"noopener noreferrer",target:"_blank",children:a}):n.jsx(Ee,{className:i,to:"/containers",children:a})}function Nk(){const[e,t]=d.useState(null),[r,s]=d.useState(null),[a,i]=d.useState(null),[l,o]=d.useState(null),[c,u]=d.useState(!1),[h,m]=d.useState(null),[f,w]=d.useState(!1),j=d.useCallback(async(C,k)=>{C!=="poll"&&u(!0);try{const O=await mk(k);if(k?.aborted)return;t(O),o(null);const S=new Date(O.collected_at);m(Number.isNaN(S.getTime())?new Date:S)}catch(O){k?.aborted||o(yp(O))}finally{!k?.aborted&&C!=="poll"&&u(!1)}},[]),y=d.useCallback(async C=>{try{const k=await dk(C);if(C?.aborted)return;s(k),i(null)}catch(k){C?.aborted||i(yp(k))}},[]),b=d.useCallback((C,k)=>Promise.all([j(C,k),y(k)]),[y,j]);d.useEffect(()=>{const C=new AbortController;b("initial",C.signal);const k=window.setInterval(()=>{b("poll",C.signal)},fk);return()=>{C.abort(),window.clearInterval(k)}},[b]);const v=d.useMemo(()=>f?e?.applications??[]:(e?.applications??[]).slice(0,Io),[f,e?.applications]),p=e?.metrics,x=p?.temperature_celsius??null,g=yk(p??null),N=e?.health.state??"unknown",E=e?n.jsx(fe,{label:N,tone:N==="healthy"?"success":N==="critical"?"danger":N==="attention"?"warning":"neutral"}):n.jsx(fe,{label:"syncing",tone:"info"});return n.jsxs("section",{className:"space-y-5 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsx(bg,{isRefreshing:c,onRefresh:()=>void b("manual")}),description:h?`last updated: ${Bt(h)}`:"collecting current status",status:E,title:"overview"}),l?n.jsxs("div",{"aria-live":"polite",className:"flex items-start gap-3 border-l-2 border-danger bg-danger/[0.06] p-4 text-sm text-danger",role:"status",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),n.jsxs("div",{children:[n.jsx("p",{className:"font-medium",children:"Overview refresh failed"}),n.jsx("p",{className:"mt-0.5 text-muted-foreground",children:l})]})]}):null,e?n.jsx(jk,{issues:e.health.issues,state:e.health.state}):null,n.jsxs("div",{className:"grid gap-3 sm:grid-cols-2 lg:grid-cols-3 xl:grid-cols-5",children:[n.jsx(Bs,{label:"cpu",percent:p?.cpu_percent??null,tone:Qs(p?.cpu_percent??null,60,85),value:_t(p?.cpu_percent)}),n.jsx(Bs,{detail:p?`${Pe(p.memory_used)} / ${Pe(p.memory_total)}`:void 0,label:"memory",percent:p?.memory_percent??null,tone:Qs(p?.memory_percent??null,70,90),value:_t(p?.memory_percent)}),n.jsx(Bs,{detail:g.detail,label:"swap",percent:g.percent,tone:g.tone,value:g.value}),n.jsx(Bs,{label:"temperature",percent:x===null?null:x/90*100,tone:Qs(x,65,80),value:x===null?"—":`${x.toFixed(1)} °C`}),n.jsx(Bs,{detail:p?`${Pe(p.disk_used)} / ${Pe(p.disk_total)}`:void 0,label:"storage",percent:p?.disk_percent??null,tone:Qs(p?.disk_percent??null,75,90),value:_t(p?.disk_percent)})]}),n.jsxs("div",{className:"grid gap-3 xl:grid-cols-2",children:[e?n.jsx(tk,{pressure:e.pressure}):null,n.jsx(J1,{error:a,snapshot:r})]}),n.jsxs("div",{className:"grid gap-3 xl:grid-cols-2",children:[n.jsx(Q,{children:n.jsxs(K,{className:"p-4 sm:p-5",children:[n.jsxs("div",{className:"flex items-center justify-between gap-3",children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4 text-primary"}),n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"workloads"})]}),n.jsx(ee,{tone:"neutral",children:"current"})]}),n.jsxs("div",{className:"mt-4 grid divide-y divide-divider sm:grid-cols-2 sm:divide-x sm:divide-y-0",children:[n.jsxs(Ee,{className:"pb-4 focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring sm:pb-0 sm:pr-5",to:"/containers",children:[n.jsxs("div",{className:"flex items-center justify-between",children:[n.jsxs("span",{className:"flex items-center gap-2 text-sm text-muted-foreground",children:[n.jsx(Ul,{"aria-hidden":"true",className:"h-4 w-4"})," containers"]}),n.jsx("span",{className:"font-mono text-2xl text-foreground",children:e?.workloads.containers.total??"—"})]}),n.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[n.jsxs(ee,{tone:"success",children:[e?.workloads.containers.running??0," running"]}),n.jsxs(ee,{tone:(e?.workloads.containers.unhealthy??0)>0?"danger":"neutral",children:[e?.workloads.containers.unhealthy??0," unhealthy"]}),n.jsxs(ee,{tone:(e?.workloads.containers.stopped??0)>0?"warning":"neutral",children:[e?.workloads.containers.stopped??0," stopped"]})]})]}),n.jsxs(Ee,{className:"pt-4 focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring sm:pl-5 sm:pt-0",to:"/stacks",children:[n.jsxs("div",{className:"flex items-center justify-between",children:[n.jsxs("span",{className:"flex items-center gap-2 text-sm text-muted-foreground",children:[n.jsx(rN,{"aria-hidden":"true",className:"h-4 w-4"})," stacks"]}),n.jsx("span",{className:"font-mono text-2xl text-foreground",children:e?.workloads.stacks.total??"—"})]}),n.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[n.jsxs(ee,{tone:"success",children:[e?.workloads.stacks.healthy??0," healthy"]}),n.jsxs(ee,{tone:(e?.workloads.stacks.partial??0)>0?"warning":"neutral",children:[e?.workloads.stacks.partial??0," partial"]}),n.jsxs(ee,{tone:(e?.workloads.stacks.down??0)>0?"danger":"neutral",children:[e?.workloads.stacks.down??0," down"]})]})]})]})]})}),n.jsx(Q,{children:n.jsxs(K,{className:"p-4 sm:p-5",children:[n.jsxs("div",{className:"flex items-center justify-between gap-3",children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4 text-primary"}),n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"alerts"})]}),n.jsx(Ee,{className:"font-mono text-[11px] text-muted-foreground hover:text-primary",to:"/integrations",children:"view policy"})]}),n.jsxs("div",{className:"mt-4",children:[e?.alerts.active.length?e.alerts.active.slice(0,3).map(C=>n.jsx(bp,{record:C},C.key)):n.jsxs("div",{className:"flex items-center gap-3 py-1 text-sm text-muted-foreground",children:[n.jsx(lt,{"aria-hidden":"true",className:"h-4 w-4 text-success"}),"No active alerts."]}),e?.alerts.recent_recoveries.length?n.jsxs("div",{className:"mt-4 border-t border-divider pt-3",children:[n.jsx("p",{className:"mb-3 font-mono text-[10px] uppercase text-dim",children:"recently resolved"}),e.alerts.recent_recoveries.map(C=>n.jsx(bp,{record:C,recovered:!0},`${C.key}:${C.at}`))]}):null]})]})})]}),e?.warnings.length?n.jsxs("div",{className:"flex items-start gap-3 border-l-2 border-warning/60 bg-warning/[0.04] px-4 py-3 text-sm",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-warning"}),n.jsxs("p",{className:"text-muted-foreground",children:[n.jsx("span",{className:"font-medium text-warning",children:"Data gaps:"})," ",e.warnings.slice(0,3).map(C=>C.message).join(" · ")]})]}):null,n.jsxs("section",{"aria-labelledby":"applications-title",children:[n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-3 border-b border-divider pb-3",children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(MN,{"aria-hidden":"true",className:"h-4 w-4 text-primary"}),n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"applications-title",children:"applications"})]}),n.jsxs(ee,{tone:"neutral",children:[e?.applications.length??0," detected"]})]}),v.length?n.jsx("div",{className:"mt-3 grid gap-2 sm:grid-cols-2 xl:grid-cols-3 2xl:grid-cols-4",children:v.map(C=>n.jsx(wk,{application:C},C.id))}):n.jsx("div",{className:"mt-3 flex min-h-24 items-center justify-center rounded-md border border-border bg-card p-5 text-sm text-muted-foreground",children:e?"No web applications detected.":"Loading applications..."}),(e?.applications.length??0)>Io?n.jsx("div",{className:"mt-3 flex justify-center",children:n.jsxs(_,{className:"gap-2",onClick:()=>w(C=>!C),size:"sm",variant:"ghost",children:[f?n.jsx(jw,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(vw,{"aria-hidden":"true",className:"h-4 w-4"}),f?"show less":`show ${(e?.applications.length??0)-Io} more`]})}):null]})]})}function Un(e){return e&&typeof e=="object"&&!Array.isArray(e)?e:{}}function Tt(e){return typeof e=="string"?e:""}function $t(e){return typeof e=="number"&&Number.isFinite(e)&&e>=0?e:0}function Fr(e){return typeof e=="number"&&Number.isFinite(e)&&e>=0?e:null}function Lo(e){return e==="available"||e==="degraded"||e==="not_checked"?e:"unavailable"}function kk(e){const t=Un(e),r=Un(t.counts),s=Un(t.capacity),a=Un(t.sources),i=t.state==="healthy"||t.state==="attention"?t.state:"unavailable",l=Array.isArray(t.devices)?t.devices.slice(0,128):[],o=Array.isArray(t.warnings)?t.warnings.slice(0,20):[];return{state:i,counts:{total:$t(r.total),healthy:$t(r.healthy),warning:$t(r.warning),failing:$t(r.failing),unknown:$t(r.unknown),mounted:$t(r.mounted),unmounted:$t(r.unmounted),assigned:Fr(r.assigned),unassigned:Fr(r.unassigned),unused:Fr(r.unused)},capacity:{mounted_total_bytes:$t(s.mounted_total_bytes),mounted_used_bytes:$t(s.mounted_used_bytes),mounted_available_bytes:$t(s.mounted_available_bytes),mounted_percent:Fr(s.mounted_percent)},sources:{inventory:Lo(a.inventory),smart:Lo(a.smart),assignments:Lo(a.assignments)},devices:l.map(c=>{const u=Un(c),h=Un(u.mounted_capacity),m=u.health==="healthy"||u.health==="warning"||u.health==="failing"?u.health:"unknown",f=Array.isArray(u.assignments)?u.assignments.slice(0,256):[];return{name:Tt(u.name),path:Tt(u.path),health:m,temperature_c:Fr(u.temperature_c),mounted:u.mounted===!0,mounted_capacity:{mounted_total_bytes:$t(h.mounted_total_bytes),mounted_used_bytes:$t(h.mounted_used_bytes),mounted_available_bytes:$t(h.mounted_available_bytes)},assignments:f.map(w=>{const j=Un(w);return{provider_id:Tt(j.provider_id),capability_id:Tt(j.capability_id),role:Tt(j.role),resource_id:Tt(j.resource_id),resource_name:Tt(j.resource_name),href:Tt(j.href),device_path:Tt(j.device_path)}})}}),warnings:o.map(c=>{const u=Un(c);return{code:Tt(u.code),source:Tt(u.source),message:Tt(u.message)}}),collected_at:Tt(t.collected_at)}}function Sk(e,t){if(!Object.keys(t).length)return e;const r=e.devices.map(i=>{const l=t[i.path];if(!l)return i;const o=l.health_status==="healthy"||l.health_status==="warning"||l.health_status==="failing"?l.health_status:"unknown";return{...i,health:o,temperature_c:Fr(l.temperature_c)}}),s={healthy:0,warning:0,failing:0,unknown:0};r.forEach(i=>{s[i.health]+=1});const a=e.warnings.length>0||s.warning>0||s.failing>0||s.unknown>0;return{...e,state:r.length>0&&!a?"healthy":"attention",counts:{...e.counts,...s},sources:{...e.sources,smart:"available"},devices:r}}function wg(e){if(!e||typeof e!="object"||Array.isArray(e))return null;const t=e;return{total:ne(t.total),used:ne(t.used),available:ne(t.available),percent:ne(t.percent)}}function _k(e){return{name:String(e?.name??""),path:String(e?.path??""),size:ce(e?.size),fstype:ce(e?.fstype),mountpoint:ce(e?.mountpoint),configured_mountpoint:ce(e?.configured_mountpoint),uuid:ce(e?.uuid),label:ce(e?.label),usage:wg(e?.usage)}}function Ck(e){const t=Array.isArray(e?.partitions)?e?.partitions:[];return{name:String(e?.name??""),path:String(e?.path??""),type:String(e?.type??""),size:ce(e?.size),model:ce(e?.model),serial:ce(e?.serial),transport:ce(e?.transport),mountpoint:ce(e?.mountpoint),configured_mountpoint:ce(e?.configured_mountpoint),fstype:ce(e?.fstype),uuid:ce(e?.uuid),label:ce(e?.label),usage:wg(e?.usage),partitions:t.map(r=>_k(r))}}function Ng(e,t=""){return{device:String(e?.device??t),model:ce(e?.model),serial:ce(e?.serial),drive_type:ce(e?.drive_type),smart_available:!!e?.smart_available,smart_enabled:!!e?.smart_enabled,health_status:String(e?.health_status??"unknown"),temperature_c:ne(e?.temperature_c),power_on_hours:ne(e?.power_on_hours),reallocated_sectors:ne(e?.reallocated_sectors),pending_sectors:ne(e?.pending_sectors),uncorrectable_errors:ne(e?.uncorrectable_errors),percentage_used:ne(e?.percentage_used),available_spare:ne(e?.available_spare),media_errors:ne(e?.media_errors),error_message:ce(e?.error_message)}}async function pu(e){const t=await W("/api/disks",{method:"GET",signal:e});if(t.error)throw new Error(t.error);return{disks:Array.isArray(t.disks)?t.disks.map(r=>Ck(r)):[],helper_available:!!t.helper_available,summary:t.summary?kk(t.summary):null}}async function Ek(e){const t=await W("/api/disks/helper-status",{method:"GET",signal:e});return{available:!!t.available,socket_path:ce(t.socket_path)}}async function Ak(e){const t=await W("/api/disks/smart",{method:"GET",signal:e});return t.error||!Array.isArray(t.disks)?{}:t.disks.reduce((r,s)=>{const a=String(s.device??"");return a&&(r[a]=Ng(s.data,a)),r},{})}async function Pk(e,t){const r=await W(`/api/disks/${encodeURIComponent(e)}/smart`,{method:"GET",signal:t});if(r.error)throw new Error(String(r.error));return Ng(r,e)}async function Rk(e){const t=await W("/api/disks/suggested-mounts",{method:"GET",signal:e});return t.error||!Array.isArray(t.suggestions)?[]:t.suggestions.map(r=>({device:String(r.device??""),uuid:String(r.uuid??""),size:ce(r.size),fstype:String(r.fstype??""),label:ce(r.label),suggested_mount:String(r.suggested_mount??""),reason:String(r.reason??"")})).filter(r=>r.uuid&&r.fstype&&r.suggested_mount)}async function Mk(e,t){const r=await W("/api/disks/mount",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({uuid:e.uuid,mountpoint:e.mountpoint,fstype:e.fstype,add_to_fstab:e.add_to_fstab??!0}),signal:t});if(r.error)throw new Error(r.error)}async function Tk(e,t=!1,r){const s=await W("/api/disks/unmount",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({mountpoint:e,remove_from_fstab:t}),signal:r});if(s.error)throw new Error(s.error);return{warning:ce(s.warning)}}async function $k(e,t,r){const s=await W(`/api/disks/${encodeURIComponent(e)}/smart-test`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({test_type:t}),signal:r});if(s.error)throw new Error(s.error);return s.message||`${t} self-test started`}function Ik(e){return e==="success"?"border-success/30 text-success":e==="error"?"border-danger/30 text-danger":"border-info/30 text-info"}function kg(e){switch(e){case"healthy":return"success";case"warning":return"warning";case"failing":return"danger";default:return"neutral"}}function hi(e){return e instanceof Error&&e.message?e.message:"Unable to load disks"}function Xc(e){return e>=90?"danger":e>=75?"warning":"success"}function Lk(e){if(e.usage?.total!==null&&e.usage?.total!==void 0)return e.usage;const t=e.partitions.map(i=>i.usage).filter(i=>i?.total!==null&&i?.total!==void 0);if(!t.length)return null;const r=t.reduce((i,l)=>i+(l.total??0),0),s=t.reduce((i,l)=>i+(l.used??0),0),a=t.reduce((i,l)=>i+(l.available??0),0);return{total:r,used:s,available:a,percent:r>0?s/r*100:0}}function zk(e){return e.startsWith("/pools/")?"/pools":e.startsWith("/protection/")?"/protection":e.startsWith("/")?e:"/pools"}function Ok({summary:e}){const{counts:t,capacity:r}=e,s=[t.warning?`${t.warning} warning`:"",t.failing?`${t.failing} failing`:"",t.unknown?`${t.unknown} unknown`:""].filter(Boolean).join(" · "),a=t.assigned===null?"Provider assignments unavailable":`${t.assigned} assigned · ${t.unassigned??0} unassigned`;return n.jsxs("section",{"aria-label":"Disk summary",className:"grid overflow-hidden rounded-md border border-border bg-card sm:grid-cols-2 xl:grid-cols-4","data-disk-summary":!0,children:[n.jsxs("div",{className:"border-b border-border p-3 sm:border-r xl:border-b-0",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Health"}),n.jsxs("p",{className:"mt-1 text-sm font-medium",children:[t.healthy," healthy"]}),n.jsx("p",{className:q("mt-0.5 text-xs",s?"text-warning":"text-muted-foreground"),children:s||`${t.total} devices reporting`})]}),n.jsxs("div",{className:"border-b border-border p-3 xl:border-b-0 xl:border-r",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Mount state"}),n.jsxs("p",{className:"mt-1 text-sm font-medium",children:[t.mounted," mounted"]}),n.jsxs("p",{className:"mt-0.5 text-xs text-muted-foreground",children:[t.unmounted," unmounted"]})]}),n.jsxs("div",{className:"border-b border-border p-3 sm:border-b-0 sm:border-r",children:[n.jsxs("div",{className:"flex items-baseline justify-between gap-2",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Mounted capacity"}),n.jsx("span",{className:"font-mono text-[11px] text-muted-foreground",children:r.mounted_percent===null?"—":`${Math.round(r.mounted_percent)}%`})]}),n.jsxs("p",{className:"mt-1 text-sm font-medium",children:[Pe(r.mounted_used_bytes)," used"]}),n.jsxs("p",{className:"mt-0.5 text-xs text-muted-foreground",children:[Pe(r.mounted_available_bytes)," free"]}),r.mounted_percent!==null?n.jsx(Yt,{className:"mt-2",label:"Mounted disk capacity",tone:Xc(r.mounted_percent),value:r.mounted_percent}):null]}),n.jsxs("div",{className:"p-3",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Providers"}),n.jsx("p",{className:"mt-1 text-sm font-medium",children:t.assigned===null?"Not checked":`${t.assigned} assigned`}),n.jsx("p",{className:"mt-0.5 text-xs text-muted-foreground",children:t.unused===null?a:`${t.unused} unused · ${a}`})]})]})}function mn({label:e,value:t}){return n.jsxs("div",{className:"flex items-center justify-between gap-3 border-b border-border/50 py-1.5 last:border-0",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:e}),n.jsx("span",{className:"font-mono text-xs sm:text-sm",children:t===null||t===""?"—":t})]})}function Zc({actionKey:e,label:t,confirmLabel:r="Confirm",pendingLabel:s="Working...",className:a,confirmKey:i,setConfirmKey:l,pendingKey:o,disabled:c,onConfirm:u,requestData:h,confirmData:m}){return o===e?n.jsxs(_,{className:q("gap-1.5 text-xs sm:text-sm",a),disabled:!0,size:"sm",variant:"outline",children:[n.jsx(me,{"aria-hidden":"true",className:"h-3.5 w-3.5 animate-spin"}),s]}):i===e?n.jsxs("span",{className:"flex items-center gap-1.5",children:[n.jsx(_,{autoFocus:!0,className:q("text-xs sm:text-sm",a),onClick:u,size:"sm",variant:"outline",...m,children:r}),n.jsx(_,{onClick:()=>l(null),size:"sm",variant:"outline",children:"Cancel"})]}):n.jsx(_,{className:q("text-xs sm:text-sm",a),disabled:c||!!o,onClick:()=>l(e),size:"sm",variant:"outline",...h,children:t})}function Dk({disk:e,summary:t,smart:r,helperAvailable:s,pendingKey:a,confirmKey:i,setConfirmKey:l,onSmart:o,onUnmount:c}){const u=Lk(e),h=u?.percent??null,m=r?.health_status??t?.health??"unknown",f=r?.temperature_c??t?.temperature_c??null,w=[...e.mountpoint?[e.mountpoint]:[],...e.partitions.flatMap(y=>y.mountpoint?[y.mountpoint]:[])],j=w.find(y=>i===`unmount:${y}`);return n.jsx(Q,{className:"transition-colors duration-200 hover:border-primary/25",children:n.jsxs(K,{className:"space-y-4 p-4",children:[n.jsxs("div",{className:"flex items-start justify-between gap-3",children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-2.5",children:[n.jsx(Vl,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-primary"}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"truncate font-mono text-sm font-semibold",children:e.path}),n.jsx("p",{className:"truncate text-xs text-muted-foreground",children:e.model||"Unknown model"})]})]}),n.jsxs("div",{className:"flex shrink-0 items-center gap-1.5",children:[n.jsx(fe,{label:m,tone:kg(m)}),n.jsx(_,{"aria-label":`SMART details for ${e.path}`,className:"h-9 min-h-9 w-9 px-0","data-disk":e.name,"data-disk-action":"smart",disabled:s===!1,onClick:()=>o(e),size:"sm",title:s===!1?"SMART helper unavailable":`SMART details for ${e.path}`,variant:"outline",children:n.jsx(jt,{"aria-hidden":"true",className:"h-4 w-4"})}),w.length&&s!==!1?n.jsx(Ba,{disabled:!!a,items:w.map(y=>({id:`unmount:${y}`,label:`Unmount ${y}`,Icon:ZN,onSelect:()=>l(`unmount:${y}`),tone:"danger",data:{"data-unmount":y}})),label:`More actions for ${e.path}`,pending:!!a?.startsWith("unmount:"),triggerData:{"data-disk-menu":e.name}}):null]})]}),n.jsxs("div",{className:"flex flex-wrap items-center gap-x-4 gap-y-1 border-y border-border/70 py-2 font-mono text-xs text-muted-foreground",children:[n.jsxs("span",{children:[n.jsx("span",{className:"text-dim",children:"Size "}),e.size||"—"]}),n.jsxs("span",{children:[n.jsx("span",{className:"text-dim",children:"Bus "}),[e.transport,e.type].filter(Boolean).join(" · ")||"—"]}),f!==null?n.jsxs("span",{className:"inline-flex items-center gap-1",children:[n.jsx(GN,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-dim"}),f," °C"]}):null]}),u&&h!==null?n.jsxs("div",{"data-disk-usage":e.name,children:[n.jsxs("div",{className:"flex items-baseline justify-between gap-3",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Mounted usage"}),n.jsxs("p",{className:"font-mono text-xs text-muted-foreground",children:[Math.round(h),"% used"]})]}),n.jsx(Yt,{className:"mt-2",label:`${e.path} mounted usage`,tone:Xc(h),value:h}),n.jsxs("div",{className:"mt-2 flex flex-wrap items-center justify-between gap-x-4 gap-y-1 font-mono text-[11px]",children:[n.jsxs("span",{children:[n.jsx("span",{className:"text-dim",children:"Used "}),Pe(u.used)]}),n.jsxs("span",{children:[n.jsx("span",{className:"text-dim",children:"Free "}),Pe(u.available)]})]})]}):null,e.partitions.length?n.jsxs("div",{children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Partitions"}),n.jsx("div",{className:"mt-1 divide-y divide-border/70 border-y border-border/70",children:e.partitions.map(y=>{const b=y.usage?.percent??null;return n.jsxs("div",{className:"space-y-1.5 py-2.5 text-xs",children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-x-2 gap-y-1",children:[n.jsx("span",{className:"break-all font-mono font-medium",children:y.path}),y.fstype?n.jsx("span",{className:"rounded bg-info/10 px-1.5 py-0.5 font-mono text-info",children:y.fstype}):null,n.jsx("span",{className:"ml-auto font-mono text-muted-foreground",children:y.size||"—"})]}),n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-x-3 gap-y-1",children:[y.mountpoint?n.jsx("span",{className:"break-all font-mono text-success",children:y.mountpoint}):n.jsx("span",{className:"text-muted-foreground",children:"Unmounted"}),y.usage&&b!==null?n.jsxs("span",{className:"font-mono text-[11px] text-muted-foreground",children:[Math.round(b),"% · ",Pe(y.usage.used)," used · ",Pe(y.usage.available)," free"]}):null]}),b!==null?n.jsx(Yt,{label:`${y.path} usage`,tone:Xc(b),value:b}):null]},y.path)})})]}):null,t?.assignments.length?n.jsxs("div",{className:"flex flex-wrap items-center gap-2 border-t border-border/70 pt-3",children:[n.jsx("span",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Providers"}),t.assignments.map(y=>n.jsxs(Ee,{className:"inline-flex min-h-8 items-center gap-1 rounded border border-border bg-muted/20 px-2 text-xs text-primary hover:border-primary/40 hover:bg-muted/40",to:zk(y.href),children:[n.jsx("span",{children:y.resource_name||y.provider_id}),n.jsxs("span",{className:"text-muted-foreground",children:["· ",y.role]}),n.jsx(ys,{"aria-hidden":"true",className:"h-3 w-3"})]},`${y.provider_id}:${y.resource_id}:${y.device_path}`))]}):null,j?n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2 border-t border-danger/20 pt-3 text-xs text-danger",children:[n.jsxs("span",{children:["Unmount ",j,"?"]}),n.jsx(Zc,{actionKey:`unmount:${j}`,className:"border-danger/30 bg-danger/10 text-danger hover:bg-danger/15",confirmData:{"data-confirm-unmount":j},confirmKey:i,confirmLabel:"Confirm unmount",label:"Unmount",onConfirm:()=>c(j),pendingKey:a,pendingLabel:"Unmounting...",setConfirmKey:l})]}):null]})})}function Uk(){const[e,t]=d.useState([]),[r,s]=d.useState(null),[a,i]=d.useState({}),[l,o]=d.useState(null),[c,u]=d.useState(!0),[h,m]=d.useState(!1),[f,w]=d.useState(null),[j,y]=d.useState("Never"),[b,v]=d.useState({open:!1,status:"idle",device:"",result:null,error:null}),[p,x]=d.useState([]),[g,N]=d.useState(null),[E,C]=d.useState(null),[k,O]=d.useState(null),[S,$]=d.useState(null),R=d.useRef(!0),H=d.useCallback(async F=>{F==="initial"?u(!0):m(!0);try{const D=await pu();if(!R.current)return;t(D.disks),o(D.summary),s(D.helper_available),w(null),y(Bt(new Date))}catch(D){if(!R.current)return;w(hi(D))}finally{R.current&&(F==="initial"?u(!1):m(!1))}Ek().then(D=>{R.current&&s(D.available)}).catch(()=>{}),Ak().then(D=>{R.current&&i(D)}).catch(()=>{}),Rk().then(D=>{R.current&&x(D)}).catch(()=>{})},[]),I=d.useMemo(()=>l?Sk(l,a):null,[l,a]),U=d.useCallback(async(F,D)=>{if(!k){O(F),$(null);try{const G=await D();if(!R.current)return;N({tone:"success",message:G}),await H("manual")}catch(G){R.current&&N({tone:"error",message:hi(G)})}finally{R.current&&O(null)}}},[H,k]),L=d.useCallback(F=>U(`mount:${F.uuid}`,async()=>(await Mk({uuid:F.uuid,mountpoint:F.suggested_mount,fstype:F.fstype}),`Mounted ${F.device} at ${F.suggested_mount}`)),[U]),B=d.useCallback(F=>U(`unmount:${F}`,async()=>{const{warning:D}=await Tk(F);return D||`Unmounted ${F}`}),[U]),P=d.useCallback(async(F,D)=>{if(k)return;const G=`test:${F}:${D}`;O(G),$(null),C(null);try{const se=await $k(F,D);R.current&&C({tone:"success",message:se})}catch(se){R.current&&C({tone:"error",message:hi(se)})}finally{R.current&&O(null)}},[k]),M=d.useCallback(async F=>{C(null),v({open:!0,status:"loading",device:F.path,result:null,error:null});try{const D=await Pk(F.name);if(!R.current)return;i(G=>({...G,[F.path]:D})),v({open:!0,status:"ready",device:F.path,result:D,error:null})}catch(D){if(!R.current)return;v({open:!0,status:"error",device:F.path,result:null,error:hi(D)})}},[]),A=d.useCallback(()=>{C(null),$(null),v(F=>({...F,open:!1}))},[]);return d.useEffect(()=>{if(!g||g.tone==="error")return;const F=window.setTimeout(()=>N(null),4500);return()=>window.clearTimeout(F)},[g]),d.useEffect(()=>(R.current=!0,H("initial"),()=>{R.current=!1}),[H]),n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",disabled:h,onClick:()=>void H("manual"),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",h?"animate-spin":"")}),h?"refreshing":"refresh"]}),description:`${e.length} devices · synced ${j}`,status:n.jsx(fe,{label:r===!1?"limited":"helper ready",tone:r===!1?"warning":"success"}),title:"disk_management"}),r===!1?n.jsx(Q,{"aria-live":"polite",className:"border-warning/30",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Privileged helper unavailable — disk and SMART operations are limited."]})}):null,g?n.jsx(Q,{"aria-live":g.tone==="error"?"assertive":"polite",className:Ik(g.tone),role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm",children:[g.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),n.jsx("span",{children:g.message}),n.jsx(_,{"aria-label":"Dismiss disk notification",className:"ml-auto h-8 min-h-8 w-8 px-0",onClick:()=>N(null),size:"sm",title:"Dismiss",variant:"ghost",children:n.jsx(We,{"aria-hidden":"true",className:"h-4 w-4"})})]})}):null,f&&e.length?n.jsxs("div",{"aria-live":"polite",className:"flex flex-wrap items-center gap-2 border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm text-warning",role:"status",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4 shrink-0"}),n.jsxs("span",{children:["Refresh failed. Showing data synced ",j,"."]}),n.jsx("span",{className:"text-muted-foreground",children:f}),n.jsxs(_,{className:"ml-auto gap-1.5",disabled:h,onClick:()=>void H("manual"),size:"sm",variant:"outline",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-3.5 w-3.5",h?"animate-spin":"")}),"Retry"]})]}):null,I&&e.length?n.jsx(Ok,{summary:I}):null,p.length&&r!==!1?n.jsxs("section",{"aria-label":"Suggested mounts",className:"border-y border-border bg-card/45 px-3 py-2.5 sm:px-4",id:"v2-disk-suggestions",children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(Jw,{"aria-hidden":"true",className:"h-4 w-4 shrink-0 text-primary"}),n.jsxs("p",{className:"text-sm font-medium",children:[p.length," suggested ",p.length===1?"mount":"mounts"]}),n.jsx("span",{className:"text-xs text-muted-foreground",children:"Unmounted filesystems detected"})]}),n.jsx("div",{className:"mt-2 divide-y divide-border/70 border-t border-border/70",children:p.map(F=>n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2 py-2.5 text-xs",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"break-all font-mono text-sm",children:F.device}),n.jsxs("p",{className:"text-muted-foreground",children:[F.reason," → ",n.jsx("span",{className:"font-mono text-success",children:F.suggested_mount})]})]}),n.jsx(Zc,{actionKey:`mount:${F.uuid}`,className:"border-success/30 bg-success/10 text-success hover:bg-success/15",confirmData:{"data-confirm-mount":F.uuid},confirmKey:S,confirmLabel:`Mount at ${F.suggested_mount}`,label:"Mount",onConfirm:()=>L(F),pendingKey:k,pendingLabel:"Mounting...",requestData:{"data-mount":F.uuid},setConfirmKey:$})]},F.uuid))})]}):null,f&&!e.length?n.jsx(Q,{className:"border-danger/30",children:n.jsxs(K,{className:"flex flex-col items-start gap-3 p-4 sm:p-6",children:[n.jsxs("div",{className:"flex items-center gap-2 text-danger",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),n.jsx("p",{className:"text-sm font-medium",children:"Unable to load disks"})]}),n.jsx("p",{className:"text-sm text-muted-foreground",children:f}),n.jsx(_,{onClick:()=>void H("manual"),variant:"outline",children:"Retry"})]})}):null,c?n.jsx(Q,{"aria-live":"polite",role:"status",children:n.jsxs(K,{className:"flex min-h-[14rem] items-center justify-center gap-2 p-6 text-sm text-muted-foreground",children:[n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4 animate-pulse text-primary"}),"Loading disks..."]})}):null,!c&&!f&&!e.length&&r!==!1?n.jsx(Q,{children:n.jsx(K,{className:"flex min-h-[10rem] items-center justify-center p-6 text-sm text-muted-foreground",children:"No disks found."})}):null,!c&&e.length?n.jsx("div",{className:"grid gap-3 sm:grid-cols-2 2xl:grid-cols-3",children:e.map(F=>n.jsx(Dk,{confirmKey:S,disk:F,helperAvailable:r,onSmart:M,onUnmount:B,pendingKey:k,setConfirmKey:$,smart:a[F.path],summary:I?.devices.find(D=>D.path===F.path)},F.path))}):null,b.open?n.jsx(ze,{onClose:A,children:n.jsxs(Q,{"aria-labelledby":"v2-disk-smart-title","aria-modal":"true",className:"flex max-h-[90vh] w-full max-w-2xl flex-col overflow-hidden",id:"v2-disk-smart-modal",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsx("div",{children:n.jsxs(ge,{className:"text-base sm:text-lg",id:"v2-disk-smart-title",children:["SMART: ",b.device]})}),n.jsx(_,{"aria-label":"Close SMART details",className:"h-9 min-h-9 w-9 px-0",id:"v2-disk-smart-close",onClick:A,size:"sm",title:"Close",variant:"outline",children:n.jsx(We,{"aria-hidden":"true",className:"h-4 w-4"})})]}),n.jsx(K,{className:"space-y-3 overflow-auto p-4",id:"v2-disk-smart-content",children:b.status==="loading"?n.jsx("p",{className:"text-sm text-muted-foreground",children:"Loading SMART data..."}):b.status==="error"?n.jsxs("div",{className:"flex flex-wrap items-center gap-3 text-sm text-danger",role:"alert",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),n.jsx("span",{children:b.error||"Failed to load SMART data"}),n.jsxs(_,{"aria-label":"Retry SMART details",className:"ml-auto gap-1.5",onClick:()=>{const F=e.find(D=>D.path===b.device);F&&M(F)},size:"sm",variant:"outline",children:[n.jsx(je,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Retry"]})]}):b.result?n.jsxs(n.Fragment,{children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(fe,{label:b.result.health_status,tone:kg(b.result.health_status)}),b.result.drive_type?n.jsx("span",{className:"rounded bg-muted/50 px-2 py-1 text-xs uppercase",children:b.result.drive_type}):null]}),b.result.error_message?n.jsx("p",{className:"text-sm text-warning",children:b.result.error_message}):null,n.jsxs("div",{className:"rounded-lg border border-border/70 bg-muted/25 p-3",children:[n.jsx(mn,{label:"Model",value:b.result.model}),n.jsx(mn,{label:"Serial",value:b.result.serial}),n.jsx(mn,{label:"Temperature",value:b.result.temperature_c===null?null:`${b.result.temperature_c} °C`}),n.jsx(mn,{label:"Power-on hours",value:b.result.power_on_hours}),n.jsx(mn,{label:"Reallocated sectors",value:b.result.reallocated_sectors}),n.jsx(mn,{label:"Pending sectors",value:b.result.pending_sectors}),n.jsx(mn,{label:"Uncorrectable errors",value:b.result.uncorrectable_errors}),n.jsx(mn,{label:"Wear (used)",value:b.result.percentage_used===null?null:`${b.result.percentage_used}%`}),n.jsx(mn,{label:"Available spare",value:b.result.available_spare===null?null:`${b.result.available_spare}%`}),n.jsx(mn,{label:"Media errors",value:b.result.media_errors})]}),E?n.jsxs("div",{"aria-live":E.tone==="error"?"assertive":"polite",className:q("flex items-center gap-2 border-l-2 px-3 py-2 text-sm",E.tone==="error"?"border-danger bg-danger/5 text-danger":"border-success bg-success/5 text-success"),role:"status",children:[E.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),E.message]}):null,r!==!1&&b.result.smart_available&&b.result.smart_enabled?n.jsxs("div",{className:"flex flex-wrap items-center gap-2",id:"v2-disk-smart-test",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Self-test"}),["short","long"].map(F=>{const D=b.device.replace(/^\/dev\//,"");return n.jsx(Zc,{actionKey:`test:${D}:${F}`,confirmData:{"data-confirm-smarttest":F},confirmKey:S,confirmLabel:`Run ${F} test`,label:F==="short"?"Short":"Long",onConfirm:()=>P(D,F),pendingKey:k,pendingLabel:"Starting...",requestData:{"data-smarttest":F},setConfirmKey:$},F)})]}):null]}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No SMART data available."})})]})}):null]})}const Bk={enable:{title:"Enable extension",message:"The provider becomes available after LimeOS restarts.",confirm:"Enable"},disable:{title:"Disable extension",message:"Provider configuration is preserved, but its capabilities stop loading after restart.",confirm:"Disable"},update:{title:"Update extension",message:"The managed GitHub checkout will move to the latest fetched revision. Configuration is preserved.",confirm:"Update"},repair:{title:"Repair extension",message:"The managed checkout will be restored from its configured source. Configuration is preserved.",confirm:"Repair"},remove:{title:"Remove extension",message:"The managed package files and installation record will be removed. Disable it first.",confirm:"Remove"}};function Sg({children:e,description:t,onClose:r,title:s}){const a=d.useId();return n.jsx(ze,{onClose:r,children:n.jsxs("div",{"aria-labelledby":a,"aria-modal":"true",className:"max-h-[92vh] w-full max-w-lg overflow-y-auto rounded-lg border border-border bg-card",role:"dialog",children:[n.jsxs("header",{className:"flex items-start justify-between gap-3 border-b border-border px-4 py-4 sm:px-5",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("h2",{className:"font-mono text-base font-semibold",id:a,children:s}),n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:t})]}),n.jsx(_,{"aria-label":"Close dialog",className:"h-11 w-11 shrink-0 px-0",onClick:r,variant:"ghost",children:n.jsx(We,{"aria-hidden":"true",className:"h-4 w-4"})})]}),e]})})}function Fk({action:e,extension:t,onClose:r,onConfirm:s,pending:a}){const i=Bk[e],[l,o]=d.useState(""),c=e==="remove",u=!a&&(!c||l===t.id);return n.jsx(Sg,{description:t.name,onClose:r,title:i.title,children:n.jsxs("div",{className:"space-y-4 px-4 py-5 sm:px-5",children:[n.jsxs("div",{className:q("flex items-start gap-2 border-l-2 px-3 py-2.5 text-sm",c?"border-danger bg-danger/5 text-danger":"border-warning bg-warning/5 text-warning"),children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),n.jsx("p",{children:i.message})]}),c?n.jsxs("label",{className:"block space-y-1.5",children:[n.jsxs("span",{className:"text-sm text-foreground",children:["Type ",n.jsx("code",{className:"text-danger",children:t.id})," to confirm"]}),n.jsx("input",{autoComplete:"off",className:"min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 font-mono text-sm focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring","data-extension-remove-confirmation":!0,onChange:h=>o(h.target.value),spellCheck:!1,value:l})]}):null,n.jsxs("div",{className:"flex flex-wrap justify-end gap-2 border-t border-border pt-4",children:[n.jsx(_,{disabled:a,onClick:r,variant:"outline",children:"Cancel"}),n.jsxs(_,{className:c?"border-danger/30 bg-danger/10 text-danger hover:bg-danger/15":void 0,"data-extension-confirm":e,disabled:!u,onClick:s,variant:"outline",children:[a?n.jsx(me,{"aria-hidden":"true",className:"mr-2 h-4 w-4 animate-spin"}):null,a?`${i.confirm}...`:i.confirm]})]})]})})}function Vk({onClose:e,onConfirm:t,pending:r}){const[s,a]=d.useState(""),[i,l]=d.useState(""),o=s.trim().length>0&&!r;return n.jsx(Sg,{description:"Install a reviewed capability provider from GitHub.",onClose:e,title:"Install extension",children:n.jsxs("div",{className:"space-y-4 px-4 py-5 sm:px-5",children:[n.jsxs("div",{className:"flex items-start gap-2 border-l-2 border-warning bg-warning/5 px-3 py-2.5 text-sm text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),n.jsx("p",{children:"Extensions run with LimeOS provider permissions. Install only a source you trust and have reviewed."})]}),n.jsxs("label",{className:"block space-y-1.5",children:[n.jsx("span",{className:"text-sm text-foreground",children:"GitHub repository"}),n.jsx("input",{autoComplete:"url",className:"min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 font-mono text-sm focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring","data-extension-install-source":!0,onChange:c=>a(c.target.value),placeholder:"owner/repository",spellCheck:!1,value:s})]}),n.jsxs("label",{className:"block space-y-1.5",children:[n.jsxs("span",{className:"text-sm text-foreground",children:["Extension ID ",n.jsx("span",{className:"text-dim",children:"optional"})]}),n.jsx("input",{autoComplete:"off",className:"min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 font-mono text-sm focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring","data-extension-install-id":!0,onChange:c=>l(c.target.value),placeholder:"derived from repository",spellCheck:!1,value:i})]}),n.jsxs("div",{className:"flex flex-wrap justify-end gap-2 border-t border-border pt-4",children:[n.jsx(_,{disabled:r,onClick:e,variant:"outline",children:"Cancel"}),n.jsxs(_,{"data-extension-install-confirm":!0,disabled:!o,onClick:()=>t({type:"github",source:s.trim(),...i.trim()?{id:i.trim()}:{}}),children:[r?n.jsx(me,{"aria-hidden":"true",className:"mr-2 h-4 w-4 animate-spin"}):null,r?"Installing...":"Install"]})]})]})})}async function qk(e){const t=await fetch("/api/auth/check",{credentials:"same-origin",headers:{Accept:"application/json"},signal:e});if(t.status===401)return sp(null),{authenticated:!1,username:null,csrfToken:null,role:null,permissions:[]};if(!t.ok)throw new Error(`Auth check failed with status ${t.status}`);const r=await t.json(),s=r.csrf_token??null;return sp(s),{authenticated:!!r.authenticated,username:r.username??null,csrfToken:s,role:r.role??null,permissions:Array.isArray(r.permissions)?r.permissions.filter(a=>typeof a=="string"):[]}}async function Hk(){try{await fetch("/api/logout",{method:"POST",credentials:"same-origin",headers:await Pr("POST")})}finally{window.sessionStorage.removeItem("loggedIn"),window.sessionStorage.removeItem("username"),window.location.assign("/login.html")}}const _g=d.createContext(void 0);function Wk({children:e}){const[t,r]=d.useState("loading"),[s,a]=d.useState(null),[i,l]=d.useState(null),[o,c]=d.useState([]),[u,h]=d.useState(null),m=d.useRef(!0);d.useEffect(()=>()=>{m.current=!1},[]);const f=d.useCallback(async()=>{r("loading"),h(null);try{const j=await qk();if(!m.current)return;if(j.authenticated){r("authenticated"),a(j.username||"unknown"),l(j.role),c(j.permissions);return}r("unauthenticated"),a(null),l(null),c([])}catch(j){if(!m.current)return;r("error"),a(null),l(null),c([]),h(j instanceof Error?j.message:"Unexpected auth check failure")}},[]);d.useEffect(()=>{f()},[f]);const w=d.useMemo(()=>({state:t,username:s,role:i,permissions:o,error:u,refresh:f}),[t,s,i,o,u,f]);return n.jsx(_g.Provider,{value:w,children:e})}function Ln(){const e=d.useContext(_g);if(!e)throw new Error("useAuth must be used within AuthProvider");return e}const Gk=[{label:"Overview",path:ve.settings,end:!0},{label:"Extensions",path:ve.extensions,end:!1}];function Cg(){return n.jsx("nav",{"aria-label":"Settings sections",className:"border-b border-divider",children:n.jsxs("div",{className:"flex min-w-0 items-end gap-5 overflow-x-auto",children:[n.jsx("span",{className:"shrink-0 pb-3 font-mono text-[10px] uppercase text-dim",children:"Settings / Advanced"}),Gk.map(e=>n.jsx($x,{className:({isActive:t})=>q("relative shrink-0 border-b-2 px-1 pb-3 font-mono text-xs transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring",t?"border-primary text-primary":"border-transparent text-muted-foreground hover:text-foreground"),end:e.end,to:e.path,children:e.label},e.path))]})})}async function Eg(e){return(await W(`/api/capabilities/${encodeURIComponent(e)}`)).capability}async function Kk(){const e=await W("/api/extensions");return{extensions:Array.isArray(e.extensions)?e.extensions:[],errors:Array.isArray(e.errors)?e.errors:[]}}async function Qk(e){const t=await W(`/api/extensions/${encodeURIComponent(e)}`);return{extension:t.extension,errors:Array.isArray(t.errors)?t.errors:[]}}async function Jk(e){return W("/api/extensions/install",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)})}async function Yk(e,t){return W(`/api/extensions/${encodeURIComponent(e)}/${t}`,{method:"POST",headers:{"Content-Type":"application/json"},body:"{}"})}async function Xk(e){return W(`/api/extensions/${encodeURIComponent(e)}`,{method:"DELETE"})}const Zk={integrations:ve.integrations,mounts:ve.mounts,pools:ve.pools,protection:ve.protection,shares:ve.shares};function Ag(e){const t=e.replace(/[._-]+/g," ").trim();return t?t.charAt(0).toUpperCase()+t.slice(1):"Other capabilities"}function e2(e){return Zk[e]??null}function t2(e){const t=new Map;for(const r of e){const s=r.capabilities[0]?.id??"other",a=t.get(s)??[];a.push(r),t.set(s,a)}return[...t.entries()].sort(([r],[s])=>r==="other"?1:s==="other"?-1:r.localeCompare(s)).map(([r,s])=>({id:r,label:r==="other"?"Other capabilities":Ag(r),extensions:[...s].sort((a,i)=>a.name.localeCompare(i.name))}))}function hl(e){return e==="healthy"?"success":e==="warning"||e==="unconfigured"?"warning":e==="error"||e==="incompatible"||e==="unavailable"?"danger":"neutral"}function n2(e){return e.update_state==="available"?"update available":e.update_state==="current"?"current":"not reported"}function jp(e){if(e.runtime_kind==="integration-adapter")return[];const t=e.enabled?"disable":"enable";return e.runtime_kind==="github-python"?[t,"update","repair","remove"]:[t]}function xl(e){return e instanceof Error&&e.message?e.message:"Unable to load extensions"}function ca(e){return e.replace(/[_-]+/g," ")}function Pg({errors:e}){return e.length?n.jsxs("section",{"aria-labelledby":"extension-diagnostics-title",className:"border-l-2 border-warning bg-warning/5 px-4 py-3",children:[n.jsxs("div",{className:"flex items-center gap-2 text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4 shrink-0"}),n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"extension-diagnostics-title",children:"Extension diagnostics"})]}),n.jsx("div",{className:"mt-2 divide-y divide-warning/15",children:e.map((t,r)=>n.jsxs("div",{className:"grid gap-1 py-2 text-xs sm:grid-cols-[minmax(10rem,0.35fr)_1fr]",children:[n.jsx("code",{className:"break-all text-warning",children:t.code}),n.jsx("p",{className:"text-muted-foreground",children:t.message})]},`${t.provider_id??"registry"}-${t.code}-${r}`))})]}):null}function r2({extension:e}){const t=e.capabilities.filter(r=>r.operational).length;return n.jsxs(Ee,{className:"group grid min-h-20 cursor-pointer gap-3 px-4 py-3 transition-colors duration-200 hover:bg-muted/35 focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-inset focus-visible:ring-ring sm:grid-cols-[minmax(12rem,1.15fr)_minmax(9rem,0.65fr)_minmax(9rem,0.65fr)_auto] sm:items-center","data-extension-id":e.id,to:eu(e.id),children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx("span",{className:"mt-0.5 flex h-9 w-9 shrink-0 items-center justify-center rounded-md border border-border bg-muted/30 text-muted-foreground",children:n.jsx(au,{"aria-hidden":"true",className:"h-4 w-4"})}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"truncate font-mono text-sm font-semibold text-foreground",children:e.name}),n.jsx("p",{className:"mt-0.5 line-clamp-2 text-xs text-muted-foreground",children:e.description||e.id}),n.jsxs("div",{className:"mt-2 flex flex-wrap gap-1.5 sm:hidden",children:[n.jsx(fe,{label:ca(e.health.state),tone:hl(e.health.state)}),n.jsx(ee,{children:e.version||"version unknown"})]})]})]}),n.jsxs("div",{className:"hidden min-w-0 sm:block",children:[n.jsx("p",{className:"font-mono text-xs text-foreground",children:e.version||"unknown"}),n.jsx("p",{className:"mt-1 truncate text-xs text-dim",children:e.source})]}),n.jsxs("div",{className:"hidden sm:block",children:[n.jsx(fe,{label:ca(e.health.state),tone:hl(e.health.state)}),n.jsxs("p",{className:"mt-1 text-xs text-dim",children:[t,"/",e.capabilities.length," capabilities available"]})]}),n.jsxs("div",{className:"flex items-center justify-between gap-3 sm:justify-end",children:[n.jsx(ee,{tone:e.compatibility==="compatible"?"success":e.compatibility==="incompatible"?"danger":"neutral",children:e.compatibility}),n.jsx(tu,{"aria-hidden":"true",className:"h-4 w-4 text-dim transition-colors group-hover:text-foreground"})]})]})}function s2(){const{permissions:e}=Ln(),[t,r]=d.useState([]),[s,a]=d.useState([]),[i,l]=d.useState("loading"),[o,c]=d.useState(""),[u,h]=d.useState(!1),[m,f]=d.useState(!1),[w,j]=d.useState(null),y=e.includes("extensions.admin"),b=d.useCallback(async()=>{l("loading");try{const g=await Kk();r(g.extensions),a(g.errors),c(""),l("ready")}catch(g){c(xl(g)),l("error")}},[]);d.useEffect(()=>{b()},[b]);const v=t2(t),p=t.filter(g=>!["healthy","disabled"].includes(g.health.state)).length,x=async g=>{f(!0),j(null);try{const N=await Jk(g);h(!1),j({tone:"success",message:`Extension ${N.id||"package"} installed. Restart LimeOS to load the provider.`}),await b()}catch(N){h(!1),j({tone:"danger",message:xl(N)})}finally{f(!1)}};return n.jsxs("section",{className:"space-y-5 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs("div",{className:"flex flex-wrap gap-2",children:[y?n.jsxs(_,{className:"gap-2","data-extension-install-open":!0,onClick:()=>h(!0),children:[n.jsx(ot,{"aria-hidden":"true",className:"h-4 w-4"}),"Install"]}):null,n.jsxs(_,{className:"gap-2",disabled:i==="loading",onClick:()=>void b(),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",i==="loading"?"animate-spin":"")}),"refresh"]})]}),description:"Settings / Advanced · installed capability providers",status:i==="ready"?n.jsx(fe,{label:`${t.length} installed`,tone:p?"warning":"success"}):void 0,title:"extensions"}),n.jsx(Pg,{errors:s}),w?n.jsx("div",{"aria-live":w.tone==="danger"?"assertive":"polite",className:q("border-l-2 px-4 py-3 text-sm",w.tone==="danger"?"border-danger bg-danger/5 text-danger":"border-success bg-success/5 text-success"),"data-extension-operation-notice":!0,role:w.tone==="danger"?"alert":"status",children:w.message}):null,i==="loading"?n.jsxs("div",{"aria-live":"polite",className:"flex min-h-56 items-center justify-center gap-2 rounded-md border border-border text-sm text-muted-foreground",role:"status",children:[n.jsx(je,{"aria-hidden":"true",className:"h-4 w-4 animate-spin text-primary"}),"Loading extensions…"]}):null,i==="error"?n.jsxs("div",{"aria-live":"assertive",className:"border-l-2 border-danger bg-danger/5 px-4 py-4 text-sm text-danger",role:"alert",children:[n.jsxs("div",{className:"flex items-center gap-2 font-medium",children:[n.jsx(za,{"aria-hidden":"true",className:"h-4 w-4"}),"Extension registry is unavailable"]}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:o})]}):null,i==="ready"&&!v.length?n.jsxs("div",{className:"flex min-h-56 flex-col items-center justify-center rounded-md border border-dashed border-border px-5 text-center",children:[n.jsx(au,{"aria-hidden":"true",className:"h-7 w-7 text-dim"}),n.jsx("h2",{className:"mt-3 font-mono text-sm font-semibold",children:"No extensions discovered"}),n.jsx("p",{className:"mt-1 max-w-lg text-sm text-muted-foreground",children:"Installed providers will appear here when their capability adapters are available."})]}):null,i==="ready"&&v.length?n.jsx("div",{className:"space-y-5",children:v.map(g=>n.jsxs("section",{"aria-labelledby":`extension-group-${g.id}`,children:[n.jsxs("div",{className:"mb-2 flex items-center justify-between gap-3",children:[n.jsx("h2",{className:"font-mono text-xs font-semibold uppercase text-muted-foreground",id:`extension-group-${g.id}`,children:g.label}),n.jsx("span",{className:"font-mono text-[11px] text-dim",children:g.extensions.length})]}),n.jsx("div",{className:"overflow-hidden rounded-md border border-border bg-card divide-y divide-border",children:g.extensions.map(N=>n.jsx(r2,{extension:N},N.id))})]},g.id))}):null,u?n.jsx(Vk,{onClose:()=>h(!1),onConfirm:g=>void x(g),pending:m}):null]})}function xi({label:e,children:t}){return n.jsxs("div",{className:"min-w-0 bg-card px-4 py-3",children:[n.jsx("dt",{className:"font-mono text-[10px] uppercase text-dim",children:e}),n.jsx("dd",{className:"mt-1 break-words text-sm text-foreground",children:t})]})}function a2({extensionId:e}){const t=Ol(),{permissions:r}=Ln(),[s,a]=d.useState(null),[i,l]=d.useState([]),[o,c]=d.useState("loading"),[u,h]=d.useState(""),[m,f]=d.useState(null),[w,j]=d.useState(!1),[y,b]=d.useState(null),v=r.includes("extensions.admin"),p=d.useCallback(async()=>{c("loading");try{const g=await Qk(e);a(g.extension),l(g.errors),h(""),c("ready")}catch(g){a(null),h(xl(g)),c("error")}},[e]);d.useEffect(()=>{p()},[p]);const x=async g=>{if(s){j(!0),b(null);try{if(g==="remove"){await Xk(s.id),f(null),t(ve.extensions,{replace:!0});return}const N=await Yk(s.id,g);f(null),b({tone:"success",message:`${s.name} ${g} completed.${N.restart_required?" Restart LimeOS to apply the change.":""}`}),await p()}catch(N){f(null),b({tone:"danger",message:xl(N)})}finally{j(!1)}}};return o==="loading"?n.jsxs("div",{"aria-live":"polite",className:"flex min-h-56 items-center justify-center gap-2 text-sm text-muted-foreground",role:"status",children:[n.jsx(je,{"aria-hidden":"true",className:"h-4 w-4 animate-spin text-primary"}),"Loading extension…"]}):o==="error"||!s?n.jsxs("section",{className:"space-y-5",children:[n.jsxs(Ee,{className:q(Ye({variant:"ghost",size:"sm"}),"gap-2"),to:ve.extensions,children:[n.jsx(vs,{"aria-hidden":"true",className:"h-4 w-4"}),"Extensions"]}),n.jsxs("div",{className:"border-l-2 border-danger bg-danger/5 px-4 py-4 text-sm text-danger",role:"alert",children:[n.jsx("p",{className:"font-medium",children:"Unable to load extension"}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:u})]})]}):n.jsxs("section",{className:"space-y-5 sm:space-y-6",children:[n.jsxs(Ee,{className:q(Ye({variant:"ghost",size:"sm"}),"gap-2 px-2"),to:ve.extensions,children:[n.jsx(vs,{"aria-hidden":"true",className:"h-4 w-4"}),"Extensions"]}),n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",onClick:()=>void p(),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:"h-4 w-4"}),"refresh"]}),description:s.description||"Capability provider extension",status:n.jsx(fe,{label:ca(s.health.state),tone:hl(s.health.state)}),title:s.name}),n.jsx(Pg,{errors:i}),y?n.jsx("div",{"aria-live":y.tone==="danger"?"assertive":"polite",className:q("border-l-2 px-4 py-3 text-sm",y.tone==="danger"?"border-danger bg-danger/5 text-danger":"border-success bg-success/5 text-success"),"data-extension-operation-notice":!0,role:y.tone==="danger"?"alert":"status",children:y.message}):null,n.jsxs("section",{"aria-labelledby":"extension-package-title",children:[n.jsx("h2",{className:"mb-2 font-mono text-xs font-semibold uppercase text-muted-foreground",id:"extension-package-title",children:"Package"}),n.jsxs("dl",{className:"grid gap-px overflow-hidden rounded-md border border-border bg-border sm:grid-cols-2 lg:grid-cols-4",children:[n.jsx(xi,{label:"Version",children:n.jsx("span",{className:"font-mono",children:s.version||"unknown"})}),n.jsx(xi,{label:"Source",children:n.jsx("span",{className:"font-mono text-xs",children:s.source})}),n.jsx(xi,{label:"Runtime",children:n.jsx("span",{className:"font-mono text-xs",children:ca(s.runtime_kind)})}),n.jsx(xi,{label:"Update",children:n.jsx("span",{className:"font-mono text-xs",children:n2(s)})})]}),n.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[n.jsx(fe,{label:s.installed?"installed":"not installed",tone:s.installed?"success":"neutral"}),n.jsx(fe,{label:s.enabled?"enabled":"disabled",tone:s.enabled?"success":"neutral"}),n.jsx(fe,{label:s.compatibility,tone:s.compatibility==="compatible"?"success":s.compatibility==="incompatible"?"danger":"neutral"}),n.jsx(fe,{label:`contract ${s.contract_state}`,tone:s.contract_state==="valid"?"success":"danger"})]}),n.jsx("p",{className:"mt-3 text-sm text-muted-foreground",children:s.health.message})]}),n.jsxs("section",{"aria-labelledby":"extension-administration-title",children:[n.jsx("h2",{className:"mb-2 font-mono text-xs font-semibold uppercase text-muted-foreground",id:"extension-administration-title",children:"Administration"}),n.jsx("div",{className:"rounded-md border border-border bg-card px-4 py-4",children:jp(s).length?v?n.jsx("div",{className:"flex flex-wrap gap-2",children:jp(s).map(g=>{const N=g==="remove"?Kt:g==="repair"?cs:g==="update"?Oa:iu,E=g==="remove"&&s.enabled;return n.jsxs(_,{className:q("gap-2",g==="remove"?"border-danger/30 text-danger hover:bg-danger/10":""),"data-extension-action":g,disabled:w||E,onClick:()=>f(g),title:E?"Disable this extension before removing it":void 0,variant:"outline",children:[w?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(N,{"aria-hidden":"true",className:"h-4 w-4"}),g.charAt(0).toUpperCase()+g.slice(1)]},g)})}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"Administrator access is required to change extension packages."}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"This provider is managed from its owning LimeOS page."})})]}),n.jsxs("section",{"aria-labelledby":"extension-capabilities-title",children:[n.jsxs("div",{className:"mb-2 flex items-center justify-between gap-3",children:[n.jsx("h2",{className:"font-mono text-xs font-semibold uppercase text-muted-foreground",id:"extension-capabilities-title",children:"Capabilities"}),n.jsx("span",{className:"font-mono text-[11px] text-dim",children:s.capabilities.length})]}),s.capabilities.length?n.jsx("div",{className:"overflow-hidden rounded-md border border-border bg-card divide-y divide-border",children:s.capabilities.map(g=>{const N=e2(g.surface);return n.jsxs("div",{className:"grid gap-3 px-4 py-3 sm:grid-cols-[minmax(12rem,1fr)_auto] sm:items-center","data-capability-id":g.id,children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx(pw,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-primary"}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"font-mono text-sm font-semibold",children:Ag(g.id)}),n.jsx("p",{className:"mt-0.5 break-all font-mono text-xs text-dim",children:g.id}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:g.status.health.message})]})]}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2 sm:justify-end",children:[n.jsx(fe,{label:ca(g.status.health.state),tone:hl(g.status.health.state)}),N?n.jsxs(Ee,{className:q(Ye({variant:"outline",size:"sm"}),"gap-2"),to:N,children:["Open ",n.jsx(iw,{"aria-hidden":"true",className:"h-3.5 w-3.5"})]}):n.jsx(ee,{children:"page not available yet"})]})]},g.id)})}):n.jsx("div",{className:"rounded-md border border-dashed border-border px-4 py-6 text-sm text-muted-foreground",children:"No usable capabilities were declared. Review the diagnostics above."})]}),m?n.jsx(Fk,{action:m,extension:s,onClose:()=>f(null),onConfirm:()=>void x(m),pending:w}):null]})}function wp(){const{extensionId:e}=Zd();return n.jsxs("div",{className:"space-y-5 sm:space-y-6",children:[n.jsx(Cg,{}),e?n.jsx(a2,{extensionId:e}):n.jsx(s2,{})]})}const Np=["downloads","storage","backup","config"];async function i2(e){const r=(await W("/api/disks/media-paths",{method:"GET",signal:e})).paths??{};return{downloads:String(r.downloads??""),storage:String(r.storage??""),backup:String(r.backup??""),config:String(r.config??"")}}async function l2(e,t){const r=await W("/api/disks/media-paths",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e),signal:t});if(r.error)throw new Error(r.error);return{warning:ce(r.startup_warning)}}function o2(e){return{id:String(e?.id??e?.mount_id??e?.name??""),name:String(e?.name??e?.id??"mount"),mountpoint:ce(e?.mountpoint??e?.target),mounted:!!(e?.mounted??e?.is_mounted),type:ce(e?.type??e?.remote_type)}}async function c2(e,t){let r;try{r=await W(`/api/storage/mounts/${encodeURIComponent(e)}`,{method:"GET",signal:t})}catch(s){if(s instanceof Wl&&s.status===400)return null;throw s}if(r.error)throw new Error(r.error);if(!Array.isArray(r.mounts))throw new Error("Mount list response is invalid");return r.mounts.map(s=>o2(s))}async function fu(e,t,r){const s=await W(e,{method:t,signal:r});if(s.error)throw new Error(s.error)}function d2(e,t,r){return fu(`/api/storage/mounts/${encodeURIComponent(e)}/${encodeURIComponent(t)}/mount`,"POST",r)}function u2(e,t,r){return fu(`/api/storage/mounts/${encodeURIComponent(e)}/${encodeURIComponent(t)}/unmount`,"POST",r)}function m2(e,t,r){return fu(`/api/storage/mounts/${encodeURIComponent(e)}/${encodeURIComponent(t)}`,"DELETE",r)}async function Rg(e,t,r,s){const a=await W(e,{method:t,headers:{"Content-Type":"application/json"},body:JSON.stringify(r),signal:s});if(a.error)throw new Error(a.error)}function p2(e,t,r){return Rg(`/api/storage/mounts/${encodeURIComponent(e)}`,"POST",t,r)}function f2(e,t,r,s){return Rg(`/api/storage/mounts/${encodeURIComponent(e)}/${encodeURIComponent(t)}`,"PUT",r,s)}async function h2(e){const t=await W("/api/disks/startup-service/preview",{method:"GET",signal:e});if(t.error)throw new Error(t.error);const r=s=>({path:String(s?.path??""),current:String(s?.current??""),proposed:String(s?.proposed??""),exists:!!s?.exists,changed:!!s?.changed});return{script:r(t.script),service:r(t.service)}}async function x2(e){const t=await W("/api/disks/startup-service",{method:"POST",signal:e});if(t.error)throw new Error(t.error)}async function Mg(e,t,r){if(!Number.isInteger(t)||t<1)throw new RangeError("Concurrency must be a positive integer");const s=new Array(e.length);let a=0;async function i(){for(;;){const o=a;if(a+=1,o>=e.length)return;try{s[o]={status:"fulfilled",value:await r(e[o],o)}}catch(c){s[o]={status:"rejected",reason:c}}}}const l=Math.min(t,e.length);return await Promise.all(Array.from({length:l},()=>i())),s}function g2(e){return{id:String(e?.id??""),name:String(e?.name??e?.id??"unknown"),description:String(e?.description??""),version:String(e?.version??""),installed:!!e?.installed,enabled:!!e?.enabled,configured:!!e?.configured,status:String(e?.status??"unknown"),status_message:String(e?.status_message??""),category:String(e?.category??"storage"),kind:String(e?.kind??"generic"),type:String(e?.type??"builtin")}}async function Ql(e){const t=await W("/api/storage/plugins",{method:"GET",signal:e});return Array.isArray(t.plugins)?t.plugins.map(r=>g2(r)):[]}async function Tg(e,t){const r=await W(`/api/storage/plugins/${encodeURIComponent(e)}`,{method:"GET",signal:t});if(r.error)throw new Error(String(r.error));const s=Array.isArray(r.commands)?r.commands:[];return{id:String(r.id??e),name:String(r.name??e),description:String(r.description??""),installed:!!r.installed,kind:String(r.kind??"generic"),status:r.status??{},commands:s.map(a=>({id:String(a.id??""),label:String(a.name??a.label??a.id??""),description:a.description!=null?String(a.description):void 0,params:Array.isArray(a.params)?a.params.map(i=>String(i)):[],dangerous:!!a.dangerous,param_schema:Array.isArray(a.param_schema)?a.param_schema:void 0})),schema:r.schema??{},config:r.config??{}}}async function $g(e,t,r){const s=await fetch(`/api/storage/plugins/${encodeURIComponent(e)}/config`,{method:"POST",credentials:"same-origin",headers:{"Content-Type":"application/json",Accept:"application/json",...await Pr("POST")},body:JSON.stringify(t),signal:r}),a=await s.json().catch(()=>({}));if(s.ok&&!a.error)return{ok:!0,error:null,details:[]};const i=Array.isArray(a.details)?a.details.map(l=>String(l)):a.details?[String(a.details)]:[];return{ok:!1,error:a.error||`Save failed (${s.status})`,details:i}}async function Ig(e){const t=await fetch(`/api/storage/plugins/${encodeURIComponent(e)}/apply`,{method:"POST",credentials:"same-origin",headers:{Accept:"application/json",...await Pr("POST")}}),r=await t.json().catch(()=>({}));return t.ok&&!r.error?{ok:!0,error:null,message:r.message??null}:{ok:!1,error:r.error||`Apply failed (${t.status})`,message:null}}async function Lg(e,t){const r=await fetch(`/api/storage/plugins/${encodeURIComponent(e)}/config-preview`,{method:"POST",credentials:"same-origin",headers:{"Content-Type":"application/json",Accept:"application/json",...await Pr("POST")},body:JSON.stringify(t)}),s=await r.json().catch(()=>({}));if(!r.ok||s.error)throw new Error(s.error||`Preview failed (${r.status})`);return String(s.preview??"")}async function v2(e,t){const r=await fetch(`/api/storage/plugins/${encodeURIComponent(e)}/recovery`,{method:"GET",credentials:"same-origin",headers:{Accept:"application/json"},signal:t});if(r.status===404)return{supported:!1,data:null};if(!r.ok)throw new Error(`Recovery request failed (${r.status})`);return{supported:!0,data:await r.json()}}async function zg(e,t){const r=await fetch(`/api/storage/plugins/${encodeURIComponent(e)}/logs/latest`,{method:"GET",credentials:"same-origin",signal:t});if(r.status===404)return null;if(!r.ok)throw new Error(`Log request failed (${r.status})`);return await r.text()}async function y2(e,t,r,s,a){const i=await fetch(`/api/storage/plugins/${encodeURIComponent(e)}/commands/${encodeURIComponent(t)}`,{method:"POST",credentials:"same-origin",headers:{"Content-Type":"application/json",Accept:"text/event-stream",...await Pr("POST")},body:JSON.stringify(r??{}),signal:a});if(!i.ok||!i.body)throw new Error(`Command failed (${i.status})`);const l=i.body.getReader(),o=new TextDecoder;let c="";for(;;){const{value:u,done:h}=await l.read();if(h)break;c+=o.decode(u,{stream:!0});let m=c.indexOf(`
+`)}}if(m)return;a=s===u?a+1:1}throw new Error("Operation stream ended before completion")}function dg(e){return{name:String(e?.name??"unknown"),status:String(e?.status??"unknown"),running_count:ne(e?.running_count),container_count:ne(e?.container_count),path:ce(e?.path),compose_file:ce(e?.compose_file)}}async function ug(e={}){const t=e.includeStatus??!0,r=await W(`/api/stacks?status=${t?"true":"false"}`,{method:"GET",signal:e.signal});if(r.error)throw new Error(r.error);return Array.isArray(r.stacks)?r.stacks.map(s=>dg(s)):[]}async function Y0(e,t,r){return $n(`/api/stacks/${encodeURIComponent(e)}/operations`,{action:t},r)}async function X0(e,t=200,r){const s=await W(`/api/stacks/${encodeURIComponent(e)}/logs?tail=${t}`,{method:"GET",signal:r});if(s.error)throw new Error(s.error);return{logs:s.logs??"",returncode:ne(s.returncode)}}async function Z0(e,t,r){return In(e,t,r)}async function e1(e,t){return W(`/api/stacks/${encodeURIComponent(e.name)}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({compose_content:e.composeContent,env_content:e.envContent}),signal:t})}async function t1(e,t,r){return W(`/api/stacks/${encodeURIComponent(e)}`,{method:"DELETE",headers:{"Content-Type":"application/json"},body:JSON.stringify({force:t.force===!0,confirm_name:t.confirmName}),signal:r})}async function n1(e){const t=await W("/api/stacks/scan",{method:"POST",signal:e});if(t.error)throw new Error(t.error);const r=Array.isArray(t.stacks)?t.stacks.map(s=>dg(s)):[];return{stacks:r,count:ne(t.count)??r.length}}async function ap(e,t){const r=await W(`/api/stacks/${encodeURIComponent(e)}`,{method:"GET",signal:t});if(r.error)throw new Error(r.error);return{name:String(r.name??e),path:ce(r.path),compose_file:ce(r.compose_file),compose_content:String(r.compose_content??""),has_env:!!r.has_env,env_content:String(r.env_content??""),status:r.status&&typeof r.status=="object"?r.status:null}}async function r1(e,t,r){return W(`/api/stacks/${encodeURIComponent(e)}/compose?validate_only=true`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({content:t}),signal:r})}async function s1(e,t,r){const s=await W(`/api/stacks/${encodeURIComponent(e)}/compose`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({content:t}),signal:r});if(s.error)throw new Error(s.error)}async function a1(e,t,r){const s=await W(`/api/stacks/${encodeURIComponent(e)}/env`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({content:t}),signal:r});if(s.error)throw new Error(s.error)}async function i1(e,t){const r=await W(`/api/stacks/${encodeURIComponent(e)}/backups`,{method:"GET",signal:t});if(r.error)throw new Error(r.error);return Array.isArray(r.backups)?r.backups.map(s=>String(s)).filter(s=>s.length>0):[]}async function l1(e,t,r){const s=await W(`/api/stacks/${encodeURIComponent(e)}/backups/${encodeURIComponent(t)}`,{method:"GET",signal:r});if(s.error)throw new Error(s.error);return{content:s.content??"",filename:ce(s.filename)}}async function o1(e,t,r){const s=await W(`/api/stacks/${encodeURIComponent(e)}/restore`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({backup:t}),signal:r});if(s.error)throw new Error(s.error)}function c1(e){return e.container_count===null||e.container_count<=0||e.running_count===null?null:Math.round(e.running_count/e.container_count*100)}function d1(e){return Array.isArray(e)?[...new Set(e.map(t=>String(t).trim()).filter(Boolean))].sort():[]}function u1(e,t){const r=String(e?.id??"");return{id:r,name:String(e?.name??r),description:String(e?.description??""),requires:Array.isArray(e?.requires)?e.requires.map(s=>String(s)):[],installedStacks:d1(t[r]),managedBy:e?.managed_by?String(e.managed_by):null}}async function m1(e){const[t,r,s]=await Promise.all([W("/api/catalog",{method:"GET",signal:e}),W("/api/catalog/status",{method:"GET",signal:e}),ug({includeStatus:!1,signal:e})]),a=r.service_stacks??{};return{items:Array.isArray(t.items)?t.items.map(i=>u1(i,a)):[],availableStacks:[...new Set(s.map(i=>i.name).filter(Boolean))].sort()}}async function p1(e,t){const r=await W(`/api/catalog/${encodeURIComponent(e)}?apply_media_paths=true`,{method:"GET",signal:t});if(r.error)throw new Error(r.error);const s=r.item?.fields;return Array.isArray(s)?s.map(a=>({key:String(a.key??""),label:String(a.label??a.key??""),default:a.default===void 0||a.default===null?"":String(a.default),required:a.required===void 0?!0:!!a.required})):[]}async function f1(e,t,r,s,a){const i=await $n("/api/catalog/install",{id:e,values:t,start_service:!0,target_stack:r,stack_name:s},a);await In(i.stream_url,l=>{if(l.error)throw new Error(l.error);if(l.done&&l.returncode!==0)throw new Error(`App startup failed (${l.returncode??"unknown status"})`)},a)}async function h1(e,t,r){const s=await W("/api/catalog/remove",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({id:e,stop_service:!0,target_stack:t}),signal:r});if(s.error)throw new Error(s.error)}const ip=["B","KB","MB","GB","TB"],Gl="—";function Kl(e){return typeof e=="number"&&Number.isFinite(e)?e:null}function Pe(e,t=1){const r=Kl(e);if(r===null||r<0)return Gl;if(r===0)return"0 B";const s=Math.min(Math.floor(Math.log(r)/Math.log(1024)),ip.length-1);return`${(r/1024**s).toFixed(t)} ${ip[s]}`}function pl(e){const t=Kl(e);return t===null?Gl:`${Pe(t)}/s`}function Bt(e){const t=String(e.getHours()).padStart(2,"0"),r=String(e.getMinutes()).padStart(2,"0"),s=String(e.getSeconds()).padStart(2,"0");return`${t}:${r}:${s}`}function _t(e,t=1){const r=Kl(e);return r===null?Gl:`${r.toFixed(t)}%`}function fl(e){const t=Kl(e);if(t===null||t<0)return Gl;const r=Math.floor(t/86400),s=Math.floor(t%86400/3600),a=Math.floor(t%3600/60);return r?`${r}d ${s}h`:s?`${s}h ${a}m`:a?`${a}m`:`${Math.floor(t)}s`}async function x1({stack:e,values:t={},signal:r,onEvent:s}){const a=await $n("/api/media/quickstart",{stack:e,values:t},r);await In(a.stream_url,s,r)}const g1=3e4,Os={open:!1,itemId:"",itemName:"",status:"idle",fields:[],values:{},targetStack:"new",newStackName:"",error:null,saving:!1},Mo={open:!1,status:"idle",stackName:"media",lines:[],error:null};function Dr(e){return e instanceof Error&&e.message?e.message:"Unable to complete the request"}function lp(e,t){return`${e}:${t}`}function v1(e,t,r){if(!e.requires.length)return"new";const s=e.requires.map(a=>t.find(i=>i.id===a)?.installedStacks??[]);return r.find(a=>s.every(i=>i.includes(a)))??"new"}function y1(){const[e,t]=d.useState([]),[r,s]=d.useState([]),[a,i]=d.useState(!0),[l,o]=d.useState(!1),[c,u]=d.useState(null),[h,m]=d.useState("Never"),[f,w]=d.useState(null),[j,y]=d.useState(null),[b,v]=d.useState(null),[p,x]=d.useState(Os),[g,N]=d.useState(Mo),E=d.useRef(!0),C=d.useCallback(async I=>{I==="initial"&&i(!0),I==="manual"&&o(!0);try{const U=await m1();if(!E.current)return;t(U.items),s(U.availableStacks),u(null),m(Bt(new Date))}catch(U){E.current&&u(Dr(U))}finally{E.current&&(I==="initial"&&i(!1),I==="manual"&&o(!1))}},[]),k=d.useCallback(async(I,U)=>{const L=lp(I.id,U);v(null),y(L);try{await h1(I.id,U),E.current&&(w({tone:"success",message:`Removed ${I.name} from ${U}`}),await C("manual"))}catch(B){E.current&&w({tone:"error",message:Dr(B)})}finally{E.current&&y(null)}},[C]),O=d.useCallback(async I=>{x({...Os,open:!0,itemId:I.id,itemName:I.name,status:"loading",targetStack:v1(I,e,r),newStackName:I.id});try{const U=await p1(I.id);if(!E.current)return;const L={};for(const B of U)L[B.key]=B.default;x(B=>B.itemId===I.id&&B.open?{...B,status:"ready",fields:U,values:L}:B)}catch(U){E.current&&x(L=>L.itemId===I.id&&L.open?{...L,status:"error",error:Dr(U)}:L)}},[r,e]),S=d.useCallback(async()=>{const I=p.targetStack==="new"?p.newStackName.trim():"";if(p.targetStack==="new"&&!I){x(U=>({...U,error:"New stack name is required"}));return}x(U=>({...U,saving:!0,error:null}));try{if(await f1(p.itemId,p.values,p.targetStack,I),!E.current)return;const U=p.itemName;x(Os),w({tone:"success",message:`Installed ${U}`}),await C("manual")}catch(U){E.current&&x(L=>({...L,saving:!1,error:Dr(U)}))}},[p,C]),$=d.useCallback(async()=>{const I=g.stackName.trim();if(!I){N(U=>({...U,error:"Stack name is required"}));return}N(U=>({...U,status:"running",stackName:I,lines:["Preparing media quickstart..."],error:null}));try{if(await x1({stack:I,values:{USE_VPN:"true"},onEvent:U=>{if(!E.current)return;const L=U.error||U.line;L&&N(B=>({...B,lines:[...B.lines,L],error:U.error??B.error})),U.error?N(B=>({...B,status:"error",error:U.error??B.error})):U.done&&N(B=>({...B,status:"success"}))}}),!E.current)return;w({tone:"success",message:`Media quickstart completed for ${I}`}),await C("manual")}catch(U){E.current&&N(L=>({...L,status:"error",error:Dr(U),lines:[...L.lines,Dr(U)]}))}},[C,g.stackName]);d.useEffect(()=>{E.current=!0,C("initial");const I=window.setInterval(()=>void C("poll"),g1);return()=>{E.current=!1,window.clearInterval(I)}},[C]);const R=e.reduce((I,U)=>I+U.installedStacks.length,0),H=e.find(I=>I.id===p.itemId);return n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",disabled:l,onClick:()=>void C("manual"),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",l?"animate-spin":"")}),l?"refreshing":"refresh"]}),description:`${R} installations · ${e.length} catalog apps`,title:"app_catalog"}),f?n.jsx(Q,{"aria-live":f.tone==="error"?"assertive":"polite",className:f.tone==="error"?"border-danger/30 text-danger":"border-success/30 text-success",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm",children:[f.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),f.message]})}):null,c&&!e.length?n.jsx(Q,{className:"border-danger/30",children:n.jsxs(K,{className:"flex flex-col items-start gap-3 p-4 sm:p-6",children:[n.jsx("p",{className:"text-sm font-medium text-danger",children:"Unable to load catalog"}),n.jsx("p",{className:"text-sm text-muted-foreground",children:c}),n.jsx(_,{onClick:()=>void C("manual"),variant:"outline",children:"Retry"})]})}):null,n.jsx(Q,{className:"overflow-hidden border-info/30 bg-gradient-to-br from-info/10 via-card to-card shadow-[0_0_0_1px_rgba(56,189,248,0.06)]",children:n.jsxs(K,{className:"grid gap-4 p-4 sm:grid-cols-[1fr_auto] sm:items-center sm:p-5",children:[n.jsxs("div",{className:"space-y-3",children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(ee,{tone:"info",children:"guided setup"}),n.jsx(ee,{tone:"success",children:"vpn-first"}),n.jsx(ee,{tone:"neutral",children:"Jellyfin + downloads"})]}),n.jsxs("div",{children:[n.jsx("h2",{className:"font-mono text-lg font-semibold text-foreground",children:"Media server quickstart"}),n.jsx("p",{className:"mt-1 max-w-3xl text-sm text-muted-foreground",children:"Create the media stack in one run: provision folders, install the bundle, start Compose, then seed app folders and first-run config."})]}),n.jsxs("div",{className:"grid gap-2 text-xs text-muted-foreground sm:grid-cols-3",children:[n.jsxs("span",{className:"inline-flex items-center gap-2 rounded-md border border-border/70 bg-background/50 px-2 py-1.5",children:[n.jsx(su,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-info"}),"Media folders"]}),n.jsxs("span",{className:"inline-flex items-center gap-2 rounded-md border border-border/70 bg-background/50 px-2 py-1.5",children:[n.jsx(jt,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-success"}),"VPN networking"]}),n.jsxs("span",{className:"inline-flex items-center gap-2 rounded-md border border-border/70 bg-background/50 px-2 py-1.5",children:[n.jsx(lt,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-primary"}),"Seeded apps"]})]})]}),n.jsxs(_,{className:"gap-2 sm:min-w-40","data-media-quickstart-open":!0,disabled:g.status==="running",onClick:()=>N(I=>({...I,open:!0,status:"idle",error:null})),size:"lg",variant:"info",children:[n.jsx(Wm,{"aria-hidden":"true",className:"h-4 w-4"}),"Quickstart"]})]})}),a?n.jsx(Q,{"aria-live":"polite",role:"status",children:n.jsx(K,{className:"flex min-h-[14rem] items-center justify-center p-6 text-sm text-muted-foreground",children:"Loading catalog..."})}):null,!a&&e.length?n.jsx("div",{className:"grid gap-3 sm:grid-cols-2 xl:grid-cols-3",children:e.map(I=>n.jsx(Q,{className:"flex flex-col transition-colors duration-200 hover:border-primary/25",children:n.jsxs(K,{className:"flex flex-1 flex-col gap-3 p-4",children:[n.jsxs("div",{className:"flex items-start justify-between gap-3",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"truncate text-sm font-semibold",children:I.name}),n.jsx("p",{className:"line-clamp-2 text-xs text-muted-foreground",children:I.description})]}),I.installedStacks.length?n.jsx(fe,{label:"installed",tone:"success"}):null]}),I.requires.length?n.jsx("div",{className:"flex flex-wrap gap-1.5",children:I.requires.map(U=>n.jsxs(ee,{tone:"warning",children:["requires: ",U]},U))}):null,I.installedStacks.length?n.jsx("div",{className:"space-y-1.5",role:"list","aria-label":`${I.name} installations`,children:I.installedStacks.map(U=>{const L=lp(I.id,U),B=b===L,P=j===L;return n.jsxs("div",{className:"flex min-h-11 items-center justify-between gap-2 rounded-md border border-border/70 bg-muted/30 px-2",role:"listitem",children:[n.jsx(ee,{className:"max-w-32 truncate",title:U,tone:"success",children:U}),B?n.jsxs("span",{className:"flex items-center gap-1.5",children:[n.jsx(_,{className:"border-danger/30 bg-danger/10 px-3 text-xs text-danger hover:bg-danger/15","data-confirm-remove":I.id,"data-stack":U,disabled:P,onClick:()=>void k(I,U),variant:"outline",children:P?"Removing...":"Confirm"}),n.jsx(_,{"aria-label":`Cancel removing ${I.name} from ${U}`,className:"px-3 text-xs",onClick:()=>v(null),variant:"ghost",children:"Cancel"})]}):n.jsx(_,{"aria-label":`Remove ${I.name} from ${U}`,className:"w-11 px-0","data-catalog-action":"remove","data-item":I.id,"data-stack":U,disabled:!!j,onClick:()=>v(L),title:`Remove from ${U}`,variant:"ghost",children:n.jsx(Kt,{"aria-hidden":"true",className:"h-4 w-4"})})]},U)})}):null,n.jsx("div",{className:"mt-auto flex flex-wrap gap-2",children:I.managedBy==="integrations"?n.jsx(Ee,{className:Ye({size:"sm",variant:"info"}),to:"/integrations",children:"Manage in Integrations"}):n.jsx(_,{className:"px-3 text-xs sm:text-sm","data-catalog-action":"install","data-item":I.id,disabled:!!j,onClick:()=>void O(I),children:"Install"})})]})},I.id))}):null,!a&&!e.length&&!c?n.jsx(Q,{children:n.jsx(K,{className:"flex min-h-[10rem] items-center justify-center p-6 text-sm text-muted-foreground",children:"No catalog items found."})}):null,p.open?n.jsx(ze,{onClose:()=>x(Os),children:n.jsxs(Q,{"aria-labelledby":"v2-catalog-install-title","aria-modal":"true",className:"flex max-h-[90vh] w-full max-w-xl flex-col overflow-hidden",id:"v2-catalog-install-modal",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsxs(ge,{className:"text-base sm:text-lg",id:"v2-catalog-install-title",children:["Install ",p.itemName]}),n.jsx(we,{children:"Confirm configuration before deploying."})]}),n.jsx(_,{id:"v2-catalog-install-close",onClick:()=>x(Os),variant:"outline",children:"Close"})]}),n.jsx(K,{className:"space-y-3 overflow-auto p-4",children:p.status==="loading"?n.jsx("p",{className:"text-sm text-muted-foreground",children:"Loading options..."}):p.status==="error"?n.jsx("p",{className:"text-sm text-danger",children:p.error}):n.jsxs(n.Fragment,{children:[n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Target stack"}),n.jsxs("select",{className:"min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 text-sm focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring","data-install-target":!0,onChange:I=>x(U=>({...U,targetStack:I.target.value})),value:p.targetStack,children:[n.jsx("option",{value:"new",children:"Create new stack"}),r.map(I=>{const U=H?.installedStacks.includes(I)??!1;return n.jsxs("option",{disabled:U,value:I,children:[I,U?" (installed)":""]},I)})]})]}),p.targetStack==="new"?n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"New stack name"}),n.jsx("input",{className:"min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 font-mono text-xs focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring sm:text-sm","data-install-stack-name":!0,onChange:I=>x(U=>({...U,newStackName:I.target.value})),spellCheck:!1,value:p.newStackName})]}):null,p.fields.length?p.fields.map(I=>n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:I.label}),n.jsx("input",{className:"w-full rounded-md border border-border bg-background px-3 py-2 font-mono text-xs focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring sm:text-sm","data-install-field":I.key,onChange:U=>x(L=>({...L,values:{...L.values,[I.key]:U.target.value}})),spellCheck:!1,value:p.values[I.key]??""})]},I.key)):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No configuration required."}),p.error?n.jsx("p",{className:"text-sm text-danger",id:"v2-catalog-install-error",children:p.error}):null,n.jsxs(_,{disabled:p.saving||p.targetStack==="new"&&!p.newStackName.trim(),id:"v2-catalog-install-submit",onClick:()=>void S(),children:[p.saving?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):null,p.saving?"Installing...":"Install"]})]})})]})}):null,g.open?n.jsx(ze,{onClose:g.status==="running"?()=>{}:()=>N(Mo),children:n.jsxs(Q,{"aria-labelledby":"v2-media-quickstart-title","aria-modal":"true",className:"flex max-h-[90vh] w-full max-w-2xl flex-col overflow-hidden",id:"v2-media-quickstart-modal",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsx(ge,{className:"text-base sm:text-lg",id:"v2-media-quickstart-title",children:"Media server quickstart"}),n.jsx(we,{children:"Build the media stack with VPN-first defaults."})]}),n.jsx(_,{disabled:g.status==="running",id:"v2-media-quickstart-close",onClick:()=>N(Mo),variant:"outline",children:"Close"})]}),n.jsx(K,{className:"space-y-4 overflow-auto p-4",children:g.status==="running"||g.status==="success"||g.status==="error"?n.jsxs(n.Fragment,{children:[n.jsx("div",{"aria-live":g.status==="error"?"assertive":"polite",className:q("rounded-md border p-3 text-sm",g.status==="error"?"border-danger/30 text-danger":g.status==="success"?"border-success/30 text-success":"border-info/30 text-info"),role:"status",children:g.status==="running"?"Quickstart is running...":g.status==="success"?`Media quickstart completed for ${g.stackName}`:g.error}),n.jsx("pre",{className:"max-h-72 overflow-auto rounded-md border border-border bg-black/30 p-3 font-mono text-xs leading-5 text-muted-foreground","data-media-quickstart-log":!0,children:g.lines.join(`
+`)})]}):n.jsxs(n.Fragment,{children:[n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Stack name"}),n.jsx("input",{className:"min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 font-mono text-sm focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring","data-media-quickstart-stack":!0,onChange:I=>N(U=>({...U,stackName:I.target.value,error:null})),spellCheck:!1,value:g.stackName})]}),n.jsx("p",{className:"text-sm text-muted-foreground",children:"This uses the media bundle with VPN enabled. Non-VPN mode is not exposed yet because the current catalog definitions depend on VPN networking."}),g.error?n.jsx("p",{className:"text-sm text-danger",id:"v2-media-quickstart-error",children:g.error}):null,n.jsxs(_,{className:"gap-2","data-media-quickstart-start":!0,onClick:()=>void $(),children:[n.jsx(Wm,{"aria-hidden":"true",className:"h-4 w-4"}),"Start quickstart"]})]})})]})}):null]})}function b1(e){const t=e.filter(r=>r.status==="running");return t.length>0&&t.every(r=>r.memory_used===null)}function j1(e){return e?{container_port:ne(e.container_port),protocol:ce(e.protocol),host_port:ne(e.host_port),host_ip:ce(e.host_ip),via_service:ce(e.via_service)}:{container_port:null,protocol:null,host_port:null,host_ip:null,via_service:null}}function w1(e){const t=String(e?.id??""),r=e?.web_scheme;return{id:t||"unknown-container",name:String(e?.name??"Unnamed"),status:String(e?.status??"unknown"),image:String(e?.image??"unknown"),stack:ce(e?.stack),health:ce(e?.health),update_available:!!e?.update_available,ports:Array.isArray(e?.ports)?e.ports.map(s=>j1(s)):[],cpu_percent:ne(e?.cpu_percent),memory_percent:ne(e?.memory_percent),memory_used:ne(e?.memory_used),memory_limit:ne(e?.memory_limit),net_rx:ne(e?.net_rx),net_tx:ne(e?.net_tx),net_rx_rate:ne(e?.net_rx_rate),net_tx_rate:ne(e?.net_tx_rate),block_read_rate:ne(e?.block_read_rate),block_write_rate:ne(e?.block_write_rate),web_url:ce(e?.web_url),web_scheme:r==="http"||r==="https"?r:null}}async function mg(e={}){const t=e.includeStats??!0;return(await W(`/api/containers?stats=${t?"true":"false"}`,{method:"GET",signal:e.signal})).map(s=>w1(s))}async function op(e,t=!1,r){return W(`/api/containers/${encodeURIComponent(e)}${t?"?env=full":""}`,{method:"GET",signal:r})}async function N1(e,t){const r=await W(`/api/containers/${encodeURIComponent(e)}/health`,{method:"GET",signal:t});return{status:String(r.status??"none"),failing_streak:ne(r.failing_streak)??0,last_output:String(r.last_output??""),last_exit_code:ne(r.last_exit_code),last_started_at:ce(r.last_started_at),last_finished_at:ce(r.last_finished_at)}}async function To(e,t,r){const s=await W(`/api/containers/${encodeURIComponent(e)}/${t}`,{method:"POST",signal:r});if(s.error)throw new Error(s.error);return s}async function k1(e,t=200,r){const s=await W(`/api/containers/${encodeURIComponent(e)}/logs?tail=${t}`,{method:"GET",signal:r});if(s.error)throw new Error(s.error);return{logs:s.logs??"",container:ce(s.container)}}async function S1(e,t){const r=await W(`/api/containers/${encodeURIComponent(e)}/network-test`,{method:"POST",signal:t});if(r.error)throw new Error(r.error);return{ping_success:!!r.ping_success,ping_output:r.ping_output??"",local_ip:ce(r.local_ip),public_ip:ce(r.public_ip),probe_method:ce(r.probe_method),container_id:ce(r.container_id),container_name:ce(r.container_name)}}async function pg(e){const t=await W("/api/network-test",{method:"POST",signal:e});if(t.error)throw new Error(t.error);return{ping_success:!!t.ping_success,ping_output:t.ping_output??"",local_ip:ce(t.local_ip),public_ip:ce(t.public_ip),probe_method:ce(t.probe_method)}}async function _1(e,t){if(!e.length)return{};const r=e.map(a=>a.trim()).filter(Boolean).join(",");if(!r)return{};const s=await W(`/api/containers/stats?ids=${encodeURIComponent(r)}`,{method:"GET",signal:t});return Object.entries(s).reduce((a,[i,l])=>(a[i]={cpu_percent:ne(l.cpu_percent),memory_percent:ne(l.memory_percent),memory_used:ne(l.memory_used),memory_limit:ne(l.memory_limit),net_rx:ne(l.net_rx),net_tx:ne(l.net_tx),net_rx_rate:ne(l.net_rx_rate),net_tx_rate:ne(l.net_tx_rate),block_read_rate:ne(l.block_read_rate),block_write_rate:ne(l.block_write_rate)},a),{})}const C1=new Set(["stopped","exited"]);function E1(e,t){return t==="all"?e:t==="stopped"?e.filter(r=>C1.has(r.status)):t==="updates"?e.filter(r=>r.update_available):e.filter(r=>r.status===t)}function Ds(e){return typeof e=="number"&&Number.isInteger(e)&&e>0&&e<=65535}function A1(e){if(!e.ports.length)return null;const t=e.ports.filter(s=>s.protocol!=="udp"),r=[t.find(s=>Ds(s.host_port))?.host_port,e.ports.find(s=>Ds(s.host_port))?.host_port,t.find(s=>Ds(s.container_port))?.container_port,e.ports.find(s=>Ds(s.container_port))?.container_port];for(const s of r)if(Ds(s))return s;return null}function P1(e,t=typeof window>"u"?null:window.location.hostname){if(e.web_url)try{const i=new URL(e.web_url);if((i.protocol==="http:"||i.protocol==="https:")&&!i.username&&!i.password)return i.href}catch{}const r=A1(e);if(!r||!t)return null;const s=e.web_scheme??"http",a=t.includes(":")&&!t.startsWith("[")?`[${t}]`:t;return`${s}://${a}:${r}`}function R1(e){if(e===null)return"Not running";const t=Math.floor(e/86400),r=Math.floor(e%86400/3600),s=Math.floor(e%3600/60);return[t?`${t}d`:"",r?`${r}h`:"",`${s}m`].filter(Boolean).join(" ")}function M1({container:e,onClose:t}){const[r,s]=d.useState(null),[a,i]=d.useState(null),[l,o]=d.useState(null),[c,u]=d.useState(null),[h,m]=d.useState(new Set),[f,w]=d.useState(null);d.useEffect(()=>{const b=new AbortController;return Promise.all([op(e.id,!1,b.signal),N1(e.id,b.signal)]).then(([v,p])=>{s(v),i(p)}).catch(v=>{b.signal.aborted||o(v instanceof Error?v.message:"Unable to inspect container")}),()=>b.abort()},[e.id]);const j=d.useMemo(()=>{const b=r?.restart_policy.Name;return typeof b=="string"&&b?b:"none"},[r]),y=async b=>{w(b);try{let v=c;if(!v){const p=await op(e.id,!0);v=new Map(p.environment.map(x=>[x.key,x.value??""])),u(v)}m(p=>new Set(p).add(b))}catch(v){o(v instanceof Error?v.message:"Unable to reveal variable")}finally{w(null)}};return n.jsx(ze,{onClose:t,children:n.jsxs(Q,{"aria-labelledby":"v2-container-detail-title","aria-modal":"true",className:"flex max-h-[92vh] w-full max-w-4xl flex-col overflow-hidden",id:"v2-container-detail",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsxs("div",{children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(ge,{id:"v2-container-detail-title",children:e.name}),n.jsx(fe,{label:e.status,tone:e.status==="running"?"success":"neutral"})]}),n.jsx("p",{className:"mt-1 font-mono text-xs text-muted-foreground",children:e.id})]}),n.jsx(_,{"aria-label":"Close container details",onClick:t,variant:"outline",children:n.jsx(We,{"aria-hidden":"true",className:"h-4 w-4"})})]}),n.jsxs(K,{className:"space-y-5 overflow-auto p-4 sm:p-5",children:[l?n.jsx("p",{className:"text-sm text-danger",role:"alert",children:l}):null,r?n.jsxs(n.Fragment,{children:[n.jsx("dl",{className:"grid gap-3 rounded-lg border border-border bg-muted/20 p-4 text-sm sm:grid-cols-2 lg:grid-cols-3",children:[["Image",r.image],["Stack",r.stack??"Standalone"],["Uptime",R1(r.uptime_seconds)],["Restart",j],["Created",r.created??"Unknown"],["Started",r.started_at??"Not running"]].map(([b,v])=>n.jsxs("div",{className:"min-w-0",children:[n.jsx("dt",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:b}),n.jsx("dd",{className:"break-words font-mono text-xs",children:v})]},b))}),n.jsxs("section",{className:"space-y-2",children:[n.jsx("h3",{className:"text-sm font-semibold",children:"Healthcheck"}),n.jsxs("div",{className:"rounded-lg border border-border bg-[#080b0f] p-3",children:[n.jsxs("div",{className:"mb-2 flex items-center gap-2 text-sm",children:[n.jsx("span",{className:`h-2.5 w-2.5 rounded-full ${a?.status==="healthy"?"bg-success":a?.status==="unhealthy"?"bg-danger":"bg-muted-foreground"}`}),a?.status||"none"," · failing streak ",a?.failing_streak??0]}),n.jsx("pre",{className:"max-h-40 overflow-auto whitespace-pre-wrap break-words text-xs text-muted-foreground",children:a?.last_output||"No healthcheck output."})]})]}),n.jsxs("section",{className:"space-y-2",children:[n.jsx("h3",{className:"text-sm font-semibold",children:"Mounts"}),n.jsx("div",{className:"space-y-2",children:r.mounts.length?r.mounts.map((b,v)=>n.jsxs("div",{className:"break-all rounded-md border border-border p-2 font-mono text-xs",children:[b.source||b.type," → ",b.destination," (",b.rw?"rw":"ro",")"]},`${b.destination}-${v}`)):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No mounts."})})]}),n.jsxs("section",{className:"space-y-2",children:[n.jsx("h3",{className:"text-sm font-semibold",children:"Networks"}),n.jsx("div",{className:"grid gap-2 sm:grid-cols-2",children:r.networks.map(b=>n.jsxs("div",{className:"rounded-md border border-border p-3 text-xs",children:[n.jsx("p",{className:"font-semibold",children:b.name}),n.jsx("p",{className:"font-mono text-muted-foreground",children:b.ip_address||"No IP"})]},b.name))})]}),n.jsxs("section",{className:"space-y-2",children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(Ua,{"aria-hidden":"true",className:"h-4 w-4 text-warning"}),n.jsx("h3",{className:"text-sm font-semibold",children:"Environment keys"})]}),n.jsx("div",{className:"space-y-2",children:r.environment.map(({key:b})=>n.jsxs("div",{className:"flex min-h-11 flex-wrap items-center justify-between gap-2 rounded-md border border-border px-3",children:[n.jsxs("code",{className:"break-all text-xs",children:[b,h.has(b)?`=${c?.get(b)??""}`:""]}),h.has(b)?null:n.jsxs(_,{className:"gap-1",disabled:f===b,onClick:()=>void y(b),size:"sm",variant:"outline",children:[n.jsx(ru,{"aria-hidden":"true",className:"h-3.5 w-3.5"})," Reveal"]})]},b))})]})]}):n.jsxs("p",{className:"flex items-center gap-2 text-sm text-muted-foreground",children:[n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"})," Loading details..."]})]})]})})}const T1=[100,200,500,1e3];function fg({title:e,description:t,filename:r,idPrefix:s,closeId:a,onClose:i,load:l}){const[o,c]=d.useState(200),[u,h]=d.useState(""),[m,f]=d.useState(!0),[w,j]=d.useState(null),[y,b]=d.useState(!1),v=d.useCallback(async()=>{f(!0),j(null);try{h(await l(o)||"No logs available.")}catch(x){j(x instanceof Error?x.message:"Failed to load logs")}finally{f(!1)}},[l,o]);d.useEffect(()=>{v()},[v]),d.useEffect(()=>{if(!y)return;const x=window.setInterval(()=>void v(),5e3);return()=>window.clearInterval(x)},[y,v]);const p=()=>{const x=URL.createObjectURL(new Blob([u],{type:"text/plain;charset=utf-8"})),g=document.createElement("a");g.href=x,g.download=r,g.click(),URL.revokeObjectURL(x)};return n.jsx(ze,{onClose:i,children:n.jsxs(Q,{"aria-labelledby":`${s}-title`,"aria-modal":"true",className:"flex max-h-[92vh] w-full max-w-5xl flex-col overflow-hidden",id:`${s}-modal`,role:"dialog",children:[n.jsxs(xe,{className:"space-y-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsxs("div",{className:"flex flex-wrap items-start justify-between gap-3",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsx(ge,{id:`${s}-title`,children:e}),n.jsx(we,{children:t})]}),n.jsx(_,{id:a??`${s}-close`,onClick:i,variant:"outline",children:"Close"})]}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsxs("label",{className:"flex min-h-11 items-center gap-2 text-xs text-muted-foreground",children:["Tail",n.jsx("select",{className:"min-h-11 rounded-md border border-border bg-background px-3 text-foreground",id:`${s}-tail`,onChange:x=>c(Number(x.target.value)),value:o,children:T1.map(x=>n.jsx("option",{value:x,children:x},x))})]}),n.jsxs(_,{className:"gap-2",disabled:m,onClick:()=>void v(),variant:"outline",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",m&&"animate-spin")}),"Refresh"]}),n.jsxs(_,{"aria-pressed":y,onClick:()=>b(x=>!x),variant:y?"success":"outline",children:["Auto-refresh ",y?"on":"off"]}),n.jsxs(_,{className:"gap-2",disabled:!u,onClick:p,variant:"outline",children:[n.jsx(Oa,{"aria-hidden":"true",className:"h-4 w-4"}),"Download"]})]})]}),n.jsx(K,{className:"overflow-auto p-4",children:n.jsx("pre",{"aria-live":"polite",className:"min-h-48 whitespace-pre-wrap break-words rounded-lg border border-border/70 bg-[#080b0f] p-3 font-mono text-xs text-foreground sm:text-sm",id:`${s}-content`,children:m&&!u?"Loading logs...":w||u||"No logs available."})})]})})}function Ba({label:e,items:t,disabled:r=!1,pending:s=!1,triggerData:a,menuData:i}){const[l,o]=d.useState(!1),[c,u]=d.useState({left:0,top:0}),h=d.useRef(null),m=d.useRef(null),f=d.useRef(null),w=d.useCallback(()=>{const j=f.current;if(!j)return;const y=j.getBoundingClientRect(),b=192,v=m.current?.offsetHeight??142,p=y.bottom+8;u({left:Math.min(window.innerWidth-b-8,Math.max(8,y.right-b)),top:p+v<=window.innerHeight-8?p:Math.max(8,y.top-v-8)})},[]);return d.useLayoutEffect(()=>{l&&(w(),m.current?.querySelector("[role='menuitem']")?.focus())},[l,w]),d.useEffect(()=>{if(!l)return;const j=b=>{const v=b.target;!h.current?.contains(v)&&!m.current?.contains(v)&&o(!1)},y=b=>{b.key==="Escape"&&(o(!1),f.current?.focus())};return document.addEventListener("pointerdown",j),document.addEventListener("keydown",y),window.addEventListener("resize",w),window.addEventListener("scroll",w,!0),()=>{document.removeEventListener("pointerdown",j),document.removeEventListener("keydown",y),window.removeEventListener("resize",w),window.removeEventListener("scroll",w,!0)}},[l,w]),n.jsxs("div",{className:"relative",ref:h,children:[n.jsx(_,{...a,"aria-expanded":l,"aria-haspopup":"menu","aria-label":e,className:"h-9 min-h-9 w-9 px-0",disabled:r,onClick:()=>o(j=>!j),onKeyDown:j=>{j.key==="ArrowDown"&&(j.preventDefault(),o(!0))},ref:f,size:"sm",title:e,variant:"outline",children:s?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(Bw,{"aria-hidden":"true",className:"h-4 w-4"})}),l?wx.createPortal(n.jsx("div",{...i,"aria-label":e,className:"fixed z-50 w-48 overflow-hidden rounded-md border border-border bg-card p-1 shadow-xl shadow-black/30",onBlur:j=>{const y=j.relatedTarget;y&&(m.current?.contains(y)||f.current?.contains(y))||o(!1)},onKeyDown:j=>{if(j.key!=="ArrowDown"&&j.key!=="ArrowUp")return;j.preventDefault();const y=Array.from(m.current?.querySelectorAll("[role='menuitem']:not(:disabled)")??[]),b=y.indexOf(document.activeElement),v=j.key==="ArrowDown"?1:-1;y[(b+v+y.length)%y.length]?.focus()},ref:m,role:"menu",style:{left:c.left,top:c.top},children:t.map(j=>n.jsxs("div",{children:[j.separatorBefore?n.jsx("div",{className:"my-1 border-t border-divider",role:"separator"}):null,n.jsxs("button",{...j.data,className:q("flex min-h-10 w-full items-center gap-2 rounded-sm px-3 text-left text-sm hover:bg-muted focus-visible:bg-muted focus-visible:outline-none disabled:cursor-not-allowed disabled:opacity-50",j.tone==="info"?"text-info":j.tone==="danger"?"text-danger":"text-foreground"),disabled:j.disabled,onClick:()=>{o(!1),f.current?.focus(),j.onSelect()},role:"menuitem",type:"button",children:[n.jsx(j.Icon,{"aria-hidden":"true",className:q("h-4 w-4",j.tone?"":"text-muted-foreground")}),j.label]})]},j.id))}),document.body):null]})}const hg={start:{label:"Start",pendingLabel:"Starting...",className:"border-success/30 bg-success/10 text-success hover:bg-success/15"},stop:{label:"Stop",pendingLabel:"Stopping...",className:"border-danger/30 bg-danger/10 text-danger hover:bg-danger/15"},restart:{label:"Restart",pendingLabel:"Restarting...",className:"border-warning/30 bg-warning/10 text-warning hover:bg-warning/15"},check_update:{label:"Check Update",pendingLabel:"Checking...",className:"border-border text-muted-foreground hover:bg-muted"},update:{label:"Update",pendingLabel:"Updating...",className:"border-info/30 bg-info/10 text-info hover:bg-info/15"}};function cp(e){return e==="running"?"success":e==="stopped"||e==="exited"?"danger":e==="unavailable"?"warning":"neutral"}function $1(e){return e===null?"text-muted-foreground":e<50?"text-success":e<80?"text-warning":"text-danger"}function I1(e){return e===null?"bg-dim":e<50?"bg-success":e<80?"bg-warning":"bg-danger"}function L1(e){return e==="unavailable"||e==="error"}function dp(e){if(!(e.memory_used===null&&e.memory_limit===null))return`${Pe(e.memory_used)} / ${Pe(e.memory_limit)}`}function fi({percent:e,detail:t}){const r=e===null?0:Math.max(0,Math.min(e,100));return n.jsxs("div",{className:"min-w-0 space-y-1",children:[n.jsx("p",{className:q("text-sm font-medium",$1(e)),children:_t(e)}),t?n.jsx("p",{className:"text-xs text-muted-foreground",children:t}):null,n.jsx("div",{className:"h-1.5 rounded-full bg-muted",children:n.jsx("div",{className:q("h-1.5 rounded-full transition-[width] duration-300",I1(e)),style:{width:`${r}%`}})})]})}function up({rate:e,rx:t,tx:r}){const s=!!(e&&(e.rxRate!==null||e.txRate!==null)),a=s?pl(e?.rxRate):Pe(t),i=s?pl(e?.txRate):Pe(r);return n.jsxs("div",{className:"space-y-1 text-xs",children:[n.jsxs("p",{className:"text-sky-300",children:[n.jsx("span",{"aria-hidden":"true",children:"↓ "}),n.jsx("span",{className:"sr-only",children:s?"Download rate ":"Received "}),a]}),n.jsxs("p",{className:"text-emerald-300",children:[n.jsx("span",{"aria-hidden":"true",children:"↑ "}),n.jsx("span",{className:"sr-only",children:s?"Upload rate ":"Sent "}),i]})]})}function mp({role:e}){return e.kind==="provider"?n.jsx("span",{className:"shrink-0 rounded-full bg-sky-500/15 px-2 py-0.5 text-[0.65rem] font-medium text-sky-300","data-vpn-role":"provider",title:"VPN network provider for one or more containers",children:"VPN provider"}):e.kind==="orphaned"?n.jsx("a",{className:"inline-flex shrink-0 items-center gap-0.5 rounded-full bg-danger/15 px-2 py-0.5 text-[0.65rem] font-medium text-danger hover:underline","data-vpn-role":"orphaned",href:"/v2/network",title:`Orphaned from ${e.provider} — recreate the network group`,children:"⚠ orphaned"}):n.jsxs("span",{className:"shrink-0 rounded-full bg-muted px-2 py-0.5 text-[0.65rem] text-muted-foreground","data-vpn-role":"member",title:`Routed via ${e.provider}`,children:["via ",e.provider]})}const z1={start:Hl,stop:qx,restart:lu};function O1(e){return e.status==="running"?["stop","restart"]:["start"]}function pp({container:e,pendingAction:t,align:r,onAction:s,onOpenLogs:a,onOpenNetworkTest:i}){const o=!!t||L1(e.status);return n.jsxs("div",{className:q("flex items-center gap-1.5",r==="end"?"justify-end":"justify-start"),children:[O1(e).map(c=>{const u=hg[c],h=z1[c];return n.jsx(_,{"aria-label":`${u.label} ${e.name}`,className:q("h-9 min-h-9 w-9 px-0",u.className),"data-action":c,"data-container-id":e.id,disabled:o,onClick:()=>s(e,c),size:"sm",title:`${u.label} ${e.name}`,variant:"outline",children:t===c?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(h,{"aria-hidden":"true",className:"h-4 w-4"})},c)}),n.jsx(_,{"aria-label":`Logs ${e.name}`,className:"h-9 min-h-9 w-9 px-0","data-container-id":e.id,"data-diagnostic-action":"logs",disabled:o,onClick:()=>a(e),size:"sm",title:`Logs ${e.name}`,variant:"outline",children:n.jsx(Bl,{"aria-hidden":"true",className:"h-4 w-4"})}),n.jsx(D1,{container:e,disabled:o,onAction:s,onOpenNetworkTest:i,pendingAction:t})]})}function D1({container:e,disabled:t,pendingAction:r,onAction:s,onOpenNetworkTest:a}){return n.jsx(Ba,{disabled:t,items:[{id:"check-update",label:"Check update",Icon:je,onSelect:()=>s(e,"check_update"),data:{"data-action":"check_update","data-container-id":e.id}},{id:"update",label:"Update image",Icon:kw,onSelect:()=>s(e,"update"),tone:"info",data:{"data-action":"update","data-container-id":e.id}},{id:"network-test",label:"Network test",Icon:ou,onSelect:()=>a(e),separatorBefore:!0,data:{"data-container-id":e.id,"data-diagnostic-action":"network-test"}}],label:`More actions for ${e.name}`,menuData:{"data-container-actions-menu":e.id},pending:r==="check_update"||r==="update",triggerData:{"data-container-menu":e.id}})}function fp({container:e}){const t=P1(e);return t?n.jsx("a",{"aria-label":`Open ${e.name} web UI in a new tab`,className:"inline-flex h-8 w-8 shrink-0 items-center justify-center rounded-md text-muted-foreground hover:bg-muted hover:text-primary focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring",href:t,rel:"noopener noreferrer",target:"_blank",title:`Open ${e.name} web UI`,children:n.jsx(ys,{"aria-hidden":"true",className:"h-4 w-4"})}):null}function hp(e){const{containers:t,networkRates:r,pendingActions:s,vpnRoles:a,onAction:i,onOpenLogs:l,onOpenDetails:o,onOpenNetworkTest:c}=e;return n.jsxs(n.Fragment,{children:[n.jsx("div",{className:"hidden xl:block",children:n.jsx("div",{className:"overflow-x-auto rounded-lg border border-border bg-card",children:n.jsxs("table",{className:"min-w-full divide-y divide-divider text-sm",children:[n.jsx("thead",{className:"bg-[#0e131a]",children:n.jsx("tr",{children:["Container","Image","Status","CPU","Memory","Network","Actions"].map(u=>n.jsx("th",{className:q("px-4 py-3 font-mono text-[10px] font-medium uppercase tracking-[0.12em] text-dim",u==="Actions"?"text-right":"text-left"),children:u},u))})}),n.jsx("tbody",{className:"divide-y divide-divider",children:t.map(u=>{const h=s[u.id];return n.jsxs("tr",{children:[n.jsx("td",{className:"px-4 py-3",children:n.jsxs("div",{className:"flex min-w-0 items-center gap-2",children:[n.jsx("button",{className:"truncate font-medium text-primary hover:underline",onClick:()=>o(u),children:u.name}),n.jsx(fp,{container:u}),u.health?n.jsx("span",{"aria-label":`Health ${u.health}`,className:q("h-2.5 w-2.5 shrink-0 rounded-full",u.health==="healthy"?"bg-success":u.health==="unhealthy"?"bg-danger":"bg-warning"),title:`Health: ${u.health}`}):null,u.update_available?n.jsx("span",{"aria-label":"Update available",className:"inline-flex text-amber-300",role:"img",title:"Update available",children:n.jsx(je,{"aria-hidden":"true",className:"h-3.5 w-3.5"})}):null,a?.[u.name]?n.jsx(mp,{role:a[u.name]}):null]})}),n.jsx("td",{className:"max-w-[20rem] px-4 py-3 text-muted-foreground",children:n.jsx("span",{className:"line-clamp-2 break-all",children:u.image})}),n.jsx("td",{className:"px-4 py-3",children:n.jsx(fe,{label:u.status,tone:cp(u.status)})}),n.jsx("td",{className:"px-4 py-3",children:n.jsx(fi,{percent:u.cpu_percent})}),n.jsx("td",{className:"px-4 py-3",children:n.jsx(fi,{detail:dp(u),percent:u.memory_percent})}),n.jsx("td",{className:"px-4 py-3",children:n.jsx(up,{rate:r[u.id],rx:u.net_rx,tx:u.net_tx})}),n.jsx("td",{className:"w-[11rem] px-4 py-3 text-right",children:n.jsx(pp,{align:"end",container:u,onAction:i,onOpenLogs:l,onOpenNetworkTest:c,pendingAction:h})})]},u.id)})})]})})}),n.jsx("div",{className:"grid gap-3 xl:hidden",children:t.map(u=>{const h=s[u.id];return n.jsx(Q,{className:"overflow-hidden",children:n.jsxs(K,{className:"space-y-3 p-4",children:[n.jsxs("div",{className:"flex items-start justify-between gap-3",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsxs("div",{className:"flex min-w-0 items-center gap-1",children:[n.jsx("button",{className:"truncate text-left text-sm font-semibold text-primary hover:underline",onClick:()=>o(u),children:u.name}),n.jsx(fp,{container:u})]}),n.jsx("p",{className:"line-clamp-2 break-all text-xs text-muted-foreground",children:u.image}),a?.[u.name]?n.jsx("div",{className:"pt-1",children:n.jsx(mp,{role:a[u.name]})}):null]}),n.jsx(fe,{className:"shrink-0",label:u.status,tone:cp(u.status)})]}),n.jsxs("div",{className:"grid gap-2 text-xs sm:grid-cols-2",children:[n.jsxs("div",{className:"space-y-1 rounded-md border border-border bg-muted/20 p-2",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"CPU"}),n.jsx(fi,{percent:u.cpu_percent})]}),n.jsxs("div",{className:"space-y-1 rounded-md border border-border bg-muted/20 p-2",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Memory"}),n.jsx(fi,{detail:dp(u),percent:u.memory_percent})]})]}),n.jsxs("div",{className:"grid gap-1 rounded-md border border-border bg-muted/20 p-2 text-xs",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Network"}),n.jsx(up,{rate:r[u.id],rx:u.net_rx,tx:u.net_tx})]}),n.jsx(pp,{align:"start",container:u,onAction:i,onOpenLogs:l,onOpenNetworkTest:c,pendingAction:h})]})},u.id)})})]})}async function xg(e){const t=await W("/api/network-groups",{method:"GET",signal:e}),r=Array.isArray(t.groups)?t.groups.map(s=>({provider:String(s.provider??""),provider_status:String(s.provider_status??"unknown"),provider_health:ce(s.provider_health),members:Array.isArray(s.members)?s.members.map(a=>String(a)):[],member_count:Number(s.member_count??0),orphaned_members:Array.isArray(s.orphaned_members)?s.orphaned_members.map(a=>String(a)):[],status:String(s.status??"ok")})):[];return{docker_available:!!t.docker_available,groups:r}}async function gg(e,t){const r=await W(`/api/network-groups/${encodeURIComponent(e)}/recreate`,{method:"POST",signal:t});if(r.error)throw new Error(r.error)}async function U1(e){const t=await fetch("/api/tailscale/status",{method:"GET",credentials:"same-origin",headers:{Accept:"application/json"},signal:e});if(!t.ok)return{available:!1,data:null};const r=await t.json().catch(()=>null);return!r||r.error?{available:!1,data:r}:{available:!0,data:r}}async function B1(e){const t=await W("/api/tailscale/logout",{method:"POST",signal:e});if(t.error)throw new Error(t.error)}const F1=1e4,xp="pihealth.containers.groupByStack",V1=[{key:"all",label:"All"},{key:"running",label:"Running"},{key:"stopped",label:"Stopped"}];function Us(e){return e instanceof Error&&e.message?e.message:"Unable to load containers"}function q1(e){return e==="success"?"border-success/30 text-success":e==="error"?"border-danger/30 text-danger":"border-info/30 text-info"}function H1(e,t,r){if(t==="check_update")return typeof r.update_available=="boolean"?r.update_available?`${e}: update available`:`${e}: up to date`:r.status||`${e}: update check complete`;if(t==="update")return r.status||`${e}: update triggered`;const s=t==="start"?"started":t==="stop"?"stopped":"restarted";return r.status||`${e} ${s} successfully`}function Ur(e){return e&&e.trim().length>0?e:"Unavailable"}function gp(e,t){return e==="loading"?{label:"Running test...",className:"text-sky-300"}:e==="error"?{label:"Error",className:"text-rose-300"}:t===null?{label:"Idle",className:"text-muted-foreground"}:t?{label:"Success",className:"text-emerald-300"}:{label:"Failed",className:"text-amber-300"}}function W1(){const[e,t]=d.useState([]),[r,s]=d.useState({}),[a,i]=d.useState("all"),[l,o]=d.useState(!0),[c,u]=d.useState(!1),[h,m]=d.useState(null),[f,w]=d.useState("Never"),[j,y]=d.useState(null),[b,v]=d.useState({}),[p,x]=d.useState(null),[g,N]=d.useState(null),[E,C]=d.useState([]),[k,O]=d.useState(()=>typeof localStorage>"u"?!1:localStorage.getItem(xp)==="true"),[S,$]=d.useState({open:!1,status:"idle",containerId:null,containerName:"",result:null,error:null}),[R,H]=d.useState({visible:!1,status:"idle",result:null,error:null}),I=d.useRef(!0),U=d.useRef({}),L=d.useRef([]),B=d.useRef({}),[P,M]=d.useState(null),[A,F]=d.useState(null),D=d.useRef(!1),G=d.useCallback(T=>{L.current=T,t(T)},[]),se=d.useCallback((T,Y)=>{v(re=>{const he={...re};return Y?he[T]=Y:delete he[T],U.current=he,he})},[]),de=d.useCallback(async T=>{T==="initial"&&o(!0),T==="manual"&&u(!0);try{const Y=await mg({includeStats:!1});if(!I.current)return null;const re=new Map(L.current.map(_e=>[_e.id,_e])),he=Y.map(_e=>{const ye=re.get(_e.id);return!ye||_e.status!=="running"?_e:{..._e,cpu_percent:ye.cpu_percent,memory_percent:ye.memory_percent,memory_used:ye.memory_used,memory_limit:ye.memory_limit,net_rx:ye.net_rx,net_tx:ye.net_tx,net_rx_rate:ye.net_rx_rate,net_tx_rate:ye.net_tx_rate,block_read_rate:ye.block_read_rate,block_write_rate:ye.block_write_rate}});return G(he),m(null),w(Bt(new Date)),he}catch(Y){return I.current&&m(Us(Y)),null}finally{I.current&&(T==="initial"&&o(!1),T==="manual"&&u(!1))}},[G]),ue=d.useCallback(async T=>{const Y=T.filter(re=>re.status==="running").map(re=>re.id);if(!(!Y.length||D.current)){D.current=!0;try{const re=await _1(Y);if(!I.current)return;const he={};for(const[ye,Ze]of Object.entries(re))(Ze.net_rx_rate!==null||Ze.net_tx_rate!==null)&&(he[ye]={rxRate:Ze.net_rx_rate,txRate:Ze.net_tx_rate});s(he);const _e=L.current.map(ye=>{const Ze=re[ye.id];return Ze?{...ye,...Ze}:ye});G(_e)}catch{}finally{D.current=!1}}},[G]),Ce=d.useCallback(async(T,Y)=>{if(U.current[T.id])return;if(Y==="update"&&B.current[T.name]?.kind==="provider"){M(T);return}const re=hg[Y];se(T.id,Y),y({tone:"info",message:`${re.pendingLabel.replace("...","")} ${T.name}...`});try{const he=await To(T.id,Y);I.current&&y({tone:"success",message:H1(T.name,Y,he)})}catch(he){I.current&&y({tone:"error",message:`${re.label} failed for ${T.name}: ${Us(he)}`})}finally{const he=await de("action");he&&await ue(he),I.current&&se(T.id,null)}},[de,ue,se]),Re=d.useCallback(async(T,Y)=>{M(null),se(T.id,"update"),y({tone:"info",message:`Updating ${T.name}...`});try{await To(T.id,"update"),Y&&await gg(T.name),I.current&&y({tone:"success",message:Y?`Updated ${T.name} and recreated its network group`:`Updated ${T.name} (members may need a manual group recreate)`})}catch(re){I.current&&y({tone:"error",message:`Provider update failed for ${T.name}: ${Us(re)}`})}finally{const re=await de("action");re&&await ue(re),I.current&&se(T.id,null)}},[de,ue,se]),pe=d.useCallback(async()=>{const T=L.current.filter(ye=>ye.status==="running");if(!T.length){y({tone:"info",message:"No running containers to check."});return}F({done:0,total:T.length});const Y=[];let re=0,he=0;const _e=async()=>{for(;re<T.length;){const ye=T[re++];try{(await To(ye.id,"check_update")).update_available&&Y.push(ye.name)}catch{}he+=1,I.current&&F({done:he,total:T.length})}};if(await Promise.all([_e(),_e(),_e()]),I.current){F(null),y({tone:Y.length?"info":"success",message:Y.length?`Updates available (${Y.length}): ${Y.join(", ")}`:"All running containers are up to date."});const ye=await de("action");ye&&await ue(ye)}},[de,ue]),Ft=d.useCallback(()=>{x(null)},[]),kt=d.useCallback(()=>{$(T=>({...T,open:!1}))},[]),rt=d.useCallback(T=>{x(T)},[]),vt=d.useCallback(async T=>{$({open:!0,status:"loading",containerId:T.id,containerName:T.name,result:null,error:null});try{const Y=await S1(T.id);if(!I.current)return;$({open:!0,status:"ready",containerId:T.id,containerName:Y.container_name||T.name,result:Y,error:null})}catch(Y){if(!I.current)return;$({open:!0,status:"error",containerId:T.id,containerName:T.name,result:null,error:Us(Y)})}},[]),Xe=d.useCallback(async()=>{H(T=>({...T,visible:!0,status:"loading",result:null,error:null}));try{const T=await pg();if(!I.current)return;H({visible:!0,status:"ready",result:T,error:null})}catch(T){if(!I.current)return;H({visible:!0,status:"error",result:null,error:Us(T)})}},[]),qe=d.useCallback(async T=>{const Y=await de(T);Y&&await ue(Y)},[de,ue]);d.useEffect(()=>{I.current=!0,qe("initial");const T=window.setInterval(()=>{qe("poll")},F1);return()=>{I.current=!1,window.clearInterval(T)}},[qe]),d.useEffect(()=>{if(!j||j.tone==="error")return;const T=window.setTimeout(()=>{y(null)},4500);return()=>{window.clearTimeout(T)}},[j]);const Ge=d.useMemo(()=>E1(e,a),[e,a]),Xt=d.useMemo(()=>b1(e),[e]);d.useEffect(()=>{const T=new AbortController;return xg(T.signal).then(Y=>C(Y.groups)).catch(()=>{}),()=>T.abort()},[]),d.useEffect(()=>{typeof localStorage<"u"&&localStorage.setItem(xp,k?"true":"false")},[k]);const Fe=d.useMemo(()=>{const T={};for(const Y of E){Y.provider&&(T[Y.provider]={kind:"provider",provider:Y.provider});for(const re of Y.members)T[re]={kind:"member",provider:Y.provider};for(const re of Y.orphaned_members)T[re]={kind:"orphaned",provider:Y.provider}}return T},[E]);d.useEffect(()=>{B.current=Fe},[Fe]);const V=d.useMemo(()=>{if(!k)return null;const T=new Map;for(const Y of Ge){const re=Y.stack??"Standalone",he=T.get(re)??[];he.push(Y),T.set(re,he)}return[...T.entries()].sort(([Y],[re])=>Y==="Standalone"?1:re==="Standalone"?-1:Y.localeCompare(re))},[k,Ge]),te=gp(R.status,R.result?R.result.ping_success:null),z=gp(S.status,S.result?S.result.ping_success:null);return n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(n.Fragment,{children:[n.jsxs(_,{className:"gap-2","data-check-all-updates":!0,disabled:A!==null||Object.keys(b).length>0,onClick:()=>void pe(),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",A!==null?"animate-spin":"")}),A!==null?`checking ${A.done}/${A.total}`:"check all"]}),n.jsxs(_,{className:"gap-2",id:"v2-host-network-test-button",onClick:()=>void Xe(),variant:"secondary",children:[R.status==="loading"?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(ou,{"aria-hidden":"true",className:"h-4 w-4"}),"network test"]}),n.jsxs(_,{className:"gap-2",disabled:c,onClick:()=>void qe("manual"),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",c?"animate-spin":"")}),c?"refreshing":"refresh"]})]}),description:`docker · ${e.length} containers · synced ${f}`,status:n.jsx(fe,{label:`${e.filter(T=>T.status==="running").length} running`,tone:"success"}),title:"docker_containers"}),n.jsxs("div",{"aria-label":"Container filters",className:"flex flex-wrap items-center gap-2",role:"group",children:[V1.map(T=>n.jsx(_,{"aria-pressed":a===T.key,onClick:()=>i(T.key),size:"sm",variant:a===T.key?"default":"outline",children:T.label},T.key)),e.some(T=>T.update_available)?n.jsxs(_,{"aria-pressed":a==="updates","data-filter":"updates",onClick:()=>i("updates"),size:"sm",variant:a==="updates"?"default":"outline",children:["Updates (",e.filter(T=>T.update_available).length,")"]}):null,n.jsx(_,{"aria-pressed":k,className:"ml-auto","data-group-by-stack":!0,onClick:()=>O(T=>!T),size:"sm",variant:k?"default":"outline",children:"Group by stack"})]}),R.visible?n.jsxs(Q,{className:"border-sky-500/30",id:"v2-host-network-panel",children:[n.jsx(xe,{className:"space-y-3",children:n.jsxs("div",{className:"flex flex-wrap items-start justify-between gap-2",children:[n.jsxs("div",{children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"Host Network Diagnostics"}),n.jsx(we,{children:"Runs a direct host probe against public network endpoints."})]}),n.jsx(_,{id:"v2-host-network-hide",onClick:()=>H(T=>({...T,visible:!1})),variant:"outline",children:"Hide"})]})}),n.jsxs(K,{className:"space-y-3",children:[n.jsxs("div",{className:"grid gap-2 rounded-lg border border-border/70 bg-muted/30 p-3 text-sm sm:grid-cols-3",children:[n.jsxs("div",{children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Status"}),n.jsx("p",{className:q("font-medium",te.className),id:"v2-host-network-status",children:te.label})]}),n.jsxs("div",{children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Local IP"}),n.jsx("p",{className:"break-words font-mono text-xs sm:text-sm",children:Ur(R.result?.local_ip??null)})]}),n.jsxs("div",{children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Public IP"}),n.jsx("p",{className:"break-words font-mono text-xs sm:text-sm",children:Ur(R.result?.public_ip??null)})]})]}),n.jsxs("div",{className:"grid gap-2 rounded-lg border border-border/70 bg-muted/30 p-3 text-sm",children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Probe Method"}),n.jsx("p",{className:"font-mono text-xs sm:text-sm",children:Ur(R.result?.probe_method??null)})]}),n.jsxs("div",{className:"rounded-lg border border-border/70 bg-muted/20 p-3",children:[n.jsx("p",{className:"mb-2 text-xs uppercase tracking-wide text-muted-foreground",children:"Output"}),n.jsx("pre",{className:"max-h-[16rem] overflow-auto whitespace-pre-wrap break-words text-xs sm:text-sm",id:"v2-host-network-output",children:R.status==="loading"?"Running test...":R.status==="error"?R.error||"Host diagnostics failed":R.result?.ping_output||"No output provided."})]})]})]}):null,j?n.jsx(Q,{"aria-live":j.tone==="error"?"assertive":"polite",className:q1(j.tone),role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm",children:[j.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):j.tone==="info"?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),j.message]})}):null,h&&!e.length?n.jsx(Q,{className:"border-rose-500/40",children:n.jsxs(K,{className:"flex flex-col items-start gap-3 p-4 sm:p-6",children:[n.jsxs("div",{className:"flex items-center gap-2 text-rose-300",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),n.jsx("p",{className:"text-sm font-medium",children:"Unable to load containers"})]}),n.jsx("p",{className:"text-sm text-muted-foreground",children:h}),n.jsx(_,{onClick:()=>void qe("manual"),variant:"outline",children:"Retry"})]})}):null,h&&e.length?n.jsx(Q,{className:"border-amber-500/40",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm text-amber-300",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Refresh failed: ",h]})}):null,Xt?n.jsxs("div",{className:"flex items-start gap-3 border-l-2 border-warning/60 bg-warning/[0.04] px-4 py-3 text-sm",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-warning"}),n.jsxs("p",{className:"text-muted-foreground",children:[n.jsx("span",{className:"font-medium text-warning",children:"Container memory is not accounted for on this host."})," ","The kernel was booted without the memory cgroup, so Docker reports no usage for any container. Add"," ",n.jsx("code",{className:"rounded bg-muted px-1 py-0.5 font-mono text-xs text-foreground",children:"cgroup_enable=memory cgroup_memory=1"})," ","to ",n.jsx("code",{className:"font-mono text-xs",children:"/boot/firmware/cmdline.txt"})," ","and reboot. CPU and network figures are unaffected."]})]}):null,l?n.jsx(Q,{"aria-live":"polite",role:"status",children:n.jsxs(K,{className:"flex min-h-[14rem] items-center justify-center gap-2 p-6 text-sm text-muted-foreground",children:[n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4 animate-pulse text-primary"}),"Loading containers..."]})}):null,!l&&!Ge.length?n.jsx(Q,{children:n.jsxs(K,{className:"flex min-h-[10rem] items-center justify-center p-6 text-sm text-muted-foreground",children:["No ",a," containers found."]})}):null,!l&&Ge.length?V?n.jsx("div",{className:"space-y-6",children:V.map(([T,Y])=>n.jsxs("section",{className:"space-y-2","data-stack-group":T,children:[n.jsxs("div",{className:"flex items-center gap-2",children:[T==="Standalone"?n.jsx("h3",{className:"text-sm font-semibold text-muted-foreground",children:"Standalone"}):n.jsx("a",{className:"text-sm font-semibold text-primary hover:underline",href:"/v2/stacks",children:T}),n.jsx("span",{className:"text-xs text-muted-foreground",children:Y.length})]}),n.jsx(hp,{containers:Y,networkRates:r,onAction:Ce,onOpenDetails:N,onOpenLogs:rt,onOpenNetworkTest:vt,pendingActions:b,vpnRoles:Fe})]},T))}):n.jsx(hp,{containers:Ge,networkRates:r,onAction:Ce,onOpenDetails:N,onOpenLogs:rt,onOpenNetworkTest:vt,pendingActions:b,vpnRoles:Fe}):null,p?n.jsx(fg,{closeId:"v2-logs-modal-close",description:"Container log snapshot with optional five-second refresh.",filename:`${p.name}.log`,idPrefix:"v2-logs",load:async T=>(await k1(p.id,T)).logs,onClose:Ft,title:`Container Logs: ${p.name}`}):null,g?n.jsx(M1,{container:g,onClose:()=>N(null)}):null,P?n.jsx(ze,{onClose:()=>M(null),children:n.jsxs(Q,{className:"w-full max-w-md","data-provider-update-modal":!0,children:[n.jsxs(xe,{children:[n.jsxs(ge,{className:"text-base",children:["Update ",P.name,"?"]}),n.jsxs(we,{children:[P.name," is a VPN network provider. Updating it recreates its container and orphans every member routed through it (",n.jsx("span",{className:"font-mono",children:"network_mode: service:"}),") until the group is recreated."]})]}),n.jsxs(K,{className:"flex flex-wrap gap-2",children:[n.jsx(_,{"data-provider-update-recreate":!0,onClick:()=>void Re(P,!0),children:"Update & recreate group"}),n.jsx(_,{onClick:()=>void Re(P,!1),variant:"outline",children:"Update only"}),n.jsx(_,{onClick:()=>M(null),variant:"ghost",children:"Cancel"})]})]})}):null,S.open?n.jsx(ze,{onClose:kt,children:n.jsxs(Q,{"aria-labelledby":"v2-container-network-modal-title","aria-modal":"true",className:"flex max-h-[90vh] w-full max-w-4xl flex-col overflow-hidden",id:"v2-container-network-modal",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsxs(ge,{id:"v2-container-network-modal-title",className:"text-base sm:text-lg",children:["Container Network Test: ",S.containerName]}),n.jsx(we,{children:"Probe result from `/api/containers/<id>/network-test`."})]}),n.jsx(_,{id:"v2-container-network-modal-close",onClick:kt,variant:"outline",children:"Close"})]}),n.jsxs(K,{className:"space-y-3 overflow-auto p-4",children:[n.jsxs("div",{className:"grid gap-2 rounded-lg border border-border/70 bg-muted/30 p-3 text-sm sm:grid-cols-3",children:[n.jsxs("div",{children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Status"}),n.jsx("p",{className:q("font-medium",z.className),id:"v2-container-network-status",children:z.label})]}),n.jsxs("div",{children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Local IP"}),n.jsx("p",{className:"break-words font-mono text-xs sm:text-sm",children:Ur(S.result?.local_ip??null)})]}),n.jsxs("div",{children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Public IP"}),n.jsx("p",{className:"break-words font-mono text-xs sm:text-sm",children:Ur(S.result?.public_ip??null)})]})]}),n.jsxs("div",{className:"grid gap-2 rounded-lg border border-border/70 bg-muted/30 p-3 text-sm",children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Probe Method"}),n.jsx("p",{className:"font-mono text-xs sm:text-sm",children:Ur(S.result?.probe_method??null)})]}),n.jsxs("div",{className:"rounded-lg border border-border/70 bg-muted/20 p-3",children:[n.jsx("p",{className:"mb-2 text-xs uppercase tracking-wide text-muted-foreground",children:"Output"}),n.jsx("pre",{className:"max-h-[16rem] overflow-auto whitespace-pre-wrap break-words text-xs sm:text-sm",id:"v2-container-network-output",children:S.status==="loading"?"Collecting diagnostics...":S.status==="error"?S.error||"Failed to run container network test":S.result?.ping_output||"No output provided."})]})]})]})}):null]})}function vg({percent:e,tone:t}){return n.jsx("div",{"aria-hidden":"true",className:"mt-2 h-1 overflow-hidden rounded-full bg-border",children:n.jsx("div",{className:q("h-full rounded-full transition-[width] duration-500",t),style:{width:`${Math.max(0,Math.min(e??0,100))}%`}})})}function G1({stream:e}){const t=e.is_paused?xN:Kc,r=[e.user,e.client||e.device].filter(Boolean).join(" · ");return n.jsx("li",{className:"min-w-0 border-t border-divider py-3 first:border-t-0 first:pt-0 last:pb-0",children:n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx(t,{"aria-hidden":"true",className:q("mt-0.5 h-4 w-4 shrink-0",e.is_paused?"text-muted-foreground":"text-success")}),n.jsxs("div",{className:"min-w-0 flex-1",children:[n.jsxs("div",{className:"flex min-w-0 items-baseline justify-between gap-2",children:[n.jsx("p",{className:"min-w-0 truncate text-sm text-foreground",title:e.title,children:e.title}),n.jsx("span",{className:"shrink-0 font-mono text-[10px] text-dim",children:_t(e.progress_percent,0)})]}),e.subtitle?n.jsx("p",{className:"truncate text-xs text-muted-foreground",children:e.subtitle}):null,n.jsxs("div",{className:"mt-1 flex flex-wrap items-center gap-1.5",children:[r?n.jsx("span",{className:"font-mono text-[10px] text-dim",children:r}):null,e.is_transcoding?n.jsx(ee,{tone:"warning",title:e.transcode_reason??"Transcoding uses far more CPU than direct play",children:"transcoding"}):e.play_method?n.jsx(ee,{tone:"success",children:e.play_method.toLowerCase()}):null,e.is_paused?n.jsx(ee,{tone:"neutral",children:"paused"}):null]}),n.jsx(vg,{percent:e.progress_percent,tone:e.is_paused?"bg-dim":"bg-success"}),e.duration_seconds?n.jsxs("p",{className:"mt-1 font-mono text-[10px] text-dim",children:[fl(e.position_seconds)," of"," ",fl(e.duration_seconds)]}):null]})]})})}function K1({download:e}){const t=(e.speed_bytes??0)>0;return n.jsxs("li",{className:"min-w-0 border-t border-divider py-3 first:border-t-0 first:pt-0 last:pb-0",children:[n.jsxs("div",{className:"flex min-w-0 items-baseline justify-between gap-2",children:[n.jsx("p",{className:"min-w-0 truncate text-sm text-foreground",title:e.name,children:e.name}),n.jsx("span",{className:"shrink-0 font-mono text-[10px] text-dim",children:_t(e.progress_percent,0)})]}),n.jsxs("div",{className:"mt-1 flex flex-wrap items-center gap-1.5",children:[n.jsx(ee,{tone:"neutral",children:e.label||e.source}),n.jsx(ee,{tone:t?"info":"neutral",children:e.state}),t?n.jsx("span",{className:"font-mono text-[10px] text-info",children:pl(e.speed_bytes)}):null,e.eta?n.jsxs("span",{className:"font-mono text-[10px] text-dim",children:[e.eta," left"]}):null,e.remaining_bytes!==null?n.jsxs("span",{className:"font-mono text-[10px] text-dim",children:[Pe(e.remaining_bytes)," of ",Pe(e.size_bytes)]}):null]}),n.jsx(vg,{percent:e.progress_percent,tone:t?"bg-info":"bg-dim"})]})}function Q1({queue:e}){return n.jsxs("li",{className:"flex min-w-0 items-center justify-between gap-3 border-t border-divider py-2.5 first:border-t-0 first:pt-0 last:pb-0",children:[n.jsxs("div",{className:"flex min-w-0 items-center gap-2",children:[n.jsx("span",{className:"truncate text-sm text-foreground",children:e.label||e.source}),e.problems>0?n.jsxs(ee,{tone:"warning",title:"Items in this queue need attention",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-3 w-3"}),e.problems]}):null]}),n.jsxs("span",{className:"shrink-0 font-mono text-xs text-muted-foreground",children:[e.total," queued"]})]})}function $o({title:e,icon:t,children:r}){return n.jsxs("div",{className:"min-w-0",children:[n.jsxs("div",{className:"mb-2 flex items-center gap-1.5",children:[n.jsx(t,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-dim"}),n.jsx("span",{className:"font-mono text-[11px] uppercase text-dim",children:e})]}),r]})}function J1({snapshot:e,error:t}){const r=e?.totals,s=(e?.services??[]).filter(i=>!i.reachable),a=e!==null&&r!==void 0&&r.streams===0&&r.downloads===0&&r.queued===0;return n.jsx(Q,{children:n.jsxs(K,{className:"p-4 sm:p-5",children:[n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-3",children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(Kc,{"aria-hidden":"true",className:"h-4 w-4 text-primary"}),n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"activity"})]}),n.jsx("div",{className:"flex flex-wrap items-center gap-1.5",children:r?n.jsxs(n.Fragment,{children:[n.jsxs(ee,{tone:r.streams>0?"success":"neutral",children:[r.streams," streaming"]}),r.transcodes>0?n.jsxs(ee,{tone:"warning",children:[r.transcodes," transcoding"]}):null,n.jsxs(ee,{tone:r.downloads>0?"info":"neutral",children:[r.downloads," downloading"]}),r.download_speed>0?n.jsx(ee,{tone:"info",children:pl(r.download_speed)}):null]}):null})]}),t?n.jsxs("p",{className:"mt-4 text-sm text-muted-foreground",children:[n.jsx("span",{className:"text-warning",children:"Activity unavailable:"})," ",t]}):null,!e&&!t?n.jsx("p",{className:"mt-4 text-sm text-muted-foreground",children:"Checking media services..."}):null,a?n.jsxs("div",{className:"mt-4 flex items-center gap-2 text-sm text-muted-foreground",children:[n.jsx(lt,{"aria-hidden":"true",className:"h-4 w-4 text-success"}),"Nothing streaming or downloading right now."]}):null,e&&!a?n.jsxs("div",{className:"mt-4 space-y-5",children:[e.streams.length?n.jsx($o,{icon:Kc,title:"now playing",children:n.jsx("ul",{children:e.streams.map(i=>n.jsx(G1,{stream:i},`${i.source}:${i.title}:${i.user}`))})}):null,e.downloads.length?n.jsx($o,{icon:Oa,title:"downloading",children:n.jsx("ul",{children:e.downloads.map(i=>n.jsx(K1,{download:i},`${i.source}:${i.name}`))})}):null,e.queues.some(i=>i.total>0)?n.jsx($o,{icon:aN,title:"queues",children:n.jsx("ul",{children:e.queues.filter(i=>i.total>0).map(i=>n.jsx(Q1,{queue:i},i.source))})}):null]}):null,s.length?n.jsxs("details",{className:"mt-4 border-t border-divider pt-3",children:[n.jsxs("summary",{className:"cursor-pointer font-mono text-[10px] uppercase text-dim hover:text-muted-foreground",children:[s.length," service",s.length===1?"":"s"," not reporting"]}),n.jsx("ul",{className:"mt-2 space-y-1",children:s.map(i=>n.jsxs("li",{className:"text-xs text-muted-foreground",children:[n.jsx("span",{className:"text-foreground",children:i.label||i.name}),i.detail?` — ${i.detail}`:null]},i.id||i.name))})]}):null]})})}const Y1=[{key:"cpu",label:"cpu"},{key:"memory",label:"memory"}];function X1(e){return e===null?"neutral":e>=3?"danger":e>=1.5?"warning":"success"}function Z1(e,t){return e===null||t<=0?0:Math.max(2,Math.min(100,e/t*100))}function ek({consumer:e,basis:t,peak:r}){const s=t==="cpu"?e.cpu_percent:e.memory_bytes,a=t==="cpu"?_t(e.cpu_percent):Pe(e.memory_bytes);return n.jsxs("li",{className:"min-w-0 py-2 first:pt-0 last:pb-0",children:[n.jsxs("div",{className:"flex min-w-0 items-baseline justify-between gap-3",children:[n.jsx("span",{className:"min-w-0 truncate text-sm text-foreground",title:e.name,children:e.name}),n.jsx("span",{className:"shrink-0 font-mono text-xs text-muted-foreground",children:a})]}),n.jsx("div",{className:"mt-1.5 h-1 overflow-hidden rounded-full bg-border",children:n.jsx("div",{className:q("h-full rounded-full transition-[width] duration-300",t==="cpu"?"bg-primary":"bg-info"),style:{width:`${Z1(s,r)}%`}})})]})}function vp({consumers:e,basis:t,emptyLabel:r}){if(!e.length)return n.jsx("p",{className:"py-3 text-sm text-muted-foreground",children:r});const s=e.reduce((a,i)=>{const l=t==="cpu"?i.cpu_percent:i.memory_bytes;return l!==null&&l>a?l:a},0);return n.jsx("ul",{className:"divide-y divide-divider",children:e.map(a=>n.jsx(ek,{basis:t,consumer:a,peak:s},a.id))})}function tk({pressure:e}){const[t,r]=d.useState("cpu"),s=t==="cpu"?e.containers.by_cpu:e.containers.by_memory,a=t==="cpu"?e.processes.by_cpu:e.processes.by_memory,i=e.load_average,l=e.containers.capabilities.memory!==!1;return n.jsx(Q,{children:n.jsxs(K,{className:"p-4 sm:p-5",children:[n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-3",children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(Fl,{"aria-hidden":"true",className:"h-4 w-4 text-primary"}),n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"top consumers"})]}),n.jsx("div",{className:"flex items-center gap-1 rounded-md border border-border p-0.5",children:Y1.map(o=>n.jsx("button",{"aria-pressed":t===o.key,className:q("min-h-7 rounded px-2.5 font-mono text-[11px] transition-colors",t===o.key?"bg-primary/15 text-primary":"text-muted-foreground hover:text-foreground"),onClick:()=>r(o.key),type:"button",children:o.label},o.key))})]}),n.jsxs("div",{className:"mt-3 flex flex-wrap items-center gap-2",children:[i?n.jsxs(ee,{tone:X1(i.per_core),children:["load ",i.one?.toFixed(2)??"—",i.cpu_count?` / ${i.cpu_count} cores`:""]}):null,e.uptime_seconds!==null?n.jsxs(ee,{tone:"neutral",children:[n.jsx(QN,{"aria-hidden":"true",className:"h-3 w-3"}),"up ",fl(e.uptime_seconds)]}):null,e.processes.total!==null?n.jsxs(ee,{tone:"neutral",children:[e.processes.total," processes"]}):null]}),n.jsxs("div",{className:"mt-4 grid gap-4 divide-divider sm:grid-cols-2 sm:gap-5 sm:divide-x",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsxs("div",{className:"mb-2 flex items-center justify-between gap-2",children:[n.jsxs("span",{className:"flex items-center gap-1.5 font-mono text-[11px] uppercase text-dim",children:[n.jsx(Ul,{"aria-hidden":"true",className:"h-3.5 w-3.5"})," containers"]}),n.jsx(Ee,{className:"font-mono text-[10px] text-muted-foreground hover:text-primary",to:"/containers",children:"all"})]}),n.jsx(vp,{basis:t,consumers:s,emptyLabel:t==="memory"&&!l?"Container memory is not accounted for on this host.":"No container is using measurable resources."})]}),n.jsxs("div",{className:"min-w-0 sm:pl-5",children:[n.jsxs("div",{className:"mb-2 flex items-center justify-between gap-2",children:[n.jsxs("span",{className:"flex items-center gap-1.5 font-mono text-[11px] uppercase text-dim",children:[n.jsx(zw,{"aria-hidden":"true",className:"h-3.5 w-3.5"})," host processes"]}),n.jsx(Ee,{className:"font-mono text-[10px] text-muted-foreground hover:text-primary",to:"/system",children:"system"})]}),n.jsx(vp,{basis:t,consumers:a,emptyLabel:"No process is using measurable resources."})]})]}),t==="cpu"?n.jsxs("p",{className:"mt-3 font-mono text-[10px] text-dim",children:["cpu % is per core, as reported by docker stats and top",i?.cpu_count?` — ${i.cpu_count*100}% uses the whole machine`:""]}):null]})})}const nk={primary:"bg-primary",success:"bg-success",warning:"bg-warning",danger:"bg-danger",info:"bg-info"};function Yt({value:e,tone:t="primary",className:r,label:s}){const a=e!=null&&Number.isFinite(Number(e)),i=a?Math.min(100,Math.max(0,Number(e))):0;return n.jsx("div",{"aria-label":s,"aria-valuemax":100,"aria-valuemin":0,"aria-valuenow":a?Math.round(i):void 0,className:q("h-1 overflow-hidden rounded-full bg-border",r),role:"progressbar",children:n.jsx("div",{className:q("h-full rounded-full transition-[width] duration-300",nk[t]),style:{width:`${i}%`}})})}const mu="limeos.liveRefresh.v1",Yc="limeos:live-refresh-change",oa={enabled:!1,intervalSeconds:30};function yg(e){if(!e)return oa;try{const t=JSON.parse(e);return typeof t.enabled!="boolean"||t.interval_seconds!==30&&t.interval_seconds!==60?oa:{enabled:t.enabled,intervalSeconds:t.interval_seconds}}catch{return oa}}function rk(){if(typeof window>"u")return oa;try{return yg(window.localStorage.getItem(mu))}catch{return oa}}function sk(e){try{window.localStorage.setItem(mu,JSON.stringify({enabled:e.enabled,interval_seconds:e.intervalSeconds}))}catch{}window.dispatchEvent(new CustomEvent(Yc,{detail:e}))}function ak(e){const[t,r]=d.useState(rk),s=d.useRef(e);d.useEffect(()=>{s.current=e},[e]),d.useEffect(()=>{const o=u=>{u.key===mu&&r(yg(u.newValue))},c=u=>{const h=u.detail;h&&r(h)};return window.addEventListener("storage",o),window.addEventListener(Yc,c),()=>{window.removeEventListener("storage",o),window.removeEventListener(Yc,c)}},[]),d.useEffect(()=>{if(!t.enabled)return;let o=null;const c=()=>{o!==null&&(window.clearInterval(o),o=null)},u=()=>{c(),document.visibilityState==="visible"&&(o=window.setInterval(()=>s.current(),t.intervalSeconds*1e3))},h=()=>{document.visibilityState==="visible"?(s.current(),u()):c()};return u(),document.addEventListener("visibilitychange",h),()=>{c(),document.removeEventListener("visibilitychange",h)}},[t.enabled,t.intervalSeconds]);const a=d.useCallback(o=>{r(o),sk(o)},[]),i=d.useCallback(o=>a({...t,enabled:o}),[t,a]),l=d.useCallback(o=>a({...t,intervalSeconds:o}),[t,a]);return{preference:t,setEnabled:i,setIntervalSeconds:l}}function bg({isRefreshing:e,onRefresh:t}){const{preference:r,setEnabled:s,setIntervalSeconds:a}=ak(t);return n.jsxs("div",{className:"flex flex-wrap items-center justify-end gap-2",children:[n.jsxs("div",{className:"flex min-h-9 items-center gap-2 rounded-md border border-border bg-card px-2",children:[n.jsx("span",{className:"font-mono text-[11px] text-muted-foreground",children:"auto"}),n.jsx("button",{"aria-checked":r.enabled,"aria-label":"Auto refresh",className:q("relative h-5 w-9 cursor-pointer rounded-full border transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring",r.enabled?"border-primary/50 bg-primary/25":"border-[#303a47] bg-muted"),onClick:()=>s(!r.enabled),role:"switch",type:"button",children:n.jsx("span",{"aria-hidden":"true",className:q("absolute top-0.5 h-3.5 w-3.5 rounded-full transition-transform",r.enabled?"translate-x-[17px] bg-primary":"translate-x-0.5 bg-muted-foreground")})})]}),n.jsx("div",{"aria-label":"Auto refresh interval",className:"flex rounded-md border border-border bg-card p-0.5",role:"group",children:[30,60].map(i=>n.jsxs("button",{"aria-pressed":r.intervalSeconds===i,className:q("min-h-8 min-w-11 cursor-pointer rounded px-2 font-mono text-[11px] transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring disabled:cursor-not-allowed disabled:opacity-40",r.intervalSeconds===i?"bg-muted text-foreground":"text-muted-foreground hover:text-foreground"),disabled:!r.enabled,onClick:()=>a(i),type:"button",children:[i,"s"]},i))}),n.jsx(_,{"aria-label":"Refresh now",className:"min-h-9 w-10 px-0",disabled:e,onClick:t,size:"sm",title:"Refresh now",variant:"secondary",children:n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",e&&"animate-spin")})})]})}function jg(e){return e&&typeof e=="object"?e:{}}function Ks(e){return Array.isArray(e)?e.map(t=>jg(t)):[]}function ik(e){return{source:String(e.source??""),label:String(e.label??""),title:String(e.title??"Unknown title"),subtitle:String(e.subtitle??""),user:String(e.user??""),client:String(e.client??""),device:String(e.device??""),play_method:ce(e.play_method),is_paused:!!e.is_paused,is_transcoding:!!e.is_transcoding,transcode_reason:ce(e.transcode_reason),bitrate:ne(e.bitrate),progress_percent:ne(e.progress_percent),position_seconds:ne(e.position_seconds),duration_seconds:ne(e.duration_seconds)}}function lk(e){return{source:String(e.source??""),label:String(e.label??""),name:String(e.name??"Unknown item"),state:String(e.state??"queued"),progress_percent:ne(e.progress_percent),size_bytes:ne(e.size_bytes),remaining_bytes:ne(e.remaining_bytes),speed_bytes:ne(e.speed_bytes),eta:ce(e.eta)}}function ok(e){return{source:String(e.source??""),label:String(e.label??""),total:ne(e.total)??0,problems:ne(e.problems)??0,items:Ks(e.items).map(t=>({title:String(t.title??"Unknown item"),state:String(t.state??"queued"),status:String(t.status??"unknown")}))}}function ck(e){return{id:String(e.id??""),name:String(e.name??"unknown"),label:String(e.label??""),family:String(e.family??""),reachable:!!e.reachable,detail:ce(e.detail)}}async function dk(e){const t=await W("/api/activity",{method:"GET",signal:e}),r=jg(t.totals);return{collected_at:String(t.collected_at??""),streams:Ks(t.streams).map(ik),downloads:Ks(t.downloads).map(lk),queues:Ks(t.queues).map(ok),services:Ks(t.services).map(ck),totals:{streams:ne(r.streams)??0,transcodes:ne(r.transcodes)??0,downloads:ne(r.downloads)??0,download_speed:ne(r.download_speed)??0,queued:ne(r.queued)??0,queue_problems:ne(r.queue_problems)??0}}}const uk={load_average:null,uptime_seconds:null,containers:{by_cpu:[],by_memory:[],capabilities:{},sampled_at:null},processes:{by_cpu:[],by_memory:[],total:null}};async function mk(e){const t=await W("/api/overview",{method:"GET",signal:e});return{...t,pressure:{...uk,...t.pressure??{}}}}function pk(e,t=typeof window>"u"?null:window.location.hostname){if(e.web_url)try{const a=new URL(e.web_url);if((a.protocol==="http:"||a.protocol==="https:")&&!a.username&&!a.password)return a.href}catch{}if(!e.port||!t)return null;const r=e.web_scheme??"http",s=t.includes(":")&&!t.startsWith("[")?`[${t}]`:t;return`${r}://${s}:${e.port}`}const Io=12,fk=1e4,hk={transmission:"Transmission",jackett:"Jackett",sonarr:"Sonarr",radarr:"Radarr",nzbget:"NZBGet",jellyfin:"Jellyfin",get_iplayer:"Get iPlayer",rtdclient:"RTD Client",rdtclient:"RDT Client",lidarr:"Lidarr",audiobookshelf:"Audiobookshelf","airsonic-advanced":"Airsonic"},xk={healthy:{label:"All systems operational",detail:"Metrics, workloads, and monitored resources are healthy.",tone:"success"},attention:{label:"Attention required",detail:"One or more resources need review.",tone:"warning"},critical:{label:"Critical issues",detail:"Immediate action is recommended.",tone:"danger"},unknown:{label:"Status unavailable",detail:"Some health sources could not be checked.",tone:"neutral"}};function gk(e){return hk[e.toLowerCase()]??e.replace(/[-_]+/g," ").replace(/\b\w/g,t=>t.toUpperCase())}function Qs(e,t,r){return e===null?"info":e>=r?"danger":e>=t?"warning":"success"}function vk(e){return{primary:"text-primary",success:"text-success",warning:"text-warning",danger:"text-danger",info:"text-info"}[e]}function yk(e){return!e||e.swap_total===null?{value:"—",percent:null,tone:"info"}:e.swap_total===0?{value:"none",detail:"not configured",percent:0,tone:"success"}:{value:_t(e.swap_percent),detail:`${Pe(e.swap_used)} / ${Pe(e.swap_total)}`,percent:e.swap_percent,tone:Qs(e.swap_percent,25,60)}}function yp(e){return e instanceof Error&&e.message?e.message:"Unable to load Overview"}function bk(e){const t=new Date(e);if(Number.isNaN(t.getTime()))return"time unavailable";const r=new Date;return t.toDateString()===r.toDateString()?Bt(t):new Intl.DateTimeFormat(void 0,{day:"numeric",month:"short"}).format(t)}function Bs({label:e,value:t,percent:r,tone:s,detail:a}){return n.jsx(Ee,{className:"group block focus-visible:outline-none",to:"/system",children:n.jsx(Q,{className:"h-full transition-colors group-hover:border-[#303b48] group-focus-visible:ring-2 group-focus-visible:ring-ring",children:n.jsxs(K,{className:"p-4",children:[n.jsxs("div",{className:"flex items-center justify-between gap-2",children:[n.jsx("p",{className:"font-mono text-[11px] uppercase text-muted-foreground",children:e}),n.jsx(Fl,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-dim transition-colors group-hover:text-primary"})]}),n.jsxs("div",{className:"mt-1 flex min-h-8 items-baseline justify-between gap-3",children:[n.jsx("p",{className:q("font-mono text-xl font-medium",vk(s)),children:t}),a?n.jsx("p",{className:"truncate font-mono text-[10px] text-dim",children:a}):null]}),n.jsx(Yt,{className:"mt-2",label:`${e} ${t}`,tone:s,value:r})]})})})}function jk({state:e,issues:t}){const r=xk[e],a=e==="healthy"?lt:e==="critical"?za:ie,i={success:"border-success/60 bg-success/[0.06] text-success",warning:"border-warning/60 bg-warning/[0.06] text-warning",danger:"border-danger/60 bg-danger/[0.06] text-danger",neutral:"border-muted-foreground/40 bg-muted/40 text-muted-foreground"}[r.tone];return n.jsxs("section",{"aria-labelledby":"overview-health-title",className:q("border-l-2",i),children:[n.jsxs("div",{className:"flex flex-col gap-4 px-4 py-4 sm:flex-row sm:items-center sm:justify-between sm:px-5",children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx(a,{"aria-hidden":"true",className:"mt-0.5 h-5 w-5 shrink-0"}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("h2",{className:"font-mono text-base font-semibold text-foreground",id:"overview-health-title",children:r.label}),n.jsx("p",{className:"mt-0.5 text-sm text-muted-foreground",children:r.detail})]})]}),n.jsxs(ee,{tone:r.tone,children:[t.length," ",t.length===1?"issue":"issues"]})]}),t.length?n.jsx("div",{className:"grid border-t border-current/15 sm:grid-cols-2 xl:grid-cols-3",children:t.slice(0,3).map(l=>n.jsxs(Ee,{className:"flex min-w-0 items-center justify-between gap-3 border-b border-current/10 px-4 py-2.5 text-sm transition-colors hover:bg-white/[0.025] sm:border-r sm:px-5 xl:border-b-0",to:l.path,children:[n.jsx("span",{className:"min-w-0 truncate text-foreground",children:l.label}),n.jsx("span",{className:"shrink-0 font-mono text-[10px] uppercase text-current",children:"review"})]},l.code))}):null]})}function bp({record:e,recovered:t=!1}){return n.jsxs("div",{className:"flex min-w-0 items-start gap-3 border-t border-divider py-3 first:border-t-0 first:pt-0 last:pb-0",children:[n.jsx("span",{"aria-hidden":"true",className:q("mt-1.5 h-2 w-2 shrink-0 rounded-full",t?"bg-success":e.severity==="critical"?"bg-danger":"bg-warning")}),n.jsxs("div",{className:"min-w-0 flex-1",children:[n.jsx("p",{className:"truncate text-sm text-foreground",children:e.summary}),n.jsxs("p",{className:"mt-0.5 font-mono text-[10px] text-dim",children:[t?"resolved":e.kind," · ",bk(e.at)]})]})]})}function wk({application:e}){const t=gk(e.name),r=e.status==="running",s=pk(e),a=n.jsxs(n.Fragment,{children:[n.jsx("span",{className:"flex h-8 w-8 shrink-0 items-center justify-center rounded border border-[#2a3440] bg-muted font-mono text-xs font-semibold text-primary",children:t.charAt(0).toUpperCase()}),n.jsxs("span",{className:"min-w-0 flex-1",children:[n.jsx("span",{className:"block truncate text-sm font-medium text-foreground",children:t}),n.jsxs("span",{className:"mt-0.5 flex items-center gap-1.5 font-mono text-[10px] text-dim",children:[n.jsx("span",{className:q("h-1.5 w-1.5 rounded-full",r?"bg-success":"bg-danger")}),e.status]})]}),s&&r?n.jsx(ys,{"aria-hidden":"true",className:"h-3.5 w-3.5 shrink-0 text-dim"}):null]}),i="flex min-h-14 min-w-0 items-center gap-3 rounded-md border border-border bg-card px-3 py-2 transition-colors hover:border-[#303b48] hover:bg-muted/40 focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring";return s&&r?n.jsx("a",{className:i,href:s,rel:"noopener noreferrer",target:"_blank",children:a}):n.jsx(Ee,{className:i,to:"/containers",children:a})}function Nk(){const[e,t]=d.useState(null),[r,s]=d.useState(null),[a,i]=d.useState(null),[l,o]=d.useState(null),[c,u]=d.useState(!1),[h,m]=d.useState(null),[f,w]=d.useState(!1),j=d.useCallback(async(C,k)=>{C!=="poll"&&u(!0);try{const O=await mk(k);if(k?.aborted)return;t(O),o(null);const S=new Date(O.collected_at);m(Number.isNaN(S.getTime())?new Date:S)}catch(O){k?.aborted||o(yp(O))}finally{!k?.aborted&&C!=="poll"&&u(!1)}},[]),y=d.useCallback(async C=>{try{const k=await dk(C);if(C?.aborted)return;s(k),i(null)}catch(k){C?.aborted||i(yp(k))}},[]),b=d.useCallback((C,k)=>Promise.all([j(C,k),y(k)]),[y,j]);d.useEffect(()=>{const C=new AbortController;b("initial",C.signal);const k=window.setInterval(()=>{b("poll",C.signal)},fk);return()=>{C.abort(),window.clearInterval(k)}},[b]);const v=d.useMemo(()=>f?e?.applications??[]:(e?.applications??[]).slice(0,Io),[f,e?.applications]),p=e?.metrics,x=p?.temperature_celsius??null,g=yk(p??null),N=e?.health.state??"unknown",E=e?n.jsx(fe,{label:N,tone:N==="healthy"?"success":N==="critical"?"danger":N==="attention"?"warning":"neutral"}):n.jsx(fe,{label:"syncing",tone:"info"});return n.jsxs("section",{className:"space-y-5 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsx(bg,{isRefreshing:c,onRefresh:()=>void b("manual")}),description:h?`last updated: ${Bt(h)}`:"collecting current status",status:E,title:"overview"}),l?n.jsxs("div",{"aria-live":"polite",className:"flex items-start gap-3 border-l-2 border-danger bg-danger/[0.06] p-4 text-sm text-danger",role:"status",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),n.jsxs("div",{children:[n.jsx("p",{className:"font-medium",children:"Overview refresh failed"}),n.jsx("p",{className:"mt-0.5 text-muted-foreground",children:l})]})]}):null,e?n.jsx(jk,{issues:e.health.issues,state:e.health.state}):null,n.jsxs("div",{className:"grid gap-3 sm:grid-cols-2 lg:grid-cols-3 xl:grid-cols-5",children:[n.jsx(Bs,{label:"cpu",percent:p?.cpu_percent??null,tone:Qs(p?.cpu_percent??null,60,85),value:_t(p?.cpu_percent)}),n.jsx(Bs,{detail:p?`${Pe(p.memory_used)} / ${Pe(p.memory_total)}`:void 0,label:"memory",percent:p?.memory_percent??null,tone:Qs(p?.memory_percent??null,70,90),value:_t(p?.memory_percent)}),n.jsx(Bs,{detail:g.detail,label:"swap",percent:g.percent,tone:g.tone,value:g.value}),n.jsx(Bs,{label:"temperature",percent:x===null?null:x/90*100,tone:Qs(x,65,80),value:x===null?"—":`${x.toFixed(1)} °C`}),n.jsx(Bs,{detail:p?`${Pe(p.disk_used)} / ${Pe(p.disk_total)}`:void 0,label:"storage",percent:p?.disk_percent??null,tone:Qs(p?.disk_percent??null,75,90),value:_t(p?.disk_percent)})]}),n.jsxs("div",{className:"grid gap-3 xl:grid-cols-2",children:[e?n.jsx(tk,{pressure:e.pressure}):null,n.jsx(J1,{error:a,snapshot:r})]}),n.jsxs("div",{className:"grid gap-3 xl:grid-cols-2",children:[n.jsx(Q,{children:n.jsxs(K,{className:"p-4 sm:p-5",children:[n.jsxs("div",{className:"flex items-center justify-between gap-3",children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4 text-primary"}),n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"workloads"})]}),n.jsx(ee,{tone:"neutral",children:"current"})]}),n.jsxs("div",{className:"mt-4 grid divide-y divide-divider sm:grid-cols-2 sm:divide-x sm:divide-y-0",children:[n.jsxs(Ee,{className:"pb-4 focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring sm:pb-0 sm:pr-5",to:"/containers",children:[n.jsxs("div",{className:"flex items-center justify-between",children:[n.jsxs("span",{className:"flex items-center gap-2 text-sm text-muted-foreground",children:[n.jsx(Ul,{"aria-hidden":"true",className:"h-4 w-4"})," containers"]}),n.jsx("span",{className:"font-mono text-2xl text-foreground",children:e?.workloads.containers.total??"—"})]}),n.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[n.jsxs(ee,{tone:"success",children:[e?.workloads.containers.running??0," running"]}),n.jsxs(ee,{tone:(e?.workloads.containers.unhealthy??0)>0?"danger":"neutral",children:[e?.workloads.containers.unhealthy??0," unhealthy"]}),n.jsxs(ee,{tone:(e?.workloads.containers.stopped??0)>0?"warning":"neutral",children:[e?.workloads.containers.stopped??0," stopped"]})]})]}),n.jsxs(Ee,{className:"pt-4 focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring sm:pl-5 sm:pt-0",to:"/stacks",children:[n.jsxs("div",{className:"flex items-center justify-between",children:[n.jsxs("span",{className:"flex items-center gap-2 text-sm text-muted-foreground",children:[n.jsx(rN,{"aria-hidden":"true",className:"h-4 w-4"})," stacks"]}),n.jsx("span",{className:"font-mono text-2xl text-foreground",children:e?.workloads.stacks.total??"—"})]}),n.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[n.jsxs(ee,{tone:"success",children:[e?.workloads.stacks.healthy??0," healthy"]}),n.jsxs(ee,{tone:(e?.workloads.stacks.partial??0)>0?"warning":"neutral",children:[e?.workloads.stacks.partial??0," partial"]}),n.jsxs(ee,{tone:(e?.workloads.stacks.down??0)>0?"danger":"neutral",children:[e?.workloads.stacks.down??0," down"]})]})]})]})]})}),n.jsx(Q,{children:n.jsxs(K,{className:"p-4 sm:p-5",children:[n.jsxs("div",{className:"flex items-center justify-between gap-3",children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4 text-primary"}),n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"alerts"})]}),n.jsx(Ee,{className:"font-mono text-[11px] text-muted-foreground hover:text-primary",to:"/integrations",children:"view policy"})]}),n.jsxs("div",{className:"mt-4",children:[e?.alerts.active.length?e.alerts.active.slice(0,3).map(C=>n.jsx(bp,{record:C},C.key)):n.jsxs("div",{className:"flex items-center gap-3 py-1 text-sm text-muted-foreground",children:[n.jsx(lt,{"aria-hidden":"true",className:"h-4 w-4 text-success"}),"No active alerts."]}),e?.alerts.recent_recoveries.length?n.jsxs("div",{className:"mt-4 border-t border-divider pt-3",children:[n.jsx("p",{className:"mb-3 font-mono text-[10px] uppercase text-dim",children:"recently resolved"}),e.alerts.recent_recoveries.map(C=>n.jsx(bp,{record:C,recovered:!0},`${C.key}:${C.at}`))]}):null]})]})})]}),e?.warnings.length?n.jsxs("div",{className:"flex items-start gap-3 border-l-2 border-warning/60 bg-warning/[0.04] px-4 py-3 text-sm",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-warning"}),n.jsxs("p",{className:"text-muted-foreground",children:[n.jsx("span",{className:"font-medium text-warning",children:"Data gaps:"})," ",e.warnings.slice(0,3).map(C=>C.message).join(" · ")]})]}):null,n.jsxs("section",{"aria-labelledby":"applications-title",children:[n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-3 border-b border-divider pb-3",children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(MN,{"aria-hidden":"true",className:"h-4 w-4 text-primary"}),n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"applications-title",children:"applications"})]}),n.jsxs(ee,{tone:"neutral",children:[e?.applications.length??0," detected"]})]}),v.length?n.jsx("div",{className:"mt-3 grid gap-2 sm:grid-cols-2 xl:grid-cols-3 2xl:grid-cols-4",children:v.map(C=>n.jsx(wk,{application:C},C.id))}):n.jsx("div",{className:"mt-3 flex min-h-24 items-center justify-center rounded-md border border-border bg-card p-5 text-sm text-muted-foreground",children:e?"No web applications detected.":"Loading applications..."}),(e?.applications.length??0)>Io?n.jsx("div",{className:"mt-3 flex justify-center",children:n.jsxs(_,{className:"gap-2",onClick:()=>w(C=>!C),size:"sm",variant:"ghost",children:[f?n.jsx(jw,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(vw,{"aria-hidden":"true",className:"h-4 w-4"}),f?"show less":`show ${(e?.applications.length??0)-Io} more`]})}):null]})]})}function Un(e){return e&&typeof e=="object"&&!Array.isArray(e)?e:{}}function Tt(e){return typeof e=="string"?e:""}function $t(e){return typeof e=="number"&&Number.isFinite(e)&&e>=0?e:0}function Fr(e){return typeof e=="number"&&Number.isFinite(e)&&e>=0?e:null}function Nfl(e){return(Array.isArray(e)?e.slice(0,20):[]).map(t=>{const r=Un(t);return{code:Tt(r.code),message:Tt(r.message)}})}function Dbm(e){if(!e||typeof e!="object"||Array.isArray(e))return null;const t=Un(e);return{at:Tt(t.at),sequential_read_mbps:Fr(t.sequential_read_mbps),random_read_iops:Fr(t.random_read_iops),write_mbps:Fr(t.write_mbps),transport:Tt(t.transport),driver:Tt(t.driver),usb_speed_mbps:Fr(t.usb_speed_mbps),flags:Nfl(t.flags)}}function Dio(e){if(!e||typeof e!="object"||Array.isArray(e))return null;const t=Un(e);return{read_iops:Fr(t.read_iops),write_iops:Fr(t.write_iops),read_bps:Fr(t.read_bps),write_bps:Fr(t.write_bps),await_ms:Fr(t.await_ms),busy_percent:Fr(t.busy_percent),sampled_at:Tt(t.sampled_at),flags:Nfl(t.flags)}}function Lo(e){return e==="available"||e==="degraded"||e==="not_checked"?e:"unavailable"}function kk(e){const t=Un(e),r=Un(t.counts),s=Un(t.capacity),a=Un(t.sources),i=t.state==="healthy"||t.state==="attention"?t.state:"unavailable",l=Array.isArray(t.devices)?t.devices.slice(0,128):[],o=Array.isArray(t.warnings)?t.warnings.slice(0,20):[];return{state:i,counts:{total:$t(r.total),healthy:$t(r.healthy),warning:$t(r.warning),failing:$t(r.failing),unknown:$t(r.unknown),mounted:$t(r.mounted),unmounted:$t(r.unmounted),assigned:Fr(r.assigned),unassigned:Fr(r.unassigned),unused:Fr(r.unused)},capacity:{mounted_total_bytes:$t(s.mounted_total_bytes),mounted_used_bytes:$t(s.mounted_used_bytes),mounted_available_bytes:$t(s.mounted_available_bytes),mounted_percent:Fr(s.mounted_percent)},sources:{inventory:Lo(a.inventory),smart:Lo(a.smart),assignments:Lo(a.assignments)},devices:l.map(c=>{const u=Un(c),h=Un(u.mounted_capacity),m=u.health==="healthy"||u.health==="warning"||u.health==="failing"?u.health:"unknown",f=Array.isArray(u.assignments)?u.assignments.slice(0,256):[];return{name:Tt(u.name),path:Tt(u.path),health:m,temperature_c:Fr(u.temperature_c),mounted:u.mounted===!0,mounted_capacity:{mounted_total_bytes:$t(h.mounted_total_bytes),mounted_used_bytes:$t(h.mounted_used_bytes),mounted_available_bytes:$t(h.mounted_available_bytes)},assignments:f.map(w=>{const j=Un(w);return{provider_id:Tt(j.provider_id),capability_id:Tt(j.capability_id),role:Tt(j.role),resource_id:Tt(j.resource_id),resource_name:Tt(j.resource_name),href:Tt(j.href),device_path:Tt(j.device_path)}}),benchmark:Dbm(u.benchmark),io:Dio(u.io)}}),warnings:o.map(c=>{const u=Un(c);return{code:Tt(u.code),source:Tt(u.source),message:Tt(u.message)}}),collected_at:Tt(t.collected_at)}}function Sk(e,t){if(!Object.keys(t).length)return e;const r=e.devices.map(i=>{const l=t[i.path];if(!l)return i;const o=l.health_status==="healthy"||l.health_status==="warning"||l.health_status==="failing"?l.health_status:"unknown";return{...i,health:o,temperature_c:Fr(l.temperature_c)}}),s={healthy:0,warning:0,failing:0,unknown:0};r.forEach(i=>{s[i.health]+=1});const a=e.warnings.length>0||s.warning>0||s.failing>0||s.unknown>0;return{...e,state:r.length>0&&!a?"healthy":"attention",counts:{...e.counts,...s},sources:{...e.sources,smart:"available"},devices:r}}function wg(e){if(!e||typeof e!="object"||Array.isArray(e))return null;const t=e;return{total:ne(t.total),used:ne(t.used),available:ne(t.available),percent:ne(t.percent)}}function _k(e){return{name:String(e?.name??""),path:String(e?.path??""),size:ce(e?.size),fstype:ce(e?.fstype),mountpoint:ce(e?.mountpoint),configured_mountpoint:ce(e?.configured_mountpoint),uuid:ce(e?.uuid),label:ce(e?.label),usage:wg(e?.usage)}}function Ck(e){const t=Array.isArray(e?.partitions)?e?.partitions:[];return{name:String(e?.name??""),path:String(e?.path??""),type:String(e?.type??""),size:ce(e?.size),model:ce(e?.model),serial:ce(e?.serial),transport:ce(e?.transport),mountpoint:ce(e?.mountpoint),configured_mountpoint:ce(e?.configured_mountpoint),fstype:ce(e?.fstype),uuid:ce(e?.uuid),label:ce(e?.label),usage:wg(e?.usage),partitions:t.map(r=>_k(r))}}function Ng(e,t=""){return{device:String(e?.device??t),model:ce(e?.model),serial:ce(e?.serial),drive_type:ce(e?.drive_type),smart_available:!!e?.smart_available,smart_enabled:!!e?.smart_enabled,health_status:String(e?.health_status??"unknown"),temperature_c:ne(e?.temperature_c),power_on_hours:ne(e?.power_on_hours),reallocated_sectors:ne(e?.reallocated_sectors),pending_sectors:ne(e?.pending_sectors),uncorrectable_errors:ne(e?.uncorrectable_errors),percentage_used:ne(e?.percentage_used),available_spare:ne(e?.available_spare),media_errors:ne(e?.media_errors),error_message:ce(e?.error_message)}}async function pu(e){const t=await W("/api/disks",{method:"GET",signal:e});if(t.error)throw new Error(t.error);return{disks:Array.isArray(t.disks)?t.disks.map(r=>Ck(r)):[],helper_available:!!t.helper_available,summary:t.summary?kk(t.summary):null}}async function Ek(e){const t=await W("/api/disks/helper-status",{method:"GET",signal:e});return{available:!!t.available,socket_path:ce(t.socket_path)}}async function Ak(e){const t=await W("/api/disks/smart",{method:"GET",signal:e});return t.error||!Array.isArray(t.disks)?{}:t.disks.reduce((r,s)=>{const a=String(s.device??"");return a&&(r[a]=Ng(s.data,a)),r},{})}async function Pk(e,t){const r=await W(`/api/disks/${encodeURIComponent(e)}/smart`,{method:"GET",signal:t});if(r.error)throw new Error(String(r.error));return Ng(r,e)}async function Rk(e){const t=await W("/api/disks/suggested-mounts",{method:"GET",signal:e});return t.error||!Array.isArray(t.suggestions)?[]:t.suggestions.map(r=>({device:String(r.device??""),uuid:String(r.uuid??""),size:ce(r.size),fstype:String(r.fstype??""),label:ce(r.label),suggested_mount:String(r.suggested_mount??""),reason:String(r.reason??"")})).filter(r=>r.uuid&&r.fstype&&r.suggested_mount)}async function Mk(e,t){const r=await W("/api/disks/mount",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({uuid:e.uuid,mountpoint:e.mountpoint,fstype:e.fstype,add_to_fstab:e.add_to_fstab??!0}),signal:t});if(r.error)throw new Error(r.error)}async function Tk(e,t=!1,r){const s=await W("/api/disks/unmount",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({mountpoint:e,remove_from_fstab:t}),signal:r});if(s.error)throw new Error(s.error);return{warning:ce(s.warning)}}async function $k(e,t,r){const s=await W(`/api/disks/${encodeURIComponent(e)}/smart-test`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({test_type:t}),signal:r});if(s.error)throw new Error(s.error);return s.message||`${t} self-test started`}async function Rdb(e,t){const r=await W(`/api/disks/${encodeURIComponent(e)}/benchmark`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({}),signal:t});if(r.error)throw new Error(r.error);const s=ne(r.result?.sequential_read_mbps),a=ne(r.result?.random_read_iops),i=r.latest?.flags?.[0]?.message,l=`/dev/${e}: ${s??"?"} MB/s sequential, ${a??"?"} random reads/s`;return typeof i=="string"&&i?`${l} — ${i}`:l}function Ik(e){return e==="success"?"border-success/30 text-success":e==="error"?"border-danger/30 text-danger":"border-info/30 text-info"}function kg(e){switch(e){case"healthy":return"success";case"warning":return"warning";case"failing":return"danger";default:return"neutral"}}function hi(e){return e instanceof Error&&e.message?e.message:"Unable to load disks"}function Xc(e){return e>=90?"danger":e>=75?"warning":"success"}function Lk(e){if(e.usage?.total!==null&&e.usage?.total!==void 0)return e.usage;const t=e.partitions.map(i=>i.usage).filter(i=>i?.total!==null&&i?.total!==void 0);if(!t.length)return null;const r=t.reduce((i,l)=>i+(l.total??0),0),s=t.reduce((i,l)=>i+(l.used??0),0),a=t.reduce((i,l)=>i+(l.available??0),0);return{total:r,used:s,available:a,percent:r>0?s/r*100:0}}function zk(e){return e.startsWith("/pools/")?"/pools":e.startsWith("/protection/")?"/protection":e.startsWith("/")?e:"/pools"}function Ok({summary:e}){const{counts:t,capacity:r}=e,s=[t.warning?`${t.warning} warning`:"",t.failing?`${t.failing} failing`:"",t.unknown?`${t.unknown} unknown`:""].filter(Boolean).join(" · "),a=t.assigned===null?"Provider assignments unavailable":`${t.assigned} assigned · ${t.unassigned??0} unassigned`;return n.jsxs("section",{"aria-label":"Disk summary",className:"grid overflow-hidden rounded-md border border-border bg-card sm:grid-cols-2 xl:grid-cols-4","data-disk-summary":!0,children:[n.jsxs("div",{className:"border-b border-border p-3 sm:border-r xl:border-b-0",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Health"}),n.jsxs("p",{className:"mt-1 text-sm font-medium",children:[t.healthy," healthy"]}),n.jsx("p",{className:q("mt-0.5 text-xs",s?"text-warning":"text-muted-foreground"),children:s||`${t.total} devices reporting`})]}),n.jsxs("div",{className:"border-b border-border p-3 xl:border-b-0 xl:border-r",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Mount state"}),n.jsxs("p",{className:"mt-1 text-sm font-medium",children:[t.mounted," mounted"]}),n.jsxs("p",{className:"mt-0.5 text-xs text-muted-foreground",children:[t.unmounted," unmounted"]})]}),n.jsxs("div",{className:"border-b border-border p-3 sm:border-b-0 sm:border-r",children:[n.jsxs("div",{className:"flex items-baseline justify-between gap-2",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Mounted capacity"}),n.jsx("span",{className:"font-mono text-[11px] text-muted-foreground",children:r.mounted_percent===null?"—":`${Math.round(r.mounted_percent)}%`})]}),n.jsxs("p",{className:"mt-1 text-sm font-medium",children:[Pe(r.mounted_used_bytes)," used"]}),n.jsxs("p",{className:"mt-0.5 text-xs text-muted-foreground",children:[Pe(r.mounted_available_bytes)," free"]}),r.mounted_percent!==null?n.jsx(Yt,{className:"mt-2",label:"Mounted disk capacity",tone:Xc(r.mounted_percent),value:r.mounted_percent}):null]}),n.jsxs("div",{className:"p-3",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Providers"}),n.jsx("p",{className:"mt-1 text-sm font-medium",children:t.assigned===null?"Not checked":`${t.assigned} assigned`}),n.jsx("p",{className:"mt-0.5 text-xs text-muted-foreground",children:t.unused===null?a:`${t.unused} unused · ${a}`})]})]})}function mn({label:e,value:t}){return n.jsxs("div",{className:"flex items-center justify-between gap-3 border-b border-border/50 py-1.5 last:border-0",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:e}),n.jsx("span",{className:"font-mono text-xs sm:text-sm",children:t===null||t===""?"—":t})]})}function Zc({actionKey:e,label:t,confirmLabel:r="Confirm",pendingLabel:s="Working...",className:a,confirmKey:i,setConfirmKey:l,pendingKey:o,disabled:c,onConfirm:u,requestData:h,confirmData:m}){return o===e?n.jsxs(_,{className:q("gap-1.5 text-xs sm:text-sm",a),disabled:!0,size:"sm",variant:"outline",children:[n.jsx(me,{"aria-hidden":"true",className:"h-3.5 w-3.5 animate-spin"}),s]}):i===e?n.jsxs("span",{className:"flex items-center gap-1.5",children:[n.jsx(_,{autoFocus:!0,className:q("text-xs sm:text-sm",a),onClick:u,size:"sm",variant:"outline",...m,children:r}),n.jsx(_,{onClick:()=>l(null),size:"sm",variant:"outline",children:"Cancel"})]}):n.jsx(_,{className:q("text-xs sm:text-sm",a),disabled:c||!!o,onClick:()=>l(e),size:"sm",variant:"outline",...h,children:t})}function Dk({disk:e,summary:t,smart:r,helperAvailable:s,pendingKey:a,confirmKey:i,setConfirmKey:l,onSmart:o,onUnmount:c,onBenchmark:dBm}){const u=Lk(e),h=u?.percent??null,m=r?.health_status??t?.health??"unknown",f=r?.temperature_c??t?.temperature_c??null,w=[...e.mountpoint?[e.mountpoint]:[],...e.partitions.flatMap(y=>y.mountpoint?[y.mountpoint]:[])],j=w.find(y=>i===`unmount:${y}`),kBm=t?.benchmark??null,ioD=t?.io??null,dFl=[...kBm?.flags??[],...ioD?.flags??[]];return n.jsx(Q,{className:"transition-colors duration-200 hover:border-primary/25",children:n.jsxs(K,{className:"space-y-4 p-4",children:[n.jsxs("div",{className:"flex items-start justify-between gap-3",children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-2.5",children:[n.jsx(Vl,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-primary"}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"truncate font-mono text-sm font-semibold",children:e.path}),n.jsx("p",{className:"truncate text-xs text-muted-foreground",children:e.model||"Unknown model"})]})]}),n.jsxs("div",{className:"flex shrink-0 items-center gap-1.5",children:[n.jsx(fe,{label:m,tone:kg(m)}),n.jsx(_,{"aria-label":`SMART details for ${e.path}`,className:"h-9 min-h-9 w-9 px-0","data-disk":e.name,"data-disk-action":"smart",disabled:s===!1,onClick:()=>o(e),size:"sm",title:s===!1?"SMART helper unavailable":`SMART details for ${e.path}`,variant:"outline",children:n.jsx(jt,{"aria-hidden":"true",className:"h-4 w-4"})}),s!==!1?n.jsx(Ba,{disabled:!!a,items:[{id:`benchmark:${e.name}`,label:"Run throughput test",Icon:Fl,onSelect:()=>dBm(e),data:{"data-benchmark":e.name}},...w.map(y=>({id:`unmount:${y}`,label:`Unmount ${y}`,Icon:ZN,onSelect:()=>l(`unmount:${y}`),tone:"danger",data:{"data-unmount":y}}))],label:`More actions for ${e.path}`,pending:a===`benchmark:${e.name}`||!!a?.startsWith("unmount:"),triggerData:{"data-disk-menu":e.name}}):null]})]}),n.jsxs("div",{className:"flex flex-wrap items-center gap-x-4 gap-y-1 border-y border-border/70 py-2 font-mono text-xs text-muted-foreground",children:[n.jsxs("span",{children:[n.jsx("span",{className:"text-dim",children:"Size "}),e.size||"—"]}),n.jsxs("span",{children:[n.jsx("span",{className:"text-dim",children:"Bus "}),[e.transport,e.type].filter(Boolean).join(" · ")||"—"]}),f!==null?n.jsxs("span",{className:"inline-flex items-center gap-1",children:[n.jsx(GN,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-dim"}),f," °C"]}):null,kBm?.sequential_read_mbps!==null&&kBm?.sequential_read_mbps!==void 0?n.jsxs("span",{className:"inline-flex items-center gap-1","data-disk-benchmark":e.name,children:[n.jsx(Fl,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-dim"}),Math.round(kBm.sequential_read_mbps)," MB/s",kBm.random_read_iops!==null?` · ${Math.round(kBm.random_read_iops)} IOPS`:""]}):null,ioD?.busy_percent!==null&&ioD?.busy_percent!==void 0?n.jsxs("span",{className:"inline-flex items-center gap-1","data-disk-io":e.name,title:`Read ${pl(ioD.read_bps)} · write ${pl(ioD.write_bps)}`,children:[n.jsx(Je,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-dim"}),Math.round(ioD.busy_percent),"% busy",ioD.await_ms!==null?` · ${ioD.await_ms.toFixed(1)} ms await`:""]}):null]}),dFl.length?n.jsx("div",{className:"space-y-1 text-xs text-warning","data-disk-flags":e.name,children:dFl.map(y=>n.jsxs("p",{className:"flex items-center gap-1.5",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-3.5 w-3.5 shrink-0"}),y.message]},y.code))}):null,u&&h!==null?n.jsxs("div",{"data-disk-usage":e.name,children:[n.jsxs("div",{className:"flex items-baseline justify-between gap-3",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Mounted usage"}),n.jsxs("p",{className:"font-mono text-xs text-muted-foreground",children:[Math.round(h),"% used"]})]}),n.jsx(Yt,{className:"mt-2",label:`${e.path} mounted usage`,tone:Xc(h),value:h}),n.jsxs("div",{className:"mt-2 flex flex-wrap items-center justify-between gap-x-4 gap-y-1 font-mono text-[11px]",children:[n.jsxs("span",{children:[n.jsx("span",{className:"text-dim",children:"Used "}),Pe(u.used)]}),n.jsxs("span",{children:[n.jsx("span",{className:"text-dim",children:"Free "}),Pe(u.available)]})]})]}):null,e.partitions.length?n.jsxs("div",{children:[n.jsx("p",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Partitions"}),n.jsx("div",{className:"mt-1 divide-y divide-border/70 border-y border-border/70",children:e.partitions.map(y=>{const b=y.usage?.percent??null;return n.jsxs("div",{className:"space-y-1.5 py-2.5 text-xs",children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-x-2 gap-y-1",children:[n.jsx("span",{className:"break-all font-mono font-medium",children:y.path}),y.fstype?n.jsx("span",{className:"rounded bg-info/10 px-1.5 py-0.5 font-mono text-info",children:y.fstype}):null,n.jsx("span",{className:"ml-auto font-mono text-muted-foreground",children:y.size||"—"})]}),n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-x-3 gap-y-1",children:[y.mountpoint?n.jsx("span",{className:"break-all font-mono text-success",children:y.mountpoint}):n.jsx("span",{className:"text-muted-foreground",children:"Unmounted"}),y.usage&&b!==null?n.jsxs("span",{className:"font-mono text-[11px] text-muted-foreground",children:[Math.round(b),"% · ",Pe(y.usage.used)," used · ",Pe(y.usage.available)," free"]}):null]}),b!==null?n.jsx(Yt,{label:`${y.path} usage`,tone:Xc(b),value:b}):null]},y.path)})})]}):null,t?.assignments.length?n.jsxs("div",{className:"flex flex-wrap items-center gap-2 border-t border-border/70 pt-3",children:[n.jsx("span",{className:"font-mono text-[10px] uppercase tracking-[0.1em] text-dim",children:"Providers"}),t.assignments.map(y=>n.jsxs(Ee,{className:"inline-flex min-h-8 items-center gap-1 rounded border border-border bg-muted/20 px-2 text-xs text-primary hover:border-primary/40 hover:bg-muted/40",to:zk(y.href),children:[n.jsx("span",{children:y.resource_name||y.provider_id}),n.jsxs("span",{className:"text-muted-foreground",children:["· ",y.role]}),n.jsx(ys,{"aria-hidden":"true",className:"h-3 w-3"})]},`${y.provider_id}:${y.resource_id}:${y.device_path}`))]}):null,j?n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2 border-t border-danger/20 pt-3 text-xs text-danger",children:[n.jsxs("span",{children:["Unmount ",j,"?"]}),n.jsx(Zc,{actionKey:`unmount:${j}`,className:"border-danger/30 bg-danger/10 text-danger hover:bg-danger/15",confirmData:{"data-confirm-unmount":j},confirmKey:i,confirmLabel:"Confirm unmount",label:"Unmount",onConfirm:()=>c(j),pendingKey:a,pendingLabel:"Unmounting...",setConfirmKey:l})]}):null]})})}function Uk(){const[e,t]=d.useState([]),[r,s]=d.useState(null),[a,i]=d.useState({}),[l,o]=d.useState(null),[c,u]=d.useState(!0),[h,m]=d.useState(!1),[f,w]=d.useState(null),[j,y]=d.useState("Never"),[b,v]=d.useState({open:!1,status:"idle",device:"",result:null,error:null}),[p,x]=d.useState([]),[g,N]=d.useState(null),[E,C]=d.useState(null),[k,O]=d.useState(null),[S,$]=d.useState(null),R=d.useRef(!0),H=d.useCallback(async F=>{F==="initial"?u(!0):m(!0);try{const D=await pu();if(!R.current)return;t(D.disks),o(D.summary),s(D.helper_available),w(null),y(Bt(new Date))}catch(D){if(!R.current)return;w(hi(D))}finally{R.current&&(F==="initial"?u(!1):m(!1))}Ek().then(D=>{R.current&&s(D.available)}).catch(()=>{}),Ak().then(D=>{R.current&&i(D)}).catch(()=>{}),Rk().then(D=>{R.current&&x(D)}).catch(()=>{})},[]),I=d.useMemo(()=>l?Sk(l,a):null,[l,a]),U=d.useCallback(async(F,D)=>{if(!k){O(F),$(null);try{const G=await D();if(!R.current)return;N({tone:"success",message:G}),await H("manual")}catch(G){R.current&&N({tone:"error",message:hi(G)})}finally{R.current&&O(null)}}},[H,k]),L=d.useCallback(F=>U(`mount:${F.uuid}`,async()=>(await Mk({uuid:F.uuid,mountpoint:F.suggested_mount,fstype:F.fstype}),`Mounted ${F.device} at ${F.suggested_mount}`)),[U]),B=d.useCallback(F=>U(`unmount:${F}`,async()=>{const{warning:D}=await Tk(F);return D||`Unmounted ${F}`}),[U]),xBm=d.useCallback(F=>U(`benchmark:${F.name}`,()=>Rdb(F.name)),[U]),P=d.useCallback(async(F,D)=>{if(k)return;const G=`test:${F}:${D}`;O(G),$(null),C(null);try{const se=await $k(F,D);R.current&&C({tone:"success",message:se})}catch(se){R.current&&C({tone:"error",message:hi(se)})}finally{R.current&&O(null)}},[k]),M=d.useCallback(async F=>{C(null),v({open:!0,status:"loading",device:F.path,result:null,error:null});try{const D=await Pk(F.name);if(!R.current)return;i(G=>({...G,[F.path]:D})),v({open:!0,status:"ready",device:F.path,result:D,error:null})}catch(D){if(!R.current)return;v({open:!0,status:"error",device:F.path,result:null,error:hi(D)})}},[]),A=d.useCallback(()=>{C(null),$(null),v(F=>({...F,open:!1}))},[]);return d.useEffect(()=>{if(!g||g.tone==="error")return;const F=window.setTimeout(()=>N(null),4500);return()=>window.clearTimeout(F)},[g]),d.useEffect(()=>(R.current=!0,H("initial"),()=>{R.current=!1}),[H]),n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",disabled:h,onClick:()=>void H("manual"),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",h?"animate-spin":"")}),h?"refreshing":"refresh"]}),description:`${e.length} devices · synced ${j}`,status:n.jsx(fe,{label:r===!1?"limited":"helper ready",tone:r===!1?"warning":"success"}),title:"disk_management"}),r===!1?n.jsx(Q,{"aria-live":"polite",className:"border-warning/30",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Privileged helper unavailable — disk and SMART operations are limited."]})}):null,g?n.jsx(Q,{"aria-live":g.tone==="error"?"assertive":"polite",className:Ik(g.tone),role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm",children:[g.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),n.jsx("span",{children:g.message}),n.jsx(_,{"aria-label":"Dismiss disk notification",className:"ml-auto h-8 min-h-8 w-8 px-0",onClick:()=>N(null),size:"sm",title:"Dismiss",variant:"ghost",children:n.jsx(We,{"aria-hidden":"true",className:"h-4 w-4"})})]})}):null,f&&e.length?n.jsxs("div",{"aria-live":"polite",className:"flex flex-wrap items-center gap-2 border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm text-warning",role:"status",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4 shrink-0"}),n.jsxs("span",{children:["Refresh failed. Showing data synced ",j,"."]}),n.jsx("span",{className:"text-muted-foreground",children:f}),n.jsxs(_,{className:"ml-auto gap-1.5",disabled:h,onClick:()=>void H("manual"),size:"sm",variant:"outline",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-3.5 w-3.5",h?"animate-spin":"")}),"Retry"]})]}):null,I&&e.length?n.jsx(Ok,{summary:I}):null,p.length&&r!==!1?n.jsxs("section",{"aria-label":"Suggested mounts",className:"border-y border-border bg-card/45 px-3 py-2.5 sm:px-4",id:"v2-disk-suggestions",children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(Jw,{"aria-hidden":"true",className:"h-4 w-4 shrink-0 text-primary"}),n.jsxs("p",{className:"text-sm font-medium",children:[p.length," suggested ",p.length===1?"mount":"mounts"]}),n.jsx("span",{className:"text-xs text-muted-foreground",children:"Unmounted filesystems detected"})]}),n.jsx("div",{className:"mt-2 divide-y divide-border/70 border-t border-border/70",children:p.map(F=>n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2 py-2.5 text-xs",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"break-all font-mono text-sm",children:F.device}),n.jsxs("p",{className:"text-muted-foreground",children:[F.reason," → ",n.jsx("span",{className:"font-mono text-success",children:F.suggested_mount})]})]}),n.jsx(Zc,{actionKey:`mount:${F.uuid}`,className:"border-success/30 bg-success/10 text-success hover:bg-success/15",confirmData:{"data-confirm-mount":F.uuid},confirmKey:S,confirmLabel:`Mount at ${F.suggested_mount}`,label:"Mount",onConfirm:()=>L(F),pendingKey:k,pendingLabel:"Mounting...",requestData:{"data-mount":F.uuid},setConfirmKey:$})]},F.uuid))})]}):null,f&&!e.length?n.jsx(Q,{className:"border-danger/30",children:n.jsxs(K,{className:"flex flex-col items-start gap-3 p-4 sm:p-6",children:[n.jsxs("div",{className:"flex items-center gap-2 text-danger",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),n.jsx("p",{className:"text-sm font-medium",children:"Unable to load disks"})]}),n.jsx("p",{className:"text-sm text-muted-foreground",children:f}),n.jsx(_,{onClick:()=>void H("manual"),variant:"outline",children:"Retry"})]})}):null,c?n.jsx(Q,{"aria-live":"polite",role:"status",children:n.jsxs(K,{className:"flex min-h-[14rem] items-center justify-center gap-2 p-6 text-sm text-muted-foreground",children:[n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4 animate-pulse text-primary"}),"Loading disks..."]})}):null,!c&&!f&&!e.length&&r!==!1?n.jsx(Q,{children:n.jsx(K,{className:"flex min-h-[10rem] items-center justify-center p-6 text-sm text-muted-foreground",children:"No disks found."})}):null,!c&&e.length?n.jsx("div",{className:"grid gap-3 sm:grid-cols-2 2xl:grid-cols-3",children:e.map(F=>n.jsx(Dk,{confirmKey:S,disk:F,helperAvailable:r,onBenchmark:xBm,onSmart:M,onUnmount:B,pendingKey:k,setConfirmKey:$,smart:a[F.path],summary:I?.devices.find(D=>D.path===F.path)},F.path))}):null,b.open?n.jsx(ze,{onClose:A,children:n.jsxs(Q,{"aria-labelledby":"v2-disk-smart-title","aria-modal":"true",className:"flex max-h-[90vh] w-full max-w-2xl flex-col overflow-hidden",id:"v2-disk-smart-modal",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsx("div",{children:n.jsxs(ge,{className:"text-base sm:text-lg",id:"v2-disk-smart-title",children:["SMART: ",b.device]})}),n.jsx(_,{"aria-label":"Close SMART details",className:"h-9 min-h-9 w-9 px-0",id:"v2-disk-smart-close",onClick:A,size:"sm",title:"Close",variant:"outline",children:n.jsx(We,{"aria-hidden":"true",className:"h-4 w-4"})})]}),n.jsx(K,{className:"space-y-3 overflow-auto p-4",id:"v2-disk-smart-content",children:b.status==="loading"?n.jsx("p",{className:"text-sm text-muted-foreground",children:"Loading SMART data..."}):b.status==="error"?n.jsxs("div",{className:"flex flex-wrap items-center gap-3 text-sm text-danger",role:"alert",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),n.jsx("span",{children:b.error||"Failed to load SMART data"}),n.jsxs(_,{"aria-label":"Retry SMART details",className:"ml-auto gap-1.5",onClick:()=>{const F=e.find(D=>D.path===b.device);F&&M(F)},size:"sm",variant:"outline",children:[n.jsx(je,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Retry"]})]}):b.result?n.jsxs(n.Fragment,{children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(fe,{label:b.result.health_status,tone:kg(b.result.health_status)}),b.result.drive_type?n.jsx("span",{className:"rounded bg-muted/50 px-2 py-1 text-xs uppercase",children:b.result.drive_type}):null]}),b.result.error_message?n.jsx("p",{className:"text-sm text-warning",children:b.result.error_message}):null,n.jsxs("div",{className:"rounded-lg border border-border/70 bg-muted/25 p-3",children:[n.jsx(mn,{label:"Model",value:b.result.model}),n.jsx(mn,{label:"Serial",value:b.result.serial}),n.jsx(mn,{label:"Temperature",value:b.result.temperature_c===null?null:`${b.result.temperature_c} °C`}),n.jsx(mn,{label:"Power-on hours",value:b.result.power_on_hours}),n.jsx(mn,{label:"Reallocated sectors",value:b.result.reallocated_sectors}),n.jsx(mn,{label:"Pending sectors",value:b.result.pending_sectors}),n.jsx(mn,{label:"Uncorrectable errors",value:b.result.uncorrectable_errors}),n.jsx(mn,{label:"Wear (used)",value:b.result.percentage_used===null?null:`${b.result.percentage_used}%`}),n.jsx(mn,{label:"Available spare",value:b.result.available_spare===null?null:`${b.result.available_spare}%`}),n.jsx(mn,{label:"Media errors",value:b.result.media_errors})]}),E?n.jsxs("div",{"aria-live":E.tone==="error"?"assertive":"polite",className:q("flex items-center gap-2 border-l-2 px-3 py-2 text-sm",E.tone==="error"?"border-danger bg-danger/5 text-danger":"border-success bg-success/5 text-success"),role:"status",children:[E.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),E.message]}):null,r!==!1&&b.result.smart_available&&b.result.smart_enabled?n.jsxs("div",{className:"flex flex-wrap items-center gap-2",id:"v2-disk-smart-test",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Self-test"}),["short","long"].map(F=>{const D=b.device.replace(/^\/dev\//,"");return n.jsx(Zc,{actionKey:`test:${D}:${F}`,confirmData:{"data-confirm-smarttest":F},confirmKey:S,confirmLabel:`Run ${F} test`,label:F==="short"?"Short":"Long",onConfirm:()=>P(D,F),pendingKey:k,pendingLabel:"Starting...",requestData:{"data-smarttest":F},setConfirmKey:$},F)})]}):null]}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No SMART data available."})})]})}):null]})}const Bk={enable:{title:"Enable extension",message:"The provider becomes available after LimeOS restarts.",confirm:"Enable"},disable:{title:"Disable extension",message:"Provider configuration is preserved, but its capabilities stop loading after restart.",confirm:"Disable"},update:{title:"Update extension",message:"The managed GitHub checkout will move to the latest fetched revision. Configuration is preserved.",confirm:"Update"},repair:{title:"Repair extension",message:"The managed checkout will be restored from its configured source. Configuration is preserved.",confirm:"Repair"},remove:{title:"Remove extension",message:"The managed package files and installation record will be removed. Disable it first.",confirm:"Remove"}};function Sg({children:e,description:t,onClose:r,title:s}){const a=d.useId();return n.jsx(ze,{onClose:r,children:n.jsxs("div",{"aria-labelledby":a,"aria-modal":"true",className:"max-h-[92vh] w-full max-w-lg overflow-y-auto rounded-lg border border-border bg-card",role:"dialog",children:[n.jsxs("header",{className:"flex items-start justify-between gap-3 border-b border-border px-4 py-4 sm:px-5",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("h2",{className:"font-mono text-base font-semibold",id:a,children:s}),n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:t})]}),n.jsx(_,{"aria-label":"Close dialog",className:"h-11 w-11 shrink-0 px-0",onClick:r,variant:"ghost",children:n.jsx(We,{"aria-hidden":"true",className:"h-4 w-4"})})]}),e]})})}function Fk({action:e,extension:t,onClose:r,onConfirm:s,pending:a}){const i=Bk[e],[l,o]=d.useState(""),c=e==="remove",u=!a&&(!c||l===t.id);return n.jsx(Sg,{description:t.name,onClose:r,title:i.title,children:n.jsxs("div",{className:"space-y-4 px-4 py-5 sm:px-5",children:[n.jsxs("div",{className:q("flex items-start gap-2 border-l-2 px-3 py-2.5 text-sm",c?"border-danger bg-danger/5 text-danger":"border-warning bg-warning/5 text-warning"),children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),n.jsx("p",{children:i.message})]}),c?n.jsxs("label",{className:"block space-y-1.5",children:[n.jsxs("span",{className:"text-sm text-foreground",children:["Type ",n.jsx("code",{className:"text-danger",children:t.id})," to confirm"]}),n.jsx("input",{autoComplete:"off",className:"min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 font-mono text-sm focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring","data-extension-remove-confirmation":!0,onChange:h=>o(h.target.value),spellCheck:!1,value:l})]}):null,n.jsxs("div",{className:"flex flex-wrap justify-end gap-2 border-t border-border pt-4",children:[n.jsx(_,{disabled:a,onClick:r,variant:"outline",children:"Cancel"}),n.jsxs(_,{className:c?"border-danger/30 bg-danger/10 text-danger hover:bg-danger/15":void 0,"data-extension-confirm":e,disabled:!u,onClick:s,variant:"outline",children:[a?n.jsx(me,{"aria-hidden":"true",className:"mr-2 h-4 w-4 animate-spin"}):null,a?`${i.confirm}...`:i.confirm]})]})]})})}function Vk({onClose:e,onConfirm:t,pending:r}){const[s,a]=d.useState(""),[i,l]=d.useState(""),o=s.trim().length>0&&!r;return n.jsx(Sg,{description:"Install a reviewed capability provider from GitHub.",onClose:e,title:"Install extension",children:n.jsxs("div",{className:"space-y-4 px-4 py-5 sm:px-5",children:[n.jsxs("div",{className:"flex items-start gap-2 border-l-2 border-warning bg-warning/5 px-3 py-2.5 text-sm text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),n.jsx("p",{children:"Extensions run with LimeOS provider permissions. Install only a source you trust and have reviewed."})]}),n.jsxs("label",{className:"block space-y-1.5",children:[n.jsx("span",{className:"text-sm text-foreground",children:"GitHub repository"}),n.jsx("input",{autoComplete:"url",className:"min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 font-mono text-sm focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring","data-extension-install-source":!0,onChange:c=>a(c.target.value),placeholder:"owner/repository",spellCheck:!1,value:s})]}),n.jsxs("label",{className:"block space-y-1.5",children:[n.jsxs("span",{className:"text-sm text-foreground",children:["Extension ID ",n.jsx("span",{className:"text-dim",children:"optional"})]}),n.jsx("input",{autoComplete:"off",className:"min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 font-mono text-sm focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring","data-extension-install-id":!0,onChange:c=>l(c.target.value),placeholder:"derived from repository",spellCheck:!1,value:i})]}),n.jsxs("div",{className:"flex flex-wrap justify-end gap-2 border-t border-border pt-4",children:[n.jsx(_,{disabled:r,onClick:e,variant:"outline",children:"Cancel"}),n.jsxs(_,{"data-extension-install-confirm":!0,disabled:!o,onClick:()=>t({type:"github",source:s.trim(),...i.trim()?{id:i.trim()}:{}}),children:[r?n.jsx(me,{"aria-hidden":"true",className:"mr-2 h-4 w-4 animate-spin"}):null,r?"Installing...":"Install"]})]})]})})}async function qk(e){const t=await fetch("/api/auth/check",{credentials:"same-origin",headers:{Accept:"application/json"},signal:e});if(t.status===401)return sp(null),{authenticated:!1,username:null,csrfToken:null,role:null,permissions:[]};if(!t.ok)throw new Error(`Auth check failed with status ${t.status}`);const r=await t.json(),s=r.csrf_token??null;return sp(s),{authenticated:!!r.authenticated,username:r.username??null,csrfToken:s,role:r.role??null,permissions:Array.isArray(r.permissions)?r.permissions.filter(a=>typeof a=="string"):[]}}async function Hk(){try{await fetch("/api/logout",{method:"POST",credentials:"same-origin",headers:await Pr("POST")})}finally{window.sessionStorage.removeItem("loggedIn"),window.sessionStorage.removeItem("username"),window.location.assign("/login.html")}}const _g=d.createContext(void 0);function Wk({children:e}){const[t,r]=d.useState("loading"),[s,a]=d.useState(null),[i,l]=d.useState(null),[o,c]=d.useState([]),[u,h]=d.useState(null),m=d.useRef(!0);d.useEffect(()=>()=>{m.current=!1},[]);const f=d.useCallback(async()=>{r("loading"),h(null);try{const j=await qk();if(!m.current)return;if(j.authenticated){r("authenticated"),a(j.username||"unknown"),l(j.role),c(j.permissions);return}r("unauthenticated"),a(null),l(null),c([])}catch(j){if(!m.current)return;r("error"),a(null),l(null),c([]),h(j instanceof Error?j.message:"Unexpected auth check failure")}},[]);d.useEffect(()=>{f()},[f]);const w=d.useMemo(()=>({state:t,username:s,role:i,permissions:o,error:u,refresh:f}),[t,s,i,o,u,f]);return n.jsx(_g.Provider,{value:w,children:e})}function Ln(){const e=d.useContext(_g);if(!e)throw new Error("useAuth must be used within AuthProvider");return e}const Gk=[{label:"Overview",path:ve.settings,end:!0},{label:"Extensions",path:ve.extensions,end:!1}];function Cg(){return n.jsx("nav",{"aria-label":"Settings sections",className:"border-b border-divider",children:n.jsxs("div",{className:"flex min-w-0 items-end gap-5 overflow-x-auto",children:[n.jsx("span",{className:"shrink-0 pb-3 font-mono text-[10px] uppercase text-dim",children:"Settings / Advanced"}),Gk.map(e=>n.jsx($x,{className:({isActive:t})=>q("relative shrink-0 border-b-2 px-1 pb-3 font-mono text-xs transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring",t?"border-primary text-primary":"border-transparent text-muted-foreground hover:text-foreground"),end:e.end,to:e.path,children:e.label},e.path))]})})}async function Eg(e){return(await W(`/api/capabilities/${encodeURIComponent(e)}`)).capability}async function Kk(){const e=await W("/api/extensions");return{extensions:Array.isArray(e.extensions)?e.extensions:[],errors:Array.isArray(e.errors)?e.errors:[]}}async function Qk(e){const t=await W(`/api/extensions/${encodeURIComponent(e)}`);return{extension:t.extension,errors:Array.isArray(t.errors)?t.errors:[]}}async function Jk(e){return W("/api/extensions/install",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)})}async function Yk(e,t){return W(`/api/extensions/${encodeURIComponent(e)}/${t}`,{method:"POST",headers:{"Content-Type":"application/json"},body:"{}"})}async function Xk(e){return W(`/api/extensions/${encodeURIComponent(e)}`,{method:"DELETE"})}const Zk={integrations:ve.integrations,mounts:ve.mounts,pools:ve.pools,protection:ve.protection,shares:ve.shares};function Ag(e){const t=e.replace(/[._-]+/g," ").trim();return t?t.charAt(0).toUpperCase()+t.slice(1):"Other capabilities"}function e2(e){return Zk[e]??null}function t2(e){const t=new Map;for(const r of e){const s=r.capabilities[0]?.id??"other",a=t.get(s)??[];a.push(r),t.set(s,a)}return[...t.entries()].sort(([r],[s])=>r==="other"?1:s==="other"?-1:r.localeCompare(s)).map(([r,s])=>({id:r,label:r==="other"?"Other capabilities":Ag(r),extensions:[...s].sort((a,i)=>a.name.localeCompare(i.name))}))}function hl(e){return e==="healthy"?"success":e==="warning"||e==="unconfigured"?"warning":e==="error"||e==="incompatible"||e==="unavailable"?"danger":"neutral"}function n2(e){return e.update_state==="available"?"update available":e.update_state==="current"?"current":"not reported"}function jp(e){if(e.runtime_kind==="integration-adapter")return[];const t=e.enabled?"disable":"enable";return e.runtime_kind==="github-python"?[t,"update","repair","remove"]:[t]}function xl(e){return e instanceof Error&&e.message?e.message:"Unable to load extensions"}function ca(e){return e.replace(/[_-]+/g," ")}function Pg({errors:e}){return e.length?n.jsxs("section",{"aria-labelledby":"extension-diagnostics-title",className:"border-l-2 border-warning bg-warning/5 px-4 py-3",children:[n.jsxs("div",{className:"flex items-center gap-2 text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4 shrink-0"}),n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"extension-diagnostics-title",children:"Extension diagnostics"})]}),n.jsx("div",{className:"mt-2 divide-y divide-warning/15",children:e.map((t,r)=>n.jsxs("div",{className:"grid gap-1 py-2 text-xs sm:grid-cols-[minmax(10rem,0.35fr)_1fr]",children:[n.jsx("code",{className:"break-all text-warning",children:t.code}),n.jsx("p",{className:"text-muted-foreground",children:t.message})]},`${t.provider_id??"registry"}-${t.code}-${r}`))})]}):null}function r2({extension:e}){const t=e.capabilities.filter(r=>r.operational).length;return n.jsxs(Ee,{className:"group grid min-h-20 cursor-pointer gap-3 px-4 py-3 transition-colors duration-200 hover:bg-muted/35 focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-inset focus-visible:ring-ring sm:grid-cols-[minmax(12rem,1.15fr)_minmax(9rem,0.65fr)_minmax(9rem,0.65fr)_auto] sm:items-center","data-extension-id":e.id,to:eu(e.id),children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx("span",{className:"mt-0.5 flex h-9 w-9 shrink-0 items-center justify-center rounded-md border border-border bg-muted/30 text-muted-foreground",children:n.jsx(au,{"aria-hidden":"true",className:"h-4 w-4"})}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"truncate font-mono text-sm font-semibold text-foreground",children:e.name}),n.jsx("p",{className:"mt-0.5 line-clamp-2 text-xs text-muted-foreground",children:e.description||e.id}),n.jsxs("div",{className:"mt-2 flex flex-wrap gap-1.5 sm:hidden",children:[n.jsx(fe,{label:ca(e.health.state),tone:hl(e.health.state)}),n.jsx(ee,{children:e.version||"version unknown"})]})]})]}),n.jsxs("div",{className:"hidden min-w-0 sm:block",children:[n.jsx("p",{className:"font-mono text-xs text-foreground",children:e.version||"unknown"}),n.jsx("p",{className:"mt-1 truncate text-xs text-dim",children:e.source})]}),n.jsxs("div",{className:"hidden sm:block",children:[n.jsx(fe,{label:ca(e.health.state),tone:hl(e.health.state)}),n.jsxs("p",{className:"mt-1 text-xs text-dim",children:[t,"/",e.capabilities.length," capabilities available"]})]}),n.jsxs("div",{className:"flex items-center justify-between gap-3 sm:justify-end",children:[n.jsx(ee,{tone:e.compatibility==="compatible"?"success":e.compatibility==="incompatible"?"danger":"neutral",children:e.compatibility}),n.jsx(tu,{"aria-hidden":"true",className:"h-4 w-4 text-dim transition-colors group-hover:text-foreground"})]})]})}function s2(){const{permissions:e}=Ln(),[t,r]=d.useState([]),[s,a]=d.useState([]),[i,l]=d.useState("loading"),[o,c]=d.useState(""),[u,h]=d.useState(!1),[m,f]=d.useState(!1),[w,j]=d.useState(null),y=e.includes("extensions.admin"),b=d.useCallback(async()=>{l("loading");try{const g=await Kk();r(g.extensions),a(g.errors),c(""),l("ready")}catch(g){c(xl(g)),l("error")}},[]);d.useEffect(()=>{b()},[b]);const v=t2(t),p=t.filter(g=>!["healthy","disabled"].includes(g.health.state)).length,x=async g=>{f(!0),j(null);try{const N=await Jk(g);h(!1),j({tone:"success",message:`Extension ${N.id||"package"} installed. Restart LimeOS to load the provider.`}),await b()}catch(N){h(!1),j({tone:"danger",message:xl(N)})}finally{f(!1)}};return n.jsxs("section",{className:"space-y-5 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs("div",{className:"flex flex-wrap gap-2",children:[y?n.jsxs(_,{className:"gap-2","data-extension-install-open":!0,onClick:()=>h(!0),children:[n.jsx(ot,{"aria-hidden":"true",className:"h-4 w-4"}),"Install"]}):null,n.jsxs(_,{className:"gap-2",disabled:i==="loading",onClick:()=>void b(),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",i==="loading"?"animate-spin":"")}),"refresh"]})]}),description:"Settings / Advanced · installed capability providers",status:i==="ready"?n.jsx(fe,{label:`${t.length} installed`,tone:p?"warning":"success"}):void 0,title:"extensions"}),n.jsx(Pg,{errors:s}),w?n.jsx("div",{"aria-live":w.tone==="danger"?"assertive":"polite",className:q("border-l-2 px-4 py-3 text-sm",w.tone==="danger"?"border-danger bg-danger/5 text-danger":"border-success bg-success/5 text-success"),"data-extension-operation-notice":!0,role:w.tone==="danger"?"alert":"status",children:w.message}):null,i==="loading"?n.jsxs("div",{"aria-live":"polite",className:"flex min-h-56 items-center justify-center gap-2 rounded-md border border-border text-sm text-muted-foreground",role:"status",children:[n.jsx(je,{"aria-hidden":"true",className:"h-4 w-4 animate-spin text-primary"}),"Loading extensions…"]}):null,i==="error"?n.jsxs("div",{"aria-live":"assertive",className:"border-l-2 border-danger bg-danger/5 px-4 py-4 text-sm text-danger",role:"alert",children:[n.jsxs("div",{className:"flex items-center gap-2 font-medium",children:[n.jsx(za,{"aria-hidden":"true",className:"h-4 w-4"}),"Extension registry is unavailable"]}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:o})]}):null,i==="ready"&&!v.length?n.jsxs("div",{className:"flex min-h-56 flex-col items-center justify-center rounded-md border border-dashed border-border px-5 text-center",children:[n.jsx(au,{"aria-hidden":"true",className:"h-7 w-7 text-dim"}),n.jsx("h2",{className:"mt-3 font-mono text-sm font-semibold",children:"No extensions discovered"}),n.jsx("p",{className:"mt-1 max-w-lg text-sm text-muted-foreground",children:"Installed providers will appear here when their capability adapters are available."})]}):null,i==="ready"&&v.length?n.jsx("div",{className:"space-y-5",children:v.map(g=>n.jsxs("section",{"aria-labelledby":`extension-group-${g.id}`,children:[n.jsxs("div",{className:"mb-2 flex items-center justify-between gap-3",children:[n.jsx("h2",{className:"font-mono text-xs font-semibold uppercase text-muted-foreground",id:`extension-group-${g.id}`,children:g.label}),n.jsx("span",{className:"font-mono text-[11px] text-dim",children:g.extensions.length})]}),n.jsx("div",{className:"overflow-hidden rounded-md border border-border bg-card divide-y divide-border",children:g.extensions.map(N=>n.jsx(r2,{extension:N},N.id))})]},g.id))}):null,u?n.jsx(Vk,{onClose:()=>h(!1),onConfirm:g=>void x(g),pending:m}):null]})}function xi({label:e,children:t}){return n.jsxs("div",{className:"min-w-0 bg-card px-4 py-3",children:[n.jsx("dt",{className:"font-mono text-[10px] uppercase text-dim",children:e}),n.jsx("dd",{className:"mt-1 break-words text-sm text-foreground",children:t})]})}function a2({extensionId:e}){const t=Ol(),{permissions:r}=Ln(),[s,a]=d.useState(null),[i,l]=d.useState([]),[o,c]=d.useState("loading"),[u,h]=d.useState(""),[m,f]=d.useState(null),[w,j]=d.useState(!1),[y,b]=d.useState(null),v=r.includes("extensions.admin"),p=d.useCallback(async()=>{c("loading");try{const g=await Qk(e);a(g.extension),l(g.errors),h(""),c("ready")}catch(g){a(null),h(xl(g)),c("error")}},[e]);d.useEffect(()=>{p()},[p]);const x=async g=>{if(s){j(!0),b(null);try{if(g==="remove"){await Xk(s.id),f(null),t(ve.extensions,{replace:!0});return}const N=await Yk(s.id,g);f(null),b({tone:"success",message:`${s.name} ${g} completed.${N.restart_required?" Restart LimeOS to apply the change.":""}`}),await p()}catch(N){f(null),b({tone:"danger",message:xl(N)})}finally{j(!1)}}};return o==="loading"?n.jsxs("div",{"aria-live":"polite",className:"flex min-h-56 items-center justify-center gap-2 text-sm text-muted-foreground",role:"status",children:[n.jsx(je,{"aria-hidden":"true",className:"h-4 w-4 animate-spin text-primary"}),"Loading extension…"]}):o==="error"||!s?n.jsxs("section",{className:"space-y-5",children:[n.jsxs(Ee,{className:q(Ye({variant:"ghost",size:"sm"}),"gap-2"),to:ve.extensions,children:[n.jsx(vs,{"aria-hidden":"true",className:"h-4 w-4"}),"Extensions"]}),n.jsxs("div",{className:"border-l-2 border-danger bg-danger/5 px-4 py-4 text-sm text-danger",role:"alert",children:[n.jsx("p",{className:"font-medium",children:"Unable to load extension"}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:u})]})]}):n.jsxs("section",{className:"space-y-5 sm:space-y-6",children:[n.jsxs(Ee,{className:q(Ye({variant:"ghost",size:"sm"}),"gap-2 px-2"),to:ve.extensions,children:[n.jsx(vs,{"aria-hidden":"true",className:"h-4 w-4"}),"Extensions"]}),n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",onClick:()=>void p(),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:"h-4 w-4"}),"refresh"]}),description:s.description||"Capability provider extension",status:n.jsx(fe,{label:ca(s.health.state),tone:hl(s.health.state)}),title:s.name}),n.jsx(Pg,{errors:i}),y?n.jsx("div",{"aria-live":y.tone==="danger"?"assertive":"polite",className:q("border-l-2 px-4 py-3 text-sm",y.tone==="danger"?"border-danger bg-danger/5 text-danger":"border-success bg-success/5 text-success"),"data-extension-operation-notice":!0,role:y.tone==="danger"?"alert":"status",children:y.message}):null,n.jsxs("section",{"aria-labelledby":"extension-package-title",children:[n.jsx("h2",{className:"mb-2 font-mono text-xs font-semibold uppercase text-muted-foreground",id:"extension-package-title",children:"Package"}),n.jsxs("dl",{className:"grid gap-px overflow-hidden rounded-md border border-border bg-border sm:grid-cols-2 lg:grid-cols-4",children:[n.jsx(xi,{label:"Version",children:n.jsx("span",{className:"font-mono",children:s.version||"unknown"})}),n.jsx(xi,{label:"Source",children:n.jsx("span",{className:"font-mono text-xs",children:s.source})}),n.jsx(xi,{label:"Runtime",children:n.jsx("span",{className:"font-mono text-xs",children:ca(s.runtime_kind)})}),n.jsx(xi,{label:"Update",children:n.jsx("span",{className:"font-mono text-xs",children:n2(s)})})]}),n.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[n.jsx(fe,{label:s.installed?"installed":"not installed",tone:s.installed?"success":"neutral"}),n.jsx(fe,{label:s.enabled?"enabled":"disabled",tone:s.enabled?"success":"neutral"}),n.jsx(fe,{label:s.compatibility,tone:s.compatibility==="compatible"?"success":s.compatibility==="incompatible"?"danger":"neutral"}),n.jsx(fe,{label:`contract ${s.contract_state}`,tone:s.contract_state==="valid"?"success":"danger"})]}),n.jsx("p",{className:"mt-3 text-sm text-muted-foreground",children:s.health.message})]}),n.jsxs("section",{"aria-labelledby":"extension-administration-title",children:[n.jsx("h2",{className:"mb-2 font-mono text-xs font-semibold uppercase text-muted-foreground",id:"extension-administration-title",children:"Administration"}),n.jsx("div",{className:"rounded-md border border-border bg-card px-4 py-4",children:jp(s).length?v?n.jsx("div",{className:"flex flex-wrap gap-2",children:jp(s).map(g=>{const N=g==="remove"?Kt:g==="repair"?cs:g==="update"?Oa:iu,E=g==="remove"&&s.enabled;return n.jsxs(_,{className:q("gap-2",g==="remove"?"border-danger/30 text-danger hover:bg-danger/10":""),"data-extension-action":g,disabled:w||E,onClick:()=>f(g),title:E?"Disable this extension before removing it":void 0,variant:"outline",children:[w?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(N,{"aria-hidden":"true",className:"h-4 w-4"}),g.charAt(0).toUpperCase()+g.slice(1)]},g)})}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"Administrator access is required to change extension packages."}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"This provider is managed from its owning LimeOS page."})})]}),n.jsxs("section",{"aria-labelledby":"extension-capabilities-title",children:[n.jsxs("div",{className:"mb-2 flex items-center justify-between gap-3",children:[n.jsx("h2",{className:"font-mono text-xs font-semibold uppercase text-muted-foreground",id:"extension-capabilities-title",children:"Capabilities"}),n.jsx("span",{className:"font-mono text-[11px] text-dim",children:s.capabilities.length})]}),s.capabilities.length?n.jsx("div",{className:"overflow-hidden rounded-md border border-border bg-card divide-y divide-border",children:s.capabilities.map(g=>{const N=e2(g.surface);return n.jsxs("div",{className:"grid gap-3 px-4 py-3 sm:grid-cols-[minmax(12rem,1fr)_auto] sm:items-center","data-capability-id":g.id,children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx(pw,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-primary"}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"font-mono text-sm font-semibold",children:Ag(g.id)}),n.jsx("p",{className:"mt-0.5 break-all font-mono text-xs text-dim",children:g.id}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:g.status.health.message})]})]}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2 sm:justify-end",children:[n.jsx(fe,{label:ca(g.status.health.state),tone:hl(g.status.health.state)}),N?n.jsxs(Ee,{className:q(Ye({variant:"outline",size:"sm"}),"gap-2"),to:N,children:["Open ",n.jsx(iw,{"aria-hidden":"true",className:"h-3.5 w-3.5"})]}):n.jsx(ee,{children:"page not available yet"})]})]},g.id)})}):n.jsx("div",{className:"rounded-md border border-dashed border-border px-4 py-6 text-sm text-muted-foreground",children:"No usable capabilities were declared. Review the diagnostics above."})]}),m?n.jsx(Fk,{action:m,extension:s,onClose:()=>f(null),onConfirm:()=>void x(m),pending:w}):null]})}function wp(){const{extensionId:e}=Zd();return n.jsxs("div",{className:"space-y-5 sm:space-y-6",children:[n.jsx(Cg,{}),e?n.jsx(a2,{extensionId:e}):n.jsx(s2,{})]})}const Np=["downloads","storage","backup","config"];async function i2(e){const r=(await W("/api/disks/media-paths",{method:"GET",signal:e})).paths??{};return{downloads:String(r.downloads??""),storage:String(r.storage??""),backup:String(r.backup??""),config:String(r.config??"")}}async function l2(e,t){const r=await W("/api/disks/media-paths",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e),signal:t});if(r.error)throw new Error(r.error);return{warning:ce(r.startup_warning)}}function o2(e){return{id:String(e?.id??e?.mount_id??e?.name??""),name:String(e?.name??e?.id??"mount"),mountpoint:ce(e?.mountpoint??e?.target),mounted:!!(e?.mounted??e?.is_mounted),type:ce(e?.type??e?.remote_type)}}async function c2(e,t){let r;try{r=await W(`/api/storage/mounts/${encodeURIComponent(e)}`,{method:"GET",signal:t})}catch(s){if(s instanceof Wl&&s.status===400)return null;throw s}if(r.error)throw new Error(r.error);if(!Array.isArray(r.mounts))throw new Error("Mount list response is invalid");return r.mounts.map(s=>o2(s))}async function fu(e,t,r){const s=await W(e,{method:t,signal:r});if(s.error)throw new Error(s.error)}function d2(e,t,r){return fu(`/api/storage/mounts/${encodeURIComponent(e)}/${encodeURIComponent(t)}/mount`,"POST",r)}function u2(e,t,r){return fu(`/api/storage/mounts/${encodeURIComponent(e)}/${encodeURIComponent(t)}/unmount`,"POST",r)}function m2(e,t,r){return fu(`/api/storage/mounts/${encodeURIComponent(e)}/${encodeURIComponent(t)}`,"DELETE",r)}async function Rg(e,t,r,s){const a=await W(e,{method:t,headers:{"Content-Type":"application/json"},body:JSON.stringify(r),signal:s});if(a.error)throw new Error(a.error)}function p2(e,t,r){return Rg(`/api/storage/mounts/${encodeURIComponent(e)}`,"POST",t,r)}function f2(e,t,r,s){return Rg(`/api/storage/mounts/${encodeURIComponent(e)}/${encodeURIComponent(t)}`,"PUT",r,s)}async function h2(e){const t=await W("/api/disks/startup-service/preview",{method:"GET",signal:e});if(t.error)throw new Error(t.error);const r=s=>({path:String(s?.path??""),current:String(s?.current??""),proposed:String(s?.proposed??""),exists:!!s?.exists,changed:!!s?.changed});return{script:r(t.script),service:r(t.service)}}async function x2(e){const t=await W("/api/disks/startup-service",{method:"POST",signal:e});if(t.error)throw new Error(t.error)}async function Mg(e,t,r){if(!Number.isInteger(t)||t<1)throw new RangeError("Concurrency must be a positive integer");const s=new Array(e.length);let a=0;async function i(){for(;;){const o=a;if(a+=1,o>=e.length)return;try{s[o]={status:"fulfilled",value:await r(e[o],o)}}catch(c){s[o]={status:"rejected",reason:c}}}}const l=Math.min(t,e.length);return await Promise.all(Array.from({length:l},()=>i())),s}function g2(e){return{id:String(e?.id??""),name:String(e?.name??e?.id??"unknown"),description:String(e?.description??""),version:String(e?.version??""),installed:!!e?.installed,enabled:!!e?.enabled,configured:!!e?.configured,status:String(e?.status??"unknown"),status_message:String(e?.status_message??""),category:String(e?.category??"storage"),kind:String(e?.kind??"generic"),type:String(e?.type??"builtin")}}async function Ql(e){const t=await W("/api/storage/plugins",{method:"GET",signal:e});return Array.isArray(t.plugins)?t.plugins.map(r=>g2(r)):[]}async function Tg(e,t){const r=await W(`/api/storage/plugins/${encodeURIComponent(e)}`,{method:"GET",signal:t});if(r.error)throw new Error(String(r.error));const s=Array.isArray(r.commands)?r.commands:[];return{id:String(r.id??e),name:String(r.name??e),description:String(r.description??""),installed:!!r.installed,kind:String(r.kind??"generic"),status:r.status??{},commands:s.map(a=>({id:String(a.id??""),label:String(a.name??a.label??a.id??""),description:a.description!=null?String(a.description):void 0,params:Array.isArray(a.params)?a.params.map(i=>String(i)):[],dangerous:!!a.dangerous,param_schema:Array.isArray(a.param_schema)?a.param_schema:void 0})),schema:r.schema??{},config:r.config??{}}}async function $g(e,t,r){const s=await fetch(`/api/storage/plugins/${encodeURIComponent(e)}/config`,{method:"POST",credentials:"same-origin",headers:{"Content-Type":"application/json",Accept:"application/json",...await Pr("POST")},body:JSON.stringify(t),signal:r}),a=await s.json().catch(()=>({}));if(s.ok&&!a.error)return{ok:!0,error:null,details:[]};const i=Array.isArray(a.details)?a.details.map(l=>String(l)):a.details?[String(a.details)]:[];return{ok:!1,error:a.error||`Save failed (${s.status})`,details:i}}async function Ig(e){const t=await fetch(`/api/storage/plugins/${encodeURIComponent(e)}/apply`,{method:"POST",credentials:"same-origin",headers:{Accept:"application/json",...await Pr("POST")}}),r=await t.json().catch(()=>({}));return t.ok&&!r.error?{ok:!0,error:null,message:r.message??null}:{ok:!1,error:r.error||`Apply failed (${t.status})`,message:null}}async function Lg(e,t){const r=await fetch(`/api/storage/plugins/${encodeURIComponent(e)}/config-preview`,{method:"POST",credentials:"same-origin",headers:{"Content-Type":"application/json",Accept:"application/json",...await Pr("POST")},body:JSON.stringify(t)}),s=await r.json().catch(()=>({}));if(!r.ok||s.error)throw new Error(s.error||`Preview failed (${r.status})`);return String(s.preview??"")}async function v2(e,t){const r=await fetch(`/api/storage/plugins/${encodeURIComponent(e)}/recovery`,{method:"GET",credentials:"same-origin",headers:{Accept:"application/json"},signal:t});if(r.status===404)return{supported:!1,data:null};if(!r.ok)throw new Error(`Recovery request failed (${r.status})`);return{supported:!0,data:await r.json()}}async function zg(e,t){const r=await fetch(`/api/storage/plugins/${encodeURIComponent(e)}/logs/latest`,{method:"GET",credentials:"same-origin",signal:t});if(r.status===404)return null;if(!r.ok)throw new Error(`Log request failed (${r.status})`);return await r.text()}async function y2(e,t,r,s,a){const i=await fetch(`/api/storage/plugins/${encodeURIComponent(e)}/commands/${encodeURIComponent(t)}`,{method:"POST",credentials:"same-origin",headers:{"Content-Type":"application/json",Accept:"text/event-stream",...await Pr("POST")},body:JSON.stringify(r??{}),signal:a});if(!i.ok||!i.body)throw new Error(`Command failed (${i.status})`);const l=i.body.getReader(),o=new TextDecoder;let c="";for(;;){const{value:u,done:h}=await l.read();if(h)break;c+=o.decode(u,{stream:!0});let m=c.indexOf(`
 
 `);for(;m!==-1;){const f=c.slice(0,m);c=c.slice(m+2);const w=f.split(`
 `).find(j=>j.startsWith("data:"));if(w)try{s(JSON.parse(w.slice(5).trim()))}catch{}m=c.indexOf(`
@@ -513,10 +513,10 @@ Error generating stack: `+i.message+`
 ${H}`:""]}),O?null:n.jsxs("div",{className:"flex flex-wrap gap-2",children:[U&&!H?n.jsxs(_,{className:"gap-2",onClick:()=>{Ha(),eo()},variant:"info",children:[n.jsx(la,{className:"h-4 w-4"}),"Authenticate Claude"]}):null,n.jsx(_,{onClick:Ha,variant:U?"secondary":"default",children:"Close"})]})]}):C==="install"?n.jsxs(n.Fragment,{children:[n.jsxs("div",{className:"grid gap-3 sm:grid-cols-2",children:[n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Mattermost admin username"}),n.jsx("input",{autoComplete:"username",className:pn,name:"mattermost-admin-username",onChange:X=>A({...M,admin_username:X.target.value}),value:M.admin_username})]}),n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Mattermost admin password"}),n.jsx("input",{autoComplete:"current-password",className:pn,minLength:10,name:"mattermost-admin-password",onChange:X=>A({...M,admin_password:X.target.value}),type:"password",value:M.admin_password})]})]}),n.jsxs("button",{className:"flex min-h-11 cursor-pointer items-center gap-2 text-sm text-muted-foreground hover:text-foreground",onClick:()=>se(X=>!X),type:"button",children:[n.jsx(Je,{className:"h-4 w-4"}),"Usage limits"]}),G&&M.limits?n.jsxs("div",{className:"grid gap-3 border-l border-border pl-3 sm:grid-cols-3",children:[n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Turn timeout"}),n.jsx("input",{className:pn,max:600,min:10,name:"agent-turn-timeout",onChange:X=>A({...M,limits:{...M.limits,turn_timeout_seconds:Number(X.target.value)}}),type:"number",value:M.limits.turn_timeout_seconds})]}),n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Tool rounds"}),n.jsx("input",{className:pn,max:10,min:1,name:"agent-tool-rounds",onChange:X=>A({...M,limits:{...M.limits,tool_rounds_per_turn:Number(X.target.value)}}),type:"number",value:M.limits.tool_rounds_per_turn})]}),n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Daily invocations"}),n.jsx("input",{className:pn,max:1e3,min:1,name:"agent-daily-invocations",onChange:X=>A({...M,limits:{...M.limits,invocations_per_day:Number(X.target.value)}}),type:"number",value:M.limits.invocations_per_day})]})]}):null,n.jsxs(_,{className:"gap-2","data-agent-install":!0,disabled:!M.admin_username||M.admin_password.length<10,onClick:()=>void bu(),children:[n.jsx(os,{className:"h-4 w-4"}),"Install assistant"]})]}):n.jsxs(n.Fragment,{children:[n.jsxs("div",{className:"flex items-start gap-3 border-l-2 border-info bg-info/5 px-4 py-3",children:[n.jsx(je,{className:"mt-0.5 h-4 w-4 shrink-0 text-info"}),n.jsx("p",{className:"text-sm text-muted-foreground",children:"Provider binaries and system services will be verified and repaired. Conversations, usage, audit records, and Mattermost alerts are preserved."})]}),n.jsxs("label",{className:"flex min-h-11 cursor-pointer items-center gap-3 text-sm",children:[n.jsx("input",{checked:F,className:"h-4 w-4 accent-primary",name:"repair-mattermost",onChange:X=>D(X.target.checked),type:"checkbox"}),n.jsxs("span",{children:[n.jsx("span",{className:"block font-medium",children:"Repair Mattermost bot and configuration"}),n.jsx("span",{className:"block text-xs text-muted-foreground",children:"Use this after an interrupted setup or missing bot configuration."})]})]}),F?n.jsxs("div",{className:"grid gap-3 border-l border-border pl-3 sm:grid-cols-2",children:[n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Mattermost admin username"}),n.jsx("input",{autoComplete:"username",className:pn,name:"mattermost-admin-username",onChange:X=>A({...M,admin_username:X.target.value}),value:M.admin_username})]}),n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Mattermost admin password"}),n.jsx("input",{autoComplete:"current-password",className:pn,minLength:10,name:"mattermost-admin-password",onChange:X=>A({...M,admin_password:X.target.value}),type:"password",value:M.admin_password})]})]}):null,n.jsxs(_,{className:"gap-2","data-agent-repair":!0,disabled:F&&(!M.admin_username||M.admin_password.length<10),onClick:()=>void bu(),children:[n.jsx(cs,{className:"h-4 w-4"}),B?"Finish setup":"Start repair"]})]})})]})}):null,de?n.jsx(ze,{onClose:()=>void Wa(),restoreFocus:()=>document.getElementById("ai-agents")?.focus(),children:n.jsxs(Q,{"aria-labelledby":"claude-auth-title","aria-modal":"true",className:"flex max-h-[92vh] w-full max-w-xl flex-col overflow-hidden",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between border-b border-border",children:[n.jsxs("div",{children:[n.jsx(ge,{id:"claude-auth-title",children:"Connect Claude Code"}),n.jsx(we,{children:"Authorize the LimeOS assistant with your Claude subscription."})]}),n.jsx(_,{"aria-label":"Close Claude authentication",className:"w-11 px-0",onClick:()=>void Wa(),variant:"ghost",children:n.jsx(We,{className:"h-4 w-4"})})]}),n.jsxs(K,{className:"space-y-4 overflow-auto p-4 sm:p-6",children:[n.jsxs("div",{className:q("flex items-center gap-2 text-sm",V?"text-danger":z?"text-success":"text-info"),children:[Ce?n.jsx(me,{className:"h-4 w-4 animate-spin"}):V?n.jsx(ie,{className:"h-4 w-4"}):n.jsx(lt,{className:"h-4 w-4"}),Ce?"Waiting for Claude authorization":V?"Authentication failed":z?"Claude connected":"Preparing authentication"]}),kt?n.jsxs("a",{className:"flex min-h-11 items-center justify-center gap-2 rounded-md border border-info/30 bg-info/10 px-4 font-mono text-sm text-info transition-colors hover:bg-info/15",href:kt,rel:"noreferrer",target:"_blank",children:["Open Claude authorization",n.jsx(ys,{className:"h-4 w-4"})]}):null,qe?n.jsxs("div",{className:"space-y-2",children:[n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Authorization response"}),n.jsx("textarea",{autoComplete:"off",className:q(pn,"min-h-24 resize-y"),name:"claude-authorization-response",onChange:X=>Xe(X.target.value),value:vt})]}),n.jsxs(_,{className:"gap-2",disabled:!vt.trim()||he,onClick:()=>void iv(),children:[he?n.jsx(me,{className:"h-4 w-4 animate-spin"}):n.jsx(la,{className:"h-4 w-4"}),"Submit response"]})]}):null,Xt.length||V?n.jsxs("pre",{className:"max-h-48 overflow-auto rounded-md border border-border bg-black/30 p-3 font-mono text-xs leading-5 text-muted-foreground","data-agent-auth-log":!0,children:[Xt.join(`
 `),V?`
 ${V}`:""]}):null,Ce?null:n.jsxs("div",{className:"flex flex-wrap gap-2",children:[z&&Y?n.jsxs(_,{className:"gap-2",onClick:()=>{Wa().then(()=>qa("repair",!0))},children:[n.jsx(cs,{className:"h-4 w-4"}),"Finish setup"]}):null,n.jsx(_,{onClick:()=>void Wa(),variant:Y?"secondary":"default",children:z?"Done":"Close"})]})]})]})}):null,yn.state.open&&Mt?n.jsx(Og,{confirmLabel:pr?Mt==="uninstall"?"Uninstall AI Agents":"Retry uninstall":Mt==="disable"?"Disable assistant":"Retry disable",confirmation:pr?{expected:"AI Agents"}:void 0,description:pr?Mt==="uninstall"?"Remove the managed assistant runtime while keeping Mattermost, alerts, and the security audit log.":"Continue the interrupted uninstall with fresh Mattermost administrator credentials.":Mt==="disable"?"Stop the assistant while preserving its configuration, history, and Mattermost alert delivery.":"Continue the interrupted assistant disable operation.",destructive:pr,onClose:ov,onConfirm:X=>void cv(X.confirmation),onRetry:dv,ready:!pr||mv,restoreFocus:()=>document.getElementById("ai-agents")?.focus(),state:yn.state,title:pr?Mt==="uninstall"?"Uninstall AI Agents?":"Retry AI Agents uninstall":Mt==="disable"?"Disable AI Agents?":"Retry AI Agents cleanup",children:pr?n.jsxs("div",{className:"space-y-4",children:[n.jsxs("div",{className:"grid gap-3 text-sm sm:grid-cols-2",children:[n.jsxs("div",{className:"border-l-2 border-danger/60 pl-3",children:[n.jsx("p",{className:"font-medium text-danger",children:"Removed"}),n.jsx("p",{className:"mt-1 text-xs leading-5 text-muted-foreground",children:"Assistant services, bot credentials, runtime configuration, provider state, conversations, usage records, and local agent data."})]}),n.jsxs("div",{className:"border-l-2 border-success/60 pl-3",children:[n.jsx("p",{className:"font-medium text-success",children:"Preserved"}),n.jsx("p",{className:"mt-1 text-xs leading-5 text-muted-foreground",children:"Mattermost, alert delivery, channels, messages, other integrations, and the LimeOps security audit log."})]})]}),n.jsxs("div",{className:"grid gap-3 sm:grid-cols-2",children:[n.jsxs("label",{className:"space-y-1.5",children:[n.jsx("span",{className:"text-sm",children:"Mattermost admin username"}),n.jsx("input",{autoComplete:"username",className:pn,"data-agent-uninstall-username":!0,onChange:X=>Cs(ke=>({...ke,admin_username:X.target.value})),value:dn.admin_username})]}),n.jsxs("label",{className:"space-y-1.5",children:[n.jsx("span",{className:"text-sm",children:"Mattermost admin password"}),n.jsx("input",{autoComplete:"current-password",className:pn,"data-agent-uninstall-password":!0,maxLength:256,minLength:10,onChange:X=>Cs(ke=>({...ke,admin_password:X.target.value})),type:"password",value:dn.admin_password})]})]}),Mt==="uninstall"?n.jsxs("label",{className:"flex min-h-11 items-start gap-3 rounded-md border border-border bg-muted/20 px-3 py-2.5 text-sm",children:[n.jsx("input",{checked:dn.remove_claude_code,className:"mt-0.5 h-5 w-5 shrink-0 accent-primary","data-agent-remove-claude":!0,onChange:X=>Cs(ke=>({...ke,remove_claude_code:X.target.checked})),type:"checkbox"}),n.jsxs("span",{children:[n.jsx("span",{className:"block font-medium",children:"Remove Claude Code from this device"}),n.jsx("span",{className:"mt-0.5 block text-xs text-muted-foreground",children:"Removes the LimeOS-managed package, hold, repository, and signing key. Enabled by default."})]})]}):n.jsx("p",{className:"border-l-2 border-info bg-info/5 px-3 py-2 text-xs text-muted-foreground",children:"The original Claude Code removal choice is retained by LimeOS for this retry."})]}):null}):null]})}function FS({canAuthenticate:e,providers:t,onAuthenticate:r}){return n.jsxs("div",{className:"space-y-4",children:[n.jsxs("div",{children:[n.jsx("h3",{className:"font-mono text-sm font-semibold",children:"Providers"}),n.jsx("p",{className:"text-xs text-muted-foreground",children:"The @limeos identity stays the same when providers change."})]}),n.jsx("div",{className:"divide-y divide-border rounded-md border border-border",children:t.map(s=>n.jsxs("div",{className:"flex flex-col gap-4 p-4 sm:flex-row sm:items-center sm:justify-between",children:[n.jsxs("div",{className:"flex items-start gap-3",children:[n.jsx(Vx,{className:"mt-0.5 h-5 w-5 text-info"}),n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium",children:s.name}),n.jsx("p",{className:"text-xs text-muted-foreground",children:s.installed?`Version ${s.version??"unknown"}`:"Not installed"}),n.jsxs("div",{className:"mt-2 flex flex-wrap gap-2",children:[n.jsx(ee,{tone:s.compatible?"success":"warning",children:s.compatible?"Compatible":"Compatibility required"}),n.jsx(ee,{tone:s.authenticated?"success":"neutral",children:s.authenticated?"Authenticated":"Authentication required"})]})]})]}),e&&!s.authenticated?n.jsxs(_,{className:"gap-2 self-start",onClick:r,variant:"info",children:[n.jsx(la,{className:"h-4 w-4"}),"Authenticate"]}):null]},s.id))})]})}function VS({permissions:e}){return e?n.jsxs("div",{className:"space-y-5",children:[n.jsxs("div",{className:"flex flex-col gap-2 sm:flex-row sm:items-start sm:justify-between",children:[n.jsxs("div",{children:[n.jsx("h3",{className:"font-mono text-sm font-semibold",children:"Read-only permissions"}),n.jsx("p",{className:"text-xs text-muted-foreground",children:"Enforced by LimeOps independently of Claude."})]}),n.jsxs(ee,{tone:"success",children:[n.jsx(jt,{className:"h-3.5 w-3.5"}),e.profile.replace("_"," ")]})]}),n.jsx("div",{className:"divide-y divide-border rounded-md border border-border",children:e.allowed_operations.map(t=>n.jsxs("div",{className:"grid gap-2 p-3 sm:grid-cols-[minmax(10rem,0.7fr)_1fr] sm:items-center",children:[n.jsx("code",{className:"text-xs text-foreground",children:US(t)}),n.jsx("div",{className:"flex flex-wrap gap-1.5",children:e.resources[t]?.length?e.resources[t].map(r=>n.jsx(ee,{children:r},r)):n.jsx("span",{className:"text-xs text-dim",children:"No resource restriction"})})]},t))}),n.jsxs("div",{children:[n.jsx("h4",{className:"mb-2 font-mono text-xs font-semibold text-muted-foreground",children:"Explicitly denied"}),n.jsx("div",{className:"flex flex-wrap gap-2",children:e.denied_capabilities.map(t=>n.jsx(ee,{tone:"danger",children:t},t))})]})]}):n.jsx(vl,{icon:jt,text:"Permission data is unavailable."})}function qS({usage:e}){return e?n.jsxs("div",{className:"space-y-5",children:[n.jsx("div",{className:"grid gap-px overflow-hidden rounded-md border border-border bg-border sm:grid-cols-3",children:[["Turns",e.totals.total_turns??0],["Provider calls",e.totals.total_invocations??0],["Calls today",e.totals.invocations_today??0]].map(([t,r])=>n.jsxs("div",{className:"bg-card p-4",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase text-dim",children:t}),n.jsx("p",{className:"mt-1 font-mono text-xl",children:r})]},t))}),e.records.length?n.jsx("div",{className:"overflow-x-auto rounded-md border border-border",children:n.jsxs("table",{className:"w-full min-w-[640px] text-left text-xs",children:[n.jsx("thead",{className:"border-b border-border bg-muted/30 font-mono text-dim",children:n.jsxs("tr",{children:[n.jsx("th",{className:"p-3 font-medium",children:"Time"}),n.jsx("th",{className:"p-3 font-medium",children:"Outcome"}),n.jsx("th",{className:"p-3 font-medium",children:"Rounds"}),n.jsx("th",{className:"p-3 font-medium",children:"Duration"}),n.jsx("th",{className:"p-3 font-medium",children:"Tools"})]})}),n.jsx("tbody",{className:"divide-y divide-border",children:e.records.map((t,r)=>n.jsxs("tr",{children:[n.jsx("td",{className:"whitespace-nowrap p-3",children:gl(t.at)}),n.jsx("td",{className:"p-3",children:n.jsx(ee,{tone:t.outcome==="ok"?"success":t.outcome==="limit"?"warning":"danger",children:t.outcome??"unknown"})}),n.jsx("td",{className:"p-3 font-mono",children:t.rounds??0}),n.jsx("td",{className:"p-3 font-mono",children:OS(t.duration_seconds)}),n.jsx("td",{className:"p-3",children:n.jsx("span",{className:"line-clamp-2",children:t.tool_operations?.join(", ")||"None"})})]},t.correlation_id??r))})]})}):n.jsx(vl,{icon:nu,text:"No assistant turns have been recorded."})]}):n.jsx(vl,{icon:Je,text:"No usage data is available yet."})}function HS({audit:e}){return e?.records.length?n.jsxs("div",{className:"space-y-4",children:[n.jsxs("div",{children:[n.jsx("h3",{className:"font-mono text-sm font-semibold",children:"LimeOps audit"}),n.jsx("p",{className:"text-xs text-muted-foreground",children:"Recent broker decisions and read-only tool execution results."})]}),n.jsx("div",{className:"overflow-x-auto rounded-md border border-border",children:n.jsxs("table",{className:"w-full min-w-[720px] text-left text-xs",children:[n.jsx("thead",{className:"border-b border-border bg-muted/30 font-mono text-dim",children:n.jsxs("tr",{children:[n.jsx("th",{className:"p-3 font-medium",children:"Time"}),n.jsx("th",{className:"p-3 font-medium",children:"Actor"}),n.jsx("th",{className:"p-3 font-medium",children:"Operation"}),n.jsx("th",{className:"p-3 font-medium",children:"Phase"}),n.jsx("th",{className:"p-3 font-medium",children:"Result"}),n.jsx("th",{className:"p-3 font-medium",children:"Duration"})]})}),n.jsx("tbody",{className:"divide-y divide-border",children:e.records.map((t,r)=>n.jsxs("tr",{children:[n.jsx("td",{className:"whitespace-nowrap p-3",children:gl(t.ts)}),n.jsx("td",{className:"p-3",children:t.actor_username??t.actor_id??t.actor_type??"system"}),n.jsx("td",{className:"p-3 font-mono",children:t.operation??"-"}),n.jsx("td",{className:"p-3",children:t.phase??"-"}),n.jsx("td",{className:"p-3",children:n.jsx(ee,{tone:t.ok?"success":"danger",children:t.ok?"Allowed":t.error_code??"Denied"})}),n.jsx("td",{className:"p-3 font-mono",children:t.duration_ms===void 0?"-":`${t.duration_ms} ms`})]},t.audit_id??`${t.request_id}-${r}`))})]})})]}):n.jsx(vl,{icon:jt,text:"No LimeOps audit events have been recorded."})}function vl({icon:e,text:t}){return n.jsxs("div",{className:"flex min-h-36 flex-col items-center justify-center gap-2 text-center text-muted-foreground",children:[n.jsx(e,{className:"h-5 w-5"}),n.jsx("p",{className:"text-sm",children:t})]})}async function WS(e){const t=await W("/api/integrations/mattermost",{method:"GET",signal:e});return{...t,...Vg("mattermost",t)}}async function GS(e,t,r){const s=await $n("/api/integrations/mattermost/install",{...e},r);await In(s.stream_url,a=>{if(t(a),a.error)throw new Error(a.error)},r)}function KS(e,t){return ur("mattermost","disable",{},e,{signal:t})}function QS(e,t){return ur("mattermost","enable",{},e,{signal:t})}function JS(e,t,r){return ur("mattermost","uninstall",{confirmation:e},t,{signal:r})}function YS(e,t,r){return ur("mattermost","purge",{confirmation:e,acknowledge_data_loss:!0},t,{signal:r})}function XS(e,t,r,s){return ur("mattermost","retry_cleanup",t,r,{cleanupAction:e,signal:s})}async function ZS(e){return(await W("/api/integrations/mattermost/policy",{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)})).policy}function e_(){return W("/api/integrations/mattermost/test",{method:"POST"})}function t_(e){return W("/api/integrations/packages/pending",{method:"GET",signal:e})}function n_(e,t){return W("/api/integrations/packages/approve",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({name:e,version:t})})}function r_(e){return W("/api/integrations/stack-notifications",{method:"GET",signal:e})}function s_(e){return W("/api/integrations/stack-notifications/mode",{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify({mode:e})})}async function a_(e,t,r){const s=await $n("/api/integrations/stack-notifications/enable",{admin_password:e},r);await In(s.stream_url,a=>{if(t(a),a.error)throw new Error(a.error)},r)}function Op(e){return e instanceof Error?e.message:"The request failed"}function i_({refreshKey:e}){const[t,r]=d.useState(null),[s,a]=d.useState(null),[i,l]=d.useState(null),o=d.useCallback(async u=>{try{const h=await t_(u);r(h.pending??[]),a(null)}catch(h){u?.aborted||a(Op(h))}},[]);d.useEffect(()=>{const u=new AbortController;return o(u.signal),()=>u.abort()},[o,e]);async function c(u){l(u.name);try{await n_(u.name,u.candidate),await o(),a(null)}catch(h){a(Op(h))}finally{l(null)}}return t!==null&&t.length===0&&!s?null:n.jsxs(Q,{className:"overflow-hidden",children:[n.jsx(xe,{className:"border-b border-border/70 bg-muted/20",children:n.jsxs("div",{className:"flex items-center gap-3",children:[n.jsx("span",{className:"flex h-11 w-11 items-center justify-center rounded-md border border-warning/30 bg-warning/10 text-warning",children:n.jsx(pN,{className:"h-5 w-5"})}),n.jsxs("div",{children:[n.jsx(ge,{children:"Package updates"}),n.jsx(we,{children:"Held updates awaiting approval — applied on the next nightly run"})]})]})}),n.jsxs(K,{className:"space-y-3 p-4 sm:p-6",children:[s?n.jsxs("div",{className:"flex items-start gap-2 border-l-2 border-danger bg-danger/5 px-3 py-2 text-sm text-danger",role:"alert",children:[n.jsx(ie,{className:"mt-0.5 h-4 w-4 shrink-0"}),s]}):null,n.jsx("ul",{className:"divide-y divide-border rounded-md border border-border",children:(t??[]).map(u=>n.jsxs("li",{className:"flex flex-wrap items-center justify-between gap-3 p-3","data-package-update":u.name,children:[n.jsxs("div",{className:"min-w-0",children:[n.jsxs("p",{className:"flex items-center gap-2 text-sm font-medium",children:[u.name,u.critical?n.jsxs(ee,{tone:"danger",className:"gap-1",children:[n.jsx(Ua,{className:"h-3 w-3"}),"critical"]}):null]}),n.jsxs("p",{className:"font-mono text-xs text-muted-foreground",children:[u.installed??"—"," → ",u.candidate]})]}),u.approved?n.jsxs("span",{className:"flex items-center gap-1.5 text-sm text-success",children:[n.jsx(lt,{className:"h-4 w-4"}),"Approved — applies next run"]}):n.jsx(_,{"data-approve":u.name,disabled:i===u.name,onClick:()=>void c(u),size:"sm",children:i===u.name?"Approving…":`Approve ${u.candidate}`})]},u.name))}),n.jsx("p",{className:"text-xs text-muted-foreground",children:"Approving records who approved what; the nightly reconcile then installs and holds the approved version. A newer release from the fleet manifest always takes precedence."})]})]})}const l_="min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 text-sm text-foreground focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring";function Do(e){return e instanceof Error?e.message:"The request failed"}function Uo(e){return`${window.location.origin}/api/integrations/stack-notifications/hook/${e}`}function o_({refreshKey:e}){const[t,r]=d.useState(null),[s,a]=d.useState(null),[i,l]=d.useState(null),[o,c]=d.useState(!1),[u,h]=d.useState(!1),[m,f]=d.useState(!1),[w,j]=d.useState(""),[y,b]=d.useState(!1),[v,p]=d.useState([]),x=d.useCallback(async()=>{try{r(await r_()),a(null)}catch(k){a(Do(k))}},[]);d.useEffect(()=>{x()},[x,e]);async function g(){if(!t)return;const k=t.mode==="quiet"?"verbose":"quiet";c(!0);try{r(await s_(k)),l(k==="verbose"?"Verbose: every event is forwarded.":"Quiet: only imports, upgrades, health, and failures."),a(null)}catch(O){a(Do(O))}finally{c(!1)}}async function N(){if(t?.token)try{await navigator.clipboard.writeText(Uo(t.token)),h(!0),window.setTimeout(()=>h(!1),1500)}catch{a("Copy failed — select and copy the URL manually.")}}async function E(){b(!0),p(["Connecting to Mattermost..."]),a(null);try{await a_(w,k=>{k.line&&p(O=>[...O,k.line]),k.error&&p(O=>[...O,k.error])}),j(""),f(!1),l("Stack notifications channel is ready."),await x()}catch(k){a(Do(k))}finally{b(!1)}}const C=!!t?.configured;return n.jsxs(Q,{className:"overflow-hidden",children:[n.jsx(xe,{className:"border-b border-border/70 bg-muted/20",children:n.jsxs("div",{className:"flex flex-col gap-4 sm:flex-row sm:items-center sm:justify-between",children:[n.jsxs("div",{className:"flex items-center gap-3",children:[n.jsx("span",{className:"flex h-11 w-11 items-center justify-center rounded-md border border-primary/30 bg-primary/10 text-primary",children:n.jsx(qm,{className:"h-5 w-5"})}),n.jsxs("div",{children:[n.jsx(ge,{children:"Stack notifications"}),n.jsx(we,{children:"Radarr / Sonarr / *arr events in a dedicated Mattermost channel"})]})]}),n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx(fe,{label:C?t?.enabled?"connected":"disabled":"not set up",tone:C&&t?.enabled?"success":"neutral"}),C?null:n.jsxs(_,{className:"gap-2","data-stack-notifications-enable":!0,onClick:()=>f(!0),children:[n.jsx(ot,{className:"h-4 w-4"}),"Set up"]})]})]})}),n.jsxs(K,{className:"space-y-4 p-4 sm:p-6",children:[i?n.jsxs("div",{className:"flex items-center justify-between gap-3 border-l-2 border-success bg-success/5 px-3 py-2 text-sm text-success",role:"status",children:[n.jsxs("span",{className:"flex items-center gap-2",children:[n.jsx(lt,{className:"h-4 w-4"}),i]}),n.jsx(_,{"aria-label":"Dismiss",className:"h-8 min-h-8 w-8 px-0",onClick:()=>l(null),variant:"ghost",children:n.jsx(We,{className:"h-4 w-4"})})]}):null,s?n.jsxs("div",{className:"flex items-start gap-2 border-l-2 border-danger bg-danger/5 px-3 py-2 text-sm text-danger",role:"alert",children:[n.jsx(ie,{className:"mt-0.5 h-4 w-4 shrink-0"}),s]}):null,C?n.jsxs("div",{className:"space-y-4",children:[n.jsxs("div",{children:[n.jsx("p",{className:"font-mono text-[10px] uppercase text-dim",children:"Webhook URL for your *arr apps"}),n.jsxs("div",{className:"mt-1 flex items-center gap-2",children:[n.jsx("code",{className:"min-w-0 flex-1 truncate rounded-md border border-border bg-black/30 px-3 py-2 font-mono text-xs","data-stack-notifications-url":!0,title:t?.token?Uo(t.token):"",children:t?.token?Uo(t.token):"—"}),n.jsx(_,{"aria-label":"Copy webhook URL",className:"h-9 min-h-9 gap-1 px-2",onClick:()=>void N(),variant:"outline",children:u?n.jsx(lt,{className:"h-4 w-4 text-success"}):n.jsx(Iw,{className:"h-4 w-4"})})]}),n.jsxs("p",{className:"mt-1 text-xs text-muted-foreground",children:["In each app add a ",n.jsx("strong",{children:"Webhook"})," connection (Settings → Connect), method POST, to this URL. Delivers to"," ","~",t?.channel_name??"stack-notifications","."]})]}),n.jsxs("div",{className:"flex items-start justify-between gap-4 rounded-md border border-border p-3",children:[n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium",children:"Forwarding"}),n.jsx("p",{className:"text-xs text-muted-foreground",children:t?.mode==="verbose"?"Verbose — every event including grabs and renames.":"Quiet — imports, upgrades, health, and failures only."})]}),n.jsxs("label",{className:"inline-flex min-h-11 cursor-pointer items-center gap-2",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:t?.mode==="verbose"?"Verbose":"Quiet"}),n.jsx("input",{checked:t?.mode==="verbose",className:"h-5 w-5 accent-primary",disabled:o,onChange:()=>void g(),type:"checkbox"})]})]})]}):n.jsxs("p",{className:"text-sm text-muted-foreground",children:["Create a dedicated ",n.jsx("span",{className:"font-mono",children:"~stack-notifications"})," channel and a webhook your *arr apps post to. New Mattermost installs get this automatically; use ",n.jsx("strong",{children:"Set up"})," to add it to an existing install."]})]}),m?n.jsx(ze,{onClose:y?()=>{}:()=>f(!1),children:n.jsxs(Q,{"aria-labelledby":"stack-notifications-enable-title","aria-modal":"true",className:"w-full max-w-md",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between border-b border-border",children:[n.jsxs("div",{children:[n.jsx(ge,{id:"stack-notifications-enable-title",children:"Set up stack notifications"}),n.jsx(we,{children:"Confirm your Mattermost admin password to create the channel and webhook."})]}),n.jsx(_,{"aria-label":"Close",className:"w-11 px-0",disabled:y,onClick:()=>f(!1),variant:"ghost",children:n.jsx(We,{className:"h-4 w-4"})})]}),n.jsx(K,{className:"space-y-4 p-4 sm:p-6",children:y||v.length?n.jsxs("div",{className:"space-y-3",children:[n.jsxs("div",{className:q("flex items-center gap-2 text-sm",s?"text-danger":"text-info"),children:[y?n.jsx(me,{className:"h-4 w-4 animate-spin"}):s?n.jsx(ie,{className:"h-4 w-4"}):n.jsx(lt,{className:"h-4 w-4"}),y?"Creating channel":s?"Setup failed":"Done"]}),n.jsx("pre",{className:"max-h-56 overflow-auto rounded-md border border-border bg-black/30 p-3 font-mono text-xs leading-5 text-muted-foreground",children:v.join(`
-`)}),y?null:n.jsx(_,{onClick:()=>f(!1),children:"Close"})]}):n.jsxs(n.Fragment,{children:[n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Mattermost admin password"}),n.jsx("input",{autoComplete:"current-password",className:l_,onChange:k=>j(k.target.value),type:"password",value:w})]}),n.jsxs(_,{className:"w-full gap-2","data-stack-notifications-confirm":!0,disabled:w.length<1,onClick:()=>void E(),children:[n.jsx(qm,{className:"h-4 w-4"}),"Create channel"]})]})})]})}):null]})}const tn="min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 text-sm text-foreground focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring",c_={site_url:`${window.location.protocol}//${window.location.hostname}:8065`,admin_username:"limeadmin",admin_email:"",admin_password:"",stack_name:"mattermost",team_name:"limeos",channel_name:"limeos-alerts",timezone:Intl.DateTimeFormat().resolvedOptions().timeZone||"Europe/London",poll_seconds:60,fail_threshold:2},Dp={container:{label:"Containers",description:"Long-running containers that stop or become unhealthy"},smart:{label:"SMART",description:"Disk health assessments that report a failure"},mount:{label:"Mounts",description:"Required mountpoints that disappear"},snapraid:{label:"SnapRAID",description:"Parity errors, degradation, or a required sync"}};function yi(e){return e instanceof Error?e.message:"The request failed"}function Up(e){if(!e)return"Never";const t=typeof e=="number"?new Date(e*1e3):new Date(e);return Number.isNaN(t.getTime())?"Unknown":t.toLocaleString()}function d_(e){return e==="connected"?"success":e==="degraded"||e==="retained_data"?"warning":e==="disconnected"||e==="cleanup_required"?"danger":"neutral"}function Bo(e){return e.replace(/_/g," ")}function u_(){const{permissions:e}=Ln(),[t,r]=d.useState(null),[s,a]=d.useState(!0),[i,l]=d.useState(null),[o,c]=d.useState("overview"),[u,h]=d.useState(!1),[m,f]=d.useState(c_),[w,j]=d.useState(!1),[y,b]=d.useState([]),[v,p]=d.useState(!1),[x,g]=d.useState(!1),[N,E]=d.useState(""),[C,k]=d.useState(null),[O,S]=d.useState(!1),[$,R]=d.useState(null),[H,I]=d.useState(0),[U,L]=d.useState(null),[B,P]=d.useState(null),M=d.useCallback(()=>{I(z=>z+1)},[]),A=Hg(M),F=d.useCallback(async()=>{try{const z=await WS();r(z),E(z.policy.required_mounts.join(", ")),l(null)}catch(z){l(yi(z))}finally{a(!1)}},[]);d.useEffect(()=>{F()},[H,F]);const D=d.useMemo(()=>{const z={container:[],smart:[],mount:[],snapraid:[]};return t?.resources.forEach(T=>z[T.kind]?.push(T)),z},[t]);async function G(){j(!0),b(["Starting Mattermost setup..."]),l(null);try{await GS(m,z=>{z.line&&b(T=>[...T,z.line]),z.error&&(l(z.error),b(T=>[...T,z.error]))}),M(),R("Mattermost and LimeOS alerts are connected.")}catch(z){l(yi(z))}finally{j(!1)}}async function se(z,T){if(!t)return;const Y=t.policy;r({...t,policy:z}),g(!0);try{const re=await ZS(z);r(he=>he&&{...he,policy:re}),R(T??"Alert policy saved."),l(null)}catch(re){r(he=>he&&{...he,policy:Y}),l(yi(re))}finally{g(!1)}}function de(z){t&&se({...t.policy,categories:{...t.policy.categories,[z]:{enabled:!t.policy.categories[z].enabled}}})}function ue(z){return t?.policy.silences.find(T=>T.kind===z.kind&&T.key===z.key)}function Ce(){if(!t||!C)return;const z=new Date,T=new Date(z);C.duration==="1h"&&T.setHours(T.getHours()+1),C.duration==="24h"&&T.setHours(T.getHours()+24);const Y={...t.policy,silences:[...t.policy.silences.filter(re=>re.key!==C.resource.key),{kind:C.resource.kind,key:C.resource.key,created_at:z.toISOString(),expires_at:C.duration==="permanent"?null:T.toISOString(),reason:C.reason.trim()}]};k(null),se(Y,`${C.resource.key} silenced.`)}async function Re(){S(!0);try{await e_(),R("Test alert sent to Mattermost."),l(null),await F()}catch(z){l(yi(z))}finally{S(!1)}}function pe(z){L(z),A.open()}function Ft(){A.state.phase!=="running"&&(A.close(),L(null))}async function kt(z,T=!1){const Y=U;if(!Y)return;const re=Y.replace("retry_",""),he=Y.startsWith("retry_");if((re==="uninstall"||re==="purge")&&z!=="Mattermost"||re==="purge"&&!T)return;const _e=re==="uninstall"?{confirmation:"Mattermost"}:re==="purge"?{confirmation:"Mattermost",acknowledge_data_loss:!0}:{};await A.run(Ze=>he?XS(re,_e,Ze):re==="disable"?KS(Ze):re==="enable"?QS(Ze):re==="uninstall"?JS("Mattermost",Ze):YS("Mattermost",Ze))&&R(re==="disable"?"Mattermost and alert delivery are disabled. Configuration and chat data are preserved.":re==="enable"?"Mattermost and alert delivery are enabled.":re==="uninstall"?"Mattermost was uninstalled. Chat data is retained for reinstall or deletion.":"Mattermost and all retained chat data were deleted.")}function rt(){if(U==="uninstall"||U==="retry_uninstall"){L("retry_uninstall"),A.reconfirm();return}if(U==="purge"||U==="retry_purge"){L("retry_purge"),A.reconfirm();return}A.retry()}function vt(z){const T=gS(z);T&&(P(null),window.requestAnimationFrame(()=>{const Y=document.getElementById(T.anchor);Y?.scrollIntoView({behavior:"smooth",block:"center"}),Y?.focus()}))}const Xe=e.includes("extensions.admin"),qe=new Set(t?.allowed_actions??[]),Ge=t?.cleanup_operation?.action,Xt=t?.cleanup_operation?.retryable?Ge==="disable"?"retry_disable":Ge==="enable"?"retry_enable":Ge==="uninstall"?"retry_uninstall":Ge==="purge"?"retry_purge":null:null,Fe=[];qe.has("enable")&&Fe.push({id:"enable",label:"Enable",Icon:iu,onSelect:()=>pe("enable"),tone:"info",data:{"data-mattermost-lifecycle-action":"enable"}}),qe.has("disable")&&Fe.push({id:"disable",label:"Disable",Icon:ia,onSelect:()=>pe("disable"),tone:"danger",data:{"data-mattermost-lifecycle-action":"disable"}}),t?.blocked_actions.forEach(z=>{Fe.push({id:`blocked-${z.action}`,label:`${z.action==="disable"?"Disable":"Uninstall"} (AI Agents first)`,Icon:z.action==="disable"?ia:Kt,onSelect:()=>P(z),separatorBefore:Fe.length>0&&z.action==="uninstall",tone:"danger",data:{"data-mattermost-blocked-action":z.action}})}),qe.has("uninstall")&&Fe.push({id:"uninstall",label:"Uninstall",Icon:Kt,onSelect:()=>pe("uninstall"),separatorBefore:Fe.length>0,tone:"danger",data:{"data-mattermost-lifecycle-action":"uninstall"}}),qe.has("purge")&&Fe.push({id:"purge",label:"Delete retained data",Icon:ul,onSelect:()=>pe("purge"),separatorBefore:Fe.length>0,tone:"danger",data:{"data-mattermost-lifecycle-action":"purge"}}),qe.has("retry_cleanup")&&Xt&&Fe.push({id:"retry_cleanup",label:"Retry cleanup",Icon:je,onSelect:()=>pe(Xt),tone:"info",data:{"data-mattermost-lifecycle-action":"retry_cleanup"}});const V=U==="uninstall"||U==="retry_uninstall"||U==="purge"||U==="retry_purge",te=U==="purge"||U==="retry_purge";return n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",disabled:s,onClick:()=>{a(!0),M()},variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",s&&"animate-spin")}),"Refresh"]}),description:"Chat delivery, alert policy, and automation connections",title:"integrations"}),$?n.jsxs("div",{className:"flex items-center justify-between gap-3 border-l-2 border-success bg-success/5 px-4 py-3 text-sm text-success",role:"status",children:[n.jsxs("span",{className:"flex items-center gap-2",children:[n.jsx(lt,{className:"h-4 w-4"}),$]}),n.jsx(_,{"aria-label":"Dismiss notice",className:"h-9 min-h-9 w-9 px-0",onClick:()=>R(null),variant:"ghost",children:n.jsx(We,{className:"h-4 w-4"})})]}):null,i?n.jsxs("div",{className:"flex items-start gap-2 border-l-2 border-danger bg-danger/5 px-4 py-3 text-sm text-danger",role:"alert",children:[n.jsx(ie,{className:"mt-0.5 h-4 w-4 shrink-0"}),i]}):null,n.jsxs(Q,{className:"overflow-hidden","data-mattermost-integration":!0,id:"mattermost-integration",tabIndex:-1,children:[n.jsx(xe,{className:"border-b border-border/70 bg-muted/20",children:n.jsxs("div",{className:"flex flex-col gap-4 sm:flex-row sm:items-center sm:justify-between",children:[n.jsxs("div",{className:"flex items-center gap-3",children:[n.jsx("span",{className:"flex h-11 w-11 items-center justify-center rounded-md border border-info/30 bg-info/10 text-info",children:n.jsx(Qc,{className:"h-5 w-5"})}),n.jsxs("div",{children:[n.jsx(ge,{children:"Mattermost"}),n.jsx(we,{children:"Private chat for LimeOS incidents and agent investigations"})]})]}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(fe,{label:Bo(t?.state??"loading"),tone:t?d_(t.state):"neutral"}),Xe&&qe.has("setup")&&!t?.retained_data?n.jsxs(_,{className:"gap-2","data-mattermost-setup":!0,onClick:()=>h(!0),children:[n.jsx(ot,{className:"h-4 w-4"}),"Set up"]}):null,Xe&&Fe.length?n.jsx(Ba,{items:Fe,label:"Manage Mattermost",menuData:{"data-mattermost-lifecycle-menu":"mattermost"},triggerData:{"data-mattermost-lifecycle-menu-trigger":"mattermost"}}):null]})]})}),t?.cleanup_required?n.jsxs(K,{className:"space-y-4 p-4 sm:p-6",children:[n.jsxs("div",{className:"flex items-start gap-3 border-l-2 border-danger bg-danger/5 px-4 py-3",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-danger"}),n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium text-danger",children:"Cleanup needs attention"}),n.jsxs("p",{className:"mt-1 text-xs text-muted-foreground",children:["Mattermost remains unavailable until LimeOS finishes the interrupted ",Ge?Bo(Ge):"cleanup"," operation."]})]})]}),n.jsxs("div",{className:"grid gap-px overflow-hidden rounded-md border border-border bg-border sm:grid-cols-3",children:[n.jsxs("div",{className:"bg-card p-3",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase text-dim",children:"Operation"}),n.jsx("p",{className:"mt-1 text-sm",children:Ge?Bo(Ge):"unknown"})]}),n.jsxs("div",{className:"bg-card p-3",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase text-dim",children:"Recovery"}),n.jsx("p",{className:"mt-1 text-sm",children:t.cleanup_operation?.state??"unavailable"})]}),n.jsxs("div",{className:"bg-card p-3",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase text-dim",children:"Updated"}),n.jsx("p",{className:"mt-1 text-sm",children:Up(t.cleanup_operation?.updated_at)})]})]}),Xe&&qe.has("retry_cleanup")&&Xt?n.jsxs(_,{className:"gap-2","data-mattermost-retry-cleanup":!0,onClick:()=>pe(Xt),variant:"warning",children:[n.jsx(je,{className:"h-4 w-4"}),"Retry cleanup"]}):n.jsx("p",{className:"text-sm text-muted-foreground",children:Xe?"Recovery details are unavailable. Refresh the page before retrying.":"An administrator must finish the cleanup."})]}):t?.retained_data?n.jsxs(K,{className:"space-y-5 p-4 sm:p-6",children:[n.jsxs("div",{className:"flex items-start gap-3 border-l-2 border-warning bg-warning/5 px-4 py-3",children:[n.jsx(ul,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-warning"}),n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium",children:"Mattermost data is retained"}),n.jsx("p",{className:"mt-1 text-xs leading-5 text-muted-foreground",children:"The services and alert delivery are removed. Database records, messages, uploads, plugins, and retained logs remain available for a reinstall."})]})]}),n.jsxs("div",{className:"flex flex-wrap gap-2",children:[Xe&&qe.has("setup")?n.jsxs(_,{className:"gap-2","data-mattermost-retained-setup":!0,onClick:()=>h(!0),children:[n.jsx(ot,{className:"h-4 w-4"}),"Set up again"]}):null,Xe&&qe.has("purge")?n.jsxs(_,{className:"gap-2","data-mattermost-purge":!0,onClick:()=>pe("purge"),variant:"danger",children:[n.jsx(Kt,{className:"h-4 w-4"}),"Delete data"]}):null]}),qe.has("purge")?null:n.jsx("p",{className:"text-xs text-muted-foreground",children:"Permanent data deletion is not available in this release."})]}):t?.installed?n.jsxs(n.Fragment,{children:[n.jsx("div",{"aria-label":"Mattermost views",className:"flex overflow-x-auto border-b border-border px-4",role:"tablist",children:["overview","policy"].map(z=>n.jsx("button",{"aria-controls":`mattermost-panel-${z}`,"aria-selected":o===z,className:q("min-h-11 border-b-2 px-4 font-mono text-xs capitalize",o===z?"border-primary text-primary":"border-transparent text-muted-foreground hover:text-foreground"),id:`mattermost-tab-${z}`,onClick:()=>c(z),onKeyDown:Yl,role:"tab",tabIndex:o===z?0:-1,type:"button",children:z==="policy"?"Alert policy":z},z))}),n.jsxs(K,{"aria-labelledby":`mattermost-tab-${o}`,className:"p-4 sm:p-6",id:`mattermost-panel-${o}`,role:"tabpanel",children:[o==="overview"?n.jsxs("div",{className:"space-y-5",children:[t.state==="disabled"?n.jsxs("div",{className:"flex items-start gap-3 border-l-2 border-warning bg-warning/5 px-4 py-3",children:[n.jsx(ia,{className:"mt-0.5 h-4 w-4 shrink-0 text-warning"}),n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium",children:"Mattermost is disabled"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Chat, alert delivery, and the full managed stack are stopped. Configuration and chat data are preserved."})]})]}):null,n.jsx("div",{className:"grid gap-px overflow-hidden rounded-md border border-border bg-border sm:grid-cols-2 xl:grid-cols-5",children:[["Site",t.site_url??"Unknown"],["Channel",`~${t.channel}`],["Webhook",t.webhook_configured?"Configured":"Missing"],["Services",`${Object.values(t.services??{}).filter(z=>z.state==="running").length||3}/3 running`],["Last delivery",Up(t.delivery.at)]].map(([z,T])=>n.jsxs("div",{className:"min-w-0 bg-card p-3",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase text-dim",children:z}),n.jsx("p",{className:"mt-1 truncate text-sm",title:T,children:T})]},z))}),t.state!=="disabled"?n.jsxs("div",{className:"flex flex-wrap gap-2",children:[n.jsxs(_,{className:"gap-2",disabled:O,onClick:()=>void Re(),variant:"info",children:[O?n.jsx(me,{className:"h-4 w-4 animate-spin"}):n.jsx(Fx,{className:"h-4 w-4"}),O?"Sending":"Send test alert"]}),t.site_url?n.jsxs("a",{className:"inline-flex min-h-11 items-center gap-2 rounded-md border border-border px-4 font-mono text-sm hover:bg-muted",href:t.site_url,rel:"noreferrer",target:"_blank",children:["Open Mattermost",n.jsx(ys,{className:"h-4 w-4"})]}):null]}):null,t.incidents.length?n.jsxs("div",{children:[n.jsx("h3",{className:"mb-2 font-mono text-sm font-semibold",children:"Active incidents"}),n.jsx("div",{className:"divide-y divide-border rounded-md border border-border",children:t.incidents.map(z=>n.jsxs("div",{className:"flex items-start justify-between gap-3 p-3",children:[n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium",children:z.key}),n.jsx("p",{className:"text-xs text-muted-foreground",children:z.summary})]}),n.jsx(ee,{tone:z.severity==="critical"?"danger":"warning",children:z.severity})]},z.key))})]}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No active incidents."})]}):null,o==="policy"?n.jsxs("div",{className:"space-y-5",children:[n.jsxs("div",{className:"flex items-center justify-between",children:[n.jsxs("div",{children:[n.jsx("h3",{className:"font-mono text-sm font-semibold",children:"Alert categories"}),n.jsx("p",{className:"text-xs text-muted-foreground",children:"Choose which checks can notify Mattermost."})]}),x?n.jsx(me,{className:"h-4 w-4 animate-spin text-primary"}):null]}),n.jsx("div",{className:"divide-y divide-border rounded-md border border-border",children:Object.keys(Dp).map(z=>{const T=Dp[z],Y=t.policy.categories[z].enabled;return n.jsxs("div",{className:"p-3 sm:p-4",children:[n.jsxs("div",{className:"flex items-start justify-between gap-4",children:[n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium",children:T.label}),n.jsx("p",{className:"text-xs text-muted-foreground",children:T.description})]}),n.jsxs("label",{className:"inline-flex min-h-11 cursor-pointer items-center gap-2",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:Y?"On":"Off"}),n.jsx("input",{checked:Y,className:"h-5 w-5 accent-primary",disabled:x,onChange:()=>de(z),type:"checkbox"})]})]}),D[z].length?n.jsx("div",{className:"mt-3 grid gap-2 sm:grid-cols-2",children:D[z].map(re=>{const he=ue(re);return n.jsxs("div",{className:"flex min-h-12 items-center justify-between gap-2 rounded-md bg-muted/35 px-3",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"truncate font-mono text-xs",title:re.key,children:re.key.replace(`${z}:`,"")}),n.jsx("p",{className:q("text-[11px]",re.ok?"text-success":"text-warning"),children:re.ok?"Healthy":re.summary})]}),he?n.jsxs(_,{"aria-label":`Remove silence for ${re.key}`,className:"h-9 min-h-9 gap-1 px-2",onClick:()=>void se({...t.policy,silences:t.policy.silences.filter(_e=>_e.key!==re.key)},`${re.key} unsilenced.`),title:"Remove silence",variant:"warning",children:[n.jsx(nu,{className:"h-3.5 w-3.5"}),n.jsx(We,{className:"h-3.5 w-3.5"})]}):n.jsx(_,{"aria-label":`Silence ${re.key}`,className:"h-9 min-h-9 px-2",onClick:()=>k({resource:re,duration:"1h",reason:""}),title:"Silence resource",variant:"ghost",children:n.jsx(Vm,{className:"h-4 w-4"})})]},re.key)})}):n.jsx("p",{className:"mt-2 text-xs text-dim",children:"No resources discovered yet."})]},z)})}),n.jsxs("div",{className:"space-y-2 border-t border-border pt-5",children:[n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"font-mono text-xs font-semibold",children:"Required mountpoints"}),n.jsx("input",{className:tn,onChange:z=>E(z.target.value),placeholder:"/mnt/media, /mnt/parity",value:N})]}),n.jsx("div",{className:"flex justify-end",children:n.jsx(_,{disabled:x,onClick:()=>void se({...t.policy,required_mounts:N.split(",").map(z=>z.trim()).filter(Boolean)}),size:"sm",children:"Save mounts"})})]})]}):null]})]}):n.jsx(K,{className:"p-4 sm:p-6",children:n.jsx("div",{className:"grid gap-4 sm:grid-cols-3",children:[[Gm,"One managed stack","Postgres, Mattermost, and alerts install together."],[Ua,"Clear alert controls","Enable categories and silence individual resources."],[os,"Agent-ready","The same channel will support guided investigations."]].map(([z,T,Y])=>{const re=z;return n.jsxs("div",{className:"border-l border-border pl-3",children:[n.jsx(re,{className:"mb-2 h-4 w-4 text-primary"}),n.jsx("p",{className:"text-sm font-medium",children:T}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:Y})]},T)})})})]}),n.jsx(BS,{onLifecycleChanged:M,refreshKey:H}),n.jsx(o_,{refreshKey:H}),n.jsx(i_,{refreshKey:H}),u?n.jsx(ze,{onClose:w?()=>{}:()=>h(!1),restoreFocus:()=>document.getElementById("mattermost-integration")?.focus(),children:n.jsxs(Q,{"aria-labelledby":"mattermost-setup-title","aria-modal":"true",className:"flex max-h-[92vh] w-full max-w-2xl flex-col overflow-hidden",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between border-b border-border",children:[n.jsxs("div",{children:[n.jsx(ge,{id:"mattermost-setup-title",children:"Set up Mattermost"}),n.jsx(we,{children:"Install chat and connect LimeOS alerts in one workflow."})]}),n.jsx(_,{"aria-label":"Close setup",className:"w-11 px-0",disabled:w,onClick:()=>h(!1),variant:"ghost",children:n.jsx(We,{className:"h-4 w-4"})})]}),n.jsx(K,{className:"space-y-4 overflow-auto p-4 sm:p-6",children:w||y.length?n.jsxs("div",{className:"space-y-3",children:[n.jsxs("div",{className:q("flex items-center gap-2 text-sm",i?"text-danger":"text-info"),children:[w?n.jsx(me,{className:"h-4 w-4 animate-spin"}):i?n.jsx(ie,{className:"h-4 w-4"}):n.jsx(lt,{className:"h-4 w-4"}),w?"Installing Mattermost":i?"Setup failed":"Setup finished"]}),n.jsx("pre",{className:"max-h-72 overflow-auto rounded-md border border-border bg-black/30 p-3 font-mono text-xs leading-5 text-muted-foreground","data-mattermost-install-log":!0,children:y.join(`
+`)}),y?null:n.jsx(_,{onClick:()=>f(!1),children:"Close"})]}):n.jsxs(n.Fragment,{children:[n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Mattermost admin password"}),n.jsx("input",{autoComplete:"current-password",className:l_,onChange:k=>j(k.target.value),type:"password",value:w})]}),n.jsxs(_,{className:"w-full gap-2","data-stack-notifications-confirm":!0,disabled:w.length<1,onClick:()=>void E(),children:[n.jsx(qm,{className:"h-4 w-4"}),"Create channel"]})]})})]})}):null]})}const tn="min-h-11 w-full rounded-md border border-border bg-background px-3 py-2 text-sm text-foreground focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring",c_={site_url:`${window.location.protocol}//${window.location.hostname}:8065`,admin_username:"limeadmin",admin_email:"",admin_password:"",stack_name:"mattermost",team_name:"limeos",channel_name:"limeos-alerts",timezone:Intl.DateTimeFormat().resolvedOptions().timeZone||"Europe/London",poll_seconds:60,fail_threshold:2},Dp={container:{label:"Containers",description:"Long-running containers that stop or become unhealthy"},smart:{label:"SMART",description:"Disk health assessments that report a failure"},mount:{label:"Mounts",description:"Required mountpoints that disappear"},snapraid:{label:"SnapRAID",description:"Parity errors, degradation, or a required sync"},metric:{label:"System metrics",description:"Sustained CPU, memory, or heat, and storage filling up"}};function yi(e){return e instanceof Error?e.message:"The request failed"}function Up(e){if(!e)return"Never";const t=typeof e=="number"?new Date(e*1e3):new Date(e);return Number.isNaN(t.getTime())?"Unknown":t.toLocaleString()}function d_(e){return e==="connected"?"success":e==="degraded"||e==="retained_data"?"warning":e==="disconnected"||e==="cleanup_required"?"danger":"neutral"}function Bo(e){return e.replace(/_/g," ")}function u_(){const{permissions:e}=Ln(),[t,r]=d.useState(null),[s,a]=d.useState(!0),[i,l]=d.useState(null),[o,c]=d.useState("overview"),[u,h]=d.useState(!1),[m,f]=d.useState(c_),[w,j]=d.useState(!1),[y,b]=d.useState([]),[v,p]=d.useState(!1),[x,g]=d.useState(!1),[N,E]=d.useState(""),[C,k]=d.useState(null),[O,S]=d.useState(!1),[$,R]=d.useState(null),[H,I]=d.useState(0),[U,L]=d.useState(null),[B,P]=d.useState(null),M=d.useCallback(()=>{I(z=>z+1)},[]),A=Hg(M),F=d.useCallback(async()=>{try{const z=await WS();r(z),E(z.policy.required_mounts.join(", ")),l(null)}catch(z){l(yi(z))}finally{a(!1)}},[]);d.useEffect(()=>{F()},[H,F]);const D=d.useMemo(()=>{const z={container:[],smart:[],mount:[],snapraid:[],metric:[]};return t?.resources.forEach(T=>z[T.kind]?.push(T)),z},[t]);async function G(){j(!0),b(["Starting Mattermost setup..."]),l(null);try{await GS(m,z=>{z.line&&b(T=>[...T,z.line]),z.error&&(l(z.error),b(T=>[...T,z.error]))}),M(),R("Mattermost and LimeOS alerts are connected.")}catch(z){l(yi(z))}finally{j(!1)}}async function se(z,T){if(!t)return;const Y=t.policy;r({...t,policy:z}),g(!0);try{const re=await ZS(z);r(he=>he&&{...he,policy:re}),R(T??"Alert policy saved."),l(null)}catch(re){r(he=>he&&{...he,policy:Y}),l(yi(re))}finally{g(!1)}}function de(z){t&&se({...t.policy,categories:{...t.policy.categories,[z]:{enabled:!t.policy.categories[z].enabled}}})}function ue(z){return t?.policy.silences.find(T=>T.kind===z.kind&&T.key===z.key)}function Ce(){if(!t||!C)return;const z=new Date,T=new Date(z);C.duration==="1h"&&T.setHours(T.getHours()+1),C.duration==="24h"&&T.setHours(T.getHours()+24);const Y={...t.policy,silences:[...t.policy.silences.filter(re=>re.key!==C.resource.key),{kind:C.resource.kind,key:C.resource.key,created_at:z.toISOString(),expires_at:C.duration==="permanent"?null:T.toISOString(),reason:C.reason.trim()}]};k(null),se(Y,`${C.resource.key} silenced.`)}async function Re(){S(!0);try{await e_(),R("Test alert sent to Mattermost."),l(null),await F()}catch(z){l(yi(z))}finally{S(!1)}}function pe(z){L(z),A.open()}function Ft(){A.state.phase!=="running"&&(A.close(),L(null))}async function kt(z,T=!1){const Y=U;if(!Y)return;const re=Y.replace("retry_",""),he=Y.startsWith("retry_");if((re==="uninstall"||re==="purge")&&z!=="Mattermost"||re==="purge"&&!T)return;const _e=re==="uninstall"?{confirmation:"Mattermost"}:re==="purge"?{confirmation:"Mattermost",acknowledge_data_loss:!0}:{};await A.run(Ze=>he?XS(re,_e,Ze):re==="disable"?KS(Ze):re==="enable"?QS(Ze):re==="uninstall"?JS("Mattermost",Ze):YS("Mattermost",Ze))&&R(re==="disable"?"Mattermost and alert delivery are disabled. Configuration and chat data are preserved.":re==="enable"?"Mattermost and alert delivery are enabled.":re==="uninstall"?"Mattermost was uninstalled. Chat data is retained for reinstall or deletion.":"Mattermost and all retained chat data were deleted.")}function rt(){if(U==="uninstall"||U==="retry_uninstall"){L("retry_uninstall"),A.reconfirm();return}if(U==="purge"||U==="retry_purge"){L("retry_purge"),A.reconfirm();return}A.retry()}function vt(z){const T=gS(z);T&&(P(null),window.requestAnimationFrame(()=>{const Y=document.getElementById(T.anchor);Y?.scrollIntoView({behavior:"smooth",block:"center"}),Y?.focus()}))}const Xe=e.includes("extensions.admin"),qe=new Set(t?.allowed_actions??[]),Ge=t?.cleanup_operation?.action,Xt=t?.cleanup_operation?.retryable?Ge==="disable"?"retry_disable":Ge==="enable"?"retry_enable":Ge==="uninstall"?"retry_uninstall":Ge==="purge"?"retry_purge":null:null,Fe=[];qe.has("enable")&&Fe.push({id:"enable",label:"Enable",Icon:iu,onSelect:()=>pe("enable"),tone:"info",data:{"data-mattermost-lifecycle-action":"enable"}}),qe.has("disable")&&Fe.push({id:"disable",label:"Disable",Icon:ia,onSelect:()=>pe("disable"),tone:"danger",data:{"data-mattermost-lifecycle-action":"disable"}}),t?.blocked_actions.forEach(z=>{Fe.push({id:`blocked-${z.action}`,label:`${z.action==="disable"?"Disable":"Uninstall"} (AI Agents first)`,Icon:z.action==="disable"?ia:Kt,onSelect:()=>P(z),separatorBefore:Fe.length>0&&z.action==="uninstall",tone:"danger",data:{"data-mattermost-blocked-action":z.action}})}),qe.has("uninstall")&&Fe.push({id:"uninstall",label:"Uninstall",Icon:Kt,onSelect:()=>pe("uninstall"),separatorBefore:Fe.length>0,tone:"danger",data:{"data-mattermost-lifecycle-action":"uninstall"}}),qe.has("purge")&&Fe.push({id:"purge",label:"Delete retained data",Icon:ul,onSelect:()=>pe("purge"),separatorBefore:Fe.length>0,tone:"danger",data:{"data-mattermost-lifecycle-action":"purge"}}),qe.has("retry_cleanup")&&Xt&&Fe.push({id:"retry_cleanup",label:"Retry cleanup",Icon:je,onSelect:()=>pe(Xt),tone:"info",data:{"data-mattermost-lifecycle-action":"retry_cleanup"}});const V=U==="uninstall"||U==="retry_uninstall"||U==="purge"||U==="retry_purge",te=U==="purge"||U==="retry_purge";return n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",disabled:s,onClick:()=>{a(!0),M()},variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",s&&"animate-spin")}),"Refresh"]}),description:"Chat delivery, alert policy, and automation connections",title:"integrations"}),$?n.jsxs("div",{className:"flex items-center justify-between gap-3 border-l-2 border-success bg-success/5 px-4 py-3 text-sm text-success",role:"status",children:[n.jsxs("span",{className:"flex items-center gap-2",children:[n.jsx(lt,{className:"h-4 w-4"}),$]}),n.jsx(_,{"aria-label":"Dismiss notice",className:"h-9 min-h-9 w-9 px-0",onClick:()=>R(null),variant:"ghost",children:n.jsx(We,{className:"h-4 w-4"})})]}):null,i?n.jsxs("div",{className:"flex items-start gap-2 border-l-2 border-danger bg-danger/5 px-4 py-3 text-sm text-danger",role:"alert",children:[n.jsx(ie,{className:"mt-0.5 h-4 w-4 shrink-0"}),i]}):null,n.jsxs(Q,{className:"overflow-hidden","data-mattermost-integration":!0,id:"mattermost-integration",tabIndex:-1,children:[n.jsx(xe,{className:"border-b border-border/70 bg-muted/20",children:n.jsxs("div",{className:"flex flex-col gap-4 sm:flex-row sm:items-center sm:justify-between",children:[n.jsxs("div",{className:"flex items-center gap-3",children:[n.jsx("span",{className:"flex h-11 w-11 items-center justify-center rounded-md border border-info/30 bg-info/10 text-info",children:n.jsx(Qc,{className:"h-5 w-5"})}),n.jsxs("div",{children:[n.jsx(ge,{children:"Mattermost"}),n.jsx(we,{children:"Private chat for LimeOS incidents and agent investigations"})]})]}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(fe,{label:Bo(t?.state??"loading"),tone:t?d_(t.state):"neutral"}),Xe&&qe.has("setup")&&!t?.retained_data?n.jsxs(_,{className:"gap-2","data-mattermost-setup":!0,onClick:()=>h(!0),children:[n.jsx(ot,{className:"h-4 w-4"}),"Set up"]}):null,Xe&&Fe.length?n.jsx(Ba,{items:Fe,label:"Manage Mattermost",menuData:{"data-mattermost-lifecycle-menu":"mattermost"},triggerData:{"data-mattermost-lifecycle-menu-trigger":"mattermost"}}):null]})]})}),t?.cleanup_required?n.jsxs(K,{className:"space-y-4 p-4 sm:p-6",children:[n.jsxs("div",{className:"flex items-start gap-3 border-l-2 border-danger bg-danger/5 px-4 py-3",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-danger"}),n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium text-danger",children:"Cleanup needs attention"}),n.jsxs("p",{className:"mt-1 text-xs text-muted-foreground",children:["Mattermost remains unavailable until LimeOS finishes the interrupted ",Ge?Bo(Ge):"cleanup"," operation."]})]})]}),n.jsxs("div",{className:"grid gap-px overflow-hidden rounded-md border border-border bg-border sm:grid-cols-3",children:[n.jsxs("div",{className:"bg-card p-3",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase text-dim",children:"Operation"}),n.jsx("p",{className:"mt-1 text-sm",children:Ge?Bo(Ge):"unknown"})]}),n.jsxs("div",{className:"bg-card p-3",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase text-dim",children:"Recovery"}),n.jsx("p",{className:"mt-1 text-sm",children:t.cleanup_operation?.state??"unavailable"})]}),n.jsxs("div",{className:"bg-card p-3",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase text-dim",children:"Updated"}),n.jsx("p",{className:"mt-1 text-sm",children:Up(t.cleanup_operation?.updated_at)})]})]}),Xe&&qe.has("retry_cleanup")&&Xt?n.jsxs(_,{className:"gap-2","data-mattermost-retry-cleanup":!0,onClick:()=>pe(Xt),variant:"warning",children:[n.jsx(je,{className:"h-4 w-4"}),"Retry cleanup"]}):n.jsx("p",{className:"text-sm text-muted-foreground",children:Xe?"Recovery details are unavailable. Refresh the page before retrying.":"An administrator must finish the cleanup."})]}):t?.retained_data?n.jsxs(K,{className:"space-y-5 p-4 sm:p-6",children:[n.jsxs("div",{className:"flex items-start gap-3 border-l-2 border-warning bg-warning/5 px-4 py-3",children:[n.jsx(ul,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-warning"}),n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium",children:"Mattermost data is retained"}),n.jsx("p",{className:"mt-1 text-xs leading-5 text-muted-foreground",children:"The services and alert delivery are removed. Database records, messages, uploads, plugins, and retained logs remain available for a reinstall."})]})]}),n.jsxs("div",{className:"flex flex-wrap gap-2",children:[Xe&&qe.has("setup")?n.jsxs(_,{className:"gap-2","data-mattermost-retained-setup":!0,onClick:()=>h(!0),children:[n.jsx(ot,{className:"h-4 w-4"}),"Set up again"]}):null,Xe&&qe.has("purge")?n.jsxs(_,{className:"gap-2","data-mattermost-purge":!0,onClick:()=>pe("purge"),variant:"danger",children:[n.jsx(Kt,{className:"h-4 w-4"}),"Delete data"]}):null]}),qe.has("purge")?null:n.jsx("p",{className:"text-xs text-muted-foreground",children:"Permanent data deletion is not available in this release."})]}):t?.installed?n.jsxs(n.Fragment,{children:[n.jsx("div",{"aria-label":"Mattermost views",className:"flex overflow-x-auto border-b border-border px-4",role:"tablist",children:["overview","policy"].map(z=>n.jsx("button",{"aria-controls":`mattermost-panel-${z}`,"aria-selected":o===z,className:q("min-h-11 border-b-2 px-4 font-mono text-xs capitalize",o===z?"border-primary text-primary":"border-transparent text-muted-foreground hover:text-foreground"),id:`mattermost-tab-${z}`,onClick:()=>c(z),onKeyDown:Yl,role:"tab",tabIndex:o===z?0:-1,type:"button",children:z==="policy"?"Alert policy":z},z))}),n.jsxs(K,{"aria-labelledby":`mattermost-tab-${o}`,className:"p-4 sm:p-6",id:`mattermost-panel-${o}`,role:"tabpanel",children:[o==="overview"?n.jsxs("div",{className:"space-y-5",children:[t.state==="disabled"?n.jsxs("div",{className:"flex items-start gap-3 border-l-2 border-warning bg-warning/5 px-4 py-3",children:[n.jsx(ia,{className:"mt-0.5 h-4 w-4 shrink-0 text-warning"}),n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium",children:"Mattermost is disabled"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Chat, alert delivery, and the full managed stack are stopped. Configuration and chat data are preserved."})]})]}):null,n.jsx("div",{className:"grid gap-px overflow-hidden rounded-md border border-border bg-border sm:grid-cols-2 xl:grid-cols-5",children:[["Site",t.site_url??"Unknown"],["Channel",`~${t.channel}`],["Webhook",t.webhook_configured?"Configured":"Missing"],["Services",`${Object.values(t.services??{}).filter(z=>z.state==="running").length||3}/3 running`],["Last delivery",Up(t.delivery.at)]].map(([z,T])=>n.jsxs("div",{className:"min-w-0 bg-card p-3",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase text-dim",children:z}),n.jsx("p",{className:"mt-1 truncate text-sm",title:T,children:T})]},z))}),t.state!=="disabled"?n.jsxs("div",{className:"flex flex-wrap gap-2",children:[n.jsxs(_,{className:"gap-2",disabled:O,onClick:()=>void Re(),variant:"info",children:[O?n.jsx(me,{className:"h-4 w-4 animate-spin"}):n.jsx(Fx,{className:"h-4 w-4"}),O?"Sending":"Send test alert"]}),t.site_url?n.jsxs("a",{className:"inline-flex min-h-11 items-center gap-2 rounded-md border border-border px-4 font-mono text-sm hover:bg-muted",href:t.site_url,rel:"noreferrer",target:"_blank",children:["Open Mattermost",n.jsx(ys,{className:"h-4 w-4"})]}):null]}):null,t.incidents.length?n.jsxs("div",{children:[n.jsx("h3",{className:"mb-2 font-mono text-sm font-semibold",children:"Active incidents"}),n.jsx("div",{className:"divide-y divide-border rounded-md border border-border",children:t.incidents.map(z=>n.jsxs("div",{className:"flex items-start justify-between gap-3 p-3",children:[n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium",children:z.key}),n.jsx("p",{className:"text-xs text-muted-foreground",children:z.summary})]}),n.jsx(ee,{tone:z.severity==="critical"?"danger":"warning",children:z.severity})]},z.key))})]}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No active incidents."})]}):null,o==="policy"?n.jsxs("div",{className:"space-y-5",children:[n.jsxs("div",{className:"flex items-center justify-between",children:[n.jsxs("div",{children:[n.jsx("h3",{className:"font-mono text-sm font-semibold",children:"Alert categories"}),n.jsx("p",{className:"text-xs text-muted-foreground",children:"Choose which checks can notify Mattermost."})]}),x?n.jsx(me,{className:"h-4 w-4 animate-spin text-primary"}):null]}),n.jsx("div",{className:"divide-y divide-border rounded-md border border-border",children:Object.keys(Dp).map(z=>{const T=Dp[z],Y=t.policy.categories[z].enabled;return n.jsxs("div",{className:"p-3 sm:p-4",children:[n.jsxs("div",{className:"flex items-start justify-between gap-4",children:[n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium",children:T.label}),n.jsx("p",{className:"text-xs text-muted-foreground",children:T.description})]}),n.jsxs("label",{className:"inline-flex min-h-11 cursor-pointer items-center gap-2",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:Y?"On":"Off"}),n.jsx("input",{checked:Y,className:"h-5 w-5 accent-primary",disabled:x,onChange:()=>de(z),type:"checkbox"})]})]}),D[z].length?n.jsx("div",{className:"mt-3 grid gap-2 sm:grid-cols-2",children:D[z].map(re=>{const he=ue(re);return n.jsxs("div",{className:"flex min-h-12 items-center justify-between gap-2 rounded-md bg-muted/35 px-3",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"truncate font-mono text-xs",title:re.key,children:re.key.replace(`${z}:`,"")}),n.jsx("p",{className:q("text-[11px]",re.ok?"text-success":"text-warning"),children:re.ok?"Healthy":re.summary})]}),he?n.jsxs(_,{"aria-label":`Remove silence for ${re.key}`,className:"h-9 min-h-9 gap-1 px-2",onClick:()=>void se({...t.policy,silences:t.policy.silences.filter(_e=>_e.key!==re.key)},`${re.key} unsilenced.`),title:"Remove silence",variant:"warning",children:[n.jsx(nu,{className:"h-3.5 w-3.5"}),n.jsx(We,{className:"h-3.5 w-3.5"})]}):n.jsx(_,{"aria-label":`Silence ${re.key}`,className:"h-9 min-h-9 px-2",onClick:()=>k({resource:re,duration:"1h",reason:""}),title:"Silence resource",variant:"ghost",children:n.jsx(Vm,{className:"h-4 w-4"})})]},re.key)})}):n.jsx("p",{className:"mt-2 text-xs text-dim",children:"No resources discovered yet."})]},z)})}),n.jsxs("div",{className:"space-y-2 border-t border-border pt-5",children:[n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"font-mono text-xs font-semibold",children:"Required mountpoints"}),n.jsx("input",{className:tn,onChange:z=>E(z.target.value),placeholder:"/mnt/media, /mnt/parity",value:N})]}),n.jsx("div",{className:"flex justify-end",children:n.jsx(_,{disabled:x,onClick:()=>void se({...t.policy,required_mounts:N.split(",").map(z=>z.trim()).filter(Boolean)}),size:"sm",children:"Save mounts"})})]})]}):null]})]}):n.jsx(K,{className:"p-4 sm:p-6",children:n.jsx("div",{className:"grid gap-4 sm:grid-cols-3",children:[[Gm,"One managed stack","Postgres, Mattermost, and alerts install together."],[Ua,"Clear alert controls","Enable categories and silence individual resources."],[os,"Agent-ready","The same channel will support guided investigations."]].map(([z,T,Y])=>{const re=z;return n.jsxs("div",{className:"border-l border-border pl-3",children:[n.jsx(re,{className:"mb-2 h-4 w-4 text-primary"}),n.jsx("p",{className:"text-sm font-medium",children:T}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:Y})]},T)})})})]}),n.jsx(BS,{onLifecycleChanged:M,refreshKey:H}),n.jsx(o_,{refreshKey:H}),n.jsx(i_,{refreshKey:H}),u?n.jsx(ze,{onClose:w?()=>{}:()=>h(!1),restoreFocus:()=>document.getElementById("mattermost-integration")?.focus(),children:n.jsxs(Q,{"aria-labelledby":"mattermost-setup-title","aria-modal":"true",className:"flex max-h-[92vh] w-full max-w-2xl flex-col overflow-hidden",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between border-b border-border",children:[n.jsxs("div",{children:[n.jsx(ge,{id:"mattermost-setup-title",children:"Set up Mattermost"}),n.jsx(we,{children:"Install chat and connect LimeOS alerts in one workflow."})]}),n.jsx(_,{"aria-label":"Close setup",className:"w-11 px-0",disabled:w,onClick:()=>h(!1),variant:"ghost",children:n.jsx(We,{className:"h-4 w-4"})})]}),n.jsx(K,{className:"space-y-4 overflow-auto p-4 sm:p-6",children:w||y.length?n.jsxs("div",{className:"space-y-3",children:[n.jsxs("div",{className:q("flex items-center gap-2 text-sm",i?"text-danger":"text-info"),children:[w?n.jsx(me,{className:"h-4 w-4 animate-spin"}):i?n.jsx(ie,{className:"h-4 w-4"}):n.jsx(lt,{className:"h-4 w-4"}),w?"Installing Mattermost":i?"Setup failed":"Setup finished"]}),n.jsx("pre",{className:"max-h-72 overflow-auto rounded-md border border-border bg-black/30 p-3 font-mono text-xs leading-5 text-muted-foreground","data-mattermost-install-log":!0,children:y.join(`
 `)}),w?null:n.jsx(_,{onClick:()=>h(!1),children:"Close"})]}):n.jsxs(n.Fragment,{children:[n.jsxs("div",{className:"grid gap-3 sm:grid-cols-2",children:[n.jsxs("label",{className:"space-y-1 sm:col-span-2",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Mattermost URL"}),n.jsx("input",{className:tn,onChange:z=>f({...m,site_url:z.target.value}),value:m.site_url})]}),n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Admin username"}),n.jsx("input",{autoComplete:"username",className:tn,onChange:z=>f({...m,admin_username:z.target.value}),value:m.admin_username})]}),n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Admin email"}),n.jsx("input",{autoComplete:"email",className:tn,onChange:z=>f({...m,admin_email:z.target.value}),type:"email",value:m.admin_email})]}),n.jsxs("label",{className:"space-y-1 sm:col-span-2",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Admin password"}),n.jsx("input",{autoComplete:"new-password",className:tn,minLength:10,onChange:z=>f({...m,admin_password:z.target.value}),type:"password",value:m.admin_password})]})]}),n.jsxs("button",{className:"flex min-h-11 items-center gap-2 text-sm text-muted-foreground hover:text-foreground",onClick:()=>p(z=>!z),type:"button",children:[n.jsx(Gm,{className:"h-4 w-4"}),"Advanced settings"]}),v?n.jsxs("div",{className:"grid gap-3 border-l border-border pl-3 sm:grid-cols-2",children:[n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Stack name"}),n.jsx("input",{className:tn,onChange:z=>f({...m,stack_name:z.target.value}),value:m.stack_name})]}),n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Channel"}),n.jsx("input",{className:tn,onChange:z=>f({...m,channel_name:z.target.value}),value:m.channel_name})]}),n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Poll interval (seconds)"}),n.jsx("input",{className:tn,min:15,onChange:z=>f({...m,poll_seconds:Number(z.target.value)}),type:"number",value:m.poll_seconds})]}),n.jsxs("label",{className:"space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Failures before alerting"}),n.jsx("input",{className:tn,min:1,onChange:z=>f({...m,fail_threshold:Number(z.target.value)}),type:"number",value:m.fail_threshold})]})]}):null,n.jsxs(_,{className:"w-full gap-2 sm:w-auto","data-mattermost-install":!0,disabled:!m.admin_email||m.admin_password.length<10,onClick:()=>void G(),children:[n.jsx(Qc,{className:"h-4 w-4"}),"Install and connect"]})]})})]})}):null,B?n.jsx(ze,{onClose:()=>P(null),restoreFocus:()=>document.getElementById("mattermost-integration")?.focus(),children:n.jsxs(Q,{"aria-labelledby":"mattermost-blocked-title","aria-modal":"true",className:"w-full max-w-lg",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between border-b border-border",children:[n.jsxs("div",{children:[n.jsxs(ge,{id:"mattermost-blocked-title",children:[B.action==="disable"?"Disable":"Uninstall"," AI Agents first"]}),n.jsx(we,{children:"Mattermost is required by the installed assistant integration."})]}),n.jsx(_,{"aria-label":"Close dependency notice",className:"h-11 w-11 shrink-0 px-0",onClick:()=>P(null),variant:"ghost",children:n.jsx(We,{className:"h-4 w-4"})})]}),n.jsxs(K,{className:"space-y-4 p-4 sm:p-5",children:[n.jsxs("div",{className:"flex items-start gap-3 border-l-2 border-warning bg-warning/5 px-4 py-3",children:[n.jsx(os,{className:"mt-0.5 h-4 w-4 shrink-0 text-warning"}),n.jsxs("div",{children:[n.jsx("p",{className:"text-sm font-medium",children:"AI Agents blocks this action"}),n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:B.message})]})]}),n.jsxs("div",{className:"flex flex-wrap justify-end gap-2",children:[n.jsx(_,{onClick:()=>P(null),variant:"outline",children:"Cancel"}),n.jsxs(_,{className:"gap-2","data-mattermost-go-to-agents":!0,onClick:()=>vt(B),children:[n.jsx(os,{className:"h-4 w-4"}),"Go to AI Agents"]})]})]})]})}):null,A.state.open&&U?n.jsxs(Og,{acknowledgement:te?"I understand this permanently deletes all retained Mattermost data and cannot be undone.":void 0,confirmLabel:U==="disable"?"Disable Mattermost":U==="enable"?"Enable Mattermost":U==="uninstall"?"Uninstall Mattermost":U==="purge"?"Delete all data":U==="retry_disable"?"Retry disable":U==="retry_enable"?"Retry enable":U==="retry_uninstall"?"Retry uninstall":"Retry data deletion",confirmation:V?{expected:"Mattermost"}:void 0,description:te?"Permanently delete retained Mattermost data after the services have been uninstalled.":U==="uninstall"||U==="retry_uninstall"?"Remove the managed Mattermost stack and alert delivery while retaining chat data for reinstall.":U==="disable"||U==="retry_disable"?"Stop the complete Mattermost stack and alert delivery while preserving configuration and data.":"Start the complete Mattermost stack and restore alert delivery.",destructive:V,onClose:Ft,onConfirm:z=>void kt(z.confirmation,z.acknowledged),onRetry:rt,restoreFocus:()=>document.getElementById("mattermost-integration")?.focus(),state:A.state,title:U==="disable"?"Disable Mattermost?":U==="enable"?"Enable Mattermost?":U==="uninstall"?"Uninstall Mattermost?":U==="purge"?"Delete retained Mattermost data?":U==="retry_disable"?"Retry Mattermost disable":U==="retry_enable"?"Retry Mattermost enable":U==="retry_uninstall"?"Retry Mattermost uninstall":"Retry Mattermost data deletion",children:[U==="uninstall"||U==="retry_uninstall"?n.jsxs("div",{className:"grid gap-3 text-sm sm:grid-cols-2",children:[n.jsxs("div",{className:"border-l-2 border-danger/60 pl-3",children:[n.jsx("p",{className:"font-medium text-danger",children:"Removed"}),n.jsx("p",{className:"mt-1 text-xs leading-5 text-muted-foreground",children:"Mattermost, Postgres, and alert containers; alert delivery; and LimeOS connection configuration."})]}),n.jsxs("div",{className:"border-l-2 border-success/60 pl-3",children:[n.jsx("p",{className:"font-medium text-success",children:"Preserved"}),n.jsx("p",{className:"mt-1 text-xs leading-5 text-muted-foreground",children:"Database records, messages, uploads, plugins, and retained logs for a future reinstall."})]})]}):null,te?n.jsx("div",{className:"border-l-2 border-danger bg-danger/5 px-3 py-2 text-sm text-muted-foreground",children:"This permanently removes database records, messages, uploads, plugins, retained logs, and recovery metadata."}):null]}):null,C?n.jsx(ze,{onClose:()=>k(null),children:n.jsxs(Q,{"aria-labelledby":"mattermost-silence-title","aria-modal":"true",className:"w-full max-w-md",role:"dialog",children:[n.jsxs(xe,{children:[n.jsxs(ge,{id:"mattermost-silence-title",children:["Silence ",C.resource.key]}),n.jsx(we,{children:"Alerts remain visible in LimeOS while Mattermost delivery is paused."})]}),n.jsxs(K,{className:"space-y-3",children:[n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Duration"}),n.jsxs("select",{className:tn,onChange:z=>k({...C,duration:z.target.value}),value:C.duration,children:[n.jsx("option",{value:"1h",children:"1 hour"}),n.jsx("option",{value:"24h",children:"24 hours"}),n.jsx("option",{value:"permanent",children:"Until manually removed"})]})]}),n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs text-muted-foreground",children:"Reason (optional)"}),n.jsx("input",{className:tn,maxLength:200,onChange:z=>k({...C,reason:z.target.value}),value:C.reason})]}),n.jsxs("div",{className:"flex justify-end gap-2",children:[n.jsx(_,{onClick:()=>k(null),variant:"ghost",children:"Cancel"}),n.jsxs(_,{className:"gap-2",onClick:Ce,variant:"warning",children:[n.jsx(Vm,{className:"h-4 w-4"}),"Silence"]})]})]})]})}):null]})}function Fo(e){return e instanceof Error&&e.message?e.message:"Unable to complete the request"}function m_(e){return e==="ok"?"success":"warning"}function p_(){const[e,t]=d.useState([]),[r,s]=d.useState(!0),[a,i]=d.useState(!1),[l,o]=d.useState(!0),[c,u]=d.useState(!1),[h,m]=d.useState(null),[f,w]=d.useState("Never"),[j,y]=d.useState(null),[b,v]=d.useState(null),[p,x]=d.useState(null),[g,N]=d.useState({status:"idle",result:null,error:null}),E=d.useRef(!0),C=d.useCallback(async S=>{S==="initial"?o(!0):u(!0);try{const[$,R]=await Promise.all([xg(),U1().catch(()=>({available:!1,data:null}))]);if(!E.current)return;t($.groups),s($.docker_available),i(R.available),m(null),w(Bt(new Date))}catch($){E.current&&m(Fo($))}finally{E.current&&(S==="initial"?o(!1):u(!1))}},[]),k=d.useCallback(async(S,$,R)=>{if(!b){v(S),x(null);try{await $(),E.current&&(y({tone:"success",message:R}),await C("manual"))}catch(H){E.current&&y({tone:"error",message:Fo(H)})}finally{E.current&&v(null)}}},[C,b]),O=d.useCallback(async()=>{N({status:"loading",result:null,error:null});try{const S=await pg();E.current&&N({status:"ready",result:S,error:null})}catch(S){E.current&&N({status:"error",result:null,error:Fo(S)})}},[]);return d.useEffect(()=>(E.current=!0,C("initial"),()=>{E.current=!1}),[C]),n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",disabled:c,onClick:()=>void C("manual"),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",c?"animate-spin":"")}),c?"refreshing":"refresh"]}),description:`synced ${f}`,title:"network"}),j?n.jsx(Q,{"aria-live":j.tone==="error"?"assertive":"polite",className:j.tone==="error"?"border-danger/30 text-danger":"border-success/30 text-success",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm",children:[j.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),j.message]})}):null,l?n.jsx(Q,{"aria-live":"polite",role:"status",children:n.jsx(K,{className:"flex min-h-[14rem] items-center justify-center p-6 text-sm text-muted-foreground",children:"Loading network..."})}):n.jsxs(n.Fragment,{children:[n.jsxs(Q,{id:"v2-host-network-test",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"Host network test"}),n.jsx(we,{children:"Probe public connectivity from the host."})]}),n.jsxs(_,{className:"gap-2",disabled:g.status==="loading",id:"v2-host-network-run",onClick:()=>void O(),size:"sm",variant:"outline",children:[g.status==="loading"?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(ou,{"aria-hidden":"true",className:"h-4 w-4"}),"Run test"]})]}),g.status!=="idle"?n.jsx(K,{className:"space-y-2 text-sm",id:"v2-host-network-result",children:g.status==="error"?n.jsx("p",{className:"text-danger",children:g.error}):g.status==="loading"?n.jsx("p",{className:"text-muted-foreground",children:"Running..."}):g.result?n.jsxs(n.Fragment,{children:[n.jsx(fe,{label:g.result.ping_success?"reachable":"unreachable",tone:g.result.ping_success?"success":"danger"}),n.jsxs("p",{className:"font-mono text-xs text-muted-foreground",children:["local ",g.result.local_ip||"—"," · public ",g.result.public_ip||"—"]}),g.result.ping_output?n.jsx("pre",{className:"max-h-[16vh] overflow-auto whitespace-pre-wrap break-words rounded-md border border-border bg-muted/25 p-3 text-xs",children:g.result.ping_output}):null]}):null}):null]}),n.jsxs(Q,{id:"v2-network-groups",children:[n.jsxs(xe,{children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"VPN network groups"}),n.jsx(we,{children:"Containers sharing a provider namespace (e.g. gluetun)."})]}),n.jsx(K,{className:"space-y-2",children:r?e.length?e.map(S=>{const $=`recreate:${S.provider}`;return n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2 rounded-md border border-border bg-muted/20 p-3 text-xs",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"break-all font-mono text-sm",children:S.provider}),n.jsxs("p",{className:"text-muted-foreground",children:[S.member_count," members",S.orphaned_members.length?` · ${S.orphaned_members.length} orphaned`:""]})]}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(fe,{label:S.status,tone:m_(S.status)}),p===$?n.jsxs("span",{className:"flex items-center gap-1.5",children:[n.jsx(_,{className:"border-warning/30 bg-warning/10 text-warning hover:bg-warning/15 text-xs sm:text-sm","data-confirm-recreate":S.provider,onClick:()=>void k($,()=>gg(S.provider),`Recreated ${S.provider} group`),size:"sm",variant:"outline",children:"Confirm recreate"}),n.jsx(_,{onClick:()=>x(null),size:"sm",variant:"outline",children:"Cancel"})]}):n.jsxs(_,{className:"text-xs sm:text-sm","data-recreate":S.provider,disabled:!!b,onClick:()=>x($),size:"sm",variant:"outline",children:[b===$?n.jsx(me,{"aria-hidden":"true",className:"h-3.5 w-3.5 animate-spin"}):null,"Recreate"]})]})]},S.provider)}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No VPN network groups detected."}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"Docker unavailable."})})]}),n.jsxs(Q,{id:"v2-tailscale",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"Tailscale"}),n.jsx(we,{children:"Mesh VPN status."})]}),n.jsx(ee,{tone:a?"success":"neutral",children:a?"connected":"unavailable"})]}),a?n.jsx(K,{children:p==="tailscale-logout"?n.jsxs("span",{className:"flex items-center gap-1.5",children:[n.jsx(_,{className:"border-danger/30 bg-danger/10 text-danger hover:bg-danger/15",id:"v2-tailscale-logout-confirm",onClick:()=>void k("tailscale-logout",()=>B1(),"Tailscale logged out"),variant:"outline",children:"Confirm logout"}),n.jsx(_,{onClick:()=>x(null),variant:"outline",children:"Cancel"})]}):n.jsx(_,{disabled:!!b,id:"v2-tailscale-logout",onClick:()=>x("tailscale-logout"),variant:"outline",children:"Log out"})}):null]})]})]})}const f_=64*1024,h_=new Set(["__proto__","prototype","constructor"]);function x_(e){return e==null||e===""}function g_(e,t){return typeof e==typeof t&&e===t}function ed(e,t={}){const r={};for(const s of e.fields)Object.prototype.hasOwnProperty.call(t,s.key)?r[s.key]=t[s.key]:s.default!==void 0?r[s.key]=s.default:r[s.key]=s.type==="boolean"?!1:"";return r}function v_(e){const t=new Map(e.fields.map(i=>[i.key,i])),r=new Set,s=(e.sections??[]).map(i=>({id:i.id,label:i.label,description:i.description,fields:i.fields.flatMap(l=>{const o=t.get(l);return!o||r.has(l)?[]:(r.add(l),[o])})})),a=e.fields.filter(i=>!r.has(i.key));return a.length&&s.push({id:"configuration",label:"Configuration",fields:a}),s.filter(i=>i.fields.length>0)}function Gg(e,t){const r={},s=[];for(const a of e){const i=t[a.key];if(x_(i)){a.required&&s.push({field:a.key,code:"required",message:`${a.label} is required.`});continue}let l=i;if(a.type==="integer"||a.type==="number"){const o=typeof i=="number"?i:Number(i);if(!Number.isFinite(o)||a.type==="integer"&&!Number.isInteger(o)){s.push({field:a.key,code:a.type==="integer"?"invalid_integer":"invalid_number",message:`${a.label} must be a valid ${a.type}.`});continue}a.minimum!==void 0&&o<a.minimum&&s.push({field:a.key,code:"below_minimum",message:`${a.label} must be at least ${a.minimum}.`}),a.maximum!==void 0&&o>a.maximum&&s.push({field:a.key,code:"above_maximum",message:`${a.label} must be no more than ${a.maximum}.`}),l=o}typeof l=="string"&&(a.min_length!==void 0&&l.length<a.min_length&&s.push({field:a.key,code:"below_min_length",message:`${a.label} is too short.`}),a.max_length!==void 0&&l.length>a.max_length&&s.push({field:a.key,code:"above_max_length",message:`${a.label} is too long.`})),a.type==="select"&&a.choices&&!a.choices.some(o=>g_(o.value,l))&&s.push({field:a.key,code:"invalid_choice",message:`${a.label} has an invalid selection.`}),r[a.key]=l}return{values:r,errors:s}}function Vo(e,t){return{key:e.name,label:e.label,description:e.description,type:e.type,required:e.required,default:e.default,minimum:e.minimum,maximum:e.maximum,choices:t??e.choices}}function zi(e){return JSON.stringify({type:typeof e,value:e})}function y_(e,t){return t.find(r=>zi(r.value)===e)?.value??""}function b_(e,t){if(!e.startsWith("status."))return;const r=e.slice(7).split(".");if(r.some(a=>h_.has(a.replace(/\[\]$/,""))))return;let s=t;for(const a of r){const i=a.endsWith("[]"),l=i?a.slice(0,-2):a;if(l==="summary"&&s===t)s=t.summary;else if(l==="details"&&s===t)s=t.details;else if(Array.isArray(s)){const o=s.find(c=>typeof c=="object"&&c!==null&&"id"in c&&c.id===l);o?s="value"in o?o.value:o:s=s.flatMap(c=>{if(typeof c!="object"||c===null)return[];const u=c[l];return u===void 0?[]:[u]})}else if(typeof s=="object"&&s!==null)s=s[l];else return;if(i&&!Array.isArray(s))return}return s}function qo(e,t){if(e.choices)return e.choices;if(!e.source)return[];const r=b_(e.source,t);return(Array.isArray(r)?r:[r]).slice(0,128).flatMap(a=>{if(["string","number","boolean"].includes(typeof a))return[{value:a,label:String(a)}];if(typeof a!="object"||a===null)return[];const i=a,l=i.value??i.id??i.name,o=i.label??i.name??l;return!["string","number","boolean"].includes(typeof l)||typeof o!="string"?[]:[{value:l,label:o}]})}function j_(e,t=0,r=100){return![e,t,r].every(Number.isFinite)||r<=t?null:Math.min(100,Math.max(0,(e-t)/(r-t)*100))}function Bp(){return{phase:"idle",operationId:null,lastSequence:-1,percent:null,output:[],message:"",success:null}}function w_(e){const t=e.slice(-200),r=new TextEncoder;let s=t.reduce((a,i)=>a+r.encode(i).byteLength,0);for(;t.length>1&&s>f_;)s-=r.encode(t.shift()??"").byteLength;return t}function Fp(e,t){if(e.operationId&&t.operation_id!==e.operationId||t.sequence<=e.lastSequence)return e;const r={...e,phase:"running",operationId:e.operationId??t.operation_id,lastSequence:t.sequence};return t.type==="output"&&t.message?r.output=w_([...e.output,t.message.slice(0,2e3)]):t.type==="progress"?(r.percent=Number.isFinite(t.percent)?Math.min(100,Math.max(0,Number(t.percent))):e.percent,r.message=t.message?.slice(0,240)??e.message):t.type==="complete"?(r.phase=t.success===!1?"error":"complete",r.success=t.success!==!1,r.percent=t.success===!1?e.percent:100,r.message=t.message?.slice(0,240)??"Action completed."):t.type==="error"&&(r.phase="error",r.success=!1,r.message=t.message?.slice(0,240)??"Action failed."),r}const Vp="min-h-11 w-full rounded-md border border-input bg-background px-3 text-sm text-foreground focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring disabled:cursor-not-allowed disabled:opacity-60";function Kg({field:e,value:t,error:r,idPrefix:s="capability",onChange:a}){const i=`${s}-field-${e.key.split(".").join("-")}`,l=[e.description?`${i}-description`:"",r?`${i}-error`:""].filter(Boolean).join(" ")||void 0;return e.type==="boolean"?n.jsxs("label",{className:"flex min-h-11 cursor-pointer items-start gap-3 rounded-md border border-border px-3 py-2.5",children:[n.jsx("input",{checked:t===!0,className:"mt-0.5 h-4 w-4 shrink-0 accent-primary",disabled:e.read_only,name:e.key,onChange:o=>a(o.target.checked),type:"checkbox"}),n.jsxs("span",{className:"min-w-0",children:[n.jsx("span",{className:"block text-sm font-medium",children:e.label}),e.description?n.jsx("span",{className:"mt-0.5 block text-xs text-muted-foreground",children:e.description}):null,r?n.jsx("span",{className:"mt-1 block text-xs text-danger",children:r}):null]})]}):n.jsxs("label",{className:"block space-y-1.5",htmlFor:i,children:[n.jsxs("span",{className:"flex items-center gap-1.5 text-sm font-medium",children:[e.type==="secret_reference"?n.jsx(la,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-muted-foreground"}):null,e.label,e.required?n.jsx("span",{className:"text-danger","aria-hidden":"true",children:"*"}):null]}),e.description?n.jsx("span",{className:"block text-xs text-muted-foreground",id:`${i}-description`,children:e.description}):null,e.type==="select"?n.jsxs("select",{"aria-describedby":l,"aria-invalid":!!r,className:q(Vp,r&&"border-danger/60"),disabled:e.read_only,id:i,name:e.key,onChange:o=>a(y_(o.target.value,e.choices??[])),value:t===""||t==null?"":zi(t),children:[n.jsx("option",{disabled:e.required,value:"",children:e.required?"Select an option":"Not set"}),(e.choices??[]).map(o=>n.jsx("option",{value:zi(o.value),children:o.label},zi(o.value)))]}):n.jsx("input",{"aria-describedby":l,"aria-invalid":!!r,autoComplete:e.type==="secret_reference"?"off":void 0,className:q(Vp,r&&"border-danger/60"),disabled:e.read_only,id:i,inputMode:e.type==="integer"||e.type==="number"?"decimal":void 0,max:e.maximum,maxLength:e.max_length,min:e.minimum,minLength:e.min_length,name:e.key,onChange:o=>a(o.target.value),placeholder:e.placeholder,spellCheck:e.type==="text"?void 0:!1,type:e.type==="integer"||e.type==="number"?"number":"text",value:t==null?"":String(t)}),r?n.jsx("span",{className:"block text-xs text-danger",id:`${i}-error`,role:"alert",children:r}):null]})}function qp(e){return e==="destructive"?"danger":e==="mutation"?"warning":e==="diagnostic"?"info":"outline"}function N_({intent:e}){return e==="destructive"?n.jsx(Kt,{"aria-hidden":"true",className:"h-4 w-4"}):e==="diagnostic"?n.jsx(qN,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(Hl,{"aria-hidden":"true",className:"h-4 w-4"})}function k_(e){return(e instanceof Error?e.message:"Action could not be started.").replace(/\s+/g," ").trim().slice(0,240)||"Action could not be started."}function S_({catalog:e,status:t,execute:r}){const[s,a]=d.useState(null),[i,l]=d.useState({}),[o,c]=d.useState({}),[u,h]=d.useState(Bp),[m,f]=d.useState(null),w=d.useMemo(()=>new Map(e.availability.map(x=>[x.id,x])),[e]),j=`${e.provider_id}-${e.capability_id.split(".").join("-")}-action-dialog-title`;function y(x){const g=w.get(x.id);return g?g.available?(x.intent==="mutation"||x.intent==="destructive")&&!x.confirmation?"Confirmation is unavailable.":null:g.unavailable_reason??"Action is unavailable.":"Availability was not reported."}function b(x){const g=x.parameters.map(N=>Vo(N,qo(N,t)));if(!g.length&&!x.confirmation){v(x,{});return}a(x),l(ed({schema_id:`${e.provider_id}-${x.id}-v1`,title:x.label,fields:g})),c({})}async function v(x,g){a(null),f(x.id),h({...Bp(),phase:"running"});try{const N=await r({action_id:x.id,parameters:g},E=>h(C=>Fp(C,E)));N&&h(E=>Fp(E,N)),h(E=>E.phase==="running"?{...E,phase:"error",success:!1,message:"Action ended before reporting a result."}:E)}catch(N){h(E=>({...E,phase:"error",success:!1,message:k_(N)}))}finally{f(null)}}function p(){if(!s)return;const x=s.parameters.map(N=>Vo(N,qo(N,t))),g=Gg(x,i);c(Object.fromEntries(g.errors.map(N=>[N.field,N.message]))),g.errors.length||v(s,g.values)}return n.jsxs("section",{"aria-labelledby":`${e.provider_id}-actions-title`,className:"rounded-lg border border-border bg-card",children:[n.jsx("header",{className:"border-b border-border px-4 py-4 sm:px-5",children:n.jsx("h2",{className:"font-mono text-sm font-semibold",id:`${e.provider_id}-actions-title`,children:"Actions"})}),n.jsxs("div",{className:"space-y-4 px-4 py-5 sm:px-5",children:[n.jsx("div",{className:"flex flex-wrap gap-2",children:e.actions.map(x=>{const g=y(x),N=m!==null||g!==null;return n.jsxs(_,{"aria-label":x.label,className:"gap-2",disabled:N,onClick:()=>b(x),title:g??x.description,variant:qp(x.intent),children:[m===x.id?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(N_,{intent:x.intent}),x.label]},x.id)})}),e.actions.some(x=>y(x)!==null)?n.jsx("ul",{className:"space-y-1 text-xs text-muted-foreground",children:e.actions.filter(x=>y(x)!==null).map(x=>n.jsxs("li",{children:[n.jsxs("span",{className:"text-foreground",children:[x.label,":"]})," ",y(x)]},x.id))}):null,u.phase!=="idle"?n.jsxs("div",{className:"space-y-3 border-t border-border pt-4","aria-live":"polite",children:[n.jsxs("div",{className:"flex items-center gap-2 text-sm font-medium",children:[u.phase==="running"?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin text-info"}):u.phase==="complete"?n.jsx(lt,{"aria-hidden":"true",className:"h-4 w-4 text-success"}):n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4 text-danger"}),n.jsx("span",{children:u.message||(u.phase==="running"?"Action running":"Action finished")})]}),u.percent!==null?n.jsx(Yt,{label:"Action progress",value:u.percent}):null,u.output.length?n.jsxs("div",{className:"border border-border bg-background",children:[n.jsxs("div",{className:"flex items-center gap-2 border-b border-border px-3 py-2 font-mono text-[11px] text-muted-foreground",children:[n.jsx(Hx,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Output"]}),n.jsx("pre",{className:"max-h-56 overflow-auto whitespace-pre-wrap break-words p-3 font-mono text-xs",children:u.output.join(`
-`)})]}):null]}):null]}),s?n.jsx(ze,{onClose:()=>a(null),children:n.jsxs("div",{"aria-labelledby":j,"aria-modal":"true",className:"max-h-[90vh] w-full max-w-xl overflow-y-auto rounded-lg border border-border bg-card",role:"dialog",children:[n.jsxs("header",{className:"flex items-start justify-between gap-3 border-b border-border px-4 py-4 sm:px-5",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("h2",{className:"font-mono text-base font-semibold",id:j,children:s.confirmation?.title??s.label}),s.description?n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:s.description}):null]}),n.jsx(_,{"aria-label":"Close action",className:"h-9 w-9 shrink-0 px-0",onClick:()=>a(null),size:"sm",variant:"ghost",children:n.jsx(We,{"aria-hidden":"true",className:"h-4 w-4"})})]}),n.jsxs("div",{className:"space-y-4 px-4 py-5 sm:px-5",children:[s.parameters.map(x=>{const g=Vo(x,qo(x,t));return n.jsx(Kg,{error:o[g.key],field:g,idPrefix:`${e.provider_id}-${s.id}`,onChange:N=>{l(E=>({...E,[g.key]:N})),c(E=>({...E,[g.key]:""}))},value:i[g.key]},g.key)}),s.confirmation?n.jsxs("div",{className:q("flex items-start gap-2 border-l-2 px-3 py-2.5 text-sm",s.intent==="destructive"?"border-danger bg-danger/5 text-danger":"border-warning bg-warning/5 text-warning"),children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),s.confirmation.message]}):null,n.jsxs("div",{className:"flex flex-wrap justify-end gap-2 border-t border-border pt-4",children:[n.jsx(_,{onClick:()=>a(null),variant:"outline",children:"Cancel"}),n.jsx(_,{onClick:p,variant:qp(s.intent),children:s.confirmation?.confirm_label??`Run ${s.label}`})]})]})]})}):null]})}function __(e){return e==="healthy"?"success":e==="warning"||e==="unconfigured"?"warning":e==="error"||e==="unavailable"||e==="incompatible"?"danger":"neutral"}function C_(e){return e==="error"?"border-danger text-danger":e==="warning"?"border-warning text-warning":"border-info text-info"}function E_(e){return e==="success"?"bg-success":e==="warning"?"bg-warning":e==="error"?"bg-danger":"bg-info"}function Hp(e){const t=new Date(e);return Number.isNaN(t.getTime())?"Unknown":t.toLocaleString()}function gu({status:e}){const t=`${e.provider_id}-${e.capability_id.split(".").join("-")}-status-title`;return n.jsxs("section",{"aria-labelledby":t,className:"rounded-lg border border-border bg-card",children:[n.jsxs("header",{className:"flex flex-col gap-3 border-b border-border px-4 py-4 sm:flex-row sm:items-start sm:justify-between sm:px-5",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:t,children:"Provider status"}),n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:e.health.message})]}),n.jsxs("div",{className:"flex shrink-0 flex-wrap items-center gap-2",children:[n.jsx(fe,{label:e.health.state,tone:__(e.health.state)}),n.jsxs("span",{className:"flex items-center gap-1 font-mono text-[11px] text-muted-foreground",children:[n.jsx(nu,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),n.jsx("time",{dateTime:e.observed_at,children:Hp(e.observed_at)})]})]})]}),n.jsxs("div",{className:"space-y-5 px-4 py-5 sm:px-5",children:[e.summary.length?n.jsx("dl",{className:"grid grid-cols-2 border border-border sm:grid-cols-3 lg:grid-cols-4",children:e.summary.map(r=>n.jsxs("div",{className:"min-w-0 border-b border-r border-border p-3 last:border-r-0",children:[n.jsx("dt",{className:"font-mono text-[10px] uppercase text-muted-foreground",children:r.label}),n.jsxs("dd",{className:q("mt-1 break-words text-sm font-medium tabular-nums",r.tone==="success"&&"text-success",r.tone==="warning"&&"text-warning",r.tone==="danger"&&"text-danger"),children:[r.value===null?"Not available":String(r.value),r.unit?` ${r.unit}`:""]})]},r.id))}):null,e.metrics.length?n.jsxs("div",{children:[n.jsx("h3",{className:"font-mono text-xs font-semibold uppercase text-muted-foreground",children:"Metrics"}),n.jsx("div",{className:"mt-3 grid grid-cols-1 gap-x-6 gap-y-4 md:grid-cols-2",children:e.metrics.map(r=>{const s=j_(r.value,r.minimum,r.maximum);return n.jsxs("div",{className:"space-y-1.5",children:[n.jsxs("div",{className:"flex items-baseline justify-between gap-3 text-sm",children:[n.jsx("span",{children:r.label}),n.jsxs("span",{className:"font-mono text-xs tabular-nums text-muted-foreground",children:[r.value,r.unit?` ${r.unit}`:""]})]}),n.jsx(Yt,{label:r.label,value:s})]},r.id)})})]}):null,e.health.issues.length?n.jsx("div",{className:"space-y-2","aria-label":"Provider issues",children:e.health.issues.map(r=>n.jsxs("div",{className:q("border-l-2 bg-muted/20 px-3 py-2.5",C_(r.severity)),children:[n.jsxs("p",{className:"flex items-start gap-2 text-sm font-medium",children:[n.jsx(za,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),r.message]}),r.recovery?n.jsx("p",{className:"mt-1 pl-6 text-xs text-muted-foreground",children:r.recovery}):null]},r.code))}):null,e.recent_activity.length?n.jsxs("div",{children:[n.jsxs("h3",{className:"flex items-center gap-1.5 font-mono text-xs font-semibold uppercase text-muted-foreground",children:[n.jsx(Je,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Recent activity"]}),n.jsx("ol",{className:"mt-3 divide-y divide-border border-y border-border",children:e.recent_activity.map(r=>n.jsxs("li",{className:"flex items-start gap-3 py-2.5 text-sm",children:[n.jsx("span",{"aria-hidden":"true",className:q("mt-1.5 h-2 w-2 shrink-0 rounded-full",E_(r.kind))}),n.jsx("span",{className:"min-w-0 flex-1 break-words",children:r.summary}),n.jsx("time",{className:"shrink-0 font-mono text-[10px] text-muted-foreground",dateTime:r.occurred_at,children:Hp(r.occurred_at)})]},r.id))})]}):null]})]})}function A_(e){const t={};for(const r of e)t[r.field]||(t[r.field]=r.message);return t}function P_(e){return(e instanceof Error?e.message:"Configuration could not be saved.").replace(/\s+/g," ").trim().slice(0,240)||"Configuration could not be saved."}function R_({schema:e,initialValues:t={},errors:r=[],disabled:s=!1,onSubmit:a}){const[i,l]=d.useState(()=>ed(e,t)),[o,c]=d.useState([]),[u,h]=d.useState(r),[m,f]=d.useState(!1),[w,j]=d.useState(null),y=JSON.stringify(t),b=JSON.stringify(r);d.useEffect(()=>{l(ed(e,t)),c([]),h(r),j(null)},[e.schema_id,y,b]);const v=d.useMemo(()=>v_(e),[e]),p=A_([...u,...o]),x=e.fields.some(N=>!N.read_only);async function g(){const N=Gg(e.fields,i);if(c(N.errors),h([]),j(null),N.errors.length){requestAnimationFrame(()=>{const E=N.errors[0],C=`${e.schema_id}-field-${E.field.split(".").join("-")}`;document.getElementById(C)?.focus()});return}f(!0);try{const E=await a(N.values);E&&!E.valid?(h(E.errors),requestAnimationFrame(()=>{const C=E.errors.find(O=>O.field!=="_form");if(!C)return;const k=`${e.schema_id}-field-${C.field.split(".").join("-")}`;document.getElementById(k)?.focus()})):j("Configuration saved.")}catch(E){h([{field:"_form",code:"save_failed",message:P_(E)}])}finally{f(!1)}}return n.jsxs("section",{"aria-labelledby":`${e.schema_id}-title`,className:"rounded-lg border border-border bg-card",children:[n.jsxs("header",{className:"border-b border-border px-4 py-4 sm:px-5",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:`${e.schema_id}-title`,children:e.title}),e.description?n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:e.description}):null]}),n.jsxs("form",{className:"space-y-5 px-4 py-5 sm:px-5",onSubmit:N=>{N.preventDefault(),g()},children:[p._form?n.jsxs("div",{className:"flex items-start gap-2 border-l-2 border-danger bg-danger/5 px-3 py-2 text-sm text-danger",role:"alert",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),p._form]}):null,v.map((N,E)=>n.jsxs("fieldset",{className:E?"border-t border-border pt-5":"",children:[n.jsx("legend",{className:"font-mono text-xs font-semibold uppercase text-muted-foreground",children:N.label}),N.description?n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:N.description}):null,n.jsx("div",{className:"mt-3 grid grid-cols-1 gap-4 md:grid-cols-2",children:N.fields.map(C=>n.jsx(Kg,{error:p[C.key],field:C,idPrefix:e.schema_id,onChange:k=>{l(O=>({...O,[C.key]:k})),c(O=>O.filter(S=>S.field!==C.key)),h(O=>O.filter(S=>S.field!==C.key)),j(null)},value:i[C.key]},C.key))})]},N.id)),n.jsxs("div",{className:"flex min-h-11 flex-wrap items-center gap-3 border-t border-border pt-4",children:[n.jsxs(_,{className:"gap-2",disabled:s||m||!x,type:"submit",children:[m?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(Da,{"aria-hidden":"true",className:"h-4 w-4"}),"Save configuration"]}),w?n.jsxs("span",{className:"flex items-center gap-1.5 text-sm text-success",role:"status",children:[n.jsx(lt,{"aria-hidden":"true",className:"h-4 w-4"}),w]}):null]})]})]})}function Qg({status:e,setup:t,setupValues:r,setupErrors:s,actions:a,onSave:i,onAction:l}){return n.jsxs("div",{className:"space-y-5","data-capability-renderer":"generic",children:[n.jsx(gu,{status:e}),t&&i?n.jsx(R_,{disabled:!e.lifecycle.enabled||e.lifecycle.compatibility!=="compatible",errors:s,initialValues:r,onSubmit:i,schema:t}):null,a&&l?n.jsx(S_,{catalog:a,execute:l,status:e}):null]})}const Wp={commandId:null,running:!1,lines:[],progress:null,errors:[],summary:null,transportError:null,forceAvailable:!1};function M_(e,t){if(e.trim()==="")return t;const r=Number(e);return Number.isFinite(r)?r:t}function Gp(e){if(e==null||e<=0)return"";const t=Math.floor(e/60),r=e%60;return t?`~${t}m ${r}s left`:`~${r}s left`}function ua({pluginId:e,commands:t,poolNames:r,onCompleted:s,heading:a="Commands"}){const[i,l]=d.useState(null),[o,c]=d.useState(!1),[u,h]=d.useState({}),[m,f]=d.useState(Wp),w=(g,N,E)=>{h(C=>({...C,[g]:{...C[g],[N]:E}}))},j=(g,N)=>{const E=u[g.id]?.[N.name];return E!==void 0?E:N.type==="select"&&N.source?.includes("pools")&&r.length?r[0]:N.default!==void 0&&N.default!==null?String(N.default):""},y=g=>{const N={};for(const E of g.param_schema??[]){const C=j(g,E);if(E.type==="number"){const k=M_(C,typeof E.default=="number"?E.default:null);k!==null&&(N[E.name]=k)}else C!==""&&(N[E.name]=C)}return N},b=g=>(g.param_schema??[]).some(N=>N.required&&j(g,N)==="");async function v(g,N){c(!1),f({...Wp,commandId:g.id,running:!0});try{const E={...y(g),...N??{}};await y2(e,g.id,E,C=>{f(k=>{if(C.type==="output"&&typeof C.line=="string")return{...k,lines:[...k.lines,C.line]};if(C.type==="tag"){if(C.name==="run"&&C.values?.[0]==="pos"){const O=$=>{const R=Number($);return Number.isFinite(R)?R:null},S=C.values;return{...k,progress:{percent:O(S[4]),eta:O(S[5]),speed:O(S[6])}}}return C.name==="msg"&&(C.values?.[0]==="error"||C.values?.[0]==="fatal")?{...k,errors:[...k.errors,String(C.values[1]??"")]}:k}if(C.type==="complete"){const O=C.data??null;return{...k,running:!1,forceAvailable:!C.success&&O?.force_allowed===!0,summary:{success:!!C.success,message:String(C.message||C.error||""),data:O}}}return C.type==="error"?{...k,running:!1,transportError:C.error??"Command error"}:k})}),s?.()}catch(E){f(C=>({...C,running:!1,transportError:E instanceof Error?E.message:"Could not start command"}))}finally{f(E=>({...E,running:!1}))}}const p=i?t.find(g=>g.id===i)??null:null,x=p?.id==="unmount"?"Unmounting can interrupt applications using this pool. Continue?":p?.id==="sync"?"Sync updates parity from the current data drives. Continue?":p?.id==="fix"?"Fix can overwrite damaged files using parity. Review recovery status before continuing?":"This action can change provider state. Continue?";return n.jsxs("div",{className:"space-y-3",children:[n.jsx("p",{className:"font-mono text-xs uppercase text-muted-foreground",children:a}),n.jsx("div",{className:"flex flex-wrap gap-2",children:t.map(g=>n.jsxs(_,{className:"gap-1.5 text-xs sm:text-sm","data-plugin-command":g.id,disabled:m.running,onClick:()=>{c(!1);const N=(g.param_schema??[]).length>0;if(g.dangerous||N){const E=i===g.id?null:g.id;l(E),E&&g.dangerous&&!N&&c(!0)}else l(null),v(g)},size:"sm",variant:i===g.id?"default":"outline",children:[n.jsx(Hx,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),g.label,g.dangerous?n.jsx(ie,{"aria-hidden":"true",className:"h-3.5 w-3.5"}):null]},g.id))}),p?n.jsxs("div",{className:"space-y-3 rounded-lg border border-border/70 bg-muted/20 p-3",children:[p.description?n.jsx("p",{className:"text-xs text-muted-foreground",children:p.description}):null,(p.param_schema??[]).map(g=>n.jsxs("label",{className:"block space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:g.label??g.name}),g.type==="select"?n.jsx("select",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm","data-command-param":g.name,disabled:!r.length,onChange:N=>w(p.id,g.name,N.target.value),value:j(p,g),children:r.length?r.map(N=>n.jsx("option",{value:N,children:N},N)):n.jsx("option",{value:"",children:"No pools configured"})}):n.jsx("input",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm","data-command-param":g.name,max:g.max,min:g.min,onChange:N=>w(p.id,g.name,N.target.value),type:g.type==="number"?"number":"text",value:j(p,g)})]},g.name)),o&&p.dangerous?n.jsxs("div",{className:"space-y-2 rounded-md border border-danger/40 bg-danger/10 p-3 text-xs",children:[n.jsxs("p",{className:"flex items-center gap-1.5 font-medium text-danger",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),x]}),n.jsxs("div",{className:"flex gap-2",children:[n.jsxs(_,{"data-command-confirm":p.id,onClick:()=>void v(p),size:"sm",variant:"danger",children:["Run ",p.label]}),n.jsx(_,{onClick:()=>c(!1),size:"sm",variant:"outline",children:"Cancel"})]})]}):n.jsxs(_,{className:"gap-1.5","data-command-run":p.id,disabled:m.running||b(p),onClick:()=>p.dangerous?c(!0):void v(p),size:"sm",children:[n.jsx(Hl,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Run ",p.label]})]}):null,m.commandId?n.jsxs("div",{className:"space-y-2 rounded-lg border border-border/70 bg-muted/20 p-3","data-command-output":!0,children:[m.transportError?n.jsxs("p",{className:"flex items-center gap-1.5 rounded-md bg-danger/10 px-2 py-1.5 text-xs font-medium text-danger","data-command-transport-error":!0,children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Couldn't start: ",m.transportError]}):null,m.progress?n.jsxs("div",{className:"space-y-1","data-command-progress":!0,children:[n.jsx(Yt,{label:"command progress",tone:"primary",value:m.progress.percent}),n.jsxs("p",{className:"text-[0.7rem] text-muted-foreground tabular-nums",children:[m.progress.percent!=null?`${m.progress.percent}%`:"running",Gp(m.progress.eta)?` · ${Gp(m.progress.eta)}`:"",m.progress.speed?` · ${m.progress.speed.toFixed(1)} MB/s`:""]})]}):null,m.errors.length?n.jsx("ul",{className:"space-y-1","data-command-errors":!0,children:m.errors.map((g,N)=>n.jsx("li",{className:"text-xs font-medium text-danger",children:g},N))}):null,m.summary?n.jsxs("div",{className:q("rounded-md px-2 py-1.5 text-xs font-medium",m.summary.success?"bg-success/10 text-success":"bg-danger/10 text-danger"),"data-command-summary":!0,children:[m.summary.success?"Completed":"Failed",m.summary.message?`: ${m.summary.message}`:"",m.summary.data?` (${Object.entries(m.summary.data).filter(([,g])=>typeof g=="number").map(([g,N])=>`${N} ${g}`).join(", ")})`:""]}):null,m.forceAvailable?n.jsxs("div",{className:"space-y-2 rounded-md border border-danger/40 bg-danger/10 p-2 text-xs","data-command-threshold":!0,children:[n.jsx("p",{className:"font-medium text-danger",children:"This exceeds the configured safety threshold (see the counts above). Run anyway?"}),n.jsx(_,{"data-command-force":!0,onClick:()=>{const g=t.find(N=>N.id===m.commandId);g&&v(g,{force:!0,force_reason:"operator confirmed threshold override"})},size:"sm",variant:"danger",children:"Run anyway"})]}):null,n.jsx("pre",{className:"max-h-[20vh] overflow-auto whitespace-pre-wrap break-words text-xs sm:text-sm",id:"v2-plugin-command-output",children:m.lines.join(`
-`)||(m.running?"Waiting for output...":"")})]}):null]})}const T_=[{value:"epmfs",label:"epmfs — existing path, most free space (default)"},{value:"eplfs",label:"eplfs — existing path, least free space"},{value:"mfs",label:"mfs — most free space"},{value:"lfs",label:"lfs — least free space"},{value:"rand",label:"rand — random branch"},{value:"ff",label:"ff — first found"}],$_=[{value:"linux_6_6_plus",label:"Linux 6.6+"},{value:"linux_6_5_mmap",label:"Linux ≤ 6.5 + mmap"},{value:"linux_6_5_no_mmap",label:"Linux ≤ 6.5, no mmap"}],I_=/^\d+(\.\d+)?[KMGT]?$/i;function Kp(){return{id:`pool-${Date.now()}`,name:"",mount_point:"",branches:[],create_policy:"epmfs",preset:"linux_6_5_no_mmap",min_free_space:"4G",options:"",enabled:!0}}function L_({pluginId:e,config:t,onSaved:r}){const[s,a]=d.useState(null),[i,l]=d.useState([]),[o,c]=d.useState({}),[u,h]=d.useState([]),[m,f]=d.useState(null),[w,j]=d.useState(null),[y,b]=d.useState(!1),[v,p]=d.useState(""),[x,g]=d.useState(!1);d.useEffect(()=>{let L=!0;const B=(t.pools??[]).map(P=>({...Kp(),id:String(P.id??`pool-${Math.random()}`),name:String(P.name??""),mount_point:String(P.mount_point??""),branches:Array.isArray(P.branches)?P.branches.map(M=>String(M)):[],create_policy:String(P.create_policy??"epmfs"),preset:String(P.preset??"linux_6_5_no_mmap"),min_free_space:String(P.min_free_space??"4G"),options:String(P.options??""),enabled:P.enabled!==!1}));return l(B),b(!1),j(null),h([]),pu().then(P=>{if(!L)return;const M=new Set;for(const A of P.disks)for(const F of[A,...A.partitions])F.mountpoint?.startsWith("/mnt/")&&M.add(F.mountpoint);a([...M].sort())}).catch(()=>a([])),()=>{L=!1}},[t]);const N=(L,B)=>{b(!0),j(null),f(null),l(P=>P.map(M=>{if(M.id!==L)return M;const A={...M,...B};return B.name!==void 0&&(M.mount_point===""||M.mount_point===`/mnt/${M.name}`)&&(A.mount_point=B.name?`/mnt/${B.name}`:""),A}))},E=(L,B)=>{b(!0),j(null),f(null),l(P=>P.map(M=>M.id===L?{...M,branches:M.branches.includes(B)?M.branches.filter(A=>A!==B):[...M.branches,B]}:M))},C=(L,B,P)=>{b(!0),j(null),f(null),l(M=>M.map(A=>{if(A.id!==L)return A;const F=B+P;if(F<0||F>=A.branches.length)return A;const D=[...A.branches];return[D[B],D[F]]=[D[F],D[B]],{...A,branches:D}}))},k=()=>{b(!0),j(null),f(null),l(L=>[...L,Kp()])},O=L=>{b(!0),j(null),f(null),l(B=>B.filter(P=>P.id!==L))},S=d.useMemo(()=>{const L={};for(const B of i){const P=[];B.name.trim()||P.push("Name is required."),new Set(B.branches).size<2&&P.push("Add at least two distinct branches."),(!B.mount_point.startsWith("/mnt/")||B.mount_point.includes(".."))&&P.push("Mount point must be a safe path under /mnt/."),I_.test(B.min_free_space.trim())||P.push("Min free space must look like 4G, 500M, 1T."),P.length&&(L[B.id]=P)}return L},[i]),$=()=>({...t,enabled:!0,pools:i.map(L=>({id:L.id,name:L.name,mount_point:L.mount_point,branches:L.branches,create_policy:L.create_policy,preset:L.preset,min_free_space:L.min_free_space,options:L.options,enabled:L.enabled}))}),R=Object.values(S).flat(),H=async()=>{if(R.length){h(R);return}p("preview"),h([]),f(null);try{j(await Lg(e,$()))}catch(L){h([L instanceof Error?L.message:"Preview failed"])}finally{p("")}},I=async()=>{if(R.length){h(R);return}p("save"),h([]),f(null);const L=await $g(e,$());p(""),L.ok?(b(!1),f("Saved. Apply to (re)mount pools."),r()):h(L.details.length?L.details:[L.error??"Save failed"])},U=async()=>{g(!1),p("apply"),h([]),f(null);const L=await Ig(e);p(""),L.ok?(f(L.message??"Applied."),r()):h([L.error??"Apply failed"])};return s?n.jsxs("div",{className:"space-y-4","data-mergerfs-editor":!0,children:[i.map(L=>n.jsxs("div",{className:"space-y-3 rounded-lg border border-border/70 p-3","data-pool-editor":L.id,children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx("input",{"aria-label":"Pool name",className:"h-9 flex-1 rounded-md border border-input bg-background px-2 text-sm","data-pool-name":L.id,onChange:B=>N(L.id,{name:B.target.value}),placeholder:"pool name",value:L.name}),n.jsxs("label",{className:"flex items-center gap-1 text-xs text-muted-foreground",children:[n.jsx("input",{checked:L.enabled,"data-pool-enabled":L.id,onChange:B=>N(L.id,{enabled:B.target.checked}),type:"checkbox"}),"enabled"]}),n.jsx(_,{"aria-label":"Remove pool","data-pool-remove":L.id,onClick:()=>O(L.id),size:"icon",title:"Remove pool",variant:"ghost",children:n.jsx(Kt,{"aria-hidden":"true",className:"h-4 w-4"})})]}),n.jsx("input",{"aria-label":"Mount point",className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",onChange:B=>N(L.id,{mount_point:B.target.value}),placeholder:"/mnt/<name>",value:L.mount_point}),n.jsxs("div",{className:"space-y-1",children:[n.jsx("p",{className:"text-xs text-muted-foreground",children:"Branches (at least 2, in priority order)"}),L.branches.length?n.jsx("ol",{className:"divide-y divide-border overflow-hidden rounded-md border border-border","data-pool-branches":L.id,children:L.branches.map((B,P)=>n.jsxs("li",{className:"flex min-h-10 items-center gap-2 bg-muted/15 px-2",children:[n.jsx("span",{className:"w-5 shrink-0 text-center font-mono text-[10px] text-dim",children:P+1}),n.jsx("code",{className:"min-w-0 flex-1 truncate text-xs",title:B,children:B}),n.jsxs("div",{className:"flex shrink-0 items-center gap-1",children:[n.jsx(_,{"aria-label":`Move ${B} up`,disabled:P===0,onClick:()=>C(L.id,P,-1),size:"icon",title:"Move branch up",variant:"ghost",children:n.jsx(ow,{"aria-hidden":"true",className:"h-3.5 w-3.5"})}),n.jsx(_,{"aria-label":`Move ${B} down`,disabled:P===L.branches.length-1,onClick:()=>C(L.id,P,1),size:"icon",title:"Move branch down",variant:"ghost",children:n.jsx(nw,{"aria-hidden":"true",className:"h-3.5 w-3.5"})}),n.jsx(_,{"aria-label":`Remove ${B}`,onClick:()=>E(L.id,B),size:"icon",title:"Remove branch",variant:"ghost",children:n.jsx(We,{"aria-hidden":"true",className:"h-3.5 w-3.5"})})]})]},B))}):null,n.jsx("div",{className:"flex flex-wrap gap-1.5 pt-1",children:s.filter(B=>!L.branches.includes(B)).map(B=>n.jsxs(_,{"data-pool-branch-add":`${L.id}:${B}`,onClick:()=>E(L.id,B),size:"sm",variant:"outline",children:[n.jsx(ot,{"aria-hidden":"true",className:"mr-1 h-3.5 w-3.5"}),B]},B))}),n.jsxs("div",{className:"flex gap-2 pt-1",children:[n.jsx("input",{"aria-label":"Custom branch path or glob",className:"h-8 flex-1 rounded-md border border-input bg-background px-2 text-xs",onChange:B=>c(P=>({...P,[L.id]:B.target.value})),placeholder:"/mnt/disk*/data (glob)",value:o[L.id]??""}),n.jsx(_,{onClick:()=>{const B=(o[L.id]??"").trim();B&&(E(L.id,B),c(P=>({...P,[L.id]:""})))},size:"sm",variant:"outline",children:"Add"})]})]}),n.jsxs("div",{className:"grid grid-cols-1 gap-2 sm:grid-cols-2",children:[n.jsxs("label",{className:"space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:"Create policy"}),n.jsx("select",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",onChange:B=>N(L.id,{create_policy:B.target.value}),value:L.create_policy,children:T_.map(B=>n.jsx("option",{value:B.value,children:B.label},B.value))})]}),n.jsxs("label",{className:"space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:"Options preset"}),n.jsx("select",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",onChange:B=>N(L.id,{preset:B.target.value}),value:L.preset,children:$_.map(B=>n.jsx("option",{value:B.value,children:B.label},B.value))})]}),n.jsxs("label",{className:"space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:"Min free space"}),n.jsx("input",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",onChange:B=>N(L.id,{min_free_space:B.target.value}),value:L.min_free_space})]}),n.jsxs("label",{className:"space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:"Extra options"}),n.jsx("input",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",onChange:B=>N(L.id,{options:B.target.value}),placeholder:"comma,separated",value:L.options})]})]}),S[L.id]?n.jsx("ul",{className:"space-y-1","data-pool-errors":L.id,children:S[L.id].map(B=>n.jsxs("li",{className:"flex items-start gap-1.5 text-xs text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-3.5 w-3.5 shrink-0"}),B]},B))}):null]},L.id)),n.jsxs(_,{className:"gap-1.5","data-pool-add":!0,onClick:k,size:"sm",variant:"outline",children:[n.jsx(ot,{"aria-hidden":"true",className:"h-4 w-4"}),"Add pool"]}),u.length?n.jsx("ul",{className:"space-y-1 rounded-md bg-danger/10 p-2","data-mergerfs-errors":!0,children:u.map(L=>n.jsx("li",{className:"text-xs font-medium text-danger",children:L},L))}):null,m?n.jsx("p",{className:"text-xs font-medium text-success",role:"status",children:m}):null,w?n.jsxs("section",{"aria-labelledby":"mergerfs-preview-title",className:"overflow-hidden rounded-md border border-border","data-mergerfs-preview":!0,children:[n.jsx("div",{className:"border-b border-border bg-muted/20 px-3 py-2",children:n.jsx("h3",{className:"font-mono text-xs font-semibold",id:"mergerfs-preview-title",children:"Managed fstab preview"})}),n.jsx("pre",{className:"max-h-64 overflow-auto whitespace-pre-wrap break-all p-3 text-xs text-muted-foreground",children:w})]}):null,x?n.jsxs("div",{className:"space-y-2 rounded-md border border-warning/40 bg-warning/10 p-3 text-xs","data-apply-confirm":!0,children:[n.jsxs("p",{className:"flex items-center gap-1.5 font-medium text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Apply rewrites the managed /etc/fstab section and (re)mounts pools. Disabled pools are unmounted and removed from the section. Continue?"]}),n.jsxs("div",{className:"flex gap-2",children:[n.jsx(_,{"data-apply-confirm-yes":!0,onClick:()=>void U(),size:"sm",variant:"danger",children:"Apply changes"}),n.jsx(_,{onClick:()=>g(!1),size:"sm",variant:"outline",children:"Cancel"})]})]}):null,n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsxs(_,{className:"gap-1.5","data-mergerfs-preview-open":!0,disabled:v!==""||!!R.length,onClick:()=>void H(),size:"sm",variant:"outline",children:[n.jsx(ru,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),v==="preview"?"Previewing...":"Preview"]}),n.jsx(_,{"data-mergerfs-save":!0,disabled:v!==""||!!R.length,onClick:()=>void I(),size:"sm",children:v==="save"?"Saving...":"Save"}),n.jsx(_,{"data-mergerfs-apply":!0,disabled:v!==""||y||!!R.length,onClick:()=>g(!0),size:"sm",variant:"secondary",children:v==="apply"?"Applying...":"Apply"}),y?n.jsx("span",{className:"text-xs text-warning",children:"Save changes before applying."}):null]})]}):n.jsxs("p",{className:"flex items-center gap-2 text-sm text-muted-foreground",children:[n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"})," Loading disks..."]})}function vu({pool:e}){const t=e.totalBytes!==null&&e.freeBytes!==null?e.totalBytes-e.freeBytes:null,r=e.usedPercent!==null&&e.usedPercent>=90?"danger":"primary";return n.jsx(Q,{className:q("transition-colors hover:border-primary/25",!e.mounted&&"border-warning/30 bg-warning/5"),"data-pool-card":e.name,"data-pool-provider":e.providerId,children:n.jsxs(K,{className:"space-y-4 p-4",children:[n.jsxs("div",{className:"flex items-start justify-between gap-3",children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-2.5",children:[n.jsx(su,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-primary"}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("h2",{className:"truncate text-sm font-semibold",children:e.name}),n.jsx("p",{className:"mt-0.5 truncate font-mono text-[11px] text-dim",children:e.mountPoint??"Mount point not reported"})]})]}),n.jsx(fe,{label:e.mounted?"mounted":"unmounted",tone:e.mounted?"success":"warning"})]}),n.jsxs("dl",{className:"grid grid-cols-2 gap-x-4 gap-y-3 border-y border-border py-3 text-xs",children:[n.jsxs("div",{children:[n.jsx("dt",{className:"font-mono text-[10px] uppercase text-dim",children:"Branches"}),n.jsx("dd",{className:"mt-1 text-foreground",children:e.branchCount??"Not reported"})]}),n.jsxs("div",{children:[n.jsx("dt",{className:"font-mono text-[10px] uppercase text-dim",children:"Policy"}),n.jsx("dd",{className:"mt-1 truncate text-foreground",children:e.policy??"Provider default"})]})]}),e.usedPercent!==null?n.jsxs("div",{className:"space-y-1.5",children:[n.jsx(Yt,{label:`${e.name} capacity`,tone:r,value:e.usedPercent}),n.jsx("p",{className:"font-mono text-[11px] tabular-nums text-dim",children:t!==null&&e.totalBytes!==null?`${Pe(t)} / ${Pe(e.totalBytes)}`:`${Math.round(e.usedPercent)}% used`})]}):null,n.jsxs("div",{className:"flex items-end justify-between gap-3 pt-1",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase text-dim",children:"Provider"}),n.jsx("p",{className:"mt-0.5 truncate text-xs text-muted-foreground",children:e.providerName})]}),n.jsxs(Ee,{"aria-label":`Manage ${e.name}`,className:q(Ye({size:"sm",variant:"outline"}),"gap-2"),to:Ix(e.providerId),children:[n.jsx(_s,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Manage"]})]}),e.recentAction?n.jsx("p",{className:"truncate border-t border-border pt-3 text-xs text-dim",title:e.recentAction,children:e.recentAction}):null]})})}function z_(e){return e instanceof Error&&e.message?e.message:"Unable to load the latest provider log"}function O_({detail:e,status:t,pools:r,canConfigure:s,onRefresh:a}){const[i,l]=d.useState(t.lifecycle.configured?"overview":s?"configuration":"overview"),[o,c]=d.useState("idle"),[u,h]=d.useState(null),[m,f]=d.useState(""),w=r.map(p=>p.name),j=e.commands.filter(p=>["mount","unmount","balance"].includes(p.id)),y=e.commands.filter(p=>p.id==="status"),b=[{id:"overview",label:"Overview"},...s?[{id:"configuration",label:"Configuration"}]:[],{id:"diagnostics",label:"Diagnostics"}],v=d.useCallback(async()=>{c("loading"),f("");try{h(await zg("mergerfs")),c("ready")}catch(p){f(z_(p)),c("error")}},[]);return d.useEffect(()=>{i==="diagnostics"&&o==="idle"&&v()},[v,o,i]),n.jsxs("div",{className:"space-y-5","data-capability-renderer":"mergerfs",children:[n.jsx("div",{className:"flex gap-1 overflow-x-auto border-b border-border",role:"tablist","aria-label":"MergerFS provider views",children:b.map(p=>n.jsx("button",{"aria-controls":`mergerfs-panel-${p.id}`,"aria-selected":i===p.id,className:q("min-h-11 shrink-0 border-b-2 px-3 font-mono text-xs transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring",i===p.id?"border-primary text-primary":"border-transparent text-muted-foreground hover:text-foreground"),"data-mergerfs-tab":p.id,id:`mergerfs-tab-${p.id}`,onClick:()=>l(p.id),onKeyDown:Yl,role:"tab",tabIndex:i===p.id?0:-1,type:"button",children:p.label},p.id))}),i==="overview"?n.jsxs("div",{"aria-labelledby":"mergerfs-tab-overview",className:"space-y-5",id:"mergerfs-panel-overview",role:"tabpanel",children:[n.jsx(gu,{status:t}),r.length?n.jsxs("section",{"aria-labelledby":"mergerfs-pools-title",children:[n.jsxs("div",{className:"mb-3 flex items-center justify-between gap-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"mergerfs-pools-title",children:"Configured pools"}),n.jsxs("span",{className:"text-xs text-dim",children:[r.filter(p=>p.mounted).length,"/",r.length," mounted"]})]}),n.jsx("div",{className:"grid gap-3 sm:grid-cols-2 xl:grid-cols-3",children:r.map(p=>n.jsx(vu,{pool:p},p.id))})]}):n.jsxs("div",{className:"border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm",children:[n.jsx("p",{className:"font-medium text-warning",children:"No pools configured"}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:s?"Open Configuration to add the first MergerFS pool.":"An administrator must configure the first MergerFS pool."})]}),j.length?n.jsxs("section",{"aria-labelledby":"mergerfs-operations-title",className:"border-t border-border pt-5",children:[n.jsx("h2",{className:"sr-only",id:"mergerfs-operations-title",children:"Pool operations"}),s?n.jsx(ua,{commands:j,heading:"Pool operations",onCompleted:a,pluginId:"mergerfs",poolNames:w}):n.jsx("p",{className:"text-xs text-muted-foreground",children:"Administrator access is required for mount, unmount, and balance operations."})]}):null]}):null,i==="configuration"&&s?n.jsxs("section",{"aria-labelledby":"mergerfs-tab-configuration",className:"space-y-4",id:"mergerfs-panel-configuration",role:"tabpanel",children:[n.jsxs("div",{children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"Pool configuration"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Order branches by priority, choose the create policy, preview the managed fstab section, then save and apply."})]}),n.jsx(L_,{config:e.config,onSaved:a,pluginId:"mergerfs"})]}):null,i==="diagnostics"?n.jsxs("div",{"aria-labelledby":"mergerfs-tab-diagnostics",className:"space-y-5",id:"mergerfs-panel-diagnostics",role:"tabpanel",children:[y.length?n.jsx(ua,{commands:y,heading:"Live diagnostics",onCompleted:a,pluginId:"mergerfs",poolNames:w}):null,n.jsxs("section",{"aria-labelledby":"mergerfs-log-title",className:"overflow-hidden rounded-md border border-border",children:[n.jsxs("div",{className:"flex items-center justify-between gap-3 border-b border-border bg-muted/20 px-3 py-2",children:[n.jsxs("h2",{className:"flex items-center gap-2 font-mono text-xs font-semibold",id:"mergerfs-log-title",children:[n.jsx(Bl,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Latest provider log"]}),n.jsx(_,{"aria-label":"Reload provider log",disabled:o==="loading",onClick:()=>void v(),size:"icon",title:"Reload provider log",variant:"ghost",children:n.jsx(je,{"aria-hidden":"true",className:q("h-3.5 w-3.5",o==="loading"&&"animate-spin")})})]}),o==="error"?n.jsxs("p",{className:"flex items-center gap-2 p-3 text-xs text-danger",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),m]}):null,o==="ready"?n.jsx("pre",{className:"max-h-72 overflow-auto whitespace-pre-wrap break-words p-3 text-xs text-muted-foreground","data-mergerfs-log":!0,children:u||"No provider log is available."}):null,o==="loading"?n.jsx("p",{className:"p-3 text-xs text-muted-foreground",children:"Loading provider log…"}):null]})]}):null]})}function Rr(e){return e&&typeof e=="object"&&!Array.isArray(e)?e:{}}function bi(e){if(e==null||e==="")return null;const t=Number(e);return Number.isFinite(t)?t:null}function D_(e,t){return t?["ok","active","healthy","mounted","ready"].includes(e)?"healthy":["warning","degraded","unmounted"].includes(e)?"warning":["error","failed"].includes(e)?"error":e==="disabled"?"disabled":"unknown":"unconfigured"}function U_(e){const t=Rr(e.status);if(!e.id||t.schema_version!=="1"||t.capability_id!=="storage.pooling")return null;const r=Rr(e.renderer);return{id:String(e.id),name:String(e.name??e.id),enabled:!!(e.enabled??t.lifecycle.enabled),operational:!!e.operational,status:t,rendererId:String(r.id??"generic"),rendererMode:r.mode==="tailored"?"tailored":"generic",source:e.source==="legacy"?"legacy":"registry"}}function B_(e){const t=e.status.details.pools;return Array.isArray(t)?t.map((r,s)=>{const a=Rr(r),i=a.branches,l=Array.isArray(i)?i.length:bi(i??a.branch_count),o=bi(a.total_bytes),c=bi(a.free_bytes??a.available_bytes),h=bi(a.used_percent)??(o!==null&&o>0&&c!==null?(o-c)/o*100:null),m=!!a.mounted,f=String(a.health??""),w=["healthy","warning","error","unknown","disabled","unconfigured","incompatible","unavailable"].includes(f)?f:m?"healthy":"warning",j=String(a.name??`pool-${s+1}`);return{id:`${e.id}:${j}`,name:j,providerId:e.id,providerName:e.name,mountPoint:a.mount_point!=null?String(a.mount_point):null,mounted:m,branchCount:l,policy:a.policy!=null?String(a.policy):a.create_policy!=null?String(a.create_policy):null,totalBytes:o,freeBytes:c,usedPercent:h,health:w,recentAction:a.recent_action!=null?String(a.recent_action):null}}):[]}function Jg(e){const t=e.providers.map(m=>U_(m)).filter(m=>m!==null).sort((m,f)=>m.name.localeCompare(f.name)),r=t.filter(m=>m.enabled),s=t.filter(m=>!m.enabled),a=r.filter(m=>!m.status.lifecycle.configured),i=r.filter(m=>m.status.lifecycle.configured),l=i.flatMap(m=>B_(m)).sort((m,f)=>m.name.localeCompare(f.name)),o=l.filter(m=>m.totalBytes!==null),c=l.filter(m=>m.freeBytes!==null),u=r.filter(m=>["warning","error","unavailable","incompatible"].includes(m.status.health.state)).length,h=l.filter(m=>!m.mounted).length;return{enabledProviders:r,availableProviders:s,setupProviders:a,configuredProviders:i,pools:l,summary:{totalPools:l.length,mountedPools:l.filter(m=>m.mounted).length,totalBytes:o.length?o.reduce((m,f)=>m+(f.totalBytes??0),0):null,freeBytes:c.length?c.reduce((m,f)=>m+(f.freeBytes??0),0):null,warnings:Math.max(u,h)}}}function F_(e,t,r){const s=e.find(u=>u.id==="mergerfs"&&u.installed);if(!s)return{id:"storage.pooling",surface:"pools",providers:[]};const a=t.mergerfs,i=Rr(a?.status),l=Rr(i.details),o=s.enabled?D_(String(i.status??s.status),s.configured):"disabled",c={schema_version:"1",provider_id:s.id,capability_id:"storage.pooling",observed_at:r,lifecycle:{installed:s.installed,enabled:s.enabled,configured:s.configured,compatibility:"compatible",availability:a?"available":"unknown"},health:{state:o,message:String(i.message??s.status_message??"Provider status is available through the compatibility adapter."),issues:[]},summary:[],metrics:[],recent_activity:[],details:l};return{id:"storage.pooling",surface:"pools",providers:[{id:s.id,name:s.name,enabled:s.enabled,operational:s.enabled&&s.configured&&o==="healthy",renderer:{id:"mergerfs",mode:"tailored"},status:c,source:"legacy"}]}}function V_(e,t){if(!e.providers.length)return t;const r=new Map(t.providers.map(s=>[s.id,s]));return{...e,providers:e.providers.map(s=>{const a=r.get(s.id);if(!a)return s;const i=Rr(s.status),l=Rr(a.status);return Array.isArray(i.details?.pools)?s:{...s,status:{...i,details:l.details}}})}}function q_(e){return e instanceof Error&&e.message?e.message:"Unable to load pooling providers"}function Yg(e){return e==="healthy"?"success":e==="warning"||e==="unconfigured"?"warning":["error","unavailable","incompatible"].includes(e)?"danger":"neutral"}function H_({view:e}){const{summary:t}=e,r=[{label:"Pools",value:String(t.totalPools),detail:`${e.enabledProviders.length} enabled provider${e.enabledProviders.length===1?"":"s"}`},{label:"Mounted",value:`${t.mountedPools}/${t.totalPools}`,detail:t.totalPools?t.mountedPools!==t.totalPools?"Mount state needs attention":"All configured pools available":"No pools configured"},{label:"Capacity",value:Pe(t.totalBytes)??"Not reported",detail:`${Pe(t.freeBytes)??"Unknown"} free`},{label:"Warnings",value:String(t.warnings),detail:t.warnings?"Review provider health":"No provider warnings"}];return n.jsx("dl",{"aria-label":"Pool summary",className:"grid grid-cols-2 overflow-hidden rounded-md border border-border bg-card xl:grid-cols-4","data-pool-summary":!0,children:r.map(s=>n.jsxs("div",{className:"min-w-0 border-b border-border p-4 odd:border-r [&:nth-last-child(-n+2)]:border-b-0 xl:border-b-0 xl:border-r xl:last:border-r-0",children:[n.jsx("dt",{className:"font-mono text-[10px] uppercase text-dim",children:s.label}),n.jsx("dd",{className:"mt-1 text-lg font-semibold tabular-nums text-foreground",children:s.value}),n.jsx("p",{className:"mt-1 truncate text-xs text-muted-foreground",title:s.detail,children:s.detail})]},s.label))})}function Ho({provider:e,actionLabel:t="Set up"}){return n.jsxs("div",{className:"grid gap-3 px-4 py-3 sm:grid-cols-[minmax(0,1fr)_auto] sm:items-center","data-pool-provider-row":e.id,children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx("span",{className:"flex h-9 w-9 shrink-0 items-center justify-center rounded-md border border-border bg-muted/25 text-primary",children:n.jsx(Ul,{"aria-hidden":"true",className:"h-4 w-4"})}),n.jsxs("div",{className:"min-w-0",children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx("h3",{className:"font-mono text-sm font-semibold",children:e.name}),n.jsx(fe,{label:e.status.health.state,tone:Yg(e.status.health.state)})]}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:e.status.health.message})]})]}),n.jsxs(Ee,{className:q(Ye({size:"sm",variant:"outline"}),"gap-2"),to:Ix(e.id),children:[n.jsx(_s,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),t]})]})}function W_({provider:e,canAdmin:t,detail:r,onRefresh:s}){const a=Jg({providers:[{...e,renderer:{id:e.rendererId,mode:e.rendererMode}}]}).pools,i=eu(e.id),l=e.id==="mergerfs"&&r!==null;return n.jsxs("div",{className:"space-y-5","data-pool-provider-details":e.id,children:[n.jsxs(Ee,{className:q(Ye({size:"sm",variant:"ghost"}),"gap-2 px-0 hover:bg-transparent"),to:ve.pools,children:[n.jsx(vs,{"aria-hidden":"true",className:"h-4 w-4"}),"Back to pools"]}),n.jsx(pt,{actions:t&&!l?n.jsxs(Ee,{className:q(Ye({variant:"secondary"}),"gap-2"),to:i,children:[n.jsx(_s,{"aria-hidden":"true",className:"h-4 w-4"}),"Configure provider"]}):void 0,description:r?.description||"Storage pooling provider",status:n.jsx(fe,{label:e.status.health.state,tone:Yg(e.status.health.state)}),title:e.name}),l?n.jsx(O_,{canConfigure:t,detail:r,onRefresh:s,pools:a,status:e.status}):n.jsxs(n.Fragment,{children:[n.jsx(Qg,{status:e.status}),a.length?n.jsxs("section",{"aria-labelledby":"provider-pools-title",children:[n.jsx("h2",{className:"mb-3 font-mono text-sm font-semibold",id:"provider-pools-title",children:"Configured pools"}),n.jsx("div",{className:"grid gap-3 sm:grid-cols-2 xl:grid-cols-3",children:a.map(o=>n.jsx(vu,{pool:o},o.id))})]}):null,e.status.lifecycle.configured?null:n.jsxs("div",{className:"border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm",children:[n.jsx("p",{className:"font-medium text-warning",children:"Provider setup is required"}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:"Configure this provider before it can create operational pool cards."})]})]})]})}function Qp(){const{providerId:e}=Zd(),{permissions:t}=Ln(),r=t.includes("extensions.admin"),[s,a]=d.useState("loading"),[i,l]=d.useState({id:"storage.pooling",surface:"pools",providers:[]}),[o,c]=d.useState({}),[u,h]=d.useState(""),[m,f]=d.useState(""),[w,j]=d.useState("Never"),y=d.useCallback(async(p=!1)=>{p||a("loading");const[x,g]=await Promise.allSettled([Eg("storage.pooling"),Ql()]),N=g.status==="fulfilled"?g.value:[],E=[];if(N.find($=>$.id==="mergerfs"&&$.installed)){const $=await Tg("mergerfs").catch(()=>null);E.push(["mergerfs",$])}const k=new Date().toISOString(),O=F_(N,Object.fromEntries(E),k);if(x.status==="rejected"&&g.status==="rejected"){if(p){f("Refresh failed; showing the last successful provider state.");return}h(q_(x.reason)),a("error");return}const S=x.status==="fulfilled"?V_(x.value,O):O;l(S),c(Object.fromEntries(E)),f(x.status==="rejected"&&O.providers.length?"Capability registry unavailable; showing compatibility data from the existing MergerFS provider.":""),h(""),j(Bt(new Date)),a("ready")},[]);d.useEffect(()=>{y(!1)},[y]);const b=d.useMemo(()=>Jg(i),[i]),v=e?[...b.enabledProviders,...b.availableProviders].find(p=>p.id===e):null;return e&&s==="ready"&&v?n.jsx(W_,{canAdmin:r,detail:o[v.id]??null,onRefresh:()=>y(!0),provider:v}):e&&s==="ready"&&!v?n.jsxs("section",{className:"space-y-5",children:[n.jsxs(Ee,{className:q(Ye({size:"sm",variant:"ghost"}),"gap-2 px-0"),to:ve.pools,children:[n.jsx(vs,{"aria-hidden":"true",className:"h-4 w-4"}),"Back to pools"]}),n.jsxs("div",{className:"flex min-h-64 flex-col items-center justify-center rounded-md border border-dashed border-border px-5 text-center",children:[n.jsx(za,{"aria-hidden":"true",className:"h-7 w-7 text-warning"}),n.jsx("h1",{className:"mt-3 font-mono text-base font-semibold",children:"Pooling provider not found"}),n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:"The provider may be disabled, removed, or incompatible."})]})]}):n.jsxs("section",{className:"space-y-5 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(n.Fragment,{children:[r?n.jsxs(Ee,{className:q(Ye({variant:"secondary"}),"gap-2"),to:ve.extensions,children:[n.jsx(ot,{"aria-hidden":"true",className:"h-4 w-4"}),"Add provider"]}):null,n.jsxs(_,{className:"gap-2",disabled:s==="loading",onClick:()=>void y(!1),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",s==="loading"&&"animate-spin")}),"refresh"]})]}),description:`${b.summary.totalPools} pools · synced ${w}`,status:s==="ready"?n.jsx(fe,{label:b.summary.warnings?`${b.summary.warnings} warning${b.summary.warnings===1?"":"s"}`:"pooling ready",tone:b.summary.warnings?"warning":"success"}):void 0,title:"storage_pools"}),s==="loading"?n.jsxs("div",{"aria-live":"polite",className:"flex min-h-56 items-center justify-center gap-2 rounded-md border border-border text-sm text-muted-foreground",role:"status",children:[n.jsx(je,{"aria-hidden":"true",className:"h-4 w-4 animate-spin text-primary"}),"Loading pooling providers..."]}):null,s==="error"?n.jsxs("div",{"aria-live":"assertive",className:"border-l-2 border-danger bg-danger/5 px-4 py-4 text-sm text-danger",role:"alert",children:[n.jsxs("div",{className:"flex items-center gap-2 font-medium",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Pools are unavailable"]}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:u}),n.jsx(_,{className:"mt-3",onClick:()=>void y(!1),size:"sm",variant:"outline",children:"Retry"})]}):null,s==="ready"?n.jsx(H_,{view:b}):null,m?n.jsx("div",{className:"border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm text-muted-foreground","data-pool-compatibility-warning":!0,children:m}):null,s==="ready"&&!b.enabledProviders.length?n.jsxs("div",{className:"flex min-h-56 flex-col items-center justify-center rounded-md border border-dashed border-border px-5 text-center","data-pools-empty":!0,children:[n.jsx(ul,{"aria-hidden":"true",className:"h-7 w-7 text-dim"}),n.jsx("h2",{className:"mt-3 font-mono text-sm font-semibold",children:"No pooling provider is enabled"}),n.jsx("p",{className:"mt-1 max-w-lg text-sm text-muted-foreground",children:"Enable a storage pooling provider to combine mounted disks into managed pools."}),r?n.jsxs(Ee,{className:q(Ye({size:"sm"}),"mt-4 gap-2"),to:ve.extensions,children:[n.jsx(ot,{"aria-hidden":"true",className:"h-4 w-4"}),"Add provider"]}):null]}):null,s==="ready"&&b.pools.length?n.jsxs("section",{"aria-labelledby":"configured-pools-title",children:[n.jsxs("div",{className:"mb-3 flex items-center justify-between",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"configured-pools-title",children:"Configured pools"}),n.jsxs("span",{className:"text-xs text-dim",children:[b.summary.mountedPools,"/",b.summary.totalPools," mounted"]})]}),n.jsx("div",{className:"grid gap-3 sm:grid-cols-2 xl:grid-cols-3",children:b.pools.map(p=>n.jsx(vu,{pool:p},p.id))})]}):null,s==="ready"&&b.setupProviders.length?n.jsxs("section",{"aria-labelledby":"pool-setup-title",className:"overflow-hidden rounded-md border border-border bg-card",children:[n.jsxs("div",{className:"border-b border-border px-4 py-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"pool-setup-title",children:"Setup required"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Enabled providers appear here until their first pool is configured."})]}),n.jsx("div",{className:"divide-y divide-border",children:b.setupProviders.map(p=>n.jsx(Ho,{provider:p},p.id))})]}):null,s==="ready"&&b.configuredProviders.filter(p=>!b.pools.some(x=>x.providerId===p.id)).length?n.jsxs("section",{"aria-labelledby":"pool-provider-status-title",className:"overflow-hidden rounded-md border border-border bg-card",children:[n.jsxs("div",{className:"border-b border-border px-4 py-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"pool-provider-status-title",children:"Provider status"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Configured providers that do not currently report individual pools."})]}),n.jsx("div",{className:"divide-y divide-border",children:b.configuredProviders.filter(p=>!b.pools.some(x=>x.providerId===p.id)).map(p=>n.jsx(Ho,{actionLabel:"View",provider:p},p.id))})]}):null,s==="ready"&&b.availableProviders.length?n.jsxs("section",{"aria-labelledby":"available-pool-providers-title",className:"overflow-hidden rounded-md border border-border bg-card",children:[n.jsxs("div",{className:"border-b border-border px-4 py-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"available-pool-providers-title",children:"Available providers"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Installed pooling providers that are currently disabled."})]}),n.jsx("div",{className:"divide-y divide-border",children:b.availableProviders.map(p=>n.jsx(Ho,{actionLabel:"Review",provider:p},p.id))})]}):null]})}function G_(e){return e==="healthy"?"success":e==="warning"||e==="unconfigured"?"warning":["error","unavailable","incompatible"].includes(e)?"danger":"neutral"}function Jp(e){if(!e)return"Not reported";const t=new Date(e);return Number.isNaN(t.getTime())?e:t.toLocaleString([],{dateStyle:"medium",timeStyle:"short"})}function yu({protectionSet:e}){const t=e.health==="error"?"danger":"warning";return n.jsxs("article",{className:q("overflow-hidden rounded-md border bg-card",e.requiredAction?t==="danger"?"border-danger/45":"border-warning/45":"border-border"),"data-protection-set":e.name,children:[n.jsxs("div",{className:"flex items-start justify-between gap-3 px-4 py-3",children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-2.5",children:[n.jsx(jt,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-primary"}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("h2",{className:"truncate font-mono text-sm font-semibold",children:e.name}),n.jsx("p",{className:"mt-0.5 text-xs capitalize text-muted-foreground",children:e.kind})]})]}),n.jsx(fe,{className:"shrink-0",label:e.health,tone:G_(e.health)})]}),n.jsx("dl",{className:"grid grid-cols-3 border-y border-border",children:[{label:"Protected",value:e.protectedTargets},{label:"Unprotected",value:e.unprotectedTargets},{label:"Parity / copies",value:e.parityTargets}].map(r=>n.jsxs("div",{className:"min-w-0 border-r border-border px-3 py-2.5 last:border-r-0",children:[n.jsx("dt",{className:"font-mono text-[9px] uppercase text-dim",children:r.label}),n.jsx("dd",{className:"mt-1 text-sm font-semibold tabular-nums",children:r.value??"—"})]},r.label))}),n.jsxs("div",{className:"space-y-2 px-4 py-3 text-xs text-muted-foreground",children:[n.jsxs("p",{className:"flex items-start gap-2",children:[n.jsx(Bx,{"aria-hidden":"true",className:"mt-0.5 h-3.5 w-3.5 shrink-0"}),n.jsxs("span",{children:[n.jsx("span",{className:"text-dim",children:"Last run"}),n.jsx("br",{}),Jp(e.lastRunAt)]})]}),n.jsxs("p",{className:"flex items-start gap-2",children:[n.jsx(Gc,{"aria-hidden":"true",className:"mt-0.5 h-3.5 w-3.5 shrink-0"}),n.jsxs("span",{children:[n.jsx("span",{className:"text-dim",children:"Next run"}),n.jsx("br",{}),e.nextRunAt?Jp(e.nextRunAt):e.schedule??"Not scheduled"]})]})]}),e.requiredAction?n.jsx("div",{className:q("border-t px-4 py-2.5 text-xs font-medium",t==="danger"?"border-danger/30 bg-danger/10 text-danger":"border-warning/30 bg-warning/10 text-warning"),"data-protection-action":!0,children:e.requiredAction}):null,n.jsxs("div",{className:"flex items-center justify-between gap-3 border-t border-border px-4 py-3",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"font-mono text-[9px] uppercase text-dim",children:"Provider"}),n.jsx("p",{className:"truncate text-xs text-muted-foreground",children:e.providerName})]}),n.jsxs(Ee,{"aria-label":`Manage ${e.name}`,className:q(Ye({size:"sm",variant:"outline"}),"shrink-0 gap-1.5"),to:Lx(e.providerId),children:[n.jsx(_s,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Manage"]})]})]})}const Yp=[{label:"Daily 03:00",cron:"0 3 * * *"},{label:"Daily 04:00",cron:"0 4 * * *"},{label:"Weekly Sun 04:00",cron:"0 4 * * 0"}];function Xp({label:e,enabled:t,cron:r,onEnabled:s,onCron:a,testid:i}){const l=Yp.some(o=>o.cron===r)?r:"custom";return n.jsxs("div",{className:"space-y-1.5","data-schedule-row":i,children:[n.jsxs("label",{className:"flex items-center gap-2 text-sm",children:[n.jsx("input",{checked:t,"data-schedule-enabled":i,onChange:o=>s(o.target.checked),type:"checkbox"}),e]}),t?n.jsxs("div",{className:"flex flex-wrap items-center gap-2 pl-6",children:[n.jsxs("select",{"aria-label":`${e} schedule`,className:"h-8 rounded-md border border-input bg-background px-2 text-xs","data-schedule-preset":i,onChange:o=>{o.target.value!=="custom"&&a(o.target.value)},value:l,children:[Yp.map(o=>n.jsx("option",{value:o.cron,children:o.label},o.cron)),n.jsx("option",{value:"custom",children:"Custom cron"})]}),n.jsx("input",{"aria-label":`${e} cron expression`,className:"h-8 flex-1 rounded-md border border-input bg-background px-2 font-mono text-xs","data-schedule-cron":i,onChange:o=>a(o.target.value),placeholder:"0 3 * * *",value:r})]}):null]})}function K_({value:e,onChange:t}){return n.jsxs("div",{className:"space-y-3","data-snapraid-schedule":!0,children:[n.jsx("p",{className:"font-mono text-xs uppercase text-muted-foreground",children:"Schedule"}),n.jsx(Xp,{cron:e.sync_cron,enabled:e.sync_enabled,label:"Automatic sync",onCron:r=>t({...e,sync_cron:r}),onEnabled:r=>t({...e,sync_enabled:r}),testid:"sync"}),n.jsx(Xp,{cron:e.scrub_cron,enabled:e.scrub_enabled,label:"Automatic scrub",onCron:r=>t({...e,scrub_cron:r}),onEnabled:r=>t({...e,scrub_enabled:r}),testid:"scrub"}),n.jsx("p",{className:"text-[0.7rem] text-muted-foreground",children:"Save then Apply to (re)create the systemd timers."})]})}function Q_(e){if(!e)return null;const t=/([\d.]+)\s*([KMGTP])?i?B?/i.exec(e.trim());if(!t)return null;const r=Number(t[1]);if(!Number.isFinite(r))return null;const s=(t[2]??"G").toUpperCase(),a={K:1/1e6,M:1/1e3,G:1,T:1e3,P:1e6};return r*(a[s]??1)}function Zp(e){const t=e.split("/").filter(Boolean);return t[t.length-1]??e}function J_({pluginId:e,config:t,onSaved:r}){const[s,a]=d.useState(null),[i,l]=d.useState(null),[o,c]=d.useState({}),[u,h]=d.useState(""),[m,f]=d.useState(""),[w,j]=d.useState({sync_enabled:!1,sync_cron:"0 3 * * *",scrub_enabled:!1,scrub_cron:"0 4 * * 0"}),[y,b]=d.useState(null),[v,p]=d.useState(""),[x,g]=d.useState([]),[N,E]=d.useState(null),[C,k]=d.useState(!1),[O,S]=d.useState(!1);d.useEffect(()=>{let P=!0;const M=t.scrub??{};h(M.percent!=null?String(M.percent):""),f(M.age_days!=null?String(M.age_days):"");const A=t.schedule??{};j({sync_enabled:A.sync_enabled===!0,sync_cron:String(A.sync_cron??"0 3 * * *"),scrub_enabled:A.scrub_enabled===!0,scrub_cron:String(A.scrub_cron??"0 4 * * 0")});const F={};for(const D of t.drives??[]){const G=String(D.path??"");G&&(F[G]={role:D.role??"data",content:!!D.content})}return c(F),S(!1),b(null),g([]),pu().then(D=>{if(!P)return;const G=new Set,se=[];for(const ue of D.disks){const Ce=[ue,...ue.partitions];for(const Re of Ce){const pe=Re.mountpoint??"";!pe.startsWith("/mnt/")||G.has(pe)||(G.add(pe),se.push({path:pe,uuid:Re.uuid??"",name:Zp(pe),sizeLabel:Re.size,sizeGb:Q_(Re.size)}))}}const de=new Set(se.map(ue=>ue.path));for(const ue of t.drives??[]){const Ce=String(ue.path??"");Ce&&!de.has(Ce)&&se.push({path:Ce,uuid:String(ue.uuid??""),name:String(ue.name??Zp(Ce)),sizeLabel:null,sizeGb:null,missing:!0})}a(se)}).catch(D=>{P&&l(D instanceof Error?D.message:"Failed to load disks")}),()=>{P=!1}},[t]);const $=(P,M)=>{S(!0),b(null),E(null),c(A=>{const F=A[P]??{role:"none",content:!1};return{...A,[P]:{...F,...M}}})},R=d.useMemo(()=>s?s.map(P=>({candidate:P,assignment:o[P.path]})).filter(P=>P.assignment&&P.assignment.role!=="none"):[],[s,o]),H=d.useMemo(()=>{const P=[],M=R.filter(G=>G.assignment.role==="data"),A=R.filter(G=>G.assignment.role==="parity");A.length<1&&P.push("Add at least one parity drive."),M.length<1&&P.push("Add at least one data drive.");const F=Math.max(0,...M.map(G=>G.candidate.sizeGb??0)),D=Math.min(1/0,...A.map(G=>G.candidate.sizeGb??1/0));return A.length&&M.length&&D<F&&P.push("A parity drive is smaller than the largest data drive; parity must be at least as large."),R.filter(G=>G.assignment.content).length<2&&P.push("Store content files on at least two drives (recommended)."),P},[R]),I=()=>{let P=0;const M=R.map(F=>{const D={id:F.candidate.name,name:F.candidate.name,path:F.candidate.path,uuid:F.candidate.uuid,role:F.assignment.role,content:F.assignment.content};return F.assignment.role==="parity"?(P+=1,{...D,parity_level:P}):D}),A={...t.scrub??{}};return u.trim()!==""&&(A.percent=Number(u)),m.trim()!==""&&(A.age_days=Number(m)),{...t,enabled:!0,drives:M,scrub:A,schedule:w}},U=async()=>{p("preview"),g([]);try{b(await Lg(e,I()))}catch(P){g([P instanceof Error?P.message:"Preview failed"])}finally{p("")}},L=async()=>{p("save"),g([]),E(null);const P=await $g(e,I());p(""),P.ok?(S(!1),E("Saved. Apply to write the SnapRAID config."),r()):g(P.details.length?P.details:[P.error??"Save failed"])},B=async()=>{k(!1),p("apply"),g([]),E(null);const P=await Ig(e);p(""),P.ok?(E(P.message??"Applied."),r()):g([P.error??"Apply failed"])};return i?n.jsxs("p",{className:"text-sm text-danger",children:["Could not load disks: ",i]}):s?n.jsxs("div",{className:"space-y-4","data-snapraid-editor":!0,children:[n.jsxs("div",{className:"space-y-2",children:[n.jsx("p",{className:"font-mono text-xs uppercase text-muted-foreground",children:"Drives"}),s.length?n.jsx("ul",{className:"space-y-2",children:s.map(P=>{const M=o[P.path]??{role:"none",content:!1};return n.jsxs("li",{className:`flex flex-wrap items-center gap-2 rounded-md border p-2 text-sm ${P.missing?"border-warning/40 bg-warning/5":"border-border/70"}`,"data-drive":P.path,"data-drive-missing":P.missing?"true":void 0,children:[n.jsx(Vl,{"aria-hidden":"true",className:"h-4 w-4 shrink-0 text-muted-foreground"}),n.jsxs("span",{className:"min-w-0 flex-1 truncate",children:[P.path,P.missing?n.jsx("span",{className:"ml-2 text-xs font-medium text-warning",children:"missing (not mounted)"}):n.jsx("span",{className:"ml-2 text-xs text-muted-foreground",children:P.sizeLabel??""})]}),n.jsxs("select",{"aria-label":`Role for ${P.path}`,className:"h-8 rounded-md border border-input bg-background px-2 text-xs","data-drive-role":P.path,onChange:A=>$(P.path,{role:A.target.value}),value:M.role,children:[n.jsx("option",{value:"none",children:"Unassigned"}),n.jsx("option",{value:"data",children:"Data"}),n.jsx("option",{value:"parity",children:"Parity"})]}),n.jsxs("label",{className:"flex items-center gap-1 text-xs text-muted-foreground",children:[n.jsx("input",{checked:M.content,"data-drive-content":P.path,disabled:M.role==="none",onChange:A=>$(P.path,{content:A.target.checked}),type:"checkbox"}),"content"]})]},P.path)})}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No mounted /mnt/* disks found. Mount data and parity disks first."})]}),H.length?n.jsx("ul",{className:"space-y-1","data-snapraid-warnings":!0,children:H.map(P=>n.jsxs("li",{className:"flex items-start gap-1.5 text-xs text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-3.5 w-3.5 shrink-0"}),P]},P))}):null,n.jsxs("div",{className:"grid grid-cols-2 gap-3",children:[n.jsxs("label",{className:"space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:"Scrub percent"}),n.jsx("input",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",max:100,min:0,onChange:P=>{S(!0),b(null),E(null),h(P.target.value)},placeholder:"8",type:"number",value:u})]}),n.jsxs("label",{className:"space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:"Scrub min age (days)"}),n.jsx("input",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",min:0,onChange:P=>{S(!0),b(null),E(null),f(P.target.value)},placeholder:"10",type:"number",value:m})]})]}),n.jsx(K_,{onChange:P=>{S(!0),b(null),E(null),j(P)},value:w}),x.length?n.jsx("ul",{className:"space-y-1 rounded-md bg-danger/10 p-2","data-snapraid-errors":!0,children:x.map(P=>n.jsx("li",{className:"text-xs font-medium text-danger",children:P},P))}):null,N?n.jsx("p",{className:"text-xs font-medium text-success",role:"status",children:N}):null,n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsxs(_,{className:"gap-1.5","data-snapraid-preview-open":!0,disabled:v!=="",onClick:()=>void U(),size:"sm",variant:"outline",children:[n.jsx(ru,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Preview"]}),n.jsx(_,{"data-snapraid-save":!0,disabled:v!=="",onClick:()=>void L(),size:"sm",children:v==="save"?"Saving...":"Save"}),n.jsx(_,{"data-snapraid-apply":!0,disabled:v!==""||O,onClick:()=>k(!0),size:"sm",variant:"secondary",children:v==="apply"?"Applying...":"Apply"}),O?n.jsx("span",{className:"text-xs text-warning",children:"Save changes before applying."}):null]}),C?n.jsxs("div",{className:"space-y-2 rounded-md border border-warning/40 bg-warning/10 p-3 text-xs","data-snapraid-apply-confirm":!0,children:[n.jsxs("p",{className:"flex items-center gap-1.5 font-medium text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Apply writes /etc/snapraid.conf from the saved config. Save first if you have unsaved changes. Continue?"]}),n.jsxs("div",{className:"flex gap-2",children:[n.jsx(_,{"data-snapraid-apply-confirm-yes":!0,onClick:()=>void B(),size:"sm",variant:"danger",children:"Apply"}),n.jsx(_,{onClick:()=>k(!1),size:"sm",variant:"outline",children:"Cancel"})]})]}):null,y!==null?n.jsxs("div",{className:"space-y-1","data-snapraid-preview":!0,children:[n.jsx("p",{className:"font-mono text-xs uppercase text-muted-foreground",children:"snapraid.conf preview"}),n.jsx("pre",{className:"max-h-[24vh] overflow-auto whitespace-pre-wrap break-words rounded-md border border-border/70 bg-muted/20 p-3 text-xs",children:y||"(empty)"})]}):null]}):n.jsxs("p",{className:"flex items-center gap-2 text-sm text-muted-foreground",children:[n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"})," Loading disks..."]})}function ef(e,t){return e instanceof Error&&e.message?e.message:t}function Y_(e){return e&&typeof e=="object"&&!Array.isArray(e)?e:{}}function X_({data:e}){if(!e)return n.jsx("p",{className:"text-sm text-muted-foreground",children:"Recovery status is not available."});const t=Array.isArray(e.failed_drives)?e.failed_drives.map(a=>String(a)):[],r=Array.isArray(e.recovery_options)?e.recovery_options.map(a=>Y_(a)):[],s=e.error!=null?String(e.error):"";return n.jsxs("div",{className:"space-y-4","data-snapraid-recovery-status":!0,children:[s?n.jsxs("p",{className:"flex items-start gap-2 border-l-2 border-danger bg-danger/5 px-3 py-2.5 text-sm text-danger",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),s]}):null,n.jsx("dl",{className:"grid grid-cols-3 overflow-hidden rounded-md border border-border",children:[{label:"Recoverable",value:e.recoverable===!0?"Yes":e.recoverable===!1?"No":"Unknown"},{label:"Missing files",value:String(e.missing_files??0)},{label:"Damaged files",value:String(e.damaged_files??0)}].map(a=>n.jsxs("div",{className:"border-r border-border p-3 last:border-r-0",children:[n.jsx("dt",{className:"font-mono text-[9px] uppercase text-dim",children:a.label}),n.jsx("dd",{className:"mt-1 text-sm font-semibold tabular-nums",children:a.value})]},a.label))}),t.length?n.jsxs("section",{"aria-labelledby":"snapraid-failed-drives",children:[n.jsxs("h3",{className:"flex items-center gap-2 font-mono text-xs font-semibold",id:"snapraid-failed-drives",children:[n.jsx(Vl,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-danger"}),"Failed drives"]}),n.jsx("ul",{className:"mt-2 divide-y divide-border rounded-md border border-border",children:t.map(a=>n.jsx("li",{className:"px-3 py-2 font-mono text-xs",children:a},a))})]}):null,r.length?n.jsxs("section",{"aria-labelledby":"snapraid-recovery-options",children:[n.jsx("h3",{className:"font-mono text-xs font-semibold",id:"snapraid-recovery-options",children:"Recovery options"}),n.jsx("ul",{className:"mt-2 divide-y divide-border rounded-md border border-border",children:r.map((a,i)=>n.jsxs("li",{className:"px-3 py-2 text-xs",children:[n.jsx("p",{className:"font-medium",children:String(a.name??a.id??"Recovery option")}),n.jsx("p",{className:"mt-0.5 font-mono text-[10px] text-muted-foreground",children:String(a.command??"fix")})]},String(a.id??i)))})]}):null]})}function Z_({detail:e,status:t,protectionSets:r,canConfigure:s,onRefresh:a}){const[i,l]=d.useState(t.lifecycle.configured?"overview":s?"configuration":"overview"),[o,c]=d.useState("idle"),[u,h]=d.useState(null),[m,f]=d.useState(""),[w,j]=d.useState("idle"),[y,b]=d.useState(null),[v,p]=d.useState(""),x=e.commands.filter(O=>["sync","scrub"].includes(O.id)).map(O=>O.id==="sync"?{...O,dangerous:!0}:O),g=e.commands.filter(O=>["status","diff","check"].includes(O.id)),N=e.commands.filter(O=>O.id==="fix"),E=[{id:"overview",label:"Overview"},...s?[{id:"configuration",label:"Configuration"}]:[],...s&&x.length?[{id:"operations",label:"Operations"}]:[],{id:"recovery",label:"Recovery"},{id:"diagnostics",label:"Diagnostics"}],C=d.useCallback(async()=>{c("loading"),f("");try{const O=await v2("snapraid");h(O.supported?O.data:null),c("ready")}catch(O){f(ef(O,"Unable to load recovery status")),c("error")}},[]),k=d.useCallback(async()=>{j("loading"),p("");try{b(await zg("snapraid")),j("ready")}catch(O){p(ef(O,"Unable to load the latest SnapRAID log")),j("error")}},[]);return d.useEffect(()=>{i==="recovery"&&o==="idle"&&C(),i==="diagnostics"&&w==="idle"&&k()},[k,C,w,o,i]),n.jsxs("div",{className:"space-y-5","data-capability-renderer":"snapraid",children:[n.jsx("div",{className:"flex gap-1 overflow-x-auto border-b border-border",role:"tablist","aria-label":"SnapRAID provider views",children:E.map(O=>n.jsx("button",{"aria-controls":`snapraid-panel-${O.id}`,"aria-selected":i===O.id,className:q("min-h-11 shrink-0 border-b-2 px-3 font-mono text-xs transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring",i===O.id?"border-primary text-primary":"border-transparent text-muted-foreground hover:text-foreground"),"data-snapraid-tab":O.id,id:`snapraid-tab-${O.id}`,onClick:()=>l(O.id),onKeyDown:Yl,role:"tab",tabIndex:i===O.id?0:-1,type:"button",children:O.label},O.id))}),i==="overview"?n.jsxs("div",{"aria-labelledby":"snapraid-tab-overview",className:"space-y-5",id:"snapraid-panel-overview",role:"tabpanel",children:[n.jsx(gu,{status:t}),r.length?n.jsxs("section",{"aria-labelledby":"snapraid-protection-title",children:[n.jsx("h2",{className:"mb-3 font-mono text-sm font-semibold",id:"snapraid-protection-title",children:"Protection sets"}),n.jsx("div",{className:"grid gap-3 md:grid-cols-2 xl:grid-cols-3",children:r.map(O=>n.jsx(yu,{protectionSet:O},O.id))})]}):n.jsxs("div",{className:"border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm",children:[n.jsx("p",{className:"font-medium text-warning",children:"No protection set configured"}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:s?"Open Configuration to assign data and parity drives.":"An administrator must configure SnapRAID."})]})]}):null,i==="configuration"&&s?n.jsxs("section",{"aria-labelledby":"snapraid-tab-configuration",className:"space-y-4",id:"snapraid-panel-configuration",role:"tabpanel",children:[n.jsxs("div",{children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"Drive assignments and schedule"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Assign mounted disks, set scrub policy and schedules, preview snapraid.conf, then save and apply."})]}),n.jsx(J_,{config:e.config,onSaved:a,pluginId:"snapraid"})]}):null,i==="operations"&&s?n.jsxs("section",{"aria-labelledby":"snapraid-tab-operations",className:"space-y-4",id:"snapraid-panel-operations",role:"tabpanel",children:[n.jsxs("div",{children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"Parity operations"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Sync updates parity. Scrub verifies a bounded percentage of protected data."})]}),n.jsx(ua,{commands:x,heading:"Run operation",onCompleted:a,pluginId:"snapraid",poolNames:[]})]}):null,i==="recovery"?n.jsxs("section",{"aria-labelledby":"snapraid-tab-recovery",className:"space-y-5",id:"snapraid-panel-recovery",role:"tabpanel",children:[n.jsxs("div",{className:"flex items-center justify-between gap-3",children:[n.jsxs("div",{children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"Recovery status"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Review array damage before running a parity fix."})]}),n.jsx(_,{"aria-label":"Reload recovery status",disabled:o==="loading",onClick:()=>void C(),size:"icon",title:"Reload recovery status",variant:"ghost",children:n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",o==="loading"&&"animate-spin")})})]}),o==="loading"?n.jsx("p",{className:"text-sm text-muted-foreground",children:"Loading recovery status…"}):null,o==="error"?n.jsxs("p",{className:"flex items-start gap-2 text-sm text-danger",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),m]}):null,o==="ready"?n.jsx(X_,{data:u}):null,s&&N.length?n.jsx("div",{className:"border-t border-border pt-5",children:n.jsx(ua,{commands:N,heading:"Recovery operation",onCompleted:a,pluginId:"snapraid",poolNames:[]})}):null]}):null,i==="diagnostics"?n.jsxs("section",{"aria-labelledby":"snapraid-tab-diagnostics",className:"space-y-5",id:"snapraid-panel-diagnostics",role:"tabpanel",children:[g.length?n.jsx(ua,{commands:g,heading:"Live diagnostics",onCompleted:a,pluginId:"snapraid",poolNames:[]}):null,n.jsxs("section",{"aria-labelledby":"snapraid-log-title",className:"overflow-hidden rounded-md border border-border",children:[n.jsxs("div",{className:"flex items-center justify-between gap-3 border-b border-border bg-muted/20 px-3 py-2",children:[n.jsxs("h2",{className:"flex items-center gap-2 font-mono text-xs font-semibold",id:"snapraid-log-title",children:[n.jsx(Bl,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Latest operation log"]}),n.jsx(_,{"aria-label":"Reload SnapRAID log",disabled:w==="loading",onClick:()=>void k(),size:"icon",title:"Reload SnapRAID log",variant:"ghost",children:n.jsx(je,{"aria-hidden":"true",className:q("h-3.5 w-3.5",w==="loading"&&"animate-spin")})})]}),w==="error"?n.jsxs("p",{className:"flex items-center gap-2 p-3 text-xs text-danger",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),v]}):null,w==="ready"?n.jsx("pre",{className:"max-h-72 overflow-auto whitespace-pre-wrap break-words p-3 text-xs text-muted-foreground","data-snapraid-log":!0,children:y||"No operation log is available."}):null,w==="loading"?n.jsx("p",{className:"p-3 text-xs text-muted-foreground",children:"Loading operation log…"}):null]})]}):null]})}function sr(e){return e&&typeof e=="object"&&!Array.isArray(e)?e:{}}function ma(e){if(e==null||e==="")return null;const t=Number(e);return Number.isFinite(t)?t:null}function Js(e){return e==null||e===""?null:String(e)}function eC(e,t){return t?["ok","active","healthy","protected","ready"].includes(e)?"healthy":["warning","degraded","sync_required"].includes(e)?"warning":["error","failed"].includes(e)?"error":e==="disabled"?"disabled":"unknown":"unconfigured"}function tC(e){const t=sr(e.status);if(!e.id||t.schema_version!=="1"||t.capability_id!=="storage.protection")return null;const r=sr(e.renderer);return{id:String(e.id),name:String(e.name??e.id),enabled:!!(e.enabled??t.lifecycle.enabled),operational:!!e.operational,status:t,rendererId:String(r.id??"generic"),rendererMode:r.mode==="tailored"?"tailored":"generic",source:e.source==="legacy"?"legacy":"registry"}}function nC(e){const t=e.status.details.protection_sets;return Array.isArray(t)?t.map((r,s)=>{const a=sr(r),i=String(a.health??e.status.health.state),l=["healthy","warning","error","unknown","disabled","unconfigured","incompatible","unavailable"].includes(i)?i:"unknown",o=String(a.name??`protection-${s+1}`);return{id:`${e.id}:${o}`,name:o,providerId:e.id,providerName:e.name,kind:String(a.kind??a.type??"protection"),health:l,protectedTargets:ma(a.protected_targets??a.protected_disks??a.data_drives),unprotectedTargets:ma(a.unprotected_targets??a.unprotected_disks),parityTargets:ma(a.parity_targets??a.parity_drives??a.copies),lastRunAt:Js(a.last_success_at??a.last_run_at??a.last_sync??a.last_check),nextRunAt:Js(a.next_run_at??a.next_scheduled_at),schedule:Js(a.schedule),requiredAction:a.sync_required===!0?"Sync required":Js(a.required_action)}}):[]}function rC(e){return e.filter(r=>r!==null&&!Number.isNaN(Date.parse(r))).sort((r,s)=>Date.parse(s)-Date.parse(r))[0]??null}function sC(e){return e.filter(r=>r!==null&&!Number.isNaN(Date.parse(r))).sort((r,s)=>Date.parse(r)-Date.parse(s))[0]??null}function Xg(e){const t=e.providers.map(m=>tC(m)).filter(m=>m!==null).sort((m,f)=>m.name.localeCompare(f.name)),r=t.filter(m=>m.enabled),s=t.filter(m=>!m.enabled),a=r.filter(m=>!m.status.lifecycle.configured),i=r.filter(m=>m.status.lifecycle.configured),l=i.flatMap(m=>nC(m)).sort((m,f)=>m.name.localeCompare(f.name)),o=l.map(m=>m.protectedTargets),c=l.map(m=>m.unprotectedTargets),u=r.filter(m=>["warning","error","unavailable","incompatible"].includes(m.status.health.state)).length,h=l.filter(m=>m.requiredAction!==null||["warning","error","unavailable"].includes(m.health)).length;return{enabledProviders:r,availableProviders:s,setupProviders:a,configuredProviders:i,protectionSets:l,summary:{totalSets:l.length,protectedTargets:o.length&&o.every(m=>m!==null)?o.reduce((m,f)=>m+(f??0),0):null,unprotectedTargets:c.length&&c.every(m=>m!==null)?c.reduce((m,f)=>m+(f??0),0):null,warnings:Math.max(u,h),latestRunAt:rC(l.map(m=>m.lastRunAt)),nextRunAt:sC(l.map(m=>m.nextRunAt))}}}function aC(e,t,r){const s=e.find(y=>y.id==="snapraid"&&y.installed);if(!s)return{id:"storage.protection",surface:"protection",providers:[]};const a=t.snapraid,i=sr(a?.status),l=sr(i.details),o=Array.isArray(a?.config.drives)?a.config.drives:[],c=ma(l.data_drives)??o.filter(y=>y.role==="data").length,u=ma(l.parity_drives)??o.filter(y=>y.role==="parity").length,h=sr(a?.config.schedule),m=h.sync_enabled===!0?String(h.sync_cron??"Scheduled sync"):h.scrub_enabled===!0?String(h.scrub_cron??"Scheduled scrub"):null,f=s.enabled?eC(String(i.status??s.status),s.configured):"disabled",w=s.configured&&a?[{name:"SnapRAID parity",kind:"parity",health:f,protected_targets:c,unprotected_targets:null,parity_targets:u,last_run_at:Js(l.last_run_at),next_run_at:null,schedule:m,sync_required:l.sync_required===!0,required_action:f==="error"?String(i.message??"Review provider error"):null}]:[],j={schema_version:"1",provider_id:s.id,capability_id:"storage.protection",observed_at:r,lifecycle:{installed:s.installed,enabled:s.enabled,configured:s.configured,compatibility:"compatible",availability:a?"available":"unknown"},health:{state:f,message:String(i.message??s.status_message??"Protection status is available through the compatibility adapter."),issues:[]},summary:[],metrics:[],recent_activity:[],details:{...l,protection_sets:w}};return{id:"storage.protection",surface:"protection",providers:[{id:s.id,name:s.name,enabled:s.enabled,operational:s.enabled&&s.configured&&f==="healthy",renderer:{id:"snapraid",mode:"tailored"},status:j,source:"legacy"}]}}function iC(e,t){if(!e.providers.length)return t;const r=new Map(t.providers.map(s=>[s.id,s]));return{...e,providers:e.providers.map(s=>{const a=r.get(s.id);if(!a)return s;const i=sr(s.status),l=sr(a.status);return Array.isArray(i.details?.protection_sets)?s:{...s,status:{...i,details:l.details}}})}}function lC(e){return e instanceof Error&&e.message?e.message:"Unable to load protection providers"}function Zg(e){return e==="healthy"?"success":e==="warning"||e==="unconfigured"?"warning":["error","unavailable","incompatible"].includes(e)?"danger":"neutral"}function tf(e){if(!e)return"Not reported";const t=new Date(e);return Number.isNaN(t.getTime())?e:t.toLocaleString([],{dateStyle:"medium",timeStyle:"short"})}function oC({view:e}){const{summary:t}=e,r=[{label:"Protection sets",value:String(t.totalSets),detail:`${e.enabledProviders.length} enabled provider${e.enabledProviders.length===1?"":"s"}`},{label:"Protected",value:t.protectedTargets===null?"Not reported":String(t.protectedTargets),detail:"Provider-reported targets"},{label:"Unprotected",value:t.unprotectedTargets===null?"Not reported":String(t.unprotectedTargets),detail:"Provider-reported targets"},{label:"Last run",value:tf(t.latestRunAt),detail:"Latest provider activity"},{label:"Next run",value:tf(t.nextRunAt),detail:t.nextRunAt?"Next scheduled activity":"No next run reported"}];return n.jsx("dl",{"aria-label":"Protection summary",className:"grid grid-cols-2 overflow-hidden rounded-md border border-border bg-card lg:grid-cols-5","data-protection-summary":!0,children:r.map(s=>n.jsxs("div",{className:"min-w-0 border-b border-r border-border p-3 last:col-span-2 last:border-r-0 lg:border-b-0 lg:last:col-span-1",children:[n.jsx("dt",{className:"font-mono text-[10px] uppercase text-dim",children:s.label}),n.jsx("dd",{className:"mt-1 break-words text-sm font-semibold tabular-nums text-foreground",children:s.value}),n.jsx("p",{className:"mt-1 truncate text-[11px] text-muted-foreground",title:s.detail,children:s.detail})]},s.label))})}function Wo({provider:e,actionLabel:t="Set up"}){return n.jsxs("div",{className:"grid gap-3 px-4 py-3 sm:grid-cols-[minmax(0,1fr)_auto] sm:items-center","data-protection-provider-row":e.id,children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx("span",{className:"flex h-9 w-9 shrink-0 items-center justify-center rounded-md border border-border bg-muted/25 text-primary",children:n.jsx(jt,{"aria-hidden":"true",className:"h-4 w-4"})}),n.jsxs("div",{className:"min-w-0",children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx("h3",{className:"font-mono text-sm font-semibold",children:e.name}),n.jsx(fe,{label:e.status.health.state,tone:Zg(e.status.health.state)})]}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:e.status.health.message})]})]}),n.jsxs(Ee,{className:q(Ye({size:"sm",variant:"outline"}),"gap-2"),to:Lx(e.id),children:[n.jsx(_s,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),t]})]})}function cC({provider:e,canAdmin:t,detail:r,onRefresh:s}){const a=Xg({providers:[{...e,renderer:{id:e.rendererId,mode:e.rendererMode}}]}).protectionSets,i=eu(e.id),l=e.id==="snapraid"&&r!==null;return n.jsxs("div",{className:"space-y-5","data-protection-provider-details":e.id,children:[n.jsxs(Ee,{className:q(Ye({size:"sm",variant:"ghost"}),"gap-2 px-0 hover:bg-transparent"),to:ve.protection,children:[n.jsx(vs,{"aria-hidden":"true",className:"h-4 w-4"}),"Back to protection"]}),n.jsx(pt,{actions:t&&!l?n.jsxs(Ee,{className:q(Ye({variant:"secondary"}),"gap-2"),to:i,children:[n.jsx(_s,{"aria-hidden":"true",className:"h-4 w-4"}),"Configure provider"]}):void 0,description:r?.description||"Storage protection provider",status:n.jsx(fe,{label:e.status.health.state,tone:Zg(e.status.health.state)}),title:e.name}),l?n.jsx(Z_,{canConfigure:t,detail:r,onRefresh:s,protectionSets:a,status:e.status}):n.jsxs(n.Fragment,{children:[n.jsx(Qg,{status:e.status}),a.length?n.jsxs("section",{"aria-labelledby":"provider-protection-title",children:[n.jsx("h2",{className:"mb-3 font-mono text-sm font-semibold",id:"provider-protection-title",children:"Protection sets"}),n.jsx("div",{className:"grid gap-3 md:grid-cols-2 xl:grid-cols-3",children:a.map(o=>n.jsx(yu,{protectionSet:o},o.id))})]}):null,e.status.lifecycle.configured?null:n.jsxs("div",{className:"border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm",children:[n.jsx("p",{className:"font-medium text-warning",children:"Provider setup is required"}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:"Configure this provider before it can report protected targets."})]})]})]})}function nf(){const{providerId:e}=Zd(),{permissions:t}=Ln(),r=t.includes("extensions.admin"),[s,a]=d.useState("loading"),[i,l]=d.useState({id:"storage.protection",surface:"protection",providers:[]}),[o,c]=d.useState({}),[u,h]=d.useState(""),[m,f]=d.useState(""),[w,j]=d.useState("Never"),y=d.useCallback(async(x=!1)=>{x||a("loading");const[g,N]=await Promise.allSettled([Eg("storage.protection"),Ql()]),E=N.status==="fulfilled"?N.value:[],C=[];let k="";const O=E.find(H=>H.id==="snapraid"&&H.installed);if(O)try{C.push(["snapraid",await Tg("snapraid")])}catch{C.push(["snapraid",null]),k="SnapRAID details could not be refreshed."}const S=aC(E,Object.fromEntries(C),new Date().toISOString());if(g.status==="rejected"&&N.status==="rejected"){if(x){f("Refresh failed; showing the last successful protection state.");return}h(lC(g.reason)),a("error");return}const $=g.status==="fulfilled"?iC(g.value,S):S;l($);const R=Object.fromEntries(C);c(H=>!x||N.status==="fulfilled"&&!O||R.snapraid!==null&&R.snapraid!==void 0?R:H),f(g.status==="rejected"&&S.providers.length?"Capability registry unavailable; showing compatibility data from the existing SnapRAID provider.":k?`${k}${x?" Showing the last successful provider state.":""}`:""),h(""),j(Bt(new Date)),a("ready")},[]);d.useEffect(()=>{y(!1)},[y]);const b=d.useMemo(()=>Xg(i),[i]),v=e?[...b.enabledProviders,...b.availableProviders].find(x=>x.id===e):null;if(e&&s==="ready"&&v)return n.jsx(cC,{canAdmin:r,detail:o[v.id]??null,onRefresh:()=>y(!0),provider:v});if(e&&s==="ready"&&!v)return n.jsxs("section",{className:"space-y-5",children:[n.jsxs(Ee,{className:q(Ye({size:"sm",variant:"ghost"}),"gap-2 px-0"),to:ve.protection,children:[n.jsx(vs,{"aria-hidden":"true",className:"h-4 w-4"}),"Back to protection"]}),n.jsxs("div",{className:"flex min-h-64 flex-col items-center justify-center rounded-md border border-dashed border-border px-5 text-center",children:[n.jsx(za,{"aria-hidden":"true",className:"h-7 w-7 text-warning"}),n.jsx("h1",{className:"mt-3 font-mono text-base font-semibold",children:"Protection provider not found"}),n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:"The provider may be disabled, removed, or incompatible."})]})]});const p=b.configuredProviders.filter(x=>!b.protectionSets.some(g=>g.providerId===x.id));return n.jsxs("section",{className:"space-y-5 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(n.Fragment,{children:[r?n.jsxs(Ee,{className:q(Ye({variant:"secondary"}),"gap-2"),to:ve.extensions,children:[n.jsx(ot,{"aria-hidden":"true",className:"h-4 w-4"}),"Add provider"]}):null,n.jsxs(_,{className:"gap-2",disabled:s==="loading",onClick:()=>void y(!1),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",s==="loading"&&"animate-spin")}),"refresh"]})]}),description:`${b.summary.totalSets} protection sets · synced ${w}`,status:s==="ready"?n.jsx(fe,{label:b.summary.warnings?`${b.summary.warnings} warning${b.summary.warnings===1?"":"s"}`:"protection ready",tone:b.summary.warnings?"warning":"success"}):void 0,title:"storage_protection"}),s==="loading"?n.jsxs("div",{"aria-live":"polite",className:"flex min-h-56 items-center justify-center gap-2 rounded-md border border-border text-sm text-muted-foreground",role:"status",children:[n.jsx(je,{"aria-hidden":"true",className:"h-4 w-4 animate-spin text-primary"}),"Loading protection providers..."]}):null,s==="error"?n.jsxs("div",{"aria-live":"assertive",className:"border-l-2 border-danger bg-danger/5 px-4 py-4 text-sm text-danger",role:"alert",children:[n.jsxs("div",{className:"flex items-center gap-2 font-medium",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Protection is unavailable"]}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:u}),n.jsx(_,{className:"mt-3",onClick:()=>void y(!1),size:"sm",variant:"outline",children:"Retry"})]}):null,s==="ready"?n.jsx(oC,{view:b}):null,m?n.jsx("div",{className:"border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm text-muted-foreground","data-protection-compatibility-warning":!0,children:m}):null,s==="ready"&&!b.enabledProviders.length?n.jsxs("div",{className:"flex min-h-56 flex-col items-center justify-center rounded-md border border-dashed border-border px-5 text-center","data-protection-empty":!0,children:[n.jsx(jt,{"aria-hidden":"true",className:"h-7 w-7 text-dim"}),n.jsx("h2",{className:"mt-3 font-mono text-sm font-semibold",children:"No protection provider is enabled"}),n.jsx("p",{className:"mt-1 max-w-lg text-sm text-muted-foreground",children:"Enable a protection provider to manage parity, replication, snapshots, or backups."}),r?n.jsxs(Ee,{className:q(Ye({size:"sm"}),"mt-4 gap-2"),to:ve.extensions,children:[n.jsx(ot,{"aria-hidden":"true",className:"h-4 w-4"}),"Add provider"]}):null]}):null,s==="ready"&&b.protectionSets.length?n.jsxs("section",{"aria-labelledby":"protection-sets-title",children:[n.jsxs("div",{className:"mb-3 flex items-center justify-between gap-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"protection-sets-title",children:"Protection sets"}),n.jsxs("span",{className:"text-xs text-dim",children:[b.summary.protectedTargets??"—"," protected"]})]}),n.jsx("div",{className:"grid gap-3 md:grid-cols-2 xl:grid-cols-3",children:b.protectionSets.map(x=>n.jsx(yu,{protectionSet:x},x.id))})]}):null,s==="ready"&&b.setupProviders.length?n.jsxs("section",{"aria-labelledby":"protection-setup-title",className:"overflow-hidden rounded-md border border-border bg-card",children:[n.jsxs("div",{className:"border-b border-border px-4 py-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"protection-setup-title",children:"Setup required"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Enabled providers appear here until their first protection set is configured."})]}),n.jsx("div",{className:"divide-y divide-border",children:b.setupProviders.map(x=>n.jsx(Wo,{provider:x},x.id))})]}):null,s==="ready"&&p.length?n.jsxs("section",{"aria-labelledby":"protection-provider-status-title",className:"overflow-hidden rounded-md border border-border bg-card",children:[n.jsxs("div",{className:"border-b border-border px-4 py-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"protection-provider-status-title",children:"Provider status"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Configured providers that do not currently report protection sets."})]}),n.jsx("div",{className:"divide-y divide-border",children:p.map(x=>n.jsx(Wo,{actionLabel:"View",provider:x},x.id))})]}):null,s==="ready"&&b.availableProviders.length?n.jsxs("section",{"aria-labelledby":"available-protection-providers-title",className:"overflow-hidden rounded-md border border-border bg-card",children:[n.jsxs("div",{className:"border-b border-border px-4 py-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"available-protection-providers-title",children:"Available providers"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Installed protection providers that are currently disabled."})]}),n.jsx("div",{className:"divide-y divide-border",children:b.availableProviders.map(x=>n.jsx(Wo,{actionLabel:"Review",provider:x},x.id))})]}):null]})}async function dC(e){const t=await W("/api/pihealth/update/config",{method:"GET",signal:e});return{repo_path:String(t.repo_path??""),service_name:String(t.service_name??"")}}async function uC(e,t){const r=await W("/api/pihealth/update/config",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e),signal:t});if(r.error)throw new Error(r.error)}async function mC(e,t){const{stream_url:r}=await $n("/api/pihealth/update",{},t);await In(r,e,t)}async function pC({timeoutMs:e=12e4,intervalMs:t=2e3}={},r){const s=Date.now()+e;for(;Date.now()<s;){try{if((await fetch("/api/health",{method:"GET",credentials:"same-origin",cache:"no-store",signal:r})).status>0)return!0}catch{}await new Promise(a=>setTimeout(a,t))}return!1}async function fC(e){try{return!!(await W("/api/auth/check",{method:"GET",signal:e})).authenticated}catch{return!1}}async function hC(e){const t=await W("/api/backups/config",{method:"GET",signal:e});return{enabled:!!t.enabled,schedule_preset:String(t.schedule_preset??"daily"),retention_count:t.retention_count===void 0?null:Number(t.retention_count),dest_dir:String(t.dest_dir??"")}}async function xC(e,t){const r=await W("/api/backups/config",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e),signal:t});if(r.error)throw new Error(r.error)}async function gC(e){const t=await W("/api/backups/status",{method:"GET",signal:e});return{enabled:!!t.enabled,next_run:ce(t.next_run),backup_running:!!t.backup_running,last_run:ce(t.last_run),last_run_result:ce(t.last_run_result)}}async function vC(e){const t=await W("/api/backups/run",{method:"POST",signal:e});if(t.error)throw new Error(t.error)}async function yC(e){const t=await W("/api/backups/list",{method:"GET",signal:e});return Array.isArray(t.backups)?t.backups.map(r=>String(r)).filter(Boolean):[]}async function bC(e,t){const r=await W("/api/backups/restore",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({archive_name:e}),signal:t});if(r.error)throw new Error(r.error)}async function jC(e){const t=await W("/api/auto-update/config",{method:"GET",signal:e});return{enabled:!!t.enabled,schedule_preset:String(t.schedule_preset??"daily_4am"),notify_on_update:!!t.notify_on_update}}async function wC(e,t){const r=await W("/api/auto-update/config",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e),signal:t});if(r.error)throw new Error(r.error)}async function NC(e){const t=await W("/api/auto-update/run-now",{method:"POST",signal:e});if(t.error)throw new Error(t.error)}function Go(e){return e instanceof Error&&e.message?e.message:"Unable to complete the request"}function Fs({label:e,value:t,onChange:r,mono:s=!0,testId:a}){return n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:e}),n.jsx("input",{className:q("w-full rounded-md border border-border bg-background px-3 py-2 text-xs focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring sm:text-sm",s?"font-mono":""),"data-setting":a,onChange:i=>r(i.target.value),spellCheck:!1,value:t})]})}function Ko({label:e,checked:t,onChange:r,testId:s}){return n.jsxs("label",{className:"flex items-center gap-2 text-sm",children:[n.jsx("input",{checked:t,className:"h-4 w-4 accent-primary","data-setting":s,onChange:a=>r(a.target.checked),type:"checkbox"}),e]})}function kC({phase:e,log:t,commit:r}){const s=(()=>{switch(e){case"running":return{icon:n.jsx(me,{"aria-hidden":!0,className:"h-4 w-4 animate-spin"}),text:"Updating…",tone:"info"};case"restarting":return{icon:n.jsx(me,{"aria-hidden":!0,className:"h-4 w-4 animate-spin"}),text:"Restarting — reconnecting…",tone:"info"};case"recovered":return{icon:n.jsx(lt,{"aria-hidden":!0,className:"h-4 w-4"}),text:r?`Update complete — now at ${r}.`:"Update complete.",tone:"success"};case"loggedout":return{icon:n.jsx(lt,{"aria-hidden":!0,className:"h-4 w-4"}),text:r?`Update complete (now at ${r}) — please log in again.`:"Update complete — please log in again.",tone:"success"};case"failed":return{icon:n.jsx(ie,{"aria-hidden":!0,className:"h-4 w-4"}),text:"Update failed.",tone:"error"};default:return null}})();return s?n.jsxs("div",{className:"mt-3 space-y-2 rounded-md border border-border bg-muted/30 p-3","data-testid":"pihealth-update-progress",children:[n.jsxs("div",{className:q("flex items-center gap-2 text-sm font-medium",s.tone==="success"?"text-success":s.tone==="error"?"text-danger":"text-info"),children:[s.icon,n.jsx("span",{children:s.text})]}),t.length>0?n.jsx("ul",{className:"max-h-48 space-y-1 overflow-y-auto font-mono text-xs",children:t.map((a,i)=>n.jsxs("li",{className:q("flex gap-2",a.tone==="error"?"text-danger":"text-muted-foreground"),children:[a.step?n.jsx("span",{className:"shrink-0 uppercase tracking-wide opacity-70",children:a.step}):null,n.jsx("span",{className:"break-all",children:a.text})]},i))}):null,e==="loggedout"?n.jsx(_,{onClick:()=>window.location.assign("/login.html"),variant:"outline",children:"Go to login"}):null]}):null}function SC(){const[e,t]=d.useState({repo_path:"",service_name:""}),[r,s]=d.useState({enabled:!1,schedule_preset:"daily",retention_count:null,dest_dir:""}),[a,i]=d.useState(null),[l,o]=d.useState([]),[c,u]=d.useState({enabled:!1,schedule_preset:"daily_4am",notify_on_update:!1}),[h,m]=d.useState(!0),[f,w]=d.useState(!1),[j,y]=d.useState(null),[b,v]=d.useState("Never"),[p,x]=d.useState(null),[g,N]=d.useState(null),[E,C]=d.useState(null),[k,O]=d.useState("idle"),[S,$]=d.useState([]),[R,H]=d.useState(null),I=d.useRef(!0),U=d.useCallback(async M=>{M==="initial"?m(!0):w(!0);try{const[A,F,D,G,se]=await Promise.all([dC(),hC(),gC().catch(()=>null),yC().catch(()=>[]),jC()]);if(!I.current)return;t(A),s(F),i(D),o(G),u(se),y(null),v(Bt(new Date))}catch(A){I.current&&y(Go(A))}finally{I.current&&(M==="initial"?m(!1):w(!1))}},[]),L=d.useCallback(async(M,A,F,D=!1)=>{if(!g){N(M),C(null);try{await A(),I.current&&(x({tone:"success",message:F}),D&&await U("manual"))}catch(G){I.current&&x({tone:"error",message:Go(G)})}finally{I.current&&N(null)}}},[U,g]),B=d.useCallback(async()=>{if(k==="running"||k==="restarting")return;C(null),O("running"),$([]),H(null);let M=!1,A=!1;const F=se=>{if(I.current){if(se.new_commit&&H(se.new_commit.slice(0,8)),se.error){A=!0,$(de=>[...de,{step:se.step,text:se.error??"Update failed",tone:"error"}]);return}se.line&&$(de=>[...de,{step:se.step,text:se.line??"",tone:"info"}]),se.restarting&&(M=!0,O("restarting"))}};try{await mC(F)}catch(se){if(!I.current)return;A=!0,$(de=>[...de,{text:Go(se),tone:"error"}])}if(!I.current)return;if(A){O("failed");return}if(!M){O("recovered");return}const D=await pC();if(!I.current)return;if(!D){$(se=>[...se,{text:"Timed out waiting for the service to come back online.",tone:"error"}]),O("failed");return}const G=await fC();I.current&&O(G?"recovered":"loggedout")},[k]);d.useEffect(()=>(I.current=!0,U("initial"),()=>{I.current=!1}),[U]);const P=!!g;return n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",disabled:f,onClick:()=>void U("manual"),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",f?"animate-spin":"")}),f?"refreshing":"refresh"]}),description:`system configuration · synced ${b}`,status:n.jsx(fe,{label:"config ready",tone:"success"}),title:"system_settings"}),n.jsx(Cg,{}),p?n.jsx(Q,{"aria-live":p.tone==="error"?"assertive":"polite",className:p.tone==="error"?"border-danger/30 text-danger":"border-success/30 text-success",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm",children:[p.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),p.message]})}):null,j?n.jsx(Q,{"aria-live":"polite",className:"border-warning/30",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),j]})}):null,h?n.jsx(Q,{"aria-live":"polite",role:"status",children:n.jsxs(K,{className:"flex min-h-[14rem] items-center justify-center gap-2 p-6 text-sm text-muted-foreground",children:[n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4 animate-pulse text-primary"}),"Loading settings..."]})}):n.jsxs("div",{className:"grid gap-3 xl:grid-cols-3 xl:items-start",children:[n.jsxs(Q,{className:"transition-colors duration-200 hover:border-primary/25",id:"v2-settings-pihealth",children:[n.jsxs(xe,{children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"Pi-Health self-update"}),n.jsx(we,{children:"Pull the latest code, install dependencies, apply migrations, refresh the UI, and restart — with live progress."})]}),n.jsxs(K,{className:"space-y-3",children:[n.jsx(Fs,{label:"Repo path",onChange:M=>t(A=>({...A,repo_path:M})),testId:"pihealth-repo",value:e.repo_path}),n.jsx(Fs,{label:"Service name",onChange:M=>t(A=>({...A,service_name:M})),testId:"pihealth-service",value:e.service_name}),(()=>{const M=k==="running"||k==="restarting";return n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(_,{disabled:P||M,id:"v2-settings-pihealth-save",onClick:()=>void L("save-pihealth",()=>uC(e),"Pi-Health update config saved"),children:g==="save-pihealth"?"Saving...":"Save"}),E==="update-pihealth"?n.jsxs("span",{className:"flex items-center gap-1.5",children:[n.jsx(_,{className:"border-info/30 bg-info/10 text-info hover:bg-info/15",id:"v2-settings-pihealth-update-confirm",onClick:()=>void B(),variant:"outline",children:"Confirm update"}),n.jsx(_,{onClick:()=>C(null),variant:"outline",children:"Cancel"})]}):n.jsx(_,{disabled:P||M,id:"v2-settings-pihealth-update",onClick:()=>C("update-pihealth"),variant:"outline",children:M?"Updating…":"Update now"})]})})(),n.jsx(kC,{commit:R,log:S,phase:k})]})]}),n.jsxs(Q,{className:"transition-colors duration-200 hover:border-primary/25",id:"v2-settings-backups",children:[n.jsxs(xe,{children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"Backups"}),n.jsx(we,{children:a?`Next run: ${a.next_run||"—"} · Last: ${a.last_run||"never"}`:"Scheduled configuration backups."})]}),n.jsxs(K,{className:"space-y-3",children:[n.jsx(Ko,{checked:r.enabled,label:"Enabled",onChange:M=>s(A=>({...A,enabled:M})),testId:"backup-enabled"}),n.jsx(Fs,{label:"Schedule preset",mono:!1,onChange:M=>s(A=>({...A,schedule_preset:M})),testId:"backup-schedule",value:r.schedule_preset}),n.jsx(Fs,{label:"Destination dir",onChange:M=>s(A=>({...A,dest_dir:M})),testId:"backup-dest",value:r.dest_dir}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(_,{disabled:P,id:"v2-settings-backup-save",onClick:()=>void L("save-backup",()=>xC({enabled:r.enabled,schedule_preset:r.schedule_preset,dest_dir:r.dest_dir}),"Backup config saved"),children:g==="save-backup"?"Saving...":"Save"}),n.jsx(_,{disabled:P,id:"v2-settings-backup-run",onClick:()=>void L("run-backup",()=>vC(),"Backup started",!0),variant:"outline",children:"Run backup now"})]}),l.length?n.jsxs("div",{className:"space-y-2",children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Backups"}),l.map(M=>{const A=`restore:${M}`;return n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2 rounded-md border border-border bg-muted/20 p-2 text-xs",children:[n.jsx("span",{className:"break-all font-mono",children:M}),E===A?n.jsxs("span",{className:"flex items-center gap-1.5",children:[n.jsx(_,{className:"border-warning/30 bg-warning/10 text-warning hover:bg-warning/15 text-xs sm:text-sm","data-confirm-restore":M,onClick:()=>void L(A,()=>bC(M),`Restored ${M}`,!0),size:"sm",variant:"outline",children:"Confirm restore"}),n.jsx(_,{onClick:()=>C(null),size:"sm",variant:"outline",children:"Cancel"})]}):n.jsx(_,{className:"text-xs sm:text-sm","data-restore":M,disabled:P,onClick:()=>C(A),size:"sm",variant:"outline",children:"Restore"})]},M)})]}):null]})]}),n.jsxs(Q,{className:"transition-colors duration-200 hover:border-primary/25",id:"v2-settings-auto-update",children:[n.jsxs(xe,{children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"Container auto-update"}),n.jsx(we,{children:"Scheduled container image updates."})]}),n.jsxs(K,{className:"space-y-3",children:[n.jsx(Ko,{checked:c.enabled,label:"Enabled",onChange:M=>u(A=>({...A,enabled:M})),testId:"autoupdate-enabled"}),n.jsx(Ko,{checked:c.notify_on_update,label:"Notify on update",onChange:M=>u(A=>({...A,notify_on_update:M})),testId:"autoupdate-notify"}),n.jsx(Fs,{label:"Schedule preset",mono:!1,onChange:M=>u(A=>({...A,schedule_preset:M})),testId:"autoupdate-schedule",value:c.schedule_preset}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(_,{disabled:P,id:"v2-settings-auto-update-save",onClick:()=>void L("save-autoupdate",()=>wC(c),"Auto-update config saved"),children:g==="save-autoupdate"?"Saving...":"Save"}),n.jsx(_,{disabled:P,id:"v2-settings-auto-update-run",onClick:()=>void L("run-autoupdate",()=>NC(),"Auto-update run started"),variant:"outline",children:"Run now"})]})]})]}),n.jsxs(Q,{className:"transition-colors duration-200 hover:border-primary/25 xl:col-span-3",id:"v2-settings-advanced",children:[n.jsxs(xe,{children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"Advanced"}),n.jsx(we,{children:"Inspect installed capability extensions and provider diagnostics."})]}),n.jsxs(K,{className:"flex flex-col gap-4 sm:flex-row sm:items-center sm:justify-between",children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx("span",{className:"flex h-10 w-10 shrink-0 items-center justify-center rounded-md border border-border bg-muted/30 text-primary",children:n.jsx(au,{"aria-hidden":"true",className:"h-5 w-5"})}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"font-mono text-sm font-semibold",children:"Extensions"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Versions, compatibility, capabilities, sources, and registry health."})]})]}),n.jsxs(Ee,{className:q(Ye({variant:"outline"}),"shrink-0 gap-2"),to:ve.extensions,children:["Open extensions",n.jsx(Dx,{"aria-hidden":"true",className:"h-4 w-4"})]})]})]})]})]})}function _C(e){return{name:String(e?.name??""),path:ce(e?.path),enabled:e?.enabled===void 0?!0:!!e?.enabled}}async function CC(e,t,r){const s=await W(`/api/storage/shares/${encodeURIComponent(e)}`,{method:"GET",signal:r});if(s.error)throw new Error(s.error);if(!Array.isArray(s.shares))throw new Error("Share list response is invalid");return{pluginId:e,pluginName:t,serviceRunning:!!s.service_running,status:ce(s.status),message:ce(s.message),shares:s.shares.map(a=>_C(a))}}async function ev(e,t,r){const s=await W(e,{method:t,signal:r});if(s.error)throw new Error(s.error)}function EC(e,t,r){return ev(`/api/storage/shares/${encodeURIComponent(e)}/${encodeURIComponent(t)}/toggle`,"POST",r)}function AC(e,t,r){return ev(`/api/storage/shares/${encodeURIComponent(e)}/${encodeURIComponent(t)}`,"DELETE",r)}async function tv(e,t,r,s){const a=await W(e,{method:t,headers:{"Content-Type":"application/json"},body:JSON.stringify(r),signal:s});if(a.error)throw new Error(a.error)}function PC(e,t,r){return tv(`/api/storage/shares/${encodeURIComponent(e)}`,"POST",t,r)}function RC(e,t,r,s){return tv(`/api/storage/shares/${encodeURIComponent(e)}/${encodeURIComponent(t)}`,"PUT",r,s)}const ji={open:!1,mode:"add",pluginId:"",pluginName:"",shareName:null,text:"",status:"idle",error:null};function wi(e){return e instanceof Error&&e.message?e.message:"Unable to complete the request"}function MC(){const[e,t]=d.useState([]),[r,s]=d.useState(!0),[a,i]=d.useState(!1),[l,o]=d.useState(null),[c,u]=d.useState([]),[h,m]=d.useState("Never"),[f,w]=d.useState(null),[j,y]=d.useState(null),[b,v]=d.useState(null),[p,x]=d.useState(ji),g=d.useRef(!0),N=d.useCallback(async S=>{S==="initial"?s(!0):i(!0);try{const R=(await Ql()).filter(L=>L.category.toLowerCase().includes("share")),H=await Mg(R,4,L=>CC(L.id,L.name)),I=[],U=[];if(H.forEach((L,B)=>{L.status==="fulfilled"?I.push(L.value):U.push(`${R[B].name} shares unavailable: ${wi(L.reason)}`)}),!g.current)return;t(I),u(U),o(null),m(Bt(new Date))}catch($){g.current&&(u([]),o(wi($)))}finally{g.current&&(S==="initial"?s(!1):i(!1))}},[]),E=d.useCallback(async(S,$,R)=>{if(!j){y(S),v(null);try{await $(),g.current&&(w({tone:"success",message:R}),await N("manual"))}catch(H){g.current&&w({tone:"error",message:wi(H)})}finally{g.current&&y(null)}}},[N,j]),C=d.useCallback(S=>{x({open:!0,mode:"add",pluginId:S.pluginId,pluginName:S.pluginName,shareName:null,text:JSON.stringify({name:"",path:""},null,2),status:"idle",error:null})},[]),k=d.useCallback((S,$)=>{x({open:!0,mode:"edit",pluginId:S.pluginId,pluginName:S.pluginName,shareName:$.name,text:JSON.stringify({name:$.name,path:$.path??"",enabled:$.enabled},null,2),status:"idle",error:null})},[]),O=d.useCallback(async()=>{let S;try{S=JSON.parse(p.text)}catch{x($=>({...$,status:"error",error:"Share is not valid JSON"}));return}x($=>({...$,status:"saving",error:null}));try{if(p.mode==="add"?await PC(p.pluginId,S):p.shareName&&await RC(p.pluginId,p.shareName,S),!g.current)return;x(ji),w({tone:"success",message:p.mode==="add"?"Share created":"Share updated"}),await N("manual")}catch($){g.current&&x(R=>({...R,status:"error",error:wi($)}))}},[p,N]);return d.useEffect(()=>(g.current=!0,N("initial"),()=>{g.current=!1}),[N]),n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",disabled:a,onClick:()=>void N("manual"),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",a?"animate-spin":"")}),a?"refreshing":"refresh"]}),description:`${e.reduce((S,$)=>S+$.shares.length,0)} shares · synced ${h}`,status:c.length?n.jsx(fe,{label:"partial data",tone:"warning"}):n.jsx(fe,{label:`${e.reduce((S,$)=>S+$.shares.filter(R=>R.enabled).length,0)} enabled`,tone:"success"}),title:"network_shares"}),f?n.jsx(Q,{"aria-live":f.tone==="error"?"assertive":"polite",className:f.tone==="error"?"border-danger/30 text-danger":"border-success/30 text-success",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm",children:[f.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),f.message]})}):null,c.length?n.jsx(Q,{"aria-live":"polite",className:"border-warning/30",role:"status",children:n.jsxs(K,{className:"flex items-start gap-2 p-4 text-sm text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),n.jsx("div",{className:"space-y-1",children:c.map(S=>n.jsx("p",{children:S},S))})]})}):null,l?n.jsx(Q,{"aria-live":"polite",className:"border-warning/30",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),l]})}):null,r?n.jsx(Q,{"aria-live":"polite",role:"status",children:n.jsxs(K,{className:"flex min-h-[14rem] items-center justify-center gap-2 p-6 text-sm text-muted-foreground",children:[n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4 animate-pulse text-primary"}),"Loading shares..."]})}):null,!r&&!e.length&&!c.length?n.jsx(Q,{children:n.jsx(K,{className:"flex min-h-[10rem] items-center justify-center p-6 text-sm text-muted-foreground",children:"No share plugins configured."})}):null,r?null:e.map(S=>n.jsxs(Q,{className:"transition-colors duration-200 hover:border-primary/25",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsx(ge,{className:"text-base sm:text-lg",children:S.pluginName}),n.jsx(we,{children:S.message||"Shares"})]}),n.jsxs("div",{className:"flex shrink-0 items-center gap-2",children:[n.jsx(fe,{label:S.serviceRunning?"running":"stopped",tone:S.serviceRunning?"success":"neutral"}),n.jsxs(_,{className:"gap-1.5 text-xs sm:text-sm","data-add-share":S.pluginId,onClick:()=>C(S),size:"sm",variant:"outline",children:[n.jsx(ot,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Add share"]})]})]}),n.jsx(K,{className:"space-y-2",children:S.shares.length?S.shares.map($=>{const R=`toggle:${S.pluginId}:${$.name}`,H=`delete:${S.pluginId}:${$.name}`;return n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2 rounded-md border border-border bg-muted/20 p-3 text-xs",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"break-all font-mono text-sm",children:$.name}),n.jsx("p",{className:"break-all text-muted-foreground",children:$.path||"—"})]}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(fe,{label:$.enabled?"enabled":"disabled",tone:$.enabled?"success":"neutral"}),n.jsxs(_,{className:"text-xs sm:text-sm","data-share":$.name,"data-share-action":"toggle",disabled:!!j,onClick:()=>void E(R,()=>EC(S.pluginId,$.name),`Toggled ${$.name}`),size:"sm",variant:"outline",children:[j===R?n.jsx(me,{"aria-hidden":"true",className:"h-3.5 w-3.5 animate-spin"}):null,$.enabled?"Disable":"Enable"]}),n.jsx(_,{className:"text-xs sm:text-sm","data-edit-share":$.name,disabled:!!j,onClick:()=>k(S,$),size:"sm",variant:"outline",children:"Edit"}),b===H?n.jsxs("span",{className:"flex items-center gap-1.5",children:[n.jsx(_,{className:"border-danger/30 bg-danger/10 text-danger hover:bg-danger/15 text-xs sm:text-sm","data-confirm-delete-share":$.name,onClick:()=>void E(H,()=>AC(S.pluginId,$.name),`Deleted ${$.name}`),size:"sm",variant:"outline",children:"Confirm delete"}),n.jsx(_,{onClick:()=>v(null),size:"sm",variant:"outline",children:"Cancel"})]}):n.jsx(_,{className:"text-xs sm:text-sm","data-delete-share":$.name,disabled:!!j,onClick:()=>v(H),size:"sm",variant:"outline",children:"Delete"})]})]},$.name)}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No shares configured."})})]},S.pluginId)),p.open?n.jsx(ze,{onClose:()=>x(ji),children:n.jsxs(Q,{"aria-labelledby":"v2-share-config-title","aria-modal":"true",className:"flex max-h-[90vh] w-full max-w-2xl flex-col overflow-hidden",id:"v2-share-config-modal",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsxs(ge,{className:"text-base sm:text-lg",id:"v2-share-config-title",children:[p.mode==="add"?"Add":"Edit"," ",p.pluginName," share"]}),n.jsx(we,{children:"Share definition as JSON (name + path required)."})]}),n.jsx(_,{id:"v2-share-config-close",onClick:()=>x(ji),variant:"outline",children:"Close"})]}),n.jsxs(K,{className:"space-y-3 overflow-auto p-4",children:[n.jsx("textarea",{"aria-label":"Share definition JSON",className:"h-[40vh] w-full resize-y rounded-md border border-border bg-muted/25 p-3 font-mono text-xs focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring sm:text-sm","data-share-config-textarea":!0,onChange:S=>x($=>({...$,text:S.target.value,status:"idle",error:null})),spellCheck:!1,value:p.text}),p.error?n.jsx("p",{className:"text-sm text-danger",id:"v2-share-config-error",children:p.error}):null,n.jsx(_,{disabled:p.status==="saving",id:"v2-share-config-save",onClick:()=>void O(),children:p.status==="saving"?"Saving...":"Save share"})]})]})}):null]})}const td={up:{label:"Start",pendingLabel:"Starting...",className:"border-success/30 bg-success/10 text-success hover:bg-success/15",Icon:Hl},down:{label:"Stop",pendingLabel:"Stopping...",className:"border-danger/30 bg-danger/10 text-danger hover:bg-danger/15",Icon:qx},restart:{label:"Restart",pendingLabel:"Restarting...",className:"border-warning/30 bg-warning/10 text-warning hover:bg-warning/15",Icon:lu},pull:{label:"Pull",pendingLabel:"Pulling...",className:"border-info/30 bg-info/10 text-info hover:bg-info/15",Icon:Oa}};function TC(e){return e==="running"?"success":e==="stopped"||e==="exited"?"danger":e==="partial"?"warning":"neutral"}function $C(e){return e.status==="running"?["down","restart"]:["up"]}function IC({stack:e,pendingAction:t,containers:r,onAction:s,onLogs:a,onEdit:i,onBackups:l,onDelete:o,onOpenContainer:c}){const u=c1(e),h=u===null?0:Math.max(0,Math.min(u,100)),m=!!t;return n.jsx(Q,{className:"transition-colors duration-200 hover:border-primary/25",children:n.jsxs(K,{className:"space-y-3 p-4",children:[n.jsxs("div",{className:"flex items-start justify-between gap-3",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"truncate text-sm font-semibold",children:e.name}),e.compose_file?n.jsx("p",{className:"truncate text-xs text-muted-foreground",children:e.compose_file}):null]}),n.jsx(fe,{className:"shrink-0",label:e.status,tone:TC(e.status)})]}),n.jsxs("div",{className:"space-y-1",children:[n.jsxs("p",{className:"text-xs text-muted-foreground",children:[e.running_count??"—"," / ",e.container_count??"—"," ","services up"]}),n.jsx(Yt,{label:`${e.name} services ${h}%`,tone:"success",value:h})]}),r&&r.length?n.jsx("ul",{className:"space-y-1 rounded-md border border-border/70 bg-muted/20 p-2","data-stack-containers":!0,children:r.map(f=>n.jsxs("li",{className:"flex items-center gap-2 text-xs",children:[n.jsx("span",{"aria-hidden":"true",className:q("h-2 w-2 shrink-0 rounded-full",f.status==="running"?"bg-success":"bg-muted-foreground/50")}),n.jsx("button",{className:"truncate text-left text-primary hover:underline","data-stack-container":f.name,onClick:()=>c?.(f),type:"button",children:f.name}),n.jsx("span",{className:"ml-auto shrink-0 text-muted-foreground",children:f.status})]},f.id))}):null,n.jsxs("div",{className:"flex items-center gap-1.5",children:[$C(e).map(f=>{const w=td[f],j=w.Icon;return n.jsx(_,{"aria-label":`${w.label} ${e.name}`,className:q("h-9 min-h-9 w-9 px-0",w.className),"data-action":f,"data-stack":e.name,disabled:m,onClick:()=>s(e,f),size:"sm",title:`${w.label} ${e.name}`,variant:"outline",children:t===f?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(j,{"aria-hidden":"true",className:"h-4 w-4"})},f)}),n.jsx(_,{"aria-label":`Logs ${e.name}`,className:"h-9 min-h-9 w-9 px-0","data-stack-action":"logs","data-stack":e.name,disabled:m,onClick:()=>a(e),size:"sm",title:`Logs ${e.name}`,variant:"outline",children:n.jsx(Bl,{"aria-hidden":"true",className:"h-4 w-4"})}),n.jsx(Ba,{disabled:m,items:[{id:"pull",label:"Pull images",Icon:Oa,onSelect:()=>s(e,"pull"),tone:"info",data:{"data-action":"pull","data-stack":e.name}},{id:"edit",label:"Edit compose",Icon:ql,onSelect:()=>i(e),data:{"data-stack-action":"edit","data-stack":e.name}},{id:"backups",label:"Backups",Icon:ew,onSelect:()=>l(e),data:{"data-stack-action":"backups","data-stack":e.name}},{id:"delete",label:"Delete stack",Icon:Kt,onSelect:()=>o(e),separatorBefore:!0,tone:"danger",data:{"data-stack-action":"delete","data-stack":e.name}}],label:`More actions for ${e.name}`,menuData:{"data-stack-actions-menu":e.name},pending:t==="pull",triggerData:{"data-stack-menu":e.name}})]})]})})}const LC=/^[a-zA-Z0-9][a-zA-Z0-9._-]*$/,zC=`services:
+`)})]}):null]}):null]}),s?n.jsx(ze,{onClose:()=>a(null),children:n.jsxs("div",{"aria-labelledby":j,"aria-modal":"true",className:"max-h-[90vh] w-full max-w-xl overflow-y-auto rounded-lg border border-border bg-card",role:"dialog",children:[n.jsxs("header",{className:"flex items-start justify-between gap-3 border-b border-border px-4 py-4 sm:px-5",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("h2",{className:"font-mono text-base font-semibold",id:j,children:s.confirmation?.title??s.label}),s.description?n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:s.description}):null]}),n.jsx(_,{"aria-label":"Close action",className:"h-9 w-9 shrink-0 px-0",onClick:()=>a(null),size:"sm",variant:"ghost",children:n.jsx(We,{"aria-hidden":"true",className:"h-4 w-4"})})]}),n.jsxs("div",{className:"space-y-4 px-4 py-5 sm:px-5",children:[s.parameters.map(x=>{const g=Vo(x,qo(x,t));return n.jsx(Kg,{error:o[g.key],field:g,idPrefix:`${e.provider_id}-${s.id}`,onChange:N=>{l(E=>({...E,[g.key]:N})),c(E=>({...E,[g.key]:""}))},value:i[g.key]},g.key)}),s.confirmation?n.jsxs("div",{className:q("flex items-start gap-2 border-l-2 px-3 py-2.5 text-sm",s.intent==="destructive"?"border-danger bg-danger/5 text-danger":"border-warning bg-warning/5 text-warning"),children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),s.confirmation.message]}):null,n.jsxs("div",{className:"flex flex-wrap justify-end gap-2 border-t border-border pt-4",children:[n.jsx(_,{onClick:()=>a(null),variant:"outline",children:"Cancel"}),n.jsx(_,{onClick:p,variant:qp(s.intent),children:s.confirmation?.confirm_label??`Run ${s.label}`})]})]})]})}):null]})}function __(e){return e==="healthy"?"success":e==="warning"||e==="unconfigured"?"warning":e==="error"||e==="unavailable"||e==="incompatible"?"danger":"neutral"}function C_(e){return e==="error"?"border-danger text-danger":e==="warning"?"border-warning text-warning":"border-info text-info"}function E_(e){return e==="success"?"bg-success":e==="warning"?"bg-warning":e==="error"?"bg-danger":"bg-info"}function Hp(e){const t=new Date(e);return Number.isNaN(t.getTime())?"Unknown":t.toLocaleString()}function gu({status:e}){const t=`${e.provider_id}-${e.capability_id.split(".").join("-")}-status-title`;return n.jsxs("section",{"aria-labelledby":t,className:"rounded-lg border border-border bg-card",children:[n.jsxs("header",{className:"flex flex-col gap-3 border-b border-border px-4 py-4 sm:flex-row sm:items-start sm:justify-between sm:px-5",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:t,children:"Provider status"}),n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:e.health.message})]}),n.jsxs("div",{className:"flex shrink-0 flex-wrap items-center gap-2",children:[n.jsx(fe,{label:e.health.state,tone:__(e.health.state)}),n.jsxs("span",{className:"flex items-center gap-1 font-mono text-[11px] text-muted-foreground",children:[n.jsx(nu,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),n.jsx("time",{dateTime:e.observed_at,children:Hp(e.observed_at)})]})]})]}),n.jsxs("div",{className:"space-y-5 px-4 py-5 sm:px-5",children:[e.summary.length?n.jsx("dl",{className:"grid grid-cols-2 border border-border sm:grid-cols-3 lg:grid-cols-4",children:e.summary.map(r=>n.jsxs("div",{className:"min-w-0 border-b border-r border-border p-3 last:border-r-0",children:[n.jsx("dt",{className:"font-mono text-[10px] uppercase text-muted-foreground",children:r.label}),n.jsxs("dd",{className:q("mt-1 break-words text-sm font-medium tabular-nums",r.tone==="success"&&"text-success",r.tone==="warning"&&"text-warning",r.tone==="danger"&&"text-danger"),children:[r.value===null?"Not available":String(r.value),r.unit?` ${r.unit}`:""]})]},r.id))}):null,e.metrics.length?n.jsxs("div",{children:[n.jsx("h3",{className:"font-mono text-xs font-semibold uppercase text-muted-foreground",children:"Metrics"}),n.jsx("div",{className:"mt-3 grid grid-cols-1 gap-x-6 gap-y-4 md:grid-cols-2",children:e.metrics.map(r=>{const s=j_(r.value,r.minimum,r.maximum);return n.jsxs("div",{className:"space-y-1.5",children:[n.jsxs("div",{className:"flex items-baseline justify-between gap-3 text-sm",children:[n.jsx("span",{children:r.label}),n.jsxs("span",{className:"font-mono text-xs tabular-nums text-muted-foreground",children:[r.value,r.unit?` ${r.unit}`:""]})]}),n.jsx(Yt,{label:r.label,value:s})]},r.id)})})]}):null,e.health.issues.length?n.jsx("div",{className:"space-y-2","aria-label":"Provider issues",children:e.health.issues.map(r=>n.jsxs("div",{className:q("border-l-2 bg-muted/20 px-3 py-2.5",C_(r.severity)),children:[n.jsxs("p",{className:"flex items-start gap-2 text-sm font-medium",children:[n.jsx(za,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),r.message]}),r.recovery?n.jsx("p",{className:"mt-1 pl-6 text-xs text-muted-foreground",children:r.recovery}):null]},r.code))}):null,e.recent_activity.length?n.jsxs("div",{children:[n.jsxs("h3",{className:"flex items-center gap-1.5 font-mono text-xs font-semibold uppercase text-muted-foreground",children:[n.jsx(Je,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Recent activity"]}),n.jsx("ol",{className:"mt-3 divide-y divide-border border-y border-border",children:e.recent_activity.map(r=>n.jsxs("li",{className:"flex items-start gap-3 py-2.5 text-sm",children:[n.jsx("span",{"aria-hidden":"true",className:q("mt-1.5 h-2 w-2 shrink-0 rounded-full",E_(r.kind))}),n.jsx("span",{className:"min-w-0 flex-1 break-words",children:r.summary}),n.jsx("time",{className:"shrink-0 font-mono text-[10px] text-muted-foreground",dateTime:r.occurred_at,children:Hp(r.occurred_at)})]},r.id))})]}):null]})]})}function A_(e){const t={};for(const r of e)t[r.field]||(t[r.field]=r.message);return t}function P_(e){return(e instanceof Error?e.message:"Configuration could not be saved.").replace(/\s+/g," ").trim().slice(0,240)||"Configuration could not be saved."}function R_({schema:e,initialValues:t={},errors:r=[],disabled:s=!1,onSubmit:a}){const[i,l]=d.useState(()=>ed(e,t)),[o,c]=d.useState([]),[u,h]=d.useState(r),[m,f]=d.useState(!1),[w,j]=d.useState(null),y=JSON.stringify(t),b=JSON.stringify(r);d.useEffect(()=>{l(ed(e,t)),c([]),h(r),j(null)},[e.schema_id,y,b]);const v=d.useMemo(()=>v_(e),[e]),p=A_([...u,...o]),x=e.fields.some(N=>!N.read_only);async function g(){const N=Gg(e.fields,i);if(c(N.errors),h([]),j(null),N.errors.length){requestAnimationFrame(()=>{const E=N.errors[0],C=`${e.schema_id}-field-${E.field.split(".").join("-")}`;document.getElementById(C)?.focus()});return}f(!0);try{const E=await a(N.values);E&&!E.valid?(h(E.errors),requestAnimationFrame(()=>{const C=E.errors.find(O=>O.field!=="_form");if(!C)return;const k=`${e.schema_id}-field-${C.field.split(".").join("-")}`;document.getElementById(k)?.focus()})):j("Configuration saved.")}catch(E){h([{field:"_form",code:"save_failed",message:P_(E)}])}finally{f(!1)}}return n.jsxs("section",{"aria-labelledby":`${e.schema_id}-title`,className:"rounded-lg border border-border bg-card",children:[n.jsxs("header",{className:"border-b border-border px-4 py-4 sm:px-5",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:`${e.schema_id}-title`,children:e.title}),e.description?n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:e.description}):null]}),n.jsxs("form",{className:"space-y-5 px-4 py-5 sm:px-5",onSubmit:N=>{N.preventDefault(),g()},children:[p._form?n.jsxs("div",{className:"flex items-start gap-2 border-l-2 border-danger bg-danger/5 px-3 py-2 text-sm text-danger",role:"alert",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),p._form]}):null,v.map((N,E)=>n.jsxs("fieldset",{className:E?"border-t border-border pt-5":"",children:[n.jsx("legend",{className:"font-mono text-xs font-semibold uppercase text-muted-foreground",children:N.label}),N.description?n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:N.description}):null,n.jsx("div",{className:"mt-3 grid grid-cols-1 gap-4 md:grid-cols-2",children:N.fields.map(C=>n.jsx(Kg,{error:p[C.key],field:C,idPrefix:e.schema_id,onChange:k=>{l(O=>({...O,[C.key]:k})),c(O=>O.filter(S=>S.field!==C.key)),h(O=>O.filter(S=>S.field!==C.key)),j(null)},value:i[C.key]},C.key))})]},N.id)),n.jsxs("div",{className:"flex min-h-11 flex-wrap items-center gap-3 border-t border-border pt-4",children:[n.jsxs(_,{className:"gap-2",disabled:s||m||!x,type:"submit",children:[m?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(Da,{"aria-hidden":"true",className:"h-4 w-4"}),"Save configuration"]}),w?n.jsxs("span",{className:"flex items-center gap-1.5 text-sm text-success",role:"status",children:[n.jsx(lt,{"aria-hidden":"true",className:"h-4 w-4"}),w]}):null]})]})]})}function Qg({status:e,setup:t,setupValues:r,setupErrors:s,actions:a,onSave:i,onAction:l}){return n.jsxs("div",{className:"space-y-5","data-capability-renderer":"generic",children:[n.jsx(gu,{status:e}),t&&i?n.jsx(R_,{disabled:!e.lifecycle.enabled||e.lifecycle.compatibility!=="compatible",errors:s,initialValues:r,onSubmit:i,schema:t}):null,a&&l?n.jsx(S_,{catalog:a,execute:l,status:e}):null]})}const Wp={commandId:null,running:!1,lines:[],progress:null,errors:[],summary:null,transportError:null,forceAvailable:!1};function M_(e,t){if(e.trim()==="")return t;const r=Number(e);return Number.isFinite(r)?r:t}function Gp(e){if(e==null||e<=0)return"";const t=Math.floor(e/60),r=e%60;return t?`~${t}m ${r}s left`:`~${r}s left`}function ua({pluginId:e,commands:t,poolNames:r,onCompleted:s,heading:a="Commands"}){const[i,l]=d.useState(null),[o,c]=d.useState(!1),[u,h]=d.useState({}),[m,f]=d.useState(Wp),w=(g,N,E)=>{h(C=>({...C,[g]:{...C[g],[N]:E}}))},j=(g,N)=>{const E=u[g.id]?.[N.name];return E!==void 0?E:N.type==="select"&&N.source?.includes("pools")&&r.length?r[0]:N.default!==void 0&&N.default!==null?String(N.default):""},y=g=>{const N={};for(const E of g.param_schema??[]){const C=j(g,E);if(E.type==="number"){const k=M_(C,typeof E.default=="number"?E.default:null);k!==null&&(N[E.name]=k)}else E.type==="boolean"?N[E.name]=C==="true":C!==""&&(N[E.name]=C)}return N},b=g=>(g.param_schema??[]).some(N=>N.required&&j(g,N)==="");async function v(g,N){c(!1),f({...Wp,commandId:g.id,running:!0});try{const E={...y(g),...N??{}};await y2(e,g.id,E,C=>{f(k=>{if(C.type==="output"&&typeof C.line=="string")return{...k,lines:[...k.lines,C.line]};if(C.type==="tag"){if(C.name==="run"&&C.values?.[0]==="pos"){const O=$=>{const R=Number($);return Number.isFinite(R)?R:null},S=C.values;return{...k,progress:{percent:O(S[4]),eta:O(S[5]),speed:O(S[6])}}}return C.name==="msg"&&(C.values?.[0]==="error"||C.values?.[0]==="fatal")?{...k,errors:[...k.errors,String(C.values[1]??"")]}:k}if(C.type==="complete"){const O=C.data??null;return{...k,running:!1,forceAvailable:!C.success&&O?.force_allowed===!0,summary:{success:!!C.success,message:String(C.message||C.error||""),data:O}}}return C.type==="error"?{...k,running:!1,transportError:C.error??"Command error"}:k})}),s?.()}catch(E){f(C=>({...C,running:!1,transportError:E instanceof Error?E.message:"Could not start command"}))}finally{f(E=>({...E,running:!1}))}}const p=i?t.find(g=>g.id===i)??null:null,x=p?.id==="unmount"?"Unmounting can interrupt applications using this pool. Continue?":p?.id==="sync"?"Sync updates parity from the current data drives. Continue?":p?.id==="fix"?"Fix can overwrite damaged files using parity. Review recovery status before continuing?":"This action can change provider state. Continue?";return n.jsxs("div",{className:"space-y-3",children:[n.jsx("p",{className:"font-mono text-xs uppercase text-muted-foreground",children:a}),n.jsx("div",{className:"flex flex-wrap gap-2",children:t.map(g=>n.jsxs(_,{className:"gap-1.5 text-xs sm:text-sm","data-plugin-command":g.id,disabled:m.running,onClick:()=>{c(!1);const N=(g.param_schema??[]).length>0;if(g.dangerous||N){const E=i===g.id?null:g.id;l(E),E&&g.dangerous&&!N&&c(!0)}else l(null),v(g)},size:"sm",variant:i===g.id?"default":"outline",children:[n.jsx(Hx,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),g.label,g.dangerous?n.jsx(ie,{"aria-hidden":"true",className:"h-3.5 w-3.5"}):null]},g.id))}),p?n.jsxs("div",{className:"space-y-3 rounded-lg border border-border/70 bg-muted/20 p-3",children:[p.description?n.jsx("p",{className:"text-xs text-muted-foreground",children:p.description}):null,(p.param_schema??[]).map(g=>n.jsxs("label",{className:"block space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:g.label??g.name}),g.type==="select"?n.jsx("select",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm","data-command-param":g.name,disabled:!r.length,onChange:N=>w(p.id,g.name,N.target.value),value:j(p,g),children:r.length?r.map(N=>n.jsx("option",{value:N,children:N},N)):n.jsx("option",{value:"",children:"No pools configured"})}):g.type==="boolean"?n.jsx("input",{checked:j(p,g)==="true",className:"block h-4 w-4","data-command-param":g.name,onChange:N=>w(p.id,g.name,String(N.target.checked)),type:"checkbox"}):n.jsx("input",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm","data-command-param":g.name,max:g.max,min:g.min,onChange:N=>w(p.id,g.name,N.target.value),type:g.type==="number"?"number":"text",value:j(p,g)})]},g.name)),o&&p.dangerous?n.jsxs("div",{className:"space-y-2 rounded-md border border-danger/40 bg-danger/10 p-3 text-xs",children:[n.jsxs("p",{className:"flex items-center gap-1.5 font-medium text-danger",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),x]}),n.jsxs("div",{className:"flex gap-2",children:[n.jsxs(_,{"data-command-confirm":p.id,onClick:()=>void v(p),size:"sm",variant:"danger",children:["Run ",p.label]}),n.jsx(_,{onClick:()=>c(!1),size:"sm",variant:"outline",children:"Cancel"})]})]}):n.jsxs(_,{className:"gap-1.5","data-command-run":p.id,disabled:m.running||b(p),onClick:()=>p.dangerous?c(!0):void v(p),size:"sm",children:[n.jsx(Hl,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Run ",p.label]})]}):null,m.commandId?n.jsxs("div",{className:"space-y-2 rounded-lg border border-border/70 bg-muted/20 p-3","data-command-output":!0,children:[m.transportError?n.jsxs("p",{className:"flex items-center gap-1.5 rounded-md bg-danger/10 px-2 py-1.5 text-xs font-medium text-danger","data-command-transport-error":!0,children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Couldn't start: ",m.transportError]}):null,m.progress?n.jsxs("div",{className:"space-y-1","data-command-progress":!0,children:[n.jsx(Yt,{label:"command progress",tone:"primary",value:m.progress.percent}),n.jsxs("p",{className:"text-[0.7rem] text-muted-foreground tabular-nums",children:[m.progress.percent!=null?`${m.progress.percent}%`:"running",Gp(m.progress.eta)?` · ${Gp(m.progress.eta)}`:"",m.progress.speed?` · ${m.progress.speed.toFixed(1)} MB/s`:""]})]}):null,m.errors.length?n.jsx("ul",{className:"space-y-1","data-command-errors":!0,children:m.errors.map((g,N)=>n.jsx("li",{className:"text-xs font-medium text-danger",children:g},N))}):null,m.summary?n.jsxs("div",{className:q("rounded-md px-2 py-1.5 text-xs font-medium",m.summary.success?"bg-success/10 text-success":"bg-danger/10 text-danger"),"data-command-summary":!0,children:[m.summary.success?"Completed":"Failed",m.summary.message?`: ${m.summary.message}`:"",m.summary.data?` (${Object.entries(m.summary.data).filter(([,g])=>typeof g=="number").map(([g,N])=>`${N} ${g}`).join(", ")})`:""]}):null,m.forceAvailable?n.jsxs("div",{className:"space-y-2 rounded-md border border-danger/40 bg-danger/10 p-2 text-xs","data-command-threshold":!0,children:[n.jsx("p",{className:"font-medium text-danger",children:"This exceeds the configured safety threshold (see the counts above). Run anyway?"}),n.jsx(_,{"data-command-force":!0,onClick:()=>{const g=t.find(N=>N.id===m.commandId);g&&v(g,{force:!0,force_reason:"operator confirmed threshold override"})},size:"sm",variant:"danger",children:"Run anyway"})]}):null,n.jsx("pre",{className:"max-h-[20vh] overflow-auto whitespace-pre-wrap break-words text-xs sm:text-sm",id:"v2-plugin-command-output",children:m.lines.join(`
+`)||(m.running?"Waiting for output...":"")})]}):null]})}const T_=[{value:"epmfs",label:"epmfs — existing path, most free space (default)"},{value:"eplfs",label:"eplfs — existing path, least free space"},{value:"mfs",label:"mfs — most free space"},{value:"lfs",label:"lfs — least free space"},{value:"rand",label:"rand — random branch"},{value:"ff",label:"ff — first found"}],$_=[{value:"linux_6_6_plus",label:"Linux 6.6+"},{value:"linux_6_5_mmap",label:"Linux ≤ 6.5 + mmap"},{value:"linux_6_5_no_mmap",label:"Linux ≤ 6.5, no mmap"}],I_=/^\d+(\.\d+)?[KMGT]?$/i;function Kp(){return{id:`pool-${Date.now()}`,name:"",mount_point:"",branches:[],create_policy:"epmfs",preset:"linux_6_5_no_mmap",min_free_space:"4G",options:"",enabled:!0}}function L_({pluginId:e,config:t,onSaved:r}){const[s,a]=d.useState(null),[i,l]=d.useState([]),[o,c]=d.useState({}),[u,h]=d.useState([]),[m,f]=d.useState(null),[w,j]=d.useState(null),[y,b]=d.useState(!1),[v,p]=d.useState(""),[x,g]=d.useState(!1);d.useEffect(()=>{let L=!0;const B=(t.pools??[]).map(P=>({...Kp(),id:String(P.id??`pool-${Math.random()}`),name:String(P.name??""),mount_point:String(P.mount_point??""),branches:Array.isArray(P.branches)?P.branches.map(M=>String(M)):[],create_policy:String(P.create_policy??"epmfs"),preset:String(P.preset??"linux_6_5_no_mmap"),min_free_space:String(P.min_free_space??"4G"),options:String(P.options??""),enabled:P.enabled!==!1}));return l(B),b(!1),j(null),h([]),pu().then(P=>{if(!L)return;const M=new Set;for(const A of P.disks)for(const F of[A,...A.partitions])F.mountpoint?.startsWith("/mnt/")&&M.add(F.mountpoint);a([...M].sort())}).catch(()=>a([])),()=>{L=!1}},[t]);const N=(L,B)=>{b(!0),j(null),f(null),l(P=>P.map(M=>{if(M.id!==L)return M;const A={...M,...B};return B.name!==void 0&&(M.mount_point===""||M.mount_point===`/mnt/${M.name}`)&&(A.mount_point=B.name?`/mnt/${B.name}`:""),A}))},E=(L,B)=>{b(!0),j(null),f(null),l(P=>P.map(M=>M.id===L?{...M,branches:M.branches.includes(B)?M.branches.filter(A=>A!==B):[...M.branches,B]}:M))},C=(L,B,P)=>{b(!0),j(null),f(null),l(M=>M.map(A=>{if(A.id!==L)return A;const F=B+P;if(F<0||F>=A.branches.length)return A;const D=[...A.branches];return[D[B],D[F]]=[D[F],D[B]],{...A,branches:D}}))},k=()=>{b(!0),j(null),f(null),l(L=>[...L,Kp()])},O=L=>{b(!0),j(null),f(null),l(B=>B.filter(P=>P.id!==L))},S=d.useMemo(()=>{const L={};for(const B of i){const P=[];B.name.trim()||P.push("Name is required."),new Set(B.branches).size<2&&P.push("Add at least two distinct branches."),(!B.mount_point.startsWith("/mnt/")||B.mount_point.includes(".."))&&P.push("Mount point must be a safe path under /mnt/."),I_.test(B.min_free_space.trim())||P.push("Min free space must look like 4G, 500M, 1T."),P.length&&(L[B.id]=P)}return L},[i]),$=()=>({...t,enabled:!0,pools:i.map(L=>({id:L.id,name:L.name,mount_point:L.mount_point,branches:L.branches,create_policy:L.create_policy,preset:L.preset,min_free_space:L.min_free_space,options:L.options,enabled:L.enabled}))}),R=Object.values(S).flat(),H=async()=>{if(R.length){h(R);return}p("preview"),h([]),f(null);try{j(await Lg(e,$()))}catch(L){h([L instanceof Error?L.message:"Preview failed"])}finally{p("")}},I=async()=>{if(R.length){h(R);return}p("save"),h([]),f(null);const L=await $g(e,$());p(""),L.ok?(b(!1),f("Saved. Apply to (re)mount pools."),r()):h(L.details.length?L.details:[L.error??"Save failed"])},U=async()=>{g(!1),p("apply"),h([]),f(null);const L=await Ig(e);p(""),L.ok?(f(L.message??"Applied."),r()):h([L.error??"Apply failed"])};return s?n.jsxs("div",{className:"space-y-4","data-mergerfs-editor":!0,children:[i.map(L=>n.jsxs("div",{className:"space-y-3 rounded-lg border border-border/70 p-3","data-pool-editor":L.id,children:[n.jsxs("div",{className:"flex items-center gap-2",children:[n.jsx("input",{"aria-label":"Pool name",className:"h-9 flex-1 rounded-md border border-input bg-background px-2 text-sm","data-pool-name":L.id,onChange:B=>N(L.id,{name:B.target.value}),placeholder:"pool name",value:L.name}),n.jsxs("label",{className:"flex items-center gap-1 text-xs text-muted-foreground",children:[n.jsx("input",{checked:L.enabled,"data-pool-enabled":L.id,onChange:B=>N(L.id,{enabled:B.target.checked}),type:"checkbox"}),"enabled"]}),n.jsx(_,{"aria-label":"Remove pool","data-pool-remove":L.id,onClick:()=>O(L.id),size:"icon",title:"Remove pool",variant:"ghost",children:n.jsx(Kt,{"aria-hidden":"true",className:"h-4 w-4"})})]}),n.jsx("input",{"aria-label":"Mount point",className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",onChange:B=>N(L.id,{mount_point:B.target.value}),placeholder:"/mnt/<name>",value:L.mount_point}),n.jsxs("div",{className:"space-y-1",children:[n.jsx("p",{className:"text-xs text-muted-foreground",children:"Branches (at least 2, in priority order)"}),L.branches.length?n.jsx("ol",{className:"divide-y divide-border overflow-hidden rounded-md border border-border","data-pool-branches":L.id,children:L.branches.map((B,P)=>n.jsxs("li",{className:"flex min-h-10 items-center gap-2 bg-muted/15 px-2",children:[n.jsx("span",{className:"w-5 shrink-0 text-center font-mono text-[10px] text-dim",children:P+1}),n.jsx("code",{className:"min-w-0 flex-1 truncate text-xs",title:B,children:B}),n.jsxs("div",{className:"flex shrink-0 items-center gap-1",children:[n.jsx(_,{"aria-label":`Move ${B} up`,disabled:P===0,onClick:()=>C(L.id,P,-1),size:"icon",title:"Move branch up",variant:"ghost",children:n.jsx(ow,{"aria-hidden":"true",className:"h-3.5 w-3.5"})}),n.jsx(_,{"aria-label":`Move ${B} down`,disabled:P===L.branches.length-1,onClick:()=>C(L.id,P,1),size:"icon",title:"Move branch down",variant:"ghost",children:n.jsx(nw,{"aria-hidden":"true",className:"h-3.5 w-3.5"})}),n.jsx(_,{"aria-label":`Remove ${B}`,onClick:()=>E(L.id,B),size:"icon",title:"Remove branch",variant:"ghost",children:n.jsx(We,{"aria-hidden":"true",className:"h-3.5 w-3.5"})})]})]},B))}):null,n.jsx("div",{className:"flex flex-wrap gap-1.5 pt-1",children:s.filter(B=>!L.branches.includes(B)).map(B=>n.jsxs(_,{"data-pool-branch-add":`${L.id}:${B}`,onClick:()=>E(L.id,B),size:"sm",variant:"outline",children:[n.jsx(ot,{"aria-hidden":"true",className:"mr-1 h-3.5 w-3.5"}),B]},B))}),n.jsxs("div",{className:"flex gap-2 pt-1",children:[n.jsx("input",{"aria-label":"Custom branch path or glob",className:"h-8 flex-1 rounded-md border border-input bg-background px-2 text-xs",onChange:B=>c(P=>({...P,[L.id]:B.target.value})),placeholder:"/mnt/disk*/data (glob)",value:o[L.id]??""}),n.jsx(_,{onClick:()=>{const B=(o[L.id]??"").trim();B&&(E(L.id,B),c(P=>({...P,[L.id]:""})))},size:"sm",variant:"outline",children:"Add"})]})]}),n.jsxs("div",{className:"grid grid-cols-1 gap-2 sm:grid-cols-2",children:[n.jsxs("label",{className:"space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:"Create policy"}),n.jsx("select",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",onChange:B=>N(L.id,{create_policy:B.target.value}),value:L.create_policy,children:T_.map(B=>n.jsx("option",{value:B.value,children:B.label},B.value))})]}),n.jsxs("label",{className:"space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:"Options preset"}),n.jsx("select",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",onChange:B=>N(L.id,{preset:B.target.value}),value:L.preset,children:$_.map(B=>n.jsx("option",{value:B.value,children:B.label},B.value))})]}),n.jsxs("label",{className:"space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:"Min free space"}),n.jsx("input",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",onChange:B=>N(L.id,{min_free_space:B.target.value}),value:L.min_free_space})]}),n.jsxs("label",{className:"space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:"Extra options"}),n.jsx("input",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",onChange:B=>N(L.id,{options:B.target.value}),placeholder:"comma,separated",value:L.options})]})]}),S[L.id]?n.jsx("ul",{className:"space-y-1","data-pool-errors":L.id,children:S[L.id].map(B=>n.jsxs("li",{className:"flex items-start gap-1.5 text-xs text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-3.5 w-3.5 shrink-0"}),B]},B))}):null]},L.id)),n.jsxs(_,{className:"gap-1.5","data-pool-add":!0,onClick:k,size:"sm",variant:"outline",children:[n.jsx(ot,{"aria-hidden":"true",className:"h-4 w-4"}),"Add pool"]}),u.length?n.jsx("ul",{className:"space-y-1 rounded-md bg-danger/10 p-2","data-mergerfs-errors":!0,children:u.map(L=>n.jsx("li",{className:"text-xs font-medium text-danger",children:L},L))}):null,m?n.jsx("p",{className:"text-xs font-medium text-success",role:"status",children:m}):null,w?n.jsxs("section",{"aria-labelledby":"mergerfs-preview-title",className:"overflow-hidden rounded-md border border-border","data-mergerfs-preview":!0,children:[n.jsx("div",{className:"border-b border-border bg-muted/20 px-3 py-2",children:n.jsx("h3",{className:"font-mono text-xs font-semibold",id:"mergerfs-preview-title",children:"Managed fstab preview"})}),n.jsx("pre",{className:"max-h-64 overflow-auto whitespace-pre-wrap break-all p-3 text-xs text-muted-foreground",children:w})]}):null,x?n.jsxs("div",{className:"space-y-2 rounded-md border border-warning/40 bg-warning/10 p-3 text-xs","data-apply-confirm":!0,children:[n.jsxs("p",{className:"flex items-center gap-1.5 font-medium text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Apply rewrites the managed /etc/fstab section and (re)mounts pools. Disabled pools are unmounted and removed from the section. Continue?"]}),n.jsxs("div",{className:"flex gap-2",children:[n.jsx(_,{"data-apply-confirm-yes":!0,onClick:()=>void U(),size:"sm",variant:"danger",children:"Apply changes"}),n.jsx(_,{onClick:()=>g(!1),size:"sm",variant:"outline",children:"Cancel"})]})]}):null,n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsxs(_,{className:"gap-1.5","data-mergerfs-preview-open":!0,disabled:v!==""||!!R.length,onClick:()=>void H(),size:"sm",variant:"outline",children:[n.jsx(ru,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),v==="preview"?"Previewing...":"Preview"]}),n.jsx(_,{"data-mergerfs-save":!0,disabled:v!==""||!!R.length,onClick:()=>void I(),size:"sm",children:v==="save"?"Saving...":"Save"}),n.jsx(_,{"data-mergerfs-apply":!0,disabled:v!==""||y||!!R.length,onClick:()=>g(!0),size:"sm",variant:"secondary",children:v==="apply"?"Applying...":"Apply"}),y?n.jsx("span",{className:"text-xs text-warning",children:"Save changes before applying."}):null]})]}):n.jsxs("p",{className:"flex items-center gap-2 text-sm text-muted-foreground",children:[n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"})," Loading disks..."]})}function vu({pool:e}){const t=e.totalBytes!==null&&e.freeBytes!==null?e.totalBytes-e.freeBytes:null,r=e.usedPercent!==null&&e.usedPercent>=90?"danger":"primary";return n.jsx(Q,{className:q("transition-colors hover:border-primary/25",!e.mounted&&"border-warning/30 bg-warning/5"),"data-pool-card":e.name,"data-pool-provider":e.providerId,children:n.jsxs(K,{className:"space-y-4 p-4",children:[n.jsxs("div",{className:"flex items-start justify-between gap-3",children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-2.5",children:[n.jsx(su,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-primary"}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("h2",{className:"truncate text-sm font-semibold",children:e.name}),n.jsx("p",{className:"mt-0.5 truncate font-mono text-[11px] text-dim",children:e.mountPoint??"Mount point not reported"})]})]}),n.jsx(fe,{label:e.mounted?"mounted":"unmounted",tone:e.mounted?"success":"warning"})]}),n.jsxs("dl",{className:"grid grid-cols-2 gap-x-4 gap-y-3 border-y border-border py-3 text-xs",children:[n.jsxs("div",{children:[n.jsx("dt",{className:"font-mono text-[10px] uppercase text-dim",children:"Branches"}),n.jsx("dd",{className:"mt-1 text-foreground",children:e.branchCount??"Not reported"})]}),n.jsxs("div",{children:[n.jsx("dt",{className:"font-mono text-[10px] uppercase text-dim",children:"Policy"}),n.jsx("dd",{className:"mt-1 truncate text-foreground",children:e.policy??"Provider default"})]})]}),e.usedPercent!==null?n.jsxs("div",{className:"space-y-1.5",children:[n.jsx(Yt,{label:`${e.name} capacity`,tone:r,value:e.usedPercent}),n.jsx("p",{className:"font-mono text-[11px] tabular-nums text-dim",children:t!==null&&e.totalBytes!==null?`${Pe(t)} / ${Pe(e.totalBytes)}`:`${Math.round(e.usedPercent)}% used`})]}):null,n.jsxs("div",{className:"flex items-end justify-between gap-3 pt-1",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"font-mono text-[10px] uppercase text-dim",children:"Provider"}),n.jsx("p",{className:"mt-0.5 truncate text-xs text-muted-foreground",children:e.providerName})]}),n.jsxs(Ee,{"aria-label":`Manage ${e.name}`,className:q(Ye({size:"sm",variant:"outline"}),"gap-2"),to:Ix(e.providerId),children:[n.jsx(_s,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Manage"]})]}),e.recentAction?n.jsx("p",{className:"truncate border-t border-border pt-3 text-xs text-dim",title:e.recentAction,children:e.recentAction}):null]})})}function z_(e){return e instanceof Error&&e.message?e.message:"Unable to load the latest provider log"}function O_({detail:e,status:t,pools:r,canConfigure:s,onRefresh:a}){const[i,l]=d.useState(t.lifecycle.configured?"overview":s?"configuration":"overview"),[o,c]=d.useState("idle"),[u,h]=d.useState(null),[m,f]=d.useState(""),w=r.map(p=>p.name),j=e.commands.filter(p=>["mount","unmount","balance"].includes(p.id)),y=e.commands.filter(p=>p.id==="status"),b=[{id:"overview",label:"Overview"},...s?[{id:"configuration",label:"Configuration"}]:[],{id:"diagnostics",label:"Diagnostics"}],v=d.useCallback(async()=>{c("loading"),f("");try{h(await zg("mergerfs")),c("ready")}catch(p){f(z_(p)),c("error")}},[]);return d.useEffect(()=>{i==="diagnostics"&&o==="idle"&&v()},[v,o,i]),n.jsxs("div",{className:"space-y-5","data-capability-renderer":"mergerfs",children:[n.jsx("div",{className:"flex gap-1 overflow-x-auto border-b border-border",role:"tablist","aria-label":"MergerFS provider views",children:b.map(p=>n.jsx("button",{"aria-controls":`mergerfs-panel-${p.id}`,"aria-selected":i===p.id,className:q("min-h-11 shrink-0 border-b-2 px-3 font-mono text-xs transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring",i===p.id?"border-primary text-primary":"border-transparent text-muted-foreground hover:text-foreground"),"data-mergerfs-tab":p.id,id:`mergerfs-tab-${p.id}`,onClick:()=>l(p.id),onKeyDown:Yl,role:"tab",tabIndex:i===p.id?0:-1,type:"button",children:p.label},p.id))}),i==="overview"?n.jsxs("div",{"aria-labelledby":"mergerfs-tab-overview",className:"space-y-5",id:"mergerfs-panel-overview",role:"tabpanel",children:[n.jsx(gu,{status:t}),r.length?n.jsxs("section",{"aria-labelledby":"mergerfs-pools-title",children:[n.jsxs("div",{className:"mb-3 flex items-center justify-between gap-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"mergerfs-pools-title",children:"Configured pools"}),n.jsxs("span",{className:"text-xs text-dim",children:[r.filter(p=>p.mounted).length,"/",r.length," mounted"]})]}),n.jsx("div",{className:"grid gap-3 sm:grid-cols-2 xl:grid-cols-3",children:r.map(p=>n.jsx(vu,{pool:p},p.id))})]}):n.jsxs("div",{className:"border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm",children:[n.jsx("p",{className:"font-medium text-warning",children:"No pools configured"}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:s?"Open Configuration to add the first MergerFS pool.":"An administrator must configure the first MergerFS pool."})]}),j.length?n.jsxs("section",{"aria-labelledby":"mergerfs-operations-title",className:"border-t border-border pt-5",children:[n.jsx("h2",{className:"sr-only",id:"mergerfs-operations-title",children:"Pool operations"}),s?n.jsx(ua,{commands:j,heading:"Pool operations",onCompleted:a,pluginId:"mergerfs",poolNames:w}):n.jsx("p",{className:"text-xs text-muted-foreground",children:"Administrator access is required for mount, unmount, and balance operations."})]}):null]}):null,i==="configuration"&&s?n.jsxs("section",{"aria-labelledby":"mergerfs-tab-configuration",className:"space-y-4",id:"mergerfs-panel-configuration",role:"tabpanel",children:[n.jsxs("div",{children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"Pool configuration"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Order branches by priority, choose the create policy, preview the managed fstab section, then save and apply."})]}),n.jsx(L_,{config:e.config,onSaved:a,pluginId:"mergerfs"})]}):null,i==="diagnostics"?n.jsxs("div",{"aria-labelledby":"mergerfs-tab-diagnostics",className:"space-y-5",id:"mergerfs-panel-diagnostics",role:"tabpanel",children:[y.length?n.jsx(ua,{commands:y,heading:"Live diagnostics",onCompleted:a,pluginId:"mergerfs",poolNames:w}):null,n.jsxs("section",{"aria-labelledby":"mergerfs-log-title",className:"overflow-hidden rounded-md border border-border",children:[n.jsxs("div",{className:"flex items-center justify-between gap-3 border-b border-border bg-muted/20 px-3 py-2",children:[n.jsxs("h2",{className:"flex items-center gap-2 font-mono text-xs font-semibold",id:"mergerfs-log-title",children:[n.jsx(Bl,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Latest provider log"]}),n.jsx(_,{"aria-label":"Reload provider log",disabled:o==="loading",onClick:()=>void v(),size:"icon",title:"Reload provider log",variant:"ghost",children:n.jsx(je,{"aria-hidden":"true",className:q("h-3.5 w-3.5",o==="loading"&&"animate-spin")})})]}),o==="error"?n.jsxs("p",{className:"flex items-center gap-2 p-3 text-xs text-danger",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),m]}):null,o==="ready"?n.jsx("pre",{className:"max-h-72 overflow-auto whitespace-pre-wrap break-words p-3 text-xs text-muted-foreground","data-mergerfs-log":!0,children:u||"No provider log is available."}):null,o==="loading"?n.jsx("p",{className:"p-3 text-xs text-muted-foreground",children:"Loading provider log…"}):null]})]}):null]})}function Rr(e){return e&&typeof e=="object"&&!Array.isArray(e)?e:{}}function bi(e){if(e==null||e==="")return null;const t=Number(e);return Number.isFinite(t)?t:null}function D_(e,t){return t?["ok","active","healthy","mounted","ready"].includes(e)?"healthy":["warning","degraded","unmounted"].includes(e)?"warning":["error","failed"].includes(e)?"error":e==="disabled"?"disabled":"unknown":"unconfigured"}function U_(e){const t=Rr(e.status);if(!e.id||t.schema_version!=="1"||t.capability_id!=="storage.pooling")return null;const r=Rr(e.renderer);return{id:String(e.id),name:String(e.name??e.id),enabled:!!(e.enabled??t.lifecycle.enabled),operational:!!e.operational,status:t,rendererId:String(r.id??"generic"),rendererMode:r.mode==="tailored"?"tailored":"generic",source:e.source==="legacy"?"legacy":"registry"}}function B_(e){const t=e.status.details.pools;return Array.isArray(t)?t.map((r,s)=>{const a=Rr(r),i=a.branches,l=Array.isArray(i)?i.length:bi(i??a.branch_count),o=bi(a.total_bytes),c=bi(a.free_bytes??a.available_bytes),h=bi(a.used_percent)??(o!==null&&o>0&&c!==null?(o-c)/o*100:null),m=!!a.mounted,f=String(a.health??""),w=["healthy","warning","error","unknown","disabled","unconfigured","incompatible","unavailable"].includes(f)?f:m?"healthy":"warning",j=String(a.name??`pool-${s+1}`);return{id:`${e.id}:${j}`,name:j,providerId:e.id,providerName:e.name,mountPoint:a.mount_point!=null?String(a.mount_point):null,mounted:m,branchCount:l,policy:a.policy!=null?String(a.policy):a.create_policy!=null?String(a.create_policy):null,totalBytes:o,freeBytes:c,usedPercent:h,health:w,recentAction:a.recent_action!=null?String(a.recent_action):null}}):[]}function Jg(e){const t=e.providers.map(m=>U_(m)).filter(m=>m!==null).sort((m,f)=>m.name.localeCompare(f.name)),r=t.filter(m=>m.enabled),s=t.filter(m=>!m.enabled),a=r.filter(m=>!m.status.lifecycle.configured),i=r.filter(m=>m.status.lifecycle.configured),l=i.flatMap(m=>B_(m)).sort((m,f)=>m.name.localeCompare(f.name)),o=l.filter(m=>m.totalBytes!==null),c=l.filter(m=>m.freeBytes!==null),u=r.filter(m=>["warning","error","unavailable","incompatible"].includes(m.status.health.state)).length,h=l.filter(m=>!m.mounted).length;return{enabledProviders:r,availableProviders:s,setupProviders:a,configuredProviders:i,pools:l,summary:{totalPools:l.length,mountedPools:l.filter(m=>m.mounted).length,totalBytes:o.length?o.reduce((m,f)=>m+(f.totalBytes??0),0):null,freeBytes:c.length?c.reduce((m,f)=>m+(f.freeBytes??0),0):null,warnings:Math.max(u,h)}}}function F_(e,t,r){const s=e.find(u=>u.id==="mergerfs"&&u.installed);if(!s)return{id:"storage.pooling",surface:"pools",providers:[]};const a=t.mergerfs,i=Rr(a?.status),l=Rr(i.details),o=s.enabled?D_(String(i.status??s.status),s.configured):"disabled",c={schema_version:"1",provider_id:s.id,capability_id:"storage.pooling",observed_at:r,lifecycle:{installed:s.installed,enabled:s.enabled,configured:s.configured,compatibility:"compatible",availability:a?"available":"unknown"},health:{state:o,message:String(i.message??s.status_message??"Provider status is available through the compatibility adapter."),issues:[]},summary:[],metrics:[],recent_activity:[],details:l};return{id:"storage.pooling",surface:"pools",providers:[{id:s.id,name:s.name,enabled:s.enabled,operational:s.enabled&&s.configured&&o==="healthy",renderer:{id:"mergerfs",mode:"tailored"},status:c,source:"legacy"}]}}function V_(e,t){if(!e.providers.length)return t;const r=new Map(t.providers.map(s=>[s.id,s]));return{...e,providers:e.providers.map(s=>{const a=r.get(s.id);if(!a)return s;const i=Rr(s.status),l=Rr(a.status);return Array.isArray(i.details?.pools)?s:{...s,status:{...i,details:l.details}}})}}function q_(e){return e instanceof Error&&e.message?e.message:"Unable to load pooling providers"}function Yg(e){return e==="healthy"?"success":e==="warning"||e==="unconfigured"?"warning":["error","unavailable","incompatible"].includes(e)?"danger":"neutral"}function H_({view:e}){const{summary:t}=e,r=[{label:"Pools",value:String(t.totalPools),detail:`${e.enabledProviders.length} enabled provider${e.enabledProviders.length===1?"":"s"}`},{label:"Mounted",value:`${t.mountedPools}/${t.totalPools}`,detail:t.totalPools?t.mountedPools!==t.totalPools?"Mount state needs attention":"All configured pools available":"No pools configured"},{label:"Capacity",value:Pe(t.totalBytes)??"Not reported",detail:`${Pe(t.freeBytes)??"Unknown"} free`},{label:"Warnings",value:String(t.warnings),detail:t.warnings?"Review provider health":"No provider warnings"}];return n.jsx("dl",{"aria-label":"Pool summary",className:"grid grid-cols-2 overflow-hidden rounded-md border border-border bg-card xl:grid-cols-4","data-pool-summary":!0,children:r.map(s=>n.jsxs("div",{className:"min-w-0 border-b border-border p-4 odd:border-r [&:nth-last-child(-n+2)]:border-b-0 xl:border-b-0 xl:border-r xl:last:border-r-0",children:[n.jsx("dt",{className:"font-mono text-[10px] uppercase text-dim",children:s.label}),n.jsx("dd",{className:"mt-1 text-lg font-semibold tabular-nums text-foreground",children:s.value}),n.jsx("p",{className:"mt-1 truncate text-xs text-muted-foreground",title:s.detail,children:s.detail})]},s.label))})}function Ho({provider:e,actionLabel:t="Set up"}){return n.jsxs("div",{className:"grid gap-3 px-4 py-3 sm:grid-cols-[minmax(0,1fr)_auto] sm:items-center","data-pool-provider-row":e.id,children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx("span",{className:"flex h-9 w-9 shrink-0 items-center justify-center rounded-md border border-border bg-muted/25 text-primary",children:n.jsx(Ul,{"aria-hidden":"true",className:"h-4 w-4"})}),n.jsxs("div",{className:"min-w-0",children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx("h3",{className:"font-mono text-sm font-semibold",children:e.name}),n.jsx(fe,{label:e.status.health.state,tone:Yg(e.status.health.state)})]}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:e.status.health.message})]})]}),n.jsxs(Ee,{className:q(Ye({size:"sm",variant:"outline"}),"gap-2"),to:Ix(e.id),children:[n.jsx(_s,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),t]})]})}function W_({provider:e,canAdmin:t,detail:r,onRefresh:s}){const a=Jg({providers:[{...e,renderer:{id:e.rendererId,mode:e.rendererMode}}]}).pools,i=eu(e.id),l=e.id==="mergerfs"&&r!==null;return n.jsxs("div",{className:"space-y-5","data-pool-provider-details":e.id,children:[n.jsxs(Ee,{className:q(Ye({size:"sm",variant:"ghost"}),"gap-2 px-0 hover:bg-transparent"),to:ve.pools,children:[n.jsx(vs,{"aria-hidden":"true",className:"h-4 w-4"}),"Back to pools"]}),n.jsx(pt,{actions:t&&!l?n.jsxs(Ee,{className:q(Ye({variant:"secondary"}),"gap-2"),to:i,children:[n.jsx(_s,{"aria-hidden":"true",className:"h-4 w-4"}),"Configure provider"]}):void 0,description:r?.description||"Storage pooling provider",status:n.jsx(fe,{label:e.status.health.state,tone:Yg(e.status.health.state)}),title:e.name}),l?n.jsx(O_,{canConfigure:t,detail:r,onRefresh:s,pools:a,status:e.status}):n.jsxs(n.Fragment,{children:[n.jsx(Qg,{status:e.status}),a.length?n.jsxs("section",{"aria-labelledby":"provider-pools-title",children:[n.jsx("h2",{className:"mb-3 font-mono text-sm font-semibold",id:"provider-pools-title",children:"Configured pools"}),n.jsx("div",{className:"grid gap-3 sm:grid-cols-2 xl:grid-cols-3",children:a.map(o=>n.jsx(vu,{pool:o},o.id))})]}):null,e.status.lifecycle.configured?null:n.jsxs("div",{className:"border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm",children:[n.jsx("p",{className:"font-medium text-warning",children:"Provider setup is required"}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:"Configure this provider before it can create operational pool cards."})]})]})]})}function Qp(){const{providerId:e}=Zd(),{permissions:t}=Ln(),r=t.includes("extensions.admin"),[s,a]=d.useState("loading"),[i,l]=d.useState({id:"storage.pooling",surface:"pools",providers:[]}),[o,c]=d.useState({}),[u,h]=d.useState(""),[m,f]=d.useState(""),[w,j]=d.useState("Never"),y=d.useCallback(async(p=!1)=>{p||a("loading");const[x,g]=await Promise.allSettled([Eg("storage.pooling"),Ql()]),N=g.status==="fulfilled"?g.value:[],E=[];if(N.find($=>$.id==="mergerfs"&&$.installed)){const $=await Tg("mergerfs").catch(()=>null);E.push(["mergerfs",$])}const k=new Date().toISOString(),O=F_(N,Object.fromEntries(E),k);if(x.status==="rejected"&&g.status==="rejected"){if(p){f("Refresh failed; showing the last successful provider state.");return}h(q_(x.reason)),a("error");return}const S=x.status==="fulfilled"?V_(x.value,O):O;l(S),c(Object.fromEntries(E)),f(x.status==="rejected"&&O.providers.length?"Capability registry unavailable; showing compatibility data from the existing MergerFS provider.":""),h(""),j(Bt(new Date)),a("ready")},[]);d.useEffect(()=>{y(!1)},[y]);const b=d.useMemo(()=>Jg(i),[i]),v=e?[...b.enabledProviders,...b.availableProviders].find(p=>p.id===e):null;return e&&s==="ready"&&v?n.jsx(W_,{canAdmin:r,detail:o[v.id]??null,onRefresh:()=>y(!0),provider:v}):e&&s==="ready"&&!v?n.jsxs("section",{className:"space-y-5",children:[n.jsxs(Ee,{className:q(Ye({size:"sm",variant:"ghost"}),"gap-2 px-0"),to:ve.pools,children:[n.jsx(vs,{"aria-hidden":"true",className:"h-4 w-4"}),"Back to pools"]}),n.jsxs("div",{className:"flex min-h-64 flex-col items-center justify-center rounded-md border border-dashed border-border px-5 text-center",children:[n.jsx(za,{"aria-hidden":"true",className:"h-7 w-7 text-warning"}),n.jsx("h1",{className:"mt-3 font-mono text-base font-semibold",children:"Pooling provider not found"}),n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:"The provider may be disabled, removed, or incompatible."})]})]}):n.jsxs("section",{className:"space-y-5 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(n.Fragment,{children:[r?n.jsxs(Ee,{className:q(Ye({variant:"secondary"}),"gap-2"),to:ve.extensions,children:[n.jsx(ot,{"aria-hidden":"true",className:"h-4 w-4"}),"Add provider"]}):null,n.jsxs(_,{className:"gap-2",disabled:s==="loading",onClick:()=>void y(!1),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",s==="loading"&&"animate-spin")}),"refresh"]})]}),description:`${b.summary.totalPools} pools · synced ${w}`,status:s==="ready"?n.jsx(fe,{label:b.summary.warnings?`${b.summary.warnings} warning${b.summary.warnings===1?"":"s"}`:"pooling ready",tone:b.summary.warnings?"warning":"success"}):void 0,title:"storage_pools"}),s==="loading"?n.jsxs("div",{"aria-live":"polite",className:"flex min-h-56 items-center justify-center gap-2 rounded-md border border-border text-sm text-muted-foreground",role:"status",children:[n.jsx(je,{"aria-hidden":"true",className:"h-4 w-4 animate-spin text-primary"}),"Loading pooling providers..."]}):null,s==="error"?n.jsxs("div",{"aria-live":"assertive",className:"border-l-2 border-danger bg-danger/5 px-4 py-4 text-sm text-danger",role:"alert",children:[n.jsxs("div",{className:"flex items-center gap-2 font-medium",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Pools are unavailable"]}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:u}),n.jsx(_,{className:"mt-3",onClick:()=>void y(!1),size:"sm",variant:"outline",children:"Retry"})]}):null,s==="ready"?n.jsx(H_,{view:b}):null,m?n.jsx("div",{className:"border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm text-muted-foreground","data-pool-compatibility-warning":!0,children:m}):null,s==="ready"&&!b.enabledProviders.length?n.jsxs("div",{className:"flex min-h-56 flex-col items-center justify-center rounded-md border border-dashed border-border px-5 text-center","data-pools-empty":!0,children:[n.jsx(ul,{"aria-hidden":"true",className:"h-7 w-7 text-dim"}),n.jsx("h2",{className:"mt-3 font-mono text-sm font-semibold",children:"No pooling provider is enabled"}),n.jsx("p",{className:"mt-1 max-w-lg text-sm text-muted-foreground",children:"Enable a storage pooling provider to combine mounted disks into managed pools."}),r?n.jsxs(Ee,{className:q(Ye({size:"sm"}),"mt-4 gap-2"),to:ve.extensions,children:[n.jsx(ot,{"aria-hidden":"true",className:"h-4 w-4"}),"Add provider"]}):null]}):null,s==="ready"&&b.pools.length?n.jsxs("section",{"aria-labelledby":"configured-pools-title",children:[n.jsxs("div",{className:"mb-3 flex items-center justify-between",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"configured-pools-title",children:"Configured pools"}),n.jsxs("span",{className:"text-xs text-dim",children:[b.summary.mountedPools,"/",b.summary.totalPools," mounted"]})]}),n.jsx("div",{className:"grid gap-3 sm:grid-cols-2 xl:grid-cols-3",children:b.pools.map(p=>n.jsx(vu,{pool:p},p.id))})]}):null,s==="ready"&&b.setupProviders.length?n.jsxs("section",{"aria-labelledby":"pool-setup-title",className:"overflow-hidden rounded-md border border-border bg-card",children:[n.jsxs("div",{className:"border-b border-border px-4 py-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"pool-setup-title",children:"Setup required"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Enabled providers appear here until their first pool is configured."})]}),n.jsx("div",{className:"divide-y divide-border",children:b.setupProviders.map(p=>n.jsx(Ho,{provider:p},p.id))})]}):null,s==="ready"&&b.configuredProviders.filter(p=>!b.pools.some(x=>x.providerId===p.id)).length?n.jsxs("section",{"aria-labelledby":"pool-provider-status-title",className:"overflow-hidden rounded-md border border-border bg-card",children:[n.jsxs("div",{className:"border-b border-border px-4 py-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"pool-provider-status-title",children:"Provider status"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Configured providers that do not currently report individual pools."})]}),n.jsx("div",{className:"divide-y divide-border",children:b.configuredProviders.filter(p=>!b.pools.some(x=>x.providerId===p.id)).map(p=>n.jsx(Ho,{actionLabel:"View",provider:p},p.id))})]}):null,s==="ready"&&b.availableProviders.length?n.jsxs("section",{"aria-labelledby":"available-pool-providers-title",className:"overflow-hidden rounded-md border border-border bg-card",children:[n.jsxs("div",{className:"border-b border-border px-4 py-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"available-pool-providers-title",children:"Available providers"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Installed pooling providers that are currently disabled."})]}),n.jsx("div",{className:"divide-y divide-border",children:b.availableProviders.map(p=>n.jsx(Ho,{actionLabel:"Review",provider:p},p.id))})]}):null]})}function G_(e){return e==="healthy"?"success":e==="warning"||e==="unconfigured"?"warning":["error","unavailable","incompatible"].includes(e)?"danger":"neutral"}function Jp(e){if(!e)return"Not reported";const t=new Date(e);return Number.isNaN(t.getTime())?e:t.toLocaleString([],{dateStyle:"medium",timeStyle:"short"})}function yu({protectionSet:e}){const t=e.health==="error"?"danger":"warning";return n.jsxs("article",{className:q("overflow-hidden rounded-md border bg-card",e.requiredAction?t==="danger"?"border-danger/45":"border-warning/45":"border-border"),"data-protection-set":e.name,children:[n.jsxs("div",{className:"flex items-start justify-between gap-3 px-4 py-3",children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-2.5",children:[n.jsx(jt,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0 text-primary"}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("h2",{className:"truncate font-mono text-sm font-semibold",children:e.name}),n.jsx("p",{className:"mt-0.5 text-xs capitalize text-muted-foreground",children:e.kind})]})]}),n.jsx(fe,{className:"shrink-0",label:e.health,tone:G_(e.health)})]}),n.jsx("dl",{className:"grid grid-cols-3 border-y border-border",children:[{label:"Protected",value:e.protectedTargets},{label:"Unprotected",value:e.unprotectedTargets},{label:"Parity / copies",value:e.parityTargets}].map(r=>n.jsxs("div",{className:"min-w-0 border-r border-border px-3 py-2.5 last:border-r-0",children:[n.jsx("dt",{className:"font-mono text-[9px] uppercase text-dim",children:r.label}),n.jsx("dd",{className:"mt-1 text-sm font-semibold tabular-nums",children:r.value??"—"})]},r.label))}),n.jsxs("div",{className:"space-y-2 px-4 py-3 text-xs text-muted-foreground",children:[n.jsxs("p",{className:"flex items-start gap-2",children:[n.jsx(Bx,{"aria-hidden":"true",className:"mt-0.5 h-3.5 w-3.5 shrink-0"}),n.jsxs("span",{children:[n.jsx("span",{className:"text-dim",children:"Last run"}),n.jsx("br",{}),Jp(e.lastRunAt)]})]}),n.jsxs("p",{className:"flex items-start gap-2",children:[n.jsx(Gc,{"aria-hidden":"true",className:"mt-0.5 h-3.5 w-3.5 shrink-0"}),n.jsxs("span",{children:[n.jsx("span",{className:"text-dim",children:"Next run"}),n.jsx("br",{}),e.nextRunAt?Jp(e.nextRunAt):e.schedule??"Not scheduled"]})]})]}),e.requiredAction?n.jsx("div",{className:q("border-t px-4 py-2.5 text-xs font-medium",t==="danger"?"border-danger/30 bg-danger/10 text-danger":"border-warning/30 bg-warning/10 text-warning"),"data-protection-action":!0,children:e.requiredAction}):null,n.jsxs("div",{className:"flex items-center justify-between gap-3 border-t border-border px-4 py-3",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"font-mono text-[9px] uppercase text-dim",children:"Provider"}),n.jsx("p",{className:"truncate text-xs text-muted-foreground",children:e.providerName})]}),n.jsxs(Ee,{"aria-label":`Manage ${e.name}`,className:q(Ye({size:"sm",variant:"outline"}),"shrink-0 gap-1.5"),to:Lx(e.providerId),children:[n.jsx(_s,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Manage"]})]})]})}const Yp=[{label:"Daily 03:00",cron:"0 3 * * *"},{label:"Daily 04:00",cron:"0 4 * * *"},{label:"Weekly Sun 04:00",cron:"0 4 * * 0"}];function Xp({label:e,enabled:t,cron:r,onEnabled:s,onCron:a,testid:i}){const l=Yp.some(o=>o.cron===r)?r:"custom";return n.jsxs("div",{className:"space-y-1.5","data-schedule-row":i,children:[n.jsxs("label",{className:"flex items-center gap-2 text-sm",children:[n.jsx("input",{checked:t,"data-schedule-enabled":i,onChange:o=>s(o.target.checked),type:"checkbox"}),e]}),t?n.jsxs("div",{className:"flex flex-wrap items-center gap-2 pl-6",children:[n.jsxs("select",{"aria-label":`${e} schedule`,className:"h-8 rounded-md border border-input bg-background px-2 text-xs","data-schedule-preset":i,onChange:o=>{o.target.value!=="custom"&&a(o.target.value)},value:l,children:[Yp.map(o=>n.jsx("option",{value:o.cron,children:o.label},o.cron)),n.jsx("option",{value:"custom",children:"Custom cron"})]}),n.jsx("input",{"aria-label":`${e} cron expression`,className:"h-8 flex-1 rounded-md border border-input bg-background px-2 font-mono text-xs","data-schedule-cron":i,onChange:o=>a(o.target.value),placeholder:"0 3 * * *",value:r})]}):null]})}function K_({value:e,onChange:t}){return n.jsxs("div",{className:"space-y-3","data-snapraid-schedule":!0,children:[n.jsx("p",{className:"font-mono text-xs uppercase text-muted-foreground",children:"Schedule"}),n.jsx(Xp,{cron:e.sync_cron,enabled:e.sync_enabled,label:"Automatic sync",onCron:r=>t({...e,sync_cron:r}),onEnabled:r=>t({...e,sync_enabled:r}),testid:"sync"}),n.jsx(Xp,{cron:e.scrub_cron,enabled:e.scrub_enabled,label:"Automatic scrub",onCron:r=>t({...e,scrub_cron:r}),onEnabled:r=>t({...e,scrub_enabled:r}),testid:"scrub"}),n.jsx("p",{className:"text-[0.7rem] text-muted-foreground",children:"Save then Apply to (re)create the systemd timers."})]})}function Q_(e){if(!e)return null;const t=/([\d.]+)\s*([KMGTP])?i?B?/i.exec(e.trim());if(!t)return null;const r=Number(t[1]);if(!Number.isFinite(r))return null;const s=(t[2]??"G").toUpperCase(),a={K:1/1e6,M:1/1e3,G:1,T:1e3,P:1e6};return r*(a[s]??1)}function Zp(e){const t=e.split("/").filter(Boolean);return t[t.length-1]??e}function J_({pluginId:e,config:t,onSaved:r}){const[s,a]=d.useState(null),[i,l]=d.useState(null),[o,c]=d.useState({}),[u,h]=d.useState(""),[m,f]=d.useState(""),[w,j]=d.useState({sync_enabled:!1,sync_cron:"0 3 * * *",scrub_enabled:!1,scrub_cron:"0 4 * * 0"}),[y,b]=d.useState(null),[v,p]=d.useState(""),[x,g]=d.useState([]),[N,E]=d.useState(null),[C,k]=d.useState(!1),[O,S]=d.useState(!1);d.useEffect(()=>{let P=!0;const M=t.scrub??{};h(M.percent!=null?String(M.percent):""),f(M.age_days!=null?String(M.age_days):"");const A=t.schedule??{};j({sync_enabled:A.sync_enabled===!0,sync_cron:String(A.sync_cron??"0 3 * * *"),scrub_enabled:A.scrub_enabled===!0,scrub_cron:String(A.scrub_cron??"0 4 * * 0")});const F={};for(const D of t.drives??[]){const G=String(D.path??"");G&&(F[G]={role:D.role??"data",content:!!D.content})}return c(F),S(!1),b(null),g([]),pu().then(D=>{if(!P)return;const G=new Set,se=[];for(const ue of D.disks){const Ce=[ue,...ue.partitions];for(const Re of Ce){const pe=Re.mountpoint??"";!pe.startsWith("/mnt/")||G.has(pe)||(G.add(pe),se.push({path:pe,uuid:Re.uuid??"",name:Zp(pe),sizeLabel:Re.size,sizeGb:Q_(Re.size)}))}}const de=new Set(se.map(ue=>ue.path));for(const ue of t.drives??[]){const Ce=String(ue.path??"");Ce&&!de.has(Ce)&&se.push({path:Ce,uuid:String(ue.uuid??""),name:String(ue.name??Zp(Ce)),sizeLabel:null,sizeGb:null,missing:!0})}a(se)}).catch(D=>{P&&l(D instanceof Error?D.message:"Failed to load disks")}),()=>{P=!1}},[t]);const $=(P,M)=>{S(!0),b(null),E(null),c(A=>{const F=A[P]??{role:"none",content:!1};return{...A,[P]:{...F,...M}}})},R=d.useMemo(()=>s?s.map(P=>({candidate:P,assignment:o[P.path]})).filter(P=>P.assignment&&P.assignment.role!=="none"):[],[s,o]),H=d.useMemo(()=>{const P=[],M=R.filter(G=>G.assignment.role==="data"),A=R.filter(G=>G.assignment.role==="parity");A.length<1&&P.push("Add at least one parity drive."),M.length<1&&P.push("Add at least one data drive.");const F=Math.max(0,...M.map(G=>G.candidate.sizeGb??0)),D=Math.min(1/0,...A.map(G=>G.candidate.sizeGb??1/0));return A.length&&M.length&&D<F&&P.push("A parity drive is smaller than the largest data drive; parity must be at least as large."),R.filter(G=>G.assignment.content).length<2&&P.push("Store content files on at least two drives (recommended)."),P},[R]),I=()=>{let P=0;const M=R.map(F=>{const D={id:F.candidate.name,name:F.candidate.name,path:F.candidate.path,uuid:F.candidate.uuid,role:F.assignment.role,content:F.assignment.content};return F.assignment.role==="parity"?(P+=1,{...D,parity_level:P}):D}),A={...t.scrub??{}};return u.trim()!==""&&(A.percent=Number(u)),m.trim()!==""&&(A.age_days=Number(m)),{...t,enabled:!0,drives:M,scrub:A,schedule:w}},U=async()=>{p("preview"),g([]);try{b(await Lg(e,I()))}catch(P){g([P instanceof Error?P.message:"Preview failed"])}finally{p("")}},L=async()=>{p("save"),g([]),E(null);const P=await $g(e,I());p(""),P.ok?(S(!1),E("Saved. Apply to write the SnapRAID config."),r()):g(P.details.length?P.details:[P.error??"Save failed"])},B=async()=>{k(!1),p("apply"),g([]),E(null);const P=await Ig(e);p(""),P.ok?(E(P.message??"Applied."),r()):g([P.error??"Apply failed"])};return i?n.jsxs("p",{className:"text-sm text-danger",children:["Could not load disks: ",i]}):s?n.jsxs("div",{className:"space-y-4","data-snapraid-editor":!0,children:[n.jsxs("div",{className:"space-y-2",children:[n.jsx("p",{className:"font-mono text-xs uppercase text-muted-foreground",children:"Drives"}),s.length?n.jsx("ul",{className:"space-y-2",children:s.map(P=>{const M=o[P.path]??{role:"none",content:!1};return n.jsxs("li",{className:`flex flex-wrap items-center gap-2 rounded-md border p-2 text-sm ${P.missing?"border-warning/40 bg-warning/5":"border-border/70"}`,"data-drive":P.path,"data-drive-missing":P.missing?"true":void 0,children:[n.jsx(Vl,{"aria-hidden":"true",className:"h-4 w-4 shrink-0 text-muted-foreground"}),n.jsxs("span",{className:"min-w-0 flex-1 truncate",children:[P.path,P.missing?n.jsx("span",{className:"ml-2 text-xs font-medium text-warning",children:"missing (not mounted)"}):n.jsx("span",{className:"ml-2 text-xs text-muted-foreground",children:P.sizeLabel??""})]}),n.jsxs("select",{"aria-label":`Role for ${P.path}`,className:"h-8 rounded-md border border-input bg-background px-2 text-xs","data-drive-role":P.path,onChange:A=>$(P.path,{role:A.target.value}),value:M.role,children:[n.jsx("option",{value:"none",children:"Unassigned"}),n.jsx("option",{value:"data",children:"Data"}),n.jsx("option",{value:"parity",children:"Parity"})]}),n.jsxs("label",{className:"flex items-center gap-1 text-xs text-muted-foreground",children:[n.jsx("input",{checked:M.content,"data-drive-content":P.path,disabled:M.role==="none",onChange:A=>$(P.path,{content:A.target.checked}),type:"checkbox"}),"content"]})]},P.path)})}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No mounted /mnt/* disks found. Mount data and parity disks first."})]}),H.length?n.jsx("ul",{className:"space-y-1","data-snapraid-warnings":!0,children:H.map(P=>n.jsxs("li",{className:"flex items-start gap-1.5 text-xs text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-3.5 w-3.5 shrink-0"}),P]},P))}):null,n.jsxs("div",{className:"grid grid-cols-2 gap-3",children:[n.jsxs("label",{className:"space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:"Scrub percent"}),n.jsx("input",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",max:100,min:0,onChange:P=>{S(!0),b(null),E(null),h(P.target.value)},placeholder:"8",type:"number",value:u})]}),n.jsxs("label",{className:"space-y-1 text-xs",children:[n.jsx("span",{className:"text-muted-foreground",children:"Scrub min age (days)"}),n.jsx("input",{className:"h-9 w-full rounded-md border border-input bg-background px-2 text-sm",min:0,onChange:P=>{S(!0),b(null),E(null),f(P.target.value)},placeholder:"10",type:"number",value:m})]})]}),n.jsx(K_,{onChange:P=>{S(!0),b(null),E(null),j(P)},value:w}),x.length?n.jsx("ul",{className:"space-y-1 rounded-md bg-danger/10 p-2","data-snapraid-errors":!0,children:x.map(P=>n.jsx("li",{className:"text-xs font-medium text-danger",children:P},P))}):null,N?n.jsx("p",{className:"text-xs font-medium text-success",role:"status",children:N}):null,n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsxs(_,{className:"gap-1.5","data-snapraid-preview-open":!0,disabled:v!=="",onClick:()=>void U(),size:"sm",variant:"outline",children:[n.jsx(ru,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Preview"]}),n.jsx(_,{"data-snapraid-save":!0,disabled:v!=="",onClick:()=>void L(),size:"sm",children:v==="save"?"Saving...":"Save"}),n.jsx(_,{"data-snapraid-apply":!0,disabled:v!==""||O,onClick:()=>k(!0),size:"sm",variant:"secondary",children:v==="apply"?"Applying...":"Apply"}),O?n.jsx("span",{className:"text-xs text-warning",children:"Save changes before applying."}):null]}),C?n.jsxs("div",{className:"space-y-2 rounded-md border border-warning/40 bg-warning/10 p-3 text-xs","data-snapraid-apply-confirm":!0,children:[n.jsxs("p",{className:"flex items-center gap-1.5 font-medium text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Apply writes /etc/snapraid.conf from the saved config. Save first if you have unsaved changes. Continue?"]}),n.jsxs("div",{className:"flex gap-2",children:[n.jsx(_,{"data-snapraid-apply-confirm-yes":!0,onClick:()=>void B(),size:"sm",variant:"danger",children:"Apply"}),n.jsx(_,{onClick:()=>k(!1),size:"sm",variant:"outline",children:"Cancel"})]})]}):null,y!==null?n.jsxs("div",{className:"space-y-1","data-snapraid-preview":!0,children:[n.jsx("p",{className:"font-mono text-xs uppercase text-muted-foreground",children:"snapraid.conf preview"}),n.jsx("pre",{className:"max-h-[24vh] overflow-auto whitespace-pre-wrap break-words rounded-md border border-border/70 bg-muted/20 p-3 text-xs",children:y||"(empty)"})]}):null]}):n.jsxs("p",{className:"flex items-center gap-2 text-sm text-muted-foreground",children:[n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"})," Loading disks..."]})}function ef(e,t){return e instanceof Error&&e.message?e.message:t}function Y_(e){return e&&typeof e=="object"&&!Array.isArray(e)?e:{}}function X_({data:e}){if(!e)return n.jsx("p",{className:"text-sm text-muted-foreground",children:"Recovery status is not available."});const t=Array.isArray(e.failed_drives)?e.failed_drives.map(a=>String(a)):[],r=Array.isArray(e.recovery_options)?e.recovery_options.map(a=>Y_(a)):[],s=e.error!=null?String(e.error):"";return n.jsxs("div",{className:"space-y-4","data-snapraid-recovery-status":!0,children:[s?n.jsxs("p",{className:"flex items-start gap-2 border-l-2 border-danger bg-danger/5 px-3 py-2.5 text-sm text-danger",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),s]}):null,n.jsx("dl",{className:"grid grid-cols-3 overflow-hidden rounded-md border border-border",children:[{label:"Recoverable",value:e.recoverable===!0?"Yes":e.recoverable===!1?"No":"Unknown"},{label:"Missing files",value:String(e.missing_files??0)},{label:"Damaged files",value:String(e.damaged_files??0)}].map(a=>n.jsxs("div",{className:"border-r border-border p-3 last:border-r-0",children:[n.jsx("dt",{className:"font-mono text-[9px] uppercase text-dim",children:a.label}),n.jsx("dd",{className:"mt-1 text-sm font-semibold tabular-nums",children:a.value})]},a.label))}),t.length?n.jsxs("section",{"aria-labelledby":"snapraid-failed-drives",children:[n.jsxs("h3",{className:"flex items-center gap-2 font-mono text-xs font-semibold",id:"snapraid-failed-drives",children:[n.jsx(Vl,{"aria-hidden":"true",className:"h-3.5 w-3.5 text-danger"}),"Failed drives"]}),n.jsx("ul",{className:"mt-2 divide-y divide-border rounded-md border border-border",children:t.map(a=>n.jsx("li",{className:"px-3 py-2 font-mono text-xs",children:a},a))})]}):null,r.length?n.jsxs("section",{"aria-labelledby":"snapraid-recovery-options",children:[n.jsx("h3",{className:"font-mono text-xs font-semibold",id:"snapraid-recovery-options",children:"Recovery options"}),n.jsx("ul",{className:"mt-2 divide-y divide-border rounded-md border border-border",children:r.map((a,i)=>n.jsxs("li",{className:"px-3 py-2 text-xs",children:[n.jsx("p",{className:"font-medium",children:String(a.name??a.id??"Recovery option")}),n.jsx("p",{className:"mt-0.5 font-mono text-[10px] text-muted-foreground",children:String(a.command??"fix")})]},String(a.id??i)))})]}):null]})}function Z_({detail:e,status:t,protectionSets:r,canConfigure:s,onRefresh:a}){const[i,l]=d.useState(t.lifecycle.configured?"overview":s?"configuration":"overview"),[o,c]=d.useState("idle"),[u,h]=d.useState(null),[m,f]=d.useState(""),[w,j]=d.useState("idle"),[y,b]=d.useState(null),[v,p]=d.useState(""),x=e.commands.filter(O=>["sync","scrub"].includes(O.id)).map(O=>O.id==="sync"?{...O,dangerous:!0}:O),g=e.commands.filter(O=>["status","diff","check"].includes(O.id)),N=e.commands.filter(O=>O.id==="fix"),E=[{id:"overview",label:"Overview"},...s?[{id:"configuration",label:"Configuration"}]:[],...s&&x.length?[{id:"operations",label:"Operations"}]:[],{id:"recovery",label:"Recovery"},{id:"diagnostics",label:"Diagnostics"}],C=d.useCallback(async()=>{c("loading"),f("");try{const O=await v2("snapraid");h(O.supported?O.data:null),c("ready")}catch(O){f(ef(O,"Unable to load recovery status")),c("error")}},[]),k=d.useCallback(async()=>{j("loading"),p("");try{b(await zg("snapraid")),j("ready")}catch(O){p(ef(O,"Unable to load the latest SnapRAID log")),j("error")}},[]);return d.useEffect(()=>{i==="recovery"&&o==="idle"&&C(),i==="diagnostics"&&w==="idle"&&k()},[k,C,w,o,i]),n.jsxs("div",{className:"space-y-5","data-capability-renderer":"snapraid",children:[n.jsx("div",{className:"flex gap-1 overflow-x-auto border-b border-border",role:"tablist","aria-label":"SnapRAID provider views",children:E.map(O=>n.jsx("button",{"aria-controls":`snapraid-panel-${O.id}`,"aria-selected":i===O.id,className:q("min-h-11 shrink-0 border-b-2 px-3 font-mono text-xs transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring",i===O.id?"border-primary text-primary":"border-transparent text-muted-foreground hover:text-foreground"),"data-snapraid-tab":O.id,id:`snapraid-tab-${O.id}`,onClick:()=>l(O.id),onKeyDown:Yl,role:"tab",tabIndex:i===O.id?0:-1,type:"button",children:O.label},O.id))}),i==="overview"?n.jsxs("div",{"aria-labelledby":"snapraid-tab-overview",className:"space-y-5",id:"snapraid-panel-overview",role:"tabpanel",children:[n.jsx(gu,{status:t}),r.length?n.jsxs("section",{"aria-labelledby":"snapraid-protection-title",children:[n.jsx("h2",{className:"mb-3 font-mono text-sm font-semibold",id:"snapraid-protection-title",children:"Protection sets"}),n.jsx("div",{className:"grid gap-3 md:grid-cols-2 xl:grid-cols-3",children:r.map(O=>n.jsx(yu,{protectionSet:O},O.id))})]}):n.jsxs("div",{className:"border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm",children:[n.jsx("p",{className:"font-medium text-warning",children:"No protection set configured"}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:s?"Open Configuration to assign data and parity drives.":"An administrator must configure SnapRAID."})]})]}):null,i==="configuration"&&s?n.jsxs("section",{"aria-labelledby":"snapraid-tab-configuration",className:"space-y-4",id:"snapraid-panel-configuration",role:"tabpanel",children:[n.jsxs("div",{children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"Drive assignments and schedule"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Assign mounted disks, set scrub policy and schedules, preview snapraid.conf, then save and apply."})]}),n.jsx(J_,{config:e.config,onSaved:a,pluginId:"snapraid"})]}):null,i==="operations"&&s?n.jsxs("section",{"aria-labelledby":"snapraid-tab-operations",className:"space-y-4",id:"snapraid-panel-operations",role:"tabpanel",children:[n.jsxs("div",{children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"Parity operations"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Sync updates parity. Scrub verifies a bounded percentage of protected data."})]}),n.jsx(ua,{commands:x,heading:"Run operation",onCompleted:a,pluginId:"snapraid",poolNames:[]})]}):null,i==="recovery"?n.jsxs("section",{"aria-labelledby":"snapraid-tab-recovery",className:"space-y-5",id:"snapraid-panel-recovery",role:"tabpanel",children:[n.jsxs("div",{className:"flex items-center justify-between gap-3",children:[n.jsxs("div",{children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",children:"Recovery status"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Review array damage before running a parity fix."})]}),n.jsx(_,{"aria-label":"Reload recovery status",disabled:o==="loading",onClick:()=>void C(),size:"icon",title:"Reload recovery status",variant:"ghost",children:n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",o==="loading"&&"animate-spin")})})]}),o==="loading"?n.jsx("p",{className:"text-sm text-muted-foreground",children:"Loading recovery status…"}):null,o==="error"?n.jsxs("p",{className:"flex items-start gap-2 text-sm text-danger",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),m]}):null,o==="ready"?n.jsx(X_,{data:u}):null,s&&N.length?n.jsx("div",{className:"border-t border-border pt-5",children:n.jsx(ua,{commands:N,heading:"Recovery operation",onCompleted:a,pluginId:"snapraid",poolNames:[]})}):null]}):null,i==="diagnostics"?n.jsxs("section",{"aria-labelledby":"snapraid-tab-diagnostics",className:"space-y-5",id:"snapraid-panel-diagnostics",role:"tabpanel",children:[g.length?n.jsx(ua,{commands:g,heading:"Live diagnostics",onCompleted:a,pluginId:"snapraid",poolNames:[]}):null,n.jsxs("section",{"aria-labelledby":"snapraid-log-title",className:"overflow-hidden rounded-md border border-border",children:[n.jsxs("div",{className:"flex items-center justify-between gap-3 border-b border-border bg-muted/20 px-3 py-2",children:[n.jsxs("h2",{className:"flex items-center gap-2 font-mono text-xs font-semibold",id:"snapraid-log-title",children:[n.jsx(Bl,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Latest operation log"]}),n.jsx(_,{"aria-label":"Reload SnapRAID log",disabled:w==="loading",onClick:()=>void k(),size:"icon",title:"Reload SnapRAID log",variant:"ghost",children:n.jsx(je,{"aria-hidden":"true",className:q("h-3.5 w-3.5",w==="loading"&&"animate-spin")})})]}),w==="error"?n.jsxs("p",{className:"flex items-center gap-2 p-3 text-xs text-danger",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),v]}):null,w==="ready"?n.jsx("pre",{className:"max-h-72 overflow-auto whitespace-pre-wrap break-words p-3 text-xs text-muted-foreground","data-snapraid-log":!0,children:y||"No operation log is available."}):null,w==="loading"?n.jsx("p",{className:"p-3 text-xs text-muted-foreground",children:"Loading operation log…"}):null]})]}):null]})}function sr(e){return e&&typeof e=="object"&&!Array.isArray(e)?e:{}}function ma(e){if(e==null||e==="")return null;const t=Number(e);return Number.isFinite(t)?t:null}function Js(e){return e==null||e===""?null:String(e)}function eC(e,t){return t?["ok","active","healthy","protected","ready"].includes(e)?"healthy":["warning","degraded","sync_required"].includes(e)?"warning":["error","failed"].includes(e)?"error":e==="disabled"?"disabled":"unknown":"unconfigured"}function tC(e){const t=sr(e.status);if(!e.id||t.schema_version!=="1"||t.capability_id!=="storage.protection")return null;const r=sr(e.renderer);return{id:String(e.id),name:String(e.name??e.id),enabled:!!(e.enabled??t.lifecycle.enabled),operational:!!e.operational,status:t,rendererId:String(r.id??"generic"),rendererMode:r.mode==="tailored"?"tailored":"generic",source:e.source==="legacy"?"legacy":"registry"}}function nC(e){const t=e.status.details.protection_sets;return Array.isArray(t)?t.map((r,s)=>{const a=sr(r),i=String(a.health??e.status.health.state),l=["healthy","warning","error","unknown","disabled","unconfigured","incompatible","unavailable"].includes(i)?i:"unknown",o=String(a.name??`protection-${s+1}`);return{id:`${e.id}:${o}`,name:o,providerId:e.id,providerName:e.name,kind:String(a.kind??a.type??"protection"),health:l,protectedTargets:ma(a.protected_targets??a.protected_disks??a.data_drives),unprotectedTargets:ma(a.unprotected_targets??a.unprotected_disks),parityTargets:ma(a.parity_targets??a.parity_drives??a.copies),lastRunAt:Js(a.last_success_at??a.last_run_at??a.last_sync??a.last_check),nextRunAt:Js(a.next_run_at??a.next_scheduled_at),schedule:Js(a.schedule),requiredAction:a.sync_required===!0?"Sync required":Js(a.required_action)}}):[]}function rC(e){return e.filter(r=>r!==null&&!Number.isNaN(Date.parse(r))).sort((r,s)=>Date.parse(s)-Date.parse(r))[0]??null}function sC(e){return e.filter(r=>r!==null&&!Number.isNaN(Date.parse(r))).sort((r,s)=>Date.parse(r)-Date.parse(s))[0]??null}function Xg(e){const t=e.providers.map(m=>tC(m)).filter(m=>m!==null).sort((m,f)=>m.name.localeCompare(f.name)),r=t.filter(m=>m.enabled),s=t.filter(m=>!m.enabled),a=r.filter(m=>!m.status.lifecycle.configured),i=r.filter(m=>m.status.lifecycle.configured),l=i.flatMap(m=>nC(m)).sort((m,f)=>m.name.localeCompare(f.name)),o=l.map(m=>m.protectedTargets),c=l.map(m=>m.unprotectedTargets),u=r.filter(m=>["warning","error","unavailable","incompatible"].includes(m.status.health.state)).length,h=l.filter(m=>m.requiredAction!==null||["warning","error","unavailable"].includes(m.health)).length;return{enabledProviders:r,availableProviders:s,setupProviders:a,configuredProviders:i,protectionSets:l,summary:{totalSets:l.length,protectedTargets:o.length&&o.every(m=>m!==null)?o.reduce((m,f)=>m+(f??0),0):null,unprotectedTargets:c.length&&c.every(m=>m!==null)?c.reduce((m,f)=>m+(f??0),0):null,warnings:Math.max(u,h),latestRunAt:rC(l.map(m=>m.lastRunAt)),nextRunAt:sC(l.map(m=>m.nextRunAt))}}}function aC(e,t,r){const s=e.find(y=>y.id==="snapraid"&&y.installed);if(!s)return{id:"storage.protection",surface:"protection",providers:[]};const a=t.snapraid,i=sr(a?.status),l=sr(i.details),o=Array.isArray(a?.config.drives)?a.config.drives:[],c=ma(l.data_drives)??o.filter(y=>y.role==="data").length,u=ma(l.parity_drives)??o.filter(y=>y.role==="parity").length,h=sr(a?.config.schedule),m=h.sync_enabled===!0?String(h.sync_cron??"Scheduled sync"):h.scrub_enabled===!0?String(h.scrub_cron??"Scheduled scrub"):null,f=s.enabled?eC(String(i.status??s.status),s.configured):"disabled",w=s.configured&&a?[{name:"SnapRAID parity",kind:"parity",health:f,protected_targets:c,unprotected_targets:null,parity_targets:u,last_run_at:Js(l.last_run_at),next_run_at:null,schedule:m,sync_required:l.sync_required===!0,required_action:f==="error"?String(i.message??"Review provider error"):null}]:[],j={schema_version:"1",provider_id:s.id,capability_id:"storage.protection",observed_at:r,lifecycle:{installed:s.installed,enabled:s.enabled,configured:s.configured,compatibility:"compatible",availability:a?"available":"unknown"},health:{state:f,message:String(i.message??s.status_message??"Protection status is available through the compatibility adapter."),issues:[]},summary:[],metrics:[],recent_activity:[],details:{...l,protection_sets:w}};return{id:"storage.protection",surface:"protection",providers:[{id:s.id,name:s.name,enabled:s.enabled,operational:s.enabled&&s.configured&&f==="healthy",renderer:{id:"snapraid",mode:"tailored"},status:j,source:"legacy"}]}}function iC(e,t){if(!e.providers.length)return t;const r=new Map(t.providers.map(s=>[s.id,s]));return{...e,providers:e.providers.map(s=>{const a=r.get(s.id);if(!a)return s;const i=sr(s.status),l=sr(a.status);return Array.isArray(i.details?.protection_sets)?s:{...s,status:{...i,details:l.details}}})}}function lC(e){return e instanceof Error&&e.message?e.message:"Unable to load protection providers"}function Zg(e){return e==="healthy"?"success":e==="warning"||e==="unconfigured"?"warning":["error","unavailable","incompatible"].includes(e)?"danger":"neutral"}function tf(e){if(!e)return"Not reported";const t=new Date(e);return Number.isNaN(t.getTime())?e:t.toLocaleString([],{dateStyle:"medium",timeStyle:"short"})}function oC({view:e}){const{summary:t}=e,r=[{label:"Protection sets",value:String(t.totalSets),detail:`${e.enabledProviders.length} enabled provider${e.enabledProviders.length===1?"":"s"}`},{label:"Protected",value:t.protectedTargets===null?"Not reported":String(t.protectedTargets),detail:"Provider-reported targets"},{label:"Unprotected",value:t.unprotectedTargets===null?"Not reported":String(t.unprotectedTargets),detail:"Provider-reported targets"},{label:"Last run",value:tf(t.latestRunAt),detail:"Latest provider activity"},{label:"Next run",value:tf(t.nextRunAt),detail:t.nextRunAt?"Next scheduled activity":"No next run reported"}];return n.jsx("dl",{"aria-label":"Protection summary",className:"grid grid-cols-2 overflow-hidden rounded-md border border-border bg-card lg:grid-cols-5","data-protection-summary":!0,children:r.map(s=>n.jsxs("div",{className:"min-w-0 border-b border-r border-border p-3 last:col-span-2 last:border-r-0 lg:border-b-0 lg:last:col-span-1",children:[n.jsx("dt",{className:"font-mono text-[10px] uppercase text-dim",children:s.label}),n.jsx("dd",{className:"mt-1 break-words text-sm font-semibold tabular-nums text-foreground",children:s.value}),n.jsx("p",{className:"mt-1 truncate text-[11px] text-muted-foreground",title:s.detail,children:s.detail})]},s.label))})}function Wo({provider:e,actionLabel:t="Set up"}){return n.jsxs("div",{className:"grid gap-3 px-4 py-3 sm:grid-cols-[minmax(0,1fr)_auto] sm:items-center","data-protection-provider-row":e.id,children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx("span",{className:"flex h-9 w-9 shrink-0 items-center justify-center rounded-md border border-border bg-muted/25 text-primary",children:n.jsx(jt,{"aria-hidden":"true",className:"h-4 w-4"})}),n.jsxs("div",{className:"min-w-0",children:[n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx("h3",{className:"font-mono text-sm font-semibold",children:e.name}),n.jsx(fe,{label:e.status.health.state,tone:Zg(e.status.health.state)})]}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:e.status.health.message})]})]}),n.jsxs(Ee,{className:q(Ye({size:"sm",variant:"outline"}),"gap-2"),to:Lx(e.id),children:[n.jsx(_s,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),t]})]})}function cC({provider:e,canAdmin:t,detail:r,onRefresh:s}){const a=Xg({providers:[{...e,renderer:{id:e.rendererId,mode:e.rendererMode}}]}).protectionSets,i=eu(e.id),l=e.id==="snapraid"&&r!==null;return n.jsxs("div",{className:"space-y-5","data-protection-provider-details":e.id,children:[n.jsxs(Ee,{className:q(Ye({size:"sm",variant:"ghost"}),"gap-2 px-0 hover:bg-transparent"),to:ve.protection,children:[n.jsx(vs,{"aria-hidden":"true",className:"h-4 w-4"}),"Back to protection"]}),n.jsx(pt,{actions:t&&!l?n.jsxs(Ee,{className:q(Ye({variant:"secondary"}),"gap-2"),to:i,children:[n.jsx(_s,{"aria-hidden":"true",className:"h-4 w-4"}),"Configure provider"]}):void 0,description:r?.description||"Storage protection provider",status:n.jsx(fe,{label:e.status.health.state,tone:Zg(e.status.health.state)}),title:e.name}),l?n.jsx(Z_,{canConfigure:t,detail:r,onRefresh:s,protectionSets:a,status:e.status}):n.jsxs(n.Fragment,{children:[n.jsx(Qg,{status:e.status}),a.length?n.jsxs("section",{"aria-labelledby":"provider-protection-title",children:[n.jsx("h2",{className:"mb-3 font-mono text-sm font-semibold",id:"provider-protection-title",children:"Protection sets"}),n.jsx("div",{className:"grid gap-3 md:grid-cols-2 xl:grid-cols-3",children:a.map(o=>n.jsx(yu,{protectionSet:o},o.id))})]}):null,e.status.lifecycle.configured?null:n.jsxs("div",{className:"border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm",children:[n.jsx("p",{className:"font-medium text-warning",children:"Provider setup is required"}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:"Configure this provider before it can report protected targets."})]})]})]})}function nf(){const{providerId:e}=Zd(),{permissions:t}=Ln(),r=t.includes("extensions.admin"),[s,a]=d.useState("loading"),[i,l]=d.useState({id:"storage.protection",surface:"protection",providers:[]}),[o,c]=d.useState({}),[u,h]=d.useState(""),[m,f]=d.useState(""),[w,j]=d.useState("Never"),y=d.useCallback(async(x=!1)=>{x||a("loading");const[g,N]=await Promise.allSettled([Eg("storage.protection"),Ql()]),E=N.status==="fulfilled"?N.value:[],C=[];let k="";const O=E.find(H=>H.id==="snapraid"&&H.installed);if(O)try{C.push(["snapraid",await Tg("snapraid")])}catch{C.push(["snapraid",null]),k="SnapRAID details could not be refreshed."}const S=aC(E,Object.fromEntries(C),new Date().toISOString());if(g.status==="rejected"&&N.status==="rejected"){if(x){f("Refresh failed; showing the last successful protection state.");return}h(lC(g.reason)),a("error");return}const $=g.status==="fulfilled"?iC(g.value,S):S;l($);const R=Object.fromEntries(C);c(H=>!x||N.status==="fulfilled"&&!O||R.snapraid!==null&&R.snapraid!==void 0?R:H),f(g.status==="rejected"&&S.providers.length?"Capability registry unavailable; showing compatibility data from the existing SnapRAID provider.":k?`${k}${x?" Showing the last successful provider state.":""}`:""),h(""),j(Bt(new Date)),a("ready")},[]);d.useEffect(()=>{y(!1)},[y]);const b=d.useMemo(()=>Xg(i),[i]),v=e?[...b.enabledProviders,...b.availableProviders].find(x=>x.id===e):null;if(e&&s==="ready"&&v)return n.jsx(cC,{canAdmin:r,detail:o[v.id]??null,onRefresh:()=>y(!0),provider:v});if(e&&s==="ready"&&!v)return n.jsxs("section",{className:"space-y-5",children:[n.jsxs(Ee,{className:q(Ye({size:"sm",variant:"ghost"}),"gap-2 px-0"),to:ve.protection,children:[n.jsx(vs,{"aria-hidden":"true",className:"h-4 w-4"}),"Back to protection"]}),n.jsxs("div",{className:"flex min-h-64 flex-col items-center justify-center rounded-md border border-dashed border-border px-5 text-center",children:[n.jsx(za,{"aria-hidden":"true",className:"h-7 w-7 text-warning"}),n.jsx("h1",{className:"mt-3 font-mono text-base font-semibold",children:"Protection provider not found"}),n.jsx("p",{className:"mt-1 text-sm text-muted-foreground",children:"The provider may be disabled, removed, or incompatible."})]})]});const p=b.configuredProviders.filter(x=>!b.protectionSets.some(g=>g.providerId===x.id));return n.jsxs("section",{className:"space-y-5 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(n.Fragment,{children:[r?n.jsxs(Ee,{className:q(Ye({variant:"secondary"}),"gap-2"),to:ve.extensions,children:[n.jsx(ot,{"aria-hidden":"true",className:"h-4 w-4"}),"Add provider"]}):null,n.jsxs(_,{className:"gap-2",disabled:s==="loading",onClick:()=>void y(!1),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",s==="loading"&&"animate-spin")}),"refresh"]})]}),description:`${b.summary.totalSets} protection sets · synced ${w}`,status:s==="ready"?n.jsx(fe,{label:b.summary.warnings?`${b.summary.warnings} warning${b.summary.warnings===1?"":"s"}`:"protection ready",tone:b.summary.warnings?"warning":"success"}):void 0,title:"storage_protection"}),s==="loading"?n.jsxs("div",{"aria-live":"polite",className:"flex min-h-56 items-center justify-center gap-2 rounded-md border border-border text-sm text-muted-foreground",role:"status",children:[n.jsx(je,{"aria-hidden":"true",className:"h-4 w-4 animate-spin text-primary"}),"Loading protection providers..."]}):null,s==="error"?n.jsxs("div",{"aria-live":"assertive",className:"border-l-2 border-danger bg-danger/5 px-4 py-4 text-sm text-danger",role:"alert",children:[n.jsxs("div",{className:"flex items-center gap-2 font-medium",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),"Protection is unavailable"]}),n.jsx("p",{className:"mt-1 text-muted-foreground",children:u}),n.jsx(_,{className:"mt-3",onClick:()=>void y(!1),size:"sm",variant:"outline",children:"Retry"})]}):null,s==="ready"?n.jsx(oC,{view:b}):null,m?n.jsx("div",{className:"border-l-2 border-warning bg-warning/5 px-4 py-3 text-sm text-muted-foreground","data-protection-compatibility-warning":!0,children:m}):null,s==="ready"&&!b.enabledProviders.length?n.jsxs("div",{className:"flex min-h-56 flex-col items-center justify-center rounded-md border border-dashed border-border px-5 text-center","data-protection-empty":!0,children:[n.jsx(jt,{"aria-hidden":"true",className:"h-7 w-7 text-dim"}),n.jsx("h2",{className:"mt-3 font-mono text-sm font-semibold",children:"No protection provider is enabled"}),n.jsx("p",{className:"mt-1 max-w-lg text-sm text-muted-foreground",children:"Enable a protection provider to manage parity, replication, snapshots, or backups."}),r?n.jsxs(Ee,{className:q(Ye({size:"sm"}),"mt-4 gap-2"),to:ve.extensions,children:[n.jsx(ot,{"aria-hidden":"true",className:"h-4 w-4"}),"Add provider"]}):null]}):null,s==="ready"&&b.protectionSets.length?n.jsxs("section",{"aria-labelledby":"protection-sets-title",children:[n.jsxs("div",{className:"mb-3 flex items-center justify-between gap-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"protection-sets-title",children:"Protection sets"}),n.jsxs("span",{className:"text-xs text-dim",children:[b.summary.protectedTargets??"—"," protected"]})]}),n.jsx("div",{className:"grid gap-3 md:grid-cols-2 xl:grid-cols-3",children:b.protectionSets.map(x=>n.jsx(yu,{protectionSet:x},x.id))})]}):null,s==="ready"&&b.setupProviders.length?n.jsxs("section",{"aria-labelledby":"protection-setup-title",className:"overflow-hidden rounded-md border border-border bg-card",children:[n.jsxs("div",{className:"border-b border-border px-4 py-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"protection-setup-title",children:"Setup required"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Enabled providers appear here until their first protection set is configured."})]}),n.jsx("div",{className:"divide-y divide-border",children:b.setupProviders.map(x=>n.jsx(Wo,{provider:x},x.id))})]}):null,s==="ready"&&p.length?n.jsxs("section",{"aria-labelledby":"protection-provider-status-title",className:"overflow-hidden rounded-md border border-border bg-card",children:[n.jsxs("div",{className:"border-b border-border px-4 py-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"protection-provider-status-title",children:"Provider status"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Configured providers that do not currently report protection sets."})]}),n.jsx("div",{className:"divide-y divide-border",children:p.map(x=>n.jsx(Wo,{actionLabel:"View",provider:x},x.id))})]}):null,s==="ready"&&b.availableProviders.length?n.jsxs("section",{"aria-labelledby":"available-protection-providers-title",className:"overflow-hidden rounded-md border border-border bg-card",children:[n.jsxs("div",{className:"border-b border-border px-4 py-3",children:[n.jsx("h2",{className:"font-mono text-sm font-semibold",id:"available-protection-providers-title",children:"Available providers"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Installed protection providers that are currently disabled."})]}),n.jsx("div",{className:"divide-y divide-border",children:b.availableProviders.map(x=>n.jsx(Wo,{actionLabel:"Review",provider:x},x.id))})]}):null]})}async function dC(e){const t=await W("/api/pihealth/update/config",{method:"GET",signal:e});return{repo_path:String(t.repo_path??""),service_name:String(t.service_name??"")}}async function uC(e,t){const r=await W("/api/pihealth/update/config",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e),signal:t});if(r.error)throw new Error(r.error)}async function mC(e,t){const{stream_url:r}=await $n("/api/pihealth/update",{},t);await In(r,e,t)}async function pC({timeoutMs:e=12e4,intervalMs:t=2e3}={},r){const s=Date.now()+e;for(;Date.now()<s;){try{if((await fetch("/api/health",{method:"GET",credentials:"same-origin",cache:"no-store",signal:r})).status>0)return!0}catch{}await new Promise(a=>setTimeout(a,t))}return!1}async function fC(e){try{return!!(await W("/api/auth/check",{method:"GET",signal:e})).authenticated}catch{return!1}}async function hC(e){const t=await W("/api/backups/config",{method:"GET",signal:e});return{enabled:!!t.enabled,schedule_preset:String(t.schedule_preset??"daily"),retention_count:t.retention_count===void 0?null:Number(t.retention_count),dest_dir:String(t.dest_dir??""),backup_mode:t.backup_mode==="snapshot"?"snapshot":"archive",low_priority:t.low_priority!==!1}}async function xC(e,t){const r=await W("/api/backups/config",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e),signal:t});if(r.error)throw new Error(r.error)}async function gC(e){const t=await W("/api/backups/status",{method:"GET",signal:e});return{enabled:!!t.enabled,next_run:ce(t.next_run),backup_running:!!t.backup_running,last_run:ce(t.last_run),last_run_result:ce(t.last_run_result)}}async function vC(e){const t=await W("/api/backups/run",{method:"POST",signal:e});if(t.error)throw new Error(t.error)}async function yC(e){const t=await W("/api/backups/list",{method:"GET",signal:e});return Array.isArray(t.backups)?t.backups.map(r=>String(r)).filter(Boolean):[]}async function bC(e,t){const r=await W("/api/backups/restore",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({archive_name:e}),signal:t});if(r.error)throw new Error(r.error)}async function jC(e){const t=await W("/api/auto-update/config",{method:"GET",signal:e});return{enabled:!!t.enabled,schedule_preset:String(t.schedule_preset??"daily_4am"),notify_on_update:!!t.notify_on_update}}async function wC(e,t){const r=await W("/api/auto-update/config",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e),signal:t});if(r.error)throw new Error(r.error)}async function NC(e){const t=await W("/api/auto-update/run-now",{method:"POST",signal:e});if(t.error)throw new Error(t.error)}function Go(e){return e instanceof Error&&e.message?e.message:"Unable to complete the request"}function Fs({label:e,value:t,onChange:r,mono:s=!0,testId:a}){return n.jsxs("label",{className:"block space-y-1",children:[n.jsx("span",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:e}),n.jsx("input",{className:q("w-full rounded-md border border-border bg-background px-3 py-2 text-xs focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring sm:text-sm",s?"font-mono":""),"data-setting":a,onChange:i=>r(i.target.value),spellCheck:!1,value:t})]})}function Ko({label:e,checked:t,onChange:r,testId:s}){return n.jsxs("label",{className:"flex items-center gap-2 text-sm",children:[n.jsx("input",{checked:t,className:"h-4 w-4 accent-primary","data-setting":s,onChange:a=>r(a.target.checked),type:"checkbox"}),e]})}function kC({phase:e,log:t,commit:r}){const s=(()=>{switch(e){case"running":return{icon:n.jsx(me,{"aria-hidden":!0,className:"h-4 w-4 animate-spin"}),text:"Updating…",tone:"info"};case"restarting":return{icon:n.jsx(me,{"aria-hidden":!0,className:"h-4 w-4 animate-spin"}),text:"Restarting — reconnecting…",tone:"info"};case"recovered":return{icon:n.jsx(lt,{"aria-hidden":!0,className:"h-4 w-4"}),text:r?`Update complete — now at ${r}.`:"Update complete.",tone:"success"};case"loggedout":return{icon:n.jsx(lt,{"aria-hidden":!0,className:"h-4 w-4"}),text:r?`Update complete (now at ${r}) — please log in again.`:"Update complete — please log in again.",tone:"success"};case"failed":return{icon:n.jsx(ie,{"aria-hidden":!0,className:"h-4 w-4"}),text:"Update failed.",tone:"error"};default:return null}})();return s?n.jsxs("div",{className:"mt-3 space-y-2 rounded-md border border-border bg-muted/30 p-3","data-testid":"pihealth-update-progress",children:[n.jsxs("div",{className:q("flex items-center gap-2 text-sm font-medium",s.tone==="success"?"text-success":s.tone==="error"?"text-danger":"text-info"),children:[s.icon,n.jsx("span",{children:s.text})]}),t.length>0?n.jsx("ul",{className:"max-h-48 space-y-1 overflow-y-auto font-mono text-xs",children:t.map((a,i)=>n.jsxs("li",{className:q("flex gap-2",a.tone==="error"?"text-danger":"text-muted-foreground"),children:[a.step?n.jsx("span",{className:"shrink-0 uppercase tracking-wide opacity-70",children:a.step}):null,n.jsx("span",{className:"break-all",children:a.text})]},i))}):null,e==="loggedout"?n.jsx(_,{onClick:()=>window.location.assign("/login.html"),variant:"outline",children:"Go to login"}):null]}):null}function SC(){const[e,t]=d.useState({repo_path:"",service_name:""}),[r,s]=d.useState({enabled:!1,schedule_preset:"daily",retention_count:null,dest_dir:"",backup_mode:"archive",low_priority:!0}),[a,i]=d.useState(null),[l,o]=d.useState([]),[c,u]=d.useState({enabled:!1,schedule_preset:"daily_4am",notify_on_update:!1}),[h,m]=d.useState(!0),[f,w]=d.useState(!1),[j,y]=d.useState(null),[b,v]=d.useState("Never"),[p,x]=d.useState(null),[g,N]=d.useState(null),[E,C]=d.useState(null),[k,O]=d.useState("idle"),[S,$]=d.useState([]),[R,H]=d.useState(null),I=d.useRef(!0),U=d.useCallback(async M=>{M==="initial"?m(!0):w(!0);try{const[A,F,D,G,se]=await Promise.all([dC(),hC(),gC().catch(()=>null),yC().catch(()=>[]),jC()]);if(!I.current)return;t(A),s(F),i(D),o(G),u(se),y(null),v(Bt(new Date))}catch(A){I.current&&y(Go(A))}finally{I.current&&(M==="initial"?m(!1):w(!1))}},[]),L=d.useCallback(async(M,A,F,D=!1)=>{if(!g){N(M),C(null);try{await A(),I.current&&(x({tone:"success",message:F}),D&&await U("manual"))}catch(G){I.current&&x({tone:"error",message:Go(G)})}finally{I.current&&N(null)}}},[U,g]),B=d.useCallback(async()=>{if(k==="running"||k==="restarting")return;C(null),O("running"),$([]),H(null);let M=!1,A=!1;const F=se=>{if(I.current){if(se.new_commit&&H(se.new_commit.slice(0,8)),se.error){A=!0,$(de=>[...de,{step:se.step,text:se.error??"Update failed",tone:"error"}]);return}se.line&&$(de=>[...de,{step:se.step,text:se.line??"",tone:"info"}]),se.restarting&&(M=!0,O("restarting"))}};try{await mC(F)}catch(se){if(!I.current)return;A=!0,$(de=>[...de,{text:Go(se),tone:"error"}])}if(!I.current)return;if(A){O("failed");return}if(!M){O("recovered");return}const D=await pC();if(!I.current)return;if(!D){$(se=>[...se,{text:"Timed out waiting for the service to come back online.",tone:"error"}]),O("failed");return}const G=await fC();I.current&&O(G?"recovered":"loggedout")},[k]);d.useEffect(()=>(I.current=!0,U("initial"),()=>{I.current=!1}),[U]);const P=!!g;return n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",disabled:f,onClick:()=>void U("manual"),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",f?"animate-spin":"")}),f?"refreshing":"refresh"]}),description:`system configuration · synced ${b}`,status:n.jsx(fe,{label:"config ready",tone:"success"}),title:"system_settings"}),n.jsx(Cg,{}),p?n.jsx(Q,{"aria-live":p.tone==="error"?"assertive":"polite",className:p.tone==="error"?"border-danger/30 text-danger":"border-success/30 text-success",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm",children:[p.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),p.message]})}):null,j?n.jsx(Q,{"aria-live":"polite",className:"border-warning/30",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),j]})}):null,h?n.jsx(Q,{"aria-live":"polite",role:"status",children:n.jsxs(K,{className:"flex min-h-[14rem] items-center justify-center gap-2 p-6 text-sm text-muted-foreground",children:[n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4 animate-pulse text-primary"}),"Loading settings..."]})}):n.jsxs("div",{className:"grid gap-3 xl:grid-cols-3 xl:items-start",children:[n.jsxs(Q,{className:"transition-colors duration-200 hover:border-primary/25",id:"v2-settings-pihealth",children:[n.jsxs(xe,{children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"Pi-Health self-update"}),n.jsx(we,{children:"Pull the latest code, install dependencies, apply migrations, refresh the UI, and restart — with live progress."})]}),n.jsxs(K,{className:"space-y-3",children:[n.jsx(Fs,{label:"Repo path",onChange:M=>t(A=>({...A,repo_path:M})),testId:"pihealth-repo",value:e.repo_path}),n.jsx(Fs,{label:"Service name",onChange:M=>t(A=>({...A,service_name:M})),testId:"pihealth-service",value:e.service_name}),(()=>{const M=k==="running"||k==="restarting";return n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(_,{disabled:P||M,id:"v2-settings-pihealth-save",onClick:()=>void L("save-pihealth",()=>uC(e),"Pi-Health update config saved"),children:g==="save-pihealth"?"Saving...":"Save"}),E==="update-pihealth"?n.jsxs("span",{className:"flex items-center gap-1.5",children:[n.jsx(_,{className:"border-info/30 bg-info/10 text-info hover:bg-info/15",id:"v2-settings-pihealth-update-confirm",onClick:()=>void B(),variant:"outline",children:"Confirm update"}),n.jsx(_,{onClick:()=>C(null),variant:"outline",children:"Cancel"})]}):n.jsx(_,{disabled:P||M,id:"v2-settings-pihealth-update",onClick:()=>C("update-pihealth"),variant:"outline",children:M?"Updating…":"Update now"})]})})(),n.jsx(kC,{commit:R,log:S,phase:k})]})]}),n.jsxs(Q,{className:"transition-colors duration-200 hover:border-primary/25",id:"v2-settings-backups",children:[n.jsxs(xe,{children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"Backups"}),n.jsx(we,{children:a?`Next run: ${a.next_run||"—"} · Last: ${a.last_run||"never"}`:"Scheduled configuration backups."})]}),n.jsxs(K,{className:"space-y-3",children:[n.jsx(Ko,{checked:r.enabled,label:"Enabled",onChange:M=>s(A=>({...A,enabled:M})),testId:"backup-enabled"}),n.jsx(Fs,{label:"Schedule preset",mono:!1,onChange:M=>s(A=>({...A,schedule_preset:M})),testId:"backup-schedule",value:r.schedule_preset}),n.jsx(Fs,{label:"Destination dir",onChange:M=>s(A=>({...A,dest_dir:M})),testId:"backup-dest",value:r.dest_dir}),n.jsx(Ko,{checked:r.backup_mode==="snapshot",label:"Deduplicated snapshots",onChange:M=>s(A=>({...A,backup_mode:M?"snapshot":"archive"})),testId:"backup-snapshots"}),n.jsx(Ko,{checked:r.low_priority,label:"Run backups at low CPU and disk priority",onChange:M=>s(A=>({...A,low_priority:M})),testId:"backup-low-priority"}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(_,{disabled:P,id:"v2-settings-backup-save",onClick:()=>void L("save-backup",()=>xC({enabled:r.enabled,schedule_preset:r.schedule_preset,dest_dir:r.dest_dir,backup_mode:r.backup_mode,low_priority:r.low_priority}),"Backup config saved"),children:g==="save-backup"?"Saving...":"Save"}),n.jsx(_,{disabled:P,id:"v2-settings-backup-run",onClick:()=>void L("run-backup",()=>vC(),"Backup started",!0),variant:"outline",children:"Run backup now"})]}),l.length?n.jsxs("div",{className:"space-y-2",children:[n.jsx("p",{className:"text-xs uppercase tracking-wide text-muted-foreground",children:"Backups"}),l.map(M=>{const A=`restore:${M}`;return n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2 rounded-md border border-border bg-muted/20 p-2 text-xs",children:[n.jsx("span",{className:"break-all font-mono",children:M}),E===A?n.jsxs("span",{className:"flex items-center gap-1.5",children:[n.jsx(_,{className:"border-warning/30 bg-warning/10 text-warning hover:bg-warning/15 text-xs sm:text-sm","data-confirm-restore":M,onClick:()=>void L(A,()=>bC(M),`Restored ${M}`,!0),size:"sm",variant:"outline",children:"Confirm restore"}),n.jsx(_,{onClick:()=>C(null),size:"sm",variant:"outline",children:"Cancel"})]}):n.jsx(_,{className:"text-xs sm:text-sm","data-restore":M,disabled:P,onClick:()=>C(A),size:"sm",variant:"outline",children:"Restore"})]},M)})]}):null]})]}),n.jsxs(Q,{className:"transition-colors duration-200 hover:border-primary/25",id:"v2-settings-auto-update",children:[n.jsxs(xe,{children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"Container auto-update"}),n.jsx(we,{children:"Scheduled container image updates."})]}),n.jsxs(K,{className:"space-y-3",children:[n.jsx(Ko,{checked:c.enabled,label:"Enabled",onChange:M=>u(A=>({...A,enabled:M})),testId:"autoupdate-enabled"}),n.jsx(Ko,{checked:c.notify_on_update,label:"Notify on update",onChange:M=>u(A=>({...A,notify_on_update:M})),testId:"autoupdate-notify"}),n.jsx(Fs,{label:"Schedule preset",mono:!1,onChange:M=>u(A=>({...A,schedule_preset:M})),testId:"autoupdate-schedule",value:c.schedule_preset}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(_,{disabled:P,id:"v2-settings-auto-update-save",onClick:()=>void L("save-autoupdate",()=>wC(c),"Auto-update config saved"),children:g==="save-autoupdate"?"Saving...":"Save"}),n.jsx(_,{disabled:P,id:"v2-settings-auto-update-run",onClick:()=>void L("run-autoupdate",()=>NC(),"Auto-update run started"),variant:"outline",children:"Run now"})]})]})]}),n.jsxs(Q,{className:"transition-colors duration-200 hover:border-primary/25 xl:col-span-3",id:"v2-settings-advanced",children:[n.jsxs(xe,{children:[n.jsx(ge,{className:"text-base sm:text-lg",children:"Advanced"}),n.jsx(we,{children:"Inspect installed capability extensions and provider diagnostics."})]}),n.jsxs(K,{className:"flex flex-col gap-4 sm:flex-row sm:items-center sm:justify-between",children:[n.jsxs("div",{className:"flex min-w-0 items-start gap-3",children:[n.jsx("span",{className:"flex h-10 w-10 shrink-0 items-center justify-center rounded-md border border-border bg-muted/30 text-primary",children:n.jsx(au,{"aria-hidden":"true",className:"h-5 w-5"})}),n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"font-mono text-sm font-semibold",children:"Extensions"}),n.jsx("p",{className:"mt-1 text-xs text-muted-foreground",children:"Versions, compatibility, capabilities, sources, and registry health."})]})]}),n.jsxs(Ee,{className:q(Ye({variant:"outline"}),"shrink-0 gap-2"),to:ve.extensions,children:["Open extensions",n.jsx(Dx,{"aria-hidden":"true",className:"h-4 w-4"})]})]})]})]})]})}function _C(e){return{name:String(e?.name??""),path:ce(e?.path),enabled:e?.enabled===void 0?!0:!!e?.enabled}}async function CC(e,t,r){const s=await W(`/api/storage/shares/${encodeURIComponent(e)}`,{method:"GET",signal:r});if(s.error)throw new Error(s.error);if(!Array.isArray(s.shares))throw new Error("Share list response is invalid");return{pluginId:e,pluginName:t,serviceRunning:!!s.service_running,status:ce(s.status),message:ce(s.message),shares:s.shares.map(a=>_C(a))}}async function ev(e,t,r){const s=await W(e,{method:t,signal:r});if(s.error)throw new Error(s.error)}function EC(e,t,r){return ev(`/api/storage/shares/${encodeURIComponent(e)}/${encodeURIComponent(t)}/toggle`,"POST",r)}function AC(e,t,r){return ev(`/api/storage/shares/${encodeURIComponent(e)}/${encodeURIComponent(t)}`,"DELETE",r)}async function tv(e,t,r,s){const a=await W(e,{method:t,headers:{"Content-Type":"application/json"},body:JSON.stringify(r),signal:s});if(a.error)throw new Error(a.error)}function PC(e,t,r){return tv(`/api/storage/shares/${encodeURIComponent(e)}`,"POST",t,r)}function RC(e,t,r,s){return tv(`/api/storage/shares/${encodeURIComponent(e)}/${encodeURIComponent(t)}`,"PUT",r,s)}const ji={open:!1,mode:"add",pluginId:"",pluginName:"",shareName:null,text:"",status:"idle",error:null};function wi(e){return e instanceof Error&&e.message?e.message:"Unable to complete the request"}function MC(){const[e,t]=d.useState([]),[r,s]=d.useState(!0),[a,i]=d.useState(!1),[l,o]=d.useState(null),[c,u]=d.useState([]),[h,m]=d.useState("Never"),[f,w]=d.useState(null),[j,y]=d.useState(null),[b,v]=d.useState(null),[p,x]=d.useState(ji),g=d.useRef(!0),N=d.useCallback(async S=>{S==="initial"?s(!0):i(!0);try{const R=(await Ql()).filter(L=>L.category.toLowerCase().includes("share")),H=await Mg(R,4,L=>CC(L.id,L.name)),I=[],U=[];if(H.forEach((L,B)=>{L.status==="fulfilled"?I.push(L.value):U.push(`${R[B].name} shares unavailable: ${wi(L.reason)}`)}),!g.current)return;t(I),u(U),o(null),m(Bt(new Date))}catch($){g.current&&(u([]),o(wi($)))}finally{g.current&&(S==="initial"?s(!1):i(!1))}},[]),E=d.useCallback(async(S,$,R)=>{if(!j){y(S),v(null);try{await $(),g.current&&(w({tone:"success",message:R}),await N("manual"))}catch(H){g.current&&w({tone:"error",message:wi(H)})}finally{g.current&&y(null)}}},[N,j]),C=d.useCallback(S=>{x({open:!0,mode:"add",pluginId:S.pluginId,pluginName:S.pluginName,shareName:null,text:JSON.stringify({name:"",path:""},null,2),status:"idle",error:null})},[]),k=d.useCallback((S,$)=>{x({open:!0,mode:"edit",pluginId:S.pluginId,pluginName:S.pluginName,shareName:$.name,text:JSON.stringify({name:$.name,path:$.path??"",enabled:$.enabled},null,2),status:"idle",error:null})},[]),O=d.useCallback(async()=>{let S;try{S=JSON.parse(p.text)}catch{x($=>({...$,status:"error",error:"Share is not valid JSON"}));return}x($=>({...$,status:"saving",error:null}));try{if(p.mode==="add"?await PC(p.pluginId,S):p.shareName&&await RC(p.pluginId,p.shareName,S),!g.current)return;x(ji),w({tone:"success",message:p.mode==="add"?"Share created":"Share updated"}),await N("manual")}catch($){g.current&&x(R=>({...R,status:"error",error:wi($)}))}},[p,N]);return d.useEffect(()=>(g.current=!0,N("initial"),()=>{g.current=!1}),[N]),n.jsxs("section",{className:"space-y-4 sm:space-y-6",children:[n.jsx(pt,{actions:n.jsxs(_,{className:"gap-2",disabled:a,onClick:()=>void N("manual"),variant:"secondary",children:[n.jsx(je,{"aria-hidden":"true",className:q("h-4 w-4",a?"animate-spin":"")}),a?"refreshing":"refresh"]}),description:`${e.reduce((S,$)=>S+$.shares.length,0)} shares · synced ${h}`,status:c.length?n.jsx(fe,{label:"partial data",tone:"warning"}):n.jsx(fe,{label:`${e.reduce((S,$)=>S+$.shares.filter(R=>R.enabled).length,0)} enabled`,tone:"success"}),title:"network_shares"}),f?n.jsx(Q,{"aria-live":f.tone==="error"?"assertive":"polite",className:f.tone==="error"?"border-danger/30 text-danger":"border-success/30 text-success",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm",children:[f.tone==="error"?n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}):n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4"}),f.message]})}):null,c.length?n.jsx(Q,{"aria-live":"polite",className:"border-warning/30",role:"status",children:n.jsxs(K,{className:"flex items-start gap-2 p-4 text-sm text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"mt-0.5 h-4 w-4 shrink-0"}),n.jsx("div",{className:"space-y-1",children:c.map(S=>n.jsx("p",{children:S},S))})]})}):null,l?n.jsx(Q,{"aria-live":"polite",className:"border-warning/30",role:"status",children:n.jsxs(K,{className:"flex items-center gap-2 p-4 text-sm text-warning",children:[n.jsx(ie,{"aria-hidden":"true",className:"h-4 w-4"}),l]})}):null,r?n.jsx(Q,{"aria-live":"polite",role:"status",children:n.jsxs(K,{className:"flex min-h-[14rem] items-center justify-center gap-2 p-6 text-sm text-muted-foreground",children:[n.jsx(Je,{"aria-hidden":"true",className:"h-4 w-4 animate-pulse text-primary"}),"Loading shares..."]})}):null,!r&&!e.length&&!c.length?n.jsx(Q,{children:n.jsx(K,{className:"flex min-h-[10rem] items-center justify-center p-6 text-sm text-muted-foreground",children:"No share plugins configured."})}):null,r?null:e.map(S=>n.jsxs(Q,{className:"transition-colors duration-200 hover:border-primary/25",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsx(ge,{className:"text-base sm:text-lg",children:S.pluginName}),n.jsx(we,{children:S.message||"Shares"})]}),n.jsxs("div",{className:"flex shrink-0 items-center gap-2",children:[n.jsx(fe,{label:S.serviceRunning?"running":"stopped",tone:S.serviceRunning?"success":"neutral"}),n.jsxs(_,{className:"gap-1.5 text-xs sm:text-sm","data-add-share":S.pluginId,onClick:()=>C(S),size:"sm",variant:"outline",children:[n.jsx(ot,{"aria-hidden":"true",className:"h-3.5 w-3.5"}),"Add share"]})]})]}),n.jsx(K,{className:"space-y-2",children:S.shares.length?S.shares.map($=>{const R=`toggle:${S.pluginId}:${$.name}`,H=`delete:${S.pluginId}:${$.name}`;return n.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2 rounded-md border border-border bg-muted/20 p-3 text-xs",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"break-all font-mono text-sm",children:$.name}),n.jsx("p",{className:"break-all text-muted-foreground",children:$.path||"—"})]}),n.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[n.jsx(fe,{label:$.enabled?"enabled":"disabled",tone:$.enabled?"success":"neutral"}),n.jsxs(_,{className:"text-xs sm:text-sm","data-share":$.name,"data-share-action":"toggle",disabled:!!j,onClick:()=>void E(R,()=>EC(S.pluginId,$.name),`Toggled ${$.name}`),size:"sm",variant:"outline",children:[j===R?n.jsx(me,{"aria-hidden":"true",className:"h-3.5 w-3.5 animate-spin"}):null,$.enabled?"Disable":"Enable"]}),n.jsx(_,{className:"text-xs sm:text-sm","data-edit-share":$.name,disabled:!!j,onClick:()=>k(S,$),size:"sm",variant:"outline",children:"Edit"}),b===H?n.jsxs("span",{className:"flex items-center gap-1.5",children:[n.jsx(_,{className:"border-danger/30 bg-danger/10 text-danger hover:bg-danger/15 text-xs sm:text-sm","data-confirm-delete-share":$.name,onClick:()=>void E(H,()=>AC(S.pluginId,$.name),`Deleted ${$.name}`),size:"sm",variant:"outline",children:"Confirm delete"}),n.jsx(_,{onClick:()=>v(null),size:"sm",variant:"outline",children:"Cancel"})]}):n.jsx(_,{className:"text-xs sm:text-sm","data-delete-share":$.name,disabled:!!j,onClick:()=>v(H),size:"sm",variant:"outline",children:"Delete"})]})]},$.name)}):n.jsx("p",{className:"text-sm text-muted-foreground",children:"No shares configured."})})]},S.pluginId)),p.open?n.jsx(ze,{onClose:()=>x(ji),children:n.jsxs(Q,{"aria-labelledby":"v2-share-config-title","aria-modal":"true",className:"flex max-h-[90vh] w-full max-w-2xl flex-col overflow-hidden",id:"v2-share-config-modal",role:"dialog",children:[n.jsxs(xe,{className:"flex flex-row items-start justify-between gap-3 border-b border-border/70 p-4 sm:p-5",children:[n.jsxs("div",{className:"space-y-1",children:[n.jsxs(ge,{className:"text-base sm:text-lg",id:"v2-share-config-title",children:[p.mode==="add"?"Add":"Edit"," ",p.pluginName," share"]}),n.jsx(we,{children:"Share definition as JSON (name + path required)."})]}),n.jsx(_,{id:"v2-share-config-close",onClick:()=>x(ji),variant:"outline",children:"Close"})]}),n.jsxs(K,{className:"space-y-3 overflow-auto p-4",children:[n.jsx("textarea",{"aria-label":"Share definition JSON",className:"h-[40vh] w-full resize-y rounded-md border border-border bg-muted/25 p-3 font-mono text-xs focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring sm:text-sm","data-share-config-textarea":!0,onChange:S=>x($=>({...$,text:S.target.value,status:"idle",error:null})),spellCheck:!1,value:p.text}),p.error?n.jsx("p",{className:"text-sm text-danger",id:"v2-share-config-error",children:p.error}):null,n.jsx(_,{disabled:p.status==="saving",id:"v2-share-config-save",onClick:()=>void O(),children:p.status==="saving"?"Saving...":"Save share"})]})]})}):null]})}const td={up:{label:"Start",pendingLabel:"Starting...",className:"border-success/30 bg-success/10 text-success hover:bg-success/15",Icon:Hl},down:{label:"Stop",pendingLabel:"Stopping...",className:"border-danger/30 bg-danger/10 text-danger hover:bg-danger/15",Icon:qx},restart:{label:"Restart",pendingLabel:"Restarting...",className:"border-warning/30 bg-warning/10 text-warning hover:bg-warning/15",Icon:lu},pull:{label:"Pull",pendingLabel:"Pulling...",className:"border-info/30 bg-info/10 text-info hover:bg-info/15",Icon:Oa}};function TC(e){return e==="running"?"success":e==="stopped"||e==="exited"?"danger":e==="partial"?"warning":"neutral"}function $C(e){return e.status==="running"?["down","restart"]:["up"]}function IC({stack:e,pendingAction:t,containers:r,onAction:s,onLogs:a,onEdit:i,onBackups:l,onDelete:o,onOpenContainer:c}){const u=c1(e),h=u===null?0:Math.max(0,Math.min(u,100)),m=!!t;return n.jsx(Q,{className:"transition-colors duration-200 hover:border-primary/25",children:n.jsxs(K,{className:"space-y-3 p-4",children:[n.jsxs("div",{className:"flex items-start justify-between gap-3",children:[n.jsxs("div",{className:"min-w-0",children:[n.jsx("p",{className:"truncate text-sm font-semibold",children:e.name}),e.compose_file?n.jsx("p",{className:"truncate text-xs text-muted-foreground",children:e.compose_file}):null]}),n.jsx(fe,{className:"shrink-0",label:e.status,tone:TC(e.status)})]}),n.jsxs("div",{className:"space-y-1",children:[n.jsxs("p",{className:"text-xs text-muted-foreground",children:[e.running_count??"—"," / ",e.container_count??"—"," ","services up"]}),n.jsx(Yt,{label:`${e.name} services ${h}%`,tone:"success",value:h})]}),r&&r.length?n.jsx("ul",{className:"space-y-1 rounded-md border border-border/70 bg-muted/20 p-2","data-stack-containers":!0,children:r.map(f=>n.jsxs("li",{className:"flex items-center gap-2 text-xs",children:[n.jsx("span",{"aria-hidden":"true",className:q("h-2 w-2 shrink-0 rounded-full",f.status==="running"?"bg-success":"bg-muted-foreground/50")}),n.jsx("button",{className:"truncate text-left text-primary hover:underline","data-stack-container":f.name,onClick:()=>c?.(f),type:"button",children:f.name}),n.jsx("span",{className:"ml-auto shrink-0 text-muted-foreground",children:f.status})]},f.id))}):null,n.jsxs("div",{className:"flex items-center gap-1.5",children:[$C(e).map(f=>{const w=td[f],j=w.Icon;return n.jsx(_,{"aria-label":`${w.label} ${e.name}`,className:q("h-9 min-h-9 w-9 px-0",w.className),"data-action":f,"data-stack":e.name,disabled:m,onClick:()=>s(e,f),size:"sm",title:`${w.label} ${e.name}`,variant:"outline",children:t===f?n.jsx(me,{"aria-hidden":"true",className:"h-4 w-4 animate-spin"}):n.jsx(j,{"aria-hidden":"true",className:"h-4 w-4"})},f)}),n.jsx(_,{"aria-label":`Logs ${e.name}`,className:"h-9 min-h-9 w-9 px-0","data-stack-action":"logs","data-stack":e.name,disabled:m,onClick:()=>a(e),size:"sm",title:`Logs ${e.name}`,variant:"outline",children:n.jsx(Bl,{"aria-hidden":"true",className:"h-4 w-4"})}),n.jsx(Ba,{disabled:m,items:[{id:"pull",label:"Pull images",Icon:Oa,onSelect:()=>s(e,"pull"),tone:"info",data:{"data-action":"pull","data-stack":e.name}},{id:"edit",label:"Edit compose",Icon:ql,onSelect:()=>i(e),data:{"data-stack-action":"edit","data-stack":e.name}},{id:"backups",label:"Backups",Icon:ew,onSelect:()=>l(e),data:{"data-stack-action":"backups","data-stack":e.name}},{id:"delete",label:"Delete stack",Icon:Kt,onSelect:()=>o(e),separatorBefore:!0,tone:"danger",data:{"data-stack-action":"delete","data-stack":e.name}}],label:`More actions for ${e.name}`,menuData:{"data-stack-actions-menu":e.name},pending:t==="pull",triggerData:{"data-stack-menu":e.name}})]})]})})}const LC=/^[a-zA-Z0-9][a-zA-Z0-9._-]*$/,zC=`services:
   app:
     image: nginx:latest
     restart: unless-stopped
@@ -0,0 +1,332 @@
+"""
+Native MergerFS branch balancer.
+
+Moves files from the fullest branch to the emptiest until every branch's fill
+is within ``spread_percent`` of the others, like ``mergerfs.balance`` but in
+process: each move is a rate-limited copy to a temporary name, verified by
+reading it back, renamed into place and only then removed from the source.
+Progress is yielded as events while it runs, and a small checkpoint file
+records the move in flight so an interrupted run (closed stream, restart,
+crash) is cleaned up and resumed by the next one.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from stat import S_ISREG
+from typing import Callable, Generator, Iterator
+
+from pool_files import SKIPPED_DIRS, SKIPPED_PREFIXES, TEMP_SUFFIX, RateLimiter
+
+
+DEFAULT_SPREAD_PERCENT = 2.0
+DEFAULT_MIN_FILE_BYTES = 1024 * 1024
+CHUNK_BYTES = 4 * 1024 * 1024
+PROGRESS_INTERVAL_SECONDS = 2.0
+
+
+@dataclass
+class BranchUsage:
+    branch: str
+    total: int
+    used: int
+
+    @property
+    def percent(self) -> float:
+        return self.used / self.total * 100 if self.total else 0.0
+
+    @property
+    def free(self) -> int:
+        return self.total - self.used
+
+
+def statvfs_usage(branch: str) -> tuple[int, int]:
+    """Return ``(total_bytes, used_bytes)`` for a branch filesystem."""
+    stat = os.statvfs(branch)
+    total = stat.f_blocks * stat.f_frsize
+    return total, total - stat.f_bavail * stat.f_frsize
+
+
+def _candidates(branch: str, min_bytes: int) -> Iterator[tuple[str, os.stat_result]]:
+    """Walk a branch lazily, yielding movable regular files as ``(relpath, stat)``."""
+    for directory, dirnames, filenames in os.walk(branch):
+        dirnames[:] = sorted(name for name in dirnames if name not in SKIPPED_DIRS)
+        for name in sorted(filenames):
+            if name.startswith(SKIPPED_PREFIXES) or name.endswith(TEMP_SUFFIX):
+                continue
+            path = os.path.join(directory, name)
+            try:
+                stat = os.lstat(path)
+            except OSError:
+                continue
+            # Hard links (torrent seeds next to library copies) would be split in two.
+            if not S_ISREG(stat.st_mode) or stat.st_nlink > 1 or stat.st_size < min_bytes:
+                continue
+            yield os.path.relpath(path, branch), stat
+
+
+class MergerFSBalancer:
+    """Plan and perform branch-to-branch moves for one pool."""
+
+    def __init__(
+        self,
+        branches: list[str],
+        checkpoint_path: str,
+        *,
+        spread_percent: float = DEFAULT_SPREAD_PERCENT,
+        rate_limit_bytes: float = 0,
+        min_file_bytes: int = DEFAULT_MIN_FILE_BYTES,
+        dry_run: bool = False,
+        usage_reader: Callable[[str], tuple[int, int]] = statvfs_usage,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._branches = list(branches)
+        self._checkpoint_path = checkpoint_path
+        self._spread = max(0.0, float(spread_percent))
+        self._min_bytes = max(0, int(min_file_bytes))
+        self._dry_run = dry_run
+        self._usage_reader = usage_reader
+        self._clock = clock
+        self._limiter = RateLimiter(rate_limit_bytes, clock=clock, sleep=sleep)
+
+    # -- checkpoint ------------------------------------------------------------
+
+    def _load_checkpoint(self) -> dict:
+        try:
+            with open(self._checkpoint_path) as handle:
+                data = json.load(handle)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_checkpoint(self, checkpoint: dict) -> None:
+        if self._dry_run:
+            return
+        temp_path = f"{self._checkpoint_path}.tmp"
+        with open(temp_path, "w") as handle:
+            json.dump(checkpoint, handle, indent=2)
+        os.replace(temp_path, self._checkpoint_path)
+
+    def _recover(self, checkpoint: dict) -> Iterator[dict]:
+        """Finish or undo the move an interrupted run left in flight."""
+        pending = checkpoint.get("in_progress")
+        if not pending:
+            return
+        source = os.path.join(pending["from"], pending["path"])
+        target = os.path.join(pending["to"], pending["path"])
+        if pending.get("stage") == "renamed":
+            try:
+                if os.path.exists(source) and os.path.getsize(source) == os.path.getsize(target):
+                    os.unlink(source)
+                yield {"type": "progress", "event": "recovered", "path": pending["path"]}
+            except OSError as exc:
+                yield {"type": "progress", "event": "recover_failed", "path": pending["path"], "error": str(exc)}
+        elif self._already_renamed(source, target):
+            # The rename landed but the crash beat the "renamed" checkpoint.
+            try:
+                os.unlink(source)
+                yield {"type": "progress", "event": "recovered", "path": pending["path"]}
+            except OSError as exc:
+                yield {"type": "progress", "event": "recover_failed", "path": pending["path"], "error": str(exc)}
+        else:
+            try:
+                os.unlink(target + TEMP_SUFFIX)
+            except FileNotFoundError:
+                pass
+            yield {"type": "progress", "event": "discarded", "path": pending["path"]}
+        checkpoint["in_progress"] = None
+        self._save_checkpoint(checkpoint)
+
+    def _already_renamed(self, source: str, target: str) -> bool:
+        """Whether ``target`` is a verified copy of ``source`` that was renamed into place."""
+        try:
+            if not os.path.isfile(source) or os.path.islink(target) or not os.path.isfile(target):
+                return False
+            if os.path.getsize(source) != os.path.getsize(target):
+                return False
+            return self._hash_file(source) == self._hash_file(target)
+        except OSError:
+            return False
+
+    # -- run -------------------------------------------------------------------
+
+    def run(self) -> Generator[dict, None, dict]:
+        """Yield progress events; return a summary when balanced or out of candidates."""
+        checkpoint = self._load_checkpoint() if not self._dry_run else {}
+        if checkpoint.get("branches") != self._branches:
+            checkpoint = {"branches": self._branches, "moved_files": 0, "moved_bytes": 0}
+        yield from self._recover(checkpoint)
+
+        usage = {}
+        for branch in self._branches:
+            total, used = self._usage_reader(branch)
+            usage[branch] = BranchUsage(branch, total, used)
+        sources = {branch: _candidates(branch, self._min_bytes) for branch in self._branches}
+        yield {"type": "progress", "event": "start", "dry_run": self._dry_run, **self._spread_of(usage)}
+
+        moved_files = moved_bytes = failed = 0
+        while True:
+            live = [usage[branch] for branch in self._branches if branch in sources]
+            if not live:
+                break
+            source = max(live, key=lambda item: item.percent)
+            target = min(usage.values(), key=lambda item: item.percent)
+            if source is target or source.percent - target.percent <= self._spread + 1e-9:
+                break
+            move = self._next_move(sources, source, target)
+            if move is None:
+                continue
+            relpath, stat = move
+            if not self._dry_run:
+                try:
+                    yield from self._move(checkpoint, relpath, stat, source.branch, target.branch)
+                except OSError as exc:
+                    failed += 1
+                    yield {"type": "progress", "event": "failed", "path": relpath, "error": str(exc)}
+                    continue
+            source.used -= stat.st_size
+            target.used += stat.st_size
+            moved_files += 1
+            moved_bytes += stat.st_size
+            yield {
+                "type": "progress",
+                "event": "planned" if self._dry_run else "moved",
+                "path": relpath,
+                "from": source.branch,
+                "to": target.branch,
+                "bytes": stat.st_size,
+                "moved_files": moved_files,
+                "moved_bytes": moved_bytes,
+                **self._spread_of(usage),
+            }
+
+        if not self._dry_run:
+            checkpoint["finished_at"] = time.time()
+            self._save_checkpoint(checkpoint)
+        summary = {
+            "moved_files": moved_files,
+            "moved_bytes": moved_bytes,
+            "failed_files": failed,
+            "dry_run": self._dry_run,
+        }
+        summary.update(self._spread_of(usage))
+        return summary
+
+    def _next_move(self, sources, source: BranchUsage, target: BranchUsage):
+        """Pick the next file on ``source`` that fits ``target`` without overshooting."""
+        for relpath, stat in sources[source.branch]:
+            size = stat.st_size
+            if size >= target.free or os.path.lexists(os.path.join(target.branch, relpath)):
+                continue
+            # Moving must not leave the target fuller than the source was made.
+            if (target.used + size) / target.total > (source.used - size) / source.total:
+                continue
+            return relpath, stat
+        del sources[source.branch]
+        return None
+
+    @staticmethod
+    def _spread_of(usage: dict[str, BranchUsage]) -> dict:
+        percents = {branch: round(item.percent, 2) for branch, item in usage.items()}
+        return {
+            "branches": percents,
+            "spread_percent": round(max(percents.values()) - min(percents.values()), 2)
+            if percents
+            else 0.0,
+        }
+
+    # -- moving ----------------------------------------------------------------
+
+    def _move(
+        self, checkpoint: dict, relpath: str, stat: os.stat_result, source_branch: str, target_branch: str
+    ) -> Generator[dict, None, None]:
+        source = os.path.join(source_branch, relpath)
+        target = os.path.join(target_branch, relpath)
+        temp_path = target + TEMP_SUFFIX
+        checkpoint["in_progress"] = {"path": relpath, "from": source_branch, "to": target_branch, "stage": "copy"}
+        self._save_checkpoint(checkpoint)
+        renamed = False
+        try:
+            self._make_parents(source_branch, target_branch, os.path.dirname(relpath))
+            digest = yield from self._copy(source, temp_path, relpath, stat.st_size)
+            if self._hash_file(temp_path) != digest:
+                raise OSError(f"verification failed for {relpath}")
+            shutil.copystat(source, temp_path, follow_symlinks=False)
+            try:
+                os.chown(temp_path, stat.st_uid, stat.st_gid)
+            except PermissionError:
+                pass
+            current = os.lstat(source)
+            if current.st_size != stat.st_size or current.st_mtime_ns != stat.st_mtime_ns:
+                raise OSError(f"{relpath} changed while it was being copied")
+            checkpoint["in_progress"]["stage"] = "renaming"
+            self._save_checkpoint(checkpoint)
+            os.rename(temp_path, target)
+            renamed = True
+            checkpoint["in_progress"]["stage"] = "renamed"
+            self._save_checkpoint(checkpoint)
+            os.unlink(source)
+            checkpoint["in_progress"] = None
+            checkpoint["moved_files"] = checkpoint.get("moved_files", 0) + 1
+            checkpoint["moved_bytes"] = checkpoint.get("moved_bytes", 0) + stat.st_size
+            self._save_checkpoint(checkpoint)
+        finally:
+            if not renamed:
+                try:
+                    os.unlink(temp_path)
+                except FileNotFoundError:
+                    pass
+                checkpoint["in_progress"] = None
+                self._save_checkpoint(checkpoint)
+
+    def _copy(self, source: str, destination: str, relpath: str, size: int) -> Generator[dict, None, str]:
+        digest = hashlib.blake2b()
+        copied = 0
+        reported_at = self._clock()
+        with open(source, "rb") as reader, open(destination, "wb") as writer:
+            while True:
+                chunk = reader.read(CHUNK_BYTES)
+                if not chunk:
+                    break
+                self._limiter.consume(len(chunk))
+                writer.write(chunk)
+                digest.update(chunk)
+                copied += len(chunk)
+                now = self._clock()
+                if now - reported_at >= PROGRESS_INTERVAL_SECONDS:
+                    reported_at = now
+                    yield {"type": "progress", "event": "copying", "path": relpath, "copied": copied, "bytes": size}
+            writer.flush()
+            os.fsync(writer.fileno())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        digest = hashlib.blake2b()
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(CHUNK_BYTES), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _make_parents(source_branch: str, target_branch: str, relative_dir: str) -> None:
+        """Create missing parent directories on the target with the source's mode and owner."""
+        if not relative_dir:
+            return
+        current = ""
+        for part in relative_dir.split(os.sep):
+            current = os.path.join(current, part)
+            target_dir = os.path.join(target_branch, current)
+            if os.path.isdir(target_dir):
+                continue
+            source_stat = os.stat(os.path.join(source_branch, current))
+            os.mkdir(target_dir, source_stat.st_mode & 0o7777)
+            try:
+                os.chown(target_dir, source_stat.st_uid, source_stat.st_gid)
+            except PermissionError:
+                pass
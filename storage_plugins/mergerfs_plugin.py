@@ -12,7 +12,8 @@ from typing import Generator
 
 from storage_plugins.base import StoragePlugin, CommandResult, PluginStatus
 from helper_client import helper_call, helper_available, HelperError
-from runtime_paths import STATIC_SCHEMA_DIR
+from runtime_paths import STATIC_SCHEMA_DIR, STORAGE_PLUGIN_CONFIG_DIR, STORAGE_PLUGIN_STATE_DIR
+from storage_plugins.mergerfs_balance import DEFAULT_SPREAD_PERCENT, MergerFSBalancer
 
 
 POLICIES = {
@@ -65,6 +66,11 @@ class MergerFSPlugin(StoragePlugin):
     def __init__(self, config_dir: str):
         super().__init__(config_dir)
         self._schema = None
+        if os.path.realpath(config_dir) == os.path.realpath(STORAGE_PLUGIN_CONFIG_DIR):
+            self._state_dir = str(STORAGE_PLUGIN_STATE_DIR)
+        else:
+            self._state_dir = config_dir
+        os.makedirs(self._state_dir, exist_ok=True)
 
     def get_schema(self) -> dict:
         if self._schema is None:
@@ -394,8 +400,27 @@ class MergerFSPlugin(StoragePlugin):
                 "name": "Balance",
                 "description": "Rebalance files across branches",
                 "dangerous": False,
-                "params": ["pool_name"],
-                "param_schema": [self._pool_name_param()],
+                "params": ["pool_name", "dry_run", "spread_percent", "rate_limit_mbps", "min_file_mb"],
+                "param_schema": [
+                    self._pool_name_param(),
+                    {"name": "dry_run", "label": "Dry run", "type": "boolean", "default": False},
+                    {
+                        "name": "spread_percent",
+                        "label": "Target fill spread (%)",
+                        "type": "number",
+                        "min": 0,
+                        "max": 100,
+                        "default": DEFAULT_SPREAD_PERCENT,
+                    },
+                    {
+                        "name": "rate_limit_mbps",
+                        "label": "Copy rate limit (MB/s, 0 = unlimited)",
+                        "type": "number",
+                        "min": 0,
+                        "default": 0,
+                    },
+                    {"name": "min_file_mb", "label": "Skip files smaller than (MB)", "type": "number", "min": 0, "default": 1},
+                ],
             },
             {
                 "id": "status",
@@ -435,7 +460,7 @@ class MergerFSPlugin(StoragePlugin):
             if not pool_name:
                 yield "ERROR: pool_name required"
                 return CommandResult(success=False, message="", error="pool_name required")
-            return (yield from self._cmd_balance(pool_name))
+            return (yield from self._cmd_balance(pool_name, params))
 
         yield f"Unknown command: {command_id}"
         return CommandResult(success=False, message="", error="Unknown command")
@@ -606,11 +631,7 @@ class MergerFSPlugin(StoragePlugin):
             yield f"ERROR: {exc}"
             return CommandResult(success=False, message="", error=str(exc))
 
-    def _cmd_balance(self, pool_name: str) -> Generator[str, None, CommandResult]:
-        yield f"Balancing pool: {pool_name}"
-        yield "NOTE: mergerfs.balance tool required"
-        yield "Install with: apt install mergerfs-tools"
-
+    def _cmd_balance(self, pool_name: str, params: dict) -> Generator[str | dict, None, CommandResult]:
         config = self.get_config()
         pool = next(
             (item for item in config.get("pools", []) if item.get("name") == pool_name),
@@ -621,35 +642,61 @@ class MergerFSPlugin(StoragePlugin):
             yield f"Pool not found: {pool_name}"
             return CommandResult(success=False, message="", error=f"Pool not found: {pool_name}")
 
-        mount_point = pool.get("mount_point")
-
         try:
-            result = subprocess.run(
-                ["mergerfs.balance", mount_point],
-                capture_output=True,
-                text=True,
-                timeout=3600,
-            )
-            for line in result.stdout.splitlines():
-                yield line.rstrip()
-            if result.returncode == 0:
-                return CommandResult(success=True, message="Balance complete")
-            error = result.stderr.strip() or "mergerfs.balance exited with a non-zero status"
+            spread = float(params.get("spread_percent", DEFAULT_SPREAD_PERCENT))
+            rate_mbps = float(params.get("rate_limit_mbps", 0) or 0)
+            min_file_mb = float(params.get("min_file_mb", 1))
+        except (TypeError, ValueError):
+            yield "ERROR: invalid balance parameters"
+            return CommandResult(success=False, message="", error="Invalid balance parameters")
+        if not 0 <= spread <= 100 or rate_mbps < 0 or min_file_mb < 0:
+            yield "ERROR: invalid balance parameters"
+            return CommandResult(success=False, message="", error="Invalid balance parameters")
+        dry_run = params.get("dry_run") is True
+
+        missing = [branch for branch in pool.get("branches", []) if not os.path.isdir(branch)]
+        if missing:
+            error = f"Branch not available: {', '.join(missing)}"
             yield f"ERROR: {error}"
             return CommandResult(success=False, message="", error=error)
-        except subprocess.TimeoutExpired:
-            error = "MergerFS balance timed out"
-            yield f"ERROR: {error}"
-            return CommandResult(success=False, message="", error=error)
-        except FileNotFoundError:
-            error = "mergerfs.balance not found"
-            yield error
-            yield "Install mergerfs-tools package"
-            return CommandResult(success=False, message="", error=error)
-        except Exception as exc:
+
+        balancer = MergerFSBalancer(
+            pool["branches"],
+            os.path.join(self._state_dir, f"mergerfs_balance_{pool_name}.json"),
+            spread_percent=spread,
+            rate_limit_bytes=rate_mbps * 1_000_000,
+            min_file_bytes=int(min_file_mb * 1024 * 1024),
+            dry_run=dry_run,
+        )
+        yield f"{'Planning' if dry_run else 'Balancing'} pool: {pool_name} (target spread {spread:g}%)"
+        try:
+            events = balancer.run()
+            while True:
+                try:
+                    event = next(events)
+                except StopIteration as stop:
+                    summary = stop.value
+                    break
+                yield event
+                if event["event"] in ("moved", "planned"):
+                    yield (
+                        f"{'Would move' if dry_run else 'Moved'} {event['path']}: "
+                        f"{event['from']} -> {event['to']} (spread {event['spread_percent']:.1f}%)"
+                    )
+                elif event["event"] == "failed":
+                    yield f"WARNING: could not move {event['path']}: {event['error']}"
+        except OSError as exc:
             yield f"ERROR: {exc}"
             return CommandResult(success=False, message="", error=str(exc))
 
+        gib = summary["moved_bytes"] / (1024 ** 3)
+        message = (
+            f"{'Would move' if dry_run else 'Moved'} {summary['moved_files']} files "
+            f"({gib:.1f} GiB); spread now {summary['spread_percent']:.1f}%"
+        )
+        yield message
+        return CommandResult(success=True, message=message, data=summary)
+
     def is_installed(self) -> bool:
         return os.path.exists(self.MERGERFS_BIN)
 
@@ -658,7 +705,7 @@ class MergerFSPlugin(StoragePlugin):
             "To install MergerFS on Raspberry Pi OS:\n\n"
             "    sudo apt update\n"
             "    sudo apt install mergerfs\n\n"
-            "For tools (balance, dedup):\n\n"
+            "For tools (dedup):\n\n"
             "    sudo apt install mergerfs-tools\n"
         )
 
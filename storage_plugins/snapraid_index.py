@@ -0,0 +1,277 @@
+"""
+Per-disk file index used to estimate what the next SnapRAID sync will change.
+
+`snapraid diff` reads the whole content file and stats every file, which takes
+minutes on a large array. Before a guarded sync we only need to know whether
+the delete and update counts are anywhere near their thresholds, so this walks
+each data disk with parallel `os.scandir` calls and compares inode, size and
+mtime against the snapshot taken after the last successful sync.
+"""
+from __future__ import annotations
+
+import fnmatch
+import os
+import sqlite3
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator
+
+
+BUSY_TIMEOUT_MS = 3_000
+SCAN_WORKERS = 4
+INSERT_BATCH = 5_000
+# SnapRAID's own files never count as array changes.
+IGNORED_NAMES = frozenset({"snapraid.content", "snapraid.content.tmp", "snapraid.content.lock"})
+
+
+def _excluded(relpath: str, name: str, is_dir: bool, excludes: Iterable[str]) -> bool:
+    """Apply snapraid.conf `exclude` rules: `name`, `dir/`, and root-anchored `/path`."""
+    for pattern in excludes:
+        directory_only = pattern.endswith("/")
+        if directory_only:
+            if not is_dir:
+                continue
+            pattern = pattern.rstrip("/")
+        if pattern.startswith("/"):
+            if fnmatch.fnmatchcase("/" + relpath, pattern):
+                return True
+        elif fnmatch.fnmatchcase(name, pattern):
+            return True
+    return False
+
+
+def _scan_directory(root: str, relative: str, excludes: tuple[str, ...]):
+    files = []
+    subdirs = []
+    path = os.path.join(root, relative) if relative else root
+    with os.scandir(path) as entries:
+        for entry in entries:
+            relpath = f"{relative}/{entry.name}" if relative else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not _excluded(relpath, entry.name, True, excludes):
+                        subdirs.append(relpath)
+                    continue
+                if entry.name in IGNORED_NAMES or _excluded(relpath, entry.name, False, excludes):
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            files.append((relpath, stat.st_ino, stat.st_size, stat.st_mtime_ns))
+    return files, subdirs
+
+
+def scan_tree(
+    root: str,
+    excludes: Iterable[str] = (),
+    *,
+    max_workers: int = SCAN_WORKERS,
+    errors: list | None = None,
+) -> Iterator[tuple[str, int, int, int]]:
+    """Yield ``(relpath, inode, size, mtime_ns)`` for every file under ``root``.
+
+    Directories are listed concurrently; unreadable ones are appended to
+    ``errors`` so callers can tell a complete scan from a partial one.
+    """
+    excludes = tuple(excludes)
+    errors = errors if errors is not None else []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        pending = {pool.submit(_scan_directory, root, "", excludes): ""}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                relative = pending.pop(future)
+                try:
+                    files, subdirs = future.result()
+                except OSError as exc:
+                    errors.append(f"{relative or '.'}: {exc.strerror or exc}")
+                    continue
+                for subdir in subdirs:
+                    pending[pool.submit(_scan_directory, root, subdir, excludes)] = subdir
+                yield from files
+
+
+class SnapRAIDFileIndex:
+    """Snapshot each data disk after a sync and estimate changes since then."""
+
+    def __init__(
+        self,
+        database_path: str,
+        *,
+        max_workers: int = SCAN_WORKERS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.database_path = database_path
+        self._max_workers = max_workers
+        self._clock = clock
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.database_path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.database_path, timeout=BUSY_TIMEOUT_MS / 1000)
+        connection.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        with connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    disk TEXT PRIMARY KEY,
+                    root TEXT NOT NULL,
+                    taken_at INTEGER NOT NULL,
+                    files INTEGER NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    disk TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    inode INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    PRIMARY KEY (disk, path)
+                ) WITHOUT ROWID
+                """
+            )
+        return connection
+
+    def _load_current(self, connection, root: str, excludes) -> tuple[int, list[str]]:
+        connection.execute("DROP TABLE IF EXISTS temp.current")
+        connection.execute(
+            """
+            CREATE TEMP TABLE current (
+                path TEXT PRIMARY KEY,
+                inode INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        errors: list[str] = []
+        scanned = 0
+        batch = []
+        for row in scan_tree(root, excludes, max_workers=self._max_workers, errors=errors):
+            batch.append(row)
+            if len(batch) >= INSERT_BATCH:
+                connection.executemany("INSERT OR REPLACE INTO current VALUES (?, ?, ?, ?)", batch)
+                scanned += len(batch)
+                batch = []
+        connection.executemany("INSERT OR REPLACE INTO current VALUES (?, ?, ?, ?)", batch)
+        scanned += len(batch)
+        connection.execute("CREATE INDEX temp.current_inode ON current (inode)")
+        return scanned, errors
+
+    def snapshot(self, disks: dict[str, str], excludes: Iterable[str] = ()) -> dict:
+        """Record the current state of every data disk as the post-sync baseline."""
+        excludes = tuple(excludes)
+        taken_at = int(self._clock())
+        counts = {}
+        connection = self._connect()
+        try:
+            for disk, root in disks.items():
+                scanned, errors = self._load_current(connection, root, excludes)
+                with connection:
+                    connection.execute("DELETE FROM files WHERE disk = ?", (disk,))
+                    connection.execute("DELETE FROM snapshots WHERE disk = ?", (disk,))
+                    if errors:
+                        # A partial listing would show up as a mass delete next time.
+                        counts[disk] = None
+                        continue
+                    connection.execute(
+                        "INSERT INTO files SELECT ?, path, inode, size, mtime_ns FROM current",
+                        (disk,),
+                    )
+                    connection.execute(
+                        "INSERT INTO snapshots VALUES (?, ?, ?, ?)",
+                        (disk, root, taken_at, scanned),
+                    )
+                counts[disk] = scanned
+            with connection:
+                placeholders = ",".join("?" for _ in disks) or "''"
+                connection.execute(
+                    f"DELETE FROM snapshots WHERE disk NOT IN ({placeholders})",
+                    tuple(disks),
+                )
+                connection.execute(
+                    "DELETE FROM files WHERE disk NOT IN (SELECT disk FROM snapshots)"
+                )
+        finally:
+            connection.close()
+        return counts
+
+    def estimate(self, disks: dict[str, str], excludes: Iterable[str] = ()) -> dict | None:
+        """Estimate `snapraid diff` counts, or None when any disk has no usable snapshot."""
+        excludes = tuple(excludes)
+        totals = {"added": 0, "removed": 0, "updated": 0, "moved": 0}
+        summary = {"estimated": True, "scanned": 0, "errors": [], "disks": {}}
+        connection = self._connect()
+        try:
+            snapshots = {
+                disk: (root, taken_at)
+                for disk, root, taken_at in connection.execute(
+                    "SELECT disk, root, taken_at FROM snapshots"
+                )
+            }
+            if not disks or any(snapshots.get(disk, (None,))[0] != root for disk, root in disks.items()):
+                return None
+            for disk, root in disks.items():
+                scanned, errors = self._load_current(connection, root, excludes)
+                counts = self._compare(connection, disk)
+                summary["disks"][disk] = {
+                    **counts,
+                    "scanned": scanned,
+                    "snapshot_at": snapshots[disk][1],
+                }
+                summary["scanned"] += scanned
+                summary["errors"].extend(f"{disk}: {error}" for error in errors)
+                for key in totals:
+                    totals[key] += counts[key]
+        finally:
+            connection.close()
+        return {**totals, **summary}
+
+    @staticmethod
+    def _compare(connection, disk: str) -> dict:
+        updated = connection.execute(
+            """
+            SELECT COUNT(*) FROM files f JOIN current c ON c.path = f.path
+            WHERE f.disk = ?
+              AND (c.inode != f.inode OR c.size != f.size OR c.mtime_ns != f.mtime_ns)
+            """,
+            (disk,),
+        ).fetchone()[0]
+        gone = connection.execute(
+            """
+            SELECT COUNT(*) FROM files f LEFT JOIN current c ON c.path = f.path
+            WHERE f.disk = ? AND c.path IS NULL
+            """,
+            (disk,),
+        ).fetchone()[0]
+        new = connection.execute(
+            """
+            SELECT COUNT(*) FROM current c
+            WHERE NOT EXISTS (SELECT 1 FROM files f WHERE f.disk = ? AND f.path = c.path)
+            """,
+            (disk,),
+        ).fetchone()[0]
+        # A rename keeps inode, size and mtime; snapraid reports it as moved, not removed.
+        moved = connection.execute(
+            """
+            SELECT COUNT(*) FROM files f
+            WHERE f.disk = ?
+              AND NOT EXISTS (SELECT 1 FROM current c WHERE c.path = f.path)
+              AND EXISTS (
+                  SELECT 1 FROM current c
+                  WHERE c.inode = f.inode AND c.size = f.size AND c.mtime_ns = f.mtime_ns
+                    AND NOT EXISTS (
+                        SELECT 1 FROM files o WHERE o.disk = f.disk AND o.path = c.path
+                    )
+              )
+            """,
+            (disk,),
+        ).fetchone()[0]
+        return {
+            "added": max(0, new - moved),
+            "removed": max(0, gone - moved),
+            "updated": updated,
+            "moved": moved,
+        }
@@ -21,6 +21,13 @@ from storage_plugins.snapraid_logtags import (
     apply_tag_event,
     LogTagParseResult,
 )
+from storage_plugins.snapraid_index import SnapRAIDFileIndex
+from storage_plugins.snapraid_status import (
+    SnapRAIDStatusCache,
+    checked_at_iso,
+    content_fingerprint,
+    parse_snapraid_status,
+)
 from runtime_paths import (
     SNAPRAID_LOG_DIR,
     STATIC_SCHEMA_DIR,
@@ -31,6 +38,14 @@ from runtime_paths import (
 
 logger = logging.getLogger(__name__)
 UUID_PATTERN = re.compile(r"^[A-Za-z0-9._-]+$")
+# Commands that rewrite the content file and so change what `status` reports.
+STATUS_CHANGING_COMMANDS = frozenset({"sync", "scrub", "fix"})
+# Array-wide commands read every disk; wait for them up to the helper's limit.
+LONG_COMMANDS = frozenset({"sync", "scrub", "check", "fix"})
+LONG_COMMAND_TIMEOUT = 1800
+# Within this fraction of a threshold the file-index estimate is not trusted
+# to decide on its own and the real `snapraid diff` is run.
+DIFF_ESTIMATE_MARGIN = 0.25
 
 
 class SnapRAIDPlugin(StoragePlugin):
@@ -74,6 +89,12 @@ class SnapRAIDPlugin(StoragePlugin):
             self._log_dir = os.path.join(config_dir, "snapraid-logs")
         os.makedirs(os.path.dirname(self._state_path), exist_ok=True)
         os.makedirs(self._log_dir, exist_ok=True)
+        self._status_cache = SnapRAIDStatusCache(
+            os.path.join(os.path.dirname(self._state_path), "snapraid_status.json")
+        )
+        self._file_index = SnapRAIDFileIndex(
+            os.path.join(os.path.dirname(self._state_path), "snapraid_index.sqlite3")
+        )
 
     def get_schema(self) -> dict:
         if self._schema is None:
@@ -427,45 +448,89 @@ class SnapRAIDPlugin(StoragePlugin):
             }
 
         try:
-            result = subprocess.run(
-                [self.SNAPRAID_BIN, "status"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode == 0:
-                output = result.stdout
-                if "No error detected" in output:
-                    return {
-                        "status": PluginStatus.HEALTHY.value,
-                        "message": "All data protected",
-                        "details": details
-                    }
-                if "sync" in output.lower() and "required" in output.lower():
-                    details["sync_required"] = True
-                    return {
-                        "status": PluginStatus.DEGRADED.value,
-                        "message": "Sync required",
-                        "details": details
-                    }
+            entry = self._status_model()
         except FileNotFoundError:
             return {
                 "status": PluginStatus.ERROR.value,
                 "message": "SnapRAID not installed",
                 "details": details
             }
-        except subprocess.TimeoutExpired:
-            pass
         except Exception:
-            pass
+            return {
+                "status": PluginStatus.HEALTHY.value,
+                "message": "Status unknown",
+                "details": details
+            }
 
+        model = entry["model"]
+        details["array"] = model
+        details["status_checked_at"] = checked_at_iso(entry)
+        details["sync_in_progress"] = model["sync_in_progress"]
+        details["sync_required"] = model["sync_required"]
+        if model["errors"]:
+            return {
+                "status": PluginStatus.ERROR.value,
+                "message": f"{model['errors']} errors in the array",
+                "details": details
+            }
+        if model["sync_required"]:
+            return {
+                "status": PluginStatus.DEGRADED.value,
+                "message": "Sync required",
+                "details": details
+            }
+        if model["no_error_detected"]:
+            return {
+                "status": PluginStatus.HEALTHY.value,
+                "message": "All data protected",
+                "details": details
+            }
         return {
             "status": PluginStatus.HEALTHY.value,
             "message": "Status unknown",
             "details": details
         }
 
+    def _content_paths(self) -> list[str]:
+        drives = self.get_config().get("drives", [])
+        return [
+            os.path.join(drive["path"], "snapraid.content")
+            for drive in drives
+            if drive.get("content") and drive.get("path")
+        ]
+
+    def get_status_model(self) -> dict:
+        """Return the structured `snapraid status` model (see snapraid_status)."""
+        return self._status_model(use_helper=helper_available())["model"]
+
+    def _status_model(self, use_helper: bool = False) -> dict:
+        """Return the cached `snapraid status` model, re-reading it only when stale.
+
+        The entry is keyed on the config and content files, which every sync,
+        scrub and fix rewrites, so a cache hit never hides a change to the array.
+        Failures raise and are not cached.
+        """
+        fingerprint = content_fingerprint(self.SNAPRAID_CONF, self._content_paths())
+        entry = self._status_cache.get(fingerprint)
+        if entry is not None:
+            return entry
+        if use_helper:
+            result = helper_call('snapraid', {'command': 'status'}, timeout=120)
+            if not result.get('success'):
+                raise RuntimeError(result.get('stderr') or 'SnapRAID status failed')
+            output = result.get('stdout', '')
+        else:
+            result = subprocess.run(
+                [self.SNAPRAID_BIN, "status"],
+                capture_output=True,
+                text=True,
+                timeout=60
+            )
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr or "SnapRAID status failed")
+            output = result.stdout
+        return self._status_cache.put(fingerprint, parse_snapraid_status(output))
+
     def preview_config(self, config: dict) -> str:
         """Render snapraid.conf for a candidate config without writing it."""
         return self._generate_config(config)
@@ -533,6 +598,21 @@ class SnapRAIDPlugin(StoragePlugin):
         self,
         command_id: str,
         params: dict = None
+    ) -> Generator[str, None, CommandResult]:
+        try:
+            result = yield from self._run_command(command_id, params)
+        finally:
+            if command_id in STATUS_CHANGING_COMMANDS:
+                self._status_cache.invalidate()
+        if command_id == "sync" and result.success:
+            yield "Refreshing Pi-Health file index"
+            self._refresh_file_index()
+        return result
+
+    def _run_command(
+        self,
+        command_id: str,
+        params: dict = None
     ) -> Generator[str, None, CommandResult]:
         params = params or {}
         log_tags = params.get("log_tags", True)
@@ -608,7 +688,11 @@ class SnapRAIDPlugin(StoragePlugin):
                     helper_params['percent'] = params['percent']
                 if command_id == "scrub" and 'age_days' in params:
                     helper_params['age_days'] = params['age_days']
-                result = helper_call('snapraid', helper_params)
+                result = helper_call(
+                    'snapraid',
+                    helper_params,
+                    timeout=LONG_COMMAND_TIMEOUT if command_id in LONG_COMMANDS else 30,
+                )
                 stdout = result.get('stdout', '')
                 stderr = result.get('stderr', '')
                 for line in stdout.splitlines():
@@ -884,12 +968,82 @@ class SnapRAIDPlugin(StoragePlugin):
                 )
         return errors
 
+    def _data_disks(self, config: dict) -> dict[str, str]:
+        return {
+            drive["name"]: drive["path"]
+            for drive in config.get("drives", [])
+            if drive.get("role") == "data" and drive.get("name") and drive.get("path")
+        }
+
+    def _refresh_file_index(self) -> None:
+        """Record the post-sync file list that the next safety check compares against."""
+        config = self.get_config()
+        try:
+            self._file_index.snapshot(self._data_disks(config), config.get("excludes", []))
+        except Exception as exc:
+            logger.warning("SnapRAID file index refresh failed: %s", exc)
+
+    def _estimate_changes(self, config: dict) -> dict | None:
+        try:
+            estimate = self._file_index.estimate(
+                self._data_disks(config), config.get("excludes", [])
+            )
+        except Exception as exc:
+            logger.warning("SnapRAID change estimate failed: %s", exc)
+            return None
+        if estimate is None or estimate["errors"]:
+            return None
+        # A sync run outside Pi-Health (the scheduled timer, the CLI) rewrites the
+        # content file without refreshing the snapshot; the estimate would then
+        # count already-synced changes, so defer to the real diff.
+        snapshot_at = min(disk["snapshot_at"] for disk in estimate["disks"].values())
+        for path in self._content_paths():
+            try:
+                if os.path.getmtime(path) > snapshot_at + 1:
+                    return None
+            except OSError:
+                continue
+        return estimate
+
     def _check_diff_thresholds(self) -> CommandResult:
         config = self.get_config()
         thresholds = config.get("thresholds", {})
         del_threshold = thresholds.get("delete_threshold", 50)
         upd_threshold = thresholds.get("update_threshold", 500)
 
+        estimate = self._estimate_changes(config)
+        if estimate is not None:
+            verdicts = [
+                self._estimate_verdict(estimate["removed"], del_threshold),
+                self._estimate_verdict(estimate["updated"], upd_threshold),
+            ]
+            if verdicts[0] == "over":
+                return CommandResult(
+                    success=False,
+                    message="",
+                    error=(
+                        "Delete threshold exceeded: about "
+                        f"{estimate['removed']} files removed (threshold: {del_threshold})"
+                    ),
+                    data={"force_allowed": True, "estimate": estimate},
+                )
+            if verdicts[1] == "over":
+                return CommandResult(
+                    success=False,
+                    message="",
+                    error=(
+                        "Update threshold exceeded: about "
+                        f"{estimate['updated']} files changed (threshold: {upd_threshold})"
+                    ),
+                    data={"force_allowed": True, "estimate": estimate},
+                )
+            if verdicts == ["under", "under"]:
+                return CommandResult(
+                    success=True,
+                    message="Diff safety check passed (estimated)",
+                    data={"estimate": estimate},
+                )
+
         try:
             result = subprocess.run(
                 [self.SNAPRAID_BIN, "diff"],
@@ -953,6 +1107,14 @@ class SnapRAIDPlugin(StoragePlugin):
 
         return CommandResult(success=True, message="Diff safety check passed")
 
+    @staticmethod
+    def _estimate_verdict(count: int, threshold: int) -> str:
+        if count > threshold * (1 + DIFF_ESTIMATE_MARGIN):
+            return "over"
+        if count < threshold * (1 - DIFF_ESTIMATE_MARGIN):
+            return "under"
+        return "close"
+
     def _record_force_override(self, username: object, reason: str, warning: str) -> bool:
         event = {
             "timestamp": datetime.now().isoformat(),
@@ -1047,58 +1209,17 @@ class SnapRAIDPlugin(StoragePlugin):
             "recovery_options": []
         }
 
-        output = ""
-        if helper_available():
-            try:
-                result = helper_call('snapraid', {'command': 'status'})
-                output = result.get('stdout', '')
-                if not result.get('success'):
-                    status["recoverable"] = False
-                    status["error"] = result.get('stderr', 'SnapRAID status failed')
-                    return status
-            except HelperError as exc:
-                status["recoverable"] = False
-                status["error"] = str(exc)
-                return status
-        else:
-            try:
-                result = subprocess.run(
-                    [self.SNAPRAID_BIN, "status"],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                if result.returncode != 0:
-                    status["recoverable"] = False
-                    status["error"] = result.stderr or "SnapRAID status failed"
-                    return status
-                output = result.stdout
-            except Exception as exc:
-                status["recoverable"] = False
-                status["error"] = str(exc)
-                return status
-
-        def _parse_count(label: str) -> int:
-            patterns = [
-                rf'{label}\s+file\s+(\d+)',
-                rf'(\d+)\s+{label}'
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, output, re.IGNORECASE)
-                if match:
-                    return int(match.group(1))
-            return 0
-
-        status["missing_files"] = _parse_count("missing")
-        status["damaged_files"] = _parse_count("damaged")
-
-        failed = []
-        for line in output.splitlines():
-            if "missing" in line.lower() and "disk" in line.lower():
-                parts = line.split()
-                failed.append(parts[-1])
-        if failed:
-            status["failed_drives"] = failed
+        try:
+            model = self._status_model(use_helper=helper_available())["model"]
+        except Exception as exc:
+            status["recoverable"] = False
+            status["error"] = str(exc)
+            return status
+
+        status["missing_files"] = model["missing_files"]
+        status["damaged_files"] = model["damaged_files"]
+        if model["failed_drives"]:
+            status["failed_drives"] = list(model["failed_drives"])
 
         if status["missing_files"] > 0:
             status["recovery_options"].append({
@@ -0,0 +1,248 @@
+"""
+Parse `snapraid status` into a structured model and cache it.
+
+`snapraid status` loads the whole content file, which takes tens of seconds on
+a large array, yet its answer only changes when the content file does (a sync,
+scrub or fix rewrites it) or as scrub ages drift by days. The model is cached
+per content fingerprint, in memory and beside the plugin state so the helper
+and the web process share one read.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+
+# Scrub ages are counted in days; re-reading a few times a day keeps them honest.
+STATUS_MAX_AGE_SECONDS = 6 * 60 * 60
+STATUS_CACHE_VERSION = 1
+
+_DISK_ROW = re.compile(
+    r"^\s*(?P<files>\d+)\s+(?P<fragmented>\d+)\s+(?P<excess>\d+)\s+"
+    r"(?P<wasted>-?[\d.]+|-)\s+(?P<used>\d+|-)\s+(?P<free>\d+|-)\s+"
+    r"(?P<use>\d+%|-)(?:\s+(?P<name>\S+))?\s*$"
+)
+_SCRUB_AGE = re.compile(
+    r"oldest block was scrubbed (\d+) days ago, the median (\d+), the newest (\d+)",
+    re.IGNORECASE,
+)
+_NOT_SCRUBBED = re.compile(r"The (\d+)% of the array is not scrubbed", re.IGNORECASE)
+_ERRORS = re.compile(r"there (?:are|is) (\d+) errors?", re.IGNORECASE)
+_SYNC_PROGRESS = re.compile(r"sync in progress at (\d+)%", re.IGNORECASE)
+_GRAPH_ROW = re.compile(r"^\s*(?:(\d+)%)?\|(.*)$")
+_GRAPH_AXIS = re.compile(r"^\s*(\d+)\s+days ago of the last scrub/sync\s+(\d+)\s*$")
+
+_memory_lock = threading.Lock()
+_memory_cache: dict[str, dict] = {}
+
+
+def _number(value: str) -> float | int | None:
+    if value in (None, "-"):
+        return None
+    if value.endswith("%"):
+        value = value[:-1]
+    return float(value) if "." in value else int(value)
+
+
+def _count(output: str, label: str) -> int:
+    for pattern in (rf"{label}\s+file\s+(\d+)", rf"(\d+)\s+{label}"):
+        match = re.search(pattern, output, re.IGNORECASE)
+        if match:
+            return int(match.group(1))
+    return 0
+
+
+def _histogram(lines: list[str]) -> list[dict]:
+    """Read the scrub-age bar chart back into ``{"days_ago", "percent"}`` bins.
+
+    The chart's top row is labelled with the tallest bar's share of blocks and
+    its x axis runs from the oldest scrub (left) to today (right).
+    """
+    rows = []
+    top_percent = None
+    oldest = newest = None
+    for line in lines:
+        axis = _GRAPH_AXIS.match(line)
+        if axis:
+            oldest, newest = int(axis.group(1)), int(axis.group(2))
+            continue
+        row = _GRAPH_ROW.match(line)
+        if row:
+            if row.group(1) is not None and top_percent is None:
+                top_percent = int(row.group(1))
+            rows.append(row.group(2).rstrip())
+    if not rows or top_percent is None or oldest is None:
+        return []
+    width = max(len(row) for row in rows)
+    height = len(rows)
+    bins = []
+    for column in range(width):
+        # Bars grow upwards from the baseline; the first row with ink is the bar top.
+        filled = next(
+            (index for index, row in enumerate(rows) if column < len(row) and row[column] not in " _"),
+            None,
+        )
+        if filled is None:
+            continue
+        share = top_percent * (height - filled) / height
+        days_ago = oldest - (oldest - newest) * column / max(1, width - 1)
+        bins.append({"days_ago": round(days_ago), "percent": round(share, 1)})
+    return bins
+
+
+def parse_snapraid_status(output: str) -> dict:
+    """Return the structured model for one `snapraid status` report."""
+    disks = []
+    totals = None
+    graph_lines: list[str] = []
+    in_graph = False
+    for line in output.splitlines():
+        if _GRAPH_ROW.match(line) or _GRAPH_AXIS.match(line):
+            in_graph = True
+            graph_lines.append(line)
+            continue
+        if in_graph and not line.strip():
+            in_graph = False
+        match = _DISK_ROW.match(line)
+        if not match:
+            continue
+        row = {
+            "files": int(match.group("files")),
+            "fragmented_files": int(match.group("fragmented")),
+            "excess_fragments": int(match.group("excess")),
+            "wasted_gb": _number(match.group("wasted")),
+            "used_gb": _number(match.group("used")),
+            "free_gb": _number(match.group("free")),
+            "use_percent": _number(match.group("use")),
+        }
+        if match.group("name"):
+            disks.append({"name": match.group("name"), **row})
+        else:
+            totals = row
+
+    lowered = output.lower()
+    scrub_age = _SCRUB_AGE.search(output)
+    not_scrubbed = _NOT_SCRUBBED.search(output)
+    errors = _ERRORS.search(output)
+    progress = _SYNC_PROGRESS.search(output)
+    failed_drives = [
+        line.split()[-1]
+        for line in output.splitlines()
+        if "missing" in line.lower() and "disk" in line.lower() and line.split()
+    ]
+    return {
+        "disks": disks,
+        "totals": totals,
+        "scrub": {
+            "oldest_days": int(scrub_age.group(1)) if scrub_age else None,
+            "median_days": int(scrub_age.group(2)) if scrub_age else None,
+            "newest_days": int(scrub_age.group(3)) if scrub_age else None,
+            "not_scrubbed_percent": int(not_scrubbed.group(1)) if not_scrubbed else 0,
+            "histogram": _histogram(graph_lines),
+        },
+        "sync_required": (
+            "not fully synced" in lowered
+            or ("sync" in lowered and "required" in lowered)
+        ),
+        "sync_in_progress": progress is not None,
+        "sync_progress_percent": int(progress.group(1)) if progress else None,
+        "rehash_required": "rehash is needed" in lowered,
+        "no_error_detected": "no error detected" in lowered,
+        "errors": int(errors.group(1)) if errors else 0,
+        "missing_files": _count(output, "missing"),
+        "damaged_files": _count(output, "damaged"),
+        "failed_drives": failed_drives,
+    }
+
+
+def content_fingerprint(conf_path: str, content_paths: list[str]) -> list:
+    """What the status depends on: the config and each content file's size and mtime."""
+    fingerprint = []
+    for path in [conf_path, *sorted(content_paths)]:
+        try:
+            stat = os.stat(path)
+            fingerprint.append([path, stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            fingerprint.append([path, None, None])
+    return fingerprint
+
+
+class SnapRAIDStatusCache:
+    """Memoise parsed status per fingerprint in memory and in a JSON file."""
+
+    def __init__(self, cache_path: str, *, clock=time.time, max_age_seconds: float = STATUS_MAX_AGE_SECONDS):
+        self._cache_path = cache_path
+        self._clock = clock
+        self._max_age = max_age_seconds
+
+    def get(self, fingerprint: list) -> dict | None:
+        with _memory_lock:
+            entry = _memory_cache.get(self._cache_path)
+        if entry is None:
+            entry = self._read_file()
+            if entry is not None:
+                with _memory_lock:
+                    _memory_cache[self._cache_path] = entry
+        if (
+            entry is None
+            or entry.get("fingerprint") != fingerprint
+            or self._clock() - entry.get("checked_at", 0) > self._max_age
+        ):
+            return None
+        return entry
+
+    def put(self, fingerprint: list, model: dict) -> dict:
+        entry = {
+            "version": STATUS_CACHE_VERSION,
+            "fingerprint": fingerprint,
+            "checked_at": self._clock(),
+            "model": model,
+        }
+        with _memory_lock:
+            _memory_cache[self._cache_path] = entry
+        self._write_file(entry)
+        return entry
+
+    def invalidate(self) -> None:
+        with _memory_lock:
+            _memory_cache.pop(self._cache_path, None)
+        try:
+            os.remove(self._cache_path)
+        except OSError:
+            pass
+
+    def _read_file(self) -> dict | None:
+        try:
+            with open(self._cache_path) as handle:
+                entry = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != STATUS_CACHE_VERSION:
+            return None
+        return entry
+
+    def _write_file(self, entry: dict) -> None:
+        directory = os.path.dirname(self._cache_path) or "."
+        try:
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".snapraid_status.", suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as handle:
+                json.dump(entry, handle)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, self._cache_path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+def checked_at_iso(entry: dict) -> str:
+    return datetime.fromtimestamp(entry["checked_at"], tz=timezone.utc).isoformat()
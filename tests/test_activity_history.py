@@ -0,0 +1,197 @@
+import sqlite3
+from unittest.mock import Mock
+
+import pytest
+
+from activity_history import ActivityHistoryStore
+from activity_service import ActivityService, HttpResponse
+from metric_history import RETENTION_SECONDS, InvalidMetricRange
+
+
+NOW = 2_000_000_020
+
+
+def aggregate(streams=0, transcodes=0, download_speed=0.0, queue_problems=0):
+    return {
+        "streams": streams,
+        "transcodes": transcodes,
+        "download_speed": download_speed,
+        "queue_problems": queue_problems,
+    }
+
+
+def test_observations_are_averaged_into_one_row_per_minute(tmp_path):
+    database = tmp_path / "metrics.sqlite3"
+    store = ActivityHistoryStore(database, clock=lambda: NOW)
+
+    store.observe({"jellyfin": aggregate(streams=2, transcodes=1)}, observed_at=NOW - 40)
+    store.observe({"jellyfin": aggregate(streams=4, transcodes=1)}, observed_at=NOW - 32)
+    store.observe({"sabnzbd": aggregate(download_speed=1000, queue_problems=1)}, observed_at=NOW - 24)
+    assert not database.exists()
+
+    # Crossing the minute boundary writes the closed bucket.
+    store.observe({"jellyfin": aggregate()}, observed_at=NOW + 30)
+
+    with sqlite3.connect(database) as connection:
+        rows = connection.execute(
+            "SELECT bucket_at, source, streams, transcodes, download_speed, queue_problems "
+            "FROM activity_samples ORDER BY source"
+        ).fetchall()
+    assert rows == [
+        (NOW - 40, "jellyfin", 3.0, 1.0, 0.0, 0.0),
+        (NOW - 40, "sabnzbd", 0.0, 0.0, 1000.0, 1.0),
+    ]
+
+
+def test_flush_writes_the_open_bucket_and_prunes_expired_rows(tmp_path):
+    database = tmp_path / "metrics.sqlite3"
+    store = ActivityHistoryStore(database, clock=lambda: NOW)
+    store.observe({"jellyfin": aggregate(streams=1)}, observed_at=NOW - RETENTION_SECONDS - 600)
+    store.observe({"jellyfin": aggregate(streams=1)}, observed_at=NOW)
+    store.flush()
+
+    with sqlite3.connect(database) as connection:
+        rows = connection.execute("SELECT bucket_at FROM activity_samples").fetchall()
+    assert rows == [(NOW - NOW % 60,)]
+
+
+def test_flush_keeps_the_bucket_open_for_later_observations(tmp_path):
+    database = tmp_path / "metrics.sqlite3"
+    store = ActivityHistoryStore(database, clock=lambda: NOW)
+    store.observe({"jellyfin": aggregate(streams=2)}, observed_at=NOW - 20)
+    store.flush()
+    store.observe({"jellyfin": aggregate(streams=4)}, observed_at=NOW - 10)
+    store.flush()
+
+    with sqlite3.connect(database) as connection:
+        rows = connection.execute("SELECT bucket_at, streams FROM activity_samples").fetchall()
+    assert rows == [(NOW - NOW % 60, 3.0)]
+
+
+def test_idle_refresher_keeps_sampling_history_and_flushes_on_stop():
+    now = [100.0]
+    recorded = []
+    flushed = []
+    service = ActivityService(
+        container_provider=lambda: [],
+        inspect_reader=lambda container_id: {},
+        clock=lambda: now[0],
+        history_recorder=recorded.append,
+        history_flusher=lambda: flushed.append(True),
+        history_interval_seconds=60.0,
+    )
+
+    assert service._has_a_reader() is False
+    assert service._history_due() is True
+    service.refresh()
+    assert service._history_due() is False
+    now[0] += 60
+    assert service._history_due() is True
+
+    service.stop()
+    assert flushed == [True]
+
+
+def test_query_returns_totals_and_a_series_per_service(tmp_path):
+    store = ActivityHistoryStore(tmp_path / "metrics.sqlite3", clock=lambda: NOW)
+    store.observe(
+        {
+            "jellyfin": aggregate(streams=2, transcodes=1),
+            "sabnzbd": aggregate(download_speed=500),
+        },
+        observed_at=NOW - 600,
+    )
+    store.observe({"jellyfin": aggregate(streams=1)}, observed_at=NOW - 60)
+    store.flush()
+
+    history = store.query("24h")
+
+    assert history["range"] == "24h"
+    assert history["bucket_seconds"] == 300
+    totals = [point for point in history["points"] if point["streams"] is not None]
+    assert [point["streams"] for point in totals] == [2.0, 1.0]
+    assert totals[0]["download_speed"] == 500.0
+    assert [service["source"] for service in history["services"]] == ["jellyfin", "sabnzbd"]
+    assert len(history["services"][0]["points"]) == 2
+
+
+def test_query_without_a_database_is_empty(tmp_path):
+    history = ActivityHistoryStore(tmp_path / "missing.sqlite3", clock=lambda: NOW).query("7d")
+    assert history["points"] == []
+    assert history["services"] == []
+
+
+def test_query_rejects_unknown_ranges(tmp_path):
+    with pytest.raises(InvalidMetricRange):
+        ActivityHistoryStore(tmp_path / "metrics.sqlite3").query("90d")
+
+
+def test_activity_service_records_aggregates_before_display_truncation():
+    import json
+
+    recorded = []
+    slots = [
+        {"filename": f"item-{index}", "status": "Downloading", "percentage": "1"}
+        for index in range(20)
+    ]
+
+    def transport(method, url, headers=None, body=None, timeout=None):
+        payload = {"queue": {"kbpersec": "10", "slots": slots}}
+        return HttpResponse(200, {}, json.dumps(payload).encode("utf-8"))
+
+    service = ActivityService(
+        container_provider=lambda: [
+            {
+                "id": "sab-id",
+                "name": "sabnzbd",
+                "status": "running",
+                "image": "linuxserver/sabnzbd",
+                "ports": [{"container_port": 8080, "host_port": 8080, "protocol": "tcp"}],
+            }
+        ],
+        inspect_reader=lambda container_id: {
+            "mounts": [{"source": "/srv/config", "destination": "/config"}]
+        },
+        transport=transport,
+        credential_readers={"sabnzbd": lambda root: "sab-key"},
+        history_recorder=recorded.append,
+        ttl_seconds=0.0,
+    )
+    service.snapshot()
+
+    assert recorded == [
+        {
+            "sabnzbd": {
+                "streams": 0,
+                "transcodes": 0,
+                # The service caps the request at 12 slots, each reporting the
+                # overall 10 kB/s rate.
+                "download_speed": 12 * 10 * 1024.0,
+                "queue_problems": 0,
+            }
+        }
+    ]
+
+
+def test_activity_history_requires_authentication(client):
+    assert client.get("/api/activity/history?range=24h").status_code == 401
+
+
+def test_activity_history_delegates_to_injected_service(authenticated_client):
+    service = Mock()
+    service.query.return_value = {"range": "7d", "points": [], "services": []}
+    authenticated_client.application.extensions["activity_history_service"] = service
+
+    response = authenticated_client.get("/api/activity/history?range=7d")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"range": "7d", "points": [], "services": []}
+    service.query.assert_called_once_with("7d")
+
+
+def test_activity_history_returns_400_for_invalid_range(authenticated_client):
+    service = Mock()
+    service.query.side_effect = InvalidMetricRange("range must be one of: 24h, 7d, 30d")
+    authenticated_client.application.extensions["activity_history_service"] = service
+
+    assert authenticated_client.get("/api/activity/history?range=90d").status_code == 400
@@ -404,3 +404,129 @@ def test_the_snapshot_is_cached_between_calls():
     service.snapshot()
     service.snapshot()
     assert len(transport.requests) == 1
+
+
+class Clock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_config_roots_and_credentials_are_cached_until_the_container_restarts():
+    transport = FakeTransport({"/api/v3/queue": ok({"totalRecords": 0, "records": []})})
+    sonarr = container("sonarr", ports=[published(8989, 8989)])
+    sonarr["started_at"] = "2026-07-25T10:00:00Z"
+    inspected, reads = [], []
+    clock = Clock()
+    service = ActivityService(
+        container_provider=lambda: [sonarr],
+        inspect_reader=lambda container_id: inspected.append(container_id)
+        or {"mounts": [{"source": "/srv/config", "destination": "/config"}]},
+        transport=transport,
+        credential_readers={"arr": lambda root: reads.append(root) or "arr-key"},
+        wall_clock=lambda: NOW,
+        ttl_seconds=8.0,
+        clock=clock,
+    )
+
+    service.snapshot()
+    clock.now += 10
+    service.snapshot()
+    assert len(transport.requests) == 2
+    assert inspected == ["sonarr-id"]
+    assert reads == ["/srv/config"]
+
+    sonarr["started_at"] = "2026-07-25T11:00:00Z"
+    clock.now += 10
+    service.snapshot()
+    assert inspected == ["sonarr-id", "sonarr-id"]
+    assert reads == ["/srv/config", "/srv/config"]
+
+
+def test_a_failed_call_forgets_the_cached_credential():
+    responses = [HttpResponse(401, {}, b""), ok({"totalRecords": 0, "records": []})]
+    transport = FakeTransport({"/api/v3/queue": lambda method, headers: responses.pop(0)})
+    reads = []
+    clock = Clock()
+    service = ActivityService(
+        container_provider=lambda: [container("sonarr", ports=[published(8989, 8989)])],
+        inspect_reader=lambda container_id: {
+            "mounts": [{"source": "/srv/config", "destination": "/config"}]
+        },
+        transport=transport,
+        credential_readers={"arr": lambda root: reads.append(root) or "arr-key"},
+        wall_clock=lambda: NOW,
+        ttl_seconds=8.0,
+        clock=clock,
+    )
+
+    assert service.snapshot()["services"][0]["reachable"] is False
+    clock.now += 10
+    assert service.snapshot()["services"][0]["reachable"] is True
+    assert len(reads) == 2
+
+
+def test_a_stale_snapshot_is_served_while_the_refresher_catches_up():
+    import threading
+
+    release = threading.Event()
+    calls = []
+
+    def slow_queue(method, headers):
+        calls.append(method)
+        if len(calls) > 1:
+            release.wait(5)
+        return ok({"totalRecords": len(calls), "records": []})
+
+    clock = Clock()
+    service = ActivityService(
+        container_provider=lambda: [container("sonarr", ports=[published(8989, 8989)])],
+        inspect_reader=lambda container_id: {
+            "mounts": [{"source": "/srv/config", "destination": "/config"}]
+        },
+        transport=FakeTransport({"/api/v3/queue": slow_queue}),
+        credential_readers={"arr": lambda root: "arr-key"},
+        wall_clock=lambda: NOW,
+        ttl_seconds=8.0,
+        clock=clock,
+    )
+    first = service.snapshot()
+    service.start()
+    try:
+        clock.now += 10
+        # The refresher is blocked on the slow service; the read must not be.
+        assert service.snapshot() is first
+        release.set()
+        for _ in range(100):
+            if service.snapshot()["queues"][0]["total"] == 2:
+                break
+            threading.Event().wait(0.02)
+        assert service.snapshot()["queues"][0]["total"] == 2
+    finally:
+        release.set()
+        service.stop()
+
+
+def test_the_refresher_idles_without_readers():
+    transport = FakeTransport({"/api/v3/queue": ok({"totalRecords": 0, "records": []})})
+    clock = Clock()
+    service = ActivityService(
+        container_provider=lambda: [container("sonarr", ports=[published(8989, 8989)])],
+        inspect_reader=lambda container_id: {
+            "mounts": [{"source": "/srv/config", "destination": "/config"}]
+        },
+        transport=transport,
+        credential_readers={"arr": lambda root: "arr-key"},
+        wall_clock=lambda: NOW,
+        ttl_seconds=8.0,
+        idle_after_seconds=60.0,
+        clock=clock,
+    )
+
+    assert service._has_a_reader() is False
+    service.snapshot()
+    assert service._has_a_reader() is True
+    clock.now += 61
+    assert service._has_a_reader() is False
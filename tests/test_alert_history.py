@@ -89,3 +89,81 @@ def test_oversized_ledger_fails_closed(tmp_path):
 
 def test_default_record_bound_is_small():
     assert MAX_ALERT_EVENTS == 200
+
+
+def test_record_appends_in_place_until_compaction(tmp_path):
+    path = tmp_path / "events.jsonl"
+    ledger = AlertEventLedger(path, max_records=3)
+    ledger.record(note("incident", key="container:a"))
+    inode = path.stat().st_ino
+
+    ledger.record(note("incident", key="container:b"))
+    assert path.stat().st_ino == inode
+    assert len(path.read_text().splitlines()) == 2
+
+    for key in ("c", "d", "e", "f"):
+        ledger.record(note("incident", key=f"container:{key}"))
+
+    # Six lines reached twice the retained count: rewritten down to the newest three.
+    assert path.stat().st_ino != inode
+    assert [json.loads(line)["key"] for line in path.read_text().splitlines()] == [
+        "container:d",
+        "container:e",
+        "container:f",
+    ]
+    assert ledger.record(note("incident", key="container:f")) is False
+
+
+def test_reader_in_another_process_follows_appends_and_compaction(tmp_path):
+    path = tmp_path / "events.jsonl"
+    writer = AlertEventLedger(path, max_records=2)
+    reader = AlertEventLedger(path, max_records=2)
+
+    writer.record(note("incident", key="container:a"))
+    assert [record["key"] for record in reader.recent()] == ["container:a"]
+
+    writer.record(note("incident", key="container:b"))
+    writer.record(note("incident", key="container:c"))
+    writer.record(note("recovery", key="container:c"))
+    assert [(record["key"], record["event"]) for record in reader.recent(limit=5)] == [
+        ("container:c", "recovery"),
+        ("container:c", "incident"),
+    ]
+
+
+def test_recent_reads_nothing_when_the_ledger_is_unchanged(tmp_path, monkeypatch):
+    path = tmp_path / "events.jsonl"
+    ledger = AlertEventLedger(path)
+    ledger.record(note("incident"))
+    ledger.recent()
+
+    opened = []
+    original_open = type(path).open
+
+    def tracking_open(self, *args, **kwargs):
+        opened.append(self)
+        return original_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(path), "open", tracking_open)
+
+    assert ledger.recent(event="incident")[0]["key"] == "container:jellyfin"
+    assert opened == []
+
+
+def test_a_partially_written_line_waits_for_its_newline(tmp_path):
+    path = tmp_path / "events.jsonl"
+    record = {
+        "at": "2026-07-15T12:00:00Z",
+        "event": "incident",
+        "key": "container:a",
+        "kind": "container",
+        "severity": "warning",
+        "summary": "Stopped",
+    }
+    line = json.dumps(record)
+    path.write_text(line[:20])
+    ledger = AlertEventLedger(path)
+    assert ledger.records() == []
+
+    path.write_text(line + "\n")
+    assert [item["key"] for item in ledger.records()] == ["container:a"]
@@ -0,0 +1,172 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from alert_daemon import run_once
+from alert_evaluator import AlertEvaluator, AlertEvaluatorConfig, Notification
+from alert_notifier import MattermostWebhookNotifier
+from alert_outbox import NotificationQueue
+from alert_signals import ContainerRecord, container_signals
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    def log_message(self, *_args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length))
+        server = self.server
+        if server.failures_left > 0:
+            server.failures_left -= 1
+            status = 503
+        else:
+            server.posts.append(payload)
+            status = 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        with server.changed:
+            server.changed.notify_all()
+
+
+@pytest.fixture
+def webhook():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), WebhookHandler)
+    server.daemon_threads = True
+    server.posts = []
+    server.failures_left = 0
+    server.changed = threading.Condition()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def webhook_url(server):
+    host, port = server.server_address
+    return f"http://{host}:{port}/hooks/alerts"
+
+
+def note(key, event="incident", severity="warning"):
+    return Notification(event, key, "container", severity, f"{key} stopped", "2026-07-15T12:00:00+00:00")
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_a_burst_in_one_tick_becomes_a_single_digest(tmp_path, webhook):
+    notifier = MattermostWebhookNotifier(webhook_url(webhook))
+    queue = NotificationQueue(tmp_path / "outbox.json", deliver=notifier.deliver, burst_size=3)
+
+    queue.send_batch([note(f"container:app{index}") for index in range(30)])
+    assert queue.deliver_due() == 1
+
+    assert len(webhook.posts) == 1
+    digest = webhook.posts[0]["attachments"][0]
+    assert digest["title"] == "Alert digest: 30 incidents"
+    lines = digest["text"].splitlines()
+    assert len(lines) == 26
+    assert lines[-1] == "- …and 5 more"
+    assert queue.pending == 0
+
+
+def test_a_small_tick_is_posted_as_individual_messages(tmp_path, webhook):
+    notifier = MattermostWebhookNotifier(webhook_url(webhook))
+    queue = NotificationQueue(tmp_path / "outbox.json", deliver=notifier.deliver, burst_size=3)
+
+    queue.send_batch([note("container:a"), note("container:b", event="recovery")])
+    queue.deliver_due()
+
+    assert [post["attachments"][0]["title"] for post in webhook.posts] == [
+        "🟠 Warning: container:a",
+        "✅ Recovered: container:b",
+    ]
+
+
+def test_failed_posts_back_off_and_survive_a_restart(tmp_path, webhook):
+    webhook.failures_left = 2
+    clock = Clock()
+    path = tmp_path / "outbox.json"
+    notifier = MattermostWebhookNotifier(webhook_url(webhook))
+    results = []
+    queue = NotificationQueue(
+        path,
+        deliver=notifier.deliver,
+        clock=clock,
+        base_backoff_seconds=10,
+        on_result=lambda notes, error: results.append(error is None),
+    )
+    queue.send_batch([note("container:a"), note("container:b")])
+
+    assert queue.deliver_due() == 0
+    clock.now += 5
+    assert queue.deliver_due() == 0  # still backing off; nothing posted
+    clock.now += 5
+    assert queue.deliver_due() == 0  # second failure doubles the delay
+
+    restarted = NotificationQueue(path, deliver=notifier.deliver, clock=clock, base_backoff_seconds=10)
+    assert restarted.pending == 2
+    clock.now += 19
+    assert restarted.deliver_due() == 0
+    clock.now += 1
+    assert restarted.deliver_due() == 2
+    assert [post["attachments"][0]["title"] for post in webhook.posts] == [
+        "🟠 Warning: container:a",
+        "🟠 Warning: container:b",
+    ]
+    assert results == [False, False]
+
+
+def test_worker_thread_delivers_without_blocking_the_caller(tmp_path, webhook):
+    notifier = MattermostWebhookNotifier(webhook_url(webhook))
+    queue = NotificationQueue(tmp_path / "outbox.json", deliver=notifier.deliver)
+    queue.start()
+    try:
+        with webhook.changed:
+            queue.send(note("container:a"))
+            assert webhook.changed.wait_for(lambda: webhook.posts, timeout=5)
+    finally:
+        queue.stop()
+    assert queue.pending == 0
+
+
+def test_entries_older_than_the_max_age_are_dropped(tmp_path):
+    clock = Clock()
+    queue = NotificationQueue(
+        tmp_path / "outbox.json",
+        deliver=lambda notes: (_ for _ in ()).throw(OSError("down")),
+        clock=clock,
+        max_age_seconds=60,
+    )
+    queue.send(note("container:a"))
+    queue.deliver_due()
+    clock.now += 61
+    queue.deliver_due()
+    assert queue.pending == 0
+
+
+def test_run_once_hands_the_tick_to_the_queue(tmp_path):
+    batches = []
+    queue = NotificationQueue(tmp_path / "outbox.json", deliver=batches.append, burst_size=1)
+    evaluator = AlertEvaluator(
+        state_path=tmp_path / "alerts.json",
+        config=AlertEvaluatorConfig(fail_threshold=1),
+    )
+    records = [ContainerRecord(name, False, None, "always") for name in ("a", "b")]
+
+    notifications = run_once(lambda: container_signals(records), evaluator, queue)
+
+    assert len(notifications) == 2
+    assert batches == []  # nothing posted inside the evaluation tick
+    queue.deliver_due()
+    assert [[item.key for item in batch] for batch in batches] == [["container:a", "container:b"]]
@@ -1,15 +1,23 @@
+import select
+import threading
+import time
 from types import SimpleNamespace
 
 from alert_daemon import (
+    Wakeup,
     build_live_provider,
+    cadenced,
     collect_signals,
     config_from_env,
     container_records,
+    docker_event_action,
     mounts_present,
     run_once,
     smart_passed,
+    watch_docker_events,
+    watch_mountinfo,
 )
-from alert_evaluator import AlertEvaluator, AlertEvaluatorConfig
+from alert_evaluator import AlertEvaluator, AlertEvaluatorConfig, Signal
 from alert_notifier import RecordingNotifier
 from alert_signals import (
     ContainerRecord,
@@ -189,3 +197,122 @@ def test_build_live_provider_combines_sources():
     )
     keys = {s.key for s in provider()}
     assert keys == {"container:jellyfin", "smart:/dev/sda", "mount:/mnt/parity", "snapraid:status"}
+
+
+def test_cadenced_source_repeats_last_reading_until_due():
+    now = [0.0]
+    reads = []
+
+    def source():
+        reads.append(now[0])
+        return [Signal("smart:/dev/sda", True, "ok", "smart", "critical")]
+
+    slow = cadenced(source, 900, clock=lambda: now[0])
+    assert slow() == slow()
+    now[0] = 901
+    slow()
+    assert reads == [0.0, 901]
+
+
+def test_build_live_provider_reads_smart_and_snapraid_on_the_slow_cadence():
+    now = [0.0]
+    calls = {"smart": 0, "snapraid": 0, "mounts": 0}
+
+    def counted(name, value):
+        def read():
+            calls[name] += 1
+            return value
+        return read
+
+    provider = build_live_provider(
+        list_containers=lambda: [],
+        smart_devices=counted("smart", {"disks": [{"device": "/dev/sda", "data": {"passed": True}}]}),
+        snapraid_status=counted("snapraid", {"status": "healthy"}),
+        read_proc_mounts=counted("mounts", ""),
+        required_mounts=["/mnt/disk1"],
+        slow_interval_seconds=900,
+        clock=lambda: now[0],
+    )
+    for _ in range(3):
+        keys = {signal.key for signal in provider()}
+    assert keys == {"smart:/dev/sda", "mount:/mnt/disk1", "snapraid:status"}
+    assert calls == {"smart": 1, "snapraid": 1, "mounts": 3}
+
+
+def test_wakeup_coalesces_a_burst_into_one_evaluation():
+    wakeup = Wakeup()
+    assert wakeup.wait(0) == set()
+    wakeup.signal("container")
+    wakeup.signal("container")
+    wakeup.signal("mount")
+    assert wakeup.wait(5) == {"container", "mount"}
+    assert wakeup.wait(0) == set()
+
+
+def test_wakeup_settles_a_burst_into_one_return():
+    wakeup = Wakeup()
+    returns = []
+    waiter = threading.Thread(target=lambda: returns.append(wakeup.wait(5, settle=0.5)))
+    waiter.start()
+    for reason in ("container", "mount", "container", "smart", "mount"):
+        wakeup.signal(reason)
+        time.sleep(0.02)
+    waiter.join(timeout=5)
+
+    assert returns == [{"container", "mount", "smart"}]
+    assert wakeup.wait(0) == set()
+
+
+def test_docker_events_wake_only_for_alerting_actions():
+    wakeup = Wakeup()
+    stop = threading.Event()
+    streams = iter([
+        [
+            {"Type": "container", "Action": "exec_start: sh"},
+            {"Type": "network", "Action": "die"},
+        ],
+        [{"Type": "container", "Action": "health_status: unhealthy"}],
+    ])
+
+    def events():
+        try:
+            return next(streams)
+        except StopIteration:
+            stop.set()
+            return []
+
+    watch_docker_events(events, wakeup, stop=stop, retry_seconds=0)
+    # The first stream ending wakes the loop (events may have been missed), as does the
+    # health change in the second.
+    assert wakeup.wait(0) == {"container"}
+    assert docker_event_action({"status": "oom"}) == "oom"
+
+
+def test_mountinfo_change_wakes_the_loop(tmp_path):
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_text("36 35 98:0 / /mnt/disk1 rw - ext4 /dev/sda1 rw\n")
+    wakeup = Wakeup()
+    stop = threading.Event()
+
+    class FakePoller:
+        def __init__(self):
+            self.ticks = iter([[], [(3, select.POLLPRI)]])
+
+        def register(self, _fd, mask):
+            assert mask & select.POLLPRI
+
+        def poll(self, _timeout):
+            try:
+                return next(self.ticks)
+            except StopIteration:
+                stop.set()
+                return []
+
+    watch_mountinfo(wakeup, stop=stop, path=str(mountinfo), poller_factory=FakePoller)
+    assert wakeup.wait(0) == {"mount"}
+
+
+def test_config_from_env_reads_event_cadence():
+    config = config_from_env({"LIMEOS_ALERT_SLOW_POLL_SECONDS": "1800"})
+    assert config.slow_poll_seconds == 1800
+    assert config.confirm_seconds == 15
@@ -0,0 +1,163 @@
+import io
+import os
+import subprocess
+import tarfile
+
+import pytest
+
+from backup_index import (
+    BackupIndexError,
+    FrameWriter,
+    MemberStream,
+    TarIndexer,
+    build_index,
+    load_index,
+    select_entries,
+    write_index,
+)
+
+
+def make_tar(fmt):
+    long_dir = "d" * 120
+    members = {
+        "opt/stacks/app/.env": b"KEY=value\n",
+        f"opt/stacks/{long_dir}/config.xml": os.urandom(3000),
+        "opt/stacks/app/empty": b"",
+    }
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w", format=fmt) as archive:
+        directory = tarfile.TarInfo("opt/stacks/app")
+        directory.type = tarfile.DIRTYPE
+        directory.mode = 0o755
+        archive.addfile(directory)
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o600
+            info.mtime = 1_700_000_000
+            archive.addfile(info, io.BytesIO(data))
+    buffer.seek(0)
+    with tarfile.open(fileobj=buffer) as archive:
+        offsets = {
+            "/" + info.name: (info.offset, info.offset_data) for info in archive.getmembers()
+        }
+    return buffer.getvalue(), members, offsets
+
+
+@pytest.mark.parametrize("fmt", [tarfile.GNU_FORMAT, tarfile.PAX_FORMAT])
+def test_indexer_records_offsets_through_long_names(fmt):
+    stream, members, offsets = make_tar(fmt)
+    indexer = TarIndexer()
+    for start in range(0, len(stream), 777):
+        indexer.feed(stream[start:start + 777])
+
+    assert not indexer.failed
+    entries = {entry["path"]: entry for entry in indexer.entries}
+    assert set(entries) == set(offsets)
+    for path, (offset, data_offset) in offsets.items():
+        assert (entries[path]["offset"], entries[path]["data_offset"]) == (offset, data_offset)
+    long_path = next(path for path in entries if "ddd" in path)
+    assert entries[long_path]["size"] == 3000
+    assert entries["/opt/stacks/app"]["type"] == "dir"
+    assert entries["/opt/stacks/app/.env"]["mode"] == 0o600
+    assert len(entries["/opt/stacks/app/.env"]["hash"]) == 64
+
+
+def test_frames_and_member_stream_restore_selected_paths(tmp_path):
+    stream, members, _offsets = make_tar(tarfile.GNU_FORMAT)
+    archive_path = tmp_path / "pi-health-backup-1.tar.gz"
+    indexer = TarIndexer()
+    with open(archive_path, "wb") as output:
+        frames = FrameWriter(
+            lambda: subprocess.Popen(["gzip", "-1"], stdin=subprocess.PIPE, stdout=output),
+            lambda: os.lseek(output.fileno(), 0, os.SEEK_CUR),
+            frame_size=1024,
+            tap=indexer.feed,
+        )
+        frames.write(stream)
+        frames.close()
+    write_index(str(archive_path), build_index(archive_path.name, "gz", frames.frames, indexer))
+
+    # Concatenated frames still decompress as one ordinary archive.
+    with tarfile.open(archive_path) as archive:
+        assert archive.extractfile("opt/stacks/app/.env").read() == b"KEY=value\n"
+
+    index = load_index(str(archive_path))
+    assert len(index["frames"]) == -(-len(stream) // 1024)
+    selection = select_entries(index["entries"], ["/opt/stacks/app"])
+    assert [entry["path"] for entry in selection] == [
+        "/opt/stacks/app",
+        "/opt/stacks/app/.env",
+        "/opt/stacks/app/empty",
+    ]
+    decompressed = []
+
+    def decompress(data):
+        decompressed.append(len(data))
+        return subprocess.run(["gzip", "-d", "-c"], input=data, capture_output=True).stdout
+
+    reader = MemberStream(str(archive_path), index, selection, decompress)
+    extracted = b"".join(iter(lambda: reader.read(65536), b""))
+    reader.close()
+
+    assert len(extracted) == reader.total
+    assert len(decompressed) < len(index["frames"])
+    with tarfile.open(fileobj=io.BytesIO(extracted)) as archive:
+        assert archive.getnames() == ["opt/stacks/app", "opt/stacks/app/.env", "opt/stacks/app/empty"]
+        assert archive.extractfile("opt/stacks/app/.env").read() == b"KEY=value\n"
+
+    # A member that fails verification is never handed out, even in part.
+    selection[1]["hash"] = "0" * 64
+    reader = MemberStream(str(archive_path), index, selection, decompress)
+    handed_out = []
+    with pytest.raises(BackupIndexError, match="/opt/stacks/app/.env differs"):
+        for piece in iter(lambda: reader.read(65536), b""):
+            handed_out.append(piece)
+    reader.close()
+    assert b"KEY=value" not in b"".join(handed_out)
+
+
+@pytest.mark.parametrize("fmt", [tarfile.GNU_FORMAT, tarfile.PAX_FORMAT])
+def test_selecting_a_hard_link_brings_its_target(fmt):
+    buffer = io.BytesIO()
+    target = "srv/" + "t" * 120 + "/data.bin"
+    with tarfile.open(fileobj=buffer, mode="w", format=fmt) as archive:
+        info = tarfile.TarInfo(target)
+        info.size = 4
+        archive.addfile(info, io.BytesIO(b"data"))
+        link = tarfile.TarInfo("srv/seed/data.bin")
+        link.type = tarfile.LNKTYPE
+        link.linkname = target
+        archive.addfile(link)
+    indexer = TarIndexer()
+    indexer.feed(buffer.getvalue())
+
+    selection = select_entries(indexer.entries, ["/srv/seed"])
+
+    assert [entry["path"] for entry in selection] == ["/" + target, "/srv/seed/data.bin"]
+    del indexer.entries[1]["link"]
+    with pytest.raises(BackupIndexError, match="without its target"):
+        select_entries(indexer.entries, ["/srv/seed"])
+
+
+def test_failed_compressor_stops_the_writer(tmp_path):
+    with open(tmp_path / "out", "wb") as output:
+        frames = FrameWriter(
+            lambda: subprocess.Popen(["sh", "-c", "exit 3"], stdin=subprocess.PIPE, stdout=output),
+            lambda: 0,
+            frame_size=16,
+        )
+        with pytest.raises(BrokenPipeError):
+            for _ in range(4):
+                frames.write(b"x" * 16)
+        assert frames.returncode == 3
+        assert frames.frames == []
+
+
+def test_missing_or_foreign_index_is_rejected(tmp_path):
+    archive = tmp_path / "pi-health-backup-1.tar.zst"
+    with pytest.raises(BackupIndexError, match="no index"):
+        load_index(str(archive))
+    (tmp_path / "pi-health-backup-1.tar.zst.index.json").write_text('{"version": 9}')
+    with pytest.raises(BackupIndexError, match="Unsupported"):
+        load_index(str(archive))
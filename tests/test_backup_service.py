@@ -1,6 +1,8 @@
 """Tests for the framework-neutral BackupService and its route delegation."""
 
 import json
+import os
+import time
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import Mock
@@ -252,7 +254,14 @@ def test_restore_stops_and_starts_stacks():
     result = service.restore("pi-health-backup-20240101.tar.zst")
     assert result["stopped"] == ["alpha"]
     assert result["started"] == ["alpha"]
-    assert ("backup_restore", {"archive_path": "/mnt/backup/pi-health-backup-20240101.tar.zst"}) in helper.calls
+    assert (
+        "backup_restore",
+        {
+            "archive_path": "/mnt/backup/pi-health-backup-20240101.tar.zst",
+            "low_priority": True,
+            "background": True,
+        },
+    ) in helper.calls
 
 
 def test_restore_rejects_traversal_name():
@@ -323,6 +332,272 @@ def test_restore_plugins_success_persists_result():
     assert repo.writes[-1]["last_plugin_backup"] == FIXED_NOW.isoformat()
 
 
+def test_snapshot_mode_relays_helper_job_progress():
+    helper = FakeHelper(
+        responses=[
+            {"success": True, "job_id": "job-1"},
+            {"success": True, "events": [{"type": "progress", "files": 3}], "cursor": 1, "done": False},
+            {"success": True, "events": [], "cursor": 1, "done": False},
+            {
+                "success": True,
+                "events": [],
+                "cursor": 1,
+                "done": True,
+                "result": {"success": True, "snapshot": "pi-health-backup-20260102_030405"},
+            },
+        ]
+    )
+    service = make_service(
+        helper=helper, config={"backup_mode": "snapshot", "plugin_backup_enabled": False}
+    )
+    sleeps = []
+    service._sleep = sleeps.append
+
+    events = list(service.stream_backup())
+
+    assert events[0] == {"type": "progress", "files": 3, "target": "pi-health-backup"}
+    assert events[-1]["done"] is True
+    assert events[-1]["result"]["primary"]["snapshot"] == "pi-health-backup-20260102_030405"
+    assert helper.calls[0][0] == "backup_snapshot_create"
+    assert helper.calls[1] == ("backup_job_status", {"job_id": "job-1", "cursor": 0})
+    assert sleeps == [1.0]
+
+
+def test_snapshot_restore_waits_for_the_helper_job():
+    helper = FakeHelper(
+        responses=[
+            {"success": True, "job_id": "job-2"},
+            {"success": False, "error": "Unknown backup job"},
+        ]
+    )
+    paths = []
+    service = make_service(helper=helper, archive_exists=lambda path: paths.append(path) or True)
+
+    try:
+        service.restore("pi-health-backup-20240101_000000", stop_stacks=False)
+    except BackupOperationError as exc:
+        assert "Unknown backup job" in str(exc)
+    else:
+        raise AssertionError("expected BackupOperationError")
+    assert paths == ["/mnt/backup/pi-health-chunks/snapshots/pi-health-backup-20240101_000000.json"]
+    assert helper.calls[0] == (
+        "backup_snapshot_restore",
+        {
+            "dest_dir": "/mnt/backup",
+            "snapshot": "pi-health-backup-20240101_000000",
+            "low_priority": True,
+        },
+    )
+
+
+def test_update_config_rejects_unknown_backup_mode():
+    try:
+        make_service().update_config({"backup_mode": "incremental"})
+    except BackupConfigError as exc:
+        assert "backup_mode" in str(exc)
+    else:
+        raise AssertionError("expected BackupConfigError")
+
+
+def test_update_config_validates_compression_tuning():
+    service = make_service()
+    config = service.update_config(
+        {"compression_level": "9", "compression_threads": 2, "low_priority": False}
+    )
+    assert (config["compression_level"], config["compression_threads"]) == (9, 2)
+    assert config["low_priority"] is False
+    for changes, field in (
+        ({"compression_level": 22}, "compression_level"),
+        ({"compression_threads": -1}, "compression_threads"),
+        ({"compression_threads": True}, "compression_threads"),
+    ):
+        try:
+            service.update_config(changes)
+        except BackupConfigError as exc:
+            assert field in str(exc)
+        else:
+            raise AssertionError("expected BackupConfigError")
+
+
+def test_archive_mode_runs_as_a_prioritised_helper_job():
+    helper = FakeHelper(
+        responses=[
+            {"success": True, "job_id": "job-3"},
+            {
+                "success": True,
+                "events": [{"type": "progress", "bytes": 512, "bytes_total": 2048}],
+                "cursor": 1,
+                "done": True,
+                "result": {"success": True, "archive": "/mnt/backup/a.tar.zst"},
+            },
+        ]
+    )
+    service = make_service(
+        helper=helper,
+        config={
+            "plugin_backup_enabled": False,
+            "compression_level": 6,
+            "compression_threads": 3,
+        },
+    )
+
+    events = list(service.stream_backup())
+
+    assert events[0]["bytes_total"] == 2048
+    assert events[-1]["result"]["primary"]["archive"] == "/mnt/backup/a.tar.zst"
+    command, params = helper.calls[0]
+    assert command == "backup_create"
+    assert {key: params[key] for key in (
+        "compression_level", "compression_threads", "low_priority", "background"
+    )} == {
+        "compression_level": 6,
+        "compression_threads": 3,
+        "low_priority": True,
+        "background": True,
+    }
+
+
+def _write_index(dest_dir, name, entries):
+    (dest_dir / f"{name}.index.json").write_text(
+        json.dumps({"version": 1, "compression": "zst", "frames": [], "entries": entries})
+    )
+
+
+def test_browse_lists_one_level_of_an_indexed_archive(tmp_path):
+    name = "pi-health-backup-20240101_000000.tar.zst"
+    _write_index(
+        tmp_path,
+        name,
+        [
+            {"path": "/opt/stacks", "type": "dir", "mode": 493, "size": 0},
+            {"path": "/opt/stacks/sonarr", "type": "dir", "mode": 493, "size": 0},
+            {"path": "/opt/stacks/sonarr/.env", "type": "file", "mode": 384, "size": 12},
+            {"path": "/opt/stacks/sonarr/config.xml", "type": "file", "mode": 420, "size": 30},
+            {"path": "/opt/stacks/compose.yaml", "type": "file", "mode": 420, "size": 5},
+        ],
+    )
+    service = make_service(config={"dest_dir": str(tmp_path)})
+
+    listing = service.browse(name, "/opt/stacks/")
+
+    assert listing["path"] == "/opt/stacks"
+    assert [(item["name"], item["type"], item["size"]) for item in listing["entries"]] == [
+        ("sonarr", "dir", 42),
+        ("compose.yaml", "file", 5),
+    ]
+    assert service.browse(name, "/")["entries"][0]["path"] == "/opt"
+    try:
+        service.browse("pi-health-backup-20230101_000000.tar.zst")
+    except BackupConfigError as exc:
+        assert "no index" in str(exc)
+    else:
+        raise AssertionError("expected BackupConfigError")
+
+
+def test_restore_paths_sends_the_selection_and_staging_target():
+    helper = FakeHelper(
+        responses=[
+            {"success": True, "job_id": "job-4"},
+            {
+                "success": True,
+                "events": [],
+                "cursor": 0,
+                "done": True,
+                "result": {"success": True, "entries": 2},
+            },
+        ]
+    )
+    repo = FakeRepository()
+    service = make_service(repository=repo, helper=helper)
+
+    result = service.restore_paths(
+        "pi-health-backup-20240101.tar.zst", ["/opt/stacks/sonarr/"], staging=True
+    )
+
+    assert result["entries"] == 2
+    command, params = helper.calls[0]
+    assert command == "backup_restore"
+    assert params["paths"] == ["/opt/stacks/sonarr"]
+    assert params["target"] == "/mnt/backup/restore-staging/pi-health-backup-20240101"
+    assert repo.writes[-1]["last_restore_result"]["paths"] == ["/opt/stacks/sonarr"]
+    for paths in ([], ["opt/stacks"], ["/opt/../etc"]):
+        try:
+            service.restore_paths("pi-health-backup-20240101.tar.zst", paths)
+        except BackupConfigError:
+            pass
+        else:
+            raise AssertionError("expected BackupConfigError")
+
+
+def test_list_backups_includes_snapshot_manifests(tmp_path):
+    from backup_service import list_backups
+
+    (tmp_path / "pi-health-backup-20240101_000000.tar.zst").write_bytes(b"x")
+    snapshots = tmp_path / "pi-health-chunks" / "snapshots"
+    snapshots.mkdir(parents=True)
+    (snapshots / "pi-health-backup-20240102_000000.json").write_text(
+        json.dumps({"bytes": 4096, "stored_bytes": 512, "files": 3, "entries": []})
+    )
+    (snapshots / "unrelated.json").write_text("{}")
+
+    entries = {item["name"]: item for item in list_backups(str(tmp_path))}
+
+    assert entries["pi-health-backup-20240101_000000.tar.zst"]["type"] == "archive"
+    snapshot = entries["pi-health-backup-20240102_000000"]
+    assert (snapshot["type"], snapshot["size"], snapshot["stored_bytes"]) == ("snapshot", 4096, 512)
+    assert len(entries) == 2
+
+
+def test_catalog_serves_cached_listing_until_the_directory_changes(tmp_path):
+    from backup_service import BackupCatalog, list_backups
+
+    archive = tmp_path / "pi-health-backup-20240101_000000.tar.zst"
+    archive.write_bytes(b"x" * 100)
+    (tmp_path / f"{archive.name}.meta.json").write_text(
+        json.dumps({"bytes": 400, "ratio": 0.25, "duration_seconds": 1.5, "sources": ["/opt"]})
+    )
+    old = time.time() - 60
+    os.utime(tmp_path, (old, old))
+    scans = []
+    catalog = BackupCatalog(lister=lambda path: scans.append(path) or list_backups(path))
+
+    first = catalog.list(str(tmp_path))
+    assert catalog.list(str(tmp_path)) == first
+    assert len(scans) == 1
+    assert (first[0]["bytes"], first[0]["ratio"], first[0]["indexed"]) == (400, 0.25, False)
+
+    (tmp_path / "storage-plugins-20240102_000000.tar.zst").write_bytes(b"y")
+    os.utime(tmp_path, (old + 5, old + 5))
+    assert len(catalog.list(str(tmp_path))) == 2
+    assert len(scans) == 2
+
+    # A directory modified moments ago is rescanned until its mtime settles.
+    os.utime(tmp_path, None)
+    catalog.list(str(tmp_path))
+    catalog.list(str(tmp_path))
+    assert len(scans) == 4
+
+
+def test_size_trend_reads_the_catalog_oldest_first():
+    catalog = Mock()
+    catalog.list.return_value = [
+        {"name": "storage-plugins-2.tar.zst", "type": "archive", "mtime": 2.0, "size": 10,
+         "bytes": 40, "ratio": 0.25, "duration_seconds": 1.0},
+        {"name": "pi-health-backup-1", "type": "snapshot", "mtime": 1.0, "size": 900,
+         "bytes": 900, "stored_bytes": 90, "ratio": 0.1, "duration_seconds": 3.0},
+    ]
+    service = make_service()
+    service._catalog = catalog
+
+    trend = service.size_trend()
+
+    catalog.list.assert_called_with("/mnt/backup")
+    assert [(point["series"], point["source_bytes"], point["stored_bytes"]) for point in trend] == [
+        ("pi-health-backup", 900, 90),
+        ("storage-plugins", 40, 10),
+    ]
+
+
 # --- Read models -------------------------------------------------------------
 
 def test_status_reports_running_flag_and_next_run():
@@ -422,3 +697,34 @@ def test_restore_route_returns_result_on_success():
     )
     assert response.status_code == 200
     assert json.loads(response.data)["status"] == "ok"
+
+
+def test_contents_and_restore_paths_routes_delegate():
+    service = Mock()
+    service.browse.return_value = {"name": "a.tar.zst", "path": "/opt", "entries": []}
+    service.restore_paths.side_effect = BackupConfigError("Invalid path")
+    client = _authed_client(service)
+
+    response = client.get("/api/backups/a.tar.zst/contents?path=/opt")
+    assert response.status_code == 200
+    service.browse.assert_called_with("a.tar.zst", "/opt")
+    response = client.post(
+        "/api/backups/a.tar.zst/restore-paths", json={"paths": ["etc"], "staging": True}
+    )
+    assert response.status_code == 400
+    service.restore_paths.assert_called_with("a.tar.zst", ["etc"], staging=True)
+
+
+def test_backup_operation_route_streams_progress():
+    service = Mock()
+    service.stream_backup.return_value = iter(
+        [{"type": "progress", "files": 1}, {"type": "complete", "done": True, "result": {}}]
+    )
+    client = _authed_client(service)
+
+    response = client.post("/api/backups/operations")
+
+    assert response.status_code == 202
+    stream = client.get(response.get_json()["stream_url"]).get_data(as_text=True)
+    assert '"files": 1' in stream
+    assert '"done": true' in stream
@@ -0,0 +1,126 @@
+import os
+import random
+
+import pytest
+
+import chunk_store
+from chunk_store import ChunkStore, ChunkStoreBusy, ChunkStoreError, iter_chunks
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Scale chunk sizes down so a few hundred KiB spans many chunks."""
+    monkeypatch.setattr(chunk_store, "MIN_CHUNK", 2048)
+    monkeypatch.setattr(chunk_store, "MAX_CHUNK", 32 * 1024)
+    monkeypatch.setattr(chunk_store, "BOUNDARY_MASK", (1 << 5) - 1)
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def make_source(tmp_path):
+    source = tmp_path / "home" / "pi" / "docker"
+    data = random.Random(7).randbytes(400 * 1024)
+    write(source / "sonarr" / "sonarr.db", data)
+    write(source / "sonarr" / "config.xml", b"<Config><Port>8989</Port></Config>")
+    write(source / "sonarr" / "logs" / "sonarr.txt", b"noise")
+    os.symlink("config.xml", source / "sonarr" / "current.xml")
+    return source, data
+
+
+def test_chunks_are_content_defined_and_survive_an_insert(small_chunks):
+    import io
+
+    data = random.Random(1).randbytes(300 * 1024)
+    before = list(iter_chunks(io.BytesIO(data)))
+    after = list(iter_chunks(io.BytesIO(data[:1000] + b"inserted" + data[1000:])))
+
+    assert b"".join(before) == data
+    assert all(len(chunk) <= 32 * 1024 for chunk in before)
+    assert len(set(before) & set(after)) >= len(before) - 2
+
+
+def test_snapshot_round_trip_restores_files_links_and_metadata(tmp_path, small_chunks):
+    source, data = make_source(tmp_path)
+    os.chmod(source / "sonarr" / "config.xml", 0o600)
+    store = ChunkStore(str(tmp_path / "store"))
+
+    summary = store.create("pi-health-backup", [str(source)], excludes=["*/logs/*"])
+
+    assert summary["files"] == 2
+    assert summary["bytes"] == len(data) + 34
+    target = tmp_path / "restore"
+    restored = store.restore(summary["snapshot"], target=str(target))
+    base = target / str(source).lstrip("/")
+    assert restored["files"] == 2
+    assert (base / "sonarr" / "sonarr.db").read_bytes() == data
+    assert os.readlink(base / "sonarr" / "current.xml") == "config.xml"
+    assert os.stat(base / "sonarr" / "config.xml").st_mode & 0o777 == 0o600
+    assert not (base / "sonarr" / "logs" / "sonarr.txt").exists()
+
+    only = tmp_path / "only"
+    partial = store.restore(
+        summary["snapshot"], target=str(only), paths=[f"{source}/sonarr/config.xml"]
+    )
+    assert partial["files"] == 1
+    assert (only / str(source).lstrip("/") / "sonarr" / "config.xml").exists()
+    assert not (only / str(source).lstrip("/") / "sonarr" / "sonarr.db").exists()
+
+
+def test_unchanged_files_are_reused_and_edits_store_only_new_chunks(tmp_path, small_chunks):
+    source, data = make_source(tmp_path)
+    store = ChunkStore(str(tmp_path / "store"))
+    first = store.create("pi-health-backup", [str(source)])
+
+    second = store.create("pi-health-backup", [str(source)])
+    assert second["reused_files"] == first["files"]
+    assert second["new_chunks"] == 0
+
+    write(source / "sonarr" / "sonarr.db", data[:5000] + b"changed" + data[5000:])
+    third = store.create("pi-health-backup", [str(source)])
+    assert third["reused_files"] == first["files"] - 1
+    assert 0 < third["stored_bytes"] < first["stored_bytes"] / 4
+
+
+def test_prune_removes_old_manifests_and_unreferenced_chunks(tmp_path, small_chunks):
+    source, data = make_source(tmp_path)
+    store = ChunkStore(str(tmp_path / "store"))
+    store.create("pi-health-backup", [str(source)])
+    write(source / "sonarr" / "sonarr.db", random.Random(9).randbytes(len(data)))
+    latest = store.create("pi-health-backup", [str(source)])
+    store.create("storage-plugins", [str(source / "sonarr" / "config.xml")])
+
+    pruned = store.prune("pi-health-backup", 1)
+
+    assert len(pruned["snapshots_removed"]) == 1
+    assert pruned["chunks_removed"] > 0
+    assert store.snapshot_names() == [latest["snapshot"], store.snapshot_names("storage-plugins")[0]]
+    target = tmp_path / "restore"
+    store.restore(latest["snapshot"], target=str(target))
+    assert (target / str(source).lstrip("/") / "sonarr" / "sonarr.db").read_bytes() == (
+        source / "sonarr" / "sonarr.db"
+    ).read_bytes()
+
+
+def test_corrupt_chunks_and_busy_stores_are_reported(tmp_path, small_chunks):
+    source, _data = make_source(tmp_path)
+    store = ChunkStore(str(tmp_path / "store"))
+    summary = store.create("pi-health-backup", [str(source)])
+    chunk = next(
+        os.path.join(directory, name)
+        for directory, _dirs, names in os.walk(tmp_path / "store" / "chunks")
+        for name in names
+    )
+    with open(chunk, "r+b") as handle:
+        handle.seek(5)
+        handle.write(b"\x00\x01\x02")
+
+    with pytest.raises(ChunkStoreError, match="chunk"):
+        store.restore(summary["snapshot"], target=str(tmp_path / "restore"))
+    with store._lock():
+        with pytest.raises(ChunkStoreBusy):
+            store.prune("pi-health-backup", 1)
+    with pytest.raises(ChunkStoreError, match="Invalid"):
+        store.load("../escape")
@@ -81,6 +81,7 @@ def test_inventory_composes_metadata_and_injected_state():
             "health": None,
             "restart_policy": "no",
             "exit_code": None,
+            "started_at": None,
             "network": {
                 "mode": "bridge",
                 "role": "standalone",
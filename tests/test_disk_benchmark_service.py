@@ -0,0 +1,123 @@
+import json
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from disk_benchmark_service import DiskBenchmarkError, DiskBenchmarkService
+from disk_summary_service import DiskSummaryService
+
+
+class MemoryRepository:
+    def __init__(self):
+        self.data = None
+
+    def read_json(self, path, default=None):
+        return json.loads(json.dumps(self.data)) if self.data is not None else default
+
+    def write_json(self, path, data, *, mode=0o644):
+        self.data = json.loads(json.dumps(data))
+
+
+def helper_result(rate, **extra):
+    return {
+        "success": True,
+        "sequential_read_mbps": rate,
+        "random_read_iops": 90.0,
+        "rotational": True,
+        "transport": "usb",
+        "driver": "uas",
+        "usb_speed_mbps": 5000,
+        **extra,
+    }
+
+
+def make_service(results):
+    helper = Mock()
+    helper.call.side_effect = lambda command, params: results[params["device"]]
+    service = DiskBenchmarkService(
+        helper=helper,
+        repository=MemoryRepository(),
+        history_path_provider=lambda: "/state/disk_benchmarks.json",
+        clock=lambda: datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc),
+    )
+    return service, helper
+
+
+def test_results_are_recorded_and_slow_drives_flagged():
+    service, helper = make_service(
+        {
+            "/dev/sda": helper_result(180.0),
+            "/dev/sdb": helper_result(170.0),
+            "/dev/sdc": helper_result(
+                38.0, driver="usb-storage", usb_speed_mbps=480
+            ),
+        }
+    )
+    for device in ("/dev/sda", "/dev/sdb"):
+        service.run(device)
+
+    outcome = service.run("/dev/sdc", write_path="/mnt/disk3")
+
+    helper.call.assert_called_with(
+        "disk_benchmark", {"device": "/dev/sdc", "write_path": "/mnt/disk3"}
+    )
+    assert outcome["result"]["at"] == "2026-10-18T12:00:00Z"
+    codes = [flag["code"] for flag in outcome["latest"]["flags"]]
+    assert codes == ["usb_storage_fallback", "usb2_link", "slow_vs_peers"]
+    assert service.latest()["/dev/sda"]["flags"] == []
+    assert len(service.history("/dev/sda")) == 1
+
+
+def test_history_is_bounded_per_device():
+    service, _helper = make_service({"/dev/sda": helper_result(150.0)})
+    for _ in range(25):
+        service.run("/dev/sda")
+    assert len(service.history("/dev/sda")) == 20
+
+
+def test_invalid_requests_and_helper_failures_raise():
+    service, _helper = make_service({"/dev/sda": {"success": False, "error": "busy"}})
+    with pytest.raises(DiskBenchmarkError, match="Invalid device"):
+        service.run("/etc/passwd")
+    with pytest.raises(DiskBenchmarkError, match="under /mnt"):
+        service.run("/dev/sda", write_path="/root")
+    with pytest.raises(DiskBenchmarkError, match="busy"):
+        service.run("/dev/sda")
+    assert service.latest() == {}
+
+
+def test_disk_summary_surfaces_the_latest_benchmark():
+    service, _helper = make_service({"/dev/sda": helper_result(150.0)})
+    service.run("/dev/sda")
+    summary = DiskSummaryService(
+        inventory_provider=lambda: {
+            "helper_available": True,
+            "disks": [{"name": "sda", "path": "/dev/sda"}, {"name": "sdb", "path": "/dev/sdb"}],
+        },
+        smart_provider=lambda: {"disks": []},
+        assignment_provider=lambda: {"assignments": [], "warnings": []},
+        benchmark_provider=service.latest,
+    )
+
+    devices = {item["path"]: item for item in summary.snapshot()["devices"]}
+
+    assert devices["/dev/sda"]["benchmark"]["sequential_read_mbps"] == 150.0
+    assert devices["/dev/sda"]["benchmark"]["flags"] == []
+    assert devices["/dev/sdb"]["benchmark"] is None
+
+
+def test_benchmark_routes_run_and_list_results(app, authenticated_client):
+    service, _helper = make_service({"/dev/sda": helper_result(150.0)})
+    app.extensions["disk_benchmark_service"] = service
+
+    response = authenticated_client.post("/api/disks/sda/benchmark", json={})
+    assert response.status_code == 200
+    assert response.get_json()["result"]["sequential_read_mbps"] == 150.0
+    assert authenticated_client.post(
+        "/api/disks/sda/benchmark", json={"write_path": "/etc"}
+    ).status_code == 400
+    listed = authenticated_client.get("/api/disks/benchmarks").get_json()
+    assert list(listed["devices"]) == ["/dev/sda"]
+    history = authenticated_client.get("/api/disks/sda/benchmark").get_json()
+    assert len(history["history"]) == 1
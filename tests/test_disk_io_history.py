@@ -0,0 +1,89 @@
+import pytest
+
+from disk_io_history import DiskIoHistoryStore
+from diskstats import DiskCounters, DiskThroughputSampler
+from metric_history import InvalidMetricRange
+
+
+NOW = 2_000_000_000
+
+
+def counters(reads=0, writes=0, read_ms=0, write_ms=0, busy_ms=0, read_bytes=0):
+    return DiskCounters(
+        read_bytes=read_bytes,
+        write_bytes=writes * 4096,
+        busy_ms=busy_ms,
+        reads=reads,
+        writes=writes,
+        read_ms=read_ms,
+        write_ms=write_ms,
+    )
+
+
+def test_sampler_reports_iops_await_and_utilisation():
+    readings = iter(
+        [
+            {"sda": counters()},
+            {"sda": counters(reads=200, writes=100, read_ms=900, write_ms=300, busy_ms=5_000)},
+        ]
+    )
+    times = iter([0.0, 10.0])
+    sampler = DiskThroughputSampler(
+        reader=lambda: next(readings), device_filter=lambda name: True, clock=lambda: next(times)
+    )
+
+    assert sampler.sample() is None
+    rates = sampler.sample()["sda"]
+
+    assert rates["read_iops"] == 20.0
+    assert rates["write_iops"] == 10.0
+    assert rates["write_bps"] == 100 * 4096 / 10
+    assert rates["await_ms"] == 4.0
+    assert rates["busy_percent"] == 50.0
+
+
+def test_collector_runs_record_rates_between_readings(tmp_path):
+    store = DiskIoHistoryStore(tmp_path / "metrics.sqlite3", clock=lambda: NOW + 300)
+
+    assert store.record({"sda": counters()}, sampled_at=NOW) == {}
+    assert store.latest() == {}
+    recorded = store.record(
+        {"sda": counters(reads=600, read_ms=1_200, busy_ms=30_000), "sdb": counters()},
+        sampled_at=NOW + 300,
+    )
+
+    assert list(recorded) == ["sda"]
+    latest = store.latest()["sda"]
+    assert latest["read_iops"] == 2.0
+    assert latest["await_ms"] == 2.0
+    assert latest["busy_percent"] == 10.0
+    history = store.query("sda", "24h")
+    assert len(history["points"]) == 1
+    assert history["points"][0]["read_iops"] == 2.0
+    assert store.query("sdb", "24h")["points"] == []
+
+
+def test_reset_counters_and_long_gaps_only_move_the_baseline(tmp_path):
+    store = DiskIoHistoryStore(tmp_path / "metrics.sqlite3", clock=lambda: NOW)
+    store.record({"sda": counters(reads=500)}, sampled_at=NOW)
+
+    assert store.record({"sda": counters(reads=10)}, sampled_at=NOW + 300) == {}
+    assert store.record({"sda": counters(reads=20)}, sampled_at=NOW + 300 + 7200) == {}
+    assert store.record({"sda": counters(reads=80)}, sampled_at=NOW + 7800) != {}
+
+
+def test_query_rejects_unknown_ranges_and_missing_database(tmp_path):
+    store = DiskIoHistoryStore(tmp_path / "missing.sqlite3", clock=lambda: NOW)
+    with pytest.raises(InvalidMetricRange):
+        store.query("sda", "1y")
+    assert store.query("sda", "7d")["points"] == []
+
+
+def test_disk_io_route_reads_recorded_history(app, authenticated_client, tmp_path):
+    store = DiskIoHistoryStore(tmp_path / "metrics.sqlite3")
+    app.extensions["disk_io_history"] = store
+
+    response = authenticated_client.get("/api/disks/sda/io?range=7d")
+    assert response.status_code == 200
+    assert response.get_json()["points"] == []
+    assert authenticated_client.get("/api/disks/sda/io?range=1y").status_code == 400
@@ -239,3 +239,32 @@ def test_malformed_records_are_ignored_and_results_are_bounded():
 
     assert len(result["devices"]) == 128
     assert len(result["warnings"]) <= 20
+
+
+def test_io_rates_are_attached_and_slow_pool_members_flagged():
+    def assignments():
+        result = _assignments()
+        result["assignments"][2].update(resource_id="media", resource_name="Media")
+        return result
+
+    service = DiskSummaryService(
+        inventory_provider=_inventory,
+        smart_provider=_smart,
+        assignment_provider=assignments,
+        io_provider=lambda: {
+            "sda": {"read_iops": 12.34, "await_ms": 8.0, "busy_percent": 11.0},
+            "sdb": {"read_iops": 3.0, "await_ms": 140.0, "busy_percent": 96.0},
+            "sdc": {"await_ms": float("nan"), "busy_percent": True},
+        },
+        clock=lambda: FIXED_TIME,
+    )
+
+    devices = {item["name"]: item for item in service.snapshot()["devices"]}
+
+    assert devices["sda"]["io"]["read_iops"] == 12.3
+    assert devices["sda"]["io"]["flags"] == []
+    assert [flag["code"] for flag in devices["sdb"]["io"]["flags"]] == ["slow_in_pool"]
+    assert "Media" in devices["sdb"]["io"]["flags"][0]["message"]
+    assert devices["sdc"]["io"]["await_ms"] is None
+    assert devices["sdc"]["io"]["busy_percent"] is None
+    assert _service().snapshot()["devices"][0]["io"] is None
@@ -0,0 +1,162 @@
+import os
+
+import pytest
+
+from disk_usage_index import DiskUsageError, DiskUsageIndex
+
+
+def write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+def bump_mtime(path, seconds=10):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def run(index, root, sources=None, **kwargs):
+    events = list(index.scan(str(root), sources, **kwargs))
+    assert events[-1]["event"] == "complete" and events[-1]["done"]
+    return events[-1]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "storage"
+    write(root / "movies" / "Film (2020)" / "film.mkv", 5000)
+    write(root / "movies" / "Other (2021)" / "other.mkv", 3000)
+    write(root / "tv" / "Show" / "S01" / "e01.mkv", 1000)
+    write(root / "readme.txt", 10)
+    return root
+
+
+def test_scan_aggregates_sizes_per_directory(tmp_path, tree):
+    index = DiskUsageIndex(tmp_path / "usage.sqlite3", max_workers=3)
+
+    summary = run(index, tree)
+
+    assert summary["total_bytes"] == 9010
+    assert summary["total_files"] == 4
+    assert summary["directories"] == 7
+    top = index.children(str(tree))
+    assert top["files_bytes"] == 10
+    assert [(child["name"], child["total_bytes"]) for child in top["children"]] == [
+        ("movies", 8000),
+        ("tv", 1000),
+    ]
+    movies = index.children(str(tree), "movies", limit=1)
+    assert movies["children_count"] == 2
+    assert movies["children"][0]["path"] == "movies/Film (2020)"
+    assert movies["children"][0]["percent"] == 62.5
+
+
+def test_rescan_reuses_unchanged_directories(tmp_path, tree):
+    index = DiskUsageIndex(tmp_path / "usage.sqlite3")
+    run(index, tree)
+
+    assert run(index, tree)["reused"] == 7
+
+    write(tree / "tv" / "Show" / "S01" / "e02.mkv", 500)
+    bump_mtime(tree / "tv" / "Show" / "S01")
+    summary = run(index, tree)
+    assert summary["reused"] == 6
+    assert summary["total_bytes"] == 9510
+    assert index.children(str(tree), "tv")["total_bytes"] == 1500
+
+    # A file rewritten in place leaves its directory alone until a full scan.
+    write(tree / "readme.txt", 20)
+    os.utime(tree, ns=(os.stat(tree).st_atime_ns, os.stat(tree).st_mtime_ns))
+    assert run(index, tree)["total_bytes"] == 9510
+    assert run(index, tree, full=True)["total_bytes"] == 9520
+
+
+def test_removed_directories_drop_out_of_the_index(tmp_path, tree):
+    index = DiskUsageIndex(tmp_path / "usage.sqlite3")
+    run(index, tree)
+
+    (tree / "movies" / "Other (2021)" / "other.mkv").unlink()
+    (tree / "movies" / "Other (2021)").rmdir()
+    bump_mtime(tree / "movies")
+
+    assert run(index, tree)["total_bytes"] == 6010
+    assert [child["name"] for child in index.children(str(tree), "movies")["children"]] == [
+        "Film (2020)"
+    ]
+
+
+def test_pool_branches_are_merged_under_the_pool_root(tmp_path):
+    disk1, disk2 = tmp_path / "disk1", tmp_path / "disk2"
+    write(disk1 / "movies" / "a.mkv", 100)
+    write(disk2 / "movies" / "b.mkv", 200)
+    write(disk2 / "tv" / "c.mkv", 50)
+    index = DiskUsageIndex(tmp_path / "usage.sqlite3")
+
+    summary = run(index, "/mnt/storage", [str(disk1), str(disk2)])
+
+    assert summary["total_bytes"] == 350
+    assert index.children("/mnt/storage", "movies")["files_bytes"] == 300
+
+    # A change on the second branch alone is still noticed.
+    write(disk2 / "movies" / "d.mkv", 1)
+    bump_mtime(disk2 / "movies")
+    assert run(index, "/mnt/storage", [str(disk1), str(disk2)])["total_bytes"] == 351
+
+
+def test_drill_down_rejects_unknown_roots_and_paths(tmp_path, tree):
+    index = DiskUsageIndex(tmp_path / "usage.sqlite3")
+    with pytest.raises(DiskUsageError, match="has not been scanned"):
+        index.children(str(tree))
+    run(index, tree)
+    with pytest.raises(DiskUsageError, match="Invalid path"):
+        index.children(str(tree), "movies/../tv")
+    with pytest.raises(DiskUsageError, match="not in the index"):
+        index.children(str(tree), "music")
+    with pytest.raises(DiskUsageError, match="not a directory"):
+        list(index.scan(str(tmp_path / "missing")))
+    assert index.roots()[0]["total_bytes"] == 9010
+
+
+def test_disk_usage_routes_validate_scan_roots_and_serve_the_tree(
+    authenticated_client, tmp_path, tree
+):
+    index = DiskUsageIndex(tmp_path / "usage.sqlite3")
+    run(index, tree)
+    authenticated_client.application.extensions["disk_usage_index"] = index
+
+    rejected = authenticated_client.post("/api/storage/usage/scan", json={"path": "/etc"})
+    assert rejected.status_code == 400
+    assert "under /mnt" in rejected.get_json()["error"]
+
+    response = authenticated_client.get(
+        "/api/storage/usage/tree", query_string={"root": str(tree), "path": "movies"}
+    )
+    assert response.status_code == 200
+    assert response.get_json()["total_bytes"] == 8000
+    missing = authenticated_client.get(
+        "/api/storage/usage/tree", query_string={"root": "/mnt/nowhere"}
+    )
+    assert missing.status_code == 404
+    roots = authenticated_client.get("/api/storage/usage").get_json()
+    assert roots["roots"][0]["root"] == str(tree)
+
+
+def test_pool_sub_paths_are_read_from_the_matching_branch_directories(monkeypatch, tmp_path):
+    import app as app_module
+
+    disk1, disk2 = tmp_path / "disk1", tmp_path / "disk2"
+    (disk1 / "media" / "movies").mkdir(parents=True)
+    (disk2 / "media").mkdir(parents=True)
+    monkeypatch.setattr(
+        app_module,
+        "_disk_usage_suggestions",
+        lambda: [{"path": "/mnt/storage", "label": "Pool", "branches": [str(disk1), str(disk2)]}],
+    )
+
+    assert app_module._disk_usage_target("/mnt/storage") == ("/mnt/storage", [str(disk1), str(disk2)])
+    assert app_module._disk_usage_target("/mnt/storage/media/") == (
+        "/mnt/storage/media",
+        [str(disk1 / "media"), str(disk2 / "media")],
+    )
+    with pytest.raises(DiskUsageError, match="not a directory"):
+        app_module._disk_usage_target("/mnt/storage/music")
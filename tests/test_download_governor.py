@@ -0,0 +1,343 @@
+import json
+import threading
+import urllib.parse
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from activity_service import DownloadClient
+from download_governor import DownloadGovernor, GovernorConfigError, read_io_pressure
+from http_pool import HttpConnectionPool
+
+
+NOW = datetime(2026, 7, 25, 20, 0, tzinfo=timezone.utc)
+
+
+class SabnzbdHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_args):
+        pass
+
+    def do_GET(self):
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(self.path).query))
+        state = self.server.state
+        if query.get("apikey") != "sab-key":
+            payload, status = {"error": "API Key Incorrect"}, 403
+        elif query.get("mode") == "queue":
+            payload, status = {"queue": dict(state)}, 200
+        elif query.get("mode") == "config" and query.get("name") == "speedlimit":
+            self.server.calls.append(query["value"])
+            state["speedlimit"] = query["value"]
+            payload, status = {"status": True}, 200
+        else:
+            payload, status = {"error": "unknown"}, 400
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TransmissionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length))
+        if self.headers.get("X-Transmission-Session-Id") != "session-1":
+            self.send_response(409)
+            self.send_header("X-Transmission-Session-Id", "session-1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        session = self.server.state
+        if request["method"] == "session-set":
+            self.server.calls.append(dict(request["arguments"]))
+            session.update(request["arguments"])
+            arguments = {}
+        else:
+            arguments = dict(session)
+        body = json.dumps({"result": "success", "arguments": arguments}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(handler, state):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    server.state = state
+    server.calls = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def clients():
+    sabnzbd = serve(SabnzbdHandler, {"speedlimit": "100", "speedlimit_abs": ""})
+    transmission = serve(
+        TransmissionHandler, {"speed-limit-down": 500, "speed-limit-down-enabled": False}
+    )
+    try:
+        yield sabnzbd, transmission
+    finally:
+        for server in (sabnzbd, transmission):
+            server.shutdown()
+            server.server_close()
+
+
+class MemoryRepository:
+    def __init__(self, initial=None):
+        self.data = initial
+
+    def read_json(self, path, default=None):
+        return json.loads(json.dumps(self.data)) if self.data is not None else default
+
+    def write_json(self, path, data, *, mode=0o644):
+        self.data = json.loads(json.dumps(data))
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def base_url(server):
+    host, port = server.server_address
+    return f"http://{host}:{port}"
+
+
+def make_governor(servers, *, streams=None, stats=None, io_pressure=None, config=None):
+    sabnzbd, transmission = servers
+    repository = MemoryRepository(
+        {"enabled": True, "release_after_seconds": 120, "cooldown_seconds": 60, **(config or {})}
+    )
+    activity = {"streams": streams if streams is not None else []}
+    host = {"temperature_celsius": 50.0, "cpu_usage_percent": 20.0, **(stats or {})}
+    clock = Clock()
+    log = []
+    pool = HttpConnectionPool()
+    governor = DownloadGovernor(
+        repository=repository,
+        config_path_provider=lambda: "/state/download_governor.json",
+        activity_reader=lambda: activity,
+        client_reader=lambda: [
+            DownloadClient("sabnzbd", "sabnzbd", base_url(sabnzbd), "sab-key"),
+            DownloadClient("transmission", "transmission", base_url(transmission), None),
+        ],
+        host_reader=lambda: host,
+        io_pressure_reader=lambda: io_pressure,
+        transport=pool,
+        clock=clock,
+        wall_clock=lambda: NOW,
+        logger=log.append,
+    )
+    return governor, activity, host, clock, repository, log
+
+
+PLAYING = [{"title": "Film", "is_paused": False, "is_transcoding": True}]
+
+
+def test_an_active_stream_throttles_both_clients_and_records_what_it_replaced(clients):
+    sabnzbd, transmission = clients
+    governor, _activity, _host, _clock, repository, log = make_governor(clients, streams=PLAYING)
+
+    governor.tick()
+
+    assert sabnzbd.calls == ["2048K"]
+    assert transmission.calls == [{"speed-limit-down": 2048, "speed-limit-down-enabled": True}]
+    saved = repository.data["throttle_state"]["saved"]
+    assert saved == {
+        "sabnzbd": {"speedlimit": "100"},
+        "transmission": {"speed-limit-down": 500, "speed-limit-down-enabled": False},
+    }
+    assert any("throttled sabnzbd" in line and "1 transcoding" in line for line in log)
+    assert governor.status()["engaged"] is True
+
+
+def test_limits_are_restored_only_after_a_sustained_calm_spell(clients):
+    sabnzbd, transmission = clients
+    governor, activity, _host, clock, repository, log = make_governor(clients, streams=PLAYING)
+    governor.tick()
+
+    activity["streams"] = []
+    clock.now += 90
+    governor.tick()
+    clock.now += 60
+    governor.tick()
+    assert repository.data["throttle_state"] is not None
+
+    clock.now += 61
+    governor.tick()
+
+    assert sabnzbd.calls == ["2048K", "100"]
+    assert transmission.calls[-1] == {"speed-limit-down": 500, "speed-limit-down-enabled": False}
+    assert repository.data["throttle_state"] is None
+    assert any(line.startswith("Download governor: restored transmission") for line in log)
+
+
+def test_temperature_uses_hysteresis_between_engage_and_release(clients):
+    sabnzbd, _transmission = clients
+    governor, _activity, host, clock, repository, _log = make_governor(
+        clients,
+        stats={"temperature_celsius": 76.0},
+        config={"release_after_seconds": 0, "cooldown_seconds": 0},
+    )
+    governor.tick()
+    assert repository.data["throttle_state"]["reasons"] == ["temperature 76°C ≥ 75°C"]
+
+    # Below the engage line but above the release line: stay throttled.
+    host["temperature_celsius"] = 72.0
+    clock.now += 30
+    governor.tick()
+    assert repository.data["throttle_state"] is not None
+
+    host["temperature_celsius"] = 68.0
+    clock.now += 30
+    governor.tick()
+    assert repository.data["throttle_state"] is None
+    assert sabnzbd.calls == ["2048K", "100"]
+
+
+def test_cooldown_prevents_immediate_re_engagement(clients):
+    sabnzbd, _transmission = clients
+    governor, activity, _host, clock, _repository, _log = make_governor(
+        clients, streams=PLAYING, config={"release_after_seconds": 0, "cooldown_seconds": 60}
+    )
+    governor.tick()
+    activity["streams"] = []
+    clock.now += 60
+    governor.tick()
+    assert sabnzbd.calls == ["2048K", "100"]
+
+    activity["streams"] = PLAYING
+    clock.now += 10
+    governor.tick()
+    assert sabnzbd.calls == ["2048K", "100"]
+    clock.now += 60
+    governor.tick()
+    assert sabnzbd.calls == ["2048K", "100", "2048K"]
+
+
+def test_paused_streams_and_a_disabled_governor_leave_limits_alone(clients):
+    sabnzbd, transmission = clients
+    governor, _activity, _host, _clock, repository, _log = make_governor(
+        clients, streams=[{"title": "Film", "is_paused": True}]
+    )
+    governor.tick()
+    repository.data["enabled"] = False
+    governor.tick()
+    assert sabnzbd.calls == []
+    assert transmission.calls == []
+
+
+def test_disabling_while_throttled_restores_limits(clients):
+    sabnzbd, _transmission = clients
+    governor, _activity, _host, _clock, repository, _log = make_governor(clients, streams=PLAYING)
+    governor.tick()
+
+    status = governor.update_config({"enabled": False})
+
+    assert status["engaged"] is False
+    assert sabnzbd.calls == ["2048K", "100"]
+    assert repository.data["enabled"] is False
+
+
+def test_an_absolute_sabnzbd_limit_is_restored_as_an_absolute_rate(clients):
+    sabnzbd, _transmission = clients
+    sabnzbd.state.update({"speedlimit": "40", "speedlimit_abs": "4194304"})
+    governor, activity, _host, clock, _repository, _log = make_governor(
+        clients, streams=PLAYING, config={"release_after_seconds": 0, "cooldown_seconds": 0}
+    )
+    governor.tick()
+    activity["streams"] = []
+    clock.now += 1
+    governor.tick()
+    assert sabnzbd.calls == ["2048K", "4096K"]
+
+
+def test_io_pressure_counts_as_contention(clients):
+    governor, _activity, _host, _clock, repository, _log = make_governor(clients, io_pressure=55.0)
+    governor.tick()
+    assert repository.data["throttle_state"]["reasons"] == ["I/O pressure 55% ≥ 40%"]
+
+
+def test_invalid_thresholds_are_rejected():
+    governor = DownloadGovernor(
+        repository=MemoryRepository(),
+        config_path_provider=lambda: "/state/download_governor.json",
+        activity_reader=lambda: {},
+        client_reader=lambda: [],
+    )
+    with pytest.raises(GovernorConfigError, match="throttled_limit_kbps"):
+        governor.update_config({"throttled_limit_kbps": 1})
+    with pytest.raises(GovernorConfigError, match="temperature_release_celsius"):
+        governor.update_config({"temperature_release_celsius": 90})
+
+
+def test_io_pressure_is_read_from_psi(tmp_path):
+    path = tmp_path / "io"
+    path.write_text(
+        "some avg10=12.50 avg60=3.00 avg300=1.00 total=100\n"
+        "full avg10=8.00 avg60=2.00 avg300=0.50 total=50\n"
+    )
+    assert read_io_pressure(str(path)) == 12.5
+    assert read_io_pressure(str(tmp_path / "missing")) is None
+
+
+def test_governor_routes_read_and_validate_settings(authenticated_client):
+    repository = MemoryRepository()
+    governor = DownloadGovernor(
+        repository=repository,
+        config_path_provider=lambda: "/state/download_governor.json",
+        activity_reader=lambda: {},
+        client_reader=lambda: [],
+    )
+    authenticated_client.application.extensions["download_governor"] = governor
+
+    assert authenticated_client.get("/api/activity/governor").get_json()["engaged"] is False
+    rejected = authenticated_client.post("/api/activity/governor", json={"cooldown_seconds": -1})
+    assert rejected.status_code == 400
+    accepted = authenticated_client.post("/api/activity/governor", json={"enabled": True})
+    assert accepted.status_code == 200
+    assert accepted.get_json()["config"]["enabled"] is True
+    assert repository.data["enabled"] is True
+
+
+def test_a_settings_change_during_an_engaging_tick_keeps_the_saved_limits(clients):
+    governor, _activity, _host, _clock, repository, _log = make_governor(clients, streams=PLAYING)
+    reading = threading.Event()
+    resume = threading.Event()
+    list_clients = governor._client_reader
+
+    def slow_client_reader():
+        reading.set()
+        resume.wait(5)
+        return list_clients()
+
+    governor._client_reader = slow_client_reader
+    ticking = threading.Thread(target=governor.tick)
+    ticking.start()
+    assert reading.wait(5)
+    updating = threading.Thread(
+        target=governor.update_config, args=({"throttled_limit_kbps": 1024},)
+    )
+    updating.start()
+    updating.join(0.2)
+    assert updating.is_alive()
+
+    resume.set()
+    ticking.join(5)
+    updating.join(5)
+
+    assert repository.data["throttled_limit_kbps"] == 1024
+    assert set(repository.data["throttle_state"]["saved"]) == {"sabnzbd", "transmission"}
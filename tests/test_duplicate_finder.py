@@ -0,0 +1,112 @@
+import os
+
+from duplicate_finder import DuplicateFinder, ScanRoot, media_category
+from media_layout import MediaLayout
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def scan(finder, roots):
+    events = list(finder.scan(roots))
+    assert events[-1]["stage"] == "complete" and events[-1]["done"]
+    return events[-1]
+
+
+def make_tree(tmp_path):
+    disk1, disk2 = tmp_path / "disk1", tmp_path / "disk2"
+    payload = b"head" + b"A" * 100 + b"tail"
+    write(disk1 / "movies" / "Film" / "film.mkv", payload)
+    write(disk2 / "downloads" / "complete" / "radarr" / "film.mkv", payload)
+    # Same size, head and tail as the film, different middle.
+    write(disk2 / "movies" / "Other" / "other.mkv", b"head" + b"B" * 100 + b"tail")
+    write(disk1 / "tv" / "unique.mkv", b"x" * 50)
+    os.link(disk1 / "movies" / "Film" / "film.mkv", disk1 / "movies" / "Film" / "seed.mkv")
+    roots = [
+        ScanRoot(str(disk1), "/mnt/storage"),
+        ScanRoot(str(disk2), "/mnt/storage"),
+    ]
+    return disk1, disk2, roots
+
+
+def test_files_are_narrowed_by_size_sample_then_full_hash(tmp_path):
+    _disk1, _disk2, roots = make_tree(tmp_path)
+    finder = DuplicateFinder(tmp_path / "dupes.sqlite3", min_file_bytes=1, sample_bytes=4)
+
+    summary = scan(finder, roots)
+
+    assert summary["files"] == 5
+    # The unique file is never read; the other size group is sampled.
+    assert summary["sampled"] == 4
+    assert summary["hashed"] == 4
+    groups = finder.groups()
+    assert groups["count"] == 1
+    group = groups["groups"][0]
+    assert group["copies"] == 2
+    assert group["wasted_bytes"] == 108
+    assert sorted(item["path"] for item in group["files"]) == [
+        "/mnt/storage/downloads/complete/radarr/film.mkv",
+        "/mnt/storage/movies/Film/film.mkv",
+        "/mnt/storage/movies/Film/seed.mkv",
+    ]
+
+
+def test_rescans_only_hash_new_or_changed_files(tmp_path):
+    disk1, _disk2, roots = make_tree(tmp_path)
+    finder = DuplicateFinder(tmp_path / "dupes.sqlite3", min_file_bytes=1, sample_bytes=4)
+    scan(finder, roots)
+
+    again = scan(finder, roots)
+    assert (again["sampled"], again["hashed"], again["hashed_bytes"]) == (0, 0, 0)
+
+    write(disk1 / "tv" / "copy.mkv", b"x" * 50)
+    summary = scan(finder, roots)
+    assert summary["sampled"] == 2
+    assert summary["groups"] == 2
+
+    (disk1 / "tv" / "copy.mkv").unlink()
+    assert scan(finder, roots)["groups"] == 1
+
+
+def test_hardlinks_alone_are_not_duplicates(tmp_path):
+    write(tmp_path / "disk" / "a.mkv", b"data" * 10)
+    os.link(tmp_path / "disk" / "a.mkv", tmp_path / "disk" / "b.mkv")
+    finder = DuplicateFinder(tmp_path / "dupes.sqlite3", min_file_bytes=1)
+
+    summary = scan(finder, [ScanRoot(str(tmp_path / "disk"), "/mnt/disk")])
+
+    assert summary["sampled"] == 0
+    assert finder.groups()["count"] == 0
+
+
+def test_media_category_names_library_and_download_folders():
+    layout = MediaLayout()
+    assert media_category("/mnt/storage/movies/Film/film.mkv", layout) == "library:movies"
+    assert media_category("/mnt/downloads/complete/sonarr/x.mkv", layout) == "download:sonarr"
+    assert media_category("/mnt/downloads/incomplete/x.part", layout) == "download:incomplete"
+    assert media_category("/mnt/storage/misc/x", layout) is None
+
+
+def test_duplicate_routes_scan_and_report_groups(authenticated_client, tmp_path, monkeypatch):
+    import app as app_module
+
+    _disk1, _disk2, roots = make_tree(tmp_path)
+    finder = DuplicateFinder(tmp_path / "dupes.sqlite3", min_file_bytes=1, sample_bytes=4)
+    authenticated_client.application.extensions["duplicate_finder"] = finder
+
+    monkeypatch.setattr(app_module, "_duplicate_scan_roots", lambda: [])
+    assert authenticated_client.post("/api/storage/duplicates/scan", json={}).status_code == 400
+
+    monkeypatch.setattr(app_module, "_duplicate_scan_roots", lambda: roots)
+    response = authenticated_client.post("/api/storage/duplicates/scan", json={})
+    assert response.status_code == 202
+    stream = authenticated_client.get(response.get_json()["stream_url"]).get_data(as_text=True)
+    assert '"stage": "complete"' in stream
+
+    groups = authenticated_client.get("/api/storage/duplicates").get_json()
+    categories = {item["path"]: item["category"] for item in groups["groups"][0]["files"]}
+    assert categories["/mnt/storage/movies/Film/film.mkv"] == "library:movies"
+    # The pool root is not the configured downloads root, so this copy is uncategorised.
+    assert categories["/mnt/storage/downloads/complete/radarr/film.mkv"] is None
@@ -0,0 +1,216 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from arr_client import ArrClient, ArrClientError
+from http_pool import HttpConnectionPool
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_args):
+        pass
+
+    def _reply(self, status, payload, *, close=False):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if close:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.peers.append(self.client_address)
+        if self.path.startswith("/slow"):
+            time.sleep(1.0)
+        if self.path.startswith("/missing"):
+            self._reply(404, {"error": "nope"})
+        elif self.path.startswith("/close"):
+            self._reply(200, {"path": self.path}, close=True)
+        elif self.path.startswith("/drop"):
+            # Advertise keep-alive, then hang up anyway, like an idle timeout would.
+            self._reply(200, {"path": self.path})
+            self.close_connection = True
+        else:
+            self._reply(200, {"path": self.path})
+
+    def do_POST(self):
+        self.server.peers.append(self.client_address)
+        length = int(self.headers.get("Content-Length") or 0)
+        received = json.loads(self.rfile.read(length) or b"null")
+        if self.path.startswith("/hangup"):
+            # Act on the request, then drop the socket before answering.
+            self.close_connection = True
+            return
+        self._reply(201, {"received": received, "key": self.headers.get("X-Api-Key")})
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.peers = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def url(server, path):
+    host, port = server.server_address
+    return f"http://{host}:{port}{path}"
+
+
+def test_sequential_requests_reuse_one_connection(stub_server):
+    pool = HttpConnectionPool()
+    try:
+        for index in range(5):
+            response = pool.request("GET", url(stub_server, f"/queue?page={index}"))
+            assert response.status == 200
+            assert json.loads(response.body) == {"path": f"/queue?page={index}"}
+    finally:
+        pool.close()
+
+    assert len({peer for peer in stub_server.peers}) == 1
+    assert len(stub_server.peers) == 5
+
+
+def test_error_statuses_are_returned_not_raised(stub_server):
+    pool = HttpConnectionPool()
+    try:
+        response = pool.request("GET", url(stub_server, "/missing"))
+        assert response.status == 404
+        assert pool.idle_count() == 1
+    finally:
+        pool.close()
+
+
+def test_a_server_that_closes_the_connection_is_not_pooled(stub_server):
+    pool = HttpConnectionPool()
+    try:
+        pool.request("GET", url(stub_server, "/close"))
+        assert pool.idle_count() == 0
+        pool.request("GET", url(stub_server, "/close"))
+    finally:
+        pool.close()
+
+    assert len({peer for peer in stub_server.peers}) == 2
+
+
+def test_idle_connections_are_evicted_after_the_idle_limit(stub_server):
+    now = [0.0]
+    pool = HttpConnectionPool(idle_seconds=30.0, clock=lambda: now[0])
+    try:
+        pool.request("GET", url(stub_server, "/a"))
+        assert pool.idle_count() == 1
+        now[0] = 31.0
+        pool.request("GET", url(stub_server, "/b"))
+    finally:
+        pool.close()
+
+    assert len({peer for peer in stub_server.peers}) == 2
+
+
+def test_the_pool_is_bounded_per_host(stub_server):
+    pool = HttpConnectionPool(max_per_host=2)
+    barrier = threading.Barrier(4)
+
+    def call():
+        barrier.wait()
+        pool.request("GET", url(stub_server, "/slow"))
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        assert pool.idle_count() == 2
+    finally:
+        pool.close()
+
+
+def test_a_connection_dropped_while_idle_is_retried_transparently(stub_server):
+    pool = HttpConnectionPool()
+    try:
+        pool.request("GET", url(stub_server, "/drop"))
+        assert pool.idle_count() == 1
+        time.sleep(0.1)
+        response = pool.request("GET", url(stub_server, "/second"))
+        assert response.status == 200
+    finally:
+        pool.close()
+
+
+def test_a_write_dropped_after_it_was_sent_is_not_resent(stub_server):
+    pool = HttpConnectionPool()
+    try:
+        pool.request("GET", url(stub_server, "/warm"))
+        assert pool.idle_count() == 1
+        with pytest.raises(ConnectionResetError):
+            pool.request("POST", url(stub_server, "/hangup"), body=b"{}")
+    finally:
+        pool.close()
+
+    assert len(stub_server.peers) == 2
+
+
+def test_a_write_skips_connections_the_server_already_closed(stub_server):
+    pool = HttpConnectionPool()
+    try:
+        pool.request("GET", url(stub_server, "/drop"))
+        time.sleep(0.1)
+        response = pool.request("POST", url(stub_server, "/downloadclient"), body=b"{}")
+        assert response.status == 201
+    finally:
+        pool.close()
+
+    assert len({peer for peer in stub_server.peers}) == 2
+
+
+def test_a_request_timeout_raises_os_error(stub_server):
+    pool = HttpConnectionPool()
+    try:
+        with pytest.raises(OSError):
+            pool.request("GET", url(stub_server, "/slow"), timeout=0.2)
+        assert pool.idle_count() == 0
+    finally:
+        pool.close()
+
+
+def test_arr_client_speaks_json_through_the_pool(stub_server):
+    pool = HttpConnectionPool()
+
+    def transport(method, target, headers, body):
+        response = pool.request(method, target, headers, body)
+        if response.status >= 400:
+            raise ArrClientError(f"{method} {target} failed: {response.status}")
+        return json.loads(response.body)
+
+    host, port = stub_server.server_address
+    client = ArrClient(port=port, api_key="secret", host=host, transport=transport)
+    try:
+        assert client.post("/rootfolder", {"path": "/media/tv"}) == {
+            "received": {"path": "/media/tv"},
+            "key": "secret",
+        }
+        assert client.get("/rootfolder") == {"path": "/api/v3/rootfolder"}
+    finally:
+        pool.close()
+    assert len({peer for peer in stub_server.peers}) == 1
+
+
+def test_default_arr_transport_raises_client_errors_for_http_failures(stub_server):
+    from arr_client import http_transport
+
+    with pytest.raises(ArrClientError, match="404"):
+        http_transport("GET", url(stub_server, "/missing"), {}, None)
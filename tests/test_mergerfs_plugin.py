@@ -1,4 +1,5 @@
 """Tests for MergerFS plugin."""
+import json
 import os
 import shutil
 import subprocess
@@ -288,14 +289,193 @@ class TestMergerFSCommands:
         assert result.success is False
         assert "timed out" in result.error.lower()
 
-    def test_balance_missing_binary_returns_failed_result(self, mergerfs_plugin, valid_config):
-        mergerfs_plugin.set_config(valid_config)
-        with patch("storage_plugins.mergerfs_plugin.subprocess.run", side_effect=FileNotFoundError):
-            _, result = consume_command(
-                mergerfs_plugin.run_command("balance", {"pool_name": "storage"})
-            )
+    def test_balance_dry_run_plans_without_moving(self, mergerfs_plugin, tmp_path):
+        branches = [tmp_path / "disk1", tmp_path / "disk2"]
+        for branch in branches:
+            branch.mkdir()
+        (branches[0] / "film.mkv").write_bytes(b"x" * 2 * 1024 * 1024)
+        mergerfs_plugin.set_config({"pools": [{
+            "name": "storage",
+            "branches": [str(branch) for branch in branches],
+            "mount_point": "/mnt/storage",
+        }]})
+
+        output, result = consume_command(
+            mergerfs_plugin.run_command("balance", {"pool_name": "storage", "dry_run": True})
+        )
+
+        # Both branches share one test filesystem, so they are already level.
+        assert result.success is True
+        assert result.data["dry_run"] is True
+        assert result.message.startswith("Would move 0 files")
+        assert (branches[0] / "film.mkv").exists()
+        assert any(isinstance(item, dict) and item["event"] == "start" for item in output)
+
+    def test_balance_checkpoint_lives_in_state_dir(self, temp_config_dir, tmp_path, monkeypatch):
+        import storage_plugins.mergerfs_plugin as mergerfs_module
+
+        state_dir = tmp_path / "state" / "storage_plugins"
+        monkeypatch.setattr(mergerfs_module, "STORAGE_PLUGIN_CONFIG_DIR", temp_config_dir)
+        monkeypatch.setattr(mergerfs_module, "STORAGE_PLUGIN_STATE_DIR", state_dir)
+        plugin = MergerFSPlugin(temp_config_dir)
+        branches = [tmp_path / "disk1", tmp_path / "disk2"]
+        for branch in branches:
+            branch.mkdir()
+        plugin.set_config({"pools": [{
+            "name": "storage",
+            "branches": [str(branch) for branch in branches],
+            "mount_point": "/mnt/storage",
+        }]})
+
+        _, result = consume_command(plugin.run_command("balance", {"pool_name": "storage"}))
+
+        assert result.success is True
+        assert (state_dir / "mergerfs_balance_storage.json").exists()
+        assert not os.path.exists(os.path.join(temp_config_dir, "mergerfs_balance_storage.json"))
+
+    def test_balance_rejects_missing_branches(self, mergerfs_plugin, tmp_path):
+        mergerfs_plugin.set_config({"pools": [{
+            "name": "storage",
+            "branches": [str(tmp_path / "gone1"), str(tmp_path / "gone2")],
+            "mount_point": "/mnt/storage",
+        }]})
+        _, result = consume_command(
+            mergerfs_plugin.run_command("balance", {"pool_name": "storage"})
+        )
         assert result.success is False
-        assert "not found" in result.error.lower()
+        assert "Branch not available" in result.error
+
+
+class TestMergerFSBalancer:
+    MB = 1024 * 1024
+
+    def _branches(self, tmp_path, files=8):
+        source, target = tmp_path / "disk1", tmp_path / "disk2"
+        (source / "Movies" / "Film").mkdir(parents=True)
+        target.mkdir()
+        for index in range(files):
+            (source / "Movies" / "Film" / f"part{index}.mkv").write_bytes(bytes([index]) * 5 * self.MB)
+        (source / "snapraid.content").write_bytes(b"c" * 5 * self.MB)
+        usage = {str(source): (100 * self.MB, 80 * self.MB), str(target): (100 * self.MB, 20 * self.MB)}
+        return source, target, usage
+
+    def _balancer(self, tmp_path, usage, **kwargs):
+        from storage_plugins.mergerfs_balance import MergerFSBalancer
+
+        return MergerFSBalancer(
+            list(usage),
+            str(tmp_path / "checkpoint.json"),
+            spread_percent=10,
+            usage_reader=lambda branch: usage[branch],
+            **kwargs,
+        )
+
+    def test_moves_files_until_the_spread_is_within_target(self, tmp_path):
+        source, target, usage = self._branches(tmp_path)
+
+        events, summary = consume_command(self._balancer(tmp_path, usage).run())
+
+        moved = [event for event in events if event["event"] == "moved"]
+        assert summary["moved_files"] == 5
+        assert summary["spread_percent"] == 10.0
+        assert moved[-1]["branches"] == {str(source): 55.0, str(target): 45.0}
+        for event in moved:
+            assert not (source / event["path"]).exists()
+            assert (target / event["path"]).stat().st_size == 5 * self.MB
+        assert (target / moved[0]["path"]).read_bytes()[:1] == b"\x00"
+        # SnapRAID's own files are never candidates.
+        assert (source / "snapraid.content").exists()
+        assert not list(target.rglob("*.pihealth-balance"))
+        checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+        assert checkpoint["in_progress"] is None
+        assert checkpoint["moved_files"] == 5
+
+    def test_dry_run_leaves_files_and_checkpoint_alone(self, tmp_path):
+        source, target, usage = self._branches(tmp_path)
+
+        events, summary = consume_command(self._balancer(tmp_path, usage, dry_run=True).run())
+
+        assert summary["moved_files"] == 5
+        assert {event["event"] for event in events} == {"start", "planned"}
+        assert len(list(source.rglob("*.mkv"))) == 8
+        assert not (tmp_path / "checkpoint.json").exists()
+
+    def test_closing_the_stream_mid_copy_discards_the_partial_file(self, tmp_path):
+        source, target, usage = self._branches(tmp_path)
+        ticks = iter(range(0, 10_000, 10))
+        run = self._balancer(tmp_path, usage, clock=lambda: next(ticks)).run()
+
+        event = next(run)
+        while event["event"] != "copying":
+            event = next(run)
+        run.close()
+
+        assert not list(target.rglob("*.pihealth-balance"))
+        assert len(list(source.rglob("*.mkv"))) == 8
+        assert json.loads((tmp_path / "checkpoint.json").read_text())["in_progress"] is None
+
+    def test_a_move_interrupted_after_rename_is_finished_on_resume(self, tmp_path):
+        source, target, usage = self._branches(tmp_path, files=1)
+        relpath = os.path.join("Movies", "Film", "part0.mkv")
+        (target / "Movies" / "Film").mkdir(parents=True)
+        shutil.copy2(source / relpath, target / relpath)
+        (tmp_path / "checkpoint.json").write_text(json.dumps({
+            "branches": list(usage),
+            "moved_files": 0,
+            "moved_bytes": 0,
+            "in_progress": {"path": relpath, "from": str(source), "to": str(target), "stage": "renamed"},
+        }))
+
+        events, _summary = consume_command(self._balancer(tmp_path, usage).run())
+
+        assert events[0] == {"type": "progress", "event": "recovered", "path": relpath}
+        assert not (source / relpath).exists()
+        assert (target / relpath).exists()
+
+    @pytest.mark.parametrize("stage", ["copy", "renaming"])
+    def test_a_rename_that_beat_its_checkpoint_is_finished_on_resume(self, tmp_path, stage):
+        source, target, usage = self._branches(tmp_path, files=1)
+        relpath = os.path.join("Movies", "Film", "part0.mkv")
+        (target / "Movies" / "Film").mkdir(parents=True)
+        shutil.copy2(source / relpath, target / relpath)
+        (tmp_path / "checkpoint.json").write_text(json.dumps({
+            "branches": list(usage),
+            "moved_files": 0,
+            "moved_bytes": 0,
+            "in_progress": {"path": relpath, "from": str(source), "to": str(target), "stage": stage},
+        }))
+
+        events, _summary = consume_command(self._balancer(tmp_path, usage).run())
+
+        assert events[0] == {"type": "progress", "event": "recovered", "path": relpath}
+        assert not (source / relpath).exists()
+        assert (target / relpath).read_bytes() == bytes([0]) * 5 * self.MB
+
+    def test_a_partial_target_left_by_a_crash_keeps_the_source(self, tmp_path):
+        source, target, usage = self._branches(tmp_path, files=1)
+        relpath = os.path.join("Movies", "Film", "part0.mkv")
+        (target / "Movies" / "Film").mkdir(parents=True)
+        (target / (relpath + ".pihealth-balance")).write_bytes(b"\x00" * self.MB)
+        (tmp_path / "checkpoint.json").write_text(json.dumps({
+            "branches": list(usage),
+            "moved_files": 0,
+            "moved_bytes": 0,
+            "in_progress": {"path": relpath, "from": str(source), "to": str(target), "stage": "renaming"},
+        }))
+
+        events, _summary = consume_command(self._balancer(tmp_path, usage).run())
+
+        assert events[0] == {"type": "progress", "event": "discarded", "path": relpath}
+        assert not list(target.rglob("*.pihealth-balance"))
+
+    def test_rate_limiter_sleeps_to_hold_the_rate(self):
+        from pool_files import RateLimiter
+
+        sleeps = []
+        limiter = RateLimiter(10 * self.MB, clock=lambda: 0.0, sleep=sleeps.append)
+        limiter.consume(10 * self.MB)
+        limiter.consume(5 * self.MB)
+        assert sleeps == [0.5]
 
 
 class TestMergerFSApplyConfig:
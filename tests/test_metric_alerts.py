@@ -0,0 +1,112 @@
+from metric_alerts import MetricAlertMonitor
+from metric_history import MetricHistoryStore
+
+
+START = 1_800_000_000 - 1_800_000_000 % 300
+
+
+def stats(cpu=20.0, memory=40.0, temperature=50.0, disk=50.0):
+    return {
+        "cpu_usage_percent": cpu,
+        "memory_usage": {"percent": memory},
+        "temperature_celsius": temperature,
+        "disk_usage": {"percent": disk},
+    }
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def by_key(signals):
+    return {signal.key: signal for signal in signals}
+
+
+def test_cpu_pages_only_after_staying_high_for_the_window(tmp_path):
+    clock = Clock(START)
+    store = MetricHistoryStore(tmp_path / "metrics.sqlite3", clock=clock)
+    monitor = MetricAlertMonitor(store, clock=clock)
+
+    results = []
+    for index in range(4):
+        store.record(stats(cpu=95.0), sampled_at=START + index * 300)
+        clock.now = START + (index + 1) * 300
+        results.append(by_key(monitor.signals())["metric:cpu"])
+
+    assert [signal.ok for signal in results] == [True, True, False, False]
+    assert results[2].summary.startswith("CPU usage has been at or above 85% for 15 min")
+    assert results[2].kind == "metric"
+
+    store.record(stats(cpu=30.0), sampled_at=START + 4 * 300)
+    clock.now = START + 5 * 300
+    assert by_key(monitor.signals())["metric:cpu"].ok is True
+
+
+def test_a_gap_in_collection_restarts_the_streak(tmp_path):
+    clock = Clock(START)
+    store = MetricHistoryStore(tmp_path / "metrics.sqlite3", clock=clock)
+    monitor = MetricAlertMonitor(store, clock=clock)
+    for at in (START, START + 300, START + 1800):
+        store.record(stats(temperature=85.0), sampled_at=at)
+    clock.now = START + 2100
+
+    assert by_key(monitor.signals())["metric:temperature"].ok is True
+
+
+def test_storage_filling_fast_is_projected_to_be_full_within_a_day(tmp_path):
+    clock = Clock(START)
+    store = MetricHistoryStore(tmp_path / "metrics.sqlite3", clock=clock)
+    # 2% an hour from 60%: the 38% left at the last reading is about 19 hours away.
+    for index in range(13):
+        store.record(stats(disk=60.0 + index / 6), sampled_at=START + index * 300)
+    clock.now = START + 13 * 300
+    monitor = MetricAlertMonitor(store, clock=clock)
+
+    trend = by_key(monitor.signals())["metric:disk_trend"]
+
+    assert trend.ok is False
+    assert "on course to fill in about 19h" in trend.summary
+
+
+def test_slow_growth_and_stale_history_do_not_alert(tmp_path):
+    clock = Clock(START)
+    store = MetricHistoryStore(tmp_path / "metrics.sqlite3", clock=clock)
+    for index in range(13):
+        store.record(stats(disk=60.0 + index / 1000), sampled_at=START + index * 300)
+    clock.now = START + 13 * 300
+    monitor = MetricAlertMonitor(store, clock=clock)
+    assert by_key(monitor.signals())["metric:disk_trend"].ok is True
+
+    clock.now += 3600
+    assert monitor.signals() == []
+
+
+def test_ticks_after_warmup_only_read_newly_closed_buckets(tmp_path):
+    clock = Clock(START)
+    store = MetricHistoryStore(tmp_path / "metrics.sqlite3", clock=clock)
+    calls = []
+    original = store.rollup
+
+    def rollup(start, end, bucket_seconds):
+        calls.append((start, end))
+        return original(start, end, bucket_seconds)
+
+    store.rollup = rollup
+    monitor = MetricAlertMonitor(store, clock=clock)
+    monitor.signals()
+    clock.now += 100
+    monitor.signals()
+    clock.now += 300
+    monitor.signals()
+
+    assert len(calls) == 2
+    assert calls[1] == (START, START + 300)
+
+
+def test_missing_database_yields_no_signals(tmp_path):
+    store = MetricHistoryStore(tmp_path / "absent.sqlite3")
+    assert MetricAlertMonitor(store, clock=lambda: START).signals() == []
@@ -1,10 +1,13 @@
 import pytest
 
+import operation_manager
 from operation_manager import (
     OperationCapacityError,
     OperationConflictError,
+    SPILL_SUFFIX,
     OperationRegistry,
 )
+from operation_store import OperationStore
 
 
 class FakeClock:
@@ -68,6 +71,104 @@ def test_registry_replays_trimmed_events_with_monotonic_ids():
     assert batch.complete is True
 
 
+def test_registry_trims_events_by_bytes_but_keeps_the_latest():
+    registry = immediate_registry(byte_limit=100)
+    operation = registry.create(
+        owner="opaque-owner",
+        username="alice",
+        kind="stack",
+        target="media",
+        producer=lambda: iter(
+            [{"line": "x" * 40}, {"line": "y" * 40}, {"line": "z" * 200}, {"done": True}]
+        ),
+    )
+
+    batch = registry.events_since(
+        operation.operation_id,
+        expected_kind="stack",
+        owner="opaque-owner",
+    )
+
+    assert [event.event_id for event in batch.events] == [3]
+    assert operation.event_bytes <= 100
+
+
+def test_registry_replays_spilled_events_seamlessly(tmp_path):
+    stale = tmp_path / f"stale{SPILL_SUFFIX}"
+    stale.write_bytes(b"old")
+    registry = immediate_registry(event_limit=10, spill_dir=tmp_path)
+    assert not stale.exists()
+    payloads = [{"authorization_url": "https://example.test/secret", "_ephemeral": True}]
+    payloads += [{"line": index} for index in range(1, 50)] + [{"done": True}]
+    operation = registry.create(
+        owner="opaque-owner",
+        username="alice",
+        kind="stack",
+        target="media",
+        producer=lambda: iter(payloads),
+    )
+
+    assert len(operation.events) <= 10
+    assert operation.spill_path.read_bytes().find(b"example.test") == -1
+    cursor, events, batches = 0, [], 0
+    while True:
+        batch = registry.events_since(
+            operation.operation_id,
+            expected_kind="stack",
+            owner="opaque-owner",
+            cursor=cursor,
+        )
+        batches += 1
+        events.extend(batch.events)
+        cursor = batch.next_cursor
+        if batch.complete:
+            break
+
+    assert batches > 2
+    assert [event.event_id for event in events] == list(range(51))
+    assert events[0].payload == {"expired": True}
+    assert [event.payload for event in events[1:]] == payloads[1:]
+
+    middle = registry.events_since(
+        operation.operation_id,
+        expected_kind="stack",
+        owner="opaque-owner",
+        cursor=5,
+    )
+    assert middle.events[0].event_id == 5
+    assert middle.complete is False
+
+    operation.spill_path.write_bytes(b"corrupt")
+    skipped = registry.events_since(
+        operation.operation_id,
+        expected_kind="stack",
+        owner="opaque-owner",
+        cursor=0,
+    )
+    assert skipped.events[0].event_id == operation.first_event_id
+    assert skipped.complete is True
+
+
+def test_pruned_operation_removes_its_spill_file(tmp_path):
+    clock = FakeClock()
+    registry = immediate_registry(
+        clock=clock, ttl_seconds=10, event_limit=2, spill_dir=tmp_path
+    )
+    operation = registry.create(
+        owner="opaque-owner",
+        username="alice",
+        kind="stack",
+        target="media",
+        producer=lambda: iter([{"line": index} for index in range(5)] + [{"done": True}]),
+    )
+    assert operation.spill_path.exists()
+    clock.value = 11
+
+    registry.is_owner(operation.operation_id, expected_kind="stack", owner="opaque-owner")
+
+    assert not operation.spill_path.exists()
+
+
 def test_registry_rejects_wrong_owner_and_kind():
     registry = immediate_registry()
     operation = registry.create(
@@ -259,3 +360,164 @@ def test_integration_lifecycle_unexpected_exception_is_bounded_and_private():
     assert batch.events[-1].payload == {
         "error": "Integration lifecycle operation failed"
     }
+
+
+def test_subscribers_share_frames_rendered_once():
+    registry = OperationRegistry(thread_factory=DormantThread)
+    operation = registry.create(
+        owner="opaque-owner",
+        username="alice",
+        kind="stack",
+        target="media",
+        producer=lambda: iter(()),
+    )
+    first = registry.subscribe(
+        operation.operation_id, expected_kind="stack", owner="opaque-owner"
+    )
+    second = registry.subscribe(
+        operation.operation_id, expected_kind="stack", owner="opaque-owner"
+    )
+    assert registry.subscribe(
+        operation.operation_id, expected_kind="stack", owner="other-owner"
+    ) is None
+
+    operation.append({"line": "hello", "_ephemeral": True}, event_limit=10)
+    operation.append({"done": True}, event_limit=10)
+    batches = [first.next_batch(), second.next_batch()]
+
+    assert batches[0].events[0].frame is batches[1].events[0].frame
+    assert batches[0].events[0].frame == 'id: 0\ndata: {"line": "hello"}\n\n'
+    assert batches[0].complete is True
+    assert first.cursor == 2
+
+
+def test_lagging_subscriber_is_dropped_and_discard_ends_streams():
+    registry = OperationRegistry(thread_factory=DormantThread, event_limit=2)
+    operation = registry.create(
+        owner="opaque-owner",
+        username="alice",
+        kind="stack",
+        target="media",
+        producer=lambda: iter(()),
+    )
+    slow = registry.subscribe(
+        operation.operation_id, expected_kind="stack", owner="opaque-owner"
+    )
+    fast = registry.subscribe(
+        operation.operation_id, expected_kind="stack", owner="opaque-owner"
+    )
+    operation.append({"line": 0}, event_limit=2)
+    assert slow.next_batch().next_cursor == 1
+    for index in range(1, 5):
+        operation.append({"line": index}, event_limit=2)
+
+    assert slow.next_batch() is None
+    assert slow.dropped is True
+    assert [event.event_id for event in fast.next_batch().events] == [3, 4]
+
+    operation.discard()
+    assert fast.next_batch() is None
+    assert fast.dropped is False
+
+
+def drain(registry, operation_id, owner="opaque-owner", kind="stack"):
+    cursor, events = 0, []
+    while True:
+        batch = registry.events_since(
+            operation_id, expected_kind=kind, owner=owner, cursor=cursor
+        )
+        if batch is None:
+            return None
+        events.extend(batch.events)
+        cursor = batch.next_cursor
+        if batch.complete:
+            return events
+
+
+def test_finished_operation_can_be_reattached_after_restart(tmp_path):
+    store = OperationStore(tmp_path / "operations.sqlite3")
+    payloads = [{"line": index} for index in range(30)] + [{"done": True}]
+    registry = immediate_registry(event_limit=10, spill_dir=tmp_path, store=store)
+    operation = registry.create(
+        owner="opaque-owner",
+        username="alice",
+        kind="stack",
+        target="media",
+        producer=lambda: iter(payloads),
+    )
+    (tmp_path / f"orphan{SPILL_SUFFIX}").write_bytes(b"old")
+
+    restarted = immediate_registry(event_limit=10, spill_dir=tmp_path, store=store)
+
+    assert not (tmp_path / f"orphan{SPILL_SUFFIX}").exists()
+    events = drain(restarted, operation.operation_id)
+    assert [event.payload for event in events] == payloads
+    assert [event.event_id for event in events] == list(range(31))
+    assert drain(restarted, operation.operation_id, owner="other-owner") is None
+
+
+def test_running_operation_is_marked_interrupted_after_restart(tmp_path, monkeypatch):
+    monkeypatch.setattr(operation_manager, "FLUSH_INTERVAL_SECONDS", 0)
+    store = OperationStore(tmp_path / "operations.sqlite3")
+    registry = OperationRegistry(
+        thread_factory=DormantThread, spill_dir=tmp_path, store=store
+    )
+    operation = registry.create(
+        owner="opaque-owner",
+        username="alice",
+        kind="catalog-install",
+        target="jellyfin",
+        producer=lambda: iter(()),
+    )
+    operation.append({"line": "pulling"}, event_limit=10)
+    operation.append({"step": "starting", "_ephemeral": True}, event_limit=10)
+
+    restarted = OperationRegistry(spill_dir=tmp_path, store=store)
+    events = drain(restarted, operation.operation_id, kind="catalog-install")
+
+    assert [event.payload for event in events] == [
+        {"line": "pulling"},
+        {"expired": True},
+        {
+            "error": "Operation interrupted by a restart",
+            "interrupted": True,
+            "last_progress": {"line": "pulling"},
+        },
+    ]
+    with pytest.raises(ValueError, match="spill directory"):
+        OperationRegistry(store=store)
+
+
+def test_failed_journal_records_are_retried_outside_the_condition(tmp_path, monkeypatch):
+    monkeypatch.setattr(operation_manager, "FLUSH_INTERVAL_SECONDS", 0)
+    outcomes = [False, True, True]
+    recorded = []
+
+    def on_flush(operation, member, progress):
+        # The journal never blocks readers waiting on the operation.
+        assert operation.condition.acquire(blocking=False)
+        operation.condition.release()
+        recorded.append(member[:2])
+        return outcomes.pop(0)
+
+    operation = operation_manager.BackgroundOperation(
+        "op",
+        "opaque-owner",
+        "alice",
+        "stack",
+        "media",
+        created_at=0,
+        spill_path=tmp_path / f"op{SPILL_SUFFIX}",
+        on_flush=on_flush,
+    )
+    operation.append({"line": 0}, event_limit=10)
+
+    assert operation.written_event_id == 1
+    assert operation.persisted_event_id == 0
+
+    operation.append({"line": 1}, event_limit=10)
+
+    assert recorded == [(0, 1), (0, 1), (1, 1)]
+    assert operation.persisted_event_id == 2
+    assert [member[:2] for member in operation.spilled] == [(0, 1), (1, 1)]
+
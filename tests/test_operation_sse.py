@@ -2,7 +2,8 @@
 
 Locks in the reconnect and ownership invariants of ``stream_operation_response``:
 session->owner mapping, Last-Event-ID cursor math, SSE framing, keep-alives, and
-stream termination on completion or lost ownership. Uses a fake registry so no
+stream termination on completion, lost ownership or a dropped subscriber. Uses a
+fake registry so no
 threads or sockets are involved; failures here mean a transport invariant moved
 even if a payload still looks valid.
 """
@@ -17,28 +18,36 @@ KIND = "catalog-install"
 OP_ID = "op-1"
 
 
-class FakeRegistry:
-    def __init__(self, *, is_owner=True, batches=None):
-        self._is_owner = is_owner
-        self._batches = list(batches or [])
-        self.is_owner_calls = []
-        self.events_since_calls = []
+class FakeSubscription:
+    def __init__(self, batches):
+        self._batches = batches
+        self.next_batch_calls = 0
 
-    def is_owner(self, operation_id, *, expected_kind, owner):
-        self.is_owner_calls.append(
-            {"operation_id": operation_id, "expected_kind": expected_kind, "owner": owner}
-        )
-        return self._is_owner
-
-    def events_since(self, operation_id, *, expected_kind, owner, cursor, wait_timeout):
-        self.events_since_calls.append(
-            {"cursor": cursor, "owner": owner, "expected_kind": expected_kind}
-        )
+    def next_batch(self, wait_timeout):
+        self.next_batch_calls += 1
         if self._batches:
             return self._batches.pop(0)
         return None
 
 
+class FakeRegistry:
+    def __init__(self, *, is_owner=True, batches=None):
+        self._is_owner = is_owner
+        self.subscription = FakeSubscription(list(batches or []))
+        self.subscribe_calls = []
+
+    def subscribe(self, operation_id, *, expected_kind, owner, cursor):
+        self.subscribe_calls.append(
+            {
+                "operation_id": operation_id,
+                "expected_kind": expected_kind,
+                "owner": owner,
+                "cursor": cursor,
+            }
+        )
+        return self.subscription if self._is_owner else None
+
+
 def _event(event_id, payload):
     return OperationEvent(event_id=event_id, payload=payload)
 
@@ -75,7 +84,7 @@ def test_non_owner_gets_404():
 def test_ownership_check_uses_session_token_and_expected_kind():
     registry = FakeRegistry(is_owner=False)
     _client(registry, owner="my-token").get("/stream")
-    call = registry.is_owner_calls[0]
+    call = registry.subscribe_calls[0]
     assert call["owner"] == "my-token"
     assert call["expected_kind"] == KIND
     assert call["operation_id"] == OP_ID
@@ -86,7 +95,7 @@ def test_missing_session_token_is_treated_as_non_owner():
     registry = FakeRegistry(is_owner=False)
     response = _client(registry, owner=None).get("/stream")
     assert response.status_code == 404
-    assert registry.is_owner_calls[0]["owner"] is None
+    assert registry.subscribe_calls[0]["owner"] is None
 
 
 # --- SSE framing and completion ---------------------------------------------
@@ -146,8 +155,8 @@ def test_emits_keep_alive_when_no_events_yet():
 
 
 def test_stream_ends_when_ownership_lost_midway():
-    # events_since returning None (ownership revoked / gone) terminates the stream.
-    registry = FakeRegistry(batches=[])  # first events_since returns None
+    # next_batch returning None (operation gone or subscriber dropped) ends the stream.
+    registry = FakeRegistry(batches=[])  # first next_batch returns None
     response = _client(registry).get("/stream")
     assert response.status_code == 200
     assert response.get_data(as_text=True) == ""
@@ -158,26 +167,26 @@ def test_stream_ends_when_ownership_lost_midway():
 def test_last_event_id_resumes_after_given_id():
     registry = FakeRegistry(batches=[_batch([], next_cursor=0, complete=True)])
     _client(registry).get("/stream", headers={"Last-Event-ID": "4"}).get_data()
-    assert registry.events_since_calls[0]["cursor"] == 5
+    assert registry.subscribe_calls[0]["cursor"] == 5
 
 
 def test_missing_last_event_id_starts_at_zero():
     registry = FakeRegistry(batches=[_batch([], next_cursor=0, complete=True)])
     _client(registry).get("/stream").get_data()
-    assert registry.events_since_calls[0]["cursor"] == 0
+    assert registry.subscribe_calls[0]["cursor"] == 0
 
 
 def test_non_integer_last_event_id_starts_at_zero():
     registry = FakeRegistry(batches=[_batch([], next_cursor=0, complete=True)])
     _client(registry).get("/stream", headers={"Last-Event-ID": "not-a-number"}).get_data()
-    assert registry.events_since_calls[0]["cursor"] == 0
+    assert registry.subscribe_calls[0]["cursor"] == 0
 
 
 def test_negative_last_event_id_is_clamped_to_zero():
     registry = FakeRegistry(batches=[_batch([], next_cursor=0, complete=True)])
     # "-5" + 1 = -4, clamped up to 0.
     _client(registry).get("/stream", headers={"Last-Event-ID": "-5"}).get_data()
-    assert registry.events_since_calls[0]["cursor"] == 0
+    assert registry.subscribe_calls[0]["cursor"] == 0
 
 
 def test_cursor_advances_across_batches():
@@ -187,6 +196,6 @@ def test_cursor_advances_across_batches():
             _batch([_event(2, {"done": True})], next_cursor=3, complete=True),
         ]
     )
-    _client(registry).get("/stream").get_data()
-    assert registry.events_since_calls[0]["cursor"] == 0
-    assert registry.events_since_calls[1]["cursor"] == 2
+    body = _client(registry).get("/stream").get_data(as_text=True)
+    assert registry.subscription.next_batch_calls == 2
+    assert body.index("id: 1\n") < body.index("id: 2\n")
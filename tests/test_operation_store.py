@@ -0,0 +1,82 @@
+import sqlite3
+from types import SimpleNamespace
+
+from operation_store import SCHEMA, OperationStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.value = 1_000_000.0
+
+    def __call__(self):
+        return self.value
+
+
+def started(store, operation_id):
+    store.start(
+        SimpleNamespace(
+            operation_id=operation_id,
+            owner="session-token",
+            username="alice",
+            kind="stack",
+            target="media",
+        )
+    )
+
+
+def test_recover_keeps_recent_operations_with_their_log(tmp_path):
+    clock = FakeClock()
+    store = OperationStore(tmp_path / "operations.sqlite3", clock=clock)
+    started(store, "old")
+    store.finish("old", 0)
+    clock.value += 3600
+    started(store, "done")
+    store.record_flush("done", (0, 4, 0, 120), {"line": "pulled"})
+    store.record_flush("done", (4, 1, 120, 40), None)
+    store.finish("done", 5)
+    started(store, "running")
+
+    rows = {row["operation_id"]: row for row in store.recover(max_age=900, limit=10)}
+
+    assert set(rows) == {"done", "running"}
+    assert rows["done"]["status"] == "complete"
+    assert rows["done"]["members"] == [(0, 4, 0, 120), (4, 1, 120, 40)]
+    assert rows["done"]["progress"] == {"line": "pulled"}
+    assert rows["running"]["status"] == "interrupted"
+    with sqlite3.connect(tmp_path / "operations.sqlite3") as connection:
+        dump = "\n".join(connection.iterdump())
+    assert "session-token" not in dump
+
+
+def test_recover_trims_to_the_newest_operations(tmp_path):
+    clock = FakeClock()
+    store = OperationStore(tmp_path / "operations.sqlite3", clock=clock)
+    for index in range(3):
+        clock.value += 1
+        started(store, f"op-{index}")
+        store.record_flush(f"op-{index}", (0, 1, 0, 10), None)
+
+    rows = store.recover(max_age=900, limit=2)
+
+    assert [row["operation_id"] for row in rows] == ["op-1", "op-2"]
+    store.delete("op-1")
+    assert [row["operation_id"] for row in store.recover(max_age=900, limit=2)] == ["op-2"]
+    assert OperationStore(tmp_path / "missing.sqlite3").recover(max_age=900, limit=2) == []
+
+
+def test_schema_is_created_once_per_store(tmp_path, monkeypatch):
+    executed = []
+    store = OperationStore(tmp_path / "operations.sqlite3")
+    connect = store._connect
+
+    def traced_connect():
+        connection = connect()
+        connection.set_trace_callback(executed.append)
+        return connection
+
+    monkeypatch.setattr(store, "_connect", traced_connect)
+    started(store, "op")
+    store.record_flush("op", (0, 1, 0, 10), None)
+    store.record_flush("op", (1, 1, 10, 10), None)
+
+    assert len([sql for sql in executed if "CREATE TABLE" in sql]) == len(SCHEMA)
@@ -8,6 +8,7 @@ import json
 import socket
 import stat
 import struct
+import threading
 from unittest.mock import patch, MagicMock, mock_open
 
 import pytest
@@ -22,6 +23,8 @@ import importlib
 with patch("logging.FileHandler", return_value=logging.StreamHandler()):
     helper = importlib.import_module("pihealth_helper")
 
+from backup_index import file_digest, load_metadata  # noqa: E402
+
 
 class TestRunCommand:
     @patch("pihealth_helper.subprocess.run")
@@ -566,10 +569,9 @@ class TestHelperConcurrency:
             patch("pihealth_helper.os.path.exists", return_value=True),
             patch("pihealth_helper.os.makedirs"),
             patch("pihealth_helper.os.listdir", return_value=[]),
-            patch(
-                "pihealth_helper.run_command",
-                return_value={"returncode": 0, "stdout": "", "stderr": ""},
-            ),
+            patch("pihealth_helper._estimate_backup_bytes", return_value=0),
+            patch("pihealth_helper._write_backup_archive", return_value=(None, 0)),
+            patch("pihealth_helper._write_backup_metadata"),
         ):
             result = helper.cmd_backup_create(
                 {"sources": sources, "dest_dir": "/mnt/backups"}
@@ -612,6 +614,14 @@ class TestRequestHandling:
     def test_alert_health_snapshot_is_exposed(self):
         assert "alert_health_snapshot" in helper.COMMANDS
 
+    def test_alert_health_snapshot_reads_only_requested_sections(self):
+        with patch.object(helper, "cmd_smart_all_devices") as smart, \
+                patch.object(helper, "cmd_mounts_read", return_value={"success": True, "data": []}):
+            result = helper.cmd_alert_health_snapshot({"sections": ["mounts"]})
+        smart.assert_not_called()
+        assert result == {"success": True, "mounts": {"success": True, "data": []}}
+        assert helper.cmd_alert_health_snapshot({"sections": ["shell"]})["success"] is False
+
     def test_raw_file_write_commands_are_not_exposed(self):
         for command in ("write_systemd_unit", "write_startup_script"):
             request = json.dumps({"command": command, "params": {"content": "#!/bin/sh"}})
@@ -907,3 +917,365 @@ class TestUpdateBuildStaleness:
         result = helper._pihealth_update_build(self._CTX)
         assert result["success"] and result.get("skipped")
         run_command.assert_not_called()
+
+
+class TestSmartCollector:
+    SMART_JSON = json.dumps({"device": {"name": "/dev/sda"}, "smart_status": {"passed": True}})
+    STANDBY = json.dumps({
+        "smartctl": {"messages": [{"string": "Device is in STANDBY mode, exit(2)"}]}
+    })
+
+    def collector(self, replies, now):
+        calls = []
+
+        def runner(cmd, timeout):
+            calls.append(cmd)
+            return replies.pop(0)
+
+        collector = helper.SmartCollector(
+            runner=runner, which=lambda _name: "/usr/sbin/smartctl", clock=lambda: now[0]
+        )
+        return collector, calls
+
+    def test_sleeping_drive_answers_from_last_read_without_waking(self):
+        now = [1000.0]
+        collector, calls = self.collector([
+            {"stdout": self.SMART_JSON, "stderr": "", "returncode": 0},
+            {"stdout": self.STANDBY, "stderr": "", "returncode": 2},
+        ], now)
+
+        first = collector.read("/dev/sda")
+        now[0] += helper.SMART_REFRESH_SECONDS + 1
+        second = collector.read("/dev/sda")
+
+        assert first["power_state"] == "active" and first["cached"] is False
+        assert second["power_state"] == "standby" and second["cached"] is True
+        assert second["data"]["smart_status"]["passed"] is True
+        assert all(["-n", "standby"] == cmd[3:5] for cmd in calls)
+
+    def test_reads_within_the_refresh_interval_are_served_from_cache(self):
+        now = [1000.0]
+        collector, calls = self.collector([
+            {"stdout": self.SMART_JSON, "stderr": "", "returncode": 0},
+        ], now)
+        collector.read("/dev/sda")
+        now[0] += 60
+        assert collector.read("/dev/sda")["cached"] is True
+        assert len(calls) == 1
+
+    def test_standby_without_a_previous_read_reports_no_data(self):
+        collector, _calls = self.collector([
+            {"stdout": self.STANDBY, "stderr": "", "returncode": 2},
+        ], [0.0])
+        result = collector.read("/dev/sdb")
+        assert result["data"] is None
+        assert "standby" in result["error"]
+
+    def test_sat_transport_is_remembered_after_fallback(self):
+        now = [0.0]
+        collector, calls = self.collector([
+            {"stdout": "", "stderr": "Unknown USB bridge", "returncode": 1},
+            {"stdout": self.SMART_JSON, "stderr": "", "returncode": 0},
+            {"stdout": self.SMART_JSON, "stderr": "", "returncode": 0},
+        ], now)
+        collector.read("/dev/sdc")
+        now[0] += helper.SMART_REFRESH_SECONDS + 1
+        collector.read("/dev/sdc")
+        assert "-d" not in calls[0]
+        assert calls[1][-3:] == ["-d", "sat", "/dev/sdc"]
+        assert calls[2][-3:] == ["-d", "sat", "/dev/sdc"]
+
+    def test_explicit_info_read_may_wake_the_drive(self):
+        collector, calls = self.collector([
+            {"stdout": self.SMART_JSON, "stderr": "", "returncode": 0},
+        ], [0.0])
+        with patch.object(helper, "SMART_COLLECTOR", collector):
+            result = helper.cmd_smart_info({"device": "/dev/sda"})
+        assert result == {"success": True, "data": json.loads(self.SMART_JSON)}
+        assert "standby" not in calls[0]
+
+    def test_all_devices_rejects_negative_max_age(self):
+        result = helper.cmd_smart_all_devices({"max_age_seconds": -1})
+        assert result["success"] is False
+
+    def test_all_devices_reads_concurrently_and_reports_a_hung_drive(self):
+        release = threading.Event()
+        started = []
+
+        def read(device, **_kwargs):
+            started.append(device)
+            if device == "/dev/sdb":
+                release.wait(5)
+            return {"success": True, "data": {"device": {"name": device}},
+                    "power_state": "active", "cached": False, "read_at": None}
+
+        collector = MagicMock()
+        collector.read.side_effect = read
+        lsblk = {"stdout": "sda disk\nsdb disk\nsdc disk\n", "returncode": 0}
+        try:
+            with patch.object(helper, "SMART_COLLECTOR", collector), \
+                    patch.object(helper, "SMART_BATCH_DEADLINE_SECONDS", 0.2), \
+                    patch("pihealth_helper.run_command", return_value=lsblk):
+                result = helper.cmd_smart_all_devices({"max_workers": 3})
+        finally:
+            release.set()
+
+        devices = result["devices"]
+        assert [entry["device"] for entry in devices] == ["/dev/sda", "/dev/sdb", "/dev/sdc"]
+        assert devices[0]["data"] == {"device": {"name": "/dev/sda"}}
+        assert devices[1] == {"device": "/dev/sdb", "error": "Timed out reading SMART data"}
+        assert devices[2]["power_state"] == "active"
+
+    def test_all_devices_validates_concurrency(self):
+        assert helper.cmd_smart_all_devices({"max_workers": 0})["success"] is False
+        assert helper.cmd_smart_all_devices({"max_workers": 99})["success"] is False
+        assert helper.cmd_smart_all_devices({"timeout_seconds": 0})["success"] is False
+
+
+class TestDiskBenchmark:
+    def _fake_usb_disk(self, tmp_path):
+        usb = tmp_path / "devices" / "platform" / "usb2" / "2-1"
+        interface = usb / "2-1:1.0"
+        scsi = interface / "host0" / "target0" / "0:0:0:0"
+        scsi.mkdir(parents=True)
+        drivers = tmp_path / "drivers"
+        (drivers / "usb-storage").mkdir(parents=True)
+        (drivers / "sd").mkdir()
+        (interface / "driver").symlink_to(drivers / "usb-storage")
+        (scsi / "driver").symlink_to(drivers / "sd")
+        (scsi / "model").write_text("Elements 25A3\n")
+        (usb / "speed").write_text("480\n")
+        block = tmp_path / "block" / "sda"
+        (block / "queue").mkdir(parents=True)
+        (block / "queue" / "rotational").write_text("1\n")
+        (block / "device").symlink_to(scsi)
+        return tmp_path / "block"
+
+    def test_sysfs_reports_usb_storage_fallback_and_link_speed(self, tmp_path):
+        sys_block = self._fake_usb_disk(tmp_path)
+
+        info = helper._block_device_info("sda", sys_block=str(sys_block))
+
+        assert info == {
+            "model": "Elements 25A3",
+            "rotational": True,
+            "transport": "usb",
+            "driver": "usb-storage",
+            "usb_speed_mbps": 480,
+        }
+
+    def test_rejects_partitions_bad_limits_and_foreign_write_paths(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(helper, "SYS_BLOCK_PATH", str(self._fake_usb_disk(tmp_path)))
+
+        assert helper.cmd_disk_benchmark({"device": "notdev"})["success"] is False
+        assert "whole disk" in helper.cmd_disk_benchmark({"device": "/dev/sda1"})["error"]
+        result = helper.cmd_disk_benchmark({"device": "/dev/sda", "seq_mb": 4096})
+        assert result["error"] == "seq_mb must be between 16 and 1024"
+        result = helper.cmd_disk_benchmark({"device": "/dev/sda", "write_path": "/etc"})
+        assert result["error"] == "Invalid write path"
+
+    def test_read_test_is_bounded_by_size_and_count(self, tmp_path, monkeypatch):
+        # tmpfs refuses O_DIRECT; the measurement loop is what is under test here.
+        monkeypatch.setattr(os, "O_DIRECT", 0)
+        image = tmp_path / "disk.img"
+        image.write_bytes(b"\0" * (3 * 1024 * 1024))
+
+        result = helper._direct_read_test(str(image), 2 * 1024 * 1024, 50, deadline=float("inf"))
+
+        assert result["size_bytes"] == 3 * 1024 * 1024
+        assert result["sequential_read_bytes"] == 2 * 1024 * 1024
+        assert result["random_reads"] == 50
+        assert result["random_read_iops"] > 0
+
+
+class TestBackupSnapshots:
+    def _wait(self, job_id):
+        cursor = 0
+        events = []
+        for _ in range(500):
+            status = helper.cmd_backup_job_status({'job_id': job_id, 'cursor': cursor})
+            assert status['success'] is True
+            events.extend(status['events'])
+            cursor = status['cursor']
+            if status['done']:
+                return status['result'], events
+            threading.Event().wait(0.01)
+        raise AssertionError('backup job did not finish')
+
+    def test_snapshot_jobs_back_up_and_restore_through_the_chunk_store(self, tmp_path, monkeypatch):
+        import re
+
+        source = tmp_path / 'opt' / 'stacks'
+        source.mkdir(parents=True)
+        (source / 'compose.yaml').write_text('services: {}\n')
+        monkeypatch.setattr(helper, 'BACKUP_SOURCE_ALLOWED', (str(tmp_path) + '/',))
+        monkeypatch.setattr(helper, 'BACKUP_DEST_PATTERN', re.compile(r'^/.*$'))
+        dest = str(tmp_path / 'backup')
+
+        started = helper.cmd_backup_snapshot_create({
+            'sources': [str(source)],
+            'dest_dir': dest,
+            'retention_count': 1,
+            'archive_prefix': 'pi-health-backup',
+        })
+        result, _events = self._wait(started['job_id'])
+
+        assert result['success'] is True
+        assert result['summary']['files'] == 1
+        assert os.path.isfile(
+            os.path.join(dest, 'pi-health-chunks', 'snapshots', f"{result['snapshot']}.json")
+        )
+
+        (source / 'compose.yaml').write_text('broken')
+        restore = helper.cmd_backup_snapshot_restore({
+            'dest_dir': dest, 'snapshot': result['snapshot'],
+        })
+        restored, _events = self._wait(restore['job_id'])
+        assert restored['success'] is True
+        assert (source / 'compose.yaml').read_text() == 'services: {}\n'
+
+    def test_snapshot_commands_validate_requests(self, tmp_path, monkeypatch):
+        assert helper.cmd_backup_snapshot_create({'sources': [], 'dest_dir': '/mnt/backup'})['error'] == 'sources required'
+        assert helper.cmd_backup_snapshot_restore({'dest_dir': '/mnt/backup', 'snapshot': '../x'})['error'] == 'Invalid snapshot name'
+        assert helper.cmd_backup_snapshot_restore({'dest_dir': '/etc', 'snapshot': 'x'})['error'] == 'Invalid dest_dir'
+        assert helper.cmd_backup_job_status({'job_id': 'missing'})['error'] == 'Unknown backup job'
+        assert 'backup_job_status' in helper.COMMANDS
+
+
+class TestBackupArchivePipeline:
+    def test_archive_job_reports_bytes_and_round_trips(self, tmp_path, monkeypatch):
+        import re
+        import tarfile
+
+        source = tmp_path / 'opt' / 'stacks'
+        source.mkdir(parents=True)
+        (source / 'compose.yaml').write_bytes(b'services: {}\n' * 4000)
+        (source / 'app.log').write_text('noise')
+        monkeypatch.setattr(helper, 'BACKUP_SOURCE_ALLOWED', (str(tmp_path) + '/',))
+        monkeypatch.setattr(helper, 'BACKUP_DEST_PATTERN', re.compile(r'^/.*$'))
+        monkeypatch.setattr(helper, 'BACKUP_JOB_PROGRESS_INTERVAL', 0)
+        monkeypatch.setattr(helper, 'BACKUP_PIPE_CHUNK', 4096)
+        dest = tmp_path / 'backup'
+
+        started = helper.cmd_backup_create({
+            'sources': [str(source)],
+            'dest_dir': str(dest),
+            'compression': 'gz',
+            'compression_level': 1,
+            'excludes': ['*.log'],
+            'background': True,
+        })
+        result, events = TestBackupSnapshots()._wait(started['job_id'])
+
+        assert result['success'] is True
+        assert result['archive'].endswith('.tar.gz')
+        archive_name = os.path.basename(result['archive'])
+        assert sorted(os.listdir(dest)) == [
+            archive_name, f'{archive_name}.index.json', f'{archive_name}.meta.json'
+        ]
+        metadata = load_metadata(result['archive'])
+        assert metadata['sources'] == [str(source)]
+        assert metadata['bytes'] == events[-1]['bytes']
+        assert metadata['archive_bytes'] == os.path.getsize(result['archive'])
+        assert 0 < metadata['ratio'] < 1
+        assert metadata['checksum'] == f"blake2b:{file_digest(result['archive'])}"
+        assert events[-1]['bytes'] >= events[0]['bytes'] > 0
+        # Headers plus padded data: the estimate is within a record of tar's stream.
+        assert abs(events[-1]['bytes'] - events[-1]['bytes_total']) <= 10240
+        with tarfile.open(result['archive']) as archive:
+            names = archive.getnames()
+        assert any(name.endswith('compose.yaml') for name in names)
+        assert not any(name.endswith('app.log') for name in names)
+
+        target = tmp_path / 'restore'
+        target.mkdir()
+        error = helper._extract_backup_archive(
+            result['archive'], ['gzip', '-d', '-c'],
+            ['tar', '-x', '-f', '-', '-C', str(target)], lambda _event: None,
+        )
+        assert error is None
+        restored = target / str(source).lstrip('/') / 'compose.yaml'
+        assert restored.read_bytes() == b'services: {}\n' * 4000
+
+    def test_selected_paths_restore_from_the_index(self, tmp_path, monkeypatch):
+        import functools
+        import re
+
+        source = tmp_path / 'opt' / 'stacks'
+        for stack in ('jellyfin', 'sonarr'):
+            (source / stack).mkdir(parents=True)
+            (source / stack / '.env').write_text(f'STACK={stack}\n')
+            (source / stack / 'blob.bin').write_bytes(os.urandom(20000))
+        monkeypatch.setattr(helper, 'BACKUP_SOURCE_ALLOWED', (str(tmp_path) + '/',))
+        monkeypatch.setattr(helper, 'BACKUP_DEST_PATTERN', re.compile(r'^/.*$'))
+        monkeypatch.setattr(
+            helper, 'FrameWriter', functools.partial(helper.FrameWriter, frame_size=8192)
+        )
+        result = helper.cmd_backup_create({
+            'sources': [str(source)], 'dest_dir': str(tmp_path / 'backup'), 'compression': 'gz',
+        })
+        assert result['success'] is True
+        assert len(helper.load_index(result['archive'])['frames']) > 3
+
+        staging = tmp_path / 'staging'
+        staging.mkdir()
+        error, restored = helper._extract_backup_paths(
+            result['archive'], [f'{source}/sonarr'], ['gzip', '-d', '-c'],
+            ['tar', '-x', '-f', '-', '-C', str(staging)], lambda _event: None,
+        )
+
+        assert error is None
+        assert restored == 3
+        stack = staging / str(source).lstrip('/')
+        assert (stack / 'sonarr' / '.env').read_text() == 'STACK=sonarr\n'
+        assert (stack / 'sonarr' / 'blob.bin').read_bytes() == (source / 'sonarr' / 'blob.bin').read_bytes()
+        assert not (stack / 'jellyfin').exists()
+        assert helper._extract_backup_paths(
+            result['archive'], ['/opt/missing'], ['gzip', '-d', '-c'], ['true'], print,
+        ) == ('No matching paths in archive', 0)
+
+        index = helper.load_index(result['archive'])
+        for entry in index['entries']:
+            if entry['path'].endswith('sonarr/.env'):
+                entry['hash'] = '0' * 64
+        helper.write_index(result['archive'], index)
+        (stack / 'sonarr' / '.env').write_text('LIVE=1\n')
+        error, _restored = helper._extract_backup_paths(
+            result['archive'], [f'{source}/sonarr'], ['gzip', '-d', '-c'],
+            ['tar', '-x', '--overwrite', '-f', '-', '-C', str(staging)], lambda _event: None,
+        )
+        assert 'differs from the backup' in error
+        assert (stack / 'sonarr' / '.env').read_text() == 'LIVE=1\n'
+
+    def test_restore_selection_is_validated(self):
+        assert helper._restore_selection({}) == (None, '/', None)
+        assert helper._restore_selection({'paths': ['/opt/stacks/a'], 'target': '/mnt/backup/staging'}) == (
+            ['/opt/stacks/a'], '/mnt/backup/staging', None
+        )
+        assert helper._restore_selection({'paths': ['opt'], 'target': '/'})[2] == 'Invalid paths'
+        assert helper._restore_selection({'paths': ['/opt/../etc']})[2] == 'Invalid paths'
+        assert helper._restore_selection({'target': '/etc'})[2] == 'Invalid restore target'
+
+    def test_failed_compressor_removes_the_partial_archive(self, tmp_path):
+        archive = tmp_path / 'pi-health-backup-1.tar.zst'
+        error, _written = helper._write_backup_archive(
+            ['tar', '-cf', '-', str(tmp_path)],
+            ['sh', '-c', 'echo bad level >&2; exit 1'],
+            str(archive), 'zst', 0, lambda _event: None,
+        )
+        assert error == 'bad level'
+        assert os.listdir(tmp_path) == []
+
+    def test_backup_commands_are_tuned_and_deprioritised(self):
+        with patch('pihealth_helper.shutil.which', side_effect=lambda name: f'/usr/bin/{name}'):
+            assert helper._backup_priority(True) == [
+                'nice', '-n', '10', 'ionice', '-c', '2', '-n', '7'
+            ]
+            assert helper._backup_compressor('gz', 4, 2) == ['pigz', '-4', '-p', '2']
+        assert helper._backup_priority(False) == []
+        assert helper._backup_compressor('zst', 9, 0) == ['zstd', '-q', '-9', '-T0']
+        with patch('pihealth_helper.os.path.exists', return_value=True):
+            result = helper.cmd_backup_create({
+                'sources': ['/opt/stacks'], 'dest_dir': '/mnt/backup', 'compression_level': 20,
+            })
+        assert result == {'success': False, 'error': 'compression_level must be 1-19'}
@@ -0,0 +1,208 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from diskstats import DiskCounters, DiskThroughputSampler, read_diskstats
+from scrub_planner import ScrubPlanner, ScrubPlannerConfigError, due_percent
+
+
+class MemoryRepository:
+    def __init__(self, initial=None):
+        self.data = initial
+
+    def read_json(self, path, default=None):
+        return json.loads(json.dumps(self.data)) if self.data is not None else default
+
+    def write_json(self, path, data, *, mode=0o644):
+        self.data = json.loads(json.dumps(data))
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Disks:
+    """Cumulative diskstats counters the test advances by hand."""
+
+    def __init__(self):
+        self.read_bytes = 0
+        self.busy_ms = 0
+
+    def __call__(self):
+        return {"sda": DiskCounters(self.read_bytes, 0, self.busy_ms)}
+
+
+MODEL = {
+    "sync_in_progress": False,
+    "scrub": {
+        "oldest_days": 60,
+        "median_days": 20,
+        "newest_days": 0,
+        "not_scrubbed_percent": 0,
+        "histogram": [
+            {"days_ago": 60, "percent": 10.0},
+            {"days_ago": 20, "percent": 20.0},
+            {"days_ago": 0, "percent": 20.0},
+        ],
+    },
+}
+
+
+def make_planner(*, streams=None, hour=3, config=None, model=MODEL):
+    repository = MemoryRepository(
+        {
+            "enabled": True,
+            "idle_for_seconds": 600,
+            "min_interval_seconds": 1800,
+            "avoid_hours": [20],
+            **(config or {}),
+        }
+    )
+    activity = {"streams": streams if streams is not None else []}
+    clock = Clock()
+    disks = Disks()
+    wall = {"now": datetime(2026, 10, 18, hour, 0)}
+    runs = []
+    planner = ScrubPlanner(
+        repository=repository,
+        config_path_provider=lambda: "/state/scrub_planner.json",
+        status_reader=lambda: model,
+        scrub_runner=lambda percent, older_than: runs.append((percent, older_than)),
+        activity_reader=lambda: activity,
+        throughput_sampler=DiskThroughputSampler(
+            reader=disks, device_filter=lambda name: True, clock=clock
+        ),
+        clock=clock,
+        wall_clock=lambda: wall["now"],
+        logger=lambda line: None,
+    )
+    return planner, activity, clock, disks, wall, runs, repository
+
+
+def idle_ticks(planner, clock, count, step=300):
+    for _ in range(count):
+        planner.tick()
+        clock.now += step
+
+
+def test_due_share_counts_unscrubbed_and_old_blocks():
+    scrub = {"not_scrubbed_percent": 10, "histogram": MODEL["scrub"]["histogram"]}
+    # 10% never scrubbed plus a fifth of the rest older than 30 days.
+    assert due_percent(scrub, 30) == pytest.approx(28.0)
+    assert due_percent({"median_days": 40}, 30) == 50.0
+
+
+def test_a_slice_runs_only_after_a_sustained_idle_spell():
+    planner, _activity, clock, _disks, _wall, runs, repository = make_planner()
+
+    idle_ticks(planner, clock, 2)
+    assert runs == []
+    idle_ticks(planner, clock, 2)
+
+    # 100/30 per day to stay current plus 20% overdue spread over 7 days.
+    assert runs == [(2, 10)]
+    assert repository.data["budget"] == {"day": "2026-10-18", "percent": 2}
+    assert planner.status()["recent_runs"][0]["result"] == "complete"
+
+
+def test_streams_disk_traffic_and_busy_hours_hold_the_scrub_back():
+    planner, activity, clock, disks, wall, runs, _repository = make_planner(
+        streams=[{"title": "Film", "is_paused": False}]
+    )
+    idle_ticks(planner, clock, 6)
+    assert runs == []
+    assert "1 active stream(s)" in planner.status()["busy"]
+
+    activity["streams"] = []
+    for _ in range(6):
+        disks.busy_ms += 200_000
+        planner.tick()
+        clock.now += 300
+    assert runs == []
+    assert any("busy" in reason for reason in planner.status()["busy"])
+
+    wall["now"] = datetime(2026, 10, 18, 20, 30)
+    idle_ticks(planner, clock, 6)
+    assert runs == []
+    assert planner.status()["busy"] == ["20:00 is a busy hour"]
+
+
+def test_a_disabled_planner_never_polls_activity():
+    polls, samples = [], []
+    planner, _activity, clock, _disks, _wall, runs, _repository = make_planner(
+        config={"enabled": False}
+    )
+    planner._activity_reader = lambda: polls.append(1) or {}
+    sample = planner._throughput.sample
+    planner._throughput.sample = lambda: samples.append(1) or sample()
+
+    idle_ticks(planner, clock, 3)
+
+    assert polls == []
+    assert runs == []
+    # The throughput baseline is still kept warm for the first enabled tick.
+    assert len(samples) == 3
+
+
+def test_the_daily_budget_caps_how_much_is_scrubbed():
+    planner, _activity, clock, _disks, wall, runs, _repository = make_planner(
+        config={"min_interval_seconds": 0}
+    )
+    idle_ticks(planner, clock, 40)
+    # About 6.2% is due today; the last fraction of a percent waits for tomorrow.
+    assert runs == [(2, 10), (2, 10), (2, 10)]
+    assert planner.status()["last_plan"]["reason"] == "today's scrub budget is spent"
+
+    # A new day brings a fresh budget.
+    wall["now"] = datetime(2026, 10, 19, 3, 0)
+    idle_ticks(planner, clock, 4)
+    assert runs[3:] == [(2, 10), (2, 10)]
+
+
+def test_invalid_settings_are_rejected():
+    planner, *_rest = make_planner()
+    with pytest.raises(ScrubPlannerConfigError, match="target_age_days"):
+        planner.update_config({"target_age_days": 0})
+    with pytest.raises(ScrubPlannerConfigError, match="avoid_hours"):
+        planner.update_config({"avoid_hours": [24]})
+    assert planner.update_config({"avoid_hours": [21, 20, 21]})["config"]["avoid_hours"] == [20, 21]
+
+
+def test_diskstats_are_read_per_device(tmp_path):
+    path = tmp_path / "diskstats"
+    path.write_text(
+        "   8       0 sda 100 0 2048 50 10 0 4096 20 0 700 70 0 0 0 0\n"
+        "   7       0 loop0 1 0 2 0 0 0 0 0 0 0 0\n"
+    )
+    stats = read_diskstats(str(path))
+    assert stats["sda"] == DiskCounters(
+        read_bytes=2048 * 512,
+        write_bytes=4096 * 512,
+        busy_ms=700,
+        reads=100,
+        writes=10,
+        read_ms=50,
+        write_ms=20,
+    )
+    assert read_diskstats(str(tmp_path / "missing")) == {}
+
+
+def test_scrub_planner_routes_read_and_validate_settings(authenticated_client):
+    planner, *_rest = make_planner()
+    authenticated_client.application.extensions["scrub_planner"] = planner
+
+    status = authenticated_client.get("/api/storage/snapraid/scrub-planner").get_json()
+    assert status["config"]["target_age_days"] == 30
+    rejected = authenticated_client.post(
+        "/api/storage/snapraid/scrub-planner", json={"max_percent_per_run": 0}
+    )
+    assert rejected.status_code == 400
+    accepted = authenticated_client.post(
+        "/api/storage/snapraid/scrub-planner", json={"target_age_days": 14}
+    )
+    assert accepted.get_json()["config"]["target_age_days"] == 14
@@ -2,6 +2,8 @@
 
 from unittest.mock import patch, MagicMock
 import subprocess
+import threading
+import time
 
 from smart_monitor import (
     SmartHealth,
@@ -468,6 +470,55 @@ class TestGetAllSmartData:
             # Only sda should be queried (disk type)
             assert mock_get.call_count == 1
 
+    @patch('smart_monitor.subprocess.run')
+    def test_reads_devices_concurrently_within_the_limit(self, mock_run):
+        """Test that devices overlap but never exceed max_workers."""
+        mock_run.return_value = MagicMock(
+            stdout="sda disk\nsdb disk\nsdc disk\nsdd disk\n", stderr="", returncode=0
+        )
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def slow_read(device, timeout=None):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return SmartHealth(device=device)
+
+        with patch('smart_monitor.get_smart_data', side_effect=slow_read):
+            results = get_all_smart_data(max_workers=2)
+
+        assert [health.device for health in results] == [
+            "/dev/sda", "/dev/sdb", "/dev/sdc", "/dev/sdd"
+        ]
+        assert peak[0] == 2
+
+    @patch('smart_monitor.BATCH_GRACE_SECONDS', 0)
+    @patch('smart_monitor.subprocess.run')
+    def test_a_hung_device_does_not_hold_back_the_others(self, mock_run):
+        """Test that a device stuck past its timeout is reported, not awaited."""
+        mock_run.return_value = MagicMock(stdout="sda disk\nsdb disk\n", stderr="", returncode=0)
+        release = threading.Event()
+
+        def read(device, timeout=None):
+            if device == "/dev/sdb":
+                release.wait(5)
+            return SmartHealth(device=device, health_status="healthy")
+
+        try:
+            with patch('smart_monitor.get_smart_data', side_effect=read):
+                results = get_all_smart_data(max_workers=2, timeout=0.1)
+        finally:
+            release.set()
+
+        assert results[0].health_status == "healthy"
+        assert results[1].device == "/dev/sdb"
+        assert results[1].error_message == "Timeout reading SMART data"
+
     @patch('smart_monitor.subprocess.run')
     def test_handles_lsblk_error(self, mock_run):
         """Test handling of lsblk errors."""
@@ -435,3 +435,209 @@ class TestPoolSurfacePH4001:
         ):
             status = snapraid_plugin.get_status()
         assert status["details"]["sync_required"] is False
+
+
+STATUS_OUTPUT = """\
+SnapRAID status report:
+
+   Files Fragmented Excess  Wasted  Used    Free  Use Name
+            Files  Fragments  GB      GB      GB
+   12034      12      40     1.2    2500    1500  62% d1
+    8011       3       9       -    1800    2200  45% d2
+ --------------------------------------------------------------------------
+   20045      15      49     1.2    4300    3700  53%
+
+
+ 40%|o
+    |o
+    |o                                               o
+ 20%|o                                               o
+    |o                                      *        o
+    |o                                      *        o
+  0%|o______________________________________*________o
+    30                    days ago of the last scrub/sync                 0
+
+The oldest block was scrubbed 30 days ago, the median 5, the newest 0.
+
+No sync is in progress.
+The 10% of the array is not scrubbed.
+No rehash is in progress or needed.
+No error detected.
+"""
+
+
+class TestSnapRAIDStatusModel:
+    def test_status_report_is_parsed_into_a_structured_model(self):
+        from storage_plugins.snapraid_status import parse_snapraid_status
+
+        model = parse_snapraid_status(STATUS_OUTPUT)
+
+        assert [disk["name"] for disk in model["disks"]] == ["d1", "d2"]
+        assert model["disks"][0]["fragmented_files"] == 12
+        assert model["disks"][0]["wasted_gb"] == 1.2
+        assert model["disks"][1]["wasted_gb"] is None
+        assert model["totals"]["files"] == 20045
+        assert model["scrub"]["oldest_days"] == 30
+        assert model["scrub"]["median_days"] == 5
+        assert model["scrub"]["not_scrubbed_percent"] == 10
+        histogram = model["scrub"]["histogram"]
+        assert histogram[0] == {"days_ago": 30, "percent": 40.0}
+        assert histogram[-1]["days_ago"] == 0
+        assert model["sync_required"] is False
+        assert model["no_error_detected"] is True
+        assert model["errors"] == 0
+
+    def test_array_error_count_is_parsed(self):
+        from storage_plugins.snapraid_status import parse_snapraid_status
+
+        model = parse_snapraid_status("DANGER! In the array there are 7 errors!\n")
+        assert model["errors"] == 7
+
+    def test_status_is_cached_until_a_content_file_changes(
+        self, snapraid_plugin, valid_config, tmp_path, monkeypatch
+    ):
+        conf = tmp_path / "snapraid.conf"
+        conf.write_text("")
+        disk = tmp_path / "disk1"
+        disk.mkdir()
+        content = disk / "snapraid.content"
+        content.write_text("v1")
+        valid_config["drives"][0]["path"] = str(disk)
+        monkeypatch.setattr(snapraid_plugin, "SNAPRAID_CONF", str(conf))
+        monkeypatch.setattr(snapraid_plugin, "get_config", lambda: valid_config)
+
+        with patch(
+            "storage_plugins.snapraid_plugin.subprocess.run",
+            return_value=MagicMock(returncode=0, stdout=STATUS_OUTPUT, stderr=""),
+        ) as mock_run:
+            first = snapraid_plugin.get_status()
+            snapraid_plugin.get_status()
+            recovery = snapraid_plugin.get_recovery_status()
+            assert mock_run.call_count == 1
+
+            content.write_text("v2 after sync")
+            snapraid_plugin.get_status()
+            assert mock_run.call_count == 2
+
+        assert first["status"] == "healthy"
+        assert first["details"]["array"]["disks"][0]["name"] == "d1"
+        assert recovery["missing_files"] == 0
+
+        # A fresh plugin instance (another process) reads the persisted model.
+        other = SnapRAIDPlugin(snapraid_plugin.config_dir)
+        monkeypatch.setattr(other, "SNAPRAID_CONF", str(conf))
+        monkeypatch.setattr(other, "get_config", lambda: valid_config)
+        with patch("storage_plugins.snapraid_plugin.subprocess.run") as mock_run:
+            assert other.get_status()["details"]["array"]["totals"]["files"] == 20045
+        mock_run.assert_not_called()
+
+    def test_sync_invalidates_the_cached_status(self, snapraid_plugin, valid_config, tmp_path, monkeypatch):
+        conf = tmp_path / "snapraid.conf"
+        conf.write_text("")
+        monkeypatch.setattr(snapraid_plugin, "SNAPRAID_CONF", str(conf))
+        monkeypatch.setattr(snapraid_plugin, "get_config", lambda: valid_config)
+        monkeypatch.setattr(snapraid_plugin, "_check_mounted_sources", lambda config: [])
+        monkeypatch.setattr(
+            snapraid_plugin, "_check_diff_thresholds", lambda: MagicMock(success=True)
+        )
+        with patch(
+            "storage_plugins.snapraid_plugin.subprocess.run",
+            return_value=MagicMock(returncode=0, stdout="A sync is required.\n", stderr=""),
+        ):
+            assert snapraid_plugin.get_status()["status"] == "degraded"
+
+        with patch("storage_plugins.snapraid_plugin.helper_available", return_value=True):
+            with patch(
+                "storage_plugins.snapraid_plugin.helper_call",
+                return_value={"success": True, "stdout": "done", "stderr": ""},
+            ):
+                list(snapraid_plugin.run_command("sync", {"log_tags": False}))
+
+        with patch(
+            "storage_plugins.snapraid_plugin.subprocess.run",
+            return_value=MagicMock(returncode=0, stdout=STATUS_OUTPUT, stderr=""),
+        ):
+            assert snapraid_plugin.get_status()["status"] == "healthy"
+
+
+class TestSnapRAIDChangeEstimate:
+    @staticmethod
+    def _populate(root, count):
+        for index in range(count):
+            folder = root / f"dir{index % 3}"
+            folder.mkdir(exist_ok=True)
+            (folder / f"file{index}.mkv").write_text("x" * index)
+
+    def test_estimate_counts_changes_since_the_snapshot(self, tmp_path):
+        from storage_plugins.snapraid_index import SnapRAIDFileIndex
+
+        disk = tmp_path / "disk1"
+        disk.mkdir()
+        self._populate(disk, 10)
+        (disk / "snapraid.content").write_text("content")
+        (disk / "skip.tmp").write_text("excluded")
+        index = SnapRAIDFileIndex(str(tmp_path / "index.sqlite3"), max_workers=2)
+        disks = {"d1": str(disk)}
+
+        assert index.estimate(disks, ["*.tmp"]) is None
+        assert index.snapshot(disks, ["*.tmp"]) == {"d1": 10}
+
+        (disk / "dir0" / "file0.mkv").unlink()
+        (disk / "dir1" / "file1.mkv").write_text("changed size")
+        (disk / "dir2" / "file2.mkv").rename(disk / "dir2" / "renamed.mkv")
+        (disk / "new.mkv").write_text("new")
+        (disk / "another.tmp").write_text("excluded")
+
+        estimate = index.estimate(disks, ["*.tmp"])
+        assert (estimate["added"], estimate["removed"], estimate["updated"], estimate["moved"]) == (1, 1, 1, 1)
+        assert estimate["scanned"] == 10
+        assert estimate["errors"] == []
+        # A disk whose mount point changed has no usable baseline.
+        assert index.estimate({"d1": str(tmp_path)}, ["*.tmp"]) is None
+
+    def _plugin_with_disk(self, snapraid_plugin, valid_config, tmp_path, monkeypatch, files):
+        disk = tmp_path / "disk1"
+        disk.mkdir()
+        self._populate(disk, files)
+        valid_config["drives"] = [valid_config["drives"][0], valid_config["drives"][2]]
+        valid_config["drives"][0]["path"] = str(disk)
+        valid_config["drives"][0]["content"] = False
+        valid_config["thresholds"] = {"delete_threshold": 8, "update_threshold": 500}
+        monkeypatch.setattr(snapraid_plugin, "get_config", lambda: valid_config)
+        snapraid_plugin._refresh_file_index()
+        return disk
+
+    def test_mass_delete_is_blocked_from_the_estimate_without_running_diff(
+        self, snapraid_plugin, valid_config, tmp_path, monkeypatch
+    ):
+        disk = self._plugin_with_disk(snapraid_plugin, valid_config, tmp_path, monkeypatch, 30)
+        shutil.rmtree(disk / "dir0")
+        shutil.rmtree(disk / "dir1")
+
+        with patch("storage_plugins.snapraid_plugin.subprocess.run") as mock_run:
+            result = snapraid_plugin._check_diff_thresholds()
+
+        mock_run.assert_not_called()
+        assert result.success is False
+        assert "about 20 files removed" in result.error
+        assert result.data["force_allowed"] is True
+
+    def test_small_changes_pass_and_close_calls_run_the_real_diff(
+        self, snapraid_plugin, valid_config, tmp_path, monkeypatch
+    ):
+        disk = self._plugin_with_disk(snapraid_plugin, valid_config, tmp_path, monkeypatch, 30)
+        (disk / "dir0" / "file0.mkv").unlink()
+
+        with patch("storage_plugins.snapraid_plugin.subprocess.run") as mock_run:
+            assert snapraid_plugin._check_diff_thresholds().success is True
+        mock_run.assert_not_called()
+
+        for index in (3, 6, 9, 12, 15, 18, 21):
+            (disk / "dir0" / f"file{index}.mkv").unlink()
+        with patch(
+            "storage_plugins.snapraid_plugin.subprocess.run",
+            return_value=MagicMock(returncode=0, stdout="8 removed\n", stderr=""),
+        ) as mock_run:
+            result = snapraid_plugin._check_diff_thresholds()
+        mock_run.assert_called_once()
+        assert result.success is True